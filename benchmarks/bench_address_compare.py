@@ -0,0 +1,150 @@
+"""Address deduplication benchmark: blocking keys + sort-merge + pair scoring.
+
+Builds a synthetic corpus (default 1M addresses; pass a size as the first
+argument to change it). About one address in ten is a re-spelled copy of
+another one — keywords written out or abbreviated, punctuation and case
+changed, the country added or dropped — and those copies are the pairs
+deduplication should find.
+
+Stages timed:
+
+- `address_keys_batch` over the whole corpus;
+- sort-merge: sort `(key, index)` tuples, group equal keys, drop blocks
+  larger than `MAX_BLOCK`, emit the distinct pairs within each block;
+- `compare_addresses_batch` over the candidate pairs;
+- for reference, the ad-hoc Python path it replaces (`normalize_address` +
+  `shorten_address_keywords` + token-set Jaccard) on a sample of pairs.
+
+Reports candidate-pair counts against the N² / 2 an all-pairs scan would
+need, and the recall of the planted duplicates at `THRESHOLD`.
+"""
+
+import random
+import sys
+import time
+from itertools import groupby
+from typing import List, Set, Tuple
+
+from rigour.addresses import (
+    address_keys_batch,
+    compare_addresses_batch,
+    normalize_address,
+    shorten_address_keywords,
+)
+
+SIZE = 1_000_000
+DUPLICATE_RATE = 0.1
+MAX_BLOCK = 100
+THRESHOLD = 0.7
+PYTHON_SAMPLE = 100_000
+
+SYLLABLES = ["ba", "ren", "kol", "mi", "sta", "dor", "lin", "ve", "gar", "to"]
+SYLLABLES += ["hol", "an", "ber", "sul", "ne", "wick", "fel", "ma", "ri", "ost"]
+STREET_TYPES = [("Street", "St."), ("Road", "Rd"), ("Avenue", "Ave"), ("Lane", "Ln")]
+COUNTRIES = [("Germany", "DE"), ("United Kingdom", "UK"), ("France", "FR")]
+COUNTRIES += [("United States", "USA"), ("Netherlands", "NL")]
+
+
+def word(rng: random.Random, parts: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(parts)).title()
+
+
+def build_corpus(size: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    rng = random.Random(42)
+    cities = [word(rng, 3) for _ in range(2_000)]
+    streets = [word(rng, rng.randint(2, 4)) for _ in range(50_000)]
+    addresses: List[str] = []
+    parts: List[Tuple[str, int, int, str, str, int]] = []
+    duplicates: List[Tuple[int, int]] = []
+    while len(addresses) < size:
+        if parts and rng.random() < DUPLICATE_RATE:
+            idx = rng.randrange(len(parts))
+            street, stype, number, city, postcode, country = parts[idx]
+            _, short = STREET_TYPES[stype]
+            _, code = COUNTRIES[country]
+            text = f"{number} {street} {short}, {city.upper()} {postcode}"
+            if rng.random() < 0.5:
+                text = f"{text}, {code}"
+            duplicates.append((idx, len(addresses)))
+            addresses.append(text)
+            # A copy may be copied again; it keeps its source's parts.
+            parts.append(parts[idx])
+            continue
+        street = rng.choice(streets)
+        stype = rng.randrange(len(STREET_TYPES))
+        number = rng.randint(1, 400)
+        city = rng.choice(cities)
+        postcode = str(rng.randint(10000, 99999))
+        country = rng.randrange(len(COUNTRIES))
+        parts.append((street, stype, number, city, postcode, country))
+        full, _ = STREET_TYPES[stype]
+        name, _ = COUNTRIES[country]
+        addresses.append(f"{street} {full} {number}, {postcode} {city}, {name}")
+    return addresses, duplicates
+
+
+def candidate_pairs(keys: List[List[str]]) -> Set[Tuple[int, int]]:
+    entries = sorted((key, idx) for idx, ks in enumerate(keys) for key in ks)
+    pairs: Set[Tuple[int, int]] = set()
+    for _, group in groupby(entries, key=lambda e: e[0]):
+        block = [idx for _, idx in group]
+        if len(block) > MAX_BLOCK:
+            continue
+        for i, left in enumerate(block):
+            for right in block[i + 1 :]:
+                pairs.add((left, right))
+    return pairs
+
+
+def python_compare(left: str, right: str) -> float:
+    lnorm = normalize_address(left) or ""
+    rnorm = normalize_address(right) or ""
+    ltokens = set(shorten_address_keywords(lnorm).split())
+    rtokens = set(shorten_address_keywords(rnorm).split())
+    union = ltokens | rtokens
+    return len(ltokens & rtokens) / len(union) if union else 0.0
+
+
+def timed(label: str, start: float, count: int, unit: str) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.2f} s   ({count / elapsed:>12,.0f} {unit}/sec)")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    addresses, duplicates = build_corpus(size)
+    print(f"Corpus: {len(addresses):,} addresses, {len(duplicates):,} planted copies")
+    compare_addresses_batch([("warm up", "the replacers")])
+
+    start = time.perf_counter()
+    keys = address_keys_batch(addresses)
+    timed("address_keys_batch", start, len(addresses), "addresses")
+
+    start = time.perf_counter()
+    pairs = candidate_pairs(keys)
+    timed("sort-merge", start, len(addresses), "addresses")
+    all_pairs = len(addresses) * (len(addresses) - 1) // 2
+    print(f"  candidate pairs: {len(pairs):,} (all-pairs scan: {all_pairs:,})")
+
+    pair_list = sorted(pairs)
+    texts = [(addresses[a], addresses[b]) for a, b in pair_list]
+    start = time.perf_counter()
+    scores = compare_addresses_batch(texts)
+    timed("compare_addresses_batch", start, len(texts), "pairs")
+
+    sample = texts[:PYTHON_SAMPLE]
+    start = time.perf_counter()
+    for left, right in sample:
+        python_compare(left, right)
+    timed("python token-set (sample)", start, len(sample), "pairs")
+
+    matched = {pair for pair, score in zip(pair_list, scores) if score >= THRESHOLD}
+    found = sum(1 for pair in duplicates if pair in matched)
+    blocked = sum(1 for pair in duplicates if pair in pairs)
+    print(f"  planted copies in candidates: {blocked / len(duplicates):.1%}")
+    print(f"  planted copies >= {THRESHOLD}: {found / len(duplicates):.1%}")
+    print(f"  pairs >= {THRESHOLD}: {len(matched):,}")
+
+
+if __name__ == "__main__":
+    main()
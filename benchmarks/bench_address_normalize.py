@@ -0,0 +1,191 @@
+"""Relative-speed benchmark: Rust `normalize_address` vs the former Python
+implementation (kept below as `python_normalize_address`).
+
+The corpus is synthetic: street-style templates filled with names from
+`contrib/sample_names.csv`, so it mixes plain ASCII addresses (the Rust
+byte-loop fast path) with Cyrillic, Greek, CJK, Arabic etc. It is split
+by `str.isascii()` and each bucket is timed for:
+
+- the Python reference, one call per address;
+- `normalize_address`, one call per address;
+- `normalize_addresses`, one call for the whole bucket.
+
+Each is run with `latinize=False` and `latinize=True`. The reference
+uses `normality.ascii_text` (PyICU) to latinize, the Rust path uses
+ICU4X via `maybe_ascii`, so outputs are compared without latinization
+only; latinized mismatches are counted and reported, not asserted.
+"""
+
+import csv
+import random
+import statistics
+import string
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from normality import ascii_text
+from normality.constants import WS
+from normality.util import Categories
+
+from rigour.addresses import normalize_address, normalize_addresses
+
+CORPUS = Path(__file__).parent.parent / "contrib" / "sample_names.csv"
+PASSES = 5
+SIZE = 20_000
+
+TEMPLATES = [
+    "{n} {name} Street, {name2} {zip}",
+    "{name} str. {n}, {zip} {name2}",
+    "Apt {n}/{n2}, {name} Rd., {name2}, {zip}",
+    "д. {n}, ул. {name}, г. {name2}, {zip}",
+    "{name2}, {name} {n}-{n2}",
+]
+ASCII_TEMPLATES = [t for t in TEMPLATES if t.isascii()]
+
+CHARS_ALLOWED = "&№" + string.ascii_letters + string.digits
+TOKEN_SEP_CATEGORIES: Categories = {
+    "Cc": WS,
+    "Cf": None,
+    "Co": None,
+    "Cn": None,
+    "Lm": None,
+    "Mn": None,
+    "Mc": WS,
+    "Me": None,
+    "No": None,
+    "Zs": WS,
+    "Zl": WS,
+    "Zp": WS,
+    "Pc": WS,
+    "Pd": WS,
+    "Ps": WS,
+    "Pe": WS,
+    "Pi": WS,
+    "Pf": WS,
+    "Po": WS,
+    "Sm": WS,
+    "Sc": None,
+    "Sk": None,
+    "So": WS,
+}
+
+
+def python_normalize_address(
+    address: str, latinize: bool = False, min_length: int = 4
+) -> Optional[str]:
+    """The pre-Rust implementation, verbatim."""
+    tokens: List[List[str]] = []
+    token: List[str] = []
+    for char in address.casefold():
+        if char in CHARS_ALLOWED:
+            chr: Optional[str] = char
+        else:
+            cat = unicodedata.category(char)
+            chr = TOKEN_SEP_CATEGORIES.get(cat, char)
+        if chr is None:
+            continue
+        if chr == WS:
+            if len(token):
+                tokens.append(token)
+            token = []
+            continue
+        token.append(chr)
+    if len(token):
+        tokens.append(token)
+
+    parts: List[str] = []
+    for token in tokens:
+        token_str = "".join(token)
+        if latinize:
+            token_str = ascii_text(token_str)
+        if len(token_str) == 0:
+            continue
+        parts.append(token_str)
+    norm_address = WS.join(parts)
+    if len(norm_address) < min_length:
+        return None
+    return norm_address
+
+
+def build_corpus() -> List[str]:
+    with open(CORPUS, encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        names = [row[0] for row in reader if row and row[0]]
+    ascii_names = [n for n in names if n.isascii()]
+    rng = random.Random(42)
+    addresses: List[str] = []
+    for i in range(SIZE):
+        # Roughly two in three addresses are all-ASCII, like real data.
+        if i % 3:
+            pool, template = ascii_names, rng.choice(ASCII_TEMPLATES)
+        else:
+            pool, template = names, rng.choice(TEMPLATES)
+        addresses.append(
+            template.format(
+                n=rng.randint(1, 999),
+                n2=rng.randint(1, 99),
+                zip=rng.randint(10000, 99999),
+                name=rng.choice(pool),
+                name2=rng.choice(pool),
+            )
+        )
+    return addresses
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench(label: str, fn: Callable[[], object], n: int) -> None:
+    fn()  # warmup
+    times = [timed(fn) for _ in range(PASSES)]
+    med = statistics.median(times)
+    print(f"  {label}  {med * 1000:8.2f} ms   ({n / med:>12,.0f} addresses/sec)")
+
+
+def run_bucket(name: str, addresses: List[str]) -> None:
+    n = len(addresses)
+    for latinize in (False, True):
+        print(f"== {name} bucket ({n} addresses), latinize={latinize} ==")
+        bench(
+            "python reference        ",
+            lambda: [python_normalize_address(a, latinize) for a in addresses],
+            n,
+        )
+        bench(
+            "rust normalize_address  ",
+            lambda: [normalize_address(a, latinize) for a in addresses],
+            n,
+        )
+        bench(
+            "rust normalize_addresses",
+            lambda: normalize_addresses(addresses, latinize),
+            n,
+        )
+        expected = [python_normalize_address(a, latinize) for a in addresses]
+        actual = normalize_addresses(addresses, latinize)
+        diffs = sum(1 for e, a in zip(expected, actual) if e != a)
+        print(f"  mismatches vs reference: {diffs}")
+        if not latinize:
+            assert diffs == 0, "Rust output diverges from the reference"
+        print()
+
+
+def main() -> None:
+    addresses = build_corpus()
+    ascii_bucket = [a for a in addresses if a.isascii()]
+    other_bucket = [a for a in addresses if not a.isascii()]
+    print(f"Corpus: {len(addresses)} synthetic addresses")
+    print(f"Passes per run: {PASSES} (median reported)")
+    print()
+    run_bucket("ASCII", ascii_bucket)
+    run_bucket("non-ASCII", other_bucket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Decode-vs-reanalysis benchmark for the binary `Name` codec.
+
+Analyses every name in `contrib/sample_names.csv` once (PER, the
+default flags), then times three ways of getting the same `Name`
+objects back:
+
+- **analyze_names** — the full pipeline again: tokenise, transliterate,
+  metaphone, tagger pass.
+- **load_names** — decode one `dump_names` blob of the whole corpus.
+- **pickle.loads** — unpickle the list; each name goes through
+  `Name.from_bytes`.
+
+The point of the codec is that the decode columns stay well below the
+re-analysis column: a cache of analysed names is only worth keeping
+if reading it back is cheaper than recomputing it. Encoded size per
+name is reported alongside.
+"""
+
+import csv
+import pickle
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from rigour.names import Name, NameTypeTag, analyze_names, dump_names, load_names
+
+CONTRIB = Path(__file__).parent.parent / "contrib"
+PASSES = 5
+
+
+def load_sample_names() -> List[str]:
+    with open(CONTRIB / "sample_names.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        return [row[0] for row in reader]
+
+
+def timed(fn: Callable[[], object]) -> float:
+    times = []
+    for _ in range(PASSES):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    texts = load_sample_names()
+    names: List[Name] = []
+    for text in texts:
+        names.extend(analyze_names(NameTypeTag.PER, [text]))
+    blob = dump_names(names)
+    pickled = pickle.dumps(names, protocol=pickle.HIGHEST_PROTOCOL)
+
+    restored = load_names(blob)
+    assert [n.form for n in restored] == [n.form for n in names]
+
+    print(f"Corpus: {len(texts)} sample names -> {len(names)} Name objects")
+    print(f"Passes: {PASSES}, median reported")
+    print(
+        f"Encoded: {len(blob)} bytes ({len(blob) / len(names):.1f} per name), "
+        f"pickled: {len(pickled)} bytes"
+    )
+    print()
+
+    def reanalyze() -> None:
+        for text in texts:
+            analyze_names(NameTypeTag.PER, [text])
+
+    base = timed(reanalyze)
+    rows = [
+        ("analyze_names", base),
+        ("dump_names", timed(lambda: dump_names(names))),
+        ("load_names", timed(lambda: load_names(blob))),
+        ("pickle.loads", timed(lambda: pickle.loads(pickled))),
+    ]
+    for label, med in rows:
+        print(
+            f"  {label:<14} {med * 1000:8.2f} ms   "
+            f"{med * 1e6 / len(names):6.2f} us/name   "
+            f"{base / med:6.1f}x vs analyze"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Import-time regression check for rigour's top-level subpackages.
+
+Each subpackage is imported in a fresh interpreter under
+`python -X importtime`, and its cumulative import time (the package
+itself plus everything it pulls in that wasn't already loaded) is
+compared against a budget. The package `__init__` modules load their
+submodules lazily (PEP 562), so a bare `import rigour.names` should
+cost little more than the interpreter's own startup; an eager import
+slipping back into an `__init__` shows up here as a blown budget.
+
+The minimum over several runs is reported, as the least noisy
+estimate. Exits non-zero if any subpackage is over budget.
+
+    python benchmarks/bench_importtime.py [--runs N] [--scale F]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, Optional
+
+# Cumulative import time budgets in milliseconds. `rigour.langs`
+# imports `rigour.env`, which loads normality (and chardet with it);
+# `rigour.territories` and `rigour.ids` import their base classes
+# eagerly.
+BUDGETS: Dict[str, float] = {
+    "rigour": 40.0,
+    "rigour.names": 40.0,
+    "rigour.text": 40.0,
+    "rigour.territories": 80.0,
+    "rigour.addresses": 40.0,
+    "rigour.langs": 250.0,
+    "rigour.ids": 80.0,
+    "rigour.mime": 40.0,
+    "rigour.urls": 40.0,
+}
+
+
+def import_time(module: str) -> Optional[float]:
+    """Cumulative import time of `module` in a fresh process, in ms."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000.0
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, for slow machines",
+    )
+    args = parser.parse_args()
+
+    failed = 0
+    print(f"{'module':<20} {'import ms':>10} {'budget ms':>10}")
+    for module, budget in BUDGETS.items():
+        samples = [import_time(module) for _ in range(args.runs)]
+        times = [s for s in samples if s is not None]
+        if not times:
+            print(f"{module:<20} {'?':>10} {budget:>10.1f}  not reported")
+            failed += 1
+            continue
+        best = min(times)
+        limit = budget * args.scale
+        status = "" if best <= limit else "  OVER BUDGET"
+        if status:
+            failed += 1
+        print(f"{module:<20} {best:>10.1f} {limit:>10.1f}{status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
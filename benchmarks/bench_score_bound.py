@@ -0,0 +1,96 @@
+"""Prune-rate benchmark for `score_upper_bound`.
+
+Analyses every name in `contrib/sample_names.csv` as PER and takes
+the full cross product, minus self-pairs. For a range of acceptance
+thresholds it reports the share of pairs whose upper bound already
+falls below the threshold — the pairs a matcher can drop without
+running `pair_symbols` / `compare_parts` — and checks on a sample
+that no dropped pair would have scored above the threshold.
+
+Per-pair cost of the bound and of the full single-pair score is
+reported alongside, so the saving can be read off directly.
+"""
+
+import csv
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from rigour.names import (
+    Name,
+    NameTypeTag,
+    analyze_names,
+    match_name_sets,
+    score_upper_bound,
+)
+
+CONTRIB = Path(__file__).parent.parent / "contrib"
+THRESHOLDS = (0.5, 0.7, 0.8, 0.9)
+SAMPLE = 3000
+PASSES = 3
+
+
+def load_names() -> List[Name]:
+    with open(CONTRIB / "sample_names.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        texts = [row[0] for row in reader]
+    names: List[Name] = []
+    for text in texts:
+        names.extend(analyze_names(NameTypeTag.PER, [text]))
+    return names
+
+
+def timed(fn: Callable[[], object]) -> float:
+    times = []
+    for _ in range(PASSES):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    names = load_names()
+    pairs: List[Tuple[Name, Name]] = [
+        (q, r) for q in names for r in names if q is not r
+    ]
+    print(f"Corpus: {len(names)} names, {len(pairs)} pairs")
+
+    start = time.perf_counter()
+    bounds = [score_upper_bound(q, r) for q, r in pairs]
+    elapsed = time.perf_counter() - start
+    print(
+        f"Bound over all pairs: {elapsed:.2f} s "
+        f"({elapsed * 1e9 / len(pairs):.0f} ns/pair incl. call overhead)"
+    )
+    print()
+
+    for threshold in THRESHOLDS:
+        pruned = sum(1 for b in bounds if b < threshold)
+        print(
+            f"  threshold {threshold:.2f}: "
+            f"{pruned / len(pairs):6.1%} of pairs pruned"
+        )
+    print()
+
+    rng = random.Random(42)
+    sample = rng.sample(range(len(pairs)), min(SAMPLE, len(pairs)))
+    violations = 0
+    for idx in sample:
+        q, r = pairs[idx]
+        if match_name_sets([q], [r]).score > bounds[idx] + 1e-9:
+            violations += 1
+    print(f"Sampled {len(sample)} pairs, bound violations: {violations}")
+
+    subset = [pairs[i] for i in sample]
+    bound_t = timed(lambda: [score_upper_bound(q, r) for q, r in subset])
+    full_t = timed(lambda: [match_name_sets([q], [r]) for q, r in subset])
+    print(f"  score_upper_bound  {bound_t * 1e6 / len(subset):8.2f} us/pair")
+    print(f"  match_name_sets    {full_t * 1e6 / len(subset):8.2f} us/pair")
+
+
+if __name__ == "__main__":
+    main()
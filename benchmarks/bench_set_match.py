@@ -0,0 +1,108 @@
+"""N×M name-set matching benchmark: the Putin worst case.
+
+Both sides are the 80 aliases in `contrib/putin_names.txt` — the
+screening shape where a many-alias query meets a many-alias candidate
+(see `plans/name-matcher-pruning.md`). Matched against itself the
+literal `comparable` short-circuit would end the search at once, so
+the result side drops every alias whose `comparable` form also appears
+on the query side. That leaves the hard case: no literal hit, and a
+cross product dominated by non-latinizable aliases. Two ways of finding the best pair are timed:
+
+- **python loop** — what a matcher does today: for every pair,
+  `pair_symbols` then `compare_parts` on each pairing's residue,
+  weighted mean, keep the best. Two FFI crossings per pairing.
+- **match_name_sets** — the whole cross product in one call, with the
+  script / symbol pre-filter and the bound-ordered early exit.
+
+The Python loop here is a simplified scorer (no per-category symbol
+weights), so compare timings, not scores. The pruning counters from
+`NameSetMatch` are printed alongside.
+"""
+
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from rigour.names import (
+    Name,
+    NameTypeTag,
+    align_person_name_order,
+    analyze_names,
+    compare_parts,
+    match_name_sets,
+    pair_symbols,
+)
+
+CONTRIB = Path(__file__).parent.parent / "contrib"
+PASSES = 5
+
+
+def load_names() -> List[Name]:
+    with open(CONTRIB / "putin_names.txt", encoding="utf-8") as fh:
+        texts = [line.strip() for line in fh if line.strip()]
+    names: List[Name] = []
+    for text in texts:
+        names.extend(analyze_names(NameTypeTag.PER, [text]))
+    return names
+
+
+def timed(fn: Callable[[], object]) -> float:
+    times = []
+    for _ in range(PASSES):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def python_loop(queries: List[Name], results: List[Name]) -> float:
+    best = 0.0
+    for query in queries:
+        for result in results:
+            for pairing in pair_symbols(query, result):
+                used_q = {p.index for a in pairing for p in a.qps}
+                used_r = {p.index for a in pairing for p in a.rps}
+                qrem = [p for p in query.parts if p.index not in used_q]
+                rrem = [p for p in result.parts if p.index not in used_r]
+                qrem, rrem = align_person_name_order(qrem, rrem)
+                aligns = list(pairing) + compare_parts(qrem, rrem)
+                total = sum(a.weight for a in aligns)
+                if total > 0:
+                    score = sum(a.score * a.weight for a in aligns) / total
+                    best = max(best, score)
+    return best
+
+
+def main() -> None:
+    queries = load_names()
+    query_forms = {n.comparable for n in queries}
+    results = [n for n in load_names() if n.comparable not in query_forms]
+    # Re-add one latin alias under a typo so there is a strong,
+    # non-literal pair for the bound to lock onto.
+    results.extend(analyze_names(NameTypeTag.PER, ["Vladimir Poutine"]))
+
+    print(f"Query: {len(queries)} names, result: {len(results)} names")
+    print(f"Pairs: {len(queries) * len(results)}, passes: {PASSES}, median")
+    match = match_name_sets(queries, results)
+    print(
+        f"Best: {match.query.form if match.query else '-'} ~ "
+        f"{match.result.form if match.result else '-'} ({match.score:.3f})"
+    )
+    print(
+        f"Filtered: {match.filtered}, skipped by bound: {match.skipped}, "
+        f"scored: {match.scored}"
+    )
+    print()
+
+    base = timed(lambda: python_loop(queries, results))
+    fast = timed(lambda: match_name_sets(queries, results))
+    for label, med in (("python loop", base), ("match_name_sets", fast)):
+        print(
+            f"  {label:<16} {med * 1000:9.2f} ms   "
+            f"{base / med:6.1f}x vs python loop"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Cold-start latency of the name pipeline, measured in fresh processes.
+
+Each run spawns a new interpreter that imports `rigour.names` and
+makes one `analyze_names` call per tagger (a PER and an ORG name), so
+the numbers include everything a short-lived worker or CLI pays
+before its first result. Three setups:
+
+- **no cache** — `RIGOUR_TAGGER_CACHE` unset: both taggers are built
+  from the embedded corpora.
+- **cold cache** — an empty cache directory: the taggers are built
+  and their images written.
+- **warm cache** — the images from the cold run are loaded.
+
+Import time and first-call time are reported separately; the tagger
+image only changes the latter.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+RUNS = 5
+
+CHILD = """
+import json, time
+t0 = time.perf_counter()
+from rigour.names import NameTypeTag, analyze_names
+t1 = time.perf_counter()
+analyze_names(NameTypeTag.PER, ["Vladimir Vladimirovich Putin"])
+analyze_names(NameTypeTag.ORG, ["Siemens Aktiengesellschaft"])
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_call": t2 - t1}))
+"""
+
+
+def run_child(cache_dir: Optional[str]) -> Dict[str, float]:
+    env = dict(os.environ)
+    env.pop("RIGOUR_TAGGER_CACHE", None)
+    if cache_dir is not None:
+        env["RIGOUR_TAGGER_CACHE"] = cache_dir
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def report(label: str, samples: List[Dict[str, float]]) -> None:
+    imp = statistics.median(s["import"] for s in samples) * 1000
+    call = statistics.median(s["first_call"] for s in samples) * 1000
+    print(f"{label:<12}  import {imp:8.1f} ms  first call {call:8.1f} ms")
+
+
+def main() -> None:
+    print(f"Runs per setup: {RUNS}, median reported")
+    report("no cache", [run_child(None) for _ in range(RUNS)])
+
+    cold: List[Dict[str, float]] = []
+    for _ in range(RUNS):
+        with tempfile.TemporaryDirectory() as tmp:
+            cold.append(run_child(tmp))
+    report("cold cache", cold)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_child(tmp)
+        images = sum(
+            os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)
+        )
+        report("warm cache", [run_child(tmp) for _ in range(RUNS)])
+        print(f"Image size: {images / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
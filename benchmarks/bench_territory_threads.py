@@ -0,0 +1,101 @@
+"""Thread-scaling benchmark for `lookup_territory`.
+
+The territory tables (identifier map, name map, fuzzy name index) are
+built once under `rigour.util.resource_lock` and then read without
+any lock. This runs a lookup workload through a `ThreadPoolExecutor`
+at 1, 4, 8 and 16 workers, twice: once on the lock-free read path and
+once with every call wrapped in `resource_lock`, which is what each
+lookup used to pay. The memo in front of `lookup_territory` is bypassed
+so every call reaches the tables.
+
+On stock CPython the GIL already serialises the Python-side work, so
+expect the two columns to be close apart from the lock traffic; on a
+free-threaded build (3.13t / 3.14t, `PYTHON_GIL=0`) only the lock-free
+path should scale with the worker count.
+
+Workloads:
+
+- **exact** — every territory's code, alpha-3, name and full name,
+  plus a few unknown strings.
+- **fuzzy** — the names with one character swapped, `fuzzy=True`.
+"""
+
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence
+
+from rigour.territories import get_territories, lookup_territory
+from rigour.util import resource_lock
+
+PASSES = 3
+THREADS = (1, 4, 8, 16)
+CHUNKS = 64
+
+# Skip the `lru_cache` so every call reads the shared tables.
+_lookup = lookup_territory.__wrapped__
+
+
+def chunked(items: Sequence, n: int) -> List[Sequence]:
+    size = max(1, len(items) // n)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_threaded(
+    work: Callable[[Sequence], None], chunks: List[Sequence], threads: int
+) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(work, chunks))
+        return time.perf_counter() - start
+
+
+def bench(label: str, texts: List[str], fuzzy: bool) -> None:
+    chunks = chunked(texts, CHUNKS)
+
+    def lock_free(chunk: Sequence) -> None:
+        for text in chunk:
+            _lookup(text, fuzzy)
+
+    def locked(chunk: Sequence) -> None:
+        for text in chunk:
+            with resource_lock:
+                _lookup(text, fuzzy)
+
+    print(f"== {label} ({len(texts)} lookups) ==")
+    print("             lock-free              locked")
+    base = None
+    for threads in THREADS:
+        meds = []
+        for work in (lock_free, locked):
+            times = [run_threaded(work, chunks, threads) for _ in range(PASSES)]
+            meds.append(statistics.median(times))
+        if base is None:
+            base = meds[0]
+        print(
+            f"  {threads:>2} threads: "
+            f"{meds[0] * 1000:8.2f} ms ({base / meds[0]:5.2f}x)   "
+            f"{meds[1] * 1000:8.2f} ms ({base / meds[1]:5.2f}x)"
+        )
+    print()
+
+
+def main() -> None:
+    exact: List[str] = ["Narnia", "Atlantis", "XX", "Q0"]
+    for territory in get_territories():
+        exact.extend([territory.code, territory.name, territory.full_name])
+        if territory.alpha3 is not None:
+            exact.append(territory.alpha3)
+    names = [t.name for t in get_territories() if len(t.name) > 3]
+    fuzzy = [n[0] + n[2] + n[1] + n[3:] for n in names]
+
+    # Build every table before timing.
+    _lookup(exact[0], True)
+    print(f"Passes: {PASSES}, median reported; speedup vs. 1 thread lock-free")
+    print()
+    bench("exact", exact * 5, fuzzy=False)
+    bench("fuzzy", fuzzy, fuzzy=True)
+
+
+if __name__ == "__main__":
+    main()
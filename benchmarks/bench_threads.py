@@ -0,0 +1,155 @@
+"""Thread-scaling benchmark for the GIL-releasing Rust entry points.
+
+Runs a fixed workload through a `ThreadPoolExecutor` at 1, 4, 8 and 16
+workers and reports throughput relative to the single-thread run. The
+Rust bindings drop the GIL around their compute sections (ICU4X
+transliteration, the normalisation pipeline, the AC tagger pass, the
+Bron–Kerbosch covering search, the `compare_parts` DP), so on a
+multi-core box the speedup column should climb with the worker count.
+Object construction still happens under the GIL, so perfect linear
+scaling isn't expected on stock CPython.
+
+Workloads:
+
+- **maybe_ascii** — admitted names from `contrib/sample_names.csv`,
+  suffixed per pass so every call misses the LRU.
+- **normalize** — the same names through `CASEFOLD | NAME`.
+- **analyze_names** — one PER call per name.
+- **pair_symbols** / **compare_parts** — every Putin spelling in
+  `contrib/putin_names.txt` against every other one.
+"""
+
+import csv
+import itertools
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+from rigour.names import (
+    Name,
+    NameTypeTag,
+    analyze_names,
+    compare_parts,
+    pair_symbols,
+)
+from rigour.text.normalize import Normalize, normalize
+from rigour.text.translit import maybe_ascii, should_ascii
+
+CONTRIB = Path(__file__).parent.parent / "contrib"
+PASSES = 3
+THREADS = (1, 4, 8, 16)
+CHUNKS = 64
+# Fresh id per timed run, so cache-busting workloads never see a
+# string a previous run (at any thread count) has already cached.
+RUN_IDS = itertools.count()
+
+
+def load_sample_names() -> List[str]:
+    with open(CONTRIB / "sample_names.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        return [row[0] for row in reader]
+
+
+def load_putin_names() -> List[Name]:
+    with open(CONTRIB / "putin_names.txt", encoding="utf-8") as f:
+        raw = [line.strip() for line in f if line.strip()]
+    names: List[Name] = []
+    for text in raw:
+        names.extend(analyze_names(NameTypeTag.PER, [text]))
+    return names
+
+
+def chunked(items: Sequence, n: int) -> List[Sequence]:
+    size = max(1, len(items) // n)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_threaded(
+    work: Callable[[Sequence], None], chunks: List[Sequence], threads: int
+) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(work, chunks))
+        return time.perf_counter() - start
+
+
+def bench(
+    label: str,
+    make_chunks: Callable[[int], List[Sequence]],
+    work: Callable[[Sequence], None],
+) -> None:
+    print(f"== {label} ==")
+    base = None
+    for threads in THREADS:
+        times = [
+            run_threaded(work, make_chunks(next(RUN_IDS)), threads)
+            for _ in range(PASSES)
+        ]
+        med = statistics.median(times)
+        if base is None:
+            base = med
+        print(
+            f"  {threads:>2} threads: {med * 1000:8.2f} ms   "
+            f"speedup {base / med:5.2f}x"
+        )
+    print()
+
+
+def main() -> None:
+    sample = load_sample_names()
+    admitted = [n for n in sample if should_ascii(n) and not n.isascii()]
+    putin = load_putin_names()
+    pairs: List[Tuple[Name, Name]] = [(q, r) for q in putin for r in putin]
+    flags = Normalize.CASEFOLD | Normalize.NAME
+    print(
+        f"Corpus: {len(sample)} sample names "
+        f"({len(admitted)} non-ASCII admitted), {len(putin)} Putin names"
+    )
+    print(f"Passes: {PASSES}, median reported")
+    print()
+
+    def ascii_chunks(run: int) -> List[Sequence]:
+        # Unique suffix per run and repeat → every call is a cache miss.
+        texts = [f"{n} {run}x{i}" for i in range(20) for n in admitted]
+        return chunked(texts, CHUNKS)
+
+    def ascii_work(chunk: Sequence) -> None:
+        for text in chunk:
+            maybe_ascii(text)
+
+    def norm_chunks(run: int) -> List[Sequence]:
+        return chunked(sample * 20, CHUNKS)
+
+    def norm_work(chunk: Sequence) -> None:
+        for text in chunk:
+            normalize(text, flags)
+
+    def analyze_work(chunk: Sequence) -> None:
+        for text in chunk:
+            analyze_names(NameTypeTag.PER, [text])
+
+    def pair_chunks(run: int) -> List[Sequence]:
+        return chunked(pairs, CHUNKS)
+
+    def pair_work(chunk: Sequence) -> None:
+        for q, r in chunk:
+            pair_symbols(q, r)
+
+    def compare_work(chunk: Sequence) -> None:
+        for q, r in chunk:
+            compare_parts(list(q.parts), list(r.parts))
+
+    bench("maybe_ascii (cache-busted)", ascii_chunks, ascii_work)
+    bench("normalize (CASEFOLD | NAME)", norm_chunks, norm_work)
+    bench(
+        "analyze_names (PER)", lambda run: chunked(sample * 5, CHUNKS), analyze_work
+    )
+    bench("pair_symbols (Putin × Putin)", pair_chunks, pair_work)
+    bench("compare_parts (Putin × Putin)", pair_chunks, compare_work)
+
+
+if __name__ == "__main__":
+    main()
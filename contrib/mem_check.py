@@ -1,5 +1,26 @@
+"""Memory footprint of rigour's lazily built data.
+
+Single process (default): report peak RSS as each component is
+loaded.
+
+Multi-process (`--workers N`): start N fresh worker processes that
+each load every component, then read their RSS and PSS (proportional
+set size: shared pages are split between the processes mapping them)
+from `/proc/<pid>/smaps_rollup`. This runs twice — once building the
+taggers privately in each worker, once with `RIGOUR_TAGGER_CACHE`
+pointing at pre-saved tagger images that every worker maps — so the
+difference is the per-worker memory the shared images save. Linux
+only.
+"""
+
+import argparse
 import gc
+import os
 import resource
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
 
 
 def get_mem() -> int:
@@ -17,13 +38,17 @@ def sizeof_fmt(num: float, suffix="B"):
     return f"{num:.1f}Yi{suffix}"
 
 
-def run_checks():
-    print("Initial:", sizeof_fmt(get_mem()))
+def run_checks(verbose: bool = True):
+    def report(label: str) -> None:
+        if verbose:
+            print(label, sizeof_fmt(get_mem() * 1024))
+
+    report("Initial:")
     from rigour.territories import lookup_territory
 
     lookup_territory("Germany")
 
-    print("After loading territories:", sizeof_fmt(get_mem()))
+    report("After loading territories:")
 
     from rigour.addresses import normalize_address, remove_address_keywords
 
@@ -32,25 +57,104 @@ def run_checks():
     if addr:
         remove_address_keywords(addr)
 
-    print("After loading addresses:", sizeof_fmt(get_mem()))
+    report("After loading addresses:")
 
     from rigour.names import remove_org_types
 
     org = "Example Limited Liability Company"
     org = remove_org_types(org)
 
-    print("After loading org types:", sizeof_fmt(get_mem()))
+    report("After loading org types:")
 
     from rigour.names import NameTypeTag, analyze_names
 
     analyze_names(NameTypeTag.ORG, ["Example Organization"])
 
-    print("After loading org names:", sizeof_fmt(get_mem()))
+    report("After loading org names:")
 
     analyze_names(NameTypeTag.PER, ["John Doe"])
 
-    print("After loading person names:", sizeof_fmt(get_mem()))
+    report("After loading person names:")
+
+
+def smaps_rollup(pid: int) -> Dict[str, int]:
+    """RSS / PSS / shared figures of a process, in bytes."""
+    out: Dict[str, int] = {}
+    with open(f"/proc/{pid}/smaps_rollup") as fh:
+        for line in fh:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                out[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    return out
+
+
+def run_workers(count: int, cache_dir: Optional[str]) -> List[Dict[str, int]]:
+    """Start `count` workers, wait until all are loaded, measure them."""
+    env = dict(os.environ)
+    env.pop("RIGOUR_TAGGER_CACHE", None)
+    if cache_dir is not None:
+        env["RIGOUR_TAGGER_CACHE"] = cache_dir
+    procs = [
+        subprocess.Popen(
+            [sys.executable, __file__, "--worker"],
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(count)
+    ]
+    try:
+        for proc in procs:
+            assert proc.stdout is not None
+            if proc.stdout.readline().strip() != "ready":
+                raise RuntimeError("worker failed to load")
+        # Measure only once every worker is loaded, so PSS reflects
+        # the pages they share with each other.
+        return [smaps_rollup(proc.pid) for proc in procs]
+    finally:
+        for proc in procs:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait()
+
+
+def worker() -> None:
+    run_checks(verbose=False)
+    print("ready", flush=True)
+    sys.stdin.read()
+
+
+def report_workers(label: str, stats: List[Dict[str, int]]) -> int:
+    rss = sum(s["Rss"] for s in stats)
+    pss = sum(s["Pss"] for s in stats)
+    print(
+        f"{label:<16} RSS total {sizeof_fmt(rss):>10}  "
+        f"PSS total {sizeof_fmt(pss):>10}  "
+        f"PSS/worker {sizeof_fmt(pss / len(stats)):>10}"
+    )
+    return pss
+
+
+def compare_workers(count: int) -> None:
+    from rigour.names import save_tagger_images
+
+    print(f"Workers: {count}")
+    private = report_workers("private taggers", run_workers(count, None))
+    with tempfile.TemporaryDirectory() as tmp:
+        save_tagger_images(tmp)
+        shared = report_workers("mapped taggers", run_workers(count, tmp))
+    print(f"Saving: {sizeof_fmt(private - shared)} in total")
 
 
 if __name__ == "__main__":
-    run_checks()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker()
+    elif args.workers > 0:
+        compare_workers(args.workers)
+    else:
+        run_checks()
@@ -1,25 +1,29 @@
 import yaml
 import logging
+from typing import Any, Dict, List
 
-from genscripts.util import write_python, RESOURCES_PATH, CODE_PATH
+from genscripts.util import write_json, RESOURCES_PATH, RUST_DATA_PATH
 
 log = logging.getLogger(__name__)
 
-TEMPLATE = """
-from typing import Dict, List
-
-FORMS: Dict[str, List[str]] = %r
-"""
-
 
 def generate_data_file() -> None:
+    """Emit `rust/data/addresses/forms.json` — an array of `{target,
+    forms}` records in YAML order. Consumed by the Rust-side address
+    keyword replacer (`rust/src/text/address.rs`) via `include_str!`.
+    Order is kept because a form listed under two targets maps to the
+    later one."""
     source_path = RESOURCES_PATH / "addresses"
     with open(source_path / "forms.yml", "r", encoding="utf-8") as ufh:
         data = yaml.safe_load(ufh.read())
 
-    dest_path = CODE_PATH / "addresses" / "data.py"
-    content = TEMPLATE % data.get("forms", {})
-    write_python(dest_path, content)
+    records: List[Dict[str, Any]] = []
+    for target, forms in data.get("forms", {}).items():
+        records.append({"target": target, "forms": forms})
+
+    out_path = RUST_DATA_PATH / "addresses" / "forms.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(out_path, records, indent=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import re
+import unicodedata
+from typing import Iterable, List
+
+import stdnum
+from stdnum import bic, isin, numdb
+from stdnum.util import _char_map
+
+from genscripts.util import RUST_GENERATED_PATH
+
+HEADER = """\
+// This file is automatically generated by genscripts/generate_ids.py,
+// do not edit it. Run `make build-ids` to regenerate.
+//
+// Tables copied out of python-stdnum, which `rigour.ids` wraps; all
+// sorted by key for binary search. See `rust/src/ids.rs`.
+"""
+
+# The BBAN structure notation used in stdnum's iban.dat, e.g. "4!n12!c".
+STRUCTURE_RE = re.compile(r"(?:[1-9][0-9]*![nac])*")
+
+
+def _rust_str(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _rust_char(value: str) -> str:
+    if value in ("\\", "'"):
+        return f"'\\{value}'"
+    # Spaces, controls and combining marks don't survive a text editor.
+    if unicodedata.category(value)[0] in "CMZ":
+        return f"'\\u{{{ord(value):x}}}'"
+    return f"'{value}'"
+
+
+def _codes(name: str, doc: str, codes: Iterable[str]) -> List[str]:
+    codes = sorted(set(codes))
+    assert all(len(c) == 2 and c.isascii() and c.isupper() for c in codes)
+    lines = [f"/// {doc}", f"pub(crate) static {name}: &[&str] = &["]
+    for i in range(0, len(codes), 12):
+        lines.append("    " + " ".join(f"{_rust_str(c)}," for c in codes[i : i + 12]))
+    lines.append("];")
+    return lines
+
+
+def render() -> str:
+    lines = [HEADER]
+    lines.append("/// The python-stdnum release these tables were copied from.")
+    lines.append(f"pub const STDNUM_VERSION: &str = {_rust_str(stdnum.__version__)};")
+    lines.append("")
+    lines.append("/// Look-alike characters `stdnum.util.clean` maps to ASCII.")
+    lines.append("pub(crate) static CLEAN_CHARS: &[(char, char)] = &[")
+    for char, ascii in sorted(_char_map.items()):
+        assert len(ascii) == 1 and ascii.isascii()
+        lines.append(f"    ({_rust_char(char)}, {_rust_char(ascii)}),")
+    lines.append("];")
+    lines.append("")
+    lines.extend(
+        _codes("ISIN_COUNTRIES", "ISIN country prefixes.", isin._country_codes)
+    )
+    lines.append("")
+    lines.extend(_codes("BIC_COUNTRIES", "BIC country codes.", bic._country_codes))
+    lines.append("")
+    lines.append("/// IBAN country code → BBAN structure, in SWIFT notation.")
+    lines.append("pub(crate) static IBAN_BBAN: &[(&str, &str)] = &[")
+    for length, low, high, props, children in sorted(numdb.get("iban").prefixes):
+        assert length == 2 and low == high and not children
+        structure = props["bban"]
+        assert STRUCTURE_RE.fullmatch(structure), structure
+        lines.append(f"    ({_rust_str(low)}, {_rust_str(structure)}),")
+    lines.append("];")
+    return "\n".join(lines) + "\n"
+
+
+def update_data() -> None:
+    output_path = RUST_GENERATED_PATH / "stdnum.rs"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.write(render())
+
+
+if __name__ == "__main__":
+    update_data()
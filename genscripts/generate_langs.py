@@ -1,23 +1,77 @@
 import csv
 import logging
-from typing import Dict, Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 import yaml
 
+from rigour.langs.synonyms import LANG_SYNONYMS, NON_LANGS
 from rigour.langs.util import normalize_code
-from genscripts.util import write_python, CODE_PATH, RESOURCES_PATH
+from genscripts.util import RESOURCES_PATH, RUST_GENERATED_PATH
 
 # https://iso639-3.sil.org/sites/iso639-3/files/downloads/iso-639-3.tab
 log = logging.getLogger(__name__)
 
-TEMPLATE = """from typing import Dict, Set
+# Codes per line in the packed `ISO3_ALL` literal.
+CODES_PER_LINE = 24
 
-ISO3_ALL: Set[str] = set(%r)  # noqa
-ISO3_MAP: Dict[str, str] = %r  # noqa
-ISO2_MAP: Dict[str, str] = %r  # noqa
+HEADER = """\
+// This file is automatically generated by genscripts/generate_langs.py,
+// do not edit it. Run `make build-iso639` to regenerate.
+//
+// All tables are sorted by key (byte order) for binary search; see
+// `rust/src/langs.rs`.
 """
 
 
+def _rust_str(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _pairs(name: str, doc: str, items: Iterable[Tuple[str, str]]) -> List[str]:
+    lines = [f"/// {doc}", f"pub(crate) static {name}: &[(&str, &str)] = &["]
+    for key, value in sorted(items):
+        lines.append(f"    ({_rust_str(key)}, {_rust_str(value)}),")
+    lines.append("];")
+    return lines
+
+
+def render(
+    iso3_ids: Set[str], iso3_map: Dict[str, str], iso2_map: Dict[str, str]
+) -> str:
+    codes = sorted(iso3_ids)
+    assert all(len(c) == 3 and c.isascii() for c in codes)
+    lines = [HEADER]
+    lines.append("/// Every ISO 639-3 code, packed three bytes per code.")
+    lines.append('pub(crate) static ISO3_ALL: &str = "\\')
+    for i in range(0, len(codes), CODES_PER_LINE):
+        lines.append("    " + "".join(codes[i : i + CODES_PER_LINE]) + "\\")
+    lines.append('";')
+    lines.append("")
+    lines.extend(
+        _pairs(
+            "ISO3_MAP",
+            "Two-letter, ISO 639-2 and language name → ISO 639-3 code.",
+            iso3_map.items(),
+        )
+    )
+    lines.append("")
+    lines.extend(
+        _pairs("ISO2_MAP", "ISO 639-3 → ISO 639-1 code.", iso2_map.items())
+    )
+    lines.append("")
+    lines.append("/// Codes that are not a language (`rigour.langs.synonyms.NON_LANGS`).")
+    non_langs = ", ".join(_rust_str(c) for c in sorted(NON_LANGS))
+    lines.append(f"pub(crate) static NON_LANGS: &[&str] = &[{non_langs}];")
+    lines.append("")
+    lines.append("/// Synonym groups (`rigour.langs.synonyms.LANG_SYNONYMS`), in order.")
+    lines.append("pub(crate) static SYNONYMS: &[&[&str]] = &[")
+    for group in LANG_SYNONYMS:
+        lines.append("    &[" + ", ".join(_rust_str(c) for c in group) + "],")
+    lines.append("];")
+    return "\n".join(lines) + "\n"
+
+
 def update_data() -> None:
     iso3_ids: Set[str] = set()
     iso2_map: Dict[str, str] = {}
@@ -59,9 +113,10 @@ def update_data() -> None:
             for value in values:
                 iso3_map[value.lower()] = iso3
 
-    output_path = CODE_PATH / "langs" / "iso639.py"
-    content = TEMPLATE % (list(sorted(iso3_ids)), iso3_map, iso2_map)
-    write_python(output_path, content)
+    output_path = RUST_GENERATED_PATH / "iso639.rs"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.write(render(iso3_ids, iso3_map, iso2_map))
 
 
 if __name__ == "__main__":
@@ -11,7 +11,6 @@ from ruamel.yaml.scalarstring import FoldedScalarString, DoubleQuotedScalarStrin
 
 from rigour.ids.wikidata import is_qid
 from rigour.langs import iso_639_alpha3
-from rigour.territories.territory import Territory
 from rigour.territories.util import clean_code, clean_codes
 from genscripts.util import write_jsonl, norm_string, RESOURCES_PATH, RUST_DATA_PATH
 
@@ -147,7 +146,6 @@ def rewrite_territories():
 
 def update_data() -> None:
     raw_territories: Dict[str, Any] = {}
-    territories: Dict[str, Territory] = {}
     seen_codes: Set[str] = set()
     for source_file in territory_files():
         filename = os.path.basename(source_file)
@@ -176,7 +174,7 @@ def update_data() -> None:
                 data["names_weak"] = sorted(names)
             data["other_codes"] = clean_codes(data.get("other_codes", []))
             for other in data["other_codes"]:
-                if other in territories:
+                if other in raw_territories:
                     log.warning("Duplicate code: %s", other)
             if len(data["other_codes"]) == 0:
                 data.pop("other_codes")
@@ -202,38 +200,40 @@ def update_data() -> None:
                     langs.add(lang_code)
                 data["langs"] = sorted(langs)
             raw_territories[code] = data
-            territories[code] = Territory(territories, code, data)
-
-    for terr in territories.values():
-        assert terr.name is not None, f"Must have a name: {terr.code}"
-        assert terr.code is not None, f"Missing code: {terr.name}"
-        assert terr.qid is not None, f"Missing QID: {terr.code}"
-        assert is_qid(terr.qid), f"Invalid QID: {terr.code}"
-        for other_qid in terr.other_qids:
+
+    # Validate the raw records: the `Territory` objects are only ever
+    # built by the Rust core, from the data written below.
+    for code, data in raw_territories.items():
+        assert data.get("name") is not None, f"Must have a name: {code}"
+        assert data.get("qid") is not None, f"Missing QID: {code}"
+        assert is_qid(data["qid"]), f"Invalid QID: {code}"
+        for other_qid in data.get("other_qids", []):
             assert is_qid(other_qid), f"Invalid QID: {other_qid}"
-        if terr._parent is not None:
-            assert terr._parent != terr.code, f"Cannot be its own parent: {terr.code}"
-            if terr._parent not in territories:
-                msg = "Invalid parent: %s (country: %r)" % (terr._parent, terr.code)
+        parent = data.get("parent")
+        if parent is not None:
+            assert parent != code, f"Cannot be its own parent: {code}"
+            if parent not in raw_territories:
+                msg = "Invalid parent: %s (country: %r)" % (parent, code)
                 raise RuntimeError(msg)
 
-        for successor in terr._successors:
-            if successor not in territories:
-                msg = "Invalid successor: %s (country: %r)" % (successor, terr.code)
+        for successor in data.get("successors", []):
+            if successor not in raw_territories:
+                msg = "Invalid successor: %s (country: %r)" % (successor, code)
                 raise RuntimeError(msg)
 
-        for claim in terr._claims:
-            if claim not in territories:
-                msg = "Invalid claim: %s (country: %r)" % (claim, terr.code)
+        for claim in data.get("claims", []):
+            if claim not in raw_territories:
+                msg = "Invalid claim: %s (country: %r)" % (claim, code)
                 raise RuntimeError(msg)
 
-        for see in terr._see:
-            if see not in territories:
-                msg = "Invalid see: %s (country: %r)" % (see, terr.code)
+        for see in data.get("see", []):
+            if see not in raw_territories:
+                msg = "Invalid see: %s (country: %r)" % (see, code)
                 raise RuntimeError(msg)
 
-        if terr.is_country and not terr.is_jurisdiction:
-            msg = "Country is not a jurisdiction: %r" % terr.code
+        is_country = data.get("is_country", False)
+        if is_country and not data.get("is_jurisdiction", is_country):
+            msg = "Country is not a jurisdiction: %r" % code
             raise RuntimeError(msg)
 
     out_path = RUST_DATA_PATH / "territories" / "data.jsonl"
@@ -0,0 +1,10 @@
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.warmup import preload
+
+__all__ = ["preload"]
+
+__getattr__, __dir__ = lazy_exports(globals(), {"rigour.warmup": ["preload"]})
@@ -1,3 +1,5 @@
+from typing import Any
+
 def metaphone(token: str) -> str: ...
 def soundex(token: str) -> str: ...
 def codepoint_script(cp: int) -> str | None: ...
@@ -7,6 +9,44 @@ def should_ascii(text: str) -> bool: ...
 def maybe_ascii(text: str, drop: bool = False) -> str: ...
 def tokenize_name(text: str, token_min_length: int = 1) -> list[str]: ...
 def _normalize(text: str, flags: int, cleanup: int) -> str | None: ...
+def normalize_territory_name(name: str) -> str: ...
+def normalize_territory_names(names: list[str]) -> list[str]: ...
+def normalize_address(
+    address: str, latinize: bool = False, min_length: int = 4
+) -> str | None: ...
+def normalize_addresses(
+    addresses: list[str],
+    latinize: bool = False,
+    min_length: int = 4,
+    threads: int | None = None,
+) -> list[str | None]: ...
+def shorten_address_keywords(address: str, latinize: bool = False) -> str: ...
+def shorten_address_keywords_batch(
+    addresses: list[str], latinize: bool = False, threads: int | None = None
+) -> list[str]: ...
+def remove_address_keywords(
+    address: str, latinize: bool = False, replacement: str = " "
+) -> str: ...
+def remove_address_keywords_batch(
+    addresses: list[str],
+    latinize: bool = False,
+    replacement: str = " ",
+    threads: int | None = None,
+) -> list[str]: ...
+def compare_addresses(left: str, right: str, latinize: bool = False) -> float: ...
+def compare_addresses_batch(
+    pairs: list[tuple[str, str]], latinize: bool = False, threads: int | None = None
+) -> list[float]: ...
+def address_keys(address: str, latinize: bool = False) -> list[str]: ...
+def address_keys_batch(
+    addresses: list[str], latinize: bool = False, threads: int | None = None
+) -> list[list[str]]: ...
+def normalize_identifiers(
+    format: str, values: list[str], threads: int | None = None
+) -> list[str | None]: ...
+def validate_identifiers(
+    format: str, values: list[str], threads: int | None = None
+) -> list[bool]: ...
 def raw_levenshtein(a: str, b: str) -> int: ...
 def raw_levenshtein_cutoff(a: str, b: str, cutoff: int) -> int: ...
 def raw_jaro(a: str, b: str) -> float: ...
@@ -35,7 +75,83 @@ def generic_person_names_list() -> list[str]: ...
 def ordinals_dict() -> dict[int, list[str]]: ...
 def territories_jsonl() -> str: ...
 
+# Territory index (rigour.territories).
+class Territory:
+    """A territory - country, sub-national, historic, or supranational.
+
+    One object per territory, built once per process with inherited
+    fields resolved. Compared, ordered and hashed by `code`.
+    """
+
+    code: str
+    name: str
+    full_name: str
+    alpha3: str | None
+    is_country: bool
+    is_ftm: bool
+    is_jurisdiction: bool
+    is_historical: bool
+    qid: str
+    qids: frozenset[str]
+    codes: frozenset[str]
+    region: str | None
+    subregion: str | None
+    in_sentence: str
+    ftm_country: str | None
+    _region: str | None
+    _subregion: str | None
+    _in_sentence: str | None
+
+    @property
+    def parent(self) -> "Territory | None": ...
+    @property
+    def successors(self) -> list["Territory"]: ...
+    @property
+    def claims(self) -> list["Territory"]: ...
+    @property
+    def see(self) -> list["Territory"]: ...
+    @property
+    def other_qids(self) -> list[str]: ...
+    @property
+    def other_codes(self) -> list[str]: ...
+    @property
+    def langs(self) -> list[str]: ...
+    def to_dict(self) -> dict[str, Any]: ...
+    def __lt__(self, other: object) -> bool: ...
+    def __le__(self, other: object) -> bool: ...
+    def __gt__(self, other: object) -> bool: ...
+    def __ge__(self, other: object) -> bool: ...
+
+def territory_index() -> dict[str, Territory]: ...
+def territory_by_code(code: str) -> Territory | None: ...
+def territories_intersect(left: list[str], right: list[str]) -> set[str]: ...
+def territories_intersect_batch(
+    query: list[str], candidates: list[list[str]]
+) -> list[set[str]]: ...
+def territory_is_within(code: str, ancestor: str) -> bool: ...
+def territory_descendants(code: str) -> list[Territory]: ...
+def find_territories(text: str) -> list[tuple[int, int, Territory, bool]]: ...
+def find_territories_batch(
+    texts: list[str], threads: int | None = None
+) -> list[list[tuple[int, int, Territory, bool]]]: ...
+
+class FuzzyNameIndex:
+    # BK-tree over a list of names; results are (position, distance).
+    def __init__(self, names: list[str]) -> None: ...
+    def __len__(self) -> int: ...
+    def search(self, name: str) -> tuple[int, int] | None: ...
+    def search_batch(
+        self, names: list[str], threads: int | None = None
+    ) -> list[tuple[int, int] | None]: ...
+
+# ISO 639 language codes (rigour.langs).
+def iso_639_alpha3(code: str) -> str | None: ...
+def iso_639_alpha2(code: str) -> str | None: ...
+def is_iso_639_3(code: str) -> bool: ...
+def list_to_alpha3(codes: list[str], synonyms: bool = True) -> set[str]: ...
+
 MAX_NAME_LENGTH: int
+STDNUM_VERSION: str
 
 
 class SymbolCategory:
@@ -195,6 +311,89 @@ class Name:
     @classmethod
     def consolidate_names(cls, names: "object") -> set["Name"]: ...
 
+    def prepare(self) -> "PreparedName": ...
+
+    def to_bytes(self) -> bytes: ...
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Name": ...
+
+
+def dump_names(names: list[Name]) -> bytes: ...
+
+
+def load_names(data: bytes) -> list[Name]: ...
+
+
+def name_data_version() -> int: ...
+
+
+class Column:
+    """A read-only 1-D array exported through the buffer protocol."""
+
+    format: str
+    itemsize: int
+
+    def __len__(self) -> int: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+
+class NameColumns:
+    """Columnar view over a batch of analysed names."""
+
+    type_tags: list[NameTypeTag]
+    part_tags: list[NamePartTag]
+    symbol_categories: list[SymbolCategory]
+
+    num_entities: int
+    num_names: int
+    num_parts: int
+    num_spans: int
+    num_symbols: int
+
+    entity_name_offsets: Column
+    name_tag: Column
+    name_form_offsets: Column
+    name_form_data: Column
+    name_part_offsets: Column
+    name_span_offsets: Column
+    part_tag: Column
+    part_form_offsets: Column
+    part_form_data: Column
+    part_comparable_offsets: Column
+    part_comparable_data: Column
+    part_metaphone_offsets: Column
+    part_metaphone_data: Column
+    part_metaphone_validity: Column
+    span_part_offsets: Column
+    span_parts: Column
+    span_symbol: Column
+    symbol_category: Column
+    symbol_id_offsets: Column
+    symbol_id_data: Column
+
+    def __len__(self) -> int: ...
+
+
+def names_to_columns(entities: list[list[Name]]) -> NameColumns: ...
+
+
+def analyze_names_columns(
+    type_tags: list[NameTypeTag],
+    names: list[list[str]],
+    part_tags: list[dict[NamePartTag, list[str]] | None] | None = None,
+    *,
+    infer_initials: bool = False,
+    symbols: bool = True,
+    phonetics: bool = True,
+    numerics: bool = True,
+    consolidate: bool = True,
+    rewrite: bool = True,
+    threads: int | None = None,
+    cached: list[bytes | None] | None = None,
+) -> tuple[NameColumns, list[bytes | None]]: ...
+
 
 def analyze_names(
     type_tag: NameTypeTag,
@@ -210,6 +409,27 @@ def analyze_names(
 ) -> set[Name]: ...
 
 
+def analyze_names_batch(
+    type_tags: list[NameTypeTag],
+    names: list[list[str]],
+    part_tags: list[dict[NamePartTag, list[str]] | None] | None = None,
+    *,
+    infer_initials: bool = False,
+    symbols: bool = True,
+    phonetics: bool = True,
+    numerics: bool = True,
+    consolidate: bool = True,
+    rewrite: bool = True,
+    threads: int | None = None,
+) -> list[set[Name]]: ...
+
+
+def save_tagger_images(directory: str) -> list[str]: ...
+
+
+def preload_data(components: list[str] | None = None) -> list[tuple[str, float]]: ...
+
+
 def align_person_name_order(
     left: list[NamePart],
     right: list[NamePart],
@@ -298,3 +518,87 @@ def compare_parts(
     res: list[NamePart],
     config: CompareConfig | None = None,
 ) -> list[Alignment]: ...
+
+
+class MatchConfig:
+    """Scoring knobs for `match_name_sets`.
+
+    Frozen, like `CompareConfig`. `symbol_scores` / `symbol_weights`
+    override the per-category defaults for symbol edges; the getters
+    return the effective table, defaults included. The defaults are
+    nomenklatura logic_v2's `SYM_SCORES` / `SYM_WEIGHTS` tables and
+    its `nm_extra_query_name` / `nm_extra_result_name` weights.
+    """
+
+    compare: CompareConfig
+    symbol_scores: dict[SymbolCategory, float]
+    symbol_weights: dict[SymbolCategory, float]
+    extra_query_weight: float
+    extra_result_weight: float
+
+    def __init__(
+        self,
+        compare: CompareConfig | None = None,
+        symbol_scores: dict[SymbolCategory, float] | None = None,
+        symbol_weights: dict[SymbolCategory, float] | None = None,
+        extra_query_weight: float = 0.8,
+        extra_result_weight: float = 0.2,
+    ) -> None: ...
+
+
+class NameSetMatch:
+    """Best pair found by `match_name_sets`, with work counters."""
+
+    score: float
+    query: Name | None
+    result: Name | None
+    alignments: tuple[Alignment, ...]
+    literal: bool
+    pairs: int
+    filtered: int
+    skipped: int
+    scored: int
+
+
+def match_name_sets(
+    query_names: list[Name],
+    result_names: list[Name],
+    config: MatchConfig | None = None,
+) -> NameSetMatch: ...
+
+
+def score_upper_bound(
+    query: Name,
+    result: Name,
+    config: MatchConfig | None = None,
+) -> float: ...
+
+
+class PreparedName:
+    """A query `Name` with its pairing and residue inputs precomputed."""
+
+    name: Name
+
+    def __init__(self, name: Name) -> None: ...
+    def pair_symbols(self, other: Name) -> list[tuple[Alignment, ...]]: ...
+    def pair_symbols_many(
+        self, others: list[Name]
+    ) -> list[list[tuple[Alignment, ...]]]: ...
+    def compare_parts(
+        self,
+        qry: list[NamePart],
+        res: list[NamePart],
+        config: CompareConfig | None = None,
+    ) -> list[Alignment]: ...
+    def compare_parts_many(
+        self,
+        qry: list[NamePart],
+        candidates: list[list[NamePart]],
+        config: CompareConfig | None = None,
+    ) -> list[list[Alignment]]: ...
+    def score_upper_bound(
+        self, other: Name, config: MatchConfig | None = None
+    ) -> float: ...
+    def match_names(
+        self, results: list[Name], config: MatchConfig | None = None
+    ) -> NameSetMatch: ...
@@ -1,8 +1,21 @@
 """
 This module provides a set of tools for handling postal/geographic addresses. It includes functions
-for normalising addresses for comparison purposes, and for formatting addresses given in parts for
+for normalising and comparing addresses, and for formatting addresses given in parts for
 display as a single string.
 
+## Address comparison
+
+`compare_addresses` scores how likely two addresses describe the same place, and
+`address_keys` generates blocking keys, so that candidate pairs in a large set of
+addresses can be found by grouping on keys rather than comparing all pairs.
+
+```python
+from rigour.addresses import address_keys, compare_addresses
+
+compare_addresses("160 Broad Street, Birmingham", "160 Broad St., Birmingham, UK")
+address_keys("Bahnhofstr. 10, 86150 Augsburg, Germany")
+```
+
 ## Postal address formatting
 
 This set of helpers is designed to help with the processing of real-world
@@ -22,6 +35,8 @@ address = {
 address_text = format_address_line(address, country="DE")
 ```
 
+`format_address_lines` formats a whole list of addresses in one call.
+
 ### Acknowledgements
 
 The address formatting database contained in `rigour/data/addresses/formats.yml` is
@@ -30,16 +45,60 @@ repository](https://github.com/OpenCageData/address-formatting). It is used to
 format addresses according to customs in the country that is been encoded.
 """
 
-from rigour.addresses.cleaning import clean_address
-from rigour.addresses.normalize import normalize_address
-from rigour.addresses.normalize import remove_address_keywords, shorten_address_keywords
-from rigour.addresses.format import format_address, format_address_line
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.addresses.cleaning import clean_address
+    from rigour.addresses.compare import compare_addresses, compare_addresses_batch
+    from rigour.addresses.compare import address_keys, address_keys_batch
+    from rigour.addresses.normalize import normalize_address, normalize_addresses
+    from rigour.addresses.normalize import remove_address_keywords, shorten_address_keywords
+    from rigour.addresses.normalize import remove_address_keywords_batch
+    from rigour.addresses.normalize import shorten_address_keywords_batch
+    from rigour.addresses.format import format_address, format_address_line
+    from rigour.addresses.format import format_address_lines
 
 __all__ = [
     "clean_address",
+    "compare_addresses",
+    "compare_addresses_batch",
+    "address_keys",
+    "address_keys_batch",
     "normalize_address",
+    "normalize_addresses",
     "remove_address_keywords",
     "shorten_address_keywords",
+    "remove_address_keywords_batch",
+    "shorten_address_keywords_batch",
     "format_address",
     "format_address_line",
+    "format_address_lines",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.addresses.cleaning": ["clean_address"],
+        "rigour.addresses.compare": [
+            "compare_addresses",
+            "compare_addresses_batch",
+            "address_keys",
+            "address_keys_batch",
+        ],
+        "rigour.addresses.normalize": [
+            "normalize_address",
+            "normalize_addresses",
+            "remove_address_keywords",
+            "shorten_address_keywords",
+            "remove_address_keywords_batch",
+            "shorten_address_keywords_batch",
+        ],
+        "rigour.addresses.format": [
+            "format_address",
+            "format_address_line",
+            "format_address_lines",
+        ],
+    },
+)
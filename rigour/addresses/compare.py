@@ -0,0 +1,93 @@
+from typing import Iterable, List, Tuple
+
+from rigour._core import address_keys as _address_keys
+from rigour._core import address_keys_batch as _address_keys_batch
+from rigour._core import compare_addresses as _compare_addresses
+from rigour._core import compare_addresses_batch as _compare_addresses_batch
+
+
+def compare_addresses(left: str, right: str, latinize: bool = False) -> float:
+    """Score how likely two addresses describe the same place.
+
+    Both addresses are normalised with :func:`normalize_address` and have
+    their keywords shortened as in :func:`shorten_address_keywords`. The
+    score is a weighted Dice coefficient over the two token sets: shortened
+    keywords (`"st"`, `"apt"`) and territory codes (`"de"`, `"gb"`) weigh
+    less than other words, so spelling out `"Street"` changes nothing and a
+    missing country costs little.
+
+    Args:
+        left: A raw address string.
+        right: A raw address string.
+        latinize: Transliterate both addresses to ASCII before comparing,
+            see :func:`normalize_address`.
+
+    Returns:
+        A similarity between 0.0 and 1.0. Addresses which normalise to
+        nothing score 0.0.
+    """
+    return _compare_addresses(left, right, latinize)
+
+
+def compare_addresses_batch(
+    pairs: Iterable[Tuple[str, str]], latinize: bool = False
+) -> List[float]:
+    """Score many address pairs at once, as :func:`compare_addresses` would.
+    The pairs are compared without the GIL, spread over the available CPU
+    cores.
+
+    Args:
+        pairs: `(left, right)` raw address strings.
+        latinize: See :func:`compare_addresses`.
+
+    Returns:
+        One score per pair, in order.
+    """
+    return _compare_addresses_batch(list(pairs), latinize)
+
+
+def address_keys(address: str, latinize: bool = False) -> List[str]:
+    """Generate blocking keys for an address.
+
+    Two addresses that might describe the same place share at least one
+    key, so candidate pairs for :func:`compare_addresses` can be found by
+    sorting or grouping on the keys instead of comparing every address with
+    every other. Keys are built from the normalised, keyword-shortened
+    tokens:
+
+    * `p:<token>` for postal-code-like tokens (`"p:86150"`, `"p:sw1y5hx"`),
+    * `n:<number>:<word>` for a house number of up to four digits next to a
+      street word (`"n:10:bahnhofstr"`); these never also yield `p:` keys,
+    * `r:<word>` for the two longest plain words, standing in for the
+      rarest ones.
+
+    Large blocks (e.g. `r:` keys of common city names) should be dropped or
+    capped before building pairs from them.
+
+    Args:
+        address: A raw address string.
+        latinize: Transliterate the address to ASCII first, see
+            :func:`normalize_address`.
+
+    Returns:
+        A sorted list of distinct keys, empty if the address normalises to
+        nothing.
+    """
+    return _address_keys(address, latinize)
+
+
+def address_keys_batch(
+    addresses: Iterable[str], latinize: bool = False
+) -> List[List[str]]:
+    """Generate blocking keys for many addresses at once, as
+    :func:`address_keys` would. The addresses are processed without the GIL,
+    spread over the available CPU cores.
+
+    Args:
+        addresses: Raw address strings.
+        latinize: See :func:`address_keys`.
+
+    Returns:
+        One sorted key list per address, in order.
+    """
+    return _address_keys_batch(list(addresses), latinize)
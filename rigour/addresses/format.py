@@ -1,5 +1,6 @@
+import re
 import yaml
-from typing import Dict, Optional, TypedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, TypedDict, Union
 from functools import cache
 from jinja2 import Template, Environment
 
@@ -9,6 +10,14 @@ from rigour.addresses.cleaning import clean_address
 
 env = Environment()
 
+# Template tags understood by the compiled renderer. The templates in
+# `formats.yml` only use `{{a or b or ...}}` and one `{%- if a and b -%}`
+# block; anything else is rendered through Jinja2.
+TAG = re.compile(r"({{.*?}}|{%.*?%})", re.S)
+VARS = re.compile(r"^{{\s*(\w+(?:\s+or\s+\w+)*)\s*}}$")
+IF_OPEN = re.compile(r"^{%(-?)\s*if\s+(\w+(?:\s+and\s+\w+)*)\s*(-?)%}$")
+IF_CLOSE = re.compile(r"^{%(-?)\s*endif\s*(-?)%}$")
+
 
 class Format(TypedDict):
     address_template: str
@@ -16,6 +25,26 @@ class Format(TypedDict):
     add_component: Dict[str, str]
 
 
+class _Cond(NamedTuple):
+    """Literal text emitted only when all of `names` are present."""
+
+    names: Tuple[str, ...]
+    text: str
+
+
+# A literal, a `{{a or b}}` lookup, or a conditional literal.
+Segment = Union[str, Tuple[str, ...], _Cond]
+
+
+class _Formatter(NamedTuple):
+    """A country's template with its `use_country` redirects resolved."""
+
+    # Cleaned `add_component` values, applied to addresses lacking the key.
+    defaults: Dict[str, str]
+    segments: Optional[List[Segment]]
+    template: str
+
+
 @cache
 def _load_formats() -> Dict[str, Format]:
     template_file = DATA_PATH / "addresses" / "formats.yml"
@@ -29,27 +58,93 @@ def _load_template(template: str) -> Template:
     return env.from_string(template)
 
 
-def _format(address: Dict[str, Optional[str]], country: Optional[str] = None) -> str:
+def _compile(template: str) -> Optional[List[Segment]]:
+    """Compile a template into segments, or return None if it uses syntax
+    beyond the supported subset."""
+    # Jinja2 normalises newlines and drops a single trailing newline.
+    source = "\n".join(template.splitlines())
+    if "{#" in source:
+        return None
+    tokens = TAG.split(source)
+    segments: List[Segment] = []
+    cond: Optional[Tuple[str, ...]] = None
+    cond_text: List[str] = []
+    strip_next = False
+    for idx, token in enumerate(tokens):
+        if idx % 2 == 0:
+            text = token.lstrip() if strip_next else token
+            strip_next = False
+            if cond is not None:
+                cond_text.append(text)
+            else:
+                segments.append(text)
+            continue
+        out = cond_text if cond is not None else segments
+        if token.startswith("{{"):
+            match = VARS.match(token)
+            if match is None or cond is not None:
+                return None
+            names = tuple(re.split(r"\s+or\s+", match.group(1)))
+            # A missing value would render the Jinja2 global of that name.
+            if any(name in env.globals for name in names):
+                return None
+            segments.append(names)
+            continue
+        opener = IF_OPEN.match(token)
+        closer = IF_CLOSE.match(token)
+        if opener is not None and cond is None:
+            strip_before, terms, strip_after = opener.groups()
+            cond = tuple(re.split(r"\s+and\s+", terms))
+        elif closer is not None and cond is not None:
+            strip_before, strip_after = closer.groups()
+        else:
+            return None
+        if strip_before and out and isinstance(out[-1], str):
+            out[-1] = out[-1].rstrip()
+        strip_next = bool(strip_after)
+        if closer is not None and cond is not None:
+            text = "".join(cond_text)
+            if text:
+                segments.append(_Cond(cond, text))
+            cond = None
+            cond_text = []
+    if cond is not None:
+        return None
+    return [seg for seg in segments if seg != ""]
+
+
+def _find_format(formats: Dict[str, Format], country: Optional[str]) -> Format:
     country = country.upper() if country is not None else "default"
-    formats = _load_formats()
     fmt = formats.get(country)
-    if fmt is None and country is not None and "-" in country:
+    if fmt is None and "-" in country:
         country, _ = country.split("-", 1)
         fmt = formats.get(country)
     if fmt is None:
         fmt = formats.get("default", None)
     if fmt is None:
         raise RuntimeError("Missing the default address model!")  # pragma: nocover
+    return fmt
+
 
+@cache
+def _get_formatter(country: Optional[str]) -> _Formatter:
+    formats = _load_formats()
+    fmt = _find_format(formats, country)
     # Some country configurations redirect to other countries but
     # change the country name in the process:
-    use_country = fmt.get("use_country")
-    if use_country is not None:
+    added: Dict[str, str] = {}
+    while fmt.get("use_country") is not None:
         for key, value in fmt.get("add_component", {}).items():
-            if key not in address:
-                address[key] = value
-        return _format(address, country=use_country)
+            added.setdefault(key, str(value).strip())
+        fmt = _find_format(formats, fmt["use_country"])
+    # An empty default still blocks later ones, but is never rendered.
+    defaults = {key: value for key, value in added.items() if len(value)}
+    template = fmt["address_template"]
+    return _Formatter(defaults, _compile(template), template)
 
+
+def _format(address: Dict[str, Optional[str]], country: Optional[str] = None) -> str:
+    formatter = _get_formatter(country)
     cleaned_address: Dict[str, str] = {}
     for part, pvalue in address.items():
         if pvalue is None:
@@ -57,10 +152,26 @@ def _format(address: Dict[str, Optional[str]], country: Optional[str] = None) ->
         pvalue = str(pvalue).strip()
         if len(pvalue):
             cleaned_address[part] = pvalue
+    for key, value in formatter.defaults.items():
+        if key not in address:
+            cleaned_address[key] = value
 
-    tpl_str = fmt.get("address_template")
-    tpl = _load_template(tpl_str)
-    return tpl.render(**cleaned_address)
+    if formatter.segments is None:
+        return _load_template(formatter.template).render(**cleaned_address)
+    parts: List[str] = []
+    for segment in formatter.segments:
+        if isinstance(segment, str):
+            parts.append(segment)
+        elif isinstance(segment, _Cond):
+            if all(n in cleaned_address for n in segment.names):
+                parts.append(segment.text)
+        else:
+            for name in segment:
+                found = cleaned_address.get(name)
+                if found is not None:
+                    parts.append(found)
+                    break
+    return "".join(parts)
 
 
 def format_address(
@@ -125,3 +236,29 @@ def format_address_line(
     """
     line = ", ".join(_format(address, country=country).split("\n"))
     return clean_address(line)
+
+
+def format_address_lines(
+    addresses: Sequence[Dict[str, Optional[str]]],
+    countries: Optional[Sequence[Optional[str]]] = None,
+) -> List[str]:
+    """Format many addresses into single-line strings, as
+    :func:`format_address_line` would.
+
+    Args:
+        addresses: The address part dicts to be formatted.
+        countries: ISO codes for the country of each address, in the same
+            order. If omitted, every address uses the default format.
+
+    Returns:
+        One formatted line per address, in order.
+    """
+    if countries is None:
+        countries = [None] * len(addresses)
+    if len(countries) != len(addresses):
+        msg = "Got %d countries for %d addresses" % (len(countries), len(addresses))
+        raise ValueError(msg)
+    return [
+        format_address_line(address, country=country)
+        for address, country in zip(addresses, countries)
+    ]
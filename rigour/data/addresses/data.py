@@ -1,290 +0,0 @@
-# This file is automatically generated, do not edit it.
-from typing import Dict, List
-
-FORMS: Dict[str, List[str]] = {
-    "apt": ["apartment", "apartamento", "appartement", "appartamento", "flat"],
-    "av": ["avenue", "ave", "avenida", "avinguda", "авеню"],
-    "rd": ["road"],
-    "no": [
-        "number",
-        "num",
-        "nr",
-        "nr",
-        "№",
-        "număr",
-        "nummer",
-        "numero",
-        "numéro",
-        "número",
-        "номер",
-    ],
-    "d": ["dom", "дом", "house", "hse"],
-    "condo": ["condominium", "condominio", "condomínio", "kondominium"],
-    "twr": ["tower", "towers", "toren", "torre", "torres", "torre"],
-    "c": ["calle"],
-    "bat": ["bâtiment"],
-    "rm": ["room", "Komnata", "kom", "кімната", "кімн"],
-    "bldg": [
-        "building",
-        "будинок",
-        "буд",
-        "зд",
-        "здание",
-        "строение",
-        "edificio",
-        "edifice",
-        "édifice",
-        "edificio",
-        "Gebäude",
-        "buildings",
-        "gebouw",
-    ],
-    "zone": ["zone", "sone", "zona", "zone", "zóna", "ζώνη", "зона"],
-    "kv": [
-        "area",
-        "район",
-        "neighborhood",
-        "nachbarschaft",
-        "neighbourhood",
-        "quartier",
-        "vecindario",
-        "райончик",
-        "district",
-        "bezirk",
-        "distrikt",
-        "barrio",
-        "quarter",
-        "quartier",
-        "quartiere",
-        "kvartal",
-        "квартал",
-        "kvartira",
-        "квартира",
-        "кв",
-    ],
-    "bch": ["beach", "пляж"],
-    "blk": ["block", "блок"],
-    "nat": ["national"],
-    "fed": ["federal"],
-    "alley": ["alley", "allée", "аллея", "проезд", "проїзд", "proezd"],
-    "int": ["international"],
-    "sec": ["section", "сектор"],
-    "wing": ["крыло"],
-    "blvd": ["boulevard", "bulevar", "бульвар"],
-    "st": [
-        "strasse",
-        "straße",
-        "strase",
-        "street",
-        "straat",
-        "strada",
-        "stradă",
-        "str",
-        "rue",
-        "стр",
-        "saint",
-    ],
-    "pr": ["pr-kt", "prospekt", "prospect", "просп", "проспект"],
-    "ul": ["ulitsa", "улица", "вул", "ул"],
-    "k": ["корпус", "korpus"],
-    "mk": ["mikrorayon", "микрорайон", "мкр"],
-    "dr": ["drive"],
-    "ln": ["lane", "laan", "переулок", "pereulok", "per", "пер"],
-    "pt": ["point"],
-    "ct": ["court"],
-    "cir": ["circle"],
-    "ter": ["terr", "terrace"],
-    "pky": ["parkway", "pkwy"],
-    "expy": ["expressway"],
-    "fwy": ["freeway"],
-    "tpke": ["turnpike"],
-    "vl": ["villa"],
-    "rte": ["route"],
-    "br": ["branch"],
-    "unt": ["unit"],
-    "loft": [
-        "attic",
-        "ática",
-        "ático",
-        "dachboden",
-        "grenier",
-        "studio",
-        "studios",
-        "penthouse",
-    ],
-    "pl": ["platz", "plaza", "place", "plot"],
-    "cty": ["county", "counties", "Okrug", "okr"],
-    "prov": ["province", "пров"],
-    "sq": ["square"],
-    "cnr": ["corner"],
-    "sub": ["subdivision"],
-    "brgh": ["borough"],
-    "ft": ["fort"],
-    "hts": ["hgts", "heights"],
-    "mt": ["mount", "montaña", "mountain", "montagna", "montagne", "montanha"],
-    "hl": ["hill", "hills", "heuvel", "heuvels", "hügel"],
-    "co": ["c o", "c/o", "care of", "℅"],
-    "pza": ["piazza"],
-    "ctr": ["center", "centre", "central"],
-    "pk": ["park", "parc", "parco", "parque"],
-    "gd": ["garden", "gardens"],
-    "rep": ["republic", "republik", "republique", "repubblica", "республіки"],
-    "est": ["estate", "estates"],
-    "stn": [
-        "stazione",
-        "station",
-        "gare",
-        "estación",
-        "bahnhof",
-        "hauptbahnhof",
-        "hbf",
-        "станция",
-        "станція",
-        "станц",
-        "станц.",
-        "вокзал",
-        "车站",
-    ],
-    "bnglw": [
-        "bungalow",
-        "bungalo",
-        "bangalô",
-        "bungaló",
-        "bungalas",
-        "bunglow",
-        "μπαγκάλοου",
-        "бунгало",
-        "बंगला",
-        "بُنْغَلُو",
-        "방갈로",
-        "バンガロー",
-        "平房",
-    ],
-    "ind": ["industrial"],
-    "cmrc": [
-        "commercial",
-        "коммерция",
-        "коммерческая",
-        "коммерческие",
-        "коммерческих",
-        "коммерческого",
-        "коммерческой",
-        "комерційний",
-    ],
-    "res": ["residential"],
-    "w": ["west", "westward"],
-    "e": ["east"],
-    "n": ["north"],
-    "s": ["south"],
-    "ne": ["northeast", "north east", "northeastern"],
-    "nw": ["northwest", "north west", "northwestern"],
-    "se": ["southeast", "south east", "southeastern"],
-    "sw": ["southwest", "south west", "southwestern"],
-    "ste": ["suite", "suit"],
-    "fl": [
-        "floor",
-        "flr",
-        "story",
-        "storey",
-        "level",
-        "lvl",
-        "andar",
-        "aukštas",
-        "étage",
-        "etazh",
-        "piso",
-        "verdieping",
-        "поверх",
-        "этаж",
-        "階",
-    ],
-    "street_level": [
-        "grnd",
-        "ground",
-        "ground floor",
-        "grnd floor",
-        "g floor",
-        "street level",
-        "begane grond",
-        "erdgeschoss",
-        "pianterreno",
-        "planta baja",
-        "rez-de-chaussée",
-        "rdc",
-        "Первый этаж",
-    ],
-    "basement": [
-        "basement",
-        "cellar",
-        "kelder",
-        "keller",
-        "seminterrato",
-        "sous-sol",
-        "souterrain",
-        "sótano",
-        "subsol",
-        "подвал",
-        "подвальное",
-    ],
-    "dept": ["department"],
-    "&": ["and", "or", "und", "et"],
-    "of": ["office", "oficina", "KOM./OFFICE", "ufficio", "офис", "ofis", "офіс"],
-    "b": ["bureau", "bureaux", "büro"],
-    "hq": [
-        "headquarters",
-        "head office",
-        "headquarter",
-        "главный офис",
-        "головний офіс",
-    ],
-    "kab": ["cabinet", "Kabinet"],
-    "pom": [
-        "pomeshch",
-        "pomeshchenie",
-        "pomeshtenie",
-        "pomeshcheniye",
-        "floor/pomeshch.",
-        "Помещ",
-        "Пом",
-    ],
-    "nab": [
-        "naberezhnaya",
-        "naberezhnye",
-        "nab.",
-        "набережная",
-        "набережн",
-        "embankment",
-        "embankments",
-    ],
-    "muni": ["municipal", "municipality", "munitsipal'nyi"],
-    "hwy": ["highway", "shosse", "шоссе", "шосе"],
-    "jct": ["junction", "jctn", "junctn"],
-    "pobox": [
-        "po box",
-        "p o box",
-        "p.o. box",
-        "p.o.box",
-        "post office box",
-        "post box",
-        "postbox",
-        "apartado postal",
-        "boîte postale",
-        "caixa postal",
-        "postbus",
-        "postfach",
-        "почтовый ящик",
-    ],
-    "zip": [
-        "zipcode",
-        "zip code",
-        "postal code",
-        "postcode",
-        "plz",
-        "postleitzahl",
-        "post code",
-    ],
-    "lit": ["letter", "liter", "litera", "літер", "лит", "литера", "літера", "литер"],
-    "rn": ["region", "регіон", "обл", "область", "oblast"],
-    "ir": ["irn"],
-    "ae": ["uae"],
-}
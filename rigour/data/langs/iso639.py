@@ -1,16921 +0,0 @@
-# This file is automatically generated, do not edit it.
-from typing import Dict, Set
-
-ISO3_ALL: Set[str] = set(
-    [
-        "aaa",
-        "aab",
-        "aac",
-        "aad",
-        "aae",
-        "aaf",
-        "aag",
-        "aah",
-        "aai",
-        "aak",
-        "aal",
-        "aan",
-        "aao",
-        "aap",
-        "aaq",
-        "aar",
-        "aas",
-        "aat",
-        "aau",
-        "aaw",
-        "aax",
-        "aaz",
-        "aba",
-        "abb",
-        "abc",
-        "abd",
-        "abe",
-        "abf",
-        "abg",
-        "abh",
-        "abi",
-        "abj",
-        "abk",
-        "abl",
-        "abm",
-        "abn",
-        "abo",
-        "abp",
-        "abq",
-        "abr",
-        "abs",
-        "abt",
-        "abu",
-        "abv",
-        "abw",
-        "abx",
-        "aby",
-        "abz",
-        "aca",
-        "acb",
-        "acd",
-        "ace",
-        "acf",
-        "ach",
-        "aci",
-        "ack",
-        "acl",
-        "acm",
-        "acn",
-        "acp",
-        "acq",
-        "acr",
-        "acs",
-        "act",
-        "acu",
-        "acv",
-        "acw",
-        "acx",
-        "acy",
-        "acz",
-        "ada",
-        "adb",
-        "add",
-        "ade",
-        "adf",
-        "adg",
-        "adh",
-        "adi",
-        "adj",
-        "adl",
-        "adn",
-        "ado",
-        "adq",
-        "adr",
-        "ads",
-        "adt",
-        "adu",
-        "adw",
-        "adx",
-        "ady",
-        "adz",
-        "aea",
-        "aeb",
-        "aec",
-        "aed",
-        "aee",
-        "aek",
-        "ael",
-        "aem",
-        "aen",
-        "aeq",
-        "aer",
-        "aes",
-        "aeu",
-        "aew",
-        "aey",
-        "aez",
-        "afb",
-        "afd",
-        "afe",
-        "afg",
-        "afh",
-        "afi",
-        "afk",
-        "afn",
-        "afo",
-        "afp",
-        "afr",
-        "afs",
-        "aft",
-        "afu",
-        "afz",
-        "aga",
-        "agb",
-        "agc",
-        "agd",
-        "age",
-        "agf",
-        "agg",
-        "agh",
-        "agi",
-        "agj",
-        "agk",
-        "agl",
-        "agm",
-        "agn",
-        "ago",
-        "agq",
-        "agr",
-        "ags",
-        "agt",
-        "agu",
-        "agv",
-        "agw",
-        "agx",
-        "agy",
-        "agz",
-        "aha",
-        "ahb",
-        "ahg",
-        "ahh",
-        "ahi",
-        "ahk",
-        "ahl",
-        "ahm",
-        "ahn",
-        "aho",
-        "ahp",
-        "ahr",
-        "ahs",
-        "aht",
-        "aia",
-        "aib",
-        "aic",
-        "aid",
-        "aie",
-        "aif",
-        "aig",
-        "aih",
-        "aii",
-        "aij",
-        "aik",
-        "ail",
-        "aim",
-        "ain",
-        "aio",
-        "aip",
-        "aiq",
-        "air",
-        "ait",
-        "aiw",
-        "aix",
-        "aiy",
-        "aja",
-        "ajg",
-        "aji",
-        "ajn",
-        "ajp",
-        "ajt",
-        "aju",
-        "ajw",
-        "ajz",
-        "aka",
-        "akb",
-        "akc",
-        "akd",
-        "ake",
-        "akf",
-        "akg",
-        "akh",
-        "aki",
-        "akj",
-        "akk",
-        "akl",
-        "akm",
-        "ako",
-        "akp",
-        "akq",
-        "akr",
-        "aks",
-        "akt",
-        "aku",
-        "akv",
-        "akw",
-        "akx",
-        "aky",
-        "akz",
-        "ala",
-        "alc",
-        "ald",
-        "ale",
-        "alf",
-        "alh",
-        "ali",
-        "alj",
-        "alk",
-        "all",
-        "alm",
-        "aln",
-        "alo",
-        "alp",
-        "alq",
-        "alr",
-        "als",
-        "alt",
-        "alu",
-        "alw",
-        "alx",
-        "aly",
-        "alz",
-        "ama",
-        "amb",
-        "amc",
-        "ame",
-        "amf",
-        "amg",
-        "amh",
-        "ami",
-        "amj",
-        "amk",
-        "aml",
-        "amm",
-        "amn",
-        "amo",
-        "amp",
-        "amq",
-        "amr",
-        "ams",
-        "amt",
-        "amu",
-        "amv",
-        "amw",
-        "amx",
-        "amy",
-        "amz",
-        "ana",
-        "anb",
-        "anc",
-        "and",
-        "ane",
-        "anf",
-        "ang",
-        "anh",
-        "ani",
-        "anj",
-        "ank",
-        "anl",
-        "anm",
-        "ann",
-        "ano",
-        "anp",
-        "anq",
-        "anr",
-        "ans",
-        "ant",
-        "anu",
-        "anv",
-        "anw",
-        "anx",
-        "any",
-        "anz",
-        "aoa",
-        "aob",
-        "aoc",
-        "aod",
-        "aoe",
-        "aof",
-        "aog",
-        "aoi",
-        "aoj",
-        "aok",
-        "aol",
-        "aom",
-        "aon",
-        "aor",
-        "aos",
-        "aot",
-        "aou",
-        "aox",
-        "aoz",
-        "apb",
-        "apc",
-        "apd",
-        "ape",
-        "apf",
-        "apg",
-        "aph",
-        "api",
-        "apj",
-        "apk",
-        "apl",
-        "apm",
-        "apn",
-        "apo",
-        "app",
-        "apq",
-        "apr",
-        "aps",
-        "apt",
-        "apu",
-        "apv",
-        "apw",
-        "apx",
-        "apy",
-        "apz",
-        "aqc",
-        "aqd",
-        "aqg",
-        "aqk",
-        "aqm",
-        "aqn",
-        "aqp",
-        "aqr",
-        "aqt",
-        "aqz",
-        "ara",
-        "arb",
-        "arc",
-        "ard",
-        "are",
-        "arg",
-        "arh",
-        "ari",
-        "arj",
-        "ark",
-        "arl",
-        "arn",
-        "aro",
-        "arp",
-        "arq",
-        "arr",
-        "ars",
-        "aru",
-        "arv",
-        "arw",
-        "arx",
-        "ary",
-        "arz",
-        "asa",
-        "asb",
-        "asc",
-        "ase",
-        "asf",
-        "asg",
-        "ash",
-        "asi",
-        "asj",
-        "ask",
-        "asl",
-        "asm",
-        "asn",
-        "aso",
-        "asp",
-        "asq",
-        "asr",
-        "ass",
-        "ast",
-        "asu",
-        "asv",
-        "asw",
-        "asx",
-        "asy",
-        "asz",
-        "ata",
-        "atb",
-        "atc",
-        "atd",
-        "ate",
-        "atg",
-        "ati",
-        "atj",
-        "atk",
-        "atl",
-        "atm",
-        "atn",
-        "ato",
-        "atp",
-        "atq",
-        "atr",
-        "ats",
-        "att",
-        "atu",
-        "atv",
-        "atw",
-        "atx",
-        "aty",
-        "atz",
-        "aua",
-        "aub",
-        "auc",
-        "aud",
-        "aug",
-        "auh",
-        "aui",
-        "auj",
-        "auk",
-        "aul",
-        "aum",
-        "aun",
-        "auo",
-        "aup",
-        "auq",
-        "aur",
-        "aut",
-        "auu",
-        "auw",
-        "aux",
-        "auy",
-        "auz",
-        "ava",
-        "avb",
-        "avd",
-        "ave",
-        "avi",
-        "avk",
-        "avl",
-        "avm",
-        "avn",
-        "avo",
-        "avs",
-        "avt",
-        "avu",
-        "avv",
-        "awa",
-        "awb",
-        "awc",
-        "awe",
-        "awg",
-        "awh",
-        "awi",
-        "awk",
-        "awm",
-        "awn",
-        "awo",
-        "awr",
-        "aws",
-        "awt",
-        "awu",
-        "awv",
-        "aww",
-        "awx",
-        "awy",
-        "axb",
-        "axe",
-        "axg",
-        "axk",
-        "axl",
-        "axm",
-        "axx",
-        "aya",
-        "ayb",
-        "ayc",
-        "ayd",
-        "aye",
-        "ayg",
-        "ayh",
-        "ayi",
-        "ayk",
-        "ayl",
-        "aym",
-        "ayn",
-        "ayo",
-        "ayp",
-        "ayq",
-        "ayr",
-        "ays",
-        "ayt",
-        "ayu",
-        "ayz",
-        "aza",
-        "azb",
-        "azd",
-        "aze",
-        "azg",
-        "azj",
-        "azm",
-        "azn",
-        "azo",
-        "azt",
-        "azz",
-        "baa",
-        "bab",
-        "bac",
-        "bae",
-        "baf",
-        "bag",
-        "bah",
-        "baj",
-        "bak",
-        "bal",
-        "bam",
-        "ban",
-        "bao",
-        "bap",
-        "bar",
-        "bas",
-        "bau",
-        "bav",
-        "baw",
-        "bax",
-        "bay",
-        "bba",
-        "bbb",
-        "bbc",
-        "bbd",
-        "bbe",
-        "bbf",
-        "bbg",
-        "bbh",
-        "bbi",
-        "bbj",
-        "bbk",
-        "bbl",
-        "bbm",
-        "bbn",
-        "bbo",
-        "bbp",
-        "bbq",
-        "bbr",
-        "bbs",
-        "bbt",
-        "bbu",
-        "bbv",
-        "bbw",
-        "bbx",
-        "bby",
-        "bca",
-        "bcb",
-        "bcc",
-        "bcd",
-        "bce",
-        "bcf",
-        "bcg",
-        "bch",
-        "bci",
-        "bcj",
-        "bck",
-        "bcl",
-        "bcm",
-        "bcn",
-        "bco",
-        "bcp",
-        "bcq",
-        "bcr",
-        "bcs",
-        "bct",
-        "bcu",
-        "bcv",
-        "bcw",
-        "bcy",
-        "bcz",
-        "bda",
-        "bdb",
-        "bdc",
-        "bdd",
-        "bde",
-        "bdf",
-        "bdg",
-        "bdh",
-        "bdi",
-        "bdj",
-        "bdk",
-        "bdl",
-        "bdm",
-        "bdn",
-        "bdo",
-        "bdp",
-        "bdq",
-        "bdr",
-        "bds",
-        "bdt",
-        "bdu",
-        "bdv",
-        "bdw",
-        "bdx",
-        "bdy",
-        "bdz",
-        "bea",
-        "beb",
-        "bec",
-        "bed",
-        "bee",
-        "bef",
-        "beg",
-        "beh",
-        "bei",
-        "bej",
-        "bek",
-        "bel",
-        "bem",
-        "ben",
-        "beo",
-        "bep",
-        "beq",
-        "bes",
-        "bet",
-        "beu",
-        "bev",
-        "bew",
-        "bex",
-        "bey",
-        "bez",
-        "bfa",
-        "bfb",
-        "bfc",
-        "bfd",
-        "bfe",
-        "bff",
-        "bfg",
-        "bfh",
-        "bfi",
-        "bfj",
-        "bfk",
-        "bfl",
-        "bfm",
-        "bfn",
-        "bfo",
-        "bfp",
-        "bfq",
-        "bfr",
-        "bfs",
-        "bft",
-        "bfu",
-        "bfw",
-        "bfx",
-        "bfy",
-        "bfz",
-        "bga",
-        "bgb",
-        "bgc",
-        "bgd",
-        "bge",
-        "bgf",
-        "bgg",
-        "bgi",
-        "bgj",
-        "bgk",
-        "bgl",
-        "bgn",
-        "bgo",
-        "bgp",
-        "bgq",
-        "bgr",
-        "bgs",
-        "bgt",
-        "bgu",
-        "bgv",
-        "bgw",
-        "bgx",
-        "bgy",
-        "bgz",
-        "bha",
-        "bhb",
-        "bhc",
-        "bhd",
-        "bhe",
-        "bhf",
-        "bhg",
-        "bhh",
-        "bhi",
-        "bhj",
-        "bhl",
-        "bhm",
-        "bhn",
-        "bho",
-        "bhp",
-        "bhq",
-        "bhr",
-        "bhs",
-        "bht",
-        "bhu",
-        "bhv",
-        "bhw",
-        "bhx",
-        "bhy",
-        "bhz",
-        "bia",
-        "bib",
-        "bid",
-        "bie",
-        "bif",
-        "big",
-        "bik",
-        "bil",
-        "bim",
-        "bin",
-        "bio",
-        "bip",
-        "biq",
-        "bir",
-        "bis",
-        "bit",
-        "biu",
-        "biv",
-        "biw",
-        "bix",
-        "biy",
-        "biz",
-        "bja",
-        "bjb",
-        "bjc",
-        "bje",
-        "bjf",
-        "bjg",
-        "bjh",
-        "bji",
-        "bjj",
-        "bjk",
-        "bjl",
-        "bjm",
-        "bjn",
-        "bjo",
-        "bjp",
-        "bjr",
-        "bjs",
-        "bjt",
-        "bju",
-        "bjv",
-        "bjw",
-        "bjx",
-        "bjy",
-        "bjz",
-        "bka",
-        "bkc",
-        "bkd",
-        "bkf",
-        "bkg",
-        "bkh",
-        "bki",
-        "bkj",
-        "bkk",
-        "bkl",
-        "bkm",
-        "bkn",
-        "bko",
-        "bkp",
-        "bkq",
-        "bkr",
-        "bks",
-        "bkt",
-        "bku",
-        "bkv",
-        "bkw",
-        "bkx",
-        "bky",
-        "bkz",
-        "bla",
-        "blb",
-        "blc",
-        "bld",
-        "ble",
-        "blf",
-        "blh",
-        "bli",
-        "blj",
-        "blk",
-        "bll",
-        "blm",
-        "bln",
-        "blo",
-        "blp",
-        "blq",
-        "blr",
-        "bls",
-        "blt",
-        "blv",
-        "blw",
-        "blx",
-        "bly",
-        "blz",
-        "bma",
-        "bmb",
-        "bmc",
-        "bmd",
-        "bme",
-        "bmf",
-        "bmg",
-        "bmh",
-        "bmi",
-        "bmj",
-        "bmk",
-        "bml",
-        "bmm",
-        "bmn",
-        "bmo",
-        "bmp",
-        "bmq",
-        "bmr",
-        "bms",
-        "bmt",
-        "bmu",
-        "bmv",
-        "bmw",
-        "bmx",
-        "bmz",
-        "bna",
-        "bnb",
-        "bnc",
-        "bnd",
-        "bne",
-        "bnf",
-        "bng",
-        "bni",
-        "bnj",
-        "bnk",
-        "bnl",
-        "bnm",
-        "bnn",
-        "bno",
-        "bnp",
-        "bnq",
-        "bnr",
-        "bns",
-        "bnu",
-        "bnv",
-        "bnw",
-        "bnx",
-        "bny",
-        "bnz",
-        "boa",
-        "bob",
-        "bod",
-        "boe",
-        "bof",
-        "bog",
-        "boh",
-        "boi",
-        "boj",
-        "bok",
-        "bol",
-        "bom",
-        "bon",
-        "boo",
-        "bop",
-        "boq",
-        "bor",
-        "bos",
-        "bot",
-        "bou",
-        "bov",
-        "bow",
-        "box",
-        "boy",
-        "boz",
-        "bpa",
-        "bpd",
-        "bpe",
-        "bpg",
-        "bph",
-        "bpi",
-        "bpj",
-        "bpk",
-        "bpl",
-        "bpm",
-        "bpn",
-        "bpo",
-        "bpp",
-        "bpq",
-        "bpr",
-        "bps",
-        "bpt",
-        "bpu",
-        "bpv",
-        "bpw",
-        "bpx",
-        "bpy",
-        "bpz",
-        "bqa",
-        "bqb",
-        "bqc",
-        "bqd",
-        "bqf",
-        "bqg",
-        "bqh",
-        "bqi",
-        "bqj",
-        "bqk",
-        "bql",
-        "bqm",
-        "bqn",
-        "bqo",
-        "bqp",
-        "bqq",
-        "bqr",
-        "bqs",
-        "bqt",
-        "bqu",
-        "bqv",
-        "bqw",
-        "bqx",
-        "bqy",
-        "bqz",
-        "bra",
-        "brb",
-        "brc",
-        "brd",
-        "bre",
-        "brf",
-        "brg",
-        "brh",
-        "bri",
-        "brj",
-        "brk",
-        "brl",
-        "brm",
-        "brn",
-        "bro",
-        "brp",
-        "brq",
-        "brr",
-        "brs",
-        "brt",
-        "bru",
-        "brv",
-        "brw",
-        "brx",
-        "bry",
-        "brz",
-        "bsa",
-        "bsb",
-        "bsc",
-        "bse",
-        "bsf",
-        "bsg",
-        "bsh",
-        "bsi",
-        "bsj",
-        "bsk",
-        "bsl",
-        "bsm",
-        "bsn",
-        "bso",
-        "bsp",
-        "bsq",
-        "bsr",
-        "bss",
-        "bst",
-        "bsu",
-        "bsv",
-        "bsw",
-        "bsx",
-        "bsy",
-        "bta",
-        "btc",
-        "btd",
-        "bte",
-        "btf",
-        "btg",
-        "bth",
-        "bti",
-        "btj",
-        "btm",
-        "btn",
-        "bto",
-        "btp",
-        "btq",
-        "btr",
-        "bts",
-        "btt",
-        "btu",
-        "btv",
-        "btw",
-        "btx",
-        "bty",
-        "btz",
-        "bua",
-        "bub",
-        "buc",
-        "bud",
-        "bue",
-        "buf",
-        "bug",
-        "buh",
-        "bui",
-        "buj",
-        "buk",
-        "bul",
-        "bum",
-        "bun",
-        "buo",
-        "bup",
-        "buq",
-        "bus",
-        "but",
-        "buu",
-        "buv",
-        "buw",
-        "bux",
-        "buy",
-        "buz",
-        "bva",
-        "bvb",
-        "bvc",
-        "bvd",
-        "bve",
-        "bvf",
-        "bvg",
-        "bvh",
-        "bvi",
-        "bvj",
-        "bvk",
-        "bvl",
-        "bvm",
-        "bvn",
-        "bvo",
-        "bvp",
-        "bvq",
-        "bvr",
-        "bvt",
-        "bvu",
-        "bvv",
-        "bvw",
-        "bvx",
-        "bvy",
-        "bvz",
-        "bwa",
-        "bwb",
-        "bwc",
-        "bwd",
-        "bwe",
-        "bwf",
-        "bwg",
-        "bwh",
-        "bwi",
-        "bwj",
-        "bwk",
-        "bwl",
-        "bwm",
-        "bwn",
-        "bwo",
-        "bwp",
-        "bwq",
-        "bwr",
-        "bws",
-        "bwt",
-        "bwu",
-        "bww",
-        "bwx",
-        "bwy",
-        "bwz",
-        "bxa",
-        "bxb",
-        "bxc",
-        "bxd",
-        "bxe",
-        "bxf",
-        "bxg",
-        "bxh",
-        "bxi",
-        "bxj",
-        "bxk",
-        "bxl",
-        "bxm",
-        "bxn",
-        "bxo",
-        "bxp",
-        "bxq",
-        "bxr",
-        "bxs",
-        "bxu",
-        "bxv",
-        "bxw",
-        "bxz",
-        "bya",
-        "byb",
-        "byc",
-        "byd",
-        "bye",
-        "byf",
-        "byg",
-        "byh",
-        "byi",
-        "byj",
-        "byk",
-        "byl",
-        "bym",
-        "byn",
-        "byo",
-        "byp",
-        "byq",
-        "byr",
-        "bys",
-        "byt",
-        "byv",
-        "byw",
-        "byx",
-        "byz",
-        "bza",
-        "bzb",
-        "bzc",
-        "bzd",
-        "bze",
-        "bzf",
-        "bzg",
-        "bzh",
-        "bzi",
-        "bzj",
-        "bzk",
-        "bzl",
-        "bzm",
-        "bzn",
-        "bzo",
-        "bzp",
-        "bzq",
-        "bzr",
-        "bzs",
-        "bzt",
-        "bzu",
-        "bzv",
-        "bzw",
-        "bzx",
-        "bzy",
-        "bzz",
-        "caa",
-        "cab",
-        "cac",
-        "cad",
-        "cae",
-        "caf",
-        "cag",
-        "cah",
-        "caj",
-        "cak",
-        "cal",
-        "cam",
-        "can",
-        "cao",
-        "cap",
-        "caq",
-        "car",
-        "cas",
-        "cat",
-        "cav",
-        "caw",
-        "cax",
-        "cay",
-        "caz",
-        "cbb",
-        "cbc",
-        "cbd",
-        "cbg",
-        "cbi",
-        "cbj",
-        "cbk",
-        "cbl",
-        "cbn",
-        "cbo",
-        "cbq",
-        "cbr",
-        "cbs",
-        "cbt",
-        "cbu",
-        "cbv",
-        "cbw",
-        "cby",
-        "ccc",
-        "ccd",
-        "cce",
-        "ccg",
-        "cch",
-        "ccj",
-        "ccl",
-        "ccm",
-        "cco",
-        "ccp",
-        "ccr",
-        "cda",
-        "cde",
-        "cdf",
-        "cdh",
-        "cdi",
-        "cdj",
-        "cdm",
-        "cdn",
-        "cdo",
-        "cdr",
-        "cds",
-        "cdy",
-        "cdz",
-        "cea",
-        "ceb",
-        "ceg",
-        "cek",
-        "cen",
-        "ces",
-        "cet",
-        "cey",
-        "cfa",
-        "cfd",
-        "cfg",
-        "cfm",
-        "cga",
-        "cgc",
-        "cgg",
-        "cgk",
-        "cha",
-        "chb",
-        "chc",
-        "chd",
-        "che",
-        "chf",
-        "chg",
-        "chh",
-        "chj",
-        "chk",
-        "chl",
-        "chm",
-        "chn",
-        "cho",
-        "chp",
-        "chq",
-        "chr",
-        "cht",
-        "chu",
-        "chv",
-        "chw",
-        "chx",
-        "chy",
-        "chz",
-        "cia",
-        "cib",
-        "cic",
-        "cid",
-        "cie",
-        "cih",
-        "cik",
-        "cim",
-        "cin",
-        "cip",
-        "cir",
-        "ciw",
-        "ciy",
-        "cja",
-        "cje",
-        "cjh",
-        "cji",
-        "cjk",
-        "cjm",
-        "cjn",
-        "cjo",
-        "cjp",
-        "cjs",
-        "cjv",
-        "cjy",
-        "ckb",
-        "ckh",
-        "ckl",
-        "ckm",
-        "ckn",
-        "cko",
-        "ckq",
-        "ckr",
-        "cks",
-        "ckt",
-        "cku",
-        "ckv",
-        "ckx",
-        "cky",
-        "ckz",
-        "cla",
-        "clc",
-        "cld",
-        "cle",
-        "clh",
-        "cli",
-        "clj",
-        "clk",
-        "cll",
-        "clm",
-        "clo",
-        "clt",
-        "clu",
-        "clw",
-        "cly",
-        "cma",
-        "cme",
-        "cmg",
-        "cmi",
-        "cml",
-        "cmm",
-        "cmn",
-        "cmo",
-        "cmr",
-        "cms",
-        "cmt",
-        "cna",
-        "cnb",
-        "cnc",
-        "cng",
-        "cnh",
-        "cni",
-        "cnk",
-        "cnl",
-        "cno",
-        "cnp",
-        "cnr",
-        "cns",
-        "cnt",
-        "cnu",
-        "cnw",
-        "cnx",
-        "coa",
-        "cob",
-        "coc",
-        "cod",
-        "coe",
-        "cof",
-        "cog",
-        "coh",
-        "coj",
-        "cok",
-        "col",
-        "com",
-        "con",
-        "coo",
-        "cop",
-        "coq",
-        "cor",
-        "cos",
-        "cot",
-        "cou",
-        "cov",
-        "cow",
-        "cox",
-        "coz",
-        "cpa",
-        "cpb",
-        "cpc",
-        "cpg",
-        "cpi",
-        "cpn",
-        "cpo",
-        "cps",
-        "cpu",
-        "cpx",
-        "cpy",
-        "cqd",
-        "cra",
-        "crb",
-        "crc",
-        "crd",
-        "cre",
-        "crf",
-        "crg",
-        "crh",
-        "cri",
-        "crj",
-        "crk",
-        "crl",
-        "crm",
-        "crn",
-        "cro",
-        "crq",
-        "crr",
-        "crs",
-        "crt",
-        "crv",
-        "crw",
-        "crx",
-        "cry",
-        "crz",
-        "csa",
-        "csb",
-        "csc",
-        "csd",
-        "cse",
-        "csf",
-        "csg",
-        "csh",
-        "csi",
-        "csj",
-        "csk",
-        "csl",
-        "csm",
-        "csn",
-        "cso",
-        "csp",
-        "csq",
-        "csr",
-        "css",
-        "cst",
-        "csv",
-        "csw",
-        "csx",
-        "csy",
-        "csz",
-        "cta",
-        "ctc",
-        "ctd",
-        "cte",
-        "ctg",
-        "cth",
-        "ctl",
-        "ctm",
-        "ctn",
-        "cto",
-        "ctp",
-        "cts",
-        "ctt",
-        "ctu",
-        "cty",
-        "ctz",
-        "cua",
-        "cub",
-        "cuc",
-        "cug",
-        "cuh",
-        "cui",
-        "cuj",
-        "cuk",
-        "cul",
-        "cuo",
-        "cup",
-        "cuq",
-        "cur",
-        "cut",
-        "cuu",
-        "cuv",
-        "cuw",
-        "cux",
-        "cuy",
-        "cvg",
-        "cvn",
-        "cwa",
-        "cwb",
-        "cwd",
-        "cwe",
-        "cwg",
-        "cwt",
-        "cya",
-        "cyb",
-        "cym",
-        "cyo",
-        "czh",
-        "czk",
-        "czn",
-        "czo",
-        "czt",
-        "daa",
-        "dac",
-        "dad",
-        "dae",
-        "dag",
-        "dah",
-        "dai",
-        "daj",
-        "dak",
-        "dal",
-        "dam",
-        "dan",
-        "dao",
-        "daq",
-        "dar",
-        "das",
-        "dau",
-        "dav",
-        "daw",
-        "dax",
-        "daz",
-        "dba",
-        "dbb",
-        "dbd",
-        "dbe",
-        "dbf",
-        "dbg",
-        "dbi",
-        "dbj",
-        "dbl",
-        "dbm",
-        "dbn",
-        "dbo",
-        "dbp",
-        "dbq",
-        "dbr",
-        "dbt",
-        "dbu",
-        "dbv",
-        "dbw",
-        "dby",
-        "dcc",
-        "dcr",
-        "dda",
-        "ddd",
-        "dde",
-        "ddg",
-        "ddi",
-        "ddj",
-        "ddn",
-        "ddo",
-        "ddr",
-        "dds",
-        "ddw",
-        "dec",
-        "ded",
-        "dee",
-        "def",
-        "deg",
-        "deh",
-        "dei",
-        "dek",
-        "del",
-        "dem",
-        "den",
-        "dep",
-        "deq",
-        "der",
-        "des",
-        "deu",
-        "dev",
-        "dez",
-        "dga",
-        "dgb",
-        "dgc",
-        "dgd",
-        "dge",
-        "dgg",
-        "dgh",
-        "dgi",
-        "dgk",
-        "dgl",
-        "dgn",
-        "dgo",
-        "dgr",
-        "dgs",
-        "dgt",
-        "dgw",
-        "dgx",
-        "dgz",
-        "dhd",
-        "dhg",
-        "dhi",
-        "dhl",
-        "dhm",
-        "dhn",
-        "dho",
-        "dhr",
-        "dhs",
-        "dhu",
-        "dhv",
-        "dhw",
-        "dhx",
-        "dia",
-        "dib",
-        "dic",
-        "did",
-        "dif",
-        "dig",
-        "dih",
-        "dii",
-        "dij",
-        "dik",
-        "dil",
-        "dim",
-        "din",
-        "dio",
-        "dip",
-        "diq",
-        "dir",
-        "dis",
-        "diu",
-        "div",
-        "diw",
-        "dix",
-        "diy",
-        "diz",
-        "dja",
-        "djb",
-        "djc",
-        "djd",
-        "dje",
-        "djf",
-        "dji",
-        "djj",
-        "djk",
-        "djm",
-        "djn",
-        "djo",
-        "djr",
-        "dju",
-        "djw",
-        "dka",
-        "dkg",
-        "dkk",
-        "dkr",
-        "dks",
-        "dkx",
-        "dlg",
-        "dlk",
-        "dlm",
-        "dln",
-        "dma",
-        "dmb",
-        "dmc",
-        "dmd",
-        "dme",
-        "dmf",
-        "dmg",
-        "dmk",
-        "dml",
-        "dmm",
-        "dmo",
-        "dmr",
-        "dms",
-        "dmu",
-        "dmv",
-        "dmw",
-        "dmx",
-        "dmy",
-        "dna",
-        "dnd",
-        "dne",
-        "dng",
-        "dni",
-        "dnj",
-        "dnk",
-        "dnn",
-        "dno",
-        "dnr",
-        "dnt",
-        "dnu",
-        "dnv",
-        "dnw",
-        "dny",
-        "doa",
-        "dob",
-        "doc",
-        "doe",
-        "dof",
-        "doh",
-        "doi",
-        "dok",
-        "dol",
-        "don",
-        "doo",
-        "dop",
-        "doq",
-        "dor",
-        "dos",
-        "dot",
-        "dov",
-        "dow",
-        "dox",
-        "doy",
-        "doz",
-        "dpp",
-        "drb",
-        "drc",
-        "drd",
-        "dre",
-        "drg",
-        "dri",
-        "drl",
-        "drn",
-        "dro",
-        "drq",
-        "drs",
-        "drt",
-        "dru",
-        "dry",
-        "dsb",
-        "dse",
-        "dsh",
-        "dsi",
-        "dsl",
-        "dsn",
-        "dso",
-        "dsq",
-        "dta",
-        "dtb",
-        "dtd",
-        "dth",
-        "dti",
-        "dtk",
-        "dtm",
-        "dtn",
-        "dto",
-        "dtp",
-        "dtr",
-        "dts",
-        "dtt",
-        "dtu",
-        "dty",
-        "dua",
-        "dub",
-        "duc",
-        "due",
-        "duf",
-        "dug",
-        "duh",
-        "dui",
-        "duk",
-        "dul",
-        "dum",
-        "dun",
-        "duo",
-        "dup",
-        "duq",
-        "dur",
-        "dus",
-        "duu",
-        "duv",
-        "duw",
-        "dux",
-        "duy",
-        "duz",
-        "dva",
-        "dwa",
-        "dwk",
-        "dwr",
-        "dws",
-        "dwu",
-        "dww",
-        "dwy",
-        "dwz",
-        "dya",
-        "dyb",
-        "dyd",
-        "dyg",
-        "dyi",
-        "dym",
-        "dyn",
-        "dyo",
-        "dyu",
-        "dyy",
-        "dza",
-        "dze",
-        "dzg",
-        "dzl",
-        "dzn",
-        "dzo",
-        "eaa",
-        "ebc",
-        "ebg",
-        "ebk",
-        "ebo",
-        "ebr",
-        "ebu",
-        "ecr",
-        "ecs",
-        "ecy",
-        "eee",
-        "efa",
-        "efe",
-        "efi",
-        "ega",
-        "egl",
-        "ego",
-        "egy",
-        "ehs",
-        "ehu",
-        "eip",
-        "eit",
-        "eiv",
-        "eja",
-        "eka",
-        "eke",
-        "ekg",
-        "eki",
-        "ekk",
-        "ekl",
-        "ekm",
-        "eko",
-        "ekp",
-        "ekr",
-        "eky",
-        "ele",
-        "elh",
-        "eli",
-        "elk",
-        "ell",
-        "elm",
-        "elo",
-        "elu",
-        "elx",
-        "ema",
-        "emb",
-        "eme",
-        "emg",
-        "emi",
-        "emk",
-        "emm",
-        "emn",
-        "emp",
-        "emq",
-        "ems",
-        "emu",
-        "emw",
-        "emx",
-        "emy",
-        "emz",
-        "ena",
-        "enb",
-        "enc",
-        "end",
-        "enf",
-        "eng",
-        "enh",
-        "enl",
-        "enm",
-        "enn",
-        "eno",
-        "enq",
-        "enr",
-        "enu",
-        "env",
-        "enw",
-        "enx",
-        "eot",
-        "epi",
-        "epo",
-        "era",
-        "erg",
-        "erh",
-        "eri",
-        "erk",
-        "ero",
-        "err",
-        "ers",
-        "ert",
-        "erw",
-        "ese",
-        "esg",
-        "esh",
-        "esi",
-        "esk",
-        "esl",
-        "esm",
-        "esn",
-        "eso",
-        "esq",
-        "ess",
-        "est",
-        "esu",
-        "esy",
-        "etb",
-        "etc",
-        "eth",
-        "etn",
-        "eto",
-        "etr",
-        "ets",
-        "ett",
-        "etu",
-        "etx",
-        "etz",
-        "eus",
-        "eve",
-        "evh",
-        "evn",
-        "ewe",
-        "ewo",
-        "ext",
-        "eya",
-        "eyo",
-        "eza",
-        "eze",
-        "faa",
-        "fab",
-        "fad",
-        "faf",
-        "fag",
-        "fah",
-        "fai",
-        "faj",
-        "fak",
-        "fal",
-        "fam",
-        "fan",
-        "fao",
-        "fap",
-        "far",
-        "fas",
-        "fat",
-        "fau",
-        "fax",
-        "fay",
-        "faz",
-        "fbl",
-        "fcs",
-        "fer",
-        "ffi",
-        "ffm",
-        "fgr",
-        "fia",
-        "fie",
-        "fif",
-        "fij",
-        "fil",
-        "fin",
-        "fip",
-        "fir",
-        "fit",
-        "fiw",
-        "fkk",
-        "fkv",
-        "fla",
-        "flh",
-        "fli",
-        "fll",
-        "fln",
-        "flr",
-        "fly",
-        "fmp",
-        "fmu",
-        "fnb",
-        "fng",
-        "fni",
-        "fod",
-        "foi",
-        "fom",
-        "fon",
-        "for",
-        "fos",
-        "fpe",
-        "fqs",
-        "fra",
-        "frc",
-        "frd",
-        "frk",
-        "frm",
-        "fro",
-        "frp",
-        "frq",
-        "frr",
-        "frs",
-        "frt",
-        "fry",
-        "fse",
-        "fsl",
-        "fss",
-        "fub",
-        "fuc",
-        "fud",
-        "fue",
-        "fuf",
-        "fuh",
-        "fui",
-        "fuj",
-        "ful",
-        "fum",
-        "fun",
-        "fuq",
-        "fur",
-        "fut",
-        "fuu",
-        "fuv",
-        "fuy",
-        "fvr",
-        "fwa",
-        "fwe",
-        "gaa",
-        "gab",
-        "gac",
-        "gad",
-        "gae",
-        "gaf",
-        "gag",
-        "gah",
-        "gai",
-        "gaj",
-        "gak",
-        "gal",
-        "gam",
-        "gan",
-        "gao",
-        "gap",
-        "gaq",
-        "gar",
-        "gas",
-        "gat",
-        "gau",
-        "gaw",
-        "gax",
-        "gay",
-        "gaz",
-        "gba",
-        "gbb",
-        "gbd",
-        "gbe",
-        "gbf",
-        "gbg",
-        "gbh",
-        "gbi",
-        "gbj",
-        "gbk",
-        "gbl",
-        "gbm",
-        "gbn",
-        "gbo",
-        "gbp",
-        "gbq",
-        "gbr",
-        "gbs",
-        "gbu",
-        "gbv",
-        "gbw",
-        "gbx",
-        "gby",
-        "gbz",
-        "gcc",
-        "gcd",
-        "gce",
-        "gcf",
-        "gcl",
-        "gcn",
-        "gcr",
-        "gct",
-        "gda",
-        "gdb",
-        "gdc",
-        "gdd",
-        "gde",
-        "gdf",
-        "gdg",
-        "gdh",
-        "gdi",
-        "gdj",
-        "gdk",
-        "gdl",
-        "gdm",
-        "gdn",
-        "gdo",
-        "gdq",
-        "gdr",
-        "gds",
-        "gdt",
-        "gdu",
-        "gdx",
-        "gea",
-        "geb",
-        "gec",
-        "ged",
-        "gef",
-        "geg",
-        "geh",
-        "gei",
-        "gej",
-        "gek",
-        "gel",
-        "geq",
-        "ges",
-        "gev",
-        "gew",
-        "gex",
-        "gey",
-        "gez",
-        "gfk",
-        "gft",
-        "gga",
-        "ggb",
-        "ggd",
-        "gge",
-        "ggg",
-        "ggk",
-        "ggl",
-        "ggt",
-        "ggu",
-        "ggw",
-        "gha",
-        "ghc",
-        "ghe",
-        "ghh",
-        "ghk",
-        "ghl",
-        "ghn",
-        "gho",
-        "ghr",
-        "ghs",
-        "ght",
-        "gia",
-        "gib",
-        "gic",
-        "gid",
-        "gie",
-        "gig",
-        "gih",
-        "gii",
-        "gil",
-        "gim",
-        "gin",
-        "gip",
-        "giq",
-        "gir",
-        "gis",
-        "git",
-        "giu",
-        "giw",
-        "gix",
-        "giy",
-        "giz",
-        "gjk",
-        "gjm",
-        "gjn",
-        "gjr",
-        "gju",
-        "gka",
-        "gkd",
-        "gke",
-        "gkn",
-        "gko",
-        "gkp",
-        "gku",
-        "gla",
-        "glb",
-        "glc",
-        "gld",
-        "gle",
-        "glg",
-        "glh",
-        "glj",
-        "glk",
-        "gll",
-        "glo",
-        "glr",
-        "glu",
-        "glv",
-        "glw",
-        "gly",
-        "gma",
-        "gmb",
-        "gmd",
-        "gmg",
-        "gmh",
-        "gml",
-        "gmm",
-        "gmn",
-        "gmr",
-        "gmu",
-        "gmv",
-        "gmx",
-        "gmy",
-        "gmz",
-        "gna",
-        "gnb",
-        "gnc",
-        "gnd",
-        "gne",
-        "gng",
-        "gnh",
-        "gni",
-        "gnj",
-        "gnk",
-        "gnl",
-        "gnm",
-        "gnn",
-        "gno",
-        "gnq",
-        "gnr",
-        "gnt",
-        "gnu",
-        "gnw",
-        "gnz",
-        "goa",
-        "gob",
-        "goc",
-        "god",
-        "goe",
-        "gof",
-        "gog",
-        "goh",
-        "goi",
-        "goj",
-        "gok",
-        "gol",
-        "gom",
-        "gon",
-        "goo",
-        "gop",
-        "goq",
-        "gor",
-        "gos",
-        "got",
-        "gou",
-        "gow",
-        "gox",
-        "goy",
-        "goz",
-        "gpa",
-        "gpe",
-        "gpn",
-        "gqa",
-        "gqi",
-        "gqn",
-        "gqr",
-        "gqu",
-        "gra",
-        "grb",
-        "grc",
-        "grd",
-        "grg",
-        "grh",
-        "gri",
-        "grj",
-        "grm",
-        "grn",
-        "gro",
-        "grq",
-        "grr",
-        "grs",
-        "grt",
-        "gru",
-        "grv",
-        "grw",
-        "grx",
-        "gry",
-        "grz",
-        "gse",
-        "gsg",
-        "gsl",
-        "gsm",
-        "gsn",
-        "gso",
-        "gsp",
-        "gss",
-        "gsw",
-        "gta",
-        "gtu",
-        "gua",
-        "gub",
-        "guc",
-        "gud",
-        "gue",
-        "guf",
-        "gug",
-        "guh",
-        "gui",
-        "guj",
-        "guk",
-        "gul",
-        "gum",
-        "gun",
-        "guo",
-        "gup",
-        "guq",
-        "gur",
-        "gus",
-        "gut",
-        "guu",
-        "guw",
-        "gux",
-        "guz",
-        "gva",
-        "gvc",
-        "gve",
-        "gvf",
-        "gvj",
-        "gvl",
-        "gvm",
-        "gvn",
-        "gvo",
-        "gvp",
-        "gvr",
-        "gvs",
-        "gvy",
-        "gwa",
-        "gwb",
-        "gwc",
-        "gwd",
-        "gwe",
-        "gwf",
-        "gwg",
-        "gwi",
-        "gwj",
-        "gwm",
-        "gwn",
-        "gwr",
-        "gwt",
-        "gwu",
-        "gww",
-        "gwx",
-        "gxx",
-        "gya",
-        "gyb",
-        "gyd",
-        "gye",
-        "gyf",
-        "gyg",
-        "gyi",
-        "gyl",
-        "gym",
-        "gyn",
-        "gyo",
-        "gyr",
-        "gyy",
-        "gyz",
-        "gza",
-        "gzi",
-        "gzn",
-        "haa",
-        "hab",
-        "hac",
-        "had",
-        "hae",
-        "haf",
-        "hag",
-        "hah",
-        "hai",
-        "haj",
-        "hak",
-        "hal",
-        "ham",
-        "han",
-        "hao",
-        "hap",
-        "haq",
-        "har",
-        "has",
-        "hat",
-        "hau",
-        "hav",
-        "haw",
-        "hax",
-        "hay",
-        "haz",
-        "hba",
-        "hbb",
-        "hbn",
-        "hbo",
-        "hbs",
-        "hbu",
-        "hca",
-        "hch",
-        "hdn",
-        "hds",
-        "hdy",
-        "hea",
-        "heb",
-        "hed",
-        "heg",
-        "heh",
-        "hei",
-        "hem",
-        "her",
-        "hgm",
-        "hgw",
-        "hhi",
-        "hhr",
-        "hhy",
-        "hia",
-        "hib",
-        "hid",
-        "hif",
-        "hig",
-        "hih",
-        "hii",
-        "hij",
-        "hik",
-        "hil",
-        "hin",
-        "hio",
-        "hir",
-        "hit",
-        "hiw",
-        "hix",
-        "hji",
-        "hka",
-        "hke",
-        "hkh",
-        "hkk",
-        "hkn",
-        "hks",
-        "hla",
-        "hlb",
-        "hld",
-        "hle",
-        "hlt",
-        "hlu",
-        "hma",
-        "hmb",
-        "hmc",
-        "hmd",
-        "hme",
-        "hmf",
-        "hmg",
-        "hmh",
-        "hmi",
-        "hmj",
-        "hmk",
-        "hml",
-        "hmm",
-        "hmn",
-        "hmo",
-        "hmp",
-        "hmq",
-        "hmr",
-        "hms",
-        "hmt",
-        "hmu",
-        "hmv",
-        "hmw",
-        "hmy",
-        "hmz",
-        "hna",
-        "hnd",
-        "hne",
-        "hng",
-        "hnh",
-        "hni",
-        "hnj",
-        "hnn",
-        "hno",
-        "hns",
-        "hnu",
-        "hoa",
-        "hob",
-        "hoc",
-        "hod",
-        "hoe",
-        "hoh",
-        "hoi",
-        "hoj",
-        "hol",
-        "hom",
-        "hoo",
-        "hop",
-        "hor",
-        "hos",
-        "hot",
-        "hov",
-        "how",
-        "hoy",
-        "hoz",
-        "hpo",
-        "hps",
-        "hra",
-        "hrc",
-        "hre",
-        "hrk",
-        "hrm",
-        "hro",
-        "hrp",
-        "hrt",
-        "hru",
-        "hrv",
-        "hrw",
-        "hrx",
-        "hrz",
-        "hsb",
-        "hsh",
-        "hsl",
-        "hsn",
-        "hss",
-        "hti",
-        "hto",
-        "hts",
-        "htu",
-        "htx",
-        "hub",
-        "huc",
-        "hud",
-        "hue",
-        "huf",
-        "hug",
-        "huh",
-        "hui",
-        "huj",
-        "huk",
-        "hul",
-        "hum",
-        "hun",
-        "huo",
-        "hup",
-        "huq",
-        "hur",
-        "hus",
-        "hut",
-        "huu",
-        "huv",
-        "huw",
-        "hux",
-        "huy",
-        "huz",
-        "hvc",
-        "hve",
-        "hvk",
-        "hvn",
-        "hvv",
-        "hwa",
-        "hwc",
-        "hwo",
-        "hya",
-        "hye",
-        "hyw",
-        "iai",
-        "ian",
-        "iar",
-        "iba",
-        "ibb",
-        "ibd",
-        "ibe",
-        "ibg",
-        "ibh",
-        "ibl",
-        "ibm",
-        "ibn",
-        "ibo",
-        "ibr",
-        "ibu",
-        "iby",
-        "ica",
-        "ich",
-        "icl",
-        "icr",
-        "ida",
-        "idb",
-        "idc",
-        "idd",
-        "ide",
-        "idi",
-        "ido",
-        "idr",
-        "ids",
-        "idt",
-        "idu",
-        "ifa",
-        "ifb",
-        "ife",
-        "iff",
-        "ifk",
-        "ifm",
-        "ifu",
-        "ify",
-        "igb",
-        "ige",
-        "igg",
-        "igl",
-        "igm",
-        "ign",
-        "igo",
-        "igs",
-        "igw",
-        "ihb",
-        "ihi",
-        "ihp",
-        "ihw",
-        "iii",
-        "iin",
-        "ijc",
-        "ije",
-        "ijj",
-        "ijn",
-        "ijs",
-        "ike",
-        "iki",
-        "ikk",
-        "ikl",
-        "iko",
-        "ikp",
-        "ikr",
-        "iks",
-        "ikt",
-        "iku",
-        "ikv",
-        "ikw",
-        "ikx",
-        "ikz",
-        "ila",
-        "ilb",
-        "ile",
-        "ilg",
-        "ili",
-        "ilk",
-        "ilm",
-        "ilo",
-        "ilp",
-        "ils",
-        "ilu",
-        "ilv",
-        "ima",
-        "imi",
-        "iml",
-        "imn",
-        "imo",
-        "imr",
-        "ims",
-        "imy",
-        "ina",
-        "inb",
-        "ind",
-        "ing",
-        "inh",
-        "inj",
-        "inl",
-        "inm",
-        "inn",
-        "ino",
-        "inp",
-        "ins",
-        "int",
-        "inz",
-        "ior",
-        "iou",
-        "iow",
-        "ipi",
-        "ipk",
-        "ipo",
-        "iqu",
-        "iqw",
-        "ire",
-        "irh",
-        "iri",
-        "irk",
-        "irn",
-        "irr",
-        "iru",
-        "irx",
-        "iry",
-        "isa",
-        "isc",
-        "isd",
-        "ise",
-        "isg",
-        "ish",
-        "isi",
-        "isk",
-        "isl",
-        "ism",
-        "isn",
-        "iso",
-        "isr",
-        "ist",
-        "isu",
-        "ita",
-        "itb",
-        "itd",
-        "ite",
-        "iti",
-        "itk",
-        "itl",
-        "itm",
-        "ito",
-        "itr",
-        "its",
-        "itt",
-        "itv",
-        "itw",
-        "itx",
-        "ity",
-        "itz",
-        "ium",
-        "ivb",
-        "ivv",
-        "iwk",
-        "iwm",
-        "iwo",
-        "iws",
-        "ixc",
-        "ixl",
-        "iya",
-        "iyo",
-        "iyx",
-        "izh",
-        "izr",
-        "izz",
-        "jaa",
-        "jab",
-        "jac",
-        "jad",
-        "jae",
-        "jaf",
-        "jah",
-        "jaj",
-        "jak",
-        "jal",
-        "jam",
-        "jan",
-        "jao",
-        "jaq",
-        "jas",
-        "jat",
-        "jau",
-        "jav",
-        "jax",
-        "jay",
-        "jaz",
-        "jbe",
-        "jbi",
-        "jbj",
-        "jbk",
-        "jbm",
-        "jbn",
-        "jbo",
-        "jbr",
-        "jbt",
-        "jbu",
-        "jbw",
-        "jcs",
-        "jct",
-        "jda",
-        "jdg",
-        "jdt",
-        "jeb",
-        "jee",
-        "jeh",
-        "jei",
-        "jek",
-        "jel",
-        "jen",
-        "jer",
-        "jet",
-        "jeu",
-        "jgb",
-        "jge",
-        "jgk",
-        "jgo",
-        "jhi",
-        "jhs",
-        "jia",
-        "jib",
-        "jic",
-        "jid",
-        "jie",
-        "jig",
-        "jih",
-        "jii",
-        "jil",
-        "jim",
-        "jio",
-        "jiq",
-        "jit",
-        "jiu",
-        "jiv",
-        "jiy",
-        "jje",
-        "jjr",
-        "jka",
-        "jkm",
-        "jko",
-        "jkp",
-        "jkr",
-        "jks",
-        "jku",
-        "jle",
-        "jls",
-        "jma",
-        "jmb",
-        "jmc",
-        "jmd",
-        "jmi",
-        "jml",
-        "jmn",
-        "jmr",
-        "jms",
-        "jmw",
-        "jmx",
-        "jna",
-        "jnd",
-        "jng",
-        "jni",
-        "jnj",
-        "jnl",
-        "jns",
-        "job",
-        "jod",
-        "jog",
-        "jor",
-        "jos",
-        "jow",
-        "jpa",
-        "jpn",
-        "jpr",
-        "jqr",
-        "jra",
-        "jrb",
-        "jrr",
-        "jrt",
-        "jru",
-        "jsl",
-        "jua",
-        "jub",
-        "juc",
-        "jud",
-        "juh",
-        "jui",
-        "juk",
-        "jul",
-        "jum",
-        "jun",
-        "juo",
-        "jup",
-        "jur",
-        "jus",
-        "jut",
-        "juu",
-        "juw",
-        "juy",
-        "jvd",
-        "jvn",
-        "jwi",
-        "jya",
-        "jye",
-        "jyy",
-        "kaa",
-        "kab",
-        "kac",
-        "kad",
-        "kae",
-        "kaf",
-        "kag",
-        "kah",
-        "kai",
-        "kaj",
-        "kak",
-        "kal",
-        "kam",
-        "kan",
-        "kao",
-        "kap",
-        "kaq",
-        "kas",
-        "kat",
-        "kau",
-        "kav",
-        "kaw",
-        "kax",
-        "kay",
-        "kaz",
-        "kba",
-        "kbb",
-        "kbc",
-        "kbd",
-        "kbe",
-        "kbg",
-        "kbh",
-        "kbi",
-        "kbj",
-        "kbk",
-        "kbl",
-        "kbm",
-        "kbn",
-        "kbo",
-        "kbp",
-        "kbq",
-        "kbr",
-        "kbs",
-        "kbt",
-        "kbu",
-        "kbv",
-        "kbw",
-        "kbx",
-        "kby",
-        "kbz",
-        "kca",
-        "kcb",
-        "kcc",
-        "kcd",
-        "kce",
-        "kcf",
-        "kcg",
-        "kch",
-        "kci",
-        "kcj",
-        "kck",
-        "kcl",
-        "kcm",
-        "kcn",
-        "kco",
-        "kcp",
-        "kcq",
-        "kcr",
-        "kcs",
-        "kct",
-        "kcu",
-        "kcv",
-        "kcw",
-        "kcx",
-        "kcy",
-        "kcz",
-        "kda",
-        "kdc",
-        "kdd",
-        "kde",
-        "kdf",
-        "kdg",
-        "kdh",
-        "kdi",
-        "kdj",
-        "kdk",
-        "kdl",
-        "kdm",
-        "kdn",
-        "kdp",
-        "kdq",
-        "kdr",
-        "kdt",
-        "kdu",
-        "kdw",
-        "kdx",
-        "kdy",
-        "kdz",
-        "kea",
-        "keb",
-        "kec",
-        "ked",
-        "kee",
-        "kef",
-        "keg",
-        "keh",
-        "kei",
-        "kej",
-        "kek",
-        "kel",
-        "kem",
-        "ken",
-        "keo",
-        "kep",
-        "keq",
-        "ker",
-        "kes",
-        "ket",
-        "keu",
-        "kev",
-        "kew",
-        "kex",
-        "key",
-        "kez",
-        "kfa",
-        "kfb",
-        "kfc",
-        "kfd",
-        "kfe",
-        "kff",
-        "kfg",
-        "kfh",
-        "kfi",
-        "kfj",
-        "kfk",
-        "kfl",
-        "kfm",
-        "kfn",
-        "kfo",
-        "kfp",
-        "kfq",
-        "kfr",
-        "kfs",
-        "kft",
-        "kfu",
-        "kfv",
-        "kfw",
-        "kfx",
-        "kfy",
-        "kfz",
-        "kga",
-        "kgb",
-        "kge",
-        "kgf",
-        "kgg",
-        "kgi",
-        "kgj",
-        "kgk",
-        "kgl",
-        "kgm",
-        "kgn",
-        "kgo",
-        "kgp",
-        "kgq",
-        "kgr",
-        "kgs",
-        "kgt",
-        "kgu",
-        "kgv",
-        "kgw",
-        "kgx",
-        "kgy",
-        "kha",
-        "khb",
-        "khc",
-        "khd",
-        "khe",
-        "khf",
-        "khg",
-        "khh",
-        "khj",
-        "khk",
-        "khl",
-        "khm",
-        "khn",
-        "kho",
-        "khp",
-        "khq",
-        "khr",
-        "khs",
-        "kht",
-        "khu",
-        "khv",
-        "khw",
-        "khx",
-        "khy",
-        "khz",
-        "kia",
-        "kib",
-        "kic",
-        "kid",
-        "kie",
-        "kif",
-        "kig",
-        "kih",
-        "kii",
-        "kij",
-        "kik",
-        "kil",
-        "kim",
-        "kin",
-        "kio",
-        "kip",
-        "kiq",
-        "kir",
-        "kis",
-        "kit",
-        "kiu",
-        "kiv",
-        "kiw",
-        "kix",
-        "kiy",
-        "kiz",
-        "kja",
-        "kjb",
-        "kjc",
-        "kjd",
-        "kje",
-        "kjg",
-        "kjh",
-        "kji",
-        "kjj",
-        "kjk",
-        "kjl",
-        "kjm",
-        "kjn",
-        "kjo",
-        "kjp",
-        "kjq",
-        "kjr",
-        "kjs",
-        "kjt",
-        "kju",
-        "kjv",
-        "kjx",
-        "kjy",
-        "kjz",
-        "kka",
-        "kkb",
-        "kkc",
-        "kkd",
-        "kke",
-        "kkf",
-        "kkg",
-        "kkh",
-        "kki",
-        "kkj",
-        "kkk",
-        "kkl",
-        "kkm",
-        "kkn",
-        "kko",
-        "kkp",
-        "kkq",
-        "kkr",
-        "kks",
-        "kkt",
-        "kku",
-        "kkv",
-        "kkw",
-        "kkx",
-        "kky",
-        "kkz",
-        "kla",
-        "klb",
-        "klc",
-        "kld",
-        "kle",
-        "klf",
-        "klg",
-        "klh",
-        "kli",
-        "klj",
-        "klk",
-        "kll",
-        "klm",
-        "kln",
-        "klo",
-        "klp",
-        "klq",
-        "klr",
-        "kls",
-        "klt",
-        "klu",
-        "klv",
-        "klw",
-        "klx",
-        "kly",
-        "klz",
-        "kma",
-        "kmb",
-        "kmc",
-        "kmd",
-        "kme",
-        "kmf",
-        "kmg",
-        "kmh",
-        "kmi",
-        "kmj",
-        "kmk",
-        "kml",
-        "kmm",
-        "kmn",
-        "kmo",
-        "kmp",
-        "kmq",
-        "kmr",
-        "kms",
-        "kmt",
-        "kmu",
-        "kmv",
-        "kmw",
-        "kmx",
-        "kmy",
-        "kmz",
-        "kna",
-        "knb",
-        "knc",
-        "knd",
-        "kne",
-        "knf",
-        "kng",
-        "kni",
-        "knj",
-        "knk",
-        "knl",
-        "knm",
-        "knn",
-        "kno",
-        "knp",
-        "knq",
-        "knr",
-        "kns",
-        "knt",
-        "knu",
-        "knv",
-        "knw",
-        "knx",
-        "kny",
-        "knz",
-        "koa",
-        "koc",
-        "kod",
-        "koe",
-        "kof",
-        "kog",
-        "koh",
-        "koi",
-        "kok",
-        "kol",
-        "kom",
-        "kon",
-        "koo",
-        "kop",
-        "koq",
-        "kor",
-        "kos",
-        "kot",
-        "kou",
-        "kov",
-        "kow",
-        "koy",
-        "koz",
-        "kpa",
-        "kpb",
-        "kpc",
-        "kpd",
-        "kpe",
-        "kpf",
-        "kpg",
-        "kph",
-        "kpi",
-        "kpj",
-        "kpk",
-        "kpl",
-        "kpm",
-        "kpn",
-        "kpo",
-        "kpq",
-        "kpr",
-        "kps",
-        "kpt",
-        "kpu",
-        "kpv",
-        "kpw",
-        "kpx",
-        "kpy",
-        "kpz",
-        "kqa",
-        "kqb",
-        "kqc",
-        "kqd",
-        "kqe",
-        "kqf",
-        "kqg",
-        "kqh",
-        "kqi",
-        "kqj",
-        "kqk",
-        "kql",
-        "kqm",
-        "kqn",
-        "kqo",
-        "kqp",
-        "kqq",
-        "kqr",
-        "kqs",
-        "kqt",
-        "kqu",
-        "kqv",
-        "kqw",
-        "kqx",
-        "kqy",
-        "kqz",
-        "kra",
-        "krb",
-        "krc",
-        "krd",
-        "kre",
-        "krf",
-        "krh",
-        "kri",
-        "krj",
-        "krk",
-        "krl",
-        "krn",
-        "krp",
-        "krr",
-        "krs",
-        "krt",
-        "kru",
-        "krv",
-        "krw",
-        "krx",
-        "kry",
-        "krz",
-        "ksa",
-        "ksb",
-        "ksc",
-        "ksd",
-        "kse",
-        "ksf",
-        "ksg",
-        "ksh",
-        "ksi",
-        "ksj",
-        "ksk",
-        "ksl",
-        "ksm",
-        "ksn",
-        "kso",
-        "ksp",
-        "ksq",
-        "ksr",
-        "kss",
-        "kst",
-        "ksu",
-        "ksv",
-        "ksw",
-        "ksx",
-        "ksy",
-        "ksz",
-        "kta",
-        "ktb",
-        "ktc",
-        "ktd",
-        "kte",
-        "ktf",
-        "ktg",
-        "kth",
-        "kti",
-        "ktj",
-        "ktk",
-        "ktl",
-        "ktm",
-        "ktn",
-        "kto",
-        "ktp",
-        "ktq",
-        "kts",
-        "ktt",
-        "ktu",
-        "ktv",
-        "ktw",
-        "ktx",
-        "kty",
-        "ktz",
-        "kua",
-        "kub",
-        "kuc",
-        "kud",
-        "kue",
-        "kuf",
-        "kug",
-        "kuh",
-        "kui",
-        "kuj",
-        "kuk",
-        "kul",
-        "kum",
-        "kun",
-        "kuo",
-        "kup",
-        "kuq",
-        "kur",
-        "kus",
-        "kut",
-        "kuu",
-        "kuv",
-        "kuw",
-        "kux",
-        "kuy",
-        "kuz",
-        "kva",
-        "kvb",
-        "kvc",
-        "kvd",
-        "kve",
-        "kvf",
-        "kvg",
-        "kvh",
-        "kvi",
-        "kvj",
-        "kvk",
-        "kvl",
-        "kvm",
-        "kvn",
-        "kvo",
-        "kvp",
-        "kvq",
-        "kvr",
-        "kvt",
-        "kvu",
-        "kvv",
-        "kvw",
-        "kvx",
-        "kvy",
-        "kvz",
-        "kwa",
-        "kwb",
-        "kwc",
-        "kwd",
-        "kwe",
-        "kwf",
-        "kwg",
-        "kwh",
-        "kwi",
-        "kwj",
-        "kwk",
-        "kwl",
-        "kwm",
-        "kwn",
-        "kwo",
-        "kwp",
-        "kwr",
-        "kws",
-        "kwt",
-        "kwu",
-        "kwv",
-        "kww",
-        "kwx",
-        "kwy",
-        "kwz",
-        "kxa",
-        "kxb",
-        "kxc",
-        "kxd",
-        "kxf",
-        "kxh",
-        "kxi",
-        "kxj",
-        "kxk",
-        "kxm",
-        "kxn",
-        "kxo",
-        "kxp",
-        "kxq",
-        "kxr",
-        "kxs",
-        "kxt",
-        "kxv",
-        "kxw",
-        "kxx",
-        "kxy",
-        "kxz",
-        "kya",
-        "kyb",
-        "kyc",
-        "kyd",
-        "kye",
-        "kyf",
-        "kyg",
-        "kyh",
-        "kyi",
-        "kyj",
-        "kyk",
-        "kyl",
-        "kym",
-        "kyn",
-        "kyo",
-        "kyp",
-        "kyq",
-        "kyr",
-        "kys",
-        "kyt",
-        "kyu",
-        "kyv",
-        "kyw",
-        "kyx",
-        "kyy",
-        "kyz",
-        "kza",
-        "kzb",
-        "kzc",
-        "kzd",
-        "kze",
-        "kzf",
-        "kzg",
-        "kzi",
-        "kzk",
-        "kzl",
-        "kzm",
-        "kzn",
-        "kzo",
-        "kzp",
-        "kzq",
-        "kzr",
-        "kzs",
-        "kzu",
-        "kzv",
-        "kzw",
-        "kzx",
-        "kzy",
-        "kzz",
-        "laa",
-        "lab",
-        "lac",
-        "lad",
-        "lae",
-        "laf",
-        "lag",
-        "lah",
-        "lai",
-        "laj",
-        "lak",
-        "lal",
-        "lam",
-        "lan",
-        "lao",
-        "lap",
-        "laq",
-        "lar",
-        "las",
-        "lat",
-        "lau",
-        "lav",
-        "law",
-        "lax",
-        "lay",
-        "laz",
-        "lbb",
-        "lbc",
-        "lbe",
-        "lbf",
-        "lbg",
-        "lbi",
-        "lbj",
-        "lbk",
-        "lbl",
-        "lbm",
-        "lbn",
-        "lbo",
-        "lbq",
-        "lbr",
-        "lbs",
-        "lbt",
-        "lbu",
-        "lbv",
-        "lbw",
-        "lbx",
-        "lby",
-        "lbz",
-        "lcc",
-        "lcd",
-        "lce",
-        "lcf",
-        "lch",
-        "lcl",
-        "lcm",
-        "lcp",
-        "lcq",
-        "lcs",
-        "lda",
-        "ldb",
-        "ldd",
-        "ldg",
-        "ldh",
-        "ldi",
-        "ldj",
-        "ldk",
-        "ldl",
-        "ldm",
-        "ldn",
-        "ldo",
-        "ldp",
-        "ldq",
-        "lea",
-        "leb",
-        "lec",
-        "led",
-        "lee",
-        "lef",
-        "leh",
-        "lei",
-        "lej",
-        "lek",
-        "lel",
-        "lem",
-        "len",
-        "leo",
-        "lep",
-        "leq",
-        "ler",
-        "les",
-        "let",
-        "leu",
-        "lev",
-        "lew",
-        "lex",
-        "ley",
-        "lez",
-        "lfa",
-        "lfn",
-        "lga",
-        "lgb",
-        "lgg",
-        "lgh",
-        "lgi",
-        "lgk",
-        "lgl",
-        "lgm",
-        "lgn",
-        "lgq",
-        "lgr",
-        "lgt",
-        "lgu",
-        "lgz",
-        "lha",
-        "lhh",
-        "lhi",
-        "lhl",
-        "lhm",
-        "lhn",
-        "lhp",
-        "lhs",
-        "lht",
-        "lhu",
-        "lia",
-        "lib",
-        "lic",
-        "lid",
-        "lie",
-        "lif",
-        "lig",
-        "lih",
-        "lij",
-        "lik",
-        "lil",
-        "lim",
-        "lin",
-        "lio",
-        "lip",
-        "liq",
-        "lir",
-        "lis",
-        "lit",
-        "liu",
-        "liv",
-        "liw",
-        "lix",
-        "liy",
-        "liz",
-        "lja",
-        "lje",
-        "lji",
-        "ljl",
-        "ljp",
-        "ljw",
-        "ljx",
-        "lka",
-        "lkb",
-        "lkc",
-        "lkd",
-        "lke",
-        "lkh",
-        "lki",
-        "lkj",
-        "lkl",
-        "lkm",
-        "lkn",
-        "lko",
-        "lkr",
-        "lks",
-        "lkt",
-        "lku",
-        "lky",
-        "lla",
-        "llb",
-        "llc",
-        "lld",
-        "lle",
-        "llf",
-        "llg",
-        "llh",
-        "lli",
-        "llj",
-        "llk",
-        "lll",
-        "llm",
-        "lln",
-        "llp",
-        "llq",
-        "lls",
-        "llu",
-        "llx",
-        "lma",
-        "lmb",
-        "lmc",
-        "lmd",
-        "lme",
-        "lmf",
-        "lmg",
-        "lmh",
-        "lmi",
-        "lmj",
-        "lmk",
-        "lml",
-        "lmn",
-        "lmo",
-        "lmp",
-        "lmq",
-        "lmr",
-        "lmu",
-        "lmv",
-        "lmw",
-        "lmx",
-        "lmy",
-        "lna",
-        "lnb",
-        "lnd",
-        "lng",
-        "lnh",
-        "lni",
-        "lnj",
-        "lnl",
-        "lnm",
-        "lnn",
-        "lno",
-        "lns",
-        "lnu",
-        "lnw",
-        "lnz",
-        "loa",
-        "lob",
-        "loc",
-        "loe",
-        "lof",
-        "log",
-        "loh",
-        "loi",
-        "loj",
-        "lok",
-        "lol",
-        "lom",
-        "lon",
-        "loo",
-        "lop",
-        "loq",
-        "lor",
-        "los",
-        "lot",
-        "lou",
-        "lov",
-        "low",
-        "lox",
-        "loy",
-        "loz",
-        "lpa",
-        "lpe",
-        "lpn",
-        "lpo",
-        "lpx",
-        "lra",
-        "lrc",
-        "lre",
-        "lrg",
-        "lri",
-        "lrk",
-        "lrl",
-        "lrm",
-        "lrn",
-        "lro",
-        "lrr",
-        "lrt",
-        "lrv",
-        "lrz",
-        "lsa",
-        "lsb",
-        "lsd",
-        "lse",
-        "lsh",
-        "lsi",
-        "lsl",
-        "lsm",
-        "lsn",
-        "lso",
-        "lsp",
-        "lsr",
-        "lss",
-        "lst",
-        "lsv",
-        "lsy",
-        "ltc",
-        "ltg",
-        "lth",
-        "lti",
-        "ltn",
-        "lto",
-        "lts",
-        "ltu",
-        "ltz",
-        "lua",
-        "lub",
-        "luc",
-        "lud",
-        "lue",
-        "luf",
-        "lug",
-        "lui",
-        "luj",
-        "luk",
-        "lul",
-        "lum",
-        "lun",
-        "luo",
-        "lup",
-        "luq",
-        "lur",
-        "lus",
-        "lut",
-        "luu",
-        "luv",
-        "luw",
-        "luy",
-        "luz",
-        "lva",
-        "lvi",
-        "lvk",
-        "lvs",
-        "lvu",
-        "lwa",
-        "lwe",
-        "lwg",
-        "lwh",
-        "lwl",
-        "lwm",
-        "lwo",
-        "lws",
-        "lwt",
-        "lwu",
-        "lww",
-        "lxm",
-        "lya",
-        "lyg",
-        "lyn",
-        "lzh",
-        "lzl",
-        "lzn",
-        "lzz",
-        "maa",
-        "mab",
-        "mad",
-        "mae",
-        "maf",
-        "mag",
-        "mah",
-        "mai",
-        "maj",
-        "mak",
-        "mal",
-        "mam",
-        "man",
-        "maq",
-        "mar",
-        "mas",
-        "mat",
-        "mau",
-        "mav",
-        "maw",
-        "max",
-        "maz",
-        "mba",
-        "mbb",
-        "mbc",
-        "mbd",
-        "mbe",
-        "mbf",
-        "mbh",
-        "mbi",
-        "mbj",
-        "mbk",
-        "mbl",
-        "mbm",
-        "mbn",
-        "mbo",
-        "mbp",
-        "mbq",
-        "mbr",
-        "mbs",
-        "mbt",
-        "mbu",
-        "mbv",
-        "mbw",
-        "mbx",
-        "mby",
-        "mbz",
-        "mca",
-        "mcb",
-        "mcc",
-        "mcd",
-        "mce",
-        "mcf",
-        "mcg",
-        "mch",
-        "mci",
-        "mcj",
-        "mck",
-        "mcl",
-        "mcm",
-        "mcn",
-        "mco",
-        "mcp",
-        "mcq",
-        "mcr",
-        "mcs",
-        "mct",
-        "mcu",
-        "mcv",
-        "mcw",
-        "mcx",
-        "mcy",
-        "mcz",
-        "mda",
-        "mdb",
-        "mdc",
-        "mdd",
-        "mde",
-        "mdf",
-        "mdg",
-        "mdh",
-        "mdi",
-        "mdj",
-        "mdk",
-        "mdl",
-        "mdm",
-        "mdn",
-        "mdp",
-        "mdq",
-        "mdr",
-        "mds",
-        "mdt",
-        "mdu",
-        "mdv",
-        "mdw",
-        "mdx",
-        "mdy",
-        "mdz",
-        "mea",
-        "meb",
-        "mec",
-        "med",
-        "mee",
-        "mef",
-        "meh",
-        "mei",
-        "mej",
-        "mek",
-        "mel",
-        "mem",
-        "men",
-        "meo",
-        "mep",
-        "meq",
-        "mer",
-        "mes",
-        "met",
-        "meu",
-        "mev",
-        "mew",
-        "mey",
-        "mez",
-        "mfa",
-        "mfb",
-        "mfc",
-        "mfd",
-        "mfe",
-        "mff",
-        "mfg",
-        "mfh",
-        "mfi",
-        "mfj",
-        "mfk",
-        "mfl",
-        "mfm",
-        "mfn",
-        "mfo",
-        "mfp",
-        "mfq",
-        "mfr",
-        "mfs",
-        "mft",
-        "mfu",
-        "mfv",
-        "mfw",
-        "mfx",
-        "mfy",
-        "mfz",
-        "mga",
-        "mgb",
-        "mgc",
-        "mgd",
-        "mge",
-        "mgf",
-        "mgg",
-        "mgh",
-        "mgi",
-        "mgj",
-        "mgk",
-        "mgl",
-        "mgm",
-        "mgn",
-        "mgo",
-        "mgp",
-        "mgq",
-        "mgr",
-        "mgs",
-        "mgt",
-        "mgu",
-        "mgv",
-        "mgw",
-        "mgy",
-        "mgz",
-        "mha",
-        "mhb",
-        "mhc",
-        "mhd",
-        "mhe",
-        "mhf",
-        "mhg",
-        "mhi",
-        "mhj",
-        "mhk",
-        "mhl",
-        "mhm",
-        "mhn",
-        "mho",
-        "mhp",
-        "mhq",
-        "mhr",
-        "mhs",
-        "mht",
-        "mhu",
-        "mhw",
-        "mhx",
-        "mhy",
-        "mhz",
-        "mia",
-        "mib",
-        "mic",
-        "mid",
-        "mie",
-        "mif",
-        "mig",
-        "mih",
-        "mii",
-        "mij",
-        "mik",
-        "mil",
-        "mim",
-        "min",
-        "mio",
-        "mip",
-        "miq",
-        "mir",
-        "mis",
-        "mit",
-        "miu",
-        "miw",
-        "mix",
-        "miy",
-        "miz",
-        "mjb",
-        "mjc",
-        "mjd",
-        "mje",
-        "mjg",
-        "mjh",
-        "mji",
-        "mjj",
-        "mjk",
-        "mjl",
-        "mjm",
-        "mjn",
-        "mjo",
-        "mjp",
-        "mjq",
-        "mjr",
-        "mjs",
-        "mjt",
-        "mju",
-        "mjv",
-        "mjw",
-        "mjx",
-        "mjy",
-        "mjz",
-        "mka",
-        "mkb",
-        "mkc",
-        "mkd",
-        "mke",
-        "mkf",
-        "mkg",
-        "mki",
-        "mkj",
-        "mkk",
-        "mkl",
-        "mkm",
-        "mkn",
-        "mko",
-        "mkp",
-        "mkq",
-        "mkr",
-        "mks",
-        "mkt",
-        "mku",
-        "mkv",
-        "mkw",
-        "mkx",
-        "mky",
-        "mkz",
-        "mla",
-        "mlb",
-        "mlc",
-        "mle",
-        "mlf",
-        "mlg",
-        "mlh",
-        "mli",
-        "mlj",
-        "mlk",
-        "mll",
-        "mlm",
-        "mln",
-        "mlo",
-        "mlp",
-        "mlq",
-        "mlr",
-        "mls",
-        "mlt",
-        "mlu",
-        "mlv",
-        "mlw",
-        "mlx",
-        "mlz",
-        "mma",
-        "mmb",
-        "mmc",
-        "mmd",
-        "mme",
-        "mmf",
-        "mmg",
-        "mmh",
-        "mmi",
-        "mmj",
-        "mmk",
-        "mml",
-        "mmm",
-        "mmn",
-        "mmo",
-        "mmp",
-        "mmq",
-        "mmr",
-        "mmt",
-        "mmu",
-        "mmv",
-        "mmw",
-        "mmx",
-        "mmy",
-        "mmz",
-        "mna",
-        "mnb",
-        "mnc",
-        "mnd",
-        "mne",
-        "mnf",
-        "mng",
-        "mnh",
-        "mni",
-        "mnj",
-        "mnk",
-        "mnl",
-        "mnm",
-        "mnn",
-        "mnp",
-        "mnq",
-        "mnr",
-        "mns",
-        "mnu",
-        "mnv",
-        "mnw",
-        "mnx",
-        "mny",
-        "mnz",
-        "moa",
-        "moc",
-        "mod",
-        "moe",
-        "mog",
-        "moh",
-        "moi",
-        "moj",
-        "mok",
-        "mom",
-        "mon",
-        "moo",
-        "mop",
-        "moq",
-        "mor",
-        "mos",
-        "mot",
-        "mou",
-        "mov",
-        "mow",
-        "mox",
-        "moy",
-        "moz",
-        "mpa",
-        "mpb",
-        "mpc",
-        "mpd",
-        "mpe",
-        "mpg",
-        "mph",
-        "mpi",
-        "mpj",
-        "mpk",
-        "mpl",
-        "mpm",
-        "mpn",
-        "mpo",
-        "mpp",
-        "mpq",
-        "mpr",
-        "mps",
-        "mpt",
-        "mpu",
-        "mpv",
-        "mpw",
-        "mpx",
-        "mpy",
-        "mpz",
-        "mqa",
-        "mqb",
-        "mqc",
-        "mqe",
-        "mqf",
-        "mqg",
-        "mqh",
-        "mqi",
-        "mqj",
-        "mqk",
-        "mql",
-        "mqm",
-        "mqn",
-        "mqo",
-        "mqp",
-        "mqq",
-        "mqr",
-        "mqs",
-        "mqt",
-        "mqu",
-        "mqv",
-        "mqw",
-        "mqx",
-        "mqy",
-        "mqz",
-        "mra",
-        "mrb",
-        "mrc",
-        "mrd",
-        "mre",
-        "mrf",
-        "mrg",
-        "mrh",
-        "mri",
-        "mrj",
-        "mrk",
-        "mrl",
-        "mrm",
-        "mrn",
-        "mro",
-        "mrp",
-        "mrq",
-        "mrr",
-        "mrs",
-        "mrt",
-        "mru",
-        "mrv",
-        "mrw",
-        "mrx",
-        "mry",
-        "mrz",
-        "msa",
-        "msb",
-        "msc",
-        "msd",
-        "mse",
-        "msf",
-        "msg",
-        "msh",
-        "msi",
-        "msj",
-        "msk",
-        "msl",
-        "msm",
-        "msn",
-        "mso",
-        "msp",
-        "msq",
-        "msr",
-        "mss",
-        "msu",
-        "msv",
-        "msw",
-        "msx",
-        "msy",
-        "msz",
-        "mta",
-        "mtb",
-        "mtc",
-        "mtd",
-        "mte",
-        "mtf",
-        "mtg",
-        "mth",
-        "mti",
-        "mtj",
-        "mtk",
-        "mtl",
-        "mtm",
-        "mtn",
-        "mto",
-        "mtp",
-        "mtq",
-        "mtr",
-        "mts",
-        "mtt",
-        "mtu",
-        "mtv",
-        "mtw",
-        "mtx",
-        "mty",
-        "mua",
-        "mub",
-        "muc",
-        "mud",
-        "mue",
-        "mug",
-        "muh",
-        "mui",
-        "muj",
-        "muk",
-        "mul",
-        "mum",
-        "muo",
-        "mup",
-        "muq",
-        "mur",
-        "mus",
-        "mut",
-        "muu",
-        "muv",
-        "mux",
-        "muy",
-        "muz",
-        "mva",
-        "mvb",
-        "mvd",
-        "mve",
-        "mvf",
-        "mvg",
-        "mvh",
-        "mvi",
-        "mvk",
-        "mvl",
-        "mvn",
-        "mvo",
-        "mvp",
-        "mvq",
-        "mvr",
-        "mvs",
-        "mvt",
-        "mvu",
-        "mvv",
-        "mvw",
-        "mvx",
-        "mvy",
-        "mvz",
-        "mwa",
-        "mwb",
-        "mwc",
-        "mwe",
-        "mwf",
-        "mwg",
-        "mwh",
-        "mwi",
-        "mwk",
-        "mwl",
-        "mwm",
-        "mwn",
-        "mwo",
-        "mwp",
-        "mwq",
-        "mwr",
-        "mws",
-        "mwt",
-        "mwu",
-        "mwv",
-        "mww",
-        "mwz",
-        "mxa",
-        "mxb",
-        "mxc",
-        "mxd",
-        "mxe",
-        "mxf",
-        "mxg",
-        "mxh",
-        "mxi",
-        "mxj",
-        "mxk",
-        "mxl",
-        "mxm",
-        "mxn",
-        "mxo",
-        "mxp",
-        "mxq",
-        "mxr",
-        "mxs",
-        "mxt",
-        "mxu",
-        "mxv",
-        "mxw",
-        "mxx",
-        "mxy",
-        "mxz",
-        "mya",
-        "myb",
-        "myc",
-        "mye",
-        "myf",
-        "myg",
-        "myh",
-        "myj",
-        "myk",
-        "myl",
-        "mym",
-        "myo",
-        "myp",
-        "myr",
-        "mys",
-        "myu",
-        "myv",
-        "myw",
-        "myx",
-        "myy",
-        "myz",
-        "mza",
-        "mzb",
-        "mzc",
-        "mzd",
-        "mze",
-        "mzg",
-        "mzh",
-        "mzi",
-        "mzj",
-        "mzk",
-        "mzl",
-        "mzm",
-        "mzn",
-        "mzo",
-        "mzp",
-        "mzq",
-        "mzr",
-        "mzs",
-        "mzt",
-        "mzu",
-        "mzv",
-        "mzw",
-        "mzx",
-        "mzy",
-        "mzz",
-        "naa",
-        "nab",
-        "nac",
-        "nae",
-        "naf",
-        "nag",
-        "naj",
-        "nak",
-        "nal",
-        "nam",
-        "nan",
-        "nao",
-        "nap",
-        "naq",
-        "nar",
-        "nas",
-        "nat",
-        "nau",
-        "nav",
-        "naw",
-        "nax",
-        "nay",
-        "naz",
-        "nba",
-        "nbb",
-        "nbc",
-        "nbd",
-        "nbe",
-        "nbg",
-        "nbh",
-        "nbi",
-        "nbj",
-        "nbk",
-        "nbl",
-        "nbm",
-        "nbn",
-        "nbo",
-        "nbp",
-        "nbq",
-        "nbr",
-        "nbs",
-        "nbt",
-        "nbu",
-        "nbv",
-        "nbw",
-        "nby",
-        "nca",
-        "ncb",
-        "ncc",
-        "ncd",
-        "nce",
-        "ncf",
-        "ncg",
-        "nch",
-        "nci",
-        "ncj",
-        "nck",
-        "ncl",
-        "ncm",
-        "ncn",
-        "nco",
-        "ncq",
-        "ncr",
-        "ncs",
-        "nct",
-        "ncu",
-        "ncx",
-        "ncz",
-        "nda",
-        "ndb",
-        "ndc",
-        "ndd",
-        "nde",
-        "ndf",
-        "ndg",
-        "ndh",
-        "ndi",
-        "ndj",
-        "ndk",
-        "ndl",
-        "ndm",
-        "ndn",
-        "ndo",
-        "ndp",
-        "ndq",
-        "ndr",
-        "nds",
-        "ndt",
-        "ndu",
-        "ndv",
-        "ndw",
-        "ndx",
-        "ndy",
-        "ndz",
-        "nea",
-        "neb",
-        "nec",
-        "ned",
-        "nee",
-        "nef",
-        "neg",
-        "neh",
-        "nei",
-        "nej",
-        "nek",
-        "nem",
-        "nen",
-        "neo",
-        "nep",
-        "neq",
-        "ner",
-        "nes",
-        "net",
-        "neu",
-        "nev",
-        "new",
-        "nex",
-        "ney",
-        "nez",
-        "nfa",
-        "nfd",
-        "nfl",
-        "nfr",
-        "nfu",
-        "nga",
-        "ngb",
-        "ngc",
-        "ngd",
-        "nge",
-        "ngg",
-        "ngh",
-        "ngi",
-        "ngj",
-        "ngk",
-        "ngl",
-        "ngm",
-        "ngn",
-        "ngo",
-        "ngp",
-        "ngq",
-        "ngr",
-        "ngs",
-        "ngt",
-        "ngu",
-        "ngv",
-        "ngw",
-        "ngx",
-        "ngy",
-        "ngz",
-        "nha",
-        "nhb",
-        "nhc",
-        "nhd",
-        "nhe",
-        "nhf",
-        "nhg",
-        "nhh",
-        "nhi",
-        "nhk",
-        "nhm",
-        "nhn",
-        "nho",
-        "nhp",
-        "nhq",
-        "nhr",
-        "nht",
-        "nhu",
-        "nhv",
-        "nhw",
-        "nhx",
-        "nhy",
-        "nhz",
-        "nia",
-        "nib",
-        "nid",
-        "nie",
-        "nif",
-        "nig",
-        "nih",
-        "nii",
-        "nij",
-        "nik",
-        "nil",
-        "nim",
-        "nin",
-        "nio",
-        "niq",
-        "nir",
-        "nis",
-        "nit",
-        "niu",
-        "niv",
-        "niw",
-        "nix",
-        "niy",
-        "niz",
-        "nja",
-        "njb",
-        "njd",
-        "njh",
-        "nji",
-        "njj",
-        "njl",
-        "njm",
-        "njn",
-        "njo",
-        "njr",
-        "njs",
-        "njt",
-        "nju",
-        "njx",
-        "njy",
-        "njz",
-        "nka",
-        "nkb",
-        "nkc",
-        "nkd",
-        "nke",
-        "nkf",
-        "nkg",
-        "nkh",
-        "nki",
-        "nkj",
-        "nkk",
-        "nkm",
-        "nkn",
-        "nko",
-        "nkp",
-        "nkq",
-        "nkr",
-        "nks",
-        "nkt",
-        "nku",
-        "nkv",
-        "nkw",
-        "nkx",
-        "nkz",
-        "nla",
-        "nlc",
-        "nld",
-        "nle",
-        "nlg",
-        "nli",
-        "nlj",
-        "nlk",
-        "nll",
-        "nlm",
-        "nlo",
-        "nlq",
-        "nlu",
-        "nlv",
-        "nlw",
-        "nlx",
-        "nly",
-        "nlz",
-        "nma",
-        "nmb",
-        "nmc",
-        "nmd",
-        "nme",
-        "nmf",
-        "nmg",
-        "nmh",
-        "nmi",
-        "nmj",
-        "nmk",
-        "nml",
-        "nmm",
-        "nmn",
-        "nmo",
-        "nmp",
-        "nmq",
-        "nmr",
-        "nms",
-        "nmt",
-        "nmu",
-        "nmv",
-        "nmw",
-        "nmx",
-        "nmy",
-        "nmz",
-        "nna",
-        "nnb",
-        "nnc",
-        "nnd",
-        "nne",
-        "nnf",
-        "nng",
-        "nnh",
-        "nni",
-        "nnj",
-        "nnk",
-        "nnl",
-        "nnm",
-        "nnn",
-        "nno",
-        "nnp",
-        "nnq",
-        "nnr",
-        "nnt",
-        "nnu",
-        "nnv",
-        "nnw",
-        "nny",
-        "nnz",
-        "noa",
-        "nob",
-        "noc",
-        "nod",
-        "noe",
-        "nof",
-        "nog",
-        "noh",
-        "noi",
-        "noj",
-        "nok",
-        "nol",
-        "nom",
-        "non",
-        "nop",
-        "noq",
-        "nor",
-        "nos",
-        "not",
-        "nou",
-        "nov",
-        "now",
-        "noy",
-        "noz",
-        "npa",
-        "npb",
-        "npg",
-        "nph",
-        "npi",
-        "npl",
-        "npn",
-        "npo",
-        "nps",
-        "npu",
-        "npx",
-        "npy",
-        "nqg",
-        "nqk",
-        "nql",
-        "nqm",
-        "nqn",
-        "nqo",
-        "nqq",
-        "nqt",
-        "nqy",
-        "nra",
-        "nrb",
-        "nrc",
-        "nre",
-        "nrf",
-        "nrg",
-        "nri",
-        "nrk",
-        "nrl",
-        "nrm",
-        "nrn",
-        "nrp",
-        "nrr",
-        "nrt",
-        "nru",
-        "nrx",
-        "nrz",
-        "nsa",
-        "nsb",
-        "nsc",
-        "nsd",
-        "nse",
-        "nsf",
-        "nsg",
-        "nsh",
-        "nsi",
-        "nsk",
-        "nsl",
-        "nsm",
-        "nsn",
-        "nso",
-        "nsp",
-        "nsq",
-        "nsr",
-        "nss",
-        "nst",
-        "nsu",
-        "nsv",
-        "nsw",
-        "nsx",
-        "nsy",
-        "nsz",
-        "ntd",
-        "nte",
-        "ntg",
-        "nti",
-        "ntj",
-        "ntk",
-        "ntm",
-        "nto",
-        "ntp",
-        "ntr",
-        "ntu",
-        "ntw",
-        "ntx",
-        "nty",
-        "ntz",
-        "nua",
-        "nuc",
-        "nud",
-        "nue",
-        "nuf",
-        "nug",
-        "nuh",
-        "nui",
-        "nuj",
-        "nuk",
-        "nul",
-        "num",
-        "nun",
-        "nuo",
-        "nup",
-        "nuq",
-        "nur",
-        "nus",
-        "nut",
-        "nuu",
-        "nuv",
-        "nuw",
-        "nux",
-        "nuy",
-        "nuz",
-        "nvh",
-        "nvm",
-        "nvo",
-        "nwa",
-        "nwb",
-        "nwc",
-        "nwe",
-        "nwg",
-        "nwi",
-        "nwm",
-        "nwo",
-        "nwr",
-        "nwx",
-        "nwy",
-        "nxa",
-        "nxd",
-        "nxe",
-        "nxg",
-        "nxi",
-        "nxk",
-        "nxl",
-        "nxm",
-        "nxn",
-        "nxo",
-        "nxq",
-        "nxr",
-        "nxx",
-        "nya",
-        "nyb",
-        "nyc",
-        "nyd",
-        "nye",
-        "nyf",
-        "nyg",
-        "nyh",
-        "nyi",
-        "nyj",
-        "nyk",
-        "nyl",
-        "nym",
-        "nyn",
-        "nyo",
-        "nyp",
-        "nyq",
-        "nyr",
-        "nys",
-        "nyt",
-        "nyu",
-        "nyv",
-        "nyw",
-        "nyx",
-        "nyy",
-        "nza",
-        "nzb",
-        "nzd",
-        "nzi",
-        "nzk",
-        "nzm",
-        "nzs",
-        "nzu",
-        "nzy",
-        "nzz",
-        "oaa",
-        "oac",
-        "oar",
-        "oav",
-        "obi",
-        "obk",
-        "obl",
-        "obm",
-        "obo",
-        "obr",
-        "obt",
-        "obu",
-        "oca",
-        "och",
-        "oci",
-        "ocm",
-        "oco",
-        "ocu",
-        "oda",
-        "odk",
-        "odt",
-        "odu",
-        "ofo",
-        "ofs",
-        "ofu",
-        "ogb",
-        "ogc",
-        "oge",
-        "ogg",
-        "ogo",
-        "ogu",
-        "oht",
-        "ohu",
-        "oia",
-        "oin",
-        "ojb",
-        "ojc",
-        "ojg",
-        "oji",
-        "ojp",
-        "ojs",
-        "ojv",
-        "ojw",
-        "oka",
-        "okb",
-        "okc",
-        "okd",
-        "oke",
-        "okg",
-        "okh",
-        "oki",
-        "okj",
-        "okk",
-        "okl",
-        "okm",
-        "okn",
-        "oko",
-        "okr",
-        "oks",
-        "oku",
-        "okv",
-        "okx",
-        "okz",
-        "ola",
-        "old",
-        "ole",
-        "olk",
-        "olm",
-        "olo",
-        "olr",
-        "olt",
-        "olu",
-        "oma",
-        "omb",
-        "omc",
-        "omg",
-        "omi",
-        "omk",
-        "oml",
-        "omn",
-        "omo",
-        "omp",
-        "omr",
-        "omt",
-        "omu",
-        "omw",
-        "omx",
-        "omy",
-        "ona",
-        "onb",
-        "one",
-        "ong",
-        "oni",
-        "onj",
-        "onk",
-        "onn",
-        "ono",
-        "onp",
-        "onr",
-        "ons",
-        "ont",
-        "onu",
-        "onw",
-        "onx",
-        "ood",
-        "oog",
-        "oon",
-        "oor",
-        "oos",
-        "opa",
-        "opk",
-        "opm",
-        "opo",
-        "opt",
-        "opy",
-        "ora",
-        "orc",
-        "ore",
-        "org",
-        "orh",
-        "ori",
-        "orm",
-        "orn",
-        "oro",
-        "orr",
-        "ors",
-        "ort",
-        "oru",
-        "orv",
-        "orw",
-        "orx",
-        "ory",
-        "orz",
-        "osa",
-        "osc",
-        "osi",
-        "osn",
-        "oso",
-        "osp",
-        "oss",
-        "ost",
-        "osu",
-        "osx",
-        "ota",
-        "otb",
-        "otd",
-        "ote",
-        "oti",
-        "otk",
-        "otl",
-        "otm",
-        "otn",
-        "otq",
-        "otr",
-        "ots",
-        "ott",
-        "otu",
-        "otw",
-        "otx",
-        "oty",
-        "otz",
-        "oua",
-        "oub",
-        "oue",
-        "oui",
-        "oum",
-        "ovd",
-        "owi",
-        "owl",
-        "oyb",
-        "oyd",
-        "oym",
-        "oyy",
-        "ozm",
-        "pab",
-        "pac",
-        "pad",
-        "pae",
-        "paf",
-        "pag",
-        "pah",
-        "pai",
-        "pak",
-        "pal",
-        "pam",
-        "pan",
-        "pao",
-        "pap",
-        "paq",
-        "par",
-        "pas",
-        "pau",
-        "pav",
-        "paw",
-        "pax",
-        "pay",
-        "paz",
-        "pbb",
-        "pbc",
-        "pbe",
-        "pbf",
-        "pbg",
-        "pbh",
-        "pbi",
-        "pbl",
-        "pbm",
-        "pbn",
-        "pbo",
-        "pbp",
-        "pbr",
-        "pbs",
-        "pbt",
-        "pbu",
-        "pbv",
-        "pby",
-        "pca",
-        "pcb",
-        "pcc",
-        "pcd",
-        "pce",
-        "pcf",
-        "pcg",
-        "pch",
-        "pci",
-        "pcj",
-        "pck",
-        "pcl",
-        "pcm",
-        "pcn",
-        "pcp",
-        "pcw",
-        "pda",
-        "pdc",
-        "pdi",
-        "pdn",
-        "pdo",
-        "pdt",
-        "pdu",
-        "pea",
-        "peb",
-        "ped",
-        "pee",
-        "pef",
-        "peg",
-        "peh",
-        "pei",
-        "pej",
-        "pek",
-        "pel",
-        "pem",
-        "peo",
-        "pep",
-        "peq",
-        "pes",
-        "pev",
-        "pex",
-        "pey",
-        "pez",
-        "pfa",
-        "pfe",
-        "pfl",
-        "pga",
-        "pgd",
-        "pgg",
-        "pgi",
-        "pgk",
-        "pgl",
-        "pgn",
-        "pgs",
-        "pgu",
-        "pgz",
-        "pha",
-        "phd",
-        "phg",
-        "phh",
-        "phk",
-        "phl",
-        "phm",
-        "phn",
-        "pho",
-        "phq",
-        "phr",
-        "pht",
-        "phu",
-        "phv",
-        "phw",
-        "pia",
-        "pib",
-        "pic",
-        "pid",
-        "pie",
-        "pif",
-        "pig",
-        "pih",
-        "pii",
-        "pij",
-        "pil",
-        "pim",
-        "pin",
-        "pio",
-        "pip",
-        "pir",
-        "pis",
-        "pit",
-        "piu",
-        "piv",
-        "piw",
-        "pix",
-        "piy",
-        "piz",
-        "pjt",
-        "pka",
-        "pkb",
-        "pkc",
-        "pkg",
-        "pkh",
-        "pkn",
-        "pko",
-        "pkp",
-        "pkr",
-        "pks",
-        "pkt",
-        "pku",
-        "pla",
-        "plb",
-        "plc",
-        "pld",
-        "ple",
-        "plg",
-        "plh",
-        "pli",
-        "plj",
-        "plk",
-        "pll",
-        "pln",
-        "plo",
-        "plq",
-        "plr",
-        "pls",
-        "plt",
-        "plu",
-        "plv",
-        "plw",
-        "ply",
-        "plz",
-        "pma",
-        "pmb",
-        "pmd",
-        "pme",
-        "pmf",
-        "pmh",
-        "pmi",
-        "pmj",
-        "pmk",
-        "pml",
-        "pmm",
-        "pmn",
-        "pmo",
-        "pmq",
-        "pmr",
-        "pms",
-        "pmt",
-        "pmw",
-        "pmx",
-        "pmy",
-        "pmz",
-        "pna",
-        "pnb",
-        "pnc",
-        "pnd",
-        "pne",
-        "png",
-        "pnh",
-        "pni",
-        "pnj",
-        "pnk",
-        "pnl",
-        "pnm",
-        "pnn",
-        "pno",
-        "pnp",
-        "pnq",
-        "pnr",
-        "pns",
-        "pnt",
-        "pnu",
-        "pnv",
-        "pnw",
-        "pnx",
-        "pny",
-        "pnz",
-        "poc",
-        "poe",
-        "pof",
-        "pog",
-        "poh",
-        "poi",
-        "pok",
-        "pol",
-        "pom",
-        "pon",
-        "poo",
-        "pop",
-        "poq",
-        "por",
-        "pos",
-        "pot",
-        "pov",
-        "pow",
-        "pox",
-        "poy",
-        "ppe",
-        "ppi",
-        "ppk",
-        "ppl",
-        "ppm",
-        "ppn",
-        "ppo",
-        "ppp",
-        "ppq",
-        "pps",
-        "ppt",
-        "ppu",
-        "pqa",
-        "pqm",
-        "prc",
-        "prd",
-        "pre",
-        "prf",
-        "prg",
-        "prh",
-        "pri",
-        "prk",
-        "prl",
-        "prm",
-        "prn",
-        "pro",
-        "prp",
-        "prq",
-        "prr",
-        "prs",
-        "prt",
-        "pru",
-        "prw",
-        "prx",
-        "prz",
-        "psa",
-        "psc",
-        "psd",
-        "pse",
-        "psg",
-        "psh",
-        "psi",
-        "psl",
-        "psm",
-        "psn",
-        "pso",
-        "psp",
-        "psq",
-        "psr",
-        "pss",
-        "pst",
-        "psu",
-        "psw",
-        "psy",
-        "pta",
-        "pth",
-        "pti",
-        "ptn",
-        "pto",
-        "ptp",
-        "ptq",
-        "ptr",
-        "ptt",
-        "ptu",
-        "ptv",
-        "ptw",
-        "pty",
-        "pua",
-        "pub",
-        "puc",
-        "pud",
-        "pue",
-        "puf",
-        "pug",
-        "pui",
-        "puj",
-        "pum",
-        "puo",
-        "pup",
-        "puq",
-        "pur",
-        "pus",
-        "put",
-        "puu",
-        "puw",
-        "pux",
-        "puy",
-        "pwa",
-        "pwb",
-        "pwg",
-        "pwi",
-        "pwm",
-        "pwn",
-        "pwo",
-        "pwr",
-        "pww",
-        "pxm",
-        "pye",
-        "pym",
-        "pyn",
-        "pys",
-        "pyu",
-        "pyx",
-        "pyy",
-        "pzn",
-        "qua",
-        "qub",
-        "quc",
-        "qud",
-        "que",
-        "quf",
-        "qug",
-        "quh",
-        "qui",
-        "quk",
-        "qul",
-        "qum",
-        "qun",
-        "qup",
-        "quq",
-        "qur",
-        "qus",
-        "quv",
-        "quw",
-        "qux",
-        "quy",
-        "quz",
-        "qva",
-        "qvc",
-        "qve",
-        "qvh",
-        "qvi",
-        "qvj",
-        "qvl",
-        "qvm",
-        "qvn",
-        "qvo",
-        "qvp",
-        "qvs",
-        "qvw",
-        "qvy",
-        "qvz",
-        "qwa",
-        "qwc",
-        "qwh",
-        "qwm",
-        "qws",
-        "qwt",
-        "qxa",
-        "qxc",
-        "qxh",
-        "qxl",
-        "qxn",
-        "qxo",
-        "qxp",
-        "qxq",
-        "qxr",
-        "qxs",
-        "qxt",
-        "qxu",
-        "qxw",
-        "qya",
-        "qyp",
-        "raa",
-        "rab",
-        "rac",
-        "rad",
-        "raf",
-        "rag",
-        "rah",
-        "rai",
-        "raj",
-        "rak",
-        "ral",
-        "ram",
-        "ran",
-        "rao",
-        "rap",
-        "raq",
-        "rar",
-        "ras",
-        "rat",
-        "rau",
-        "rav",
-        "raw",
-        "rax",
-        "ray",
-        "raz",
-        "rbb",
-        "rbk",
-        "rbl",
-        "rbp",
-        "rcf",
-        "rdb",
-        "rea",
-        "reb",
-        "ree",
-        "reg",
-        "rei",
-        "rej",
-        "rel",
-        "rem",
-        "ren",
-        "rer",
-        "res",
-        "ret",
-        "rey",
-        "rga",
-        "rge",
-        "rgk",
-        "rgn",
-        "rgr",
-        "rgs",
-        "rgu",
-        "rhg",
-        "rhp",
-        "ria",
-        "rif",
-        "ril",
-        "rim",
-        "rin",
-        "rir",
-        "rit",
-        "riu",
-        "rjg",
-        "rji",
-        "rjs",
-        "rka",
-        "rkb",
-        "rkh",
-        "rki",
-        "rkm",
-        "rkt",
-        "rkw",
-        "rma",
-        "rmb",
-        "rmc",
-        "rmd",
-        "rme",
-        "rmf",
-        "rmg",
-        "rmh",
-        "rmi",
-        "rmk",
-        "rml",
-        "rmm",
-        "rmn",
-        "rmo",
-        "rmp",
-        "rmq",
-        "rms",
-        "rmt",
-        "rmu",
-        "rmv",
-        "rmw",
-        "rmx",
-        "rmy",
-        "rmz",
-        "rnd",
-        "rng",
-        "rnl",
-        "rnn",
-        "rnp",
-        "rnr",
-        "rnw",
-        "rob",
-        "roc",
-        "rod",
-        "roe",
-        "rof",
-        "rog",
-        "roh",
-        "rol",
-        "rom",
-        "ron",
-        "roo",
-        "rop",
-        "ror",
-        "rou",
-        "row",
-        "rpn",
-        "rpt",
-        "rri",
-        "rro",
-        "rrt",
-        "rsb",
-        "rsl",
-        "rsm",
-        "rtc",
-        "rth",
-        "rtm",
-        "rts",
-        "rtw",
-        "rub",
-        "ruc",
-        "rue",
-        "ruf",
-        "rug",
-        "ruh",
-        "rui",
-        "ruk",
-        "run",
-        "ruo",
-        "rup",
-        "ruq",
-        "rus",
-        "rut",
-        "ruu",
-        "ruy",
-        "ruz",
-        "rwa",
-        "rwk",
-        "rwl",
-        "rwm",
-        "rwo",
-        "rwr",
-        "rxd",
-        "rxw",
-        "ryn",
-        "rys",
-        "ryu",
-        "rzh",
-        "saa",
-        "sab",
-        "sac",
-        "sad",
-        "sae",
-        "saf",
-        "sag",
-        "sah",
-        "saj",
-        "sak",
-        "sam",
-        "san",
-        "sao",
-        "saq",
-        "sar",
-        "sas",
-        "sat",
-        "sau",
-        "sav",
-        "saw",
-        "sax",
-        "say",
-        "saz",
-        "sba",
-        "sbb",
-        "sbc",
-        "sbd",
-        "sbe",
-        "sbf",
-        "sbg",
-        "sbh",
-        "sbi",
-        "sbj",
-        "sbk",
-        "sbl",
-        "sbm",
-        "sbn",
-        "sbo",
-        "sbp",
-        "sbq",
-        "sbr",
-        "sbs",
-        "sbt",
-        "sbu",
-        "sbv",
-        "sbw",
-        "sbx",
-        "sby",
-        "sbz",
-        "scb",
-        "sce",
-        "scf",
-        "scg",
-        "sch",
-        "sci",
-        "sck",
-        "scl",
-        "scn",
-        "sco",
-        "scp",
-        "scq",
-        "scs",
-        "sct",
-        "scu",
-        "scv",
-        "scw",
-        "scx",
-        "sda",
-        "sdb",
-        "sdc",
-        "sde",
-        "sdf",
-        "sdg",
-        "sdh",
-        "sdj",
-        "sdk",
-        "sdl",
-        "sdn",
-        "sdo",
-        "sdp",
-        "sdq",
-        "sdr",
-        "sds",
-        "sdt",
-        "sdu",
-        "sdx",
-        "sdz",
-        "sea",
-        "seb",
-        "sec",
-        "sed",
-        "see",
-        "sef",
-        "seg",
-        "seh",
-        "sei",
-        "sej",
-        "sek",
-        "sel",
-        "sen",
-        "seo",
-        "sep",
-        "seq",
-        "ser",
-        "ses",
-        "set",
-        "seu",
-        "sev",
-        "sew",
-        "sey",
-        "sez",
-        "sfb",
-        "sfe",
-        "sfm",
-        "sfs",
-        "sfw",
-        "sga",
-        "sgb",
-        "sgc",
-        "sgd",
-        "sge",
-        "sgg",
-        "sgh",
-        "sgi",
-        "sgj",
-        "sgk",
-        "sgm",
-        "sgp",
-        "sgr",
-        "sgs",
-        "sgt",
-        "sgu",
-        "sgw",
-        "sgx",
-        "sgy",
-        "sgz",
-        "sha",
-        "shb",
-        "shc",
-        "shd",
-        "she",
-        "shg",
-        "shh",
-        "shi",
-        "shj",
-        "shk",
-        "shl",
-        "shm",
-        "shn",
-        "sho",
-        "shp",
-        "shq",
-        "shr",
-        "shs",
-        "sht",
-        "shu",
-        "shv",
-        "shw",
-        "shx",
-        "shy",
-        "shz",
-        "sia",
-        "sib",
-        "sid",
-        "sie",
-        "sif",
-        "sig",
-        "sih",
-        "sii",
-        "sij",
-        "sik",
-        "sil",
-        "sim",
-        "sin",
-        "sip",
-        "siq",
-        "sir",
-        "sis",
-        "siu",
-        "siv",
-        "siw",
-        "six",
-        "siy",
-        "siz",
-        "sja",
-        "sjb",
-        "sjd",
-        "sje",
-        "sjg",
-        "sjk",
-        "sjl",
-        "sjm",
-        "sjn",
-        "sjo",
-        "sjp",
-        "sjr",
-        "sjs",
-        "sjt",
-        "sju",
-        "sjw",
-        "ska",
-        "skb",
-        "skc",
-        "skd",
-        "ske",
-        "skf",
-        "skg",
-        "skh",
-        "ski",
-        "skj",
-        "skm",
-        "skn",
-        "sko",
-        "skp",
-        "skq",
-        "skr",
-        "sks",
-        "skt",
-        "sku",
-        "skv",
-        "skw",
-        "skx",
-        "sky",
-        "skz",
-        "slc",
-        "sld",
-        "sle",
-        "slf",
-        "slg",
-        "slh",
-        "sli",
-        "slj",
-        "slk",
-        "sll",
-        "slm",
-        "sln",
-        "slp",
-        "slq",
-        "slr",
-        "sls",
-        "slt",
-        "slu",
-        "slv",
-        "slw",
-        "slx",
-        "sly",
-        "slz",
-        "sma",
-        "smb",
-        "smc",
-        "smd",
-        "sme",
-        "smf",
-        "smg",
-        "smh",
-        "smj",
-        "smk",
-        "sml",
-        "smm",
-        "smn",
-        "smo",
-        "smp",
-        "smq",
-        "smr",
-        "sms",
-        "smt",
-        "smu",
-        "smv",
-        "smw",
-        "smx",
-        "smy",
-        "smz",
-        "sna",
-        "snb",
-        "snc",
-        "snd",
-        "sne",
-        "snf",
-        "sng",
-        "sni",
-        "snj",
-        "snk",
-        "snl",
-        "snm",
-        "snn",
-        "sno",
-        "snp",
-        "snq",
-        "snr",
-        "sns",
-        "snu",
-        "snv",
-        "snw",
-        "snx",
-        "sny",
-        "snz",
-        "soa",
-        "sob",
-        "soc",
-        "sod",
-        "soe",
-        "sog",
-        "soh",
-        "soi",
-        "soj",
-        "sok",
-        "sol",
-        "som",
-        "soo",
-        "sop",
-        "soq",
-        "sor",
-        "sos",
-        "sot",
-        "sou",
-        "sov",
-        "sow",
-        "sox",
-        "soy",
-        "soz",
-        "spa",
-        "spb",
-        "spc",
-        "spd",
-        "spe",
-        "spg",
-        "spi",
-        "spk",
-        "spl",
-        "spm",
-        "spn",
-        "spo",
-        "spp",
-        "spq",
-        "spr",
-        "sps",
-        "spt",
-        "spu",
-        "spv",
-        "spx",
-        "spy",
-        "sqa",
-        "sqh",
-        "sqi",
-        "sqk",
-        "sqm",
-        "sqn",
-        "sqo",
-        "sqq",
-        "sqr",
-        "sqs",
-        "sqt",
-        "squ",
-        "sqx",
-        "sra",
-        "srb",
-        "src",
-        "srd",
-        "sre",
-        "srf",
-        "srg",
-        "srh",
-        "sri",
-        "srk",
-        "srl",
-        "srm",
-        "srn",
-        "sro",
-        "srp",
-        "srq",
-        "srr",
-        "srs",
-        "srt",
-        "sru",
-        "srv",
-        "srw",
-        "srx",
-        "sry",
-        "srz",
-        "ssb",
-        "ssc",
-        "ssd",
-        "sse",
-        "ssf",
-        "ssg",
-        "ssh",
-        "ssi",
-        "ssj",
-        "ssk",
-        "ssl",
-        "ssm",
-        "ssn",
-        "sso",
-        "ssp",
-        "ssq",
-        "ssr",
-        "sss",
-        "sst",
-        "ssu",
-        "ssv",
-        "ssw",
-        "ssx",
-        "ssy",
-        "ssz",
-        "sta",
-        "stb",
-        "std",
-        "ste",
-        "stf",
-        "stg",
-        "sth",
-        "sti",
-        "stj",
-        "stk",
-        "stl",
-        "stm",
-        "stn",
-        "sto",
-        "stp",
-        "stq",
-        "str",
-        "sts",
-        "stt",
-        "stu",
-        "stv",
-        "stw",
-        "sty",
-        "sua",
-        "sub",
-        "suc",
-        "sue",
-        "sug",
-        "sui",
-        "suj",
-        "suk",
-        "sun",
-        "suo",
-        "suq",
-        "sur",
-        "sus",
-        "sut",
-        "suv",
-        "suw",
-        "sux",
-        "suy",
-        "suz",
-        "sva",
-        "svb",
-        "svc",
-        "sve",
-        "svk",
-        "svm",
-        "svs",
-        "svx",
-        "swa",
-        "swb",
-        "swc",
-        "swe",
-        "swf",
-        "swg",
-        "swh",
-        "swi",
-        "swj",
-        "swk",
-        "swl",
-        "swm",
-        "swn",
-        "swo",
-        "swp",
-        "swq",
-        "swr",
-        "sws",
-        "swt",
-        "swu",
-        "swv",
-        "sww",
-        "swx",
-        "swy",
-        "sxb",
-        "sxc",
-        "sxe",
-        "sxg",
-        "sxk",
-        "sxl",
-        "sxm",
-        "sxn",
-        "sxo",
-        "sxr",
-        "sxs",
-        "sxu",
-        "sxw",
-        "sya",
-        "syb",
-        "syc",
-        "syi",
-        "syk",
-        "syl",
-        "sym",
-        "syn",
-        "syo",
-        "syr",
-        "sys",
-        "syw",
-        "syx",
-        "syy",
-        "sza",
-        "szb",
-        "szc",
-        "szd",
-        "sze",
-        "szg",
-        "szl",
-        "szn",
-        "szp",
-        "szs",
-        "szv",
-        "szw",
-        "szy",
-        "taa",
-        "tab",
-        "tac",
-        "tad",
-        "tae",
-        "taf",
-        "tag",
-        "tah",
-        "taj",
-        "tak",
-        "tal",
-        "tam",
-        "tan",
-        "tao",
-        "tap",
-        "taq",
-        "tar",
-        "tas",
-        "tat",
-        "tau",
-        "tav",
-        "taw",
-        "tax",
-        "tay",
-        "taz",
-        "tba",
-        "tbc",
-        "tbd",
-        "tbe",
-        "tbf",
-        "tbg",
-        "tbh",
-        "tbi",
-        "tbj",
-        "tbk",
-        "tbl",
-        "tbm",
-        "tbn",
-        "tbo",
-        "tbp",
-        "tbr",
-        "tbs",
-        "tbt",
-        "tbu",
-        "tbv",
-        "tbw",
-        "tbx",
-        "tby",
-        "tbz",
-        "tca",
-        "tcb",
-        "tcc",
-        "tcd",
-        "tce",
-        "tcf",
-        "tcg",
-        "tch",
-        "tci",
-        "tck",
-        "tcl",
-        "tcm",
-        "tcn",
-        "tco",
-        "tcp",
-        "tcq",
-        "tcs",
-        "tct",
-        "tcu",
-        "tcw",
-        "tcx",
-        "tcy",
-        "tcz",
-        "tda",
-        "tdb",
-        "tdc",
-        "tdd",
-        "tde",
-        "tdf",
-        "tdg",
-        "tdh",
-        "tdi",
-        "tdj",
-        "tdk",
-        "tdl",
-        "tdm",
-        "tdn",
-        "tdo",
-        "tdq",
-        "tdr",
-        "tds",
-        "tdt",
-        "tdv",
-        "tdx",
-        "tdy",
-        "tea",
-        "teb",
-        "tec",
-        "ted",
-        "tee",
-        "tef",
-        "teg",
-        "teh",
-        "tei",
-        "tek",
-        "tel",
-        "tem",
-        "ten",
-        "teo",
-        "tep",
-        "teq",
-        "ter",
-        "tes",
-        "tet",
-        "teu",
-        "tev",
-        "tew",
-        "tex",
-        "tey",
-        "tez",
-        "tfi",
-        "tfn",
-        "tfo",
-        "tfr",
-        "tft",
-        "tga",
-        "tgb",
-        "tgc",
-        "tgd",
-        "tge",
-        "tgf",
-        "tgh",
-        "tgi",
-        "tgj",
-        "tgk",
-        "tgl",
-        "tgn",
-        "tgo",
-        "tgp",
-        "tgq",
-        "tgr",
-        "tgs",
-        "tgt",
-        "tgu",
-        "tgv",
-        "tgw",
-        "tgx",
-        "tgy",
-        "tgz",
-        "tha",
-        "thd",
-        "the",
-        "thf",
-        "thh",
-        "thi",
-        "thk",
-        "thl",
-        "thm",
-        "thn",
-        "thp",
-        "thq",
-        "thr",
-        "ths",
-        "tht",
-        "thu",
-        "thv",
-        "thy",
-        "thz",
-        "tia",
-        "tic",
-        "tif",
-        "tig",
-        "tih",
-        "tii",
-        "tij",
-        "tik",
-        "til",
-        "tim",
-        "tin",
-        "tio",
-        "tip",
-        "tiq",
-        "tir",
-        "tis",
-        "tit",
-        "tiu",
-        "tiv",
-        "tiw",
-        "tix",
-        "tiy",
-        "tiz",
-        "tja",
-        "tjg",
-        "tji",
-        "tjj",
-        "tjl",
-        "tjm",
-        "tjn",
-        "tjo",
-        "tjp",
-        "tjs",
-        "tju",
-        "tjw",
-        "tka",
-        "tkb",
-        "tkd",
-        "tke",
-        "tkf",
-        "tkg",
-        "tkl",
-        "tkm",
-        "tkn",
-        "tkp",
-        "tkq",
-        "tkr",
-        "tks",
-        "tkt",
-        "tku",
-        "tkv",
-        "tkw",
-        "tkx",
-        "tkz",
-        "tla",
-        "tlb",
-        "tlc",
-        "tld",
-        "tlf",
-        "tlg",
-        "tlh",
-        "tli",
-        "tlj",
-        "tlk",
-        "tll",
-        "tlm",
-        "tln",
-        "tlo",
-        "tlp",
-        "tlq",
-        "tlr",
-        "tls",
-        "tlt",
-        "tlu",
-        "tlv",
-        "tlx",
-        "tly",
-        "tma",
-        "tmb",
-        "tmc",
-        "tmd",
-        "tme",
-        "tmf",
-        "tmg",
-        "tmh",
-        "tmi",
-        "tmj",
-        "tmk",
-        "tml",
-        "tmm",
-        "tmn",
-        "tmo",
-        "tmq",
-        "tmr",
-        "tms",
-        "tmt",
-        "tmu",
-        "tmv",
-        "tmw",
-        "tmy",
-        "tmz",
-        "tna",
-        "tnb",
-        "tnc",
-        "tnd",
-        "tng",
-        "tnh",
-        "tni",
-        "tnk",
-        "tnl",
-        "tnm",
-        "tnn",
-        "tno",
-        "tnp",
-        "tnq",
-        "tnr",
-        "tns",
-        "tnt",
-        "tnu",
-        "tnv",
-        "tnw",
-        "tnx",
-        "tny",
-        "tnz",
-        "tob",
-        "toc",
-        "tod",
-        "tof",
-        "tog",
-        "toh",
-        "toi",
-        "toj",
-        "tol",
-        "tom",
-        "ton",
-        "too",
-        "top",
-        "toq",
-        "tor",
-        "tos",
-        "tou",
-        "tov",
-        "tow",
-        "tox",
-        "toy",
-        "toz",
-        "tpa",
-        "tpc",
-        "tpe",
-        "tpf",
-        "tpg",
-        "tpi",
-        "tpj",
-        "tpk",
-        "tpl",
-        "tpm",
-        "tpn",
-        "tpo",
-        "tpp",
-        "tpq",
-        "tpr",
-        "tpt",
-        "tpu",
-        "tpv",
-        "tpw",
-        "tpx",
-        "tpy",
-        "tpz",
-        "tqb",
-        "tql",
-        "tqm",
-        "tqn",
-        "tqo",
-        "tqp",
-        "tqq",
-        "tqr",
-        "tqt",
-        "tqu",
-        "tqw",
-        "tra",
-        "trb",
-        "trc",
-        "trd",
-        "tre",
-        "trf",
-        "trg",
-        "trh",
-        "tri",
-        "trj",
-        "trl",
-        "trm",
-        "trn",
-        "tro",
-        "trp",
-        "trq",
-        "trr",
-        "trs",
-        "trt",
-        "tru",
-        "trv",
-        "trw",
-        "trx",
-        "try",
-        "trz",
-        "tsa",
-        "tsb",
-        "tsc",
-        "tsd",
-        "tse",
-        "tsg",
-        "tsh",
-        "tsi",
-        "tsj",
-        "tsk",
-        "tsl",
-        "tsm",
-        "tsn",
-        "tso",
-        "tsp",
-        "tsq",
-        "tsr",
-        "tss",
-        "tst",
-        "tsu",
-        "tsv",
-        "tsw",
-        "tsx",
-        "tsy",
-        "tsz",
-        "tta",
-        "ttb",
-        "ttc",
-        "ttd",
-        "tte",
-        "ttf",
-        "ttg",
-        "tth",
-        "tti",
-        "ttj",
-        "ttk",
-        "ttl",
-        "ttm",
-        "ttn",
-        "tto",
-        "ttp",
-        "ttq",
-        "ttr",
-        "tts",
-        "ttt",
-        "ttu",
-        "ttv",
-        "ttw",
-        "tty",
-        "ttz",
-        "tua",
-        "tub",
-        "tuc",
-        "tud",
-        "tue",
-        "tuf",
-        "tug",
-        "tuh",
-        "tui",
-        "tuj",
-        "tuk",
-        "tul",
-        "tum",
-        "tun",
-        "tuo",
-        "tuq",
-        "tur",
-        "tus",
-        "tuu",
-        "tuv",
-        "tux",
-        "tuy",
-        "tuz",
-        "tva",
-        "tvd",
-        "tve",
-        "tvk",
-        "tvl",
-        "tvm",
-        "tvn",
-        "tvo",
-        "tvs",
-        "tvt",
-        "tvu",
-        "tvw",
-        "tvx",
-        "tvy",
-        "twa",
-        "twb",
-        "twc",
-        "twd",
-        "twe",
-        "twf",
-        "twg",
-        "twh",
-        "twi",
-        "twl",
-        "twm",
-        "twn",
-        "two",
-        "twp",
-        "twq",
-        "twr",
-        "twt",
-        "twu",
-        "tww",
-        "twx",
-        "twy",
-        "txa",
-        "txb",
-        "txc",
-        "txe",
-        "txg",
-        "txh",
-        "txi",
-        "txj",
-        "txm",
-        "txn",
-        "txo",
-        "txq",
-        "txr",
-        "txs",
-        "txt",
-        "txu",
-        "txx",
-        "txy",
-        "tya",
-        "tye",
-        "tyh",
-        "tyi",
-        "tyj",
-        "tyl",
-        "tyn",
-        "typ",
-        "tyr",
-        "tys",
-        "tyt",
-        "tyu",
-        "tyv",
-        "tyx",
-        "tyy",
-        "tyz",
-        "tza",
-        "tzh",
-        "tzj",
-        "tzl",
-        "tzm",
-        "tzn",
-        "tzo",
-        "tzx",
-        "uam",
-        "uan",
-        "uar",
-        "uba",
-        "ubi",
-        "ubl",
-        "ubr",
-        "ubu",
-        "uby",
-        "uda",
-        "ude",
-        "udg",
-        "udi",
-        "udj",
-        "udl",
-        "udm",
-        "udu",
-        "ues",
-        "ufi",
-        "uga",
-        "ugb",
-        "uge",
-        "ugn",
-        "ugo",
-        "ugy",
-        "uha",
-        "uhn",
-        "uig",
-        "uis",
-        "uiv",
-        "uji",
-        "uka",
-        "ukg",
-        "ukh",
-        "uki",
-        "ukk",
-        "ukl",
-        "ukp",
-        "ukq",
-        "ukr",
-        "uks",
-        "uku",
-        "ukv",
-        "ukw",
-        "uky",
-        "ula",
-        "ulb",
-        "ulc",
-        "ule",
-        "ulf",
-        "uli",
-        "ulk",
-        "ull",
-        "ulm",
-        "uln",
-        "ulu",
-        "ulw",
-        "uma",
-        "umb",
-        "umc",
-        "umd",
-        "umg",
-        "umi",
-        "umm",
-        "umn",
-        "umo",
-        "ump",
-        "umr",
-        "ums",
-        "umu",
-        "una",
-        "und",
-        "une",
-        "ung",
-        "uni",
-        "unk",
-        "unm",
-        "unn",
-        "unr",
-        "unu",
-        "unx",
-        "unz",
-        "upi",
-        "upv",
-        "ura",
-        "urb",
-        "urc",
-        "urd",
-        "ure",
-        "urf",
-        "urg",
-        "urh",
-        "uri",
-        "urk",
-        "url",
-        "urm",
-        "urn",
-        "uro",
-        "urp",
-        "urr",
-        "urt",
-        "uru",
-        "urv",
-        "urw",
-        "urx",
-        "ury",
-        "urz",
-        "usa",
-        "ush",
-        "usi",
-        "usk",
-        "usp",
-        "uss",
-        "usu",
-        "uta",
-        "ute",
-        "uth",
-        "utp",
-        "utr",
-        "utu",
-        "uum",
-        "uun",
-        "uur",
-        "uuu",
-        "uve",
-        "uvh",
-        "uvl",
-        "uwa",
-        "uya",
-        "uzb",
-        "uzn",
-        "uzs",
-        "vaa",
-        "vae",
-        "vaf",
-        "vag",
-        "vah",
-        "vai",
-        "vaj",
-        "val",
-        "vam",
-        "van",
-        "vao",
-        "vap",
-        "var",
-        "vas",
-        "vau",
-        "vav",
-        "vay",
-        "vbb",
-        "vbk",
-        "vec",
-        "ved",
-        "vel",
-        "vem",
-        "ven",
-        "veo",
-        "vep",
-        "ver",
-        "vgr",
-        "vgt",
-        "vic",
-        "vid",
-        "vie",
-        "vif",
-        "vig",
-        "vil",
-        "vin",
-        "vis",
-        "vit",
-        "viv",
-        "vka",
-        "vkj",
-        "vkk",
-        "vkl",
-        "vkm",
-        "vkn",
-        "vko",
-        "vkp",
-        "vkt",
-        "vku",
-        "vkz",
-        "vlp",
-        "vls",
-        "vma",
-        "vmb",
-        "vmc",
-        "vmd",
-        "vme",
-        "vmf",
-        "vmg",
-        "vmh",
-        "vmi",
-        "vmj",
-        "vmk",
-        "vml",
-        "vmm",
-        "vmp",
-        "vmq",
-        "vmr",
-        "vms",
-        "vmu",
-        "vmv",
-        "vmw",
-        "vmx",
-        "vmy",
-        "vmz",
-        "vnk",
-        "vnm",
-        "vnp",
-        "vol",
-        "vor",
-        "vot",
-        "vra",
-        "vro",
-        "vrs",
-        "vrt",
-        "vsi",
-        "vsl",
-        "vsv",
-        "vto",
-        "vum",
-        "vun",
-        "vut",
-        "vwa",
-        "waa",
-        "wab",
-        "wac",
-        "wad",
-        "wae",
-        "waf",
-        "wag",
-        "wah",
-        "wai",
-        "waj",
-        "wal",
-        "wam",
-        "wan",
-        "wao",
-        "wap",
-        "waq",
-        "war",
-        "was",
-        "wat",
-        "wau",
-        "wav",
-        "waw",
-        "wax",
-        "way",
-        "waz",
-        "wba",
-        "wbb",
-        "wbe",
-        "wbf",
-        "wbh",
-        "wbi",
-        "wbj",
-        "wbk",
-        "wbl",
-        "wbm",
-        "wbp",
-        "wbq",
-        "wbr",
-        "wbs",
-        "wbt",
-        "wbv",
-        "wbw",
-        "wca",
-        "wci",
-        "wdd",
-        "wdg",
-        "wdj",
-        "wdk",
-        "wdu",
-        "wdy",
-        "wea",
-        "wec",
-        "wed",
-        "weg",
-        "weh",
-        "wei",
-        "wem",
-        "weo",
-        "wep",
-        "wer",
-        "wes",
-        "wet",
-        "weu",
-        "wew",
-        "wfg",
-        "wga",
-        "wgb",
-        "wgg",
-        "wgi",
-        "wgo",
-        "wgu",
-        "wgy",
-        "wha",
-        "whg",
-        "whk",
-        "whu",
-        "wib",
-        "wic",
-        "wie",
-        "wif",
-        "wig",
-        "wih",
-        "wii",
-        "wij",
-        "wik",
-        "wil",
-        "wim",
-        "win",
-        "wir",
-        "wiu",
-        "wiv",
-        "wiy",
-        "wja",
-        "wji",
-        "wka",
-        "wkb",
-        "wkd",
-        "wkl",
-        "wkr",
-        "wku",
-        "wkw",
-        "wky",
-        "wla",
-        "wlc",
-        "wle",
-        "wlg",
-        "wlh",
-        "wli",
-        "wlk",
-        "wll",
-        "wlm",
-        "wln",
-        "wlo",
-        "wlr",
-        "wls",
-        "wlu",
-        "wlv",
-        "wlw",
-        "wlx",
-        "wly",
-        "wma",
-        "wmb",
-        "wmc",
-        "wmd",
-        "wme",
-        "wmg",
-        "wmh",
-        "wmi",
-        "wmm",
-        "wmn",
-        "wmo",
-        "wms",
-        "wmt",
-        "wmw",
-        "wmx",
-        "wnb",
-        "wnc",
-        "wnd",
-        "wne",
-        "wng",
-        "wni",
-        "wnk",
-        "wnm",
-        "wnn",
-        "wno",
-        "wnp",
-        "wnu",
-        "wnw",
-        "wny",
-        "woa",
-        "wob",
-        "woc",
-        "wod",
-        "woe",
-        "wof",
-        "wog",
-        "woi",
-        "wok",
-        "wol",
-        "wom",
-        "won",
-        "woo",
-        "wor",
-        "wos",
-        "wow",
-        "woy",
-        "wpc",
-        "wrb",
-        "wrd",
-        "wrg",
-        "wrh",
-        "wri",
-        "wrk",
-        "wrl",
-        "wrm",
-        "wrn",
-        "wro",
-        "wrp",
-        "wrr",
-        "wrs",
-        "wru",
-        "wrv",
-        "wrw",
-        "wrx",
-        "wry",
-        "wrz",
-        "wsa",
-        "wsg",
-        "wsi",
-        "wsk",
-        "wsr",
-        "wss",
-        "wsu",
-        "wsv",
-        "wtf",
-        "wth",
-        "wti",
-        "wtk",
-        "wtm",
-        "wtw",
-        "wua",
-        "wub",
-        "wud",
-        "wuh",
-        "wul",
-        "wum",
-        "wun",
-        "wur",
-        "wut",
-        "wuu",
-        "wuv",
-        "wux",
-        "wuy",
-        "wwa",
-        "wwb",
-        "wwo",
-        "wwr",
-        "www",
-        "wxa",
-        "wxw",
-        "wya",
-        "wyb",
-        "wyi",
-        "wym",
-        "wyr",
-        "wyy",
-        "xaa",
-        "xab",
-        "xac",
-        "xad",
-        "xae",
-        "xag",
-        "xai",
-        "xaj",
-        "xak",
-        "xal",
-        "xam",
-        "xan",
-        "xao",
-        "xap",
-        "xaq",
-        "xar",
-        "xas",
-        "xat",
-        "xau",
-        "xav",
-        "xaw",
-        "xay",
-        "xbb",
-        "xbc",
-        "xbd",
-        "xbe",
-        "xbg",
-        "xbi",
-        "xbj",
-        "xbm",
-        "xbn",
-        "xbo",
-        "xbp",
-        "xbr",
-        "xbw",
-        "xby",
-        "xcb",
-        "xcc",
-        "xce",
-        "xcg",
-        "xch",
-        "xcl",
-        "xcm",
-        "xcn",
-        "xco",
-        "xcr",
-        "xct",
-        "xcu",
-        "xcv",
-        "xcw",
-        "xcy",
-        "xda",
-        "xdc",
-        "xdk",
-        "xdm",
-        "xdo",
-        "xdy",
-        "xeb",
-        "xed",
-        "xeg",
-        "xel",
-        "xem",
-        "xep",
-        "xer",
-        "xes",
-        "xet",
-        "xeu",
-        "xfa",
-        "xga",
-        "xgb",
-        "xgd",
-        "xgf",
-        "xgg",
-        "xgi",
-        "xgl",
-        "xgm",
-        "xgr",
-        "xgu",
-        "xgw",
-        "xha",
-        "xhc",
-        "xhd",
-        "xhe",
-        "xho",
-        "xhr",
-        "xht",
-        "xhu",
-        "xhv",
-        "xib",
-        "xii",
-        "xil",
-        "xin",
-        "xir",
-        "xis",
-        "xiv",
-        "xiy",
-        "xjb",
-        "xjt",
-        "xka",
-        "xkb",
-        "xkc",
-        "xkd",
-        "xke",
-        "xkf",
-        "xkg",
-        "xki",
-        "xkj",
-        "xkk",
-        "xkl",
-        "xkn",
-        "xko",
-        "xkp",
-        "xkq",
-        "xkr",
-        "xks",
-        "xkt",
-        "xku",
-        "xkv",
-        "xkw",
-        "xkx",
-        "xky",
-        "xkz",
-        "xla",
-        "xlb",
-        "xlc",
-        "xld",
-        "xle",
-        "xlg",
-        "xli",
-        "xln",
-        "xlo",
-        "xlp",
-        "xls",
-        "xlu",
-        "xly",
-        "xma",
-        "xmb",
-        "xmc",
-        "xmd",
-        "xme",
-        "xmf",
-        "xmg",
-        "xmh",
-        "xmj",
-        "xmk",
-        "xml",
-        "xmm",
-        "xmn",
-        "xmo",
-        "xmp",
-        "xmq",
-        "xmr",
-        "xms",
-        "xmt",
-        "xmu",
-        "xmv",
-        "xmw",
-        "xmx",
-        "xmy",
-        "xmz",
-        "xna",
-        "xnb",
-        "xng",
-        "xnh",
-        "xni",
-        "xnj",
-        "xnk",
-        "xnm",
-        "xnn",
-        "xno",
-        "xnq",
-        "xnr",
-        "xns",
-        "xnt",
-        "xnu",
-        "xny",
-        "xnz",
-        "xoc",
-        "xod",
-        "xog",
-        "xoi",
-        "xok",
-        "xom",
-        "xon",
-        "xoo",
-        "xop",
-        "xor",
-        "xow",
-        "xpa",
-        "xpb",
-        "xpc",
-        "xpd",
-        "xpe",
-        "xpf",
-        "xpg",
-        "xph",
-        "xpi",
-        "xpj",
-        "xpk",
-        "xpl",
-        "xpm",
-        "xpn",
-        "xpo",
-        "xpp",
-        "xpq",
-        "xpr",
-        "xps",
-        "xpt",
-        "xpu",
-        "xpv",
-        "xpw",
-        "xpx",
-        "xpy",
-        "xpz",
-        "xqa",
-        "xqt",
-        "xra",
-        "xrb",
-        "xrd",
-        "xre",
-        "xrg",
-        "xri",
-        "xrm",
-        "xrn",
-        "xrr",
-        "xrt",
-        "xru",
-        "xrw",
-        "xsa",
-        "xsb",
-        "xsc",
-        "xsd",
-        "xse",
-        "xsh",
-        "xsi",
-        "xsj",
-        "xsl",
-        "xsm",
-        "xsn",
-        "xso",
-        "xsp",
-        "xsq",
-        "xsr",
-        "xss",
-        "xsu",
-        "xsv",
-        "xsy",
-        "xta",
-        "xtb",
-        "xtc",
-        "xtd",
-        "xte",
-        "xtg",
-        "xth",
-        "xti",
-        "xtj",
-        "xtl",
-        "xtm",
-        "xtn",
-        "xto",
-        "xtp",
-        "xtq",
-        "xtr",
-        "xts",
-        "xtt",
-        "xtu",
-        "xtv",
-        "xtw",
-        "xty",
-        "xua",
-        "xub",
-        "xud",
-        "xug",
-        "xuj",
-        "xul",
-        "xum",
-        "xun",
-        "xuo",
-        "xup",
-        "xur",
-        "xut",
-        "xuu",
-        "xve",
-        "xvi",
-        "xvn",
-        "xvo",
-        "xvs",
-        "xwa",
-        "xwc",
-        "xwd",
-        "xwe",
-        "xwg",
-        "xwj",
-        "xwk",
-        "xwl",
-        "xwo",
-        "xwr",
-        "xwt",
-        "xww",
-        "xxb",
-        "xxk",
-        "xxm",
-        "xxr",
-        "xxt",
-        "xya",
-        "xyb",
-        "xyj",
-        "xyk",
-        "xyl",
-        "xyt",
-        "xyy",
-        "xzh",
-        "xzm",
-        "xzp",
-        "yaa",
-        "yab",
-        "yac",
-        "yad",
-        "yae",
-        "yaf",
-        "yag",
-        "yah",
-        "yai",
-        "yaj",
-        "yak",
-        "yal",
-        "yam",
-        "yan",
-        "yao",
-        "yap",
-        "yaq",
-        "yar",
-        "yas",
-        "yat",
-        "yau",
-        "yav",
-        "yaw",
-        "yax",
-        "yay",
-        "yaz",
-        "yba",
-        "ybb",
-        "ybe",
-        "ybh",
-        "ybi",
-        "ybj",
-        "ybk",
-        "ybl",
-        "ybm",
-        "ybn",
-        "ybo",
-        "ybx",
-        "yby",
-        "ych",
-        "ycl",
-        "ycn",
-        "ycp",
-        "yda",
-        "ydd",
-        "yde",
-        "ydg",
-        "ydk",
-        "yea",
-        "yec",
-        "yee",
-        "yei",
-        "yej",
-        "yel",
-        "yer",
-        "yes",
-        "yet",
-        "yeu",
-        "yev",
-        "yey",
-        "yga",
-        "ygi",
-        "ygl",
-        "ygm",
-        "ygp",
-        "ygr",
-        "ygs",
-        "ygu",
-        "ygw",
-        "yha",
-        "yhd",
-        "yhl",
-        "yhs",
-        "yia",
-        "yid",
-        "yif",
-        "yig",
-        "yih",
-        "yii",
-        "yij",
-        "yik",
-        "yil",
-        "yim",
-        "yin",
-        "yip",
-        "yiq",
-        "yir",
-        "yis",
-        "yit",
-        "yiu",
-        "yiv",
-        "yix",
-        "yiz",
-        "yka",
-        "ykg",
-        "yki",
-        "ykk",
-        "ykl",
-        "ykm",
-        "ykn",
-        "yko",
-        "ykr",
-        "ykt",
-        "yku",
-        "yky",
-        "yla",
-        "ylb",
-        "yle",
-        "ylg",
-        "yli",
-        "yll",
-        "ylm",
-        "yln",
-        "ylo",
-        "ylr",
-        "ylu",
-        "yly",
-        "ymb",
-        "ymc",
-        "ymd",
-        "yme",
-        "ymg",
-        "ymh",
-        "ymi",
-        "ymk",
-        "yml",
-        "ymm",
-        "ymn",
-        "ymo",
-        "ymp",
-        "ymq",
-        "ymr",
-        "yms",
-        "ymx",
-        "ymz",
-        "yna",
-        "ynd",
-        "yne",
-        "yng",
-        "ynk",
-        "ynl",
-        "ynn",
-        "yno",
-        "ynq",
-        "yns",
-        "ynu",
-        "yob",
-        "yog",
-        "yoi",
-        "yok",
-        "yol",
-        "yom",
-        "yon",
-        "yor",
-        "yot",
-        "yox",
-        "yoy",
-        "ypa",
-        "ypb",
-        "ypg",
-        "yph",
-        "ypm",
-        "ypn",
-        "ypo",
-        "ypp",
-        "ypz",
-        "yra",
-        "yrb",
-        "yre",
-        "yrk",
-        "yrl",
-        "yrm",
-        "yrn",
-        "yro",
-        "yrs",
-        "yrw",
-        "yry",
-        "ysc",
-        "ysd",
-        "ysg",
-        "ysl",
-        "ysm",
-        "ysn",
-        "yso",
-        "ysp",
-        "ysr",
-        "yss",
-        "ysy",
-        "yta",
-        "ytl",
-        "ytp",
-        "ytw",
-        "yty",
-        "yua",
-        "yub",
-        "yuc",
-        "yud",
-        "yue",
-        "yuf",
-        "yug",
-        "yui",
-        "yuj",
-        "yuk",
-        "yul",
-        "yum",
-        "yun",
-        "yup",
-        "yuq",
-        "yur",
-        "yut",
-        "yuw",
-        "yux",
-        "yuy",
-        "yuz",
-        "yva",
-        "yvt",
-        "ywa",
-        "ywg",
-        "ywl",
-        "ywn",
-        "ywq",
-        "ywr",
-        "ywt",
-        "ywu",
-        "yww",
-        "yxa",
-        "yxg",
-        "yxl",
-        "yxm",
-        "yxu",
-        "yxy",
-        "yyr",
-        "yyu",
-        "yyz",
-        "yzg",
-        "yzk",
-        "zaa",
-        "zab",
-        "zac",
-        "zad",
-        "zae",
-        "zaf",
-        "zag",
-        "zah",
-        "zai",
-        "zaj",
-        "zak",
-        "zal",
-        "zam",
-        "zao",
-        "zap",
-        "zaq",
-        "zar",
-        "zas",
-        "zat",
-        "zau",
-        "zav",
-        "zaw",
-        "zax",
-        "zay",
-        "zaz",
-        "zba",
-        "zbc",
-        "zbe",
-        "zbl",
-        "zbt",
-        "zbu",
-        "zbw",
-        "zca",
-        "zch",
-        "zdj",
-        "zea",
-        "zeg",
-        "zeh",
-        "zen",
-        "zga",
-        "zgb",
-        "zgh",
-        "zgm",
-        "zgn",
-        "zgr",
-        "zha",
-        "zhb",
-        "zhd",
-        "zhi",
-        "zhn",
-        "zho",
-        "zhw",
-        "zia",
-        "zib",
-        "zik",
-        "zil",
-        "zim",
-        "zin",
-        "ziw",
-        "ziz",
-        "zka",
-        "zkb",
-        "zkd",
-        "zkg",
-        "zkh",
-        "zkk",
-        "zkn",
-        "zko",
-        "zkp",
-        "zkr",
-        "zkt",
-        "zku",
-        "zkv",
-        "zkz",
-        "zla",
-        "zlj",
-        "zlm",
-        "zln",
-        "zlq",
-        "zma",
-        "zmb",
-        "zmc",
-        "zmd",
-        "zme",
-        "zmf",
-        "zmg",
-        "zmh",
-        "zmi",
-        "zmj",
-        "zmk",
-        "zml",
-        "zmm",
-        "zmn",
-        "zmo",
-        "zmp",
-        "zmq",
-        "zmr",
-        "zms",
-        "zmt",
-        "zmu",
-        "zmv",
-        "zmw",
-        "zmx",
-        "zmy",
-        "zmz",
-        "zna",
-        "zne",
-        "zng",
-        "znk",
-        "zns",
-        "zoc",
-        "zoh",
-        "zom",
-        "zoo",
-        "zoq",
-        "zor",
-        "zos",
-        "zpa",
-        "zpb",
-        "zpc",
-        "zpd",
-        "zpe",
-        "zpf",
-        "zpg",
-        "zph",
-        "zpi",
-        "zpj",
-        "zpk",
-        "zpl",
-        "zpm",
-        "zpn",
-        "zpo",
-        "zpp",
-        "zpq",
-        "zpr",
-        "zps",
-        "zpt",
-        "zpu",
-        "zpv",
-        "zpw",
-        "zpx",
-        "zpy",
-        "zpz",
-        "zqe",
-        "zra",
-        "zrg",
-        "zrn",
-        "zro",
-        "zrp",
-        "zrs",
-        "zsa",
-        "zsk",
-        "zsl",
-        "zsm",
-        "zsr",
-        "zsu",
-        "zte",
-        "ztg",
-        "ztl",
-        "ztm",
-        "ztn",
-        "ztp",
-        "ztq",
-        "zts",
-        "ztt",
-        "ztu",
-        "ztx",
-        "zty",
-        "zua",
-        "zuh",
-        "zul",
-        "zum",
-        "zun",
-        "zuy",
-        "zwa",
-        "zxx",
-        "zyb",
-        "zyg",
-        "zyj",
-        "zyn",
-        "zyp",
-        "zza",
-        "zzj",
-    ]
-)  # noqa
-ISO3_MAP: Dict[str, str] = {
-    "ghotuo": "aaa",
-    "alumu-tesu": "aab",
-    "amal": "aad",
-    "arbëreshë albanian": "aae",
-    "aranadan": "aaf",
-    "ambrak": "aag",
-    "abu' arapesh": "aah",
-    "arifama-miniafia": "aai",
-    "ankave": "aak",
-    "afade": "aal",
-    "anambé": "aan",
-    "algerian saharan arabic": "aao",
-    "pará arára": "aap",
-    "eastern abnaki": "aaq",
-    "aa": "aar",
-    "aar": "aar",
-    "afar": "aar",
-    "aasáx": "aas",
-    "arvanitika albanian": "aat",
-    "abau": "aau",
-    "solong": "aaw",
-    "mandobo atas": "aax",
-    "amarasi": "aaz",
-    "bankon": "abb",
-    "ambala ayta": "abc",
-    "manide": "abd",
-    "western abnaki": "abe",
-    "abai sungai": "abf",
-    "abaga": "abg",
-    "tajiki arabic": "abh",
-    "abidji": "abi",
-    "aka-bea": "abj",
-    "ab": "abk",
-    "abk": "abk",
-    "abkhazian": "abk",
-    "lampung nyo": "abl",
-    "abanyom": "abm",
-    "abua": "abn",
-    "abon": "abo",
-    "abellen ayta": "abp",
-    "abaza": "abq",
-    "abron": "abr",
-    "ambonese malay": "abs",
-    "ambulas": "abt",
-    "abure": "abu",
-    "baharna arabic": "abv",
-    "inabaknon": "abx",
-    "aneme wake": "aby",
-    "abui": "abz",
-    "achagua": "aca",
-    "áncá": "acb",
-    "gikyode": "acd",
-    "ace": "ace",
-    "achinese": "ace",
-    "saint lucian creole french": "acf",
-    "ach": "ach",
-    "acoli": "ach",
-    "aka-cari": "aci",
-    "aka-kora": "ack",
-    "akar-bale": "acl",
-    "mesopotamian arabic": "acm",
-    "achang": "acn",
-    "eastern acipa": "acp",
-    "ta'izzi-adeni arabic": "acq",
-    "achi": "acr",
-    "acroá": "acs",
-    "achterhoeks": "act",
-    "achuar-shiwiar": "acu",
-    "achumawi": "acv",
-    "hijazi arabic": "acw",
-    "omani arabic": "acx",
-    "cypriot arabic": "acy",
-    "acheron": "acz",
-    "ada": "ada",
-    "adangme": "ada",
-    "atauran": "adb",
-    "lidzonka": "add",
-    "adele": "ade",
-    "dhofari arabic": "adf",
-    "andegerebinha": "adg",
-    "adhola": "adh",
-    "adioukrou": "adj",
-    "galo": "adl",
-    "adang": "adn",
-    "adangbe": "adq",
-    "adonara": "adr",
-    "adamorobe sign language": "ads",
-    "adnyamathanha": "adt",
-    "aduge": "adu",
-    "amundava": "adw",
-    "amdo tibetan": "adx",
-    "ady": "ady",
-    "adyghe": "ady",
-    "adzera": "adz",
-    "areba": "aea",
-    "tunisian arabic": "aeb",
-    "saidi arabic": "aec",
-    "argentine sign language": "aed",
-    "northeast pashai": "aee",
-    "haeke": "aek",
-    "ambele": "ael",
-    "arem": "aem",
-    "armenian sign language": "aen",
-    "eastern arrernte": "aer",
-    "alsea": "aes",
-    "akeu": "aeu",
-    "ambakich": "aew",
-    "amele": "aey",
-    "aeka": "aez",
-    "gulf arabic": "afb",
-    "andai": "afd",
-    "putukwam": "afe",
-    "afghan sign language": "afg",
-    "afh": "afh",
-    "afrihili": "afh",
-    "akrukay": "afi",
-    "nanubae": "afk",
-    "defaka": "afn",
-    "eloyi": "afo",
-    "tapei": "afp",
-    "af": "afr",
-    "afr": "afr",
-    "afrikaans": "afr",
-    "afro-seminole creole": "afs",
-    "afitti": "aft",
-    "awutu": "afu",
-    "obokuitai": "afz",
-    "aguano": "aga",
-    "legbo": "agb",
-    "agatu": "agc",
-    "agarabi": "agd",
-    "angal": "age",
-    "arguni": "agf",
-    "angor": "agg",
-    "ngelima": "agh",
-    "agariya": "agi",
-    "argobba": "agj",
-    "isarog agta": "agk",
-    "fembe": "agl",
-    "angaataha": "agm",
-    "agutaynen": "agn",
-    "tainae": "ago",
-    "aghem": "agq",
-    "aguaruna": "agr",
-    "esimbi": "ags",
-    "central cagayan agta": "agt",
-    "aguacateco": "agu",
-    "remontado dumagat": "agv",
-    "kahua": "agw",
-    "aghul": "agx",
-    "southern alta": "agy",
-    "mt. iriga agta": "agz",
-    "ahanta": "aha",
-    "axamb": "ahb",
-    "qimant": "ahg",
-    "aghu": "ahh",
-    "tiagbamrin aizi": "ahi",
-    "akha": "ahk",
-    "mobumrin aizi": "ahm",
-    "àhàn": "ahn",
-    "ahom": "aho",
-    "aproumu aizi": "ahp",
-    "ahirani": "ahr",
-    "ashe": "ahs",
-    "ahtena": "aht",
-    "arosi": "aia",
-    "ainu (china)": "aib",
-    "ainbai": "aic",
-    "alngith": "aid",
-    "amara": "aie",
-    "antigua and barbuda creole english": "aig",
-    "ai-cham": "aih",
-    "assyrian neo-aramaic": "aii",
-    "lishanid noshan": "aij",
-    "aimele": "ail",
-    "aimol": "aim",
-    "ain": "ain",
-    "ainu (japan)": "ain",
-    "aiton": "aio",
-    "burumakok": "aip",
-    "aimaq": "aiq",
-    "airoran": "air",
-    "arikem": "ait",
-    "aari": "aiw",
-    "aighon": "aix",
-    "aja (south sudan)": "aja",
-    "aja (benin)": "ajg",
-    "ajië": "aji",
-    "andajin": "ajn",
-    "south levantine arabic": "ajp",
-    "judeo-tunisian arabic": "ajt",
-    "judeo-moroccan arabic": "aju",
-    "ajawa": "ajw",
-    "amri karbi": "ajz",
-    "ak": "aka",
-    "aka": "aka",
-    "akan": "aka",
-    "batak angkola": "akb",
-    "mpur": "akc",
-    "ukpet-ehom": "akd",
-    "akawaio": "ake",
-    "akpa": "akf",
-    "anakalangu": "akg",
-    "angal heneng": "akh",
-    "aiome": "aki",
-    "aka-jeru": "akj",
-    "akk": "akk",
-    "akkadian": "akk",
-    "aklanon": "akl",
-    "aka-bo": "akm",
-    "akurio": "ako",
-    "siwu": "akp",
-    "araki": "akr",
-    "akaselem": "aks",
-    "akolet": "akt",
-    "akum": "aku",
-    "akhvakh": "akv",
-    "akwa": "akw",
-    "aka-kede": "akx",
-    "aka-kol": "aky",
-    "alabama": "akz",
-    "alago": "ala",
-    "qawasqar": "alc",
-    "alladian": "ald",
-    "ale": "ale",
-    "aleut": "ale",
-    "alege": "alf",
-    "alawa": "alh",
-    "amaimon": "ali",
-    "alangan": "alj",
-    "alak": "alk",
-    "allar": "all",
-    "amblong": "alm",
-    "gheg albanian": "aln",
-    "larike-wakasihu": "alo",
-    "alune": "alp",
-    "algonquin": "alq",
-    "alutor": "alr",
-    "tosk albanian": "als",
-    "alt": "alt",
-    "southern altai": "alt",
-    "'are'are": "alu",
-    "alaba-k’abeena": "alw",
-    "amol": "alx",
-    "alyawarr": "aly",
-    "alur": "alz",
-    "amanayé": "ama",
-    "ambo": "amb",
-    "amahuaca": "amc",
-    "yanesha'": "ame",
-    "hamer-banna": "amf",
-    "amurdak": "amg",
-    "am": "amh",
-    "amh": "amh",
-    "amharic": "amh",
-    "amis": "ami",
-    "amdang": "amj",
-    "ambai": "amk",
-    "war-jaintia": "aml",
-    "ama (papua new guinea)": "amm",
-    "amanab": "amn",
-    "alamblak": "amp",
-    "amahai": "amq",
-    "amarakaeri": "amr",
-    "southern amami-oshima": "ams",
-    "amto": "amt",
-    "guerrero amuzgo": "amu",
-    "ambelau": "amv",
-    "western neo-aramaic": "amw",
-    "anmatyerre": "amx",
-    "atampaya": "amz",
-    "andaqui": "ana",
-    "andoa": "anb",
-    "ngas": "anc",
-    "ansus": "and",
-    "xârâcùù": "ane",
-    "animere": "anf",
-    "ang": "ang",
-    "old english (ca. 450-1100)": "ang",
-    "nend": "anh",
-    "andi": "ani",
-    "anor": "anj",
-    "goemai": "ank",
-    "anu-hkongso chin": "anl",
-    "anal": "anm",
-    "obolo": "ann",
-    "andoque": "ano",
-    "anp": "anp",
-    "angika": "anp",
-    "jarawa (india)": "anq",
-    "andh": "anr",
-    "anserma": "ans",
-    "antakarinya": "ant",
-    "anuak": "anu",
-    "denya": "anv",
-    "anaang": "anw",
-    "andra-hus": "anx",
-    "anyin": "any",
-    "anem": "anz",
-    "angolar": "aoa",
-    "abom": "aob",
-    "pemon": "aoc",
-    "andarum": "aod",
-    "angal enen": "aoe",
-    "bragat": "aof",
-    "angoram": "aog",
-    "anindilyakwa": "aoi",
-    "mufian": "aoj",
-    "arhö": "aok",
-    "alor": "aol",
-    "ömie": "aom",
-    "bumbita arapesh": "aon",
-    "aore": "aor",
-    "taikat": "aos",
-    "atong (india)": "aot",
-    "a'ou": "aou",
-    "atorada": "aox",
-    "uab meto": "aoz",
-    "sa'a": "apb",
-    "north levantine arabic": "apc",
-    "sudanese arabic": "apd",
-    "bukiyip": "ape",
-    "pahanan agta": "apf",
-    "ampanang": "apg",
-    "athpariya": "aph",
-    "apiaká": "api",
-    "jicarilla apache": "apj",
-    "kiowa apache": "apk",
-    "lipan apache": "apl",
-    "mescalero-chiricahua apache": "apm",
-    "apinayé": "apn",
-    "ambul": "apo",
-    "apma": "app",
-    "a-pucikwar": "apq",
-    "arop-lokep": "apr",
-    "arop-sissano": "aps",
-    "apatani": "apt",
-    "apurinã": "apu",
-    "alapmunte": "apv",
-    "western apache": "apw",
-    "aputai": "apx",
-    "apalaí": "apy",
-    "safeyoka": "apz",
-    "archi": "aqc",
-    "ampari dogon": "aqd",
-    "arigidi": "aqg",
-    "aninka": "aqk",
-    "atohwaim": "aqm",
-    "northern alta": "aqn",
-    "atakapa": "aqp",
-    "arhâ": "aqr",
-    "angaité": "aqt",
-    "akuntsu": "aqz",
-    "ar": "ara",
-    "ara": "ara",
-    "arabic": "ara",
-    "standard arabic": "arb",
-    "arc": "arc",
-    "official aramaic (700-300 bce)": "arc",
-    "arabana": "ard",
-    "western arrarnta": "are",
-    "an": "arg",
-    "arg": "arg",
-    "aragonese": "arg",
-    "arhuaco": "arh",
-    "arikara": "ari",
-    "arapaso": "arj",
-    "arikapú": "ark",
-    "arabela": "arl",
-    "arn": "arn",
-    "mapudungun": "arn",
-    "araona": "aro",
-    "arp": "arp",
-    "arapaho": "arp",
-    "algerian arabic": "arq",
-    "karo (brazil)": "arr",
-    "najdi arabic": "ars",
-    "aruá (amazonas state)": "aru",
-    "arbore": "arv",
-    "arw": "arw",
-    "arawak": "arw",
-    "aruá (rodonia state)": "arx",
-    "moroccan arabic": "ary",
-    "egyptian arabic": "arz",
-    "asu (tanzania)": "asa",
-    "assiniboine": "asb",
-    "casuarina coast asmat": "asc",
-    "american sign language": "ase",
-    "auslan": "asf",
-    "cishingini": "asg",
-    "abishira": "ash",
-    "buruwai": "asi",
-    "sari": "asj",
-    "ashkun": "ask",
-    "asilulu": "asl",
-    "as": "asm",
-    "asm": "asm",
-    "assamese": "asm",
-    "xingú asuriní": "asn",
-    "dano": "aso",
-    "algerian sign language": "asp",
-    "austrian sign language": "asq",
-    "asuri": "asr",
-    "ipulo": "ass",
-    "ast": "ast",
-    "asturian": "ast",
-    "tocantins asurini": "asu",
-    "asoa": "asv",
-    "australian aborigines sign language": "asw",
-    "muratayak": "asx",
-    "yaosakor asmat": "asy",
-    "pele-ata": "ata",
-    "zaiwa": "atb",
-    "atsahuaca": "atc",
-    "ata manobo": "atd",
-    "atemble": "ate",
-    "ivbie north-okpela-arhe": "atg",
-    "attié": "ati",
-    "atikamekw": "atj",
-    "mt. iraya agta": "atl",
-    "ashtiani": "atn",
-    "atong (cameroon)": "ato",
-    "pudtol atta": "atp",
-    "aralle-tabulahan": "atq",
-    "waimiri-atroari": "atr",
-    "gros ventre": "ats",
-    "pamplona atta": "att",
-    "reel": "atu",
-    "northern altai": "atv",
-    "atsugewi": "atw",
-    "arutani": "atx",
-    "aneityum": "aty",
-    "arta": "atz",
-    "asumboa": "aua",
-    "alugu": "aub",
-    "waorani": "auc",
-    "anuta": "aud",
-    "aguna": "aug",
-    "aushi": "auh",
-    "anuki": "aui",
-    "awjilah": "auj",
-    "heyo": "auk",
-    "aulua": "aul",
-    "asu (nigeria)": "aum",
-    "molmo one": "aun",
-    "auyokawa": "auo",
-    "makayam": "aup",
-    "anus": "auq",
-    "aruek": "aur",
-    "austral": "aut",
-    "auye": "auu",
-    "awyi": "auw",
-    "aurá": "aux",
-    "awiyaana": "auy",
-    "uzbeki arabic": "auz",
-    "av": "ava",
-    "ava": "ava",
-    "avaric": "ava",
-    "avau": "avb",
-    "alviri-vidari": "avd",
-    "ae": "ave",
-    "ave": "ave",
-    "avestan": "ave",
-    "avikam": "avi",
-    "kotava": "avk",
-    "eastern egyptian bedawi arabic": "avl",
-    "angkamuthi": "avm",
-    "avatime": "avn",
-    "agavotaguerra": "avo",
-    "aushiri": "avs",
-    "avokaya": "avu",
-    "avá-canoeiro": "avv",
-    "awa": "awa",
-    "awadhi": "awa",
-    "awa (papua new guinea)": "awb",
-    "cicipu": "awc",
-    "awetí": "awe",
-    "anguthimri": "awg",
-    "awbono": "awh",
-    "aekyom": "awi",
-    "awabakal": "awk",
-    "arawum": "awm",
-    "awngi": "awn",
-    "awak": "awo",
-    "awera": "awr",
-    "south awyu": "aws",
-    "araweté": "awt",
-    "central awyu": "awu",
-    "jair awyu": "awv",
-    "awun": "aww",
-    "awara": "awx",
-    "edera awyu": "awy",
-    "abipon": "axb",
-    "ayerrerenge": "axe",
-    "mato grosso arára": "axg",
-    "yaka (central african republic)": "axk",
-    "lower southern aranda": "axl",
-    "middle armenian": "axm",
-    "xârâgurè": "axx",
-    "awar": "aya",
-    "ayizo gbe": "ayb",
-    "southern aymara": "ayc",
-    "ayabadhu": "ayd",
-    "ayere": "aye",
-    "ginyanga": "ayg",
-    "hadrami arabic": "ayh",
-    "leyigha": "ayi",
-    "akuku": "ayk",
-    "libyan arabic": "ayl",
-    "ay": "aym",
-    "aym": "aym",
-    "aymara": "aym",
-    "sanaani arabic": "ayn",
-    "ayoreo": "ayo",
-    "north mesopotamian arabic": "ayp",
-    "ayi (papua new guinea)": "ayq",
-    "central aymara": "ayr",
-    "sorsogon ayta": "ays",
-    "magbukun ayta": "ayt",
-    "mai brat": "ayz",
-    "azha": "aza",
-    "south azerbaijani": "azb",
-    "eastern durango nahuatl": "azd",
-    "az": "aze",
-    "aze": "aze",
-    "azerbaijani": "aze",
-    "san pedro amuzgos amuzgo": "azg",
-    "north azerbaijani": "azj",
-    "ipalapa amuzgo": "azm",
-    "western durango nahuatl": "azn",
-    "awing": "azo",
-    "faire atta": "azt",
-    "highland puebla nahuatl": "azz",
-    "babatana": "baa",
-    "bainouk-gunyuño": "bab",
-    "badui": "bac",
-    "baré": "bae",
-    "nubaca": "baf",
-    "tuki": "bag",
-    "bahamas creole english": "bah",
-    "barakai": "baj",
-    "ba": "bak",
-    "bak": "bak",
-    "bashkir": "bak",
-    "bal": "bal",
-    "baluchi": "bal",
-    "bm": "bam",
-    "bam": "bam",
-    "bambara": "bam",
-    "ban": "ban",
-    "balinese": "ban",
-    "waimaha": "bao",
-    "bantawa": "bap",
-    "bavarian": "bar",
-    "bas": "bas",
-    "basa (cameroon)": "bas",
-    "bada (nigeria)": "bau",
-    "vengo": "bav",
-    "bambili-bambui": "baw",
-    "bamun": "bax",
-    "batuley": "bay",
-    "baatonum": "bba",
-    "barai": "bbb",
-    "batak toba": "bbc",
-    "bangba": "bbe",
-    "baibai": "bbf",
-    "barama": "bbg",
-    "bugan": "bbh",
-    "barombi": "bbi",
-    "ghomálá'": "bbj",
-    "babanki": "bbk",
-    "bats": "bbl",
-    "babango": "bbm",
-    "uneapa": "bbn",
-    "northern bobo madaré": "bbo",
-    "west central banda": "bbp",
-    "bamali": "bbq",
-    "girawa": "bbr",
-    "bakpinka": "bbs",
-    "mburku": "bbt",
-    "kulung (nigeria)": "bbu",
-    "karnai": "bbv",
-    "baba": "bbw",
-    "bubia": "bbx",
-    "befang": "bby",
-    "central bai": "bca",
-    "bainouk-samik": "bcb",
-    "southern balochi": "bcc",
-    "north babar": "bcd",
-    "bamenyam": "bce",
-    "bamu": "bcf",
-    "baga pokur": "bcg",
-    "bariai": "bch",
-    "baoulé": "bci",
-    "bardi": "bcj",
-    "bunuba": "bck",
-    "central bikol": "bcl",
-    "bannoni": "bcm",
-    "bali (nigeria)": "bcn",
-    "kaluli": "bco",
-    "bali (democratic republic of congo)": "bcp",
-    "bench": "bcq",
-    "babine": "bcr",
-    "kohumono": "bcs",
-    "bendi": "bct",
-    "awad bing": "bcu",
-    "shoo-minda-nye": "bcv",
-    "bana": "bcw",
-    "bacama": "bcy",
-    "bainouk-gunyaamolo": "bcz",
-    "bayot": "bda",
-    "basap": "bdb",
-    "emberá-baudó": "bdc",
-    "bunama": "bdd",
-    "bade": "bde",
-    "biage": "bdf",
-    "bonggi": "bdg",
-    "baka (south sudan)": "bdh",
-    "burun": "bdi",
-    "bai (south sudan)": "bdj",
-    "budukh": "bdk",
-    "indonesian bajau": "bdl",
-    "buduma": "bdm",
-    "baldemu": "bdn",
-    "morom": "bdo",
-    "bende": "bdp",
-    "bahnar": "bdq",
-    "west coast bajau": "bdr",
-    "burunge": "bds",
-    "bokoto": "bdt",
-    "oroko": "bdu",
-    "bodo parja": "bdv",
-    "baham": "bdw",
-    "budong-budong": "bdx",
-    "bandjalang": "bdy",
-    "badeshi": "bdz",
-    "beaver": "bea",
-    "bebele": "beb",
-    "iceve-maci": "bec",
-    "bedoanas": "bed",
-    "byangsi": "bee",
-    "benabena": "bef",
-    "belait": "beg",
-    "biali": "beh",
-    "bekati'": "bei",
-    "bej": "bej",
-    "beja": "bej",
-    "bebeli": "bek",
-    "be": "bel",
-    "bel": "bel",
-    "belarusian": "bel",
-    "bem": "bem",
-    "bemba (zambia)": "bem",
-    "bn": "ben",
-    "ben": "ben",
-    "bengali": "ben",
-    "beami": "beo",
-    "besoa": "bep",
-    "beembe": "beq",
-    "besme": "bes",
-    "guiberoua béte": "bet",
-    "blagar": "beu",
-    "daloa bété": "bev",
-    "betawi": "bew",
-    "jur modo": "bex",
-    "beli (papua new guinea)": "bey",
-    "bena (tanzania)": "bez",
-    "bari": "bfa",
-    "pauri bareli": "bfb",
-    "panyi bai": "bfc",
-    "bafut": "bfd",
-    "betaf": "bfe",
-    "bofi": "bff",
-    "busang kayan": "bfg",
-    "blafe": "bfh",
-    "british sign language": "bfi",
-    "bafanji": "bfj",
-    "ban khor sign language": "bfk",
-    "banda-ndélé": "bfl",
-    "mmen": "bfm",
-    "bunak": "bfn",
-    "malba birifor": "bfo",
-    "beba": "bfp",
-    "badaga": "bfq",
-    "bazigar": "bfr",
-    "southern bai": "bfs",
-    "balti": "bft",
-    "gahri": "bfu",
-    "bondo": "bfw",
-    "bantayanon": "bfx",
-    "bagheli": "bfy",
-    "mahasu pahari": "bfz",
-    "gwamhi-wuri": "bga",
-    "bobongko": "bgb",
-    "haryanvi": "bgc",
-    "rathwi bareli": "bgd",
-    "bauria": "bge",
-    "bangandu": "bgf",
-    "bugun": "bgg",
-    "giangan": "bgi",
-    "bangolan": "bgj",
-    "bo (laos)": "bgl",
-    "western balochi": "bgn",
-    "baga koga": "bgo",
-    "eastern balochi": "bgp",
-    "bagri": "bgq",
-    "bawm chin": "bgr",
-    "tagabawa": "bgs",
-    "bughotu": "bgt",
-    "mbongno": "bgu",
-    "warkay-bipim": "bgv",
-    "bhatri": "bgw",
-    "balkan gagauz turkish": "bgx",
-    "benggoi": "bgy",
-    "banggai": "bgz",
-    "bharia": "bha",
-    "bhili": "bhb",
-    "biga": "bhc",
-    "bhadrawahi": "bhd",
-    "bhaya": "bhe",
-    "odiai": "bhf",
-    "binandere": "bhg",
-    "bukharic": "bhh",
-    "bhilali": "bhi",
-    "bahing": "bhj",
-    "bimin": "bhl",
-    "bathari": "bhm",
-    "bohtan neo-aramaic": "bhn",
-    "bho": "bho",
-    "bhojpuri": "bho",
-    "bima": "bhp",
-    "tukang besi south": "bhq",
-    "bara malagasy": "bhr",
-    "buwal": "bhs",
-    "bhattiyali": "bht",
-    "bhunjia": "bhu",
-    "bahau": "bhv",
-    "biak": "bhw",
-    "bhalay": "bhx",
-    "bhele": "bhy",
-    "bada (indonesia)": "bhz",
-    "badimaya": "bia",
-    "bissa": "bib",
-    "bidiyo": "bid",
-    "bepour": "bie",
-    "biafada": "bif",
-    "biangai": "big",
-    "bik": "bik",
-    "bikol": "bik",
-    "bile": "bil",
-    "bimoba": "bim",
-    "bin": "bin",
-    "bini": "bin",
-    "bila": "bip",
-    "bipi": "biq",
-    "bisorio": "bir",
-    "bi": "bis",
-    "bis": "bis",
-    "bislama": "bis",
-    "berinomo": "bit",
-    "biete": "biu",
-    "southern birifor": "biv",
-    "kol (cameroon)": "biw",
-    "bijori": "bix",
-    "birhor": "biy",
-    "baloi": "biz",
-    "budza": "bja",
-    "banggarla": "bjb",
-    "bariji": "bjc",
-    "biao-jiao mien": "bje",
-    "barzani jewish neo-aramaic": "bjf",
-    "bidyogo": "bjg",
-    "bahinemo": "bjh",
-    "burji": "bji",
-    "kanauji": "bjj",
-    "barok": "bjk",
-    "bulu (papua new guinea)": "bjl",
-    "bajelani": "bjm",
-    "banjar": "bjn",
-    "mid-southern banda": "bjo",
-    "fanamaket": "bjp",
-    "binumarien": "bjr",
-    "bajan": "bjs",
-    "balanta-ganja": "bjt",
-    "busuu": "bju",
-    "bedjond": "bjv",
-    "bakwé": "bjw",
-    "banao itneg": "bjx",
-    "bayali": "bjy",
-    "baruga": "bjz",
-    "kyak": "bka",
-    "baka (cameroon)": "bkc",
-    "binukid": "bkd",
-    "beeke": "bkf",
-    "buraka": "bkg",
-    "bakoko": "bkh",
-    "baki": "bki",
-    "pande": "bkj",
-    "brokskat": "bkk",
-    "berik": "bkl",
-    "kom (cameroon)": "bkm",
-    "bukitan": "bkn",
-    "kwa'": "bko",
-    "boko (democratic republic of congo)": "bkp",
-    "bakairí": "bkq",
-    "bakumpai": "bkr",
-    "northern sorsoganon": "bks",
-    "boloki": "bkt",
-    "buhid": "bku",
-    "bekwarra": "bkv",
-    "bekwel": "bkw",
-    "baikeno": "bkx",
-    "bokyi": "bky",
-    "bungku": "bkz",
-    "bla": "bla",
-    "siksika": "bla",
-    "bilua": "blb",
-    "bella coola": "blc",
-    "bolango": "bld",
-    "balanta-kentohe": "ble",
-    "buol": "blf",
-    "kuwaa": "blh",
-    "bolia": "bli",
-    "bolongan": "blj",
-    "pa'o karen": "blk",
-    "biloxi": "bll",
-    "beli (south sudan)": "blm",
-    "southern catanduanes bikol": "bln",
-    "anii": "blo",
-    "blablanga": "blp",
-    "baluan-pam": "blq",
-    "blang": "blr",
-    "balaesang": "bls",
-    "tai dam": "blt",
-    "kibala": "blv",
-    "balangao": "blw",
-    "mag-indi ayta": "blx",
-    "notre": "bly",
-    "balantak": "blz",
-    "lame": "bma",
-    "bembe": "bmb",
-    "biem": "bmc",
-    "baga manduri": "bmd",
-    "limassa": "bme",
-    "bom-kim": "bmf",
-    "bamwe": "bmg",
-    "kein": "bmh",
-    "bagirmi": "bmi",
-    "bote-majhi": "bmj",
-    "ghayavi": "bmk",
-    "bomboli": "bml",
-    "northern betsimisaraka malagasy": "bmm",
-    "bina (papua new guinea)": "bmn",
-    "bambalang": "bmo",
-    "bulgebi": "bmp",
-    "bomu": "bmq",
-    "muinane": "bmr",
-    "bilma kanuri": "bms",
-    "biao mon": "bmt",
-    "somba-siawari": "bmu",
-    "bomwali": "bmw",
-    "baimak": "bmx",
-    "baramu": "bmz",
-    "bonerate": "bna",
-    "bookan": "bnb",
-    "bontok": "bnc",
-    "banda (indonesia)": "bnd",
-    "bintauna": "bne",
-    "masiwang": "bnf",
-    "benga": "bng",
-    "bangi": "bni",
-    "eastern tawbuid": "bnj",
-    "bierebo": "bnk",
-    "boon": "bnl",
-    "batanga": "bnm",
-    "bunun": "bnn",
-    "bantoanon": "bno",
-    "bola": "bnp",
-    "bantik": "bnq",
-    "butmas-tur": "bnr",
-    "bundeli": "bns",
-    "bentong": "bnu",
-    "bonerif": "bnv",
-    "bisis": "bnw",
-    "bangubangu": "bnx",
-    "bintulu": "bny",
-    "beezen": "bnz",
-    "bora": "boa",
-    "aweer": "bob",
-    "bo": "bod",
-    "tib": "bod",
-    "bod": "bod",
-    "tibetan": "bod",
-    "mundabli": "boe",
-    "bolon": "bof",
-    "bamako sign language": "bog",
-    "boma": "boh",
-    "barbareño": "boi",
-    "anjam": "boj",
-    "bonjo": "bok",
-    "bole": "bol",
-    "berom": "bom",
-    "bine": "bon",
-    "tiemacèwè bozo": "boo",
-    "bonkiman": "bop",
-    "bogaya": "boq",
-    "borôro": "bor",
-    "bs": "bos",
-    "bos": "bos",
-    "bosnian": "bos",
-    "bongo": "bot",
-    "bondei": "bou",
-    "tuwuli": "bov",
-    "rema": "bow",
-    "buamu": "box",
-    "bodo (central african republic)": "boy",
-    "tiéyaxo bozo": "boz",
-    "daakaka": "bpa",
-    "banda-banda": "bpd",
-    "bauni": "bpe",
-    "bonggo": "bpg",
-    "botlikh": "bph",
-    "bagupi": "bpi",
-    "binji": "bpj",
-    "orowe": "bpk",
-    "broome pearling lugger pidgin": "bpl",
-    "biyom": "bpm",
-    "dzao min": "bpn",
-    "anasi": "bpo",
-    "kaure": "bpp",
-    "banda malay": "bpq",
-    "koronadal blaan": "bpr",
-    "sarangani blaan": "bps",
-    "barrow point": "bpt",
-    "bongu": "bpu",
-    "bian marind": "bpv",
-    "bo (papua new guinea)": "bpw",
-    "palya bareli": "bpx",
-    "bishnupriya": "bpy",
-    "bilba": "bpz",
-    "tchumbuli": "bqa",
-    "bagusa": "bqb",
-    "boko (benin)": "bqc",
-    "bung": "bqd",
-    "baga kaloum": "bqf",
-    "bago-kusuntu": "bqg",
-    "baima": "bqh",
-    "bakhtiari": "bqi",
-    "bandial": "bqj",
-    "banda-mbrès": "bqk",
-    "bilakura": "bql",
-    "wumboko": "bqm",
-    "bulgarian sign language": "bqn",
-    "balo": "bqo",
-    "busa": "bqp",
-    "biritai": "bqq",
-    "burusu": "bqr",
-    "bosngun": "bqs",
-    "bamukumbit": "bqt",
-    "boguru": "bqu",
-    "koro wachi": "bqv",
-    "buru (nigeria)": "bqw",
-    "baangi": "bqx",
-    "bengkala sign language": "bqy",
-    "bakaka": "bqz",
-    "bra": "bra",
-    "braj": "bra",
-    "lave": "brb",
-    "berbice creole dutch": "brc",
-    "baraamu": "brd",
-    "br": "bre",
-    "bre": "bre",
-    "breton": "bre",
-    "bira": "brf",
-    "baure": "brg",
-    "brahui": "brh",
-    "mokpwe": "bri",
-    "bieria": "brj",
-    "birked": "brk",
-    "birwa": "brl",
-    "barambu": "brm",
-    "boruca": "brn",
-    "brokkat": "bro",
-    "barapasi": "brp",
-    "breri": "brq",
-    "birao": "brr",
-    "baras": "brs",
-    "bitare": "brt",
-    "eastern bru": "bru",
-    "western bru": "brv",
-    "bellari": "brw",
-    "bodo (india)": "brx",
-    "burui": "bry",
-    "bilbil": "brz",
-    "abinomn": "bsa",
-    "brunei bisaya": "bsb",
-    "bassari": "bsc",
-    "wushi": "bse",
-    "bauchi": "bsf",
-    "bashkardi": "bsg",
-    "kati": "bsh",
-    "bassossi": "bsi",
-    "bangwinji": "bsj",
-    "burushaski": "bsk",
-    "basa-gumna": "bsl",
-    "busami": "bsm",
-    "barasana-eduria": "bsn",
-    "buso": "bso",
-    "baga sitemu": "bsp",
-    "bassa": "bsq",
-    "bassa-kontagora": "bsr",
-    "akoose": "bss",
-    "basketo": "bst",
-    "bahonsuai": "bsu",
-    "baga sobané": "bsv",
-    "baiso": "bsw",
-    "yangkam": "bsx",
-    "sabah bisaya": "bsy",
-    "bata": "bta",
-    "bati (cameroon)": "btc",
-    "batak dairi": "btd",
-    "gamo-ningi": "bte",
-    "birgit": "btf",
-    "gagnoa bété": "btg",
-    "biatah bidayuh": "bth",
-    "burate": "bti",
-    "bacanese malay": "btj",
-    "batak mandailing": "btm",
-    "ratagnon": "btn",
-    "rinconada bikol": "bto",
-    "budibud": "btp",
-    "batek": "btq",
-    "baetora": "btr",
-    "batak simalungun": "bts",
-    "bete-bendi": "btt",
-    "batu": "btu",
-    "bateri": "btv",
-    "butuanon": "btw",
-    "batak karo": "btx",
-    "bobot": "bty",
-    "batak alas-kluet": "btz",
-    "bua": "bua",
-    "buriat": "bua",
-    "bushi": "buc",
-    "ntcham": "bud",
-    "beothuk": "bue",
-    "bushoong": "buf",
-    "bug": "bug",
-    "buginese": "bug",
-    "younuo bunu": "buh",
-    "bongili": "bui",
-    "basa-gurmana": "buj",
-    "bugawac": "buk",
-    "bg": "bul",
-    "bul": "bul",
-    "bulgarian": "bul",
-    "bulu (cameroon)": "bum",
-    "sherbro": "bun",
-    "terei": "buo",
-    "busoa": "bup",
-    "brem": "buq",
-    "bokobaru": "bus",
-    "bungain": "but",
-    "budu": "buu",
-    "bubi": "buw",
-    "boghom": "bux",
-    "bullom so": "buy",
-    "bukwen": "buz",
-    "barein": "bva",
-    "bube": "bvb",
-    "baelelea": "bvc",
-    "baeggu": "bvd",
-    "berau malay": "bve",
-    "boor": "bvf",
-    "bonkeng": "bvg",
-    "bure": "bvh",
-    "belanda viri": "bvi",
-    "baan": "bvj",
-    "bukat": "bvk",
-    "bolivian sign language": "bvl",
-    "bamunka": "bvm",
-    "buna": "bvn",
-    "bolgo": "bvo",
-    "bumang": "bvp",
-    "birri": "bvq",
-    "burarra": "bvr",
-    "bati (indonesia)": "bvt",
-    "bukit malay": "bvu",
-    "baniva": "bvv",
-    "boga": "bvw",
-    "dibole": "bvx",
-    "baybayanon": "bvy",
-    "bauzi": "bvz",
-    "bwatoo": "bwa",
-    "namosi-naitasiri-serua": "bwb",
-    "bwile": "bwc",
-    "bwaidoka": "bwd",
-    "bwe karen": "bwe",
-    "boselewa": "bwf",
-    "barwe": "bwg",
-    "bishuo": "bwh",
-    "baniwa": "bwi",
-    "láá láá bwamu": "bwj",
-    "bauwaki": "bwk",
-    "bwela": "bwl",
-    "biwat": "bwm",
-    "wunai bunu": "bwn",
-    "boro (ethiopia)": "bwo",
-    "mandobo bawah": "bwp",
-    "southern bobo madaré": "bwq",
-    "bura-pabir": "bwr",
-    "bomboma": "bws",
-    "bafaw-balong": "bwt",
-    "buli (ghana)": "bwu",
-    "bu-nao bunu": "bwx",
-    "cwi bwamu": "bwy",
-    "bwisi": "bwz",
-    "tairaha": "bxa",
-    "belanda bor": "bxb",
-    "molengue": "bxc",
-    "pela": "bxd",
-    "birale": "bxe",
-    "bilur": "bxf",
-    "bangala": "bxg",
-    "buhutu": "bxh",
-    "pirlatapa": "bxi",
-    "bayungu": "bxj",
-    "bukusu": "bxk",
-    "jalkunan": "bxl",
-    "mongolia buriat": "bxm",
-    "burduna": "bxn",
-    "barikanchi": "bxo",
-    "bebil": "bxp",
-    "beele": "bxq",
-    "russia buriat": "bxr",
-    "busam": "bxs",
-    "china buriat": "bxu",
-    "berakou": "bxv",
-    "bankagooma": "bxw",
-    "binahari": "bxz",
-    "batak": "bya",
-    "bikya": "byb",
-    "ubaghara": "byc",
-    "benyadu'": "byd",
-    "pouye": "bye",
-    "bete": "byf",
-    "baygo": "byg",
-    "bhujel": "byh",
-    "buyu": "byi",
-    "bina (nigeria)": "byj",
-    "biao": "byk",
-    "bayono": "byl",
-    "bidjara": "bym",
-    "byn": "byn",
-    "bilin": "byn",
-    "biyo": "byo",
-    "bumaji": "byp",
-    "basay": "byq",
-    "baruya": "byr",
-    "burak": "bys",
-    "berti": "byt",
-    "medumba": "byv",
-    "belhariya": "byw",
-    "qaqet": "byx",
-    "banaro": "byz",
-    "bandi": "bza",
-    "andio": "bzb",
-    "southern betsimisaraka malagasy": "bzc",
-    "bribri": "bzd",
-    "jenaama bozo": "bze",
-    "boikin": "bzf",
-    "babuza": "bzg",
-    "mapos buang": "bzh",
-    "bisu": "bzi",
-    "belize kriol english": "bzj",
-    "nicaragua creole english": "bzk",
-    "boano (sulawesi)": "bzl",
-    "bolondo": "bzm",
-    "boano (maluku)": "bzn",
-    "bozaba": "bzo",
-    "kemberano": "bzp",
-    "buli (indonesia)": "bzq",
-    "biri": "bzr",
-    "brazilian sign language": "bzs",
-    "brithenig": "bzt",
-    "burmeso": "bzu",
-    "naami": "bzv",
-    "basa (nigeria)": "bzw",
-    "kɛlɛngaxo bozo": "bzx",
-    "obanliku": "bzy",
-    "evant": "bzz",
-    "chortí": "caa",
-    "garifuna": "cab",
-    "chuj": "cac",
-    "cad": "cad",
-    "caddo": "cad",
-    "lehar": "cae",
-    "southern carrier": "caf",
-    "nivaclé": "cag",
-    "cahuarano": "cah",
-    "chané": "caj",
-    "kaqchikel": "cak",
-    "carolinian": "cal",
-    "cemuhî": "cam",
-    "chambri": "can",
-    "chácobo": "cao",
-    "chipaya": "cap",
-    "car nicobarese": "caq",
-    "car": "car",
-    "galibi carib": "car",
-    "tsimané": "cas",
-    "ca": "cat",
-    "cat": "cat",
-    "catalan": "cat",
-    "cavineña": "cav",
-    "callawalla": "caw",
-    "chiquitano": "cax",
-    "cayuga": "cay",
-    "canichana": "caz",
-    "cabiyarí": "cbb",
-    "carapana": "cbc",
-    "carijona": "cbd",
-    "chimila": "cbg",
-    "chachi": "cbi",
-    "ede cabe": "cbj",
-    "chavacano": "cbk",
-    "bualkhaw chin": "cbl",
-    "nyahkur": "cbn",
-    "izora": "cbo",
-    "tsucuba": "cbq",
-    "cashibo-cacataibo": "cbr",
-    "cashinahua": "cbs",
-    "chayahuita": "cbt",
-    "candoshi-shapra": "cbu",
-    "cacua": "cbv",
-    "kinabalian": "cbw",
-    "carabayo": "cby",
-    "chamicuro": "ccc",
-    "cafundo creole": "ccd",
-    "chopi": "cce",
-    "samba daka": "ccg",
-    "atsam": "cch",
-    "kasanga": "ccj",
-    "cutchi-swahili": "ccl",
-    "malaccan creole malay": "ccm",
-    "comaltepec chinantec": "cco",
-    "chakma": "ccp",
-    "cacaopera": "ccr",
-    "choni": "cda",
-    "chenchu": "cde",
-    "chiru": "cdf",
-    "chambeali": "cdh",
-    "chodri": "cdi",
-    "churahi": "cdj",
-    "chepang": "cdm",
-    "chaudangsi": "cdn",
-    "min dong chinese": "cdo",
-    "cinda-regi-tiyal": "cdr",
-    "chadian sign language": "cds",
-    "chadong": "cdy",
-    "koda": "cdz",
-    "lower chehalis": "cea",
-    "ceb": "ceb",
-    "cebuano": "ceb",
-    "chamacoco": "ceg",
-    "eastern khumi chin": "cek",
-    "cs": "ces",
-    "cze": "ces",
-    "ces": "ces",
-    "czech": "ces",
-    "centúúm": "cet",
-    "ekai chin": "cey",
-    "dijim-bwilim": "cfa",
-    "cara": "cfd",
-    "como karim": "cfg",
-    "falam chin": "cfm",
-    "changriwa": "cga",
-    "kagayanen": "cgc",
-    "chiga": "cgg",
-    "chocangacakha": "cgk",
-    "ch": "cha",
-    "cha": "cha",
-    "chamorro": "cha",
-    "chb": "chb",
-    "chibcha": "chb",
-    "catawba": "chc",
-    "highland oaxaca chontal": "chd",
-    "ce": "che",
-    "che": "che",
-    "chechen": "che",
-    "tabasco chontal": "chf",
-    "chg": "chg",
-    "chagatai": "chg",
-    "chinook": "chh",
-    "ojitlán chinantec": "chj",
-    "chk": "chk",
-    "chuukese": "chk",
-    "cahuilla": "chl",
-    "chm": "chm",
-    "mari (russia)": "chm",
-    "chn": "chn",
-    "chinook jargon": "chn",
-    "cho": "cho",
-    "choctaw": "cho",
-    "chp": "chp",
-    "chipewyan": "chp",
-    "quiotepec chinantec": "chq",
-    "chr": "chr",
-    "cherokee": "chr",
-    "cholón": "cht",
-    "cu": "chu",
-    "chu": "chu",
-    "church slavic": "chu",
-    "cv": "chv",
-    "chv": "chv",
-    "chuvash": "chv",
-    "chuwabu": "chw",
-    "chantyal": "chx",
-    "chy": "chy",
-    "cheyenne": "chy",
-    "ozumacín chinantec": "chz",
-    "cia-cia": "cia",
-    "ci gbe": "cib",
-    "chickasaw": "cic",
-    "chimariko": "cid",
-    "cineni": "cie",
-    "chinali": "cih",
-    "chitkuli kinnauri": "cik",
-    "cimbrian": "cim",
-    "cinta larga": "cin",
-    "chiapanec": "cip",
-    "tiri": "cir",
-    "chippewa": "ciw",
-    "chaima": "ciy",
-    "western cham": "cja",
-    "chru": "cje",
-    "upper chehalis": "cjh",
-    "chamalal": "cji",
-    "chokwe": "cjk",
-    "eastern cham": "cjm",
-    "chenapian": "cjn",
-    "ashéninka pajonal": "cjo",
-    "cabécar": "cjp",
-    "shor": "cjs",
-    "chuave": "cjv",
-    "jinyu chinese": "cjy",
-    "central kurdish": "ckb",
-    "chak": "ckh",
-    "cibak": "ckl",
-    "chakavian": "ckm",
-    "kaang chin": "ckn",
-    "anufo": "cko",
-    "kajakse": "ckq",
-    "kairak": "ckr",
-    "tayo": "cks",
-    "chukot": "ckt",
-    "koasati": "cku",
-    "kavalan": "ckv",
-    "caka": "ckx",
-    "cakfem-mushere": "cky",
-    "cakchiquel-quiché mixed language": "ckz",
-    "chilcotin": "clc",
-    "chaldean neo-aramaic": "cld",
-    "lealao chinantec": "cle",
-    "chilisso": "clh",
-    "chakali": "cli",
-    "laitu chin": "clj",
-    "idu-mishmi": "clk",
-    "chala": "cll",
-    "clallam": "clm",
-    "lowland oaxaca chontal": "clo",
-    "lautu chin": "clt",
-    "caluyanun": "clu",
-    "chulym": "clw",
-    "eastern highland chatino": "cly",
-    "cerma": "cme",
-    "classical mongolian": "cmg",
-    "emberá-chamí": "cmi",
-    "campalagian": "cml",
-    "michigamea": "cmm",
-    "mandarin chinese": "cmn",
-    "central mnong": "cmo",
-    "mro-khimi chin": "cmr",
-    "messapic": "cms",
-    "camtho": "cmt",
-    "changthang": "cna",
-    "chinbon chin": "cnb",
-    "côông": "cnc",
-    "northern qiang": "cng",
-    "hakha chin": "cnh",
-    "asháninka": "cni",
-    "khumi chin": "cnk",
-    "lalana chinantec": "cnl",
-    "northern ping chinese": "cnp",
-    "cnr": "cnr",
-    "montenegrin": "cnr",
-    "central asmat": "cns",
-    "tepetotutla chinantec": "cnt",
-    "chenoua": "cnu",
-    "ngawn chin": "cnw",
-    "middle cornish": "cnx",
-    "cocos islands malay": "coa",
-    "chicomuceltec": "cob",
-    "cocopa": "coc",
-    "cocama-cocamilla": "cod",
-    "koreguaje": "coe",
-    "colorado": "cof",
-    "chong": "cog",
-    "chonyi-dzihana-kauma": "coh",
-    "cochimi": "coj",
-    "santa teresa cora": "cok",
-    "columbia-wenatchi": "col",
-    "comanche": "com",
-    "cofán": "con",
-    "comox": "coo",
-    "cop": "cop",
-    "coptic": "cop",
-    "coquille": "coq",
-    "kw": "cor",
-    "cor": "cor",
-    "cornish": "cor",
-    "co": "cos",
-    "cos": "cos",
-    "corsican": "cos",
-    "caquinte": "cot",
-    "wamey": "cou",
-    "cao miao": "cov",
-    "cowlitz": "cow",
-    "nanti": "cox",
-    "chochotec": "coz",
-    "palantla chinantec": "cpa",
-    "ucayali-yurúa ashéninka": "cpb",
-    "ajyíninka apurucayali": "cpc",
-    "cappadocian greek": "cpg",
-    "chinese pidgin english": "cpi",
-    "cherepon": "cpn",
-    "kpeego": "cpo",
-    "capiznon": "cps",
-    "pichis ashéninka": "cpu",
-    "pu-xian chinese": "cpx",
-    "south ucayali ashéninka": "cpy",
-    "chuanqiandian cluster miao": "cqd",
-    "chara": "cra",
-    "island carib": "crb",
-    "lonwolwol": "crc",
-    "coeur d'alene": "crd",
-    "cr": "cre",
-    "cre": "cre",
-    "cree": "cre",
-    "caramanta": "crf",
-    "michif": "crg",
-    "crh": "crh",
-    "crimean tatar": "crh",
-    "sãotomense": "cri",
-    "southern east cree": "crj",
-    "plains cree": "crk",
-    "northern east cree": "crl",
-    "moose cree": "crm",
-    "el nayar cora": "crn",
-    "crow": "cro",
-    "iyo'wujwa chorote": "crq",
-    "carolina algonquian": "crr",
-    "seselwa creole french": "crs",
-    "iyojwa'ja chorote": "crt",
-    "chaura": "crv",
-    "chrau": "crw",
-    "carrier": "crx",
-    "cori": "cry",
-    "cruzeño": "crz",
-    "chiltepec chinantec": "csa",
-    "csb": "csb",
-    "kashubian": "csb",
-    "catalan sign language": "csc",
-    "chiangmai sign language": "csd",
-    "czech sign language": "cse",
-    "cuba sign language": "csf",
-    "chilean sign language": "csg",
-    "asho chin": "csh",
-    "coast miwok": "csi",
-    "songlai chin": "csj",
-    "jola-kasa": "csk",
-    "chinese sign language": "csl",
-    "central sierra miwok": "csm",
-    "colombian sign language": "csn",
-    "sochiapam chinantec": "cso",
-    "southern ping chinese": "csp",
-    "croatia sign language": "csq",
-    "costa rican sign language": "csr",
-    "southern ohlone": "css",
-    "northern ohlone": "cst",
-    "sumtu chin": "csv",
-    "swampy cree": "csw",
-    "cambodian sign language": "csx",
-    "siyin chin": "csy",
-    "coos": "csz",
-    "tataltepec chatino": "cta",
-    "chetco": "ctc",
-    "tedim chin": "ctd",
-    "tepinapa chinantec": "cte",
-    "chittagonian": "ctg",
-    "thaiphum chin": "cth",
-    "tlacoatzintepec chinantec": "ctl",
-    "chitimacha": "ctm",
-    "chhintange": "ctn",
-    "emberá-catío": "cto",
-    "western highland chatino": "ctp",
-    "northern catanduanes bikol": "cts",
-    "wayanad chetti": "ctt",
-    "chol": "ctu",
-    "moundadan chetty": "cty",
-    "zacatepec chatino": "ctz",
-    "cubeo": "cub",
-    "usila chinantec": "cuc",
-    "chungmboko": "cug",
-    "chuka": "cuh",
-    "cuiba": "cui",
-    "mashco piro": "cuj",
-    "san blas kuna": "cuk",
-    "culina": "cul",
-    "cumanagoto": "cuo",
-    "cupeño": "cup",
-    "chhulung": "cur",
-    "teutila cuicatec": "cut",
-    "tai ya": "cuu",
-    "cuvok": "cuv",
-    "chukwa": "cuw",
-    "tepeuxila cuicatec": "cux",
-    "cuitlatec": "cuy",
-    "chug": "cvg",
-    "valle nacional chinantec": "cvn",
-    "kabwa": "cwa",
-    "maindo": "cwb",
-    "woods cree": "cwd",
-    "kwere": "cwe",
-    "chewong": "cwg",
-    "kuwaataay": "cwt",
-    "nopala chatino": "cya",
-    "cayubaba": "cyb",
-    "cy": "cym",
-    "wel": "cym",
-    "cym": "cym",
-    "welsh": "cym",
-    "cuyonon": "cyo",
-    "huizhou chinese": "czh",
-    "knaanic": "czk",
-    "zenzontepec chatino": "czn",
-    "min zhong chinese": "czo",
-    "zotung chin": "czt",
-    "dangaléat": "daa",
-    "dambi": "dac",
-    "marik": "dad",
-    "duupa": "dae",
-    "dagbani": "dag",
-    "gwahatike": "dah",
-    "dar fur daju": "daj",
-    "dak": "dak",
-    "dakota": "dak",
-    "dahalo": "dal",
-    "damakawa": "dam",
-    "da": "dan",
-    "dan": "dan",
-    "danish": "dan",
-    "daai chin": "dao",
-    "dandami maria": "daq",
-    "dar": "dar",
-    "dargwa": "dar",
-    "daho-doo": "das",
-    "dar sila daju": "dau",
-    "taita": "dav",
-    "davawenyo": "daw",
-    "dayi": "dax",
-    "bangime": "dba",
-    "deno": "dbb",
-    "dadiya": "dbd",
-    "dabe": "dbe",
-    "edopi": "dbf",
-    "dogul dom dogon": "dbg",
-    "doka": "dbi",
-    "ida'an": "dbj",
-    "dyirbal": "dbl",
-    "duguri": "dbm",
-    "duriankere": "dbn",
-    "dulbu": "dbo",
-    "duwai": "dbp",
-    "daba": "dbq",
-    "dabarre": "dbr",
-    "ben tey dogon": "dbt",
-    "bondum dom dogon": "dbu",
-    "dungu": "dbv",
-    "bankan tey dogon": "dbw",
-    "dibiyaso": "dby",
-    "deccan": "dcc",
-    "negerhollands": "dcr",
-    "dadi dadi": "dda",
-    "dongotono": "ddd",
-    "doondo": "dde",
-    "fataluku": "ddg",
-    "west goodenough": "ddi",
-    "jaru": "ddj",
-    "dendi (benin)": "ddn",
-    "dido": "ddo",
-    "dhudhuroa": "ddr",
-    "donno so dogon": "dds",
-    "dawera-daweloor": "ddw",
-    "dagik": "dec",
-    "dedua": "ded",
-    "dewoin": "dee",
-    "dezfuli": "def",
-    "degema": "deg",
-    "dehwari": "deh",
-    "demisa": "dei",
-    "del": "del",
-    "delaware": "del",
-    "den": "den",
-    "slave (athapascan)": "den",
-    "pidgin delaware": "dep",
-    "dendi (central african republic)": "deq",
-    "deori": "der",
-    "desano": "des",
-    "de": "deu",
-    "ger": "deu",
-    "deu": "deu",
-    "german": "deu",
-    "domung": "dev",
-    "dengese": "dez",
-    "southern dagaare": "dga",
-    "bunoge dogon": "dgb",
-    "casiguran dumagat agta": "dgc",
-    "dagaari dioula": "dgd",
-    "degenan": "dge",
-    "doga": "dgg",
-    "dghwede": "dgh",
-    "northern dagara": "dgi",
-    "dagba": "dgk",
-    "andaandi": "dgl",
-    "dagoman": "dgn",
-    "dogri (individual language)": "dgo",
-    "dgr": "dgr",
-    "dogrib": "dgr",
-    "dogoso": "dgs",
-    "ndra'ngith": "dgt",
-    "daungwurrung": "dgw",
-    "doghoro": "dgx",
-    "daga": "dgz",
-    "dhundari": "dhd",
-    "dhangu-djangu": "dhg",
-    "dhimal": "dhi",
-    "dhalandji": "dhl",
-    "zemba": "dhm",
-    "dhanki": "dhn",
-    "dhodia": "dho",
-    "dhargari": "dhr",
-    "dhaiso": "dhs",
-    "dhurga": "dhu",
-    "dehu": "dhv",
-    "dhanwar (nepal)": "dhw",
-    "dhungaloo": "dhx",
-    "south central dinka": "dib",
-    "lakota dida": "dic",
-    "didinga": "did",
-    "dieri": "dif",
-    "digo": "dig",
-    "kumiai": "dih",
-    "dimbong": "dii",
-    "southwestern dinka": "dik",
-    "dilling": "dil",
-    "dime": "dim",
-    "din": "din",
-    "dinka": "din",
-    "dibo": "dio",
-    "northeastern dinka": "dip",
-    "dimli (individual language)": "diq",
-    "dirim": "dir",
-    "dimasa": "dis",
-    "diriku": "diu",
-    "dv": "div",
-    "div": "div",
-    "dhivehi": "div",
-    "northwestern dinka": "diw",
-    "dixon reef": "dix",
-    "diuwe": "diy",
-    "ding": "diz",
-    "djadjawurrung": "dja",
-    "djinba": "djb",
-    "dar daju daju": "djc",
-    "djamindjung": "djd",
-    "zarma": "dje",
-    "djangun": "djf",
-    "djinang": "dji",
-    "djeebbana": "djj",
-    "eastern maroon creole": "djk",
-    "jamsay dogon": "djm",
-    "jawoyn": "djn",
-    "jangkang": "djo",
-    "djambarrpuyngu": "djr",
-    "kapriman": "dju",
-    "djawi": "djw",
-    "dakpakha": "dka",
-    "kadung": "dkg",
-    "dakka": "dkk",
-    "kuijau": "dkr",
-    "southeastern dinka": "dks",
-    "mazagway": "dkx",
-    "dolgan": "dlg",
-    "dahalik": "dlk",
-    "dalmatian": "dlm",
-    "darlong": "dln",
-    "duma": "dma",
-    "mombo dogon": "dmb",
-    "gavak": "dmc",
-    "madhi madhi": "dmd",
-    "dugwor": "dme",
-    "medefaidrin": "dmf",
-    "upper kinabatangan": "dmg",
-    "domaaki": "dmk",
-    "dameli": "dml",
-    "dama": "dmm",
-    "kemedzung": "dmo",
-    "east damar": "dmr",
-    "dampelas": "dms",
-    "dubu": "dmu",
-    "dumpas": "dmv",
-    "mudburra": "dmw",
-    "dema": "dmx",
-    "demta": "dmy",
-    "upper grand valley dani": "dna",
-    "daonda": "dnd",
-    "ndendeule": "dne",
-    "dungan": "dng",
-    "lower grand valley dani": "dni",
-    "dengka": "dnk",
-    "dzùùngoo": "dnn",
-    "ndrulo": "dno",
-    "danaru": "dnr",
-    "mid grand valley dani": "dnt",
-    "danau": "dnu",
-    "danu": "dnv",
-    "western dani": "dnw",
-    "dení": "dny",
-    "dobu": "dob",
-    "northern dong": "doc",
-    "domu": "dof",
-    "dong": "doh",
-    "doi": "doi",
-    "dogri (macrolanguage)": "doi",
-    "dondo": "dok",
-    "doso": "dol",
-    "toura (papua new guinea)": "don",
-    "dongo": "doo",
-    "lukpa": "dop",
-    "dominican sign language": "doq",
-    "dori'o": "dor",
-    "dogosé": "dos",
-    "dass": "dot",
-    "dombe": "dov",
-    "doyayo": "dow",
-    "bussa": "dox",
-    "dompo": "doy",
-    "dorze": "doz",
-    "papar": "dpp",
-    "dair": "drb",
-    "minderico": "drc",
-    "darmiya": "drd",
-    "dolpo": "dre",
-    "rungus": "drg",
-    "c'lela": "dri",
-    "paakantyi": "drl",
-    "west damar": "drn",
-    "daro-matu melanau": "dro",
-    "dura": "drq",
-    "gedeo": "drs",
-    "drents": "drt",
-    "rukai": "dru",
-    "darai": "dry",
-    "dsb": "dsb",
-    "lower sorbian": "dsb",
-    "dutch sign language": "dse",
-    "daasanach": "dsh",
-    "disa": "dsi",
-    "danish sign language": "dsl",
-    "dusner": "dsn",
-    "desiya": "dso",
-    "tadaksahak": "dsq",
-    "daur": "dta",
-    "labuk-kinabatangan kadazan": "dtb",
-    "ditidaht": "dtd",
-    "adithinngithigh": "dth",
-    "ana tinga dogon": "dti",
-    "tene kan dogon": "dtk",
-    "tomo kan dogon": "dtm",
-    "daatsʼíin": "dtn",
-    "tommo so dogon": "dto",
-    "kadazan dusun": "dtp",
-    "lotud": "dtr",
-    "toro so dogon": "dts",
-    "toro tegu dogon": "dtt",
-    "tebul ure dogon": "dtu",
-    "dotyali": "dty",
-    "dua": "dua",
-    "duala": "dua",
-    "dubli": "dub",
-    "duna": "duc",
-    "umiray dumaget agta": "due",
-    "dumbea": "duf",
-    "duruma": "dug",
-    "dungra bhil": "duh",
-    "dumun": "dui",
-    "uyajitaya": "duk",
-    "alabat island agta": "dul",
-    "dum": "dum",
-    "middle dutch (ca. 1050-1350)": "dum",
-    "dusun deyah": "dun",
-    "dupaninan agta": "duo",
-    "duano": "dup",
-    "dusun malang": "duq",
-    "dumi": "dus",
-    "drung": "duu",
-    "duvle": "duv",
-    "dusun witu": "duw",
-    "duungooma": "dux",
-    "dicamay agta": "duy",
-    "duli-gey": "duz",
-    "duau": "dva",
-    "diri": "dwa",
-    "dawik kui": "dwk",
-    "dawro": "dwr",
-    "dutton world speedwords": "dws",
-    "dhuwal": "dwu",
-    "dawawa": "dww",
-    "dhuwaya": "dwy",
-    "dewas rai": "dwz",
-    "dyan": "dya",
-    "dyaberdyaber": "dyb",
-    "dyugun": "dyd",
-    "villa viciosa agta": "dyg",
-    "djimini senoufo": "dyi",
-    "yanda dom dogon": "dym",
-    "dyangadi": "dyn",
-    "jola-fonyi": "dyo",
-    "dyu": "dyu",
-    "dyula": "dyu",
-    "djabugay": "dyy",
-    "tunzu": "dza",
-    "djiwarli": "dze",
-    "dazaga": "dzg",
-    "dzalakha": "dzl",
-    "dzando": "dzn",
-    "dz": "dzo",
-    "dzo": "dzo",
-    "dzongkha": "dzo",
-    "karenggapa": "eaa",
-    "beginci": "ebc",
-    "ebughu": "ebg",
-    "eastern bontok": "ebk",
-    "teke-ebo": "ebo",
-    "ebrié": "ebr",
-    "embu": "ebu",
-    "eteocretan": "ecr",
-    "ecuadorian sign language": "ecs",
-    "eteocypriot": "ecy",
-    "efai": "efa",
-    "efi": "efi",
-    "efik": "efi",
-    "emilian": "egl",
-    "eggon": "ego",
-    "egy": "egy",
-    "egyptian (ancient)": "egy",
-    "miyakubo sign language": "ehs",
-    "ehueun": "ehu",
-    "eipomek": "eip",
-    "eitiep": "eit",
-    "askopan": "eiv",
-    "ejamat": "eja",
-    "eka": "eka",
-    "ekajuk": "eka",
-    "ekit": "eke",
-    "ekari": "ekg",
-    "standard estonian": "ekk",
-    "kol (bangladesh)": "ekl",
-    "elip": "ekm",
-    "koti": "eko",
-    "ekpeye": "ekp",
-    "yace": "ekr",
-    "eastern kayah": "eky",
-    "elepi": "ele",
-    "el hugeirat": "elh",
-    "nding": "eli",
-    "elkei": "elk",
-    "el": "ell",
-    "gre": "ell",
-    "ell": "ell",
-    "modern greek (1453-)": "ell",
-    "eleme": "elm",
-    "el molo": "elo",
-    "elx": "elx",
-    "elamite": "elx",
-    "emai-iuleha-ora": "ema",
-    "embaloh": "emb",
-    "emerillon": "eme",
-    "eastern meohang": "emg",
-    "mussau-emira": "emi",
-    "eastern maninkakan": "emk",
-    "mamulique": "emm",
-    "eman": "emn",
-    "northern emberá": "emp",
-    "eastern minyag": "emq",
-    "pacific gulf yupik": "ems",
-    "eastern muria": "emu",
-    "emplawas": "emw",
-    "erromintxela": "emx",
-    "epigraphic mayan": "emy",
-    "mbessa": "emz",
-    "apali": "ena",
-    "markweeta": "enb",
-    "ende": "end",
-    "forest enets": "enf",
-    "en": "eng",
-    "eng": "eng",
-    "english": "eng",
-    "tundra enets": "enh",
-    "enlhet": "enl",
-    "enm": "enm",
-    "middle english (1100-1500)": "enm",
-    "engenni": "enn",
-    "enggano": "eno",
-    "enga": "enq",
-    "emumu": "enr",
-    "enwan (edu state)": "env",
-    "enwan (akwa ibom state)": "enw",
-    "enxet": "enx",
-    "beti (côte d'ivoire)": "eot",
-    "epie": "epi",
-    "eo": "epo",
-    "epo": "epo",
-    "esperanto": "epo",
-    "eravallan": "era",
-    "eruwa": "erh",
-    "ogea": "eri",
-    "south efate": "erk",
-    "horpa": "ero",
-    "erre": "err",
-    "ersu": "ers",
-    "eritai": "ert",
-    "erokwanas": "erw",
-    "ese ejja": "ese",
-    "aheri gondi": "esg",
-    "eshtehardi": "esh",
-    "north alaskan inupiatun": "esi",
-    "northwest alaska inupiatun": "esk",
-    "egypt sign language": "esl",
-    "esuma": "esm",
-    "salvadoran sign language": "esn",
-    "estonian sign language": "eso",
-    "esselen": "esq",
-    "central siberian yupik": "ess",
-    "et": "est",
-    "est": "est",
-    "estonian": "est",
-    "central yupik": "esu",
-    "eskayan": "esy",
-    "etebi": "etb",
-    "etchemin": "etc",
-    "ethiopian sign language": "eth",
-    "eton (vanuatu)": "etn",
-    "eton (cameroon)": "eto",
-    "edolo": "etr",
-    "yekhee": "ets",
-    "etruscan": "ett",
-    "ejagham": "etu",
-    "eten": "etx",
-    "semimi": "etz",
-    "eu": "eus",
-    "baq": "eus",
-    "eus": "eus",
-    "basque": "eus",
-    "even": "eve",
-    "uvbie": "evh",
-    "evenki": "evn",
-    "ee": "ewe",
-    "ewe": "ewe",
-    "ewo": "ewo",
-    "ewondo": "ewo",
-    "extremaduran": "ext",
-    "eyak": "eya",
-    "keiyo": "eyo",
-    "ezaa": "eza",
-    "uzekwe": "eze",
-    "fasu": "faa",
-    "fa d'ambu": "fab",
-    "wagi": "fad",
-    "fagani": "faf",
-    "finongan": "fag",
-    "baissa fali": "fah",
-    "faiwol": "fai",
-    "faita": "faj",
-    "fang (cameroon)": "fak",
-    "south fali": "fal",
-    "fan": "fan",
-    "fang (equatorial guinea)": "fan",
-    "fo": "fao",
-    "fao": "fao",
-    "faroese": "fao",
-    "paloor": "fap",
-    "fataleka": "far",
-    "fa": "fas",
-    "per": "fas",
-    "fas": "fas",
-    "persian": "fas",
-    "fat": "fat",
-    "fanti": "fat",
-    "fayu": "fau",
-    "fala": "fax",
-    "southwestern fars": "fay",
-    "northwestern fars": "faz",
-    "west albay bikol": "fbl",
-    "quebec sign language": "fcs",
-    "feroge": "fer",
-    "foia foia": "ffi",
-    "maasina fulfulde": "ffm",
-    "fongoro": "fgr",
-    "nobiin": "fia",
-    "fyer": "fie",
-    "faifi": "fif",
-    "fj": "fij",
-    "fij": "fij",
-    "fijian": "fij",
-    "fil": "fil",
-    "filipino": "fil",
-    "fi": "fin",
-    "fin": "fin",
-    "finnish": "fin",
-    "fipa": "fip",
-    "firan": "fir",
-    "tornedalen finnish": "fit",
-    "fiwaga": "fiw",
-    "kirya-konzəl": "fkk",
-    "kven finnish": "fkv",
-    "kalispel-pend d'oreille": "fla",
-    "foau": "flh",
-    "fali": "fli",
-    "north fali": "fll",
-    "flinders island": "fln",
-    "fuliiru": "flr",
-    "flaaitaal": "fly",
-    "fe'fe'": "fmp",
-    "far western muria": "fmu",
-    "fanbak": "fnb",
-    "fanagalo": "fng",
-    "fania": "fni",
-    "foodo": "fod",
-    "foma": "fom",
-    "fon": "fon",
-    "fore": "for",
-    "siraya": "fos",
-    "fernando po creole english": "fpe",
-    "fr": "fra",
-    "fre": "fra",
-    "fra": "fra",
-    "french": "fra",
-    "cajun french": "frc",
-    "fordata": "frd",
-    "frankish": "frk",
-    "frm": "frm",
-    "middle french (ca. 1400-1600)": "frm",
-    "fro": "fro",
-    "old french (842-ca. 1400)": "fro",
-    "arpitan": "frp",
-    "forak": "frq",
-    "frr": "frr",
-    "northern frisian": "frr",
-    "frs": "frs",
-    "eastern frisian": "frs",
-    "fortsenal": "frt",
-    "fy": "fry",
-    "fry": "fry",
-    "western frisian": "fry",
-    "finnish sign language": "fse",
-    "french sign language": "fsl",
-    "finland-swedish sign language": "fss",
-    "adamawa fulfulde": "fub",
-    "pulaar": "fuc",
-    "east futuna": "fud",
-    "borgu fulfulde": "fue",
-    "pular": "fuf",
-    "western niger fulfulde": "fuh",
-    "bagirmi fulfulde": "fui",
-    "ff": "ful",
-    "ful": "ful",
-    "fulah": "ful",
-    "fulniô": "fun",
-    "central-eastern niger fulfulde": "fuq",
-    "fur": "fur",
-    "friulian": "fur",
-    "futuna-aniwa": "fut",
-    "furu": "fuu",
-    "nigerian fulfulde": "fuv",
-    "fuyug": "fuy",
-    "fwâi": "fwa",
-    "gaa": "gaa",
-    "gabri": "gab",
-    "mixed great andamanese": "gac",
-    "gaddang": "gad",
-    "guarequena": "gae",
-    "gende": "gaf",
-    "gagauz": "gag",
-    "alekano": "gah",
-    "borei": "gai",
-    "gadsup": "gaj",
-    "gamkonora": "gak",
-    "galolen": "gal",
-    "kandawo": "gam",
-    "gan chinese": "gan",
-    "gants": "gao",
-    "gata'": "gaq",
-    "galeya": "gar",
-    "adiwasi garasia": "gas",
-    "kenati": "gat",
-    "mudhili gadaba": "gau",
-    "nobonob": "gaw",
-    "borana-arsi-guji oromo": "gax",
-    "gay": "gay",
-    "gayo": "gay",
-    "west central oromo": "gaz",
-    "gba": "gba",
-    "gbaya (central african republic)": "gba",
-    "kaytetye": "gbb",
-    "karajarri": "gbd",
-    "niksek": "gbe",
-    "gaikundi": "gbf",
-    "gbanziri": "gbg",
-    "defi gbe": "gbh",
-    "galela": "gbi",
-    "bodo gadaba": "gbj",
-    "gaddi": "gbk",
-    "gamit": "gbl",
-    "garhwali": "gbm",
-    "mo'da": "gbn",
-    "northern grebo": "gbo",
-    "gbaya-bossangoa": "gbp",
-    "gbaya-bozoum": "gbq",
-    "gbagyi": "gbr",
-    "gbesi gbe": "gbs",
-    "gagadu": "gbu",
-    "gbanu": "gbv",
-    "gabi-gabi": "gbw",
-    "eastern xwla gbe": "gbx",
-    "gbari": "gby",
-    "zoroastrian dari": "gbz",
-    "mali": "gcc",
-    "ganggalida": "gcd",
-    "galice": "gce",
-    "guadeloupean creole french": "gcf",
-    "grenadian creole english": "gcl",
-    "gaina": "gcn",
-    "guianese creole french": "gcr",
-    "colonia tovar german": "gct",
-    "gade lohar": "gda",
-    "pottangi ollar gadaba": "gdb",
-    "gugu badhun": "gdc",
-    "gedaged": "gdd",
-    "gude": "gde",
-    "guduf-gava": "gdf",
-    "ga'dang": "gdg",
-    "gadjerawang": "gdh",
-    "gundi": "gdi",
-    "gurdjar": "gdj",
-    "gadang": "gdk",
-    "dirasha": "gdl",
-    "laal": "gdm",
-    "umanakaina": "gdn",
-    "ghodoberi": "gdo",
-    "mehri": "gdq",
-    "wipi": "gdr",
-    "ghandruk sign language": "gds",
-    "kungardutyi": "gdt",
-    "gudu": "gdu",
-    "godwari": "gdx",
-    "geruma": "gea",
-    "kire": "geb",
-    "gboloo grebo": "gec",
-    "gade": "ged",
-    "gerai": "gef",
-    "gengle": "geg",
-    "hutterite german": "geh",
-    "gebe": "gei",
-    "ywom": "gek",
-    "ut-ma'in": "gel",
-    "geme": "geq",
-    "geser-gorom": "ges",
-    "eviya": "gev",
-    "gera": "gew",
-    "garre": "gex",
-    "enya": "gey",
-    "gez": "gez",
-    "geez": "gez",
-    "patpatar": "gfk",
-    "gafat": "gft",
-    "gbii": "ggb",
-    "gugadj": "ggd",
-    "gurr-goni": "gge",
-    "gurgula": "ggg",
-    "kungarakany": "ggk",
-    "ganglau": "ggl",
-    "gitua": "ggt",
-    "gagu": "ggu",
-    "gogodala": "ggw",
-    "ghadamès": "gha",
-    "hiberno-scottish gaelic": "ghc",
-    "southern ghale": "ghe",
-    "northern ghale": "ghh",
-    "geko karen": "ghk",
-    "ghulfan": "ghl",
-    "ghanongga": "ghn",
-    "ghomara": "gho",
-    "ghera": "ghr",
-    "guhu-samane": "ghs",
-    "kuke": "ght",
-    "kija": "gia",
-    "gibanawa": "gib",
-    "gail": "gic",
-    "gidar": "gid",
-    "gaɓogbo": "gie",
-    "goaria": "gig",
-    "githabul": "gih",
-    "girirra": "gii",
-    "gil": "gil",
-    "gilbertese": "gil",
-    "gimi (eastern highlands)": "gim",
-    "hinukh": "gin",
-    "gimi (west new britain)": "gip",
-    "green gelao": "giq",
-    "red gelao": "gir",
-    "north giziga": "gis",
-    "gitxsan": "git",
-    "mulao": "giu",
-    "white gelao": "giw",
-    "gilima": "gix",
-    "giyug": "giy",
-    "south giziga": "giz",
-    "kachi koli": "gjk",
-    "gunditjmara": "gjm",
-    "gonja": "gjn",
-    "gurindji kriol": "gjr",
-    "gujari": "gju",
-    "guya": "gka",
-    "magɨ (madang province)": "gkd",
-    "ndai": "gke",
-    "gokana": "gkn",
-    "kok-nar": "gko",
-    "guinea kpelle": "gkp",
-    "ǂungkue": "gku",
-    "gd": "gla",
-    "gla": "gla",
-    "scottish gaelic": "gla",
-    "belning": "glb",
-    "bon gula": "glc",
-    "nanai": "gld",
-    "ga": "gle",
-    "gle": "gle",
-    "irish": "gle",
-    "gl": "glg",
-    "glg": "glg",
-    "galician": "glg",
-    "northwest pashai": "glh",
-    "gula iro": "glj",
-    "gilaki": "glk",
-    "garlali": "gll",
-    "galambu": "glo",
-    "glaro-twabo": "glr",
-    "gula (chad)": "glu",
-    "gv": "glv",
-    "glv": "glv",
-    "manx": "glv",
-    "glavda": "glw",
-    "gule": "gly",
-    "gambera": "gma",
-    "gula'alaa": "gmb",
-    "mághdì": "gmd",
-    "magɨyi": "gmg",
-    "gmh": "gmh",
-    "middle high german (ca. 1050-1500)": "gmh",
-    "middle low german": "gml",
-    "gbaya-mbodomo": "gmm",
-    "gimnime": "gmn",
-    "mirning": "gmr",
-    "gumalu": "gmu",
-    "gamo": "gmv",
-    "magoma": "gmx",
-    "mycenaean greek": "gmy",
-    "mgbolizhia": "gmz",
-    "kaansa": "gna",
-    "gangte": "gnb",
-    "guanche": "gnc",
-    "zulgo-gemzek": "gnd",
-    "ganang": "gne",
-    "ngangam": "gng",
-    "lere": "gnh",
-    "gooniyandi": "gni",
-    "ngen": "gnj",
-    "ǁgana": "gnk",
-    "gangulu": "gnl",
-    "ginuman": "gnm",
-    "gumatj": "gnn",
-    "northern gondi": "gno",
-    "gana": "gnq",
-    "gureng gureng": "gnr",
-    "guntai": "gnt",
-    "gnau": "gnu",
-    "western bolivian guaraní": "gnw",
-    "ganzi": "gnz",
-    "guro": "goa",
-    "playero": "gob",
-    "gorakor": "goc",
-    "godié": "god",
-    "gongduk": "goe",
-    "gofa": "gof",
-    "gogo": "gog",
-    "goh": "goh",
-    "old high german (ca. 750-1050)": "goh",
-    "gobasi": "goi",
-    "gowlan": "goj",
-    "gowli": "gok",
-    "gola": "gol",
-    "goan konkani": "gom",
-    "gon": "gon",
-    "gondi": "gon",
-    "gone dau": "goo",
-    "yeretuar": "gop",
-    "gorap": "goq",
-    "gor": "gor",
-    "gorontalo": "gor",
-    "gronings": "gos",
-    "got": "got",
-    "gothic": "got",
-    "gavar": "gou",
-    "gorowa": "gow",
-    "gobu": "gox",
-    "goundo": "goy",
-    "gozarkhani": "goz",
-    "gupa-abawa": "gpa",
-    "ghanaian pidgin english": "gpe",
-    "taiap": "gpn",
-    "ga'anda": "gqa",
-    "guiqiong": "gqi",
-    "guana (brazil)": "gqn",
-    "rajput garasia": "gra",
-    "grb": "grb",
-    "grebo": "grb",
-    "grc": "grc",
-    "ancient greek (to 1453)": "grc",
-    "guruntum-mbaaru": "grd",
-    "madi": "grg",
-    "gbiri-niragu": "grh",
-    "ghari": "gri",
-    "southern grebo": "grj",
-    "kota marudu talantang": "grm",
-    "gn": "grn",
-    "grn": "grn",
-    "guarani": "grn",
-    "groma": "gro",
-    "gorovu": "grq",
-    "taznatit": "grr",
-    "gresi": "grs",
-    "garo": "grt",
-    "kistane": "gru",
-    "central grebo": "grv",
-    "gweda": "grw",
-    "guriaso": "grx",
-    "barclayville grebo": "gry",
-    "guramalum": "grz",
-    "ghanaian sign language": "gse",
-    "german sign language": "gsg",
-    "gusilay": "gsl",
-    "guatemalan sign language": "gsm",
-    "nema": "gsn",
-    "southwest gbaya": "gso",
-    "wasembo": "gsp",
-    "greek sign language": "gss",
-    "gsw": "gsw",
-    "swiss german": "gsw",
-    "guató": "gta",
-    "aghu-tharnggala": "gtu",
-    "shiki": "gua",
-    "guajajára": "gub",
-    "wayuu": "guc",
-    "yocoboué dida": "gud",
-    "gurindji": "gue",
-    "gupapuyngu": "guf",
-    "paraguayan guaraní": "gug",
-    "guahibo": "guh",
-    "eastern bolivian guaraní": "gui",
-    "gu": "guj",
-    "guj": "guj",
-    "gujarati": "guj",
-    "gumuz": "guk",
-    "sea island creole english": "gul",
-    "guambiano": "gum",
-    "mbyá guaraní": "gun",
-    "guayabero": "guo",
-    "gunwinggu": "gup",
-    "aché": "guq",
-    "farefare": "gur",
-    "guinean sign language": "gus",
-    "maléku jaíka": "gut",
-    "yanomamö": "guu",
-    "gourmanchéma": "gux",
-    "gusii": "guz",
-    "guana (paraguay)": "gva",
-    "guanano": "gvc",
-    "duwet": "gve",
-    "golin": "gvf",
-    "guajá": "gvj",
-    "gulay": "gvl",
-    "gurmana": "gvm",
-    "kuku-yalanji": "gvn",
-    "gavião do jiparaná": "gvo",
-    "pará gavião": "gvp",
-    "gurung": "gvr",
-    "gumawana": "gvs",
-    "guyani": "gvy",
-    "mbato": "gwa",
-    "gawri": "gwc",
-    "gawwada": "gwd",
-    "gweno": "gwe",
-    "gowro": "gwf",
-    "gwi": "gwi",
-    "gwichʼin": "gwi",
-    "ǀgwi": "gwj",
-    "awngthim": "gwm",
-    "gwandara": "gwn",
-    "gwere": "gwr",
-    "gawar-bati": "gwt",
-    "guwamu": "gwu",
-    "kwini": "gww",
-    "wè southern": "gxx",
-    "northwest gbaya": "gya",
-    "garus": "gyb",
-    "kayardild": "gyd",
-    "gyem": "gye",
-    "gungabula": "gyf",
-    "gbayi": "gyg",
-    "gyele": "gyi",
-    "gayil": "gyl",
-    "ngäbere": "gym",
-    "guyanese creole english": "gyn",
-    "gyalsumdo": "gyo",
-    "guarayu": "gyr",
-    "gunya": "gyy",
-    "geji": "gyz",
-    "ganza": "gza",
-    "gazi": "gzi",
-    "gane": "gzn",
-    "hanoi sign language": "hab",
-    "gurani": "hac",
-    "hatam": "had",
-    "eastern oromo": "hae",
-    "haiphong sign language": "haf",
-    "hanga": "hag",
-    "hahon": "hah",
-    "hai": "hai",
-    "haida": "hai",
-    "hajong": "haj",
-    "hakka chinese": "hak",
-    "halang": "hal",
-    "hewa": "ham",
-    "hangaza": "han",
-    "hakö": "hao",
-    "hupla": "hap",
-    "harari": "har",
-    "haisla": "has",
-    "ht": "hat",
-    "hat": "hat",
-    "haitian": "hat",
-    "ha": "hau",
-    "hau": "hau",
-    "hausa": "hau",
-    "havu": "hav",
-    "haw": "haw",
-    "hawaiian": "haw",
-    "southern haida": "hax",
-    "haya": "hay",
-    "hazaragi": "haz",
-    "hamba": "hba",
-    "huba": "hbb",
-    "heiban": "hbn",
-    "ancient hebrew": "hbo",
-    "sh": "hbs",
-    "serbo-croatian": "hbs",
-    "habu": "hbu",
-    "andaman creole hindi": "hca",
-    "huichol": "hch",
-    "northern haida": "hdn",
-    "honduras sign language": "hds",
-    "hadiyya": "hdy",
-    "northern qiandong miao": "hea",
-    "he": "heb",
-    "heb": "heb",
-    "hebrew": "heb",
-    "herdé": "hed",
-    "helong": "heg",
-    "hehe": "heh",
-    "heiltsuk": "hei",
-    "hemba": "hem",
-    "hz": "her",
-    "her": "her",
-    "herero": "her",
-    "haiǁom": "hgm",
-    "haigwai": "hgw",
-    "hoia hoia": "hhi",
-    "kerak": "hhr",
-    "hoyahoya": "hhy",
-    "lamang": "hia",
-    "hibito": "hib",
-    "hidatsa": "hid",
-    "fiji hindi": "hif",
-    "kamwe": "hig",
-    "pamosu": "hih",
-    "hinduri": "hii",
-    "hijuk": "hij",
-    "seit-kaitetu": "hik",
-    "hil": "hil",
-    "hiligaynon": "hil",
-    "hi": "hin",
-    "hin": "hin",
-    "hindi": "hin",
-    "tsoa": "hio",
-    "himarimã": "hir",
-    "hit": "hit",
-    "hittite": "hit",
-    "hixkaryána": "hix",
-    "haji": "hji",
-    "kahe": "hka",
-    "hunde": "hke",
-    "khah": "hkh",
-    "hunjara-kaina ke": "hkk",
-    "mel-khaonh": "hkn",
-    "hong kong sign language": "hks",
-    "halia": "hla",
-    "halbi": "hlb",
-    "halang doan": "hld",
-    "hlersu": "hle",
-    "matu chin": "hlt",
-    "hieroglyphic luwian": "hlu",
-    "southern mashan hmong": "hma",
-    "humburi senni songhay": "hmb",
-    "central huishui hmong": "hmc",
-    "large flowery miao": "hmd",
-    "eastern huishui hmong": "hme",
-    "hmong don": "hmf",
-    "southwestern guiyang hmong": "hmg",
-    "southwestern huishui hmong": "hmh",
-    "northern huishui hmong": "hmi",
-    "maek": "hmk",
-    "luopohe hmong": "hml",
-    "central mashan hmong": "hmm",
-    "hmn": "hmn",
-    "hmong": "hmn",
-    "ho": "hmo",
-    "hmo": "hmo",
-    "hiri motu": "hmo",
-    "northern mashan hmong": "hmp",
-    "eastern qiandong miao": "hmq",
-    "hmar": "hmr",
-    "southern qiandong miao": "hms",
-    "hamtai": "hmt",
-    "hamap": "hmu",
-    "hmong dô": "hmv",
-    "western mashan hmong": "hmw",
-    "southern guiyang hmong": "hmy",
-    "hmong shua": "hmz",
-    "mina (cameroon)": "hna",
-    "southern hindko": "hnd",
-    "chhattisgarhi": "hne",
-    "hungu": "hng",
-    "ǁani": "hnh",
-    "hani": "hni",
-    "hmong njua": "hnj",
-    "hanunoo": "hnn",
-    "northern hindko": "hno",
-    "caribbean hindustani": "hns",
-    "hung": "hnu",
-    "hoava": "hoa",
-    "mari (madang province)": "hob",
-    "holma": "hod",
-    "horom": "hoe",
-    "hobyót": "hoh",
-    "holikachuk": "hoi",
-    "hadothi": "hoj",
-    "holu": "hol",
-    "homa": "hom",
-    "holoholo": "hoo",
-    "hopi": "hop",
-    "horo": "hor",
-    "ho chi minh city sign language": "hos",
-    "hote": "hot",
-    "hovongan": "hov",
-    "honi": "how",
-    "holiya": "hoy",
-    "hozo": "hoz",
-    "hpon": "hpo",
-    "hawai'i sign language (hsl)": "hps",
-    "hrangkhol": "hra",
-    "niwer mil": "hrc",
-    "haruku": "hrk",
-    "horned miao": "hrm",
-    "haroi": "hro",
-    "nhirrpi": "hrp",
-    "hértevin": "hrt",
-    "hruso": "hru",
-    "hr": "hrv",
-    "hrv": "hrv",
-    "croatian": "hrv",
-    "warwar feni": "hrw",
-    "hunsrik": "hrx",
-    "harzani": "hrz",
-    "hsb": "hsb",
-    "upper sorbian": "hsb",
-    "hungarian sign language": "hsh",
-    "hausa sign language": "hsl",
-    "xiang chinese": "hsn",
-    "harsusi": "hss",
-    "hoti": "hti",
-    "minica huitoto": "hto",
-    "hadza": "hts",
-    "hitu": "htu",
-    "middle hittite": "htx",
-    "huambisa": "hub",
-    "ǂhua": "huc",
-    "huaulu": "hud",
-    "san francisco del mar huave": "hue",
-    "humene": "huf",
-    "huachipaeri": "hug",
-    "huilliche": "huh",
-    "huli": "hui",
-    "northern guiyang hmong": "huj",
-    "hulung": "huk",
-    "hula": "hul",
-    "hungana": "hum",
-    "hu": "hun",
-    "hun": "hun",
-    "hungarian": "hun",
-    "hup": "hup",
-    "hupa": "hup",
-    "tsat": "huq",
-    "halkomelem": "hur",
-    "huastec": "hus",
-    "humla": "hut",
-    "murui huitoto": "huu",
-    "san mateo del mar huave": "huv",
-    "hukumina": "huw",
-    "nüpode huitoto": "hux",
-    "hulaulá": "huy",
-    "hunzib": "huz",
-    "haitian vodoun culture language": "hvc",
-    "san dionisio del mar huave": "hve",
-    "haveke": "hvk",
-    "sabu": "hvn",
-    "santa maría del mar huave": "hvv",
-    "wané": "hwa",
-    "hawai'i creole english": "hwc",
-    "hwana": "hwo",
-    "hy": "hye",
-    "arm": "hye",
-    "hye": "hye",
-    "armenian": "hye",
-    "western armenian": "hyw",
-    "iaai": "iai",
-    "iatmul": "ian",
-    "purari": "iar",
-    "iba": "iba",
-    "iban": "iba",
-    "ibibio": "ibb",
-    "iwaidja": "ibd",
-    "akpes": "ibe",
-    "ibanag": "ibg",
-    "ibaloi": "ibl",
-    "agoi": "ibm",
-    "ibino": "ibn",
-    "ig": "ibo",
-    "ibo": "ibo",
-    "igbo": "ibo",
-    "ibuoro": "ibr",
-    "ibani": "iby",
-    "ede ica": "ica",
-    "etkywan": "ich",
-    "icelandic sign language": "icl",
-    "islander creole english": "icr",
-    "idakho-isukha-tiriki": "ida",
-    "indo-portuguese": "idb",
-    "idon": "idc",
-    "ede idaca": "idd",
-    "idere": "ide",
-    "io": "ido",
-    "ido": "ido",
-    "indri": "idr",
-    "idesa": "ids",
-    "idaté": "idt",
-    "idoma": "idu",
-    "amganad ifugao": "ifa",
-    "batad ifugao": "ifb",
-    "tuwali ifugao": "ifk",
-    "teke-fuumu": "ifm",
-    "mayoyao ifugao": "ifu",
-    "keley-i kallahan": "ify",
-    "ebira": "igb",
-    "igede": "ige",
-    "igana": "igg",
-    "igala": "igl",
-    "kanggape": "igm",
-    "ignaciano": "ign",
-    "isebe": "igo",
-    "interglossa": "igs",
-    "igwe": "igw",
-    "iha based pidgin": "ihb",
-    "ihievbe": "ihi",
-    "bidhawal": "ihw",
-    "ii": "iii",
-    "iii": "iii",
-    "sichuan yi": "iii",
-    "thiin": "iin",
-    "izon": "ijc",
-    "biseni": "ije",
-    "ede ije": "ijj",
-    "kalabari": "ijn",
-    "southeast ijo": "ijs",
-    "eastern canadian inuktitut": "ike",
-    "ikulu": "ikl",
-    "olulumo-ikom": "iko",
-    "ikpeshi": "ikp",
-    "ikaranggal": "ikr",
-    "inuit sign language": "iks",
-    "inuinnaqtun": "ikt",
-    "iu": "iku",
-    "iku": "iku",
-    "inuktitut": "iku",
-    "iku-gora-ankwa": "ikv",
-    "ikwere": "ikw",
-    "ikizu": "ikz",
-    "ile ape": "ila",
-    "ie": "ile",
-    "ile": "ile",
-    "interlingue": "ile",
-    "garig-ilgar": "ilg",
-    "ili turki": "ili",
-    "ilongot": "ilk",
-    "iranun (malaysia)": "ilm",
-    "ilo": "ilo",
-    "iloko": "ilo",
-    "iranun (philippines)": "ilp",
-    "international sign": "ils",
-    "ili'uun": "ilu",
-    "ilue": "ilv",
-    "mala malasar": "ima",
-    "anamgura": "imi",
-    "miluk": "iml",
-    "imonda": "imn",
-    "imbongu": "imo",
-    "imroing": "imr",
-    "marsian": "ims",
-    "milyan": "imy",
-    "ia": "ina",
-    "ina": "ina",
-    "interlingua (international auxiliary language association)": "ina",
-    "inga": "inb",
-    "id": "ind",
-    "ind": "ind",
-    "indonesian": "ind",
-    "degexit'an": "ing",
-    "inh": "inh",
-    "ingush": "inh",
-    "jungle inga": "inj",
-    "indonesian sign language": "inl",
-    "minaean": "inm",
-    "isinai": "inn",
-    "inoke-yate": "ino",
-    "iñapari": "inp",
-    "indian sign language": "ins",
-    "intha": "int",
-    "ineseño": "inz",
-    "inor": "ior",
-    "tuma-irumu": "iou",
-    "iowa-oto": "iow",
-    "ipili": "ipi",
-    "ik": "ipk",
-    "ipk": "ipk",
-    "inupiaq": "ipk",
-    "ipiko": "ipo",
-    "iquito": "iqu",
-    "ikwo": "iqw",
-    "iresim": "ire",
-    "irarutu": "irh",
-    "rigwe": "iri",
-    "iraqw": "irk",
-    "irántxe": "irn",
-    "irula": "iru",
-    "kamberau": "irx",
-    "iraya": "iry",
-    "isabi": "isa",
-    "isconahua": "isc",
-    "isnag": "isd",
-    "italian sign language": "ise",
-    "irish sign language": "isg",
-    "esan": "ish",
-    "nkem-nkum": "isi",
-    "ishkashimi": "isk",
-    "is": "isl",
-    "ice": "isl",
-    "isl": "isl",
-    "icelandic": "isl",
-    "masimasi": "ism",
-    "isanzu": "isn",
-    "isoko": "iso",
-    "israeli sign language": "isr",
-    "istriot": "ist",
-    "isu (menchum division)": "isu",
-    "it": "ita",
-    "ita": "ita",
-    "italian": "ita",
-    "binongan itneg": "itb",
-    "southern tidung": "itd",
-    "itene": "ite",
-    "inlaod itneg": "iti",
-    "judeo-italian": "itk",
-    "itelmen": "itl",
-    "itu mbon uzo": "itm",
-    "itonama": "ito",
-    "iteri": "itr",
-    "isekiri": "its",
-    "maeng itneg": "itt",
-    "itawit": "itv",
-    "itik": "itx",
-    "moyadan itneg": "ity",
-    "itzá": "itz",
-    "iu mien": "ium",
-    "ibatan": "ivb",
-    "ivatan": "ivv",
-    "i-wak": "iwk",
-    "iwam": "iwm",
-    "iwur": "iwo",
-    "sepik iwam": "iws",
-    "ixcatec": "ixc",
-    "ixil": "ixl",
-    "iyayu": "iya",
-    "mesaka": "iyo",
-    "yaka (congo)": "iyx",
-    "ingrian": "izh",
-    "izere": "izr",
-    "izii": "izz",
-    "jamamadí": "jaa",
-    "hyam": "jab",
-    "popti'": "jac",
-    "jahanka": "jad",
-    "yabem": "jae",
-    "jara": "jaf",
-    "jah hut": "jah",
-    "zazao": "jaj",
-    "jakun": "jak",
-    "yalahatan": "jal",
-    "jamaican creole english": "jam",
-    "jandai": "jan",
-    "yanyuwa": "jao",
-    "yaqay": "jaq",
-    "new caledonian javanese": "jas",
-    "jakati": "jat",
-    "yaur": "jau",
-    "jv": "jav",
-    "jav": "jav",
-    "javanese": "jav",
-    "jambi malay": "jax",
-    "yan-nhangu": "jay",
-    "jawe": "jaz",
-    "judeo-berber": "jbe",
-    "badjiri": "jbi",
-    "arandai": "jbj",
-    "barikewa": "jbk",
-    "bijim": "jbm",
-    "nafusi": "jbn",
-    "jbo": "jbo",
-    "lojban": "jbo",
-    "jofotek-bromnya": "jbr",
-    "jabutí": "jbt",
-    "jukun takum": "jbu",
-    "yawijibaya": "jbw",
-    "jamaican country sign language": "jcs",
-    "krymchak": "jct",
-    "jadgali": "jdg",
-    "judeo-tat": "jdt",
-    "jebero": "jeb",
-    "jerung": "jee",
-    "jeri kuo": "jek",
-    "yelmek": "jel",
-    "jere": "jer",
-    "manem": "jet",
-    "jonkor bourmataguil": "jeu",
-    "ngbee": "jgb",
-    "judeo-georgian": "jge",
-    "gwak": "jgk",
-    "ngomba": "jgo",
-    "jehai": "jhi",
-    "jhankot sign language": "jhs",
-    "jina": "jia",
-    "jibu": "jib",
-    "bu (kaduna state)": "jid",
-    "jilbe": "jie",
-    "jingulu": "jig",
-    "stodsde": "jih",
-    "jiiddu": "jii",
-    "jilim": "jil",
-    "jimi (cameroon)": "jim",
-    "jiamao": "jio",
-    "guanyinqiao": "jiq",
-    "jita": "jit",
-    "youle jinuo": "jiu",
-    "shuar": "jiv",
-    "buyuan jinuo": "jiy",
-    "jejueo": "jje",
-    "bankal": "jjr",
-    "kaera": "jka",
-    "mobwa karen": "jkm",
-    "kubo": "jko",
-    "paku karen": "jkp",
-    "koro (india)": "jkr",
-    "amami koniya sign language": "jks",
-    "labir": "jku",
-    "ngile": "jle",
-    "jamaican sign language": "jls",
-    "dima": "jma",
-    "zumbun": "jmb",
-    "machame": "jmc",
-    "yamdena": "jmd",
-    "jimi (nigeria)": "jmi",
-    "jumli": "jml",
-    "makuri naga": "jmn",
-    "kamara": "jmr",
-    "mashi (nigeria)": "jms",
-    "mouwase": "jmw",
-    "western juxtlahuaca mixtec": "jmx",
-    "jangshung": "jna",
-    "jandavra": "jnd",
-    "yangman": "jng",
-    "janji": "jni",
-    "yemsa": "jnj",
-    "rawat": "jnl",
-    "jaunsari": "jns",
-    "joba": "job",
-    "wojenaka": "jod",
-    "jogi": "jog",
-    "jorá": "jor",
-    "jordanian sign language": "jos",
-    "jowulu": "jow",
-    "jewish palestinian aramaic": "jpa",
-    "ja": "jpn",
-    "jpn": "jpn",
-    "japanese": "jpn",
-    "jpr": "jpr",
-    "judeo-persian": "jpr",
-    "jaqaru": "jqr",
-    "jarai": "jra",
-    "jrb": "jrb",
-    "judeo-arabic": "jrb",
-    "jiru": "jrr",
-    "jakattoe": "jrt",
-    "japrería": "jru",
-    "japanese sign language": "jsl",
-    "júma": "jua",
-    "wannu": "jub",
-    "jurchen": "juc",
-    "worodougou": "jud",
-    "hõne": "juh",
-    "ngadjuri": "jui",
-    "wapan": "juk",
-    "jirel": "jul",
-    "jumjum": "jum",
-    "juang": "jun",
-    "jiba": "juo",
-    "hupdë": "jup",
-    "jurúna": "jur",
-    "jumla sign language": "jus",
-    "jutish": "jut",
-    "wãpha": "juw",
-    "juray": "juy",
-    "javindo": "jvd",
-    "caribbean javanese": "jvn",
-    "jwira-pepesa": "jwi",
-    "jiarong": "jya",
-    "judeo-yemeni arabic": "jye",
-    "jaya": "jyy",
-    "kaa": "kaa",
-    "kara-kalpak": "kaa",
-    "kab": "kab",
-    "kabyle": "kab",
-    "kac": "kac",
-    "kachin": "kac",
-    "adara": "kad",
-    "ketangalan": "kae",
-    "katso": "kaf",
-    "kajaman": "kag",
-    "kara (central african republic)": "kah",
-    "karekare": "kai",
-    "kalanguya": "kak",
-    "kl": "kal",
-    "kal": "kal",
-    "kalaallisut": "kal",
-    "kam": "kam",
-    "kamba (kenya)": "kam",
-    "kn": "kan",
-    "kan": "kan",
-    "kannada": "kan",
-    "xaasongaxango": "kao",
-    "bezhta": "kap",
-    "capanahua": "kaq",
-    "ks": "kas",
-    "kas": "kas",
-    "kashmiri": "kas",
-    "ka": "kat",
-    "geo": "kat",
-    "kat": "kat",
-    "georgian": "kat",
-    "kr": "kau",
-    "kau": "kau",
-    "kanuri": "kau",
-    "katukína": "kav",
-    "kaw": "kaw",
-    "kawi": "kaw",
-    "kamayurá": "kay",
-    "kk": "kaz",
-    "kaz": "kaz",
-    "kazakh": "kaz",
-    "kalarko": "kba",
-    "kaxuiâna": "kbb",
-    "kadiwéu": "kbc",
-    "kbd": "kbd",
-    "kabardian": "kbd",
-    "kanju": "kbe",
-    "khamba": "kbg",
-    "camsá": "kbh",
-    "kaptiau": "kbi",
-    "kari": "kbj",
-    "grass koiari": "kbk",
-    "kanembu": "kbl",
-    "iwal": "kbm",
-    "kare (central african republic)": "kbn",
-    "keliko": "kbo",
-    "kabiyè": "kbp",
-    "kamano": "kbq",
-    "kafa": "kbr",
-    "kande": "kbs",
-    "abadi": "kbt",
-    "kabutra": "kbu",
-    "dera (indonesia)": "kbv",
-    "kaiep": "kbw",
-    "ap ma": "kbx",
-    "manga kanuri": "kby",
-    "duhwa": "kbz",
-    "khanty": "kca",
-    "kawacha": "kcb",
-    "lubila": "kcc",
-    "ngkâlmpw kanum": "kcd",
-    "kaivi": "kce",
-    "ukaan": "kcf",
-    "tyap": "kcg",
-    "vono": "kch",
-    "kamantan": "kci",
-    "kobiana": "kcj",
-    "kalanga": "kck",
-    "kela (papua new guinea)": "kcl",
-    "gula (central african republic)": "kcm",
-    "nubi": "kcn",
-    "kinalakna": "kco",
-    "kanga": "kcp",
-    "kamo": "kcq",
-    "katla": "kcr",
-    "koenoem": "kcs",
-    "kaian": "kct",
-    "kami (tanzania)": "kcu",
-    "kete": "kcv",
-    "kabwari": "kcw",
-    "kachama-ganjule": "kcx",
-    "korandje": "kcy",
-    "konongo": "kcz",
-    "worimi": "kda",
-    "kutu": "kdc",
-    "yankunytjatjara": "kdd",
-    "makonde": "kde",
-    "mamusi": "kdf",
-    "seba": "kdg",
-    "kumam": "kdi",
-    "karamojong": "kdj",
-    "numèè": "kdk",
-    "tsikimba": "kdl",
-    "kagoma": "kdm",
-    "kunda": "kdn",
-    "kaningdon-nindem": "kdp",
-    "koch": "kdq",
-    "karaim": "kdr",
-    "kadaru": "kdu",
-    "koneraw": "kdw",
-    "keder": "kdy",
-    "kwaja": "kdz",
-    "kabuverdianu": "kea",
-    "kélé": "keb",
-    "keiga": "kec",
-    "kerewe": "ked",
-    "eastern keres": "kee",
-    "kpessi": "kef",
-    "tese": "keg",
-    "keak": "keh",
-    "kadar": "kej",
-    "kekchí": "kek",
-    "kela (democratic republic of congo)": "kel",
-    "kemak": "kem",
-    "kenyang": "ken",
-    "kakwa": "keo",
-    "kaikadi": "kep",
-    "kamar": "keq",
-    "kera": "ker",
-    "kugbo": "kes",
-    "akebu": "keu",
-    "kanikkaran": "kev",
-    "west kewa": "kew",
-    "kukna": "kex",
-    "kupia": "key",
-    "kukele": "kez",
-    "kodava": "kfa",
-    "northwestern kolami": "kfb",
-    "konda-dora": "kfc",
-    "korra koraga": "kfd",
-    "kota (india)": "kfe",
-    "koya": "kff",
-    "kudiya": "kfg",
-    "kurichiya": "kfh",
-    "kannada kurumba": "kfi",
-    "kemiehua": "kfj",
-    "kinnauri": "kfk",
-    "kung": "kfl",
-    "khunsari": "kfm",
-    "koro (côte d'ivoire)": "kfo",
-    "korwa": "kfp",
-    "korku": "kfq",
-    "kachhi": "kfr",
-    "bilaspuri": "kfs",
-    "kanjari": "kft",
-    "katkari": "kfu",
-    "kurmukar": "kfv",
-    "kharam naga": "kfw",
-    "kullu pahari": "kfx",
-    "kumaoni": "kfy",
-    "koromfé": "kfz",
-    "koyaga": "kga",
-    "kawe": "kgb",
-    "komering": "kge",
-    "kube": "kgf",
-    "kusunda": "kgg",
-    "selangor sign language": "kgi",
-    "gamale kham": "kgj",
-    "kaiwá": "kgk",
-    "kunggari": "kgl",
-    "karipúna": "kgm",
-    "karingani": "kgn",
-    "krongo": "kgo",
-    "kaingang": "kgp",
-    "kamoro": "kgq",
-    "abun": "kgr",
-    "kumbainggar": "kgs",
-    "somyev": "kgt",
-    "kobol": "kgu",
-    "karas": "kgv",
-    "karon dori": "kgw",
-    "kamaru": "kgx",
-    "kyerung": "kgy",
-    "kha": "kha",
-    "khasi": "kha",
-    "tukang besi north": "khc",
-    "bädi kanum": "khd",
-    "korowai": "khe",
-    "khuen": "khf",
-    "khams tibetan": "khg",
-    "kehu": "khh",
-    "kuturmi": "khj",
-    "halh mongolian": "khk",
-    "lusi": "khl",
-    "km": "khm",
-    "khm": "khm",
-    "khmer": "khm",
-    "khandesi": "khn",
-    "kho": "kho",
-    "khotanese": "kho",
-    "kapori": "khp",
-    "koyra chiini songhay": "khq",
-    "kharia": "khr",
-    "kasua": "khs",
-    "khamti": "kht",
-    "nkhumbi": "khu",
-    "khvarshi": "khv",
-    "khowar": "khw",
-    "kanu": "khx",
-    "kele (democratic republic of congo)": "khy",
-    "keapara": "khz",
-    "koalib": "kib",
-    "kickapoo": "kic",
-    "koshin": "kid",
-    "kibet": "kie",
-    "eastern parbate kham": "kif",
-    "kimaama": "kig",
-    "kilmeri": "kih",
-    "kitsai": "kii",
-    "kilivila": "kij",
-    "ki": "kik",
-    "kik": "kik",
-    "kikuyu": "kik",
-    "kariya": "kil",
-    "karagas": "kim",
-    "rw": "kin",
-    "kin": "kin",
-    "kinyarwanda": "kin",
-    "kiowa": "kio",
-    "sheshi kham": "kip",
-    "kosadle": "kiq",
-    "ky": "kir",
-    "kir": "kir",
-    "kirghiz": "kir",
-    "agob": "kit",
-    "kirmanjki (individual language)": "kiu",
-    "kimbu": "kiv",
-    "northeast kiwai": "kiw",
-    "khiamniungan naga": "kix",
-    "kirikiri": "kiy",
-    "kisi": "kiz",
-    "mlap": "kja",
-    "q'anjob'al": "kjb",
-    "coastal konjo": "kjc",
-    "southern kiwai": "kjd",
-    "kisar": "kje",
-    "khmu": "kjg",
-    "khakas": "kjh",
-    "zabana": "kji",
-    "khinalugh": "kjj",
-    "highland konjo": "kjk",
-    "western parbate kham": "kjl",
-    "kháng": "kjm",
-    "kunjen": "kjn",
-    "harijan kinnauri": "kjo",
-    "pwo eastern karen": "kjp",
-    "western keres": "kjq",
-    "kurudu": "kjr",
-    "east kewa": "kjs",
-    "phrae pwo karen": "kjt",
-    "kashaya": "kju",
-    "kaikavian literary language": "kjv",
-    "ramopa": "kjx",
-    "erave": "kjy",
-    "bumthangkha": "kjz",
-    "kakanda": "kka",
-    "kwerisa": "kkb",
-    "odoodee": "kkc",
-    "kinuku": "kkd",
-    "kakabe": "kke",
-    "kalaktang monpa": "kkf",
-    "mabaka valley kalinga": "kkg",
-    "khün": "kkh",
-    "kagulu": "kki",
-    "kako": "kkj",
-    "kokota": "kkk",
-    "kosarek yale": "kkl",
-    "kiong": "kkm",
-    "kon keu": "kkn",
-    "karko": "kko",
-    "gugubera": "kkp",
-    "kaeku": "kkq",
-    "kir-balar": "kkr",
-    "giiwo": "kks",
-    "tumi": "kku",
-    "kangean": "kkv",
-    "teke-kukuya": "kkw",
-    "kohin": "kkx",
-    "guugu yimidhirr": "kky",
-    "kaska": "kkz",
-    "klamath-modoc": "kla",
-    "kiliwa": "klb",
-    "kolbila": "klc",
-    "gamilaraay": "kld",
-    "kulung (nepal)": "kle",
-    "kendeje": "klf",
-    "tagakaulo": "klg",
-    "weliki": "klh",
-    "kalumpang": "kli",
-    "khalaj": "klj",
-    "kono (nigeria)": "klk",
-    "kagan kalagan": "kll",
-    "migum": "klm",
-    "kalenjin": "kln",
-    "kapya": "klo",
-    "kamasa": "klp",
-    "rumu": "klq",
-    "khaling": "klr",
-    "kalasha": "kls",
-    "nukna": "klt",
-    "klao": "klu",
-    "maskelynes": "klv",
-    "tado": "klw",
-    "koluwawa": "klx",
-    "kalao": "kly",
-    "kabola": "klz",
-    "konni": "kma",
-    "kmb": "kmb",
-    "kimbundu": "kmb",
-    "southern dong": "kmc",
-    "majukayang kalinga": "kmd",
-    "bakole": "kme",
-    "kare (papua new guinea)": "kmf",
-    "kâte": "kmg",
-    "kalam": "kmh",
-    "kami (nigeria)": "kmi",
-    "kumarbhag paharia": "kmj",
-    "limos kalinga": "kmk",
-    "tanudan kalinga": "kml",
-    "kom (india)": "kmm",
-    "awtuw": "kmn",
-    "kwoma": "kmo",
-    "gimme": "kmp",
-    "kwama": "kmq",
-    "northern kurdish": "kmr",
-    "kamasau": "kms",
-    "kemtuik": "kmt",
-    "kanite": "kmu",
-    "karipúna creole french": "kmv",
-    "komo (democratic republic of congo)": "kmw",
-    "waboda": "kmx",
-    "koma": "kmy",
-    "khorasani turkish": "kmz",
-    "dera (nigeria)": "kna",
-    "lubuagan kalinga": "knb",
-    "central kanuri": "knc",
-    "konda": "knd",
-    "kankanaey": "kne",
-    "mankanya": "knf",
-    "koongo": "kng",
-    "kanufi": "kni",
-    "western kanjobal": "knj",
-    "kuranko": "knk",
-    "keninjal": "knl",
-    "kanamarí": "knm",
-    "konkani (individual language)": "knn",
-    "kono (sierra leone)": "kno",
-    "kwanja": "knp",
-    "kintaq": "knq",
-    "kaningra": "knr",
-    "kensiu": "kns",
-    "panoan katukína": "knt",
-    "kono (guinea)": "knu",
-    "tabo": "knv",
-    "kung-ekoka": "knw",
-    "kendayan": "knx",
-    "kanyok": "kny",
-    "kalamsé": "knz",
-    "konomala": "koa",
-    "kpati": "koc",
-    "kodi": "kod",
-    "kacipo-bale suri": "koe",
-    "kubi": "kof",
-    "cogui": "kog",
-    "koyo": "koh",
-    "komi-permyak": "koi",
-    "kok": "kok",
-    "konkani (macrolanguage)": "kok",
-    "kol (papua new guinea)": "kol",
-    "kv": "kom",
-    "kom": "kom",
-    "komi": "kom",
-    "kg": "kon",
-    "kon": "kon",
-    "kongo": "kon",
-    "konzo": "koo",
-    "waube": "kop",
-    "kota (gabon)": "koq",
-    "ko": "kor",
-    "kor": "kor",
-    "korean": "kor",
-    "kos": "kos",
-    "kosraean": "kos",
-    "lagwan": "kot",
-    "koke": "kou",
-    "kudu-camo": "kov",
-    "kugama": "kow",
-    "koyukon": "koy",
-    "korak": "koz",
-    "kutto": "kpa",
-    "mullu kurumba": "kpb",
-    "curripaco": "kpc",
-    "koba": "kpd",
-    "kpe": "kpe",
-    "kpelle": "kpe",
-    "komba": "kpf",
-    "kapingamarangi": "kpg",
-    "kplang": "kph",
-    "kofei": "kpi",
-    "karajá": "kpj",
-    "kpan": "kpk",
-    "kpala": "kpl",
-    "koho": "kpm",
-    "kepkiriwát": "kpn",
-    "ikposo": "kpo",
-    "korupun-sela": "kpq",
-    "korafe-yegha": "kpr",
-    "tehit": "kps",
-    "karata": "kpt",
-    "kafoa": "kpu",
-    "komi-zyrian": "kpv",
-    "kobon": "kpw",
-    "mountain koiali": "kpx",
-    "koryak": "kpy",
-    "kupsabiny": "kpz",
-    "kovai": "kqb",
-    "doromu-koki": "kqc",
-    "koy sanjaq surat": "kqd",
-    "kalagan": "kqe",
-    "kakabai": "kqf",
-    "kisankasa": "kqh",
-    "koitabu": "kqi",
-    "koromira": "kqj",
-    "kotafon gbe": "kqk",
-    "kyenele": "kql",
-    "khisa": "kqm",
-    "kaonde": "kqn",
-    "eastern krahn": "kqo",
-    "kimré": "kqp",
-    "krenak": "kqq",
-    "kimaragang": "kqr",
-    "northern kissi": "kqs",
-    "klias river kadazan": "kqt",
-    "seroa": "kqu",
-    "okolod": "kqv",
-    "kandas": "kqw",
-    "mser": "kqx",
-    "koorete": "kqy",
-    "korana": "kqz",
-    "kumhali": "kra",
-    "karkin": "krb",
-    "krc": "krc",
-    "karachay-balkar": "krc",
-    "kairui-midiki": "krd",
-    "panará": "kre",
-    "koro (vanuatu)": "krf",
-    "kurama": "krh",
-    "krio": "kri",
-    "kinaray-a": "krj",
-    "kerek": "krk",
-    "krl": "krl",
-    "karelian": "krl",
-    "sapo": "krn",
-    "korop": "krp",
-    "krung": "krr",
-    "gbaya (sudan)": "krs",
-    "tumari kanuri": "krt",
-    "kru": "kru",
-    "kurukh": "kru",
-    "kavet": "krv",
-    "western krahn": "krw",
-    "karon": "krx",
-    "kryts": "kry",
-    "sota kanum": "krz",
-    "shuwa-zamani": "ksa",
-    "shambala": "ksb",
-    "southern kalinga": "ksc",
-    "kuanua": "ksd",
-    "kuni": "kse",
-    "bafia": "ksf",
-    "kusaghe": "ksg",
-    "kölsch": "ksh",
-    "krisa": "ksi",
-    "uare": "ksj",
-    "kansa": "ksk",
-    "kumalu": "ksl",
-    "kumba": "ksm",
-    "kasiguranin": "ksn",
-    "kofa": "kso",
-    "kaba": "ksp",
-    "kwaami": "ksq",
-    "borong": "ksr",
-    "southern kisi": "kss",
-    "winyé": "kst",
-    "khamyang": "ksu",
-    "kusu": "ksv",
-    "s'gaw karen": "ksw",
-    "kedang": "ksx",
-    "kharia thar": "ksy",
-    "kodaku": "ksz",
-    "katua": "kta",
-    "kambaata": "ktb",
-    "kholok": "ktc",
-    "kokata": "ktd",
-    "nubri": "kte",
-    "kwami": "ktf",
-    "kalkutung": "ktg",
-    "karanga": "kth",
-    "north muyu": "kti",
-    "plapo krumen": "ktj",
-    "kaniet": "ktk",
-    "koroshi": "ktl",
-    "kurti": "ktm",
-    "karitiâna": "ktn",
-    "kuot": "kto",
-    "kaduo": "ktp",
-    "katabaga": "ktq",
-    "south muyu": "kts",
-    "ketum": "ktt",
-    "kituba (democratic republic of congo)": "ktu",
-    "eastern katu": "ktv",
-    "kato": "ktw",
-    "kaxararí": "ktx",
-    "kango (bas-uélé district)": "kty",
-    "juǀʼhoan": "ktz",
-    "kj": "kua",
-    "kua": "kua",
-    "kuanyama": "kua",
-    "kutep": "kub",
-    "kwinsu": "kuc",
-    "'auhelawa": "kud",
-    "kuman (papua new guinea)": "kue",
-    "western katu": "kuf",
-    "kupa": "kug",
-    "kushi": "kuh",
-    "kuikúro-kalapálo": "kui",
-    "kuria": "kuj",
-    "kepo'": "kuk",
-    "kulere": "kul",
-    "kum": "kum",
-    "kumyk": "kum",
-    "kunama": "kun",
-    "kumukio": "kuo",
-    "kunimaipa": "kup",
-    "karipuna": "kuq",
-    "ku": "kur",
-    "kur": "kur",
-    "kurdish": "kur",
-    "kusaal": "kus",
-    "kut": "kut",
-    "kutenai": "kut",
-    "upper kuskokwim": "kuu",
-    "kpagua": "kuw",
-    "kukatja": "kux",
-    "kuuku-ya'u": "kuy",
-    "kunza": "kuz",
-    "bagvalal": "kva",
-    "kubu": "kvb",
-    "kove": "kvc",
-    "kui (indonesia)": "kvd",
-    "kalabakan": "kve",
-    "kabalai": "kvf",
-    "kuni-boazi": "kvg",
-    "komodo": "kvh",
-    "kwang": "kvi",
-    "psikye": "kvj",
-    "korean sign language": "kvk",
-    "kayaw": "kvl",
-    "kendem": "kvm",
-    "border kuna": "kvn",
-    "dobel": "kvo",
-    "kompane": "kvp",
-    "geba karen": "kvq",
-    "kerinci": "kvr",
-    "lahta karen": "kvt",
-    "yinbaw karen": "kvu",
-    "kola": "kvv",
-    "wersing": "kvw",
-    "parkari koli": "kvx",
-    "yintale karen": "kvy",
-    "tsakwambo": "kvz",
-    "likwala": "kwc",
-    "kwaio": "kwd",
-    "kwerba": "kwe",
-    "kwara'ae": "kwf",
-    "sara kaba deme": "kwg",
-    "kowiai": "kwh",
-    "awa-cuaiquer": "kwi",
-    "kwanga": "kwj",
-    "kwakiutl": "kwk",
-    "kofyar": "kwl",
-    "kwambi": "kwm",
-    "kwangali": "kwn",
-    "kwomtari": "kwo",
-    "kodia": "kwp",
-    "kwer": "kwr",
-    "kwese": "kws",
-    "kwesten": "kwt",
-    "kwakum": "kwu",
-    "sara kaba náà": "kwv",
-    "kwinti": "kww",
-    "khirwar": "kwx",
-    "san salvador kongo": "kwy",
-    "kwadi": "kwz",
-    "kairiru": "kxa",
-    "krobu": "kxb",
-    "konso": "kxc",
-    "brunei": "kxd",
-    "manumanaw karen": "kxf",
-    "karo (ethiopia)": "kxh",
-    "keningau murut": "kxi",
-    "kulfa": "kxj",
-    "zayein karen": "kxk",
-    "northern khmer": "kxm",
-    "kanowit-tanjong melanau": "kxn",
-    "kanoé": "kxo",
-    "wadiyara koli": "kxp",
-    "smärky kanum": "kxq",
-    "koro (papua new guinea)": "kxr",
-    "kangjia": "kxs",
-    "koiwat": "kxt",
-    "kuvi": "kxv",
-    "konai": "kxw",
-    "likuba": "kxx",
-    "kayong": "kxy",
-    "kerewo": "kxz",
-    "kwaya": "kya",
-    "butbut kalinga": "kyb",
-    "kyaka": "kyc",
-    "karey": "kyd",
-    "krache": "kye",
-    "kouya": "kyf",
-    "keyagana": "kyg",
-    "karok": "kyh",
-    "kiput": "kyi",
-    "karao": "kyj",
-    "kamayo": "kyk",
-    "kalapuya": "kyl",
-    "kpatili": "kym",
-    "northern binukidnon": "kyn",
-    "kelon": "kyo",
-    "kang": "kyp",
-    "kenga": "kyq",
-    "kuruáya": "kyr",
-    "baram kayan": "kys",
-    "kayagar": "kyt",
-    "western kayah": "kyu",
-    "kayort": "kyv",
-    "kudmali": "kyw",
-    "rapoisi": "kyx",
-    "kambaira": "kyy",
-    "kayabí": "kyz",
-    "western karaboro": "kza",
-    "kaibobo": "kzb",
-    "bondoukou kulango": "kzc",
-    "kadai": "kzd",
-    "kosena": "kze",
-    "da'a kaili": "kzf",
-    "kikai": "kzg",
-    "kelabit": "kzi",
-    "kazukuru": "kzk",
-    "kayeli": "kzl",
-    "kais": "kzm",
-    "kokola": "kzn",
-    "kaningi": "kzo",
-    "kaidipang": "kzp",
-    "kaike": "kzq",
-    "karang": "kzr",
-    "sugut dusun": "kzs",
-    "kayupulau": "kzu",
-    "komyandaret": "kzv",
-    "karirí-xocó": "kzw",
-    "kamarian": "kzx",
-    "kango (tshopo district)": "kzy",
-    "kalabra": "kzz",
-    "southern subanen": "laa",
-    "linear a": "lab",
-    "lacandon": "lac",
-    "lad": "lad",
-    "ladino": "lad",
-    "pattani": "lae",
-    "lafofa": "laf",
-    "langi": "lag",
-    "lah": "lah",
-    "lahnda": "lah",
-    "lambya": "lai",
-    "lango (uganda)": "laj",
-    "laka (nigeria)": "lak",
-    "lalia": "lal",
-    "lam": "lam",
-    "lamba": "lam",
-    "laru": "lan",
-    "lo": "lao",
-    "lao": "lao",
-    "laka (chad)": "lap",
-    "qabiao": "laq",
-    "larteh": "lar",
-    "lama (togo)": "las",
-    "la": "lat",
-    "lat": "lat",
-    "latin": "lat",
-    "laba": "lau",
-    "lv": "lav",
-    "lav": "lav",
-    "latvian": "lav",
-    "lauje": "law",
-    "tiwa": "lax",
-    "lama bai": "lay",
-    "aribwatsa": "laz",
-    "label": "lbb",
-    "lakkia": "lbc",
-    "tinani": "lbf",
-    "laopang": "lbg",
-    "la'bi": "lbi",
-    "ladakhi": "lbj",
-    "central bontok": "lbk",
-    "libon bikol": "lbl",
-    "lodhi": "lbm",
-    "rmeet": "lbn",
-    "laven": "lbo",
-    "wampar": "lbq",
-    "lohorung": "lbr",
-    "libyan sign language": "lbs",
-    "lachi": "lbt",
-    "labu": "lbu",
-    "lavatbura-lamusong": "lbv",
-    "tolaki": "lbw",
-    "lawangan": "lbx",
-    "lamalama": "lby",
-    "lardil": "lbz",
-    "legenyem": "lcc",
-    "lola": "lcd",
-    "loncong": "lce",
-    "lubu": "lcf",
-    "luchazi": "lch",
-    "lisela": "lcl",
-    "tungag": "lcm",
-    "western lawa": "lcp",
-    "luhu": "lcq",
-    "lisabata-nuniali": "lcs",
-    "kla-dan": "lda",
-    "dũya": "ldb",
-    "luri": "ldd",
-    "lenyima": "ldg",
-    "lamja-dengsa-tola": "ldh",
-    "laari": "ldi",
-    "lemoro": "ldj",
-    "leelau": "ldk",
-    "kaan": "ldl",
-    "landoma": "ldm",
-    "láadan": "ldn",
-    "lufu": "ldq",
-    "lega-shabunda": "lea",
-    "lala-bisa": "leb",
-    "leco": "lec",
-    "lendu": "led",
-    "lyélé": "lee",
-    "lelemi": "lef",
-    "lenje": "leh",
-    "lemio": "lei",
-    "lengola": "lej",
-    "leipon": "lek",
-    "lele (democratic republic of congo)": "lel",
-    "nomaande": "lem",
-    "lenca": "len",
-    "leti (cameroon)": "leo",
-    "lepcha": "lep",
-    "lembena": "leq",
-    "lenkau": "ler",
-    "lese": "les",
-    "lesing-gelimi": "let",
-    "kara (papua new guinea)": "leu",
-    "lamma": "lev",
-    "ledo kaili": "lew",
-    "luang": "lex",
-    "lemolang": "ley",
-    "lez": "lez",
-    "lezghian": "lez",
-    "lefa": "lfa",
-    "lingua franca nova": "lfn",
-    "lungga": "lga",
-    "laghu": "lgb",
-    "lugbara": "lgg",
-    "laghuu": "lgh",
-    "lengilu": "lgi",
-    "lingarak": "lgk",
-    "wala": "lgl",
-    "lega-mwenga": "lgm",
-    "t'apo": "lgn",
-    "logba": "lgq",
-    "lengo": "lgr",
-    "pahi": "lgt",
-    "longgu": "lgu",
-    "ligenza": "lgz",
-    "laha (viet nam)": "lha",
-    "laha (indonesia)": "lhh",
-    "lahu shi": "lhi",
-    "lahul lohar": "lhl",
-    "lhomi": "lhm",
-    "lahanan": "lhn",
-    "lhokpu": "lhp",
-    "mlahsö": "lhs",
-    "lo-toga": "lht",
-    "lahu": "lhu",
-    "west-central limba": "lia",
-    "likum": "lib",
-    "hlai": "lic",
-    "nyindrou": "lid",
-    "likila": "lie",
-    "limbu": "lif",
-    "ligbi": "lig",
-    "lihir": "lih",
-    "ligurian": "lij",
-    "lika": "lik",
-    "lillooet": "lil",
-    "li": "lim",
-    "lim": "lim",
-    "limburgan": "lim",
-    "ln": "lin",
-    "lin": "lin",
-    "lingala": "lin",
-    "liki": "lio",
-    "sekpele": "lip",
-    "libido": "liq",
-    "liberian english": "lir",
-    "lisu": "lis",
-    "lt": "lit",
-    "lit": "lit",
-    "lithuanian": "lit",
-    "logorik": "liu",
-    "liabuku": "lix",
-    "banda-bambari": "liy",
-    "libinza": "liz",
-    "golpa": "lja",
-    "rampi": "lje",
-    "laiyolo": "lji",
-    "li'o": "ljl",
-    "lampung api": "ljp",
-    "yirandali": "ljw",
-    "yuru": "ljx",
-    "lakalei": "lka",
-    "kabras": "lkb",
-    "kucong": "lkc",
-    "lakondê": "lkd",
-    "kenyi": "lke",
-    "lakha": "lkh",
-    "laki": "lki",
-    "remun": "lkj",
-    "laeko-libuat": "lkl",
-    "kalaamaya": "lkm",
-    "lakon": "lkn",
-    "khayo": "lko",
-    "päri": "lkr",
-    "kisa": "lks",
-    "lakota": "lkt",
-    "kungkari": "lku",
-    "lokoya": "lky",
-    "lala-roba": "lla",
-    "lolo": "llb",
-    "lele (guinea)": "llc",
-    "ladin": "lld",
-    "lele (papua new guinea)": "lle",
-    "hermit": "llf",
-    "lole": "llg",
-    "lamu": "llh",
-    "teke-laali": "lli",
-    "ladji ladji": "llj",
-    "lelak": "llk",
-    "lilau": "lll",
-    "lasalimu": "llm",
-    "lele (chad)": "lln",
-    "north efate": "llp",
-    "lolak": "llq",
-    "lithuanian sign language": "lls",
-    "lauan": "llx",
-    "east limba": "lma",
-    "merei": "lmb",
-    "limilngan": "lmc",
-    "lumun": "lmd",
-    "pévé": "lme",
-    "south lembata": "lmf",
-    "lamogai": "lmg",
-    "lambichhong": "lmh",
-    "lombi": "lmi",
-    "west lembata": "lmj",
-    "lamkang": "lmk",
-    "hano": "lml",
-    "lambadi": "lmn",
-    "lombard": "lmo",
-    "limbum": "lmp",
-    "lamatuka": "lmq",
-    "lamalera": "lmr",
-    "lamenu": "lmu",
-    "lomaiviti": "lmv",
-    "lake miwok": "lmw",
-    "laimbue": "lmx",
-    "lamboya": "lmy",
-    "langbashe": "lna",
-    "mbalanhu": "lnb",
-    "lundayeh": "lnd",
-    "langobardic": "lng",
-    "lanoh": "lnh",
-    "daantanai'": "lni",
-    "leningitij": "lnj",
-    "south central banda": "lnl",
-    "langam": "lnm",
-    "lorediakarkar": "lnn",
-    "lango (south sudan)": "lno",
-    "lamnso'": "lns",
-    "longuda": "lnu",
-    "lanima": "lnw",
-    "lonzo": "lnz",
-    "loloda": "loa",
-    "lobi": "lob",
-    "inonhan": "loc",
-    "saluan": "loe",
-    "logol": "lof",
-    "logo": "log",
-    "narim": "loh",
-    "loma (côte d'ivoire)": "loi",
-    "loko": "lok",
-    "lol": "lol",
-    "mongo": "lol",
-    "loma (liberia)": "lom",
-    "malawi lomwe": "lon",
-    "lombo": "loo",
-    "lopa": "lop",
-    "lobala": "loq",
-    "téén": "lor",
-    "loniu": "los",
-    "otuho": "lot",
-    "louisiana creole": "lou",
-    "lopi": "lov",
-    "tampias lobu": "low",
-    "loun": "lox",
-    "loke": "loy",
-    "loz": "loz",
-    "lozi": "loz",
-    "lelepa": "lpa",
-    "lepki": "lpe",
-    "long phuri naga": "lpn",
-    "lipo": "lpo",
-    "lopit": "lpx",
-    "rara bakati'": "lra",
-    "northern luri": "lrc",
-    "laurentian": "lre",
-    "laragia": "lrg",
-    "marachi": "lri",
-    "loarki": "lrk",
-    "lari": "lrl",
-    "marama": "lrm",
-    "lorang": "lrn",
-    "laro": "lro",
-    "southern yamphu": "lrr",
-    "larantuka malay": "lrt",
-    "larevat": "lrv",
-    "lemerig": "lrz",
-    "lasgerdi": "lsa",
-    "burundian sign language": "lsb",
-    "lishana deni": "lsd",
-    "lusengo": "lse",
-    "lish": "lsh",
-    "lashi": "lsi",
-    "latvian sign language": "lsl",
-    "saamia": "lsm",
-    "tibetan sign language": "lsn",
-    "laos sign language": "lso",
-    "panamanian sign language": "lsp",
-    "aruop": "lsr",
-    "lasi": "lss",
-    "trinidad and tobago sign language": "lst",
-    "sivia sign language": "lsv",
-    "mauritian sign language": "lsy",
-    "late middle chinese": "ltc",
-    "latgalian": "ltg",
-    "thur": "lth",
-    "leti (indonesia)": "lti",
-    "latundê": "ltn",
-    "tsotso": "lto",
-    "tachoni": "lts",
-    "latu": "ltu",
-    "lb": "ltz",
-    "ltz": "ltz",
-    "luxembourgish": "ltz",
-    "lua": "lua",
-    "luba-lulua": "lua",
-    "lu": "lub",
-    "lub": "lub",
-    "luba-katanga": "lub",
-    "aringa": "luc",
-    "ludian": "lud",
-    "luvale": "lue",
-    "laua": "luf",
-    "lg": "lug",
-    "lug": "lug",
-    "ganda": "lug",
-    "lui": "lui",
-    "luiseno": "lui",
-    "luna": "luj",
-    "lunanakha": "luk",
-    "olu'bo": "lul",
-    "luimbi": "lum",
-    "lun": "lun",
-    "lunda": "lun",
-    "luo": "luo",
-    "luo (kenya and tanzania)": "luo",
-    "lumbu": "lup",
-    "lucumi": "luq",
-    "laura": "lur",
-    "lus": "lus",
-    "lushai": "lus",
-    "lushootseed": "lut",
-    "lumba-yakkha": "luu",
-    "luwati": "luv",
-    "luo (cameroon)": "luw",
-    "luyia": "luy",
-    "southern luri": "luz",
-    "maku'a": "lva",
-    "lavi": "lvi",
-    "lavukaleve": "lvk",
-    "standard latvian": "lvs",
-    "levuka": "lvu",
-    "lwalu": "lwa",
-    "lewo eleng": "lwe",
-    "wanga": "lwg",
-    "white lachi": "lwh",
-    "eastern lawa": "lwl",
-    "laomian": "lwm",
-    "luwo": "lwo",
-    "malawian sign language": "lws",
-    "lewotobi": "lwt",
-    "lawu": "lwu",
-    "lewo": "lww",
-    "lakurumau": "lxm",
-    "layakha": "lya",
-    "lyngngam": "lyg",
-    "luyana": "lyn",
-    "literary chinese": "lzh",
-    "litzlitz": "lzl",
-    "leinong naga": "lzn",
-    "san jerónimo tecóatl mazatec": "maa",
-    "yutanduchi mixtec": "mab",
-    "mad": "mad",
-    "madurese": "mad",
-    "bo-rukul": "mae",
-    "mafa": "maf",
-    "mag": "mag",
-    "magahi": "mag",
-    "mh": "mah",
-    "mah": "mah",
-    "marshallese": "mah",
-    "mai": "mai",
-    "maithili": "mai",
-    "jalapa de díaz mazatec": "maj",
-    "mak": "mak",
-    "makasar": "mak",
-    "ml": "mal",
-    "mal": "mal",
-    "malayalam": "mal",
-    "man": "man",
-    "mandingo": "man",
-    "chiquihuitlán mazatec": "maq",
-    "mr": "mar",
-    "mar": "mar",
-    "marathi": "mar",
-    "mas": "mas",
-    "masai": "mas",
-    "san francisco matlatzinca": "mat",
-    "huautla mazatec": "mau",
-    "sateré-mawé": "mav",
-    "mampruli": "maw",
-    "north moluccan malay": "max",
-    "central mazahua": "maz",
-    "higaonon": "mba",
-    "western bukidnon manobo": "mbb",
-    "macushi": "mbc",
-    "dibabawon manobo": "mbd",
-    "molale": "mbe",
-    "baba malay": "mbf",
-    "mangseng": "mbh",
-    "ilianen manobo": "mbi",
-    "nadëb": "mbj",
-    "malol": "mbk",
-    "maxakalí": "mbl",
-    "ombamba": "mbm",
-    "macaguán": "mbn",
-    "mbo (cameroon)": "mbo",
-    "malayo": "msa",
-    "maisin": "mbq",
-    "nukak makú": "mbr",
-    "sarangani manobo": "mbs",
-    "matigsalug manobo": "mbt",
-    "mbula-bwazza": "mbu",
-    "mbulungish": "mbv",
-    "maring": "mbw",
-    "mari (east sepik province)": "mbx",
-    "memoni": "mby",
-    "amoltepec mixtec": "mbz",
-    "maca": "mca",
-    "machiguenga": "mcb",
-    "bitur": "mcc",
-    "sharanahua": "mcd",
-    "itundujia mixtec": "mce",
-    "matsés": "mcf",
-    "mapoyo": "mcg",
-    "maquiritari": "mch",
-    "mese": "mci",
-    "mvanip": "mcj",
-    "mbunda": "mck",
-    "macaguaje": "mcl",
-    "malaccan creole portuguese": "mcm",
-    "masana": "mcn",
-    "coatlán mixe": "mco",
-    "makaa": "mcp",
-    "menya": "mcr",
-    "mambai": "mcs",
-    "mengisa": "mct",
-    "cameroon mambila": "mcu",
-    "minanibai": "mcv",
-    "mawa (chad)": "mcw",
-    "mpiemo": "mcx",
-    "south watut": "mcy",
-    "mawan": "mcz",
-    "mada (nigeria)": "mda",
-    "morigi": "mdb",
-    "male (papua new guinea)": "mdc",
-    "mbum": "mdd",
-    "maba (chad)": "mde",
-    "mdf": "mdf",
-    "moksha": "mdf",
-    "massalat": "mdg",
-    "maguindanaon": "mdh",
-    "mamvu": "mdi",
-    "mangbetu": "mdj",
-    "mangbutu": "mdk",
-    "maltese sign language": "mdl",
-    "mayogo": "mdm",
-    "mbati": "mdn",
-    "mbala": "mdp",
-    "mbole": "mdq",
-    "mdr": "mdr",
-    "mandar": "mdr",
-    "maria (papua new guinea)": "mds",
-    "mbere": "mdt",
-    "mboko": "mdu",
-    "santa lucía monteverde mixtec": "mdv",
-    "mbosi": "mdw",
-    "dizin": "mdx",
-    "male (ethiopia)": "mdy",
-    "suruí do pará": "mdz",
-    "menka": "mea",
-    "ikobi": "meb",
-    "marra": "mec",
-    "melpa": "med",
-    "mengen": "mee",
-    "megam": "mef",
-    "southwestern tlaxiaco mixtec": "meh",
-    "midob": "mei",
-    "meyah": "mej",
-    "mekeo": "mek",
-    "central melanau": "mel",
-    "mangala": "mem",
-    "men": "men",
-    "mende (sierra leone)": "men",
-    "kedah malay": "meo",
-    "miriwoong": "mep",
-    "merey": "meq",
-    "meru": "mer",
-    "masmaje": "mes",
-    "mato": "met",
-    "motu": "meu",
-    "mano": "mev",
-    "maaka": "mew",
-    "hassaniyya": "mey",
-    "menominee": "mez",
-    "pattani malay": "mfa",
-    "bangka": "mfb",
-    "mendankwe-nkwen": "mfd",
-    "morisyen": "mfe",
-    "naki": "mff",
-    "mogofin": "mfg",
-    "matal": "mfh",
-    "wandala": "mfi",
-    "mefele": "mfj",
-    "north mofu": "mfk",
-    "putai": "mfl",
-    "marghi south": "mfm",
-    "cross river mbembe": "mfn",
-    "makassar malay": "mfp",
-    "moba": "mfq",
-    "marrithiyel": "mfr",
-    "mexican sign language": "mfs",
-    "mokerang": "mft",
-    "mbwela": "mfu",
-    "mandjak": "mfv",
-    "mulaha": "mfw",
-    "melo": "mfx",
-    "mayo": "mfy",
-    "mabaan": "mfz",
-    "mga": "mga",
-    "middle irish (900-1200)": "mga",
-    "mararit": "mgb",
-    "morokodo": "mgc",
-    "moru": "mgd",
-    "mango": "mge",
-    "maklew": "mgf",
-    "mpumpong": "mgg",
-    "makhuwa-meetto": "mgh",
-    "lijili": "mgi",
-    "abureni": "mgj",
-    "mawes": "mgk",
-    "maleu-kilenge": "mgl",
-    "mambae": "mgm",
-    "mbangi": "mgn",
-    "meta'": "mgo",
-    "eastern magar": "mgp",
-    "malila": "mgq",
-    "mambwe-lungu": "mgr",
-    "manda (tanzania)": "mgs",
-    "mongol": "mon",
-    "mailu": "mgu",
-    "matengo": "mgv",
-    "matumbi": "mgw",
-    "mbunga": "mgy",
-    "mbugwe": "mgz",
-    "manda (india)": "mha",
-    "mahongwe": "mhb",
-    "mocho": "mhc",
-    "mbugu": "mhd",
-    "besisi": "mhe",
-    "mamaa": "mhf",
-    "margu": "mhg",
-    "ma'di": "mhi",
-    "mogholi": "mhj",
-    "mungaka": "mhk",
-    "mauwake": "mhl",
-    "makhuwa-moniga": "mhm",
-    "mócheno": "mhn",
-    "mashi (zambia)": "mho",
-    "balinese malay": "mhp",
-    "mandan": "mhq",
-    "eastern mari": "mhr",
-    "buru (indonesia)": "mhs",
-    "mandahuaca": "mht",
-    "digaro-mishmi": "mhu",
-    "mbukushu": "mhw",
-    "maru": "mhx",
-    "ma'anyan": "mhy",
-    "mor (mor islands)": "mhz",
-    "miami": "mia",
-    "atatláhuca mixtec": "mib",
-    "mic": "mic",
-    "mi'kmaq": "mic",
-    "mandaic": "mid",
-    "ocotepec mixtec": "mie",
-    "mofu-gudur": "mif",
-    "san miguel el grande mixtec": "mig",
-    "chayuco mixtec": "mih",
-    "chigmecatitlán mixtec": "mii",
-    "abar": "mij",
-    "mikasuki": "mik",
-    "peñoles mixtec": "mil",
-    "alacatlatzala mixtec": "mim",
-    "min": "min",
-    "minangkabau": "min",
-    "pinotepa nacional mixtec": "mio",
-    "apasco-apoala mixtec": "mip",
-    "mískito": "miq",
-    "isthmus mixe": "mir",
-    "mis": "mis",
-    "uncoded languages": "mis",
-    "southern puebla mixtec": "mit",
-    "cacaloxtepec mixtec": "miu",
-    "akoye": "miw",
-    "mixtepec mixtec": "mix",
-    "ayutla mixtec": "miy",
-    "coatzospan mixtec": "miz",
-    "makalero": "mjb",
-    "san juan colorado mixtec": "mjc",
-    "northwest maidu": "mjd",
-    "muskum": "mje",
-    "mwera (nyasa)": "mjh",
-    "kim mun": "mji",
-    "mawak": "mjj",
-    "matukar": "mjk",
-    "mandeali": "mjl",
-    "medebur": "mjm",
-    "ma (papua new guinea)": "mjn",
-    "malankuravan": "mjo",
-    "malapandaram": "mjp",
-    "malaryan": "mjq",
-    "malavedan": "mjr",
-    "miship": "mjs",
-    "sauria paharia": "mjt",
-    "manna-dora": "mju",
-    "mannan": "mjv",
-    "karbi": "mjw",
-    "mahali": "mjx",
-    "mahican": "mjy",
-    "majhi": "mjz",
-    "mbre": "mka",
-    "mal paharia": "mkb",
-    "siliput": "mkc",
-    "mk": "mkd",
-    "mac": "mkd",
-    "mkd": "mkd",
-    "macedonian": "mkd",
-    "mawchi": "mke",
-    "miya": "mkf",
-    "mak (china)": "mkg",
-    "dhatki": "mki",
-    "mokilese": "mkj",
-    "byep": "mkk",
-    "mokole": "mkl",
-    "moklen": "mkm",
-    "kupang malay": "mkn",
-    "mingang doso": "mko",
-    "moikodi": "mkp",
-    "bay miwok": "mkq",
-    "malas": "mkr",
-    "silacayoapan mixtec": "mks",
-    "vamale": "mkt",
-    "konyanka maninka": "mku",
-    "mafea": "mkv",
-    "kituba (congo)": "mkw",
-    "kinamiging manobo": "mkx",
-    "east makian": "mky",
-    "makasae": "mkz",
-    "malo": "mla",
-    "mbule": "mlb",
-    "cao lan": "mlc",
-    "manambu": "mle",
-    "mg": "mlg",
-    "mlg": "mlg",
-    "malagasy": "mlg",
-    "mape": "mlh",
-    "malimpung": "mli",
-    "miltu": "mlj",
-    "ilwana": "mlk",
-    "malua bay": "mll",
-    "mulam": "mlm",
-    "malango": "mln",
-    "mlomp": "mlo",
-    "bargam": "mlp",
-    "western maninkakan": "mlq",
-    "vame": "mlr",
-    "masalit": "mls",
-    "mt": "mlt",
-    "mlt": "mlt",
-    "maltese": "mlt",
-    "to'abaita": "mlu",
-    "motlav": "mlv",
-    "moloko": "mlw",
-    "malfaxal": "mlx",
-    "malaynon": "mlz",
-    "mama": "mma",
-    "momina": "mmb",
-    "michoacán mazahua": "mmc",
-    "maonan": "mmd",
-    "mundat": "mmf",
-    "north ambrym": "mmg",
-    "mehináku": "mmh",
-    "musar": "mmi",
-    "majhwar": "mmj",
-    "mukha-dora": "mmk",
-    "man met": "mml",
-    "maii": "mmm",
-    "mamanwa": "mmn",
-    "mangga buang": "mmo",
-    "siawi": "mmp",
-    "musak": "mmq",
-    "western xiangxi miao": "mmr",
-    "malalamai": "mmt",
-    "mmaala": "mmu",
-    "miriti": "mmv",
-    "emae": "mmw",
-    "madak": "mmx",
-    "migaama": "mmy",
-    "mabaale": "mmz",
-    "mbula": "mna",
-    "muna": "mnb",
-    "mnc": "mnc",
-    "manchu": "mnc",
-    "mondé": "mnd",
-    "naba": "mne",
-    "mundani": "mnf",
-    "eastern mnong": "mng",
-    "mono (democratic republic of congo)": "mnh",
-    "mni": "mni",
-    "manipuri": "mni",
-    "munji": "mnj",
-    "mandinka": "mnk",
-    "tiale": "mnl",
-    "mapena": "mnm",
-    "southern mnong": "mnn",
-    "min bei chinese": "mnp",
-    "minriq": "mnq",
-    "mono (usa)": "mnr",
-    "mansi": "mns",
-    "rennell-bellona": "mnv",
-    "manikion": "mnx",
-    "manyawa": "mny",
-    "moni": "mnz",
-    "mwan": "moa",
-    "mocoví": "moc",
-    "mobilian": "mod",
-    "innu": "moe",
-    "mongondow": "mog",
-    "moh": "moh",
-    "mohawk": "moh",
-    "mboi": "moi",
-    "monzombo": "moj",
-    "morori": "mok",
-    "mangue": "mom",
-    "mn": "mon",
-    "mon": "mon",
-    "mongolian": "mon",
-    "monom": "moo",
-    "mopán maya": "mop",
-    "mor (bomberai peninsula)": "moq",
-    "moro": "mor",
-    "mos": "mos",
-    "mossi": "mos",
-    "barí": "mot",
-    "mogum": "mou",
-    "mohave": "mov",
-    "moi (congo)": "mow",
-    "molima": "mox",
-    "shekkacho": "moy",
-    "mukulu": "moz",
-    "mpoto": "mpa",
-    "malak malak": "mpb",
-    "mangarrayi": "mpc",
-    "machinere": "mpd",
-    "majang": "mpe",
-    "marba": "mpg",
-    "maung": "mph",
-    "mpade": "mpi",
-    "martu wangka": "mpj",
-    "mbara (chad)": "mpk",
-    "middle watut": "mpl",
-    "yosondúa mixtec": "mpm",
-    "mindiri": "mpn",
-    "migabac": "mpp",
-    "matís": "mpq",
-    "vangunu": "mpr",
-    "dadibi": "mps",
-    "mian": "mpt",
-    "makuráp": "mpu",
-    "mungkip": "mpv",
-    "mapidian": "mpw",
-    "misima-panaeati": "mpx",
-    "mapia": "mpy",
-    "maba (indonesia)": "mqa",
-    "mbuko": "mqb",
-    "mangole": "mqc",
-    "matepi": "mqe",
-    "momuna": "mqf",
-    "kota bangun kutai malay": "mqg",
-    "tlazoyaltepec mixtec": "mqh",
-    "mariri": "mqi",
-    "mamasa": "mqj",
-    "rajah kabunsuwan manobo": "mqk",
-    "mbelime": "mql",
-    "south marquesan": "mqm",
-    "moronene": "mqn",
-    "modole": "mqo",
-    "manipa": "mqp",
-    "minokok": "mqq",
-    "mander": "mqr",
-    "west makian": "mqs",
-    "mandari": "mqu",
-    "mosimo": "mqv",
-    "murupi": "mqw",
-    "mamuju": "mqx",
-    "manggarai": "mqy",
-    "pano": "mqz",
-    "mlabri": "mra",
-    "marino": "mrb",
-    "maricopa": "mrc",
-    "western magar": "mrd",
-    "martha's vineyard sign language": "mre",
-    "elseng": "mrf",
-    "mising": "mrg",
-    "mara chin": "mrh",
-    "mi": "mri",
-    "mao": "mri",
-    "mri": "mri",
-    "maori": "mri",
-    "western mari": "mrj",
-    "hmwaveke": "mrk",
-    "mortlockese": "mrl",
-    "merlav": "mrm",
-    "cheke holo": "mrn",
-    "morouas": "mrp",
-    "north marquesan": "mrq",
-    "maria (india)": "mrr",
-    "maragus": "mrs",
-    "marghi central": "mrt",
-    "mono (cameroon)": "mru",
-    "mangareva": "mrv",
-    "maranao": "mrw",
-    "maremgi": "mrx",
-    "mandaya": "mry",
-    "marind": "mrz",
-    "ms": "msa",
-    "may": "msa",
-    "msa": "msa",
-    "malay (macrolanguage)": "msa",
-    "masbatenyo": "msb",
-    "sankaran maninka": "msc",
-    "yucatec maya sign language": "msd",
-    "musey": "mse",
-    "mekwei": "msf",
-    "moraid": "msg",
-    "masikoro malagasy": "msh",
-    "sabah malay": "msi",
-    "ma (democratic republic of congo)": "msj",
-    "mansaka": "msk",
-    "molof": "msl",
-    "agusan manobo": "msm",
-    "vurës": "msn",
-    "mombum": "mso",
-    "maritsauá": "msp",
-    "caac": "msq",
-    "mongolian sign language": "msr",
-    "west masela": "mss",
-    "musom": "msu",
-    "maslam": "msv",
-    "mansoanka": "msw",
-    "moresada": "msx",
-    "aruamu": "msy",
-    "momare": "msz",
-    "cotabato manobo": "mta",
-    "anyin morofo": "mtb",
-    "munit": "mtc",
-    "mualang": "mtd",
-    "mono (solomon islands)": "mte",
-    "murik (papua new guinea)": "mtf",
-    "munggui": "mth",
-    "maiwa (papua new guinea)": "mti",
-    "moskona": "mtj",
-    "mbe'": "mtk",
-    "montol": "mtl",
-    "mator": "mtm",
-    "matagalpa": "mtn",
-    "totontepec mixe": "mto",
-    "wichí lhamtés nocten": "mtp",
-    "muong": "mtq",
-    "mewari": "mtr",
-    "yora": "mts",
-    "mota": "mtt",
-    "tututepec mixtec": "mtu",
-    "asaro'o": "mtv",
-    "southern binukidnon": "mtw",
-    "tidaá mixtec": "mtx",
-    "nabi": "mty",
-    "mundang": "mua",
-    "mubi": "mub",
-    "ajumbu": "muc",
-    "mednyj aleut": "mud",
-    "media lengua": "mue",
-    "musgu": "mug",
-    "mündü": "muh",
-    "musi": "mui",
-    "mabire": "muj",
-    "mugom": "muk",
-    "mul": "mul",
-    "multiple languages": "mul",
-    "maiwala": "mum",
-    "nyong": "muo",
-    "malvi": "mup",
-    "eastern xiangxi miao": "muq",
-    "murle": "mur",
-    "mus": "mus",
-    "creek": "mus",
-    "western muria": "mut",
-    "yaaku": "muu",
-    "muthuvan": "muv",
-    "bo-ung": "mux",
-    "muyang": "muy",
-    "mursi": "muz",
-    "manam": "mva",
-    "mattole": "mvb",
-    "mamboru": "mvd",
-    "marwari (pakistan)": "mve",
-    "peripheral mongolian": "mvf",
-    "yucuañe mixtec": "mvg",
-    "mulgi": "mvh",
-    "miyako": "mvi",
-    "mekmek": "mvk",
-    "mbara (australia)": "mvl",
-    "minaveha": "mvn",
-    "marovo": "mvo",
-    "duri": "mvp",
-    "moere": "mvq",
-    "marau": "mvr",
-    "massep": "mvs",
-    "mpotovoro": "mvt",
-    "marfa": "mvu",
-    "tagal murut": "mvv",
-    "machinga": "mvw",
-    "meoswar": "mvx",
-    "indus kohistani": "mvy",
-    "mesqan": "mvz",
-    "mwatebu": "mwa",
-    "juwal": "mwb",
-    "mwera (chimwera)": "mwe",
-    "murrinh-patha": "mwf",
-    "aiklep": "mwg",
-    "mouk-aria": "mwh",
-    "labo": "mwi",
-    "kita maninkakan": "mwk",
-    "mwl": "mwl",
-    "mirandese": "mwl",
-    "nyamwanga": "mwn",
-    "central maewo": "mwo",
-    "kala lagaw ya": "mwp",
-    "mün chin": "mwq",
-    "mwr": "mwr",
-    "marwari": "mwr",
-    "mwimbi-muthambi": "mws",
-    "moken": "mwt",
-    "mittu": "mwu",
-    "mentawai": "mwv",
-    "hmong daw": "mww",
-    "moingi": "mwz",
-    "northwest oaxaca mixtec": "mxa",
-    "tezoatlán mixtec": "mxb",
-    "manyika": "mxc",
-    "modang": "mxd",
-    "mele-fila": "mxe",
-    "malgbe": "mxf",
-    "mbangala": "mxg",
-    "mvuba": "mxh",
-    "mozarabic": "mxi",
-    "miju-mishmi": "mxj",
-    "monumbo": "mxk",
-    "maxi gbe": "mxl",
-    "meramera": "mxm",
-    "moi (indonesia)": "mxn",
-    "mbowe": "mxo",
-    "tlahuitoltepec mixe": "mxp",
-    "juquila mixe": "mxq",
-    "murik (malaysia)": "mxr",
-    "huitepec mixtec": "mxs",
-    "jamiltepec mixtec": "mxt",
-    "mada (cameroon)": "mxu",
-    "metlatónoc mixtec": "mxv",
-    "namo": "mxw",
-    "mahou": "mxx",
-    "southeastern nochixtlán mixtec": "mxy",
-    "central masela": "mxz",
-    "my": "mya",
-    "bur": "mya",
-    "mya": "mya",
-    "burmese": "mya",
-    "mbay": "myb",
-    "mayeka": "myc",
-    "myene": "mye",
-    "bambassi": "myf",
-    "manta": "myg",
-    "makah": "myh",
-    "mangayat": "myj",
-    "mamara senoufo": "myk",
-    "moma": "myl",
-    "me'en": "mym",
-    "anfillo": "myo",
-    "pirahã": "myp",
-    "muniche": "myr",
-    "mesmes": "mys",
-    "mundurukú": "myu",
-    "myv": "myv",
-    "erzya": "myv",
-    "muyuw": "myw",
-    "masaaba": "myx",
-    "macuna": "myy",
-    "classical mandaic": "myz",
-    "santa maría zacatepec mixtec": "mza",
-    "tumzabt": "mzb",
-    "madagascar sign language": "mzc",
-    "malimba": "mzd",
-    "morawa": "mze",
-    "monastic sign language": "mzg",
-    "wichí lhamtés güisnay": "mzh",
-    "ixcatlán mazatec": "mzi",
-    "manya": "mzj",
-    "nigeria mambila": "mzk",
-    "mazatlán mixe": "mzl",
-    "mumuye": "mzm",
-    "mazanderani": "mzn",
-    "matipuhy": "mzo",
-    "movima": "mzp",
-    "mori atas": "mzq",
-    "marúbo": "mzr",
-    "macanese": "mzs",
-    "mintil": "mzt",
-    "inapang": "mzu",
-    "manza": "mzv",
-    "mawayana": "mzx",
-    "mozambican sign language": "mzy",
-    "maiadomu": "mzz",
-    "namla": "naa",
-    "southern nambikuára": "nab",
-    "narak": "nac",
-    "naka'ela": "nae",
-    "nabak": "naf",
-    "naga pidgin": "nag",
-    "nalu": "naj",
-    "nakanai": "nak",
-    "nalik": "nal",
-    "ngan'gityemerri": "nam",
-    "min nan chinese": "nan",
-    "naaba": "nao",
-    "nap": "nap",
-    "neapolitan": "nap",
-    "khoekhoe": "naq",
-    "iguta": "nar",
-    "naasioi": "nas",
-    "ca̱hungwa̱rya̱": "nat",
-    "na": "nau",
-    "nau": "nau",
-    "nauru": "nau",
-    "nv": "nav",
-    "nav": "nav",
-    "navajo": "nav",
-    "nawuri": "naw",
-    "nakwi": "nax",
-    "ngarrindjeri": "nay",
-    "coatepec nahuatl": "naz",
-    "nyemba": "nba",
-    "ndoe": "nbb",
-    "chang naga": "nbc",
-    "ngbinda": "nbd",
-    "konyak naga": "nbe",
-    "nagarchal": "nbg",
-    "ngamo": "nbh",
-    "mao naga": "nbi",
-    "ngarinyman": "nbj",
-    "nake": "nbk",
-    "nr": "nbl",
-    "nbl": "nbl",
-    "south ndebele": "nbl",
-    "ngbaka ma'bo": "nbm",
-    "kuri": "nbn",
-    "nkukoli": "nbo",
-    "nnam": "nbp",
-    "nggem": "nbq",
-    "numana": "nbr",
-    "namibian sign language": "nbs",
-    "rongmei naga": "nbu",
-    "ngamambo": "nbv",
-    "southern ngbandi": "nbw",
-    "ningera": "nby",
-    "central nicobarese": "ncb",
-    "ponam": "ncc",
-    "nachering": "ncd",
-    "yale": "nce",
-    "notsi": "ncf",
-    "nisga'a": "ncg",
-    "central huasteca nahuatl": "nch",
-    "classical nahuatl": "nci",
-    "northern puebla nahuatl": "ncj",
-    "na-kara": "nck",
-    "michoacán nahuatl": "ncl",
-    "nambo": "ncm",
-    "nauna": "ncn",
-    "sibe": "nco",
-    "northern katang": "ncq",
-    "ncane": "ncr",
-    "nicaraguan sign language": "ncs",
-    "chothe naga": "nct",
-    "chumburung": "ncu",
-    "central puebla nahuatl": "ncx",
-    "natchez": "ncz",
-    "ndasa": "nda",
-    "kenswei nsei": "ndb",
-    "ndau": "ndc",
-    "nde-nsele-nta": "ndd",
-    "nd": "nde",
-    "nde": "nde",
-    "north ndebele": "nde",
-    "nadruvian": "ndf",
-    "ndengereko": "ndg",
-    "ndali": "ndh",
-    "samba leko": "ndi",
-    "ndamba": "ndj",
-    "ndaka": "ndk",
-    "ndolo": "ndl",
-    "ndam": "ndm",
-    "ngundi": "ndn",
-    "ng": "ndo",
-    "ndo": "ndo",
-    "ndonga": "ndo",
-    "ndombe": "ndq",
-    "ndoola": "ndr",
-    "nds": "nds",
-    "low german": "nds",
-    "ndunga": "ndt",
-    "dugun": "ndu",
-    "ndut": "ndv",
-    "ndobo": "ndw",
-    "nduga": "ndx",
-    "lutos": "ndy",
-    "ndogo": "ndz",
-    "eastern ngad'a": "nea",
-    "toura (côte d'ivoire)": "neb",
-    "nedebang": "nec",
-    "nde-gbite": "ned",
-    "nêlêmwa-nixumwak": "nee",
-    "nefamese": "nef",
-    "negidal": "neg",
-    "nyenkha": "neh",
-    "neo-hittite": "nei",
-    "neko": "nej",
-    "neku": "nek",
-    "nemi": "nem",
-    "nengone": "nen",
-    "ná-meo": "neo",
-    "ne": "nep",
-    "nep": "nep",
-    "nepali (macrolanguage)": "nep",
-    "north central mixe": "neq",
-    "yahadian": "ner",
-    "bhoti kinnauri": "nes",
-    "nete": "net",
-    "nyaheun": "nev",
-    "new": "new",
-    "newari": "new",
-    "neme": "nex",
-    "neyo": "ney",
-    "nez perce": "nez",
-    "dhao": "nfa",
-    "ahwai": "nfd",
-    "ayiwo": "nfl",
-    "nafaanra": "nfr",
-    "mfumte": "nfu",
-    "ngbaka": "nga",
-    "northern ngbandi": "ngb",
-    "ngombe (democratic republic of congo)": "ngc",
-    "ngando (central african republic)": "ngd",
-    "ngemba": "nge",
-    "ngbaka manza": "ngg",
-    "nǁng": "ngh",
-    "ngizim": "ngi",
-    "ngie": "ngj",
-    "dalabon": "ngk",
-    "lomwe": "ngl",
-    "ngatik men's creole": "ngm",
-    "ngwo": "ngn",
-    "ngoni": "ngo",
-    "ngulu": "ngp",
-    "ngurimi": "ngq",
-    "engdewu": "ngr",
-    "gvoko": "ngs",
-    "kriang": "ngt",
-    "guerrero nahuatl": "ngu",
-    "nagumi": "ngv",
-    "ngwaba": "ngw",
-    "nggwahyi": "ngx",
-    "tibea": "ngy",
-    "ngungwel": "ngz",
-    "nhanda": "nha",
-    "beng": "nhb",
-    "tabasco nahuatl": "nhc",
-    "chiripá": "nhd",
-    "eastern huasteca nahuatl": "nhe",
-    "nhuwala": "nhf",
-    "tetelcingo nahuatl": "nhg",
-    "nahari": "nhh",
-    "zacatlán-ahuacatlán-tepetzintla nahuatl": "nhi",
-    "isthmus-cosoleacaque nahuatl": "nhk",
-    "morelos nahuatl": "nhm",
-    "central nahuatl": "nhn",
-    "takuu": "nho",
-    "isthmus-pajapan nahuatl": "nhp",
-    "huaxcaleca nahuatl": "nhq",
-    "naro": "nhr",
-    "ometepec nahuatl": "nht",
-    "noone": "nhu",
-    "temascaltepec nahuatl": "nhv",
-    "western huasteca nahuatl": "nhw",
-    "isthmus-mecayapan nahuatl": "nhx",
-    "northern oaxaca nahuatl": "nhy",
-    "santa maría la alta nahuatl": "nhz",
-    "nia": "nia",
-    "nias": "nia",
-    "nakame": "nib",
-    "ngandi": "nid",
-    "niellim": "nie",
-    "ngalakgan": "nig",
-    "nyiha (tanzania)": "nih",
-    "ngaju": "nij",
-    "southern nicobarese": "nik",
-    "nila": "nil",
-    "nilamba": "nim",
-    "ninzo": "nin",
-    "nganasan": "nio",
-    "nandi": "niq",
-    "nimboran": "nir",
-    "nimi": "nis",
-    "southeastern kolami": "nit",
-    "niu": "niu",
-    "niuean": "niu",
-    "gilyak": "niv",
-    "nimo": "niw",
-    "hema": "nix",
-    "ngiti": "niy",
-    "ningil": "niz",
-    "nzanyi": "nja",
-    "nocte naga": "njb",
-    "ndonde hamba": "njd",
-    "lotha naga": "njh",
-    "gudanji": "nji",
-    "njen": "njj",
-    "njalgulgule": "njl",
-    "angami naga": "njm",
-    "liangmai naga": "njn",
-    "ao naga": "njo",
-    "njerep": "njr",
-    "nisa": "njs",
-    "ndyuka-trio pidgin": "njt",
-    "ngadjunmaya": "nju",
-    "kunyi": "njx",
-    "njyem": "njy",
-    "nyishi": "njz",
-    "nkoya": "nka",
-    "khoibu naga": "nkb",
-    "nkongho": "nkc",
-    "koireng": "nkd",
-    "duke": "nke",
-    "inpui naga": "nkf",
-    "nekgini": "nkg",
-    "khezha naga": "nkh",
-    "thangal naga": "nki",
-    "nakai": "nkj",
-    "nokuku": "nkk",
-    "namat": "nkm",
-    "nkangala": "nkn",
-    "nkonya": "nko",
-    "niuatoputapu": "nkp",
-    "nkami": "nkq",
-    "nukuoro": "nkr",
-    "north asmat": "nks",
-    "nyika (tanzania)": "nkt",
-    "bouna kulango": "nku",
-    "nyika (malawi and zambia)": "nkv",
-    "nkutu": "nkw",
-    "nkoroo": "nkx",
-    "nkari": "nkz",
-    "ngombale": "nla",
-    "nalca": "nlc",
-    "nl": "nld",
-    "dut": "nld",
-    "nld": "nld",
-    "dutch": "nld",
-    "east nyala": "nle",
-    "gela": "nlg",
-    "grangali": "nli",
-    "nyali": "nlj",
-    "ninia yali": "nlk",
-    "nihali": "nll",
-    "mankiyali": "nlm",
-    "ngul": "nlo",
-    "lao naga": "nlq",
-    "nchumbulu": "nlu",
-    "orizaba nahuatl": "nlv",
-    "walangama": "nlw",
-    "nahali": "nlx",
-    "nyamal": "nly",
-    "nalögo": "nlz",
-    "maram naga": "nma",
-    "big nambas": "nmb",
-    "ngam": "nmc",
-    "ndumu": "nmd",
-    "mzieme naga": "nme",
-    "tangkhul naga (india)": "nmf",
-    "kwasio": "nmg",
-    "monsang naga": "nmh",
-    "nyam": "nmi",
-    "ngombe (central african republic)": "nmj",
-    "namakura": "nmk",
-    "ndemli": "nml",
-    "manangba": "nmm",
-    "ǃxóõ": "nmn",
-    "moyon naga": "nmo",
-    "nimanbur": "nmp",
-    "nambya": "nmq",
-    "nimbari": "nmr",
-    "letemboi": "nms",
-    "namonuito": "nmt",
-    "northeast maidu": "nmu",
-    "ngamini": "nmv",
-    "nimoa": "nmw",
-    "nama (papua new guinea)": "nmx",
-    "namuyi": "nmy",
-    "nawdm": "nmz",
-    "nyangumarta": "nna",
-    "nande": "nnb",
-    "nancere": "nnc",
-    "west ambae": "nnd",
-    "ngandyera": "nne",
-    "ngaing": "nnf",
-    "maring naga": "nng",
-    "ngiemboon": "nnh",
-    "north nuaulu": "nni",
-    "nyangatom": "nnj",
-    "nankina": "nnk",
-    "northern rengma naga": "nnl",
-    "namia": "nnm",
-    "ngete": "nnn",
-    "nn": "nno",
-    "nno": "nor",
-    "norwegian nynorsk": "nno",
-    "wancho naga": "nnp",
-    "ngindo": "nnq",
-    "narungga": "nnr",
-    "nanticoke": "nnt",
-    "dwang": "nnu",
-    "nugunu (australia)": "nnv",
-    "southern nuni": "nnw",
-    "nyangga": "nny",
-    "nda'nda'": "nnz",
-    "woun meu": "noa",
-    "nb": "nob",
-    "nob": "nob",
-    "norwegian bokmål": "nob",
-    "northern thai": "nod",
-    "nimadi": "noe",
-    "nomane": "nof",
-    "nog": "nog",
-    "nogai": "nog",
-    "nomu": "noh",
-    "noiri": "noi",
-    "nonuya": "noj",
-    "nooksack": "nok",
-    "nomlaki": "nol",
-    "nocamán": "nom",
-    "non": "non",
-    "old norse": "non",
-    "numanggang": "nop",
-    "ngongo": "noq",
-    "no": "nor",
-    "nor": "nor",
-    "norwegian": "nor",
-    "eastern nisu": "nos",
-    "nomatsiguenga": "not",
-    "ewage-notu": "nou",
-    "novial": "nov",
-    "nyambo": "now",
-    "nayi": "noz",
-    "nar phu": "npa",
-    "nupbikha": "npb",
-    "ponyo-gongwang naga": "npg",
-    "phom naga": "nph",
-    "nepali (individual language)": "npi",
-    "southeastern puebla nahuatl": "npl",
-    "mondropolon": "npn",
-    "pochuri naga": "npo",
-    "nipsan": "nps",
-    "puimei naga": "npu",
-    "noipx": "npx",
-    "napu": "npy",
-    "southern nago": "nqg",
-    "kura ede nago": "nqk",
-    "ngendelengo": "nql",
-    "ndom": "nqm",
-    "nqo": "nqo",
-    "n'ko": "nqo",
-    "kyan-karyaw naga": "nqq",
-    "nteng": "nqt",
-    "akyaung ari naga": "nqy",
-    "ngom": "nra",
-    "nara": "nrb",
-    "noric": "nrc",
-    "southern rengma naga": "nre",
-    "jèrriais": "nrf",
-    "narango": "nrg",
-    "chokri naga": "nri",
-    "ngarla": "nrk",
-    "ngarluma": "nrl",
-    "narom": "nrm",
-    "norn": "nrn",
-    "north picene": "nrp",
-    "norra": "nrr",
-    "northern kalapuya": "nrt",
-    "narua": "nru",
-    "ngurmbur": "nrx",
-    "lala": "nrz",
-    "sangtam naga": "nsa",
-    "lower nossob": "nsb",
-    "nshi": "nsc",
-    "southern nisu": "nsd",
-    "nsenga": "nse",
-    "northwestern nisu": "nsf",
-    "ngasa": "nsg",
-    "ngoshie": "nsh",
-    "nigerian sign language": "nsi",
-    "naskapi": "nsk",
-    "norwegian sign language": "nsl",
-    "sumi naga": "nsm",
-    "nehan": "nsn",
-    "nso": "nso",
-    "pedi": "nso",
-    "nepalese sign language": "nsp",
-    "northern sierra miwok": "nsq",
-    "maritime sign language": "nsr",
-    "nali": "nss",
-    "tase naga": "nst",
-    "sierra negra nahuatl": "nsu",
-    "southwestern nisu": "nsv",
-    "navut": "nsw",
-    "nsongo": "nsx",
-    "nasal": "nsy",
-    "nisenan": "nsz",
-    "northern tidung": "ntd",
-    "nathembo": "nte",
-    "ngantangarra": "ntg",
-    "natioro": "nti",
-    "ngaanyatjarra": "ntj",
-    "ikoma-nata-isenye": "ntk",
-    "nateni": "ntm",
-    "ntomba": "nto",
-    "northern tepehuan": "ntp",
-    "delo": "ntr",
-    "natügu": "ntu",
-    "nottoway": "ntw",
-    "tangkhul naga (myanmar)": "ntx",
-    "mantsi": "nty",
-    "natanzi": "ntz",
-    "yuanga": "nua",
-    "nukuini": "nuc",
-    "ngala": "nud",
-    "ngundu": "nue",
-    "nusu": "nuf",
-    "nungali": "nug",
-    "ndunda": "nuh",
-    "ngumbi": "nui",
-    "nyole": "nuj",
-    "nuu-chah-nulth": "nuk",
-    "nusa laut": "nul",
-    "niuafo'ou": "num",
-    "anong": "nun",
-    "nguôn": "nuo",
-    "nupe-nupe-tako": "nup",
-    "nukumanu": "nuq",
-    "nukuria": "nur",
-    "nuer": "nus",
-    "nung (viet nam)": "nut",
-    "ngbundu": "nuu",
-    "northern nuni": "nuv",
-    "nguluwan": "nuw",
-    "mehek": "nux",
-    "nunggubuyu": "nuy",
-    "tlamacazapa nahuatl": "nuz",
-    "nasarian": "nvh",
-    "namiae": "nvm",
-    "nyokon": "nvo",
-    "nawathinehena": "nwa",
-    "nyabwa": "nwb",
-    "nwc": "nwc",
-    "classical newari": "nwc",
-    "ngwe": "nwe",
-    "ngayawung": "nwg",
-    "southwest tanna": "nwi",
-    "nyamusa-molo": "nwm",
-    "nauo": "nwo",
-    "nawaru": "nwr",
-    "middle newar": "nwx",
-    "nottoway-meherrin": "nwy",
-    "nauete": "nxa",
-    "ngando (democratic republic of congo)": "nxd",
-    "nage": "nxe",
-    "ngad'a": "nxg",
-    "nindi": "nxi",
-    "koki naga": "nxk",
-    "south nuaulu": "nxl",
-    "numidian": "nxm",
-    "ngawun": "nxn",
-    "ndambomo": "nxo",
-    "naxi": "nxq",
-    "ninggerum": "nxr",
-    "nafri": "nxx",
-    "ny": "nya",
-    "nya": "nya",
-    "nyanja": "nya",
-    "nyangbo": "nyb",
-    "nyanga-li": "nyc",
-    "nyore": "nyd",
-    "nyengo": "nye",
-    "giryama": "nyf",
-    "nyindu": "nyg",
-    "nyikina": "nyh",
-    "ama (sudan)": "nyi",
-    "nyanga": "nyj",
-    "nyaneka": "nyk",
-    "nyeu": "nyl",
-    "nym": "nym",
-    "nyamwezi": "nym",
-    "nyn": "nyn",
-    "nyankole": "nyn",
-    "nyo": "nyo",
-    "nyoro": "nyo",
-    "nyang'i": "nyp",
-    "nayini": "nyq",
-    "nyiha (malawi)": "nyr",
-    "nyungar": "nys",
-    "nyawaygi": "nyt",
-    "nyungwe": "nyu",
-    "nyulnyul": "nyv",
-    "nyaw": "nyw",
-    "nganyaywana": "nyx",
-    "nyakyusa-ngonde": "nyy",
-    "tigon mbembe": "nza",
-    "njebi": "nzb",
-    "nzadi": "nzd",
-    "nzi": "nzi",
-    "nzima": "nzi",
-    "nzakara": "nzk",
-    "zeme naga": "nzm",
-    "new zealand sign language": "nzs",
-    "teke-nzikou": "nzu",
-    "nzakambay": "nzy",
-    "nanga dama dogon": "nzz",
-    "orok": "oaa",
-    "oroch": "oac",
-    "old aramaic (up to 700 bce)": "oar",
-    "old avar": "oav",
-    "obispeño": "obi",
-    "southern bontok": "obk",
-    "oblo": "obl",
-    "moabite": "obm",
-    "obo manobo": "obo",
-    "old burmese": "obr",
-    "old breton": "obt",
-    "obulom": "obu",
-    "ocaina": "oca",
-    "old chinese": "och",
-    "oc": "oci",
-    "oci": "oci",
-    "occitan (post 1500)": "oci",
-    "old cham": "ocm",
-    "old cornish": "oco",
-    "atzingo matlatzinca": "ocu",
-    "odut": "oda",
-    "old dutch": "odt",
-    "odual": "odu",
-    "old frisian": "ofs",
-    "efutop": "ofu",
-    "ogbia": "ogb",
-    "ogbah": "ogc",
-    "old georgian": "oge",
-    "ogbogolo": "ogg",
-    "khana": "ogo",
-    "ogbronuagum": "ogu",
-    "old hittite": "oht",
-    "old hungarian": "ohu",
-    "oirata": "oia",
-    "inebu one": "oin",
-    "northwestern ojibwa": "ojb",
-    "central ojibwa": "ojc",
-    "eastern ojibwa": "ojg",
-    "oj": "oji",
-    "oji": "oji",
-    "ojibwa": "oji",
-    "old japanese": "ojp",
-    "severn ojibwa": "ojs",
-    "ontong java": "ojv",
-    "western ojibwa": "ojw",
-    "okanagan": "oka",
-    "okobo": "okb",
-    "kobo": "okc",
-    "okodia": "okd",
-    "okpe (southwestern edo)": "oke",
-    "koko babangk": "okg",
-    "koresh-e rostam": "okh",
-    "okiek": "oki",
-    "oko-juwoi": "okj",
-    "kwamtim one": "okk",
-    "old kentish sign language": "okl",
-    "middle korean (10th-16th cent.)": "okm",
-    "oki-no-erabu": "okn",
-    "old korean (3rd-9th cent.)": "oko",
-    "kirike": "okr",
-    "oko-eni-osayen": "oks",
-    "orokaiva": "okv",
-    "okpe (northwestern edo)": "okx",
-    "old khmer": "okz",
-    "walungge": "ola",
-    "mochi": "old",
-    "olekha": "ole",
-    "olkol": "olk",
-    "oloma": "olm",
-    "livvi": "olo",
-    "olrat": "olr",
-    "old lithuanian": "olt",
-    "kuvale": "olu",
-    "omaha-ponca": "oma",
-    "east ambae": "omb",
-    "mochica": "omc",
-    "omagua": "omg",
-    "omok": "omk",
-    "ombo": "oml",
-    "minoan": "omn",
-    "utarmbung": "omo",
-    "old manipuri": "omp",
-    "old marathi": "omr",
-    "omotik": "omt",
-    "omurano": "omu",
-    "south tairora": "omw",
-    "old mon": "omx",
-    "old malay": "omy",
-    "lingao": "onb",
-    "oneida": "one",
-    "onin": "oni",
-    "onjob": "onj",
-    "kabore one": "onk",
-    "onobasulu": "onn",
-    "onondaga": "ono",
-    "sartang": "onp",
-    "northern one": "onr",
-    "ontenu": "ont",
-    "unua": "onu",
-    "old nubian": "onw",
-    "onin based pidgin": "onx",
-    "tohono o'odham": "ood",
-    "önge": "oon",
-    "oorlams": "oor",
-    "old ossetic": "oos",
-    "okpamheri": "opa",
-    "kopkaka": "opk",
-    "oksapmin": "opm",
-    "opao": "opo",
-    "opata": "opt",
-    "ofayé": "opy",
-    "oroha": "ora",
-    "orma": "orc",
-    "orejón": "ore",
-    "oring": "org",
-    "oroqen": "orh",
-    "or": "ori",
-    "ori": "ori",
-    "oriya (macrolanguage)": "ori",
-    "om": "orm",
-    "orm": "orm",
-    "oromo": "orm",
-    "orang kanaq": "orn",
-    "orokolo": "oro",
-    "oruma": "orr",
-    "orang seletar": "ors",
-    "adivasi oriya": "ort",
-    "ormuri": "oru",
-    "old russian": "orv",
-    "oro win": "orw",
-    "odia": "ory",
-    "ormu": "orz",
-    "osa": "osa",
-    "osage": "osa",
-    "oscan": "osc",
-    "osing": "osi",
-    "old sundanese": "osn",
-    "ososo": "oso",
-    "old spanish": "osp",
-    "os": "oss",
-    "oss": "oss",
-    "ossetian": "oss",
-    "osatu": "ost",
-    "southern one": "osu",
-    "old saxon": "osx",
-    "ota": "ota",
-    "ottoman turkish (1500-1928)": "ota",
-    "old tibetan": "otb",
-    "ot danum": "otd",
-    "mezquital otomi": "ote",
-    "old turkish": "otk",
-    "tilapa otomi": "otl",
-    "eastern highland otomi": "otm",
-    "tenango otomi": "otn",
-    "querétaro otomi": "otq",
-    "otoro": "otr",
-    "estado de méxico otomi": "ots",
-    "temoaya otomi": "ott",
-    "otuke": "otu",
-    "ottawa": "otw",
-    "texcatepec otomi": "otx",
-    "old tamil": "oty",
-    "ixtenco otomi": "otz",
-    "tagargrent": "oua",
-    "glio-oubi": "oub",
-    "oune": "oue",
-    "old uighur": "oui",
-    "ouma": "oum",
-    "elfdalian": "ovd",
-    "owiniga": "owi",
-    "old welsh": "owl",
-    "oyda": "oyd",
-    "wayampi": "oym",
-    "oya'oya": "oyy",
-    "koonzime": "ozm",
-    "parecís": "pab",
-    "pacoh": "pac",
-    "paumarí": "pad",
-    "pagibete": "pae",
-    "paranawát": "paf",
-    "pag": "pag",
-    "pangasinan": "pag",
-    "tenharim": "pah",
-    "parakanã": "pak",
-    "pal": "pal",
-    "pahlavi": "pal",
-    "pam": "pam",
-    "pampanga": "pam",
-    "pa": "pan",
-    "pan": "pan",
-    "panjabi": "pan",
-    "northern paiute": "pao",
-    "pap": "pap",
-    "papiamento": "pap",
-    "parya": "paq",
-    "panamint": "par",
-    "papasena": "pas",
-    "pau": "pau",
-    "palauan": "pau",
-    "pakaásnovos": "pav",
-    "pawnee": "paw",
-    "pankararé": "pax",
-    "pech": "pay",
-    "pankararú": "paz",
-    "páez": "pbb",
-    "patamona": "pbc",
-    "mezontla popoloca": "pbe",
-    "coyotepec popoloca": "pbf",
-    "paraujano": "pbg",
-    "e'ñapa woromaipu": "pbh",
-    "parkwa": "pbi",
-    "mak (nigeria)": "pbl",
-    "puebla mazatec": "pbm",
-    "kpasam": "pbn",
-    "papel": "pbo",
-    "badyara": "pbp",
-    "pangwa": "pbr",
-    "central pame": "pbs",
-    "southern pashto": "pbt",
-    "northern pashto": "pbu",
-    "pnar": "pbv",
-    "pyu (papua new guinea)": "pby",
-    "santa inés ahuatempan popoloca": "pca",
-    "pear": "pcb",
-    "bouyei": "pcc",
-    "picard": "pcd",
-    "ruching palaung": "pce",
-    "paliyan": "pcf",
-    "paniya": "pcg",
-    "pardhan": "pch",
-    "duruwa": "pci",
-    "parenga": "pcj",
-    "paite chin": "pck",
-    "pardhi": "pcl",
-    "nigerian pidgin": "pcm",
-    "piti": "pcn",
-    "pacahuara": "pcp",
-    "pyapun": "pcw",
-    "anam": "pda",
-    "pennsylvania german": "pdc",
-    "pa di": "pdi",
-    "podena": "pdn",
-    "padoe": "pdo",
-    "plautdietsch": "pdt",
-    "kayan": "pdu",
-    "peranakan indonesian": "pea",
-    "eastern pomo": "peb",
-    "mala (papua new guinea)": "ped",
-    "taje": "pee",
-    "northeastern pomo": "pef",
-    "pengo": "peg",
-    "bonan": "peh",
-    "chichimeca-jonaz": "pei",
-    "northern pomo": "pej",
-    "penchal": "pek",
-    "pekal": "pel",
-    "phende": "pem",
-    "peo": "peo",
-    "old persian (ca. 600-400 b.c.)": "peo",
-    "kunja": "pep",
-    "southern pomo": "peq",
-    "iranian persian": "pes",
-    "pémono": "pev",
-    "petats": "pex",
-    "petjo": "pey",
-    "eastern penan": "pez",
-    "pááfang": "pfa",
-    "pere": "pfe",
-    "pfaelzisch": "pfl",
-    "sudanese creole arabic": "pga",
-    "gāndhārī": "pgd",
-    "pangwali": "pgg",
-    "pagi": "pgi",
-    "rerep": "pgk",
-    "primitive irish": "pgl",
-    "paelignian": "pgn",
-    "pangseng": "pgs",
-    "pagu": "pgu",
-    "papua new guinean sign language": "pgz",
-    "pa-hng": "pha",
-    "phudagi": "phd",
-    "phuong": "phg",
-    "phukha": "phh",
-    "phake": "phk",
-    "phalura": "phl",
-    "phimbi": "phm",
-    "phn": "phn",
-    "phoenician": "phn",
-    "phunoi": "pho",
-    "phana'": "phq",
-    "pahari-potwari": "phr",
-    "phu thai": "pht",
-    "phuan": "phu",
-    "pahlavani": "phv",
-    "phangduwali": "phw",
-    "pima bajo": "pia",
-    "yine": "pib",
-    "pinji": "pic",
-    "piaroa": "pid",
-    "piro": "pie",
-    "pingelapese": "pif",
-    "pisabo": "pig",
-    "pitcairn-norfolk": "pih",
-    "pini": "pii",
-    "pijao": "pij",
-    "powhatan": "pim",
-    "piame": "pin",
-    "piapoco": "pio",
-    "pero": "pip",
-    "piratapuyo": "pir",
-    "pijin": "pis",
-    "pitta pitta": "pit",
-    "pintupi-luritja": "piu",
-    "pileni": "piv",
-    "pimbwe": "piw",
-    "piya-kwonci": "piy",
-    "pije": "piz",
-    "pitjantjatjara": "pjt",
-    "ardhamāgadhī prākrit": "pka",
-    "pokomo": "pkb",
-    "paekche": "pkc",
-    "pak-tong": "pkg",
-    "pankhu": "pkh",
-    "pakanha": "pkn",
-    "pökoot": "pko",
-    "pukapuka": "pkp",
-    "attapady kurumba": "pkr",
-    "pakistan sign language": "pks",
-    "maleng": "pkt",
-    "paku": "pku",
-    "miani": "pla",
-    "polonombauk": "plb",
-    "central palawano": "plc",
-    "polari": "pld",
-    "palu'e": "ple",
-    "pilagá": "plg",
-    "paulohi": "plh",
-    "pi": "pli",
-    "pli": "pli",
-    "pali": "pli",
-    "polci": "plj",
-    "kohistani shina": "plk",
-    "shwe palaung": "pll",
-    "palenquero": "pln",
-    "oluta popoluca": "plo",
-    "palaic": "plq",
-    "palaka senoufo": "plr",
-    "san marcos tlacoyalco popoloca": "pls",
-    "plateau malagasy": "plt",
-    "palikúr": "plu",
-    "southwest palawano": "plv",
-    "brooke's point palawano": "plw",
-    "bolyu": "ply",
-    "paluan": "plz",
-    "paama": "pma",
-    "pambia": "pmb",
-    "pallanganmiddang": "pmd",
-    "pwaamei": "pme",
-    "pamona": "pmf",
-    "māhārāṣṭri prākrit": "pmh",
-    "northern pumi": "pmi",
-    "southern pumi": "pmj",
-    "pamlico": "pmk",
-    "lingua franca": "pml",
-    "pomo": "pmm",
-    "northern pame": "pmq",
-    "paynamar": "pmr",
-    "piemontese": "pms",
-    "tuamotuan": "pmt",
-    "plains miwok": "pmw",
-    "poumei naga": "pmx",
-    "papuan malay": "pmy",
-    "southern pame": "pmz",
-    "punan bah-biau": "pna",
-    "western panjabi": "pnb",
-    "pannei": "pnc",
-    "mpinda": "pnd",
-    "western penan": "pne",
-    "pangu": "png",
-    "penrhyn": "pnh",
-    "aoheng": "pni",
-    "pinjarup": "pnj",
-    "paunaka": "pnk",
-    "paleni": "pnl",
-    "punan batu 1": "pnm",
-    "pinai-hagahai": "pnn",
-    "panobo": "pno",
-    "pancana": "pnp",
-    "pana (burkina faso)": "pnq",
-    "panim": "pnr",
-    "ponosakan": "pns",
-    "pontic": "pnt",
-    "jiongnai bunu": "pnu",
-    "pinigura": "pnv",
-    "banyjima": "pnw",
-    "phong-kniang": "pnx",
-    "pinyin": "pny",
-    "pana (central african republic)": "pnz",
-    "poqomam": "poc",
-    "san juan atzingo popoloca": "poe",
-    "poke": "pof",
-    "potiguára": "pog",
-    "poqomchi'": "poh",
-    "highland popoluca": "poi",
-    "pokangá": "pok",
-    "pl": "pol",
-    "pol": "pol",
-    "polish": "pol",
-    "southeastern pomo": "pom",
-    "pon": "pon",
-    "pohnpeian": "pon",
-    "central pomo": "poo",
-    "pwapwâ": "pop",
-    "texistepec popoluca": "poq",
-    "pt": "por",
-    "por": "por",
-    "portuguese": "por",
-    "sayula popoluca": "pos",
-    "potawatomi": "pot",
-    "upper guinea crioulo": "pov",
-    "san felipe otlaltepec popoloca": "pow",
-    "polabian": "pox",
-    "pogolo": "poy",
-    "papi": "ppe",
-    "paipai": "ppi",
-    "pipil": "ppl",
-    "papuma": "ppm",
-    "papapana": "ppn",
-    "folopa": "ppo",
-    "pelende": "ppp",
-    "san luís temalacayuca popoloca": "pps",
-    "pare": "ppt",
-    "papora": "ppu",
-    "pa'a": "pqa",
-    "malecite-passamaquoddy": "pqm",
-    "parachi": "prc",
-    "parsi-dari": "prd",
-    "principense": "pre",
-    "paranan": "prf",
-    "prussian": "prg",
-    "porohanon": "prh",
-    "paicî": "pri",
-    "parauk": "prk",
-    "peruvian sign language": "prl",
-    "kibiri": "prm",
-    "prasuni": "prn",
-    "pro": "pro",
-    "old provençal (to 1500)": "pro",
-    "parsi": "prp",
-    "ashéninka perené": "prq",
-    "puri": "prr",
-    "dari": "prs",
-    "phai": "prt",
-    "puragi": "pru",
-    "parawen": "prw",
-    "purik": "prx",
-    "providencia sign language": "prz",
-    "asue awyu": "psa",
-    "persian sign language": "psc",
-    "plains indian sign language": "psd",
-    "central malay": "pse",
-    "penang sign language": "psg",
-    "southwest pashai": "psh",
-    "southeast pashai": "psi",
-    "puerto rican sign language": "psl",
-    "pauserna": "psm",
-    "panasuan": "psn",
-    "polish sign language": "pso",
-    "philippine sign language": "psp",
-    "pasi": "psq",
-    "portuguese sign language": "psr",
-    "kaulong": "pss",
-    "central pashto": "pst",
-    "sauraseni prākrit": "psu",
-    "port sandwich": "psw",
-    "piscataway": "psy",
-    "pai tavytera": "pta",
-    "pataxó hã-ha-hãe": "pth",
-    "pindiini": "pti",
-    "patani": "ptn",
-    "zo'é": "pto",
-    "patep": "ptp",
-    "pattapu": "ptq",
-    "piamatsina": "ptr",
-    "enrekang": "ptt",
-    "bambam": "ptu",
-    "port vato": "ptv",
-    "pentlatch": "ptw",
-    "pathiya": "pty",
-    "western highland purepecha": "pua",
-    "purum": "pub",
-    "punan merap": "puc",
-    "punan aput": "pud",
-    "puelche": "pue",
-    "punan merah": "puf",
-    "phuie": "pug",
-    "puinave": "pui",
-    "punan tubu": "puj",
-    "puma": "pum",
-    "puoc": "puo",
-    "pulabu": "pup",
-    "puquina": "puq",
-    "puruborá": "pur",
-    "ps": "pus",
-    "pus": "pus",
-    "pushto": "pus",
-    "putoh": "put",
-    "punu": "puu",
-    "puluwatese": "puw",
-    "puare": "pux",
-    "purisimeño": "puy",
-    "pawaia": "pwa",
-    "panawa": "pwb",
-    "gapapaiwa": "pwg",
-    "patwin": "pwi",
-    "molbog": "pwm",
-    "paiwan": "pwn",
-    "pwo western karen": "pwo",
-    "powari": "pwr",
-    "pwo northern karen": "pww",
-    "quetzaltepec mixe": "pxm",
-    "pye krumen": "pye",
-    "fyam": "pym",
-    "poyanáwa": "pyn",
-    "paraguayan sign language": "pys",
-    "puyuma": "pyu",
-    "pyu (myanmar)": "pyx",
-    "pyen": "pyy",
-    "para naga": "pzn",
-    "quapaw": "qua",
-    "huallaga huánuco quechua": "qub",
-    "k'iche'": "quc",
-    "calderón highland quichua": "qud",
-    "qu": "que",
-    "que": "que",
-    "quechua": "que",
-    "lambayeque quechua": "quf",
-    "chimborazo highland quichua": "qug",
-    "south bolivian quechua": "quh",
-    "quileute": "qui",
-    "chachapoyas quechua": "quk",
-    "north bolivian quechua": "qul",
-    "sipacapense": "qum",
-    "quinault": "qun",
-    "southern pastaza quechua": "qup",
-    "quinqui": "quq",
-    "yanahuanca pasco quechua": "qur",
-    "santiago del estero quichua": "qus",
-    "sacapulteco": "quv",
-    "tena lowland quichua": "quw",
-    "yauyos quechua": "qux",
-    "ayacucho quechua": "quy",
-    "cusco quechua": "quz",
-    "ambo-pasco quechua": "qva",
-    "cajamarca quechua": "qvc",
-    "eastern apurímac quechua": "qve",
-    "huamalíes-dos de mayo huánuco quechua": "qvh",
-    "imbabura highland quichua": "qvi",
-    "loja highland quichua": "qvj",
-    "cajatambo north lima quechua": "qvl",
-    "margos-yarowilca-lauricocha quechua": "qvm",
-    "north junín quechua": "qvn",
-    "napo lowland quechua": "qvo",
-    "pacaraos quechua": "qvp",
-    "san martín quechua": "qvs",
-    "huaylla wanca quechua": "qvw",
-    "queyu": "qvy",
-    "northern pastaza quichua": "qvz",
-    "corongo ancash quechua": "qwa",
-    "classical quechua": "qwc",
-    "huaylas ancash quechua": "qwh",
-    "kuman (russia)": "qwm",
-    "sihuas ancash quechua": "qws",
-    "kwalhioqua-tlatskanai": "qwt",
-    "chiquián ancash quechua": "qxa",
-    "chincha quechua": "qxc",
-    "panao huánuco quechua": "qxh",
-    "salasaca highland quichua": "qxl",
-    "northern conchucos ancash quechua": "qxn",
-    "southern conchucos ancash quechua": "qxo",
-    "puno quechua": "qxp",
-    "qashqa'i": "qxq",
-    "cañar highland quichua": "qxr",
-    "southern qiang": "qxs",
-    "santa ana de tusi pasco quechua": "qxt",
-    "arequipa-la unión quechua": "qxu",
-    "jauja wanca quechua": "qxw",
-    "quenya": "qya",
-    "quiripi": "qyp",
-    "dungmali": "raa",
-    "camling": "rab",
-    "rasawa": "rac",
-    "rade": "rad",
-    "western meohang": "raf",
-    "logooli": "rag",
-    "rabha": "rah",
-    "ramoaaina": "rai",
-    "raj": "raj",
-    "rajasthani": "raj",
-    "tulu-bohuai": "rak",
-    "ralte": "ral",
-    "canela": "ram",
-    "riantana": "ran",
-    "rap": "rap",
-    "rapanui": "rap",
-    "saam": "raq",
-    "rar": "rar",
-    "rarotongan": "rar",
-    "tegali": "ras",
-    "razajerdi": "rat",
-    "raute": "rau",
-    "sampang": "rav",
-    "rawang": "raw",
-    "rang": "rax",
-    "rapa": "ray",
-    "rahambuu": "raz",
-    "rumai palaung": "rbb",
-    "northern bontok": "rbk",
-    "miraya bikol": "rbl",
-    "barababaraba": "rbp",
-    "réunion creole french": "rcf",
-    "rudbari": "rdb",
-    "rerau": "rea",
-    "rembong": "reb",
-    "rejang kayan": "ree",
-    "kara (tanzania)": "reg",
-    "reli": "rei",
-    "rejang": "rej",
-    "rendille": "rel",
-    "remo": "rem",
-    "rengao": "ren",
-    "rer bare": "rer",
-    "reshe": "res",
-    "retta": "ret",
-    "reyesano": "rey",
-    "roria": "rga",
-    "romano-greek": "rge",
-    "rangkas": "rgk",
-    "romagnol": "rgn",
-    "resígaro": "rgr",
-    "southern roglai": "rgs",
-    "ringgou": "rgu",
-    "rohingya": "rhg",
-    "yahang": "rhp",
-    "riang (india)": "ria",
-    "tarifit": "rif",
-    "riang lang": "ril",
-    "nyaturu": "rim",
-    "nungu": "rin",
-    "ribun": "rir",
-    "ritharrngu": "rit",
-    "riung": "riu",
-    "rajong": "rjg",
-    "raji": "rji",
-    "rajbanshi": "rjs",
-    "kraol": "rka",
-    "rikbaktsa": "rkb",
-    "rakahanga-manihiki": "rkh",
-    "rakhine": "rki",
-    "marka": "rkm",
-    "rangpuri": "rkt",
-    "arakwal": "rkw",
-    "rama": "rma",
-    "rembarrnga": "rmb",
-    "carpathian romani": "rmc",
-    "traveller danish": "rmd",
-    "angloromani": "rme",
-    "kalo finnish romani": "rmf",
-    "traveller norwegian": "rmg",
-    "murkim": "rmh",
-    "lomavren": "rmi",
-    "romkun": "rmk",
-    "baltic romani": "rml",
-    "roma": "rmm",
-    "balkan romani": "rmn",
-    "sinte romani": "rmo",
-    "rempi": "rmp",
-    "caló": "rmq",
-    "romanian sign language": "rms",
-    "domari": "rmt",
-    "tavringer romani": "rmu",
-    "romanova": "rmv",
-    "welsh romani": "rmw",
-    "romam": "rmx",
-    "vlax romani": "rmy",
-    "marma": "rmz",
-    "ruund": "rnd",
-    "ronga": "rng",
-    "ranglong": "rnl",
-    "roon": "rnn",
-    "rongpo": "rnp",
-    "nari nari": "rnr",
-    "rungwa": "rnw",
-    "tae'": "rob",
-    "cacgia roglai": "roc",
-    "rogo": "rod",
-    "ronji": "roe",
-    "rombo": "rof",
-    "northern roglai": "rog",
-    "rm": "roh",
-    "roh": "roh",
-    "romansh": "roh",
-    "romblomanon": "rol",
-    "rom": "ron",
-    "romany": "rom",
-    "ro": "ron",
-    "rum": "ron",
-    "ron": "ron",
-    "romanian": "ron",
-    "rotokas": "roo",
-    "kriol": "rop",
-    "rongga": "ror",
-    "runga": "rou",
-    "dela-oenale": "row",
-    "repanbitip": "rpn",
-    "rapting": "rpt",
-    "ririo": "rri",
-    "waima": "rro",
-    "arritinngithigh": "rrt",
-    "romano-serbian": "rsb",
-    "russian sign language": "rsl",
-    "miriwoong sign language": "rsm",
-    "rungtu chin": "rtc",
-    "ratahan": "rth",
-    "rotuman": "rtm",
-    "yurats": "rts",
-    "rathawi": "rtw",
-    "gungu": "rub",
-    "ruuli": "ruc",
-    "rusyn": "rue",
-    "luguru": "ruf",
-    "roviana": "rug",
-    "ruga": "ruh",
-    "rufiji": "rui",
-    "rn": "run",
-    "run": "run",
-    "rundi": "run",
-    "istro romanian": "ruo",
-    "rup": "rup",
-    "macedo-romanian": "rup",
-    "megleno romanian": "ruq",
-    "ru": "rus",
-    "rus": "rus",
-    "russian": "rus",
-    "rutul": "rut",
-    "lanas lobu": "ruu",
-    "mala (nigeria)": "ruy",
-    "ruma": "ruz",
-    "rawo": "rwa",
-    "ruwila": "rwl",
-    "amba (uganda)": "rwm",
-    "rawa": "rwo",
-    "marwari (india)": "rwr",
-    "ngardi": "rxd",
-    "karuwali": "rxw",
-    "northern amami-oshima": "ryn",
-    "yaeyama": "rys",
-    "central okinawan": "ryu",
-    "rāziḥī": "rzh",
-    "saba": "saa",
-    "buglere": "sab",
-    "meskwaki": "sac",
-    "sad": "sad",
-    "sandawe": "sad",
-    "sabanê": "sae",
-    "safaliba": "saf",
-    "sg": "sag",
-    "sag": "sag",
-    "sango": "sag",
-    "sah": "sah",
-    "yakut": "sah",
-    "sahu": "saj",
-    "sake": "sak",
-    "sam": "sam",
-    "samaritan aramaic": "sam",
-    "sa": "san",
-    "san": "san",
-    "sanskrit": "san",
-    "sause": "sao",
-    "samburu": "saq",
-    "saraveca": "sar",
-    "sas": "sas",
-    "sasak": "sas",
-    "sat": "sat",
-    "santali": "sat",
-    "saleman": "sau",
-    "saafi-saafi": "sav",
-    "sawi": "saw",
-    "saya": "say",
-    "saurashtra": "saz",
-    "ngambay": "sba",
-    "simbo": "sbb",
-    "kele (papua new guinea)": "sbc",
-    "southern samo": "sbd",
-    "saliba": "sbe",
-    "chabu": "sbf",
-    "seget": "sbg",
-    "sori-harengan": "sbh",
-    "seti": "sbi",
-    "surbakhal": "sbj",
-    "safwa": "sbk",
-    "botolan sambal": "sbl",
-    "sagala": "sbm",
-    "sindhi bhil": "sbn",
-    "sabüm": "sbo",
-    "sangu (tanzania)": "sbp",
-    "sileibi": "sbq",
-    "sembakung murut": "sbr",
-    "subiya": "sbs",
-    "kimki": "sbt",
-    "stod bhoti": "sbu",
-    "sabine": "sbv",
-    "simba": "sbw",
-    "seberuang": "sbx",
-    "soli": "sby",
-    "sara kaba": "sbz",
-    "chut": "scb",
-    "dongxiang": "sce",
-    "san miguel creole french": "scf",
-    "sanggau": "scg",
-    "sakachep": "sch",
-    "sri lankan creole malay": "sci",
-    "sadri": "sck",
-    "shina": "scl",
-    "scn": "scn",
-    "sicilian": "scn",
-    "sco": "sco",
-    "scots": "sco",
-    "hyolmo": "scp",
-    "sa'och": "scq",
-    "north slavey": "scs",
-    "southern katang": "sct",
-    "shumcho": "scu",
-    "sheni": "scv",
-    "sicel": "scx",
-    "toraja-sa'dan": "sda",
-    "shabak": "sdb",
-    "sassarese sardinian": "sdc",
-    "surubu": "sde",
-    "sarli": "sdf",
-    "savi": "sdg",
-    "southern kurdish": "sdh",
-    "suundi": "sdj",
-    "sos kundi": "sdk",
-    "saudi arabian sign language": "sdl",
-    "gallurese sardinian": "sdn",
-    "bukar-sadung bidayuh": "sdo",
-    "sherdukpen": "sdp",
-    "semandang": "sdq",
-    "oraon sadri": "sdr",
-    "sened": "sds",
-    "shuadit": "sdt",
-    "sarudu": "sdu",
-    "sibu melanau": "sdx",
-    "sallands": "sdz",
-    "semai": "sea",
-    "shempire senoufo": "seb",
-    "sechelt": "sec",
-    "sedang": "sed",
-    "seneca": "see",
-    "cebaara senoufo": "sef",
-    "segeju": "seg",
-    "sena": "seh",
-    "seri": "sei",
-    "sene": "sej",
-    "sekani": "sek",
-    "sel": "sel",
-    "selkup": "sel",
-    "nanerigé sénoufo": "sen",
-    "suarmin": "seo",
-    "sìcìté sénoufo": "sep",
-    "senara sénoufo": "seq",
-    "serrano": "ser",
-    "koyraboro senni songhai": "ses",
-    "sentani": "set",
-    "serui-laut": "seu",
-    "nyarafolo senoufo": "sev",
-    "sewa bay": "sew",
-    "secoya": "sey",
-    "senthang chin": "sez",
-    "langue des signes de belgique francophone": "sfb",
-    "eastern subanen": "sfe",
-    "small flowery miao": "sfm",
-    "south african sign language": "sfs",
-    "sehwi": "sfw",
-    "sga": "sga",
-    "old irish (to 900)": "sga",
-    "mag-antsi ayta": "sgb",
-    "kipsigis": "sgc",
-    "surigaonon": "sgd",
-    "segai": "sge",
-    "swiss-german sign language": "sgg",
-    "shughni": "sgh",
-    "suga": "sgi",
-    "surgujia": "sgj",
-    "sangkong": "sgk",
-    "singa": "sgm",
-    "singpho": "sgp",
-    "sangisari": "sgr",
-    "samogitian": "sgs",
-    "brokpake": "sgt",
-    "salas": "sgu",
-    "sebat bet gurage": "sgw",
-    "sierra leone sign language": "sgx",
-    "sanglechi": "sgy",
-    "sursurunga": "sgz",
-    "shall-zwall": "sha",
-    "ninam": "shb",
-    "sonde": "shc",
-    "kundal shahi": "shd",
-    "sheko": "she",
-    "shua": "shg",
-    "shoshoni": "shh",
-    "tachelhit": "shi",
-    "shatt": "shj",
-    "shilluk": "shk",
-    "shendu": "shl",
-    "shahrudi": "shm",
-    "shn": "shn",
-    "shan": "shn",
-    "shanga": "sho",
-    "shipibo-conibo": "shp",
-    "sala": "shq",
-    "shuswap": "shs",
-    "shasta": "sht",
-    "chadian arabic": "shu",
-    "shehri": "shv",
-    "shwai": "shw",
-    "tachawit": "shy",
-    "syenara senoufo": "shz",
-    "akkala sami": "sia",
-    "sebop": "sib",
-    "sid": "sid",
-    "sidamo": "sid",
-    "simaa": "sie",
-    "siamou": "sif",
-    "paasaal": "sig",
-    "zire": "sih",
-    "shom peng": "sii",
-    "numbami": "sij",
-    "sikiana": "sik",
-    "tumulung sisaala": "sil",
-    "mende (papua new guinea)": "sim",
-    "si": "sin",
-    "sin": "sin",
-    "sinhala": "sin",
-    "sikkimese": "sip",
-    "sonia": "siq",
-    "siri": "sir",
-    "siuslaw": "sis",
-    "sinagen": "siu",
-    "sumariup": "siv",
-    "siwai": "siw",
-    "sumau": "six",
-    "sivandi": "siy",
-    "siwi": "siz",
-    "epena": "sja",
-    "sajau basap": "sjb",
-    "kildin sami": "sjd",
-    "pite sami": "sje",
-    "assangori": "sjg",
-    "kemi sami": "sjk",
-    "sajalong": "sjl",
-    "mapun": "sjm",
-    "sindarin": "sjn",
-    "xibe": "sjo",
-    "surjapuri": "sjp",
-    "siar-lak": "sjr",
-    "senhaja de srair": "sjs",
-    "ter sami": "sjt",
-    "ume sami": "sju",
-    "shawnee": "sjw",
-    "skagit": "ska",
-    "saek": "skb",
-    "ma manda": "skc",
-    "southern sierra miwok": "skd",
-    "seke (vanuatu)": "ske",
-    "sakirabiá": "skf",
-    "sakalava malagasy": "skg",
-    "sikule": "skh",
-    "sika": "ski",
-    "seke (nepal)": "skj",
-    "kutong": "skm",
-    "kolibugan subanon": "skn",
-    "seko tengah": "sko",
-    "sekapan": "skp",
-    "sininkere": "skq",
-    "saraiki": "skr",
-    "maia": "sks",
-    "sakata": "skt",
-    "sakao": "sku",
-    "skou": "skv",
-    "skepi creole dutch": "skw",
-    "seko padang": "skx",
-    "sikaiana": "sky",
-    "sekar": "skz",
-    "sáliba": "slc",
-    "sissala": "sld",
-    "sholaga": "sle",
-    "swiss-italian sign language": "slf",
-    "selungai murut": "slg",
-    "southern puget sound salish": "slh",
-    "lower silesian": "sli",
-    "salumá": "slj",
-    "sk": "slk",
-    "slo": "slk",
-    "slk": "slk",
-    "slovak": "slk",
-    "salt-yui": "sll",
-    "pangutaran sama": "slm",
-    "salinan": "sln",
-    "lamaholot": "slp",
-    "salchuq": "slq",
-    "salar": "slr",
-    "singapore sign language": "sls",
-    "sila": "slt",
-    "selaru": "slu",
-    "sl": "slv",
-    "slv": "slv",
-    "slovenian": "slv",
-    "sialum": "slw",
-    "salampasu": "slx",
-    "selayar": "sly",
-    "ma'ya": "slz",
-    "sma": "sma",
-    "southern sami": "sma",
-    "simbari": "smb",
-    "sama": "smd",
-    "se": "sme",
-    "sme": "sme",
-    "northern sami": "sme",
-    "auwe": "smf",
-    "simbali": "smg",
-    "samei": "smh",
-    "smj": "smj",
-    "lule sami": "smj",
-    "bolinao": "smk",
-    "central sama": "sml",
-    "musasa": "smm",
-    "smn": "smn",
-    "inari sami": "smn",
-    "sm": "smo",
-    "smo": "smo",
-    "samoan": "smo",
-    "samaritan": "smp",
-    "samo": "smq",
-    "simeulue": "smr",
-    "sms": "sms",
-    "skolt sami": "sms",
-    "simte": "smt",
-    "somray": "smu",
-    "samvedi": "smv",
-    "sumbawa": "smw",
-    "samba": "smx",
-    "semnani": "smy",
-    "simeku": "smz",
-    "sn": "sna",
-    "sna": "sna",
-    "shona": "sna",
-    "sebuyau": "snb",
-    "sinaugoro": "snc",
-    "sd": "snd",
-    "snd": "snd",
-    "sindhi": "snd",
-    "bau bidayuh": "sne",
-    "noon": "snf",
-    "sanga (democratic republic of congo)": "sng",
-    "sensi": "sni",
-    "riverain sango": "snj",
-    "snk": "snk",
-    "soninke": "snk",
-    "sangil": "snl",
-    "southern ma'di": "snm",
-    "siona": "snn",
-    "snohomish": "sno",
-    "siane": "snp",
-    "sangu (gabon)": "snq",
-    "sihan": "snr",
-    "south west bay": "sns",
-    "senggi": "snu",
-    "sa'ban": "snv",
-    "selee": "snw",
-    "saniyo-hiyewe": "sny",
-    "thai song": "soa",
-    "sobei": "sob",
-    "so (democratic republic of congo)": "soc",
-    "songoora": "sod",
-    "songomeno": "soe",
-    "sog": "sog",
-    "sogdian": "sog",
-    "sonha": "soi",
-    "sokoro": "sok",
-    "solos": "sol",
-    "so": "som",
-    "som": "som",
-    "somali": "som",
-    "songo": "soo",
-    "songe": "sop",
-    "kanasi": "soq",
-    "somrai": "sor",
-    "seeku": "sos",
-    "st": "sot",
-    "sot": "sot",
-    "southern sotho": "sot",
-    "southern thai": "sou",
-    "sonsorol": "sov",
-    "sowanda": "sow",
-    "miyobe": "soy",
-    "temi": "soz",
-    "es": "spa",
-    "spa": "spa",
-    "spanish": "spa",
-    "sepa (indonesia)": "spb",
-    "sapé": "spc",
-    "saep": "spd",
-    "sepa (papua new guinea)": "spe",
-    "sian": "spg",
-    "saponi": "spi",
-    "sengo": "spk",
-    "selepet": "spl",
-    "akukem": "spm",
-    "sanapaná": "spn",
-    "spokane": "spo",
-    "supyire senoufo": "spp",
-    "loreto-ucayali spanish": "spq",
-    "saparua": "spr",
-    "saposa": "sps",
-    "spiti bhoti": "spt",
-    "sapuan": "spu",
-    "sambalpuri": "spv",
-    "south picene": "spx",
-    "sabaot": "spy",
-    "shama-sambuga": "sqa",
-    "shau": "sqh",
-    "sq": "sqi",
-    "alb": "sqi",
-    "sqi": "sqi",
-    "albanian": "sqi",
-    "albanian sign language": "sqk",
-    "suma": "sqm",
-    "susquehannock": "sqn",
-    "sorkhei": "sqo",
-    "siculo arabic": "sqr",
-    "sri lankan sign language": "sqs",
-    "soqotri": "sqt",
-    "squamish": "squ",
-    "kufr qassem sign language (kqsl)": "sqx",
-    "saruga": "sra",
-    "sora": "srb",
-    "logudorese sardinian": "src",
-    "sc": "srd",
-    "srd": "srd",
-    "sardinian": "srd",
-    "sara": "sre",
-    "nafi": "srf",
-    "sulod": "srg",
-    "sarikoli": "srh",
-    "siriano": "sri",
-    "serudung murut": "srk",
-    "isirawa": "srl",
-    "saramaccan": "srm",
-    "srn": "srn",
-    "sranan tongo": "srn",
-    "campidanese sardinian": "sro",
-    "sr": "srp",
-    "srp": "srp",
-    "serbian": "srp",
-    "sirionó": "srq",
-    "srr": "srr",
-    "serer": "srr",
-    "sarsi": "srs",
-    "sauri": "srt",
-    "suruí": "sru",
-    "southern sorsoganon": "srv",
-    "serua": "srw",
-    "sirmauri": "srx",
-    "sera": "sry",
-    "shahmirzadi": "srz",
-    "southern sama": "ssb",
-    "suba-simbiti": "ssc",
-    "siroi": "ssd",
-    "balangingi": "sse",
-    "thao": "ssf",
-    "seimat": "ssg",
-    "shihhi arabic": "ssh",
-    "sansi": "ssi",
-    "sausi": "ssj",
-    "sunam": "ssk",
-    "western sisaala": "ssl",
-    "semnam": "ssm",
-    "waata": "ssn",
-    "sissano": "sso",
-    "spanish sign language": "ssp",
-    "so'a": "ssq",
-    "swiss-french sign language": "ssr",
-    "sinasina": "sst",
-    "susuami": "ssu",
-    "shark bay": "ssv",
-    "ss": "ssw",
-    "ssw": "ssw",
-    "swati": "ssw",
-    "samberigi": "ssx",
-    "saho": "ssy",
-    "sengseng": "ssz",
-    "settla": "sta",
-    "northern subanen": "stb",
-    "sentinel": "std",
-    "liana-seti": "ste",
-    "seta": "stf",
-    "trieng": "stg",
-    "shelta": "sth",
-    "bulo stieng": "sti",
-    "matya samo": "stj",
-    "arammba": "stk",
-    "stellingwerfs": "stl",
-    "setaman": "stm",
-    "stoney": "sto",
-    "southeastern tepehuan": "stp",
-    "saterfriesisch": "stq",
-    "straits salish": "str",
-    "shumashti": "sts",
-    "budeh stieng": "stt",
-    "samtao": "stu",
-    "silt'e": "stv",
-    "satawalese": "stw",
-    "siberian tatar": "sty",
-    "sulka": "sua",
-    "suku": "sub",
-    "western subanon": "suc",
-    "suena": "sue",
-    "suganga": "sug",
-    "suki": "sui",
-    "shubi": "suj",
-    "suk": "suk",
-    "sukuma": "suk",
-    "su": "sun",
-    "sun": "sun",
-    "sundanese": "sun",
-    "bouni": "suo",
-    "tirmaga-chai suri": "suq",
-    "mwaghavul": "sur",
-    "sus": "sus",
-    "susu": "sus",
-    "subtiaba": "sut",
-    "puroik": "suv",
-    "sumbwa": "suw",
-    "sux": "sux",
-    "sumerian": "sux",
-    "suyá": "suy",
-    "sunwar": "suz",
-    "svan": "sva",
-    "ulau-suain": "svb",
-    "vincentian creole english": "svc",
-    "serili": "sve",
-    "slovakian sign language": "svk",
-    "slavomolisano": "svm",
-    "savosavo": "svs",
-    "skalvian": "svx",
-    "sw": "swa",
-    "swa": "swa",
-    "swahili (macrolanguage)": "swa",
-    "maore comorian": "swb",
-    "congo swahili": "swc",
-    "sv": "swe",
-    "swe": "swe",
-    "swedish": "swe",
-    "sere": "swf",
-    "swabian": "swg",
-    "swahili (individual language)": "swh",
-    "sira": "swj",
-    "malawi sena": "swk",
-    "swedish sign language": "swl",
-    "samosa": "swm",
-    "sawknah": "swn",
-    "shanenawa": "swo",
-    "suau": "swp",
-    "sharwa": "swq",
-    "saweru": "swr",
-    "seluwasan": "sws",
-    "sawila": "swt",
-    "suwawa": "swu",
-    "shekhawati": "swv",
-    "sowa": "sww",
-    "suruahá": "swx",
-    "sarua": "swy",
-    "suba": "sxb",
-    "sicanian": "sxc",
-    "sighu": "sxe",
-    "shuhi": "sxg",
-    "southern kalapuya": "sxk",
-    "selian": "sxl",
-    "samre": "sxm",
-    "sangir": "sxn",
-    "sorothaptic": "sxo",
-    "saaroa": "sxr",
-    "sasaru": "sxs",
-    "upper saxon": "sxu",
-    "saxwe gbe": "sxw",
-    "siang": "sya",
-    "central subanen": "syb",
-    "syc": "syc",
-    "classical syriac": "syc",
-    "seki": "syi",
-    "sukur": "syk",
-    "sylheti": "syl",
-    "maya samo": "sym",
-    "senaya": "syn",
-    "suoy": "syo",
-    "syr": "syr",
-    "syriac": "syr",
-    "sinyar": "sys",
-    "kagate": "syw",
-    "samay": "syx",
-    "al-sayyid bedouin sign language": "syy",
-    "semelai": "sza",
-    "ngalum": "szb",
-    "semaq beri": "szc",
-    "seru": "szd",
-    "seze": "sze",
-    "sengele": "szg",
-    "silesian": "szl",
-    "sula": "szn",
-    "suabo": "szp",
-    "solomon islands sign language": "szs",
-    "isu (fako division)": "szv",
-    "sawai": "szw",
-    "sakizaya": "szy",
-    "lower tanana": "taa",
-    "tabassaran": "tab",
-    "lowland tarahumara": "tac",
-    "tause": "tad",
-    "tariana": "tae",
-    "tapirapé": "taf",
-    "tagoi": "tag",
-    "ty": "tah",
-    "tah": "tah",
-    "tahitian": "tah",
-    "eastern tamang": "taj",
-    "tala": "tak",
-    "ta": "tam",
-    "tam": "tam",
-    "tamil": "tam",
-    "tangale": "tan",
-    "yami": "tao",
-    "taabwa": "tap",
-    "tamasheq": "taq",
-    "central tarahumara": "tar",
-    "tay boi": "tas",
-    "tt": "tat",
-    "tat": "tat",
-    "tatar": "tat",
-    "upper tanana": "tau",
-    "tatuyo": "tav",
-    "tamki": "tax",
-    "atayal": "tay",
-    "tocho": "taz",
-    "aikanã": "tba",
-    "takia": "tbc",
-    "kaki ae": "tbd",
-    "tanimbili": "tbe",
-    "mandara": "tbf",
-    "north tairora": "tbg",
-    "dharawal": "tbh",
-    "gaam": "tbi",
-    "tiang": "tbj",
-    "calamian tagbanwa": "tbk",
-    "tboli": "tbl",
-    "tagbu": "tbm",
-    "barro negro tunebo": "tbn",
-    "tawala": "tbo",
-    "taworta": "tbp",
-    "tumtum": "tbr",
-    "tanguat": "tbs",
-    "tembo (kitembo)": "tbt",
-    "tubar": "tbu",
-    "tobo": "tbv",
-    "tagbanwa": "tbw",
-    "kapin": "tbx",
-    "tabaru": "tby",
-    "ditammari": "tbz",
-    "ticuna": "tca",
-    "tanacross": "tcb",
-    "datooga": "tcc",
-    "tafi": "tcd",
-    "southern tutchone": "tce",
-    "malinaltepec me'phaa": "tcf",
-    "tamagario": "tcg",
-    "turks and caicos creole english": "tch",
-    "wára": "tci",
-    "tchitchege": "tck",
-    "taman (myanmar)": "tcl",
-    "tanahmerah": "tcm",
-    "tichurong": "tcn",
-    "taungyo": "tco",
-    "tawr chin": "tcp",
-    "kaiy": "tcq",
-    "torres strait creole": "tcs",
-    "t'en": "tct",
-    "southeastern tarahumara": "tcu",
-    "tecpatlán totonac": "tcw",
-    "toda": "tcx",
-    "tulu": "tcy",
-    "thado chin": "tcz",
-    "tagdal": "tda",
-    "panchpargania": "tdb",
-    "emberá-tadó": "tdc",
-    "tai nüa": "tdd",
-    "tiranige diga dogon": "tde",
-    "talieng": "tdf",
-    "western tamang": "tdg",
-    "thulung": "tdh",
-    "tomadino": "tdi",
-    "tajio": "tdj",
-    "tambas": "tdk",
-    "taruma": "tdm",
-    "tondano": "tdn",
-    "teme": "tdo",
-    "tita": "tdq",
-    "todrah": "tdr",
-    "doutai": "tds",
-    "tetun dili": "tdt",
-    "toro": "tdv",
-    "tandroy-mahafaly malagasy": "tdx",
-    "tadyawan": "tdy",
-    "temiar": "tea",
-    "tetete": "teb",
-    "terik": "tec",
-    "tepo krumen": "ted",
-    "huehuetla tepehua": "tee",
-    "teressa": "tef",
-    "teke-tege": "teg",
-    "tehuelche": "teh",
-    "torricelli": "tei",
-    "ibali teke": "tek",
-    "te": "tel",
-    "tel": "tel",
-    "telugu": "tel",
-    "tem": "tem",
-    "timne": "tem",
-    "tama (colombia)": "ten",
-    "teso": "teo",
-    "tepecano": "tep",
-    "temein": "teq",
-    "ter": "ter",
-    "tereno": "ter",
-    "tengger": "tes",
-    "tet": "tet",
-    "tetum": "tet",
-    "teor": "tev",
-    "tewa (usa)": "tew",
-    "tennet": "tex",
-    "tulishi": "tey",
-    "tetserret": "tez",
-    "tofin gbe": "tfi",
-    "tanaina": "tfn",
-    "tefaro": "tfo",
-    "teribe": "tfr",
-    "ternate": "tft",
-    "sagalla": "tga",
-    "tobilung": "tgb",
-    "tigak": "tgc",
-    "ciwogai": "tgd",
-    "eastern gorkha tamang": "tge",
-    "chalikha": "tgf",
-    "tobagonian creole english": "tgh",
-    "lawunuia": "tgi",
-    "tagin": "tgj",
-    "tg": "tgk",
-    "tgk": "tgk",
-    "tajik": "tgk",
-    "tl": "tgl",
-    "tgl": "tgl",
-    "tagalog": "tgl",
-    "tandaganon": "tgn",
-    "sudest": "tgo",
-    "tangoa": "tgp",
-    "tring": "tgq",
-    "tareng": "tgr",
-    "nume": "tgs",
-    "central tagbanwa": "tgt",
-    "tanggu": "tgu",
-    "tingui-boto": "tgv",
-    "tagwana senoufo": "tgw",
-    "tagish": "tgx",
-    "togoyo": "tgy",
-    "tagalaka": "tgz",
-    "th": "tha",
-    "tha": "tha",
-    "thai": "tha",
-    "kuuk thaayorre": "thd",
-    "chitwania tharu": "the",
-    "thangmi": "thf",
-    "northern tarahumara": "thh",
-    "tai long": "thi",
-    "tharaka": "thk",
-    "dangaura tharu": "thl",
-    "aheu": "thm",
-    "thachanadan": "thn",
-    "thompson": "thp",
-    "kochila tharu": "thq",
-    "rana tharu": "thr",
-    "thakali": "ths",
-    "tahltan": "tht",
-    "thuri": "thu",
-    "tahaggart tamahaq": "thv",
-    "tayart tamajeq": "thz",
-    "tidikelt tamazight": "tia",
-    "tira": "tic",
-    "tifal": "tif",
-    "tig": "tig",
-    "tigre": "tig",
-    "timugon murut": "tih",
-    "tiene": "tii",
-    "tilung": "tij",
-    "tikar": "tik",
-    "tillamook": "til",
-    "timbe": "tim",
-    "tindi": "tin",
-    "teop": "tio",
-    "trimuris": "tip",
-    "tiéfo": "tiq",
-    "ti": "tir",
-    "tir": "tir",
-    "tigrinya": "tir",
-    "masadiit itneg": "tis",
-    "tinigua": "tit",
-    "adasen": "tiu",
-    "tiv": "tiv",
-    "tiwi": "tiw",
-    "southern tiwa": "tix",
-    "tiruray": "tiy",
-    "tai hongjin": "tiz",
-    "tajuasohn": "tja",
-    "tunjung": "tjg",
-    "northern tujia": "tji",
-    "tjungundji": "tjj",
-    "tai laing": "tjl",
-    "timucua": "tjm",
-    "tonjon": "tjn",
-    "temacine tamazight": "tjo",
-    "tjupany": "tjp",
-    "southern tujia": "tjs",
-    "tjurruru": "tju",
-    "djabwurrung": "tjw",
-    "truká": "tka",
-    "buksa": "tkb",
-    "tukudede": "tkd",
-    "takwane": "tke",
-    "tukumanféd": "tkf",
-    "tesaka malagasy": "tkg",
-    "tkl": "tkl",
-    "tokelau": "tkl",
-    "takelma": "tkm",
-    "toku-no-shima": "tkn",
-    "tikopia": "tkp",
-    "tsakhur": "tkr",
-    "takestani": "tks",
-    "kathoriya tharu": "tkt",
-    "upper necaxa totonac": "tku",
-    "mur pano": "tkv",
-    "teanu": "tkw",
-    "tangko": "tkx",
-    "takua": "tkz",
-    "southwestern tepehuan": "tla",
-    "tobelo": "tlb",
-    "yecuatla totonac": "tlc",
-    "talaud": "tld",
-    "telefol": "tlf",
-    "tofanma": "tlg",
-    "tlh": "tlh",
-    "klingon": "tlh",
-    "tli": "tli",
-    "tlingit": "tli",
-    "talinga-bwisi": "tlj",
-    "taloki": "tlk",
-    "tetela": "tll",
-    "tolomako": "tlm",
-    "talondo'": "tln",
-    "talodi": "tlo",
-    "filomena mata-coahuitlán totonac": "tlp",
-    "tai loi": "tlq",
-    "talise": "tlr",
-    "tambotalo": "tls",
-    "sou nama": "tlt",
-    "tulehu": "tlu",
-    "taliabu": "tlv",
-    "khehek": "tlx",
-    "talysh": "tly",
-    "tama (chad)": "tma",
-    "katbol": "tmb",
-    "tumak": "tmc",
-    "haruai": "tmd",
-    "tremembé": "tme",
-    "toba-maskoy": "tmf",
-    "ternateño": "tmg",
-    "tmh": "tmh",
-    "tamashek": "tmh",
-    "tutuba": "tmi",
-    "samarokena": "tmj",
-    "northwestern tamang": "tmk",
-    "tamnim citak": "tml",
-    "tai thanh": "tmm",
-    "taman (indonesia)": "tmn",
-    "temoq": "tmo",
-    "tumleo": "tmq",
-    "jewish babylonian aramaic (ca. 200-1200 ce)": "tmr",
-    "tima": "tms",
-    "tasmate": "tmt",
-    "tembo (motembo)": "tmv",
-    "temuan": "tmw",
-    "tami": "tmy",
-    "tamanaku": "tmz",
-    "tacana": "tna",
-    "western tunebo": "tnb",
-    "tanimuca-retuarã": "tnc",
-    "angosturas tunebo": "tnd",
-    "tobanga": "tng",
-    "maiani": "tnh",
-    "tandia": "tni",
-    "kwamera": "tnk",
-    "lenakel": "tnl",
-    "tabla": "tnm",
-    "north tanna": "tnn",
-    "toromono": "tno",
-    "whitesands": "tnp",
-    "taino": "tnq",
-    "ménik": "tnr",
-    "tenis": "tns",
-    "tontemboan": "tnt",
-    "tay khang": "tnu",
-    "tangchangya": "tnv",
-    "tonsawang": "tnw",
-    "tanema": "tnx",
-    "tongwe": "tny",
-    "ten'edn": "tnz",
-    "toba": "tob",
-    "coyutla totonac": "toc",
-    "toma": "tod",
-    "gizrra": "tof",
-    "tog": "tog",
-    "tonga (nyasa)": "tog",
-    "gitonga": "toh",
-    "tonga (zambia)": "toi",
-    "tojolabal": "toj",
-    "tolowa": "tol",
-    "tombulu": "tom",
-    "to": "ton",
-    "ton": "ton",
-    "tonga (tonga islands)": "ton",
-    "xicotepec de juárez totonac": "too",
-    "papantla totonac": "top",
-    "toposa": "toq",
-    "togbo-vara banda": "tor",
-    "highland totonac": "tos",
-    "upper taromi": "tov",
-    "jemez": "tow",
-    "tobian": "tox",
-    "topoiyo": "toy",
-    "taupota": "tpa",
-    "azoyú me'phaa": "tpc",
-    "tippera": "tpe",
-    "tarpia": "tpf",
-    "kula": "tpg",
-    "tpi": "tpi",
-    "tok pisin": "tpi",
-    "tapieté": "tpj",
-    "tupinikin": "tpk",
-    "tlacoapa me'phaa": "tpl",
-    "tampulma": "tpm",
-    "tupinambá": "tpn",
-    "tai pao": "tpo",
-    "pisaflores tepehua": "tpp",
-    "tukpa": "tpq",
-    "tuparí": "tpr",
-    "tlachichilco tepehua": "tpt",
-    "tampuan": "tpu",
-    "tanapag": "tpv",
-    "tupí": "tpw",
-    "acatepec me'phaa": "tpx",
-    "trumai": "tpy",
-    "tinputz": "tpz",
-    "tembé": "tqb",
-    "lehali": "tql",
-    "turumsa": "tqm",
-    "tenino": "tqn",
-    "toaripi": "tqo",
-    "tomoip": "tqp",
-    "tunni": "tqq",
-    "torona": "tqr",
-    "western totonac": "tqt",
-    "touo": "tqu",
-    "tonkawa": "tqw",
-    "tirahi": "tra",
-    "terebu": "trb",
-    "copala triqui": "trc",
-    "turi": "trd",
-    "east tarangan": "tre",
-    "trinidadian creole english": "trf",
-    "lishán didán": "trg",
-    "turaka": "trh",
-    "trió": "tri",
-    "toram": "trj",
-    "traveller scottish": "trl",
-    "tregami": "trm",
-    "trinitario": "trn",
-    "tarao naga": "tro",
-    "kok borok": "trp",
-    "san martín itunyoso triqui": "trq",
-    "taushiro": "trr",
-    "chicahuaxtla triqui": "trs",
-    "tunggare": "trt",
-    "turoyo": "tru",
-    "taroko": "trv",
-    "torwali": "trw",
-    "tringgus-sembaan bidayuh": "trx",
-    "turung": "try",
-    "torá": "trz",
-    "tsaangi": "tsa",
-    "tsamai": "tsb",
-    "tswa": "tsc",
-    "tsakonian": "tsd",
-    "tunisian sign language": "tse",
-    "tausug": "tsg",
-    "tsuvan": "tsh",
-    "tsi": "tsi",
-    "tsimshian": "tsi",
-    "tshangla": "tsj",
-    "tseku": "tsk",
-    "ts'ün-lao": "tsl",
-    "turkish sign language": "tsm",
-    "tn": "tsn",
-    "tsn": "tsn",
-    "tswana": "tsn",
-    "ts": "tso",
-    "tso": "tso",
-    "tsonga": "tso",
-    "northern toussian": "tsp",
-    "thai sign language": "tsq",
-    "akei": "tsr",
-    "taiwan sign language": "tss",
-    "tondi songway kiini": "tst",
-    "tsou": "tsu",
-    "tsogo": "tsv",
-    "tsishingini": "tsw",
-    "mubami": "tsx",
-    "tebul sign language": "tsy",
-    "purepecha": "tsz",
-    "tutelo": "tta",
-    "tektiteko": "ttc",
-    "tauade": "ttd",
-    "bwanabwana": "tte",
-    "tuotomb": "ttf",
-    "tutong": "ttg",
-    "upper ta'oih": "tth",
-    "tobati": "tti",
-    "tooro": "ttj",
-    "totoro": "ttk",
-    "totela": "ttl",
-    "northern tutchone": "ttm",
-    "towei": "ttn",
-    "lower ta'oih": "tto",
-    "tombelala": "ttp",
-    "tawallammat tamajaq": "ttq",
-    "tera": "ttr",
-    "northeastern thai": "tts",
-    "muslim tat": "ttt",
-    "torau": "ttu",
-    "titan": "ttv",
-    "long wat": "ttw",
-    "sikaritai": "tty",
-    "tsum": "ttz",
-    "wiarumus": "tua",
-    "tübatulabal": "tub",
-    "mutu": "tuc",
-    "tuxá": "tud",
-    "tuyuca": "tue",
-    "central tunebo": "tuf",
-    "tunia": "tug",
-    "taulil": "tuh",
-    "tupuri": "tui",
-    "tugutil": "tuj",
-    "tk": "tuk",
-    "tuk": "tuk",
-    "turkmen": "tuk",
-    "tula": "tul",
-    "tum": "tum",
-    "tumbuka": "tum",
-    "tunica": "tun",
-    "tucano": "tuo",
-    "tedaga": "tuq",
-    "tr": "tur",
-    "tur": "tur",
-    "turkish": "tur",
-    "tuscarora": "tus",
-    "tututni": "tuu",
-    "turkana": "tuv",
-    "tuxináwa": "tux",
-    "tugen": "tuy",
-    "turka": "tuz",
-    "vaghua": "tva",
-    "tsuvadi": "tvd",
-    "te'un": "tve",
-    "southeast ambrym": "tvk",
-    "tvl": "tvl",
-    "tuvalu": "tvl",
-    "tela-masbuar": "tvm",
-    "tavoyan": "tvn",
-    "tidore": "tvo",
-    "taveta": "tvs",
-    "tutsa naga": "tvt",
-    "tunen": "tvu",
-    "sedoa": "tvw",
-    "taivoan": "tvx",
-    "timor pidgin": "tvy",
-    "twana": "twa",
-    "western tawbuid": "twb",
-    "teshenawa": "twc",
-    "twents": "twd",
-    "tewa (indonesia)": "twe",
-    "northern tiwa": "twf",
-    "tereweng": "twg",
-    "tai dón": "twh",
-    "tw": "twi",
-    "twi": "twi",
-    "tawara": "twl",
-    "tawang monpa": "twm",
-    "twendi": "twn",
-    "tswapong": "two",
-    "tasawaq": "twq",
-    "southwestern tarahumara": "twr",
-    "turiwára": "twt",
-    "termanu": "twu",
-    "tuwari": "tww",
-    "tewe": "twx",
-    "tawoyan": "twy",
-    "tombonuo": "txa",
-    "tokharian b": "txb",
-    "tsetsaut": "txc",
-    "totoli": "txe",
-    "tangut": "txg",
-    "thracian": "txh",
-    "ikpeng": "txi",
-    "tarjumo": "txj",
-    "tomini": "txm",
-    "west tarangan": "txn",
-    "toto": "txo",
-    "tartessian": "txr",
-    "tonsea": "txs",
-    "citak": "txt",
-    "kayapó": "txu",
-    "tatana": "txx",
-    "tanosy malagasy": "txy",
-    "tauya": "tya",
-    "kyanga": "tye",
-    "o'du": "tyh",
-    "teke-tsaayi": "tyi",
-    "tai do": "tyj",
-    "thu lao": "tyl",
-    "kombai": "tyn",
-    "thaypan": "typ",
-    "tai daeng": "tyr",
-    "tày sa pa": "tys",
-    "tày tac": "tyt",
-    "tyv": "tyv",
-    "tuvinian": "tyv",
-    "teke-tyee": "tyx",
-    "tiyaa": "tyy",
-    "tanzanian sign language": "tza",
-    "tzeltal": "tzh",
-    "tz'utujil": "tzj",
-    "talossan": "tzl",
-    "central atlas tamazight": "tzm",
-    "tugun": "tzn",
-    "tzotzil": "tzo",
-    "tabriak": "tzx",
-    "uamué": "uam",
-    "kuan": "uan",
-    "tairuma": "uar",
-    "ubang": "uba",
-    "buhi'non bikol": "ubl",
-    "ubir": "ubr",
-    "umbu-ungu": "ubu",
-    "ubykh": "uby",
-    "udihe": "ude",
-    "muduga": "udg",
-    "ujir": "udj",
-    "wuzlam": "udl",
-    "udm": "udm",
-    "udmurt": "udm",
-    "uduk": "udu",
-    "kioko": "ues",
-    "ufim": "ufi",
-    "uga": "uga",
-    "ugaritic": "uga",
-    "kuku-ugbanh": "ugb",
-    "ughele": "uge",
-    "ugandan sign language": "ugn",
-    "ugong": "ugo",
-    "uruguayan sign language": "ugy",
-    "uhami": "uha",
-    "damal": "uhn",
-    "ug": "uig",
-    "uig": "uig",
-    "uighur": "uig",
-    "uisai": "uis",
-    "iyive": "uiv",
-    "tanjijili": "uji",
-    "kaburi": "uka",
-    "ukuriguma": "ukg",
-    "ukhwejo": "ukh",
-    "kui (india)": "uki",
-    "muak sa-aak": "ukk",
-    "ukrainian sign language": "ukl",
-    "ukpe-bayobiri": "ukp",
-    "ukwa": "ukq",
-    "uk": "ukr",
-    "ukr": "ukr",
-    "ukrainian": "ukr",
-    "urubú-kaapor sign language": "uks",
-    "ukue": "uku",
-    "kuku": "ukv",
-    "ukwuani-aboh-ndoni": "ukw",
-    "kuuk-yak": "uky",
-    "fungwa": "ula",
-    "ulukwumi": "ulb",
-    "ulch": "ulc",
-    "lule": "ule",
-    "usku": "ulf",
-    "ulithian": "uli",
-    "meriam mir": "ulk",
-    "ullatan": "ull",
-    "ulumanda'": "ulm",
-    "unserdeutsch": "uln",
-    "uma' lung": "ulu",
-    "ulwa": "ulw",
-    "umatilla": "uma",
-    "umb": "umb",
-    "umbundu": "umb",
-    "marrucinian": "umc",
-    "umbindhamu": "umd",
-    "morrobalama": "umg",
-    "ukit": "umi",
-    "umon": "umm",
-    "makyan naga": "umn",
-    "umotína": "umo",
-    "umpila": "ump",
-    "umbugarla": "umr",
-    "pendau": "ums",
-    "munsee": "umu",
-    "north watut": "una",
-    "und": "und",
-    "undetermined": "und",
-    "uneme": "une",
-    "ngarinyin": "ung",
-    "enawené-nawé": "unk",
-    "unami": "unm",
-    "kurnai": "unn",
-    "mundari": "unr",
-    "unubahe": "unu",
-    "munda": "unx",
-    "unde kaili": "unz",
-    "umeda": "upi",
-    "uripiv-wala-rano-atchin": "upv",
-    "urarina": "ura",
-    "urubú-kaapor": "urb",
-    "urningangg": "urc",
-    "ur": "urd",
-    "urd": "urd",
-    "urdu": "urd",
-    "uradhi": "urf",
-    "urigina": "urg",
-    "urhobo": "urh",
-    "urim": "uri",
-    "urak lawoi'": "urk",
-    "urali": "url",
-    "urapmin": "urm",
-    "uruangnirin": "urn",
-    "ura (papua new guinea)": "uro",
-    "uru-pa-in": "urp",
-    "lehalurup": "urr",
-    "urat": "urt",
-    "urumi": "uru",
-    "uruava": "urv",
-    "urimo": "urx",
-    "orya": "ury",
-    "uru-eu-wau-wau": "urz",
-    "usarufa": "usa",
-    "ushojo": "ush",
-    "usui": "usi",
-    "usaghade": "usk",
-    "uspanteco": "usp",
-    "us-saare": "uss",
-    "otank": "uta",
-    "ute-southern paiute": "ute",
-    "ut-hun": "uth",
-    "amba (solomon islands)": "utp",
-    "etulo": "utr",
-    "urum": "uum",
-    "kulon-pazeh": "uun",
-    "ura (vanuatu)": "uur",
-    "west uvean": "uve",
-    "lote": "uvl",
-    "kuku-uwanh": "uwa",
-    "doko-uyanga": "uya",
-    "uz": "uzb",
-    "uzb": "uzb",
-    "uzbek": "uzb",
-    "northern uzbek": "uzn",
-    "southern uzbek": "uzs",
-    "vaagri booli": "vaa",
-    "vale": "vae",
-    "vafsi": "vaf",
-    "vagla": "vag",
-    "varhadi-nagpuri": "vah",
-    "vai": "vai",
-    "sekele": "vaj",
-    "vehes": "val",
-    "vanimo": "vam",
-    "valman": "van",
-    "vaiphei": "vap",
-    "huarijio": "var",
-    "vasavi": "vas",
-    "vanuma": "vau",
-    "varli": "vav",
-    "wayu": "vay",
-    "southeast babar": "vbb",
-    "southwestern bontok": "vbk",
-    "venetian": "vec",
-    "veddah": "ved",
-    "veluws": "vel",
-    "vemgo-mabas": "vem",
-    "ve": "ven",
-    "ven": "ven",
-    "venda": "ven",
-    "ventureño": "veo",
-    "veps": "vep",
-    "mom jango": "ver",
-    "vaghri": "vgr",
-    "vlaamse gebarentaal": "vgt",
-    "virgin islands creole english": "vic",
-    "vidunda": "vid",
-    "vi": "vie",
-    "vie": "vie",
-    "vietnamese": "vie",
-    "vili": "vif",
-    "viemo": "vig",
-    "vilela": "vil",
-    "vinza": "vin",
-    "vishavan": "vis",
-    "viti": "vit",
-    "iduna": "viv",
-    "kariyarra": "vka",
-    "kujarge": "vkj",
-    "kaur": "vkk",
-    "kulisusu": "vkl",
-    "kamakan": "vkm",
-    "koro nulu": "vkn",
-    "kodeoha": "vko",
-    "korlai creole portuguese": "vkp",
-    "tenggarong kutai malay": "vkt",
-    "kurrama": "vku",
-    "koro zuba": "vkz",
-    "valpei": "vlp",
-    "vlaams": "vls",
-    "martuyhunira": "vma",
-    "barbaram": "vmb",
-    "juxtlahuaca mixtec": "vmc",
-    "mudu koraga": "vmd",
-    "east masela": "vme",
-    "mainfränkisch": "vmf",
-    "lungalunga": "vmg",
-    "maraghei": "vmh",
-    "miwa": "vmi",
-    "ixtayutla mixtec": "vmj",
-    "makhuwa-shirima": "vmk",
-    "malgana": "vml",
-    "mitlatongo mixtec": "vmm",
-    "soyaltepec mazatec": "vmp",
-    "soyaltepec mixtec": "vmq",
-    "marenje": "vmr",
-    "moksela": "vms",
-    "muluridyi": "vmu",
-    "valley maidu": "vmv",
-    "makhuwa": "vmw",
-    "tamazola mixtec": "vmx",
-    "ayautla mazatec": "vmy",
-    "mazatlán mazatec": "vmz",
-    "vano": "vnk",
-    "vinmavis": "vnm",
-    "vunapu": "vnp",
-    "vo": "vol",
-    "vol": "vol",
-    "volapük": "vol",
-    "voro": "vor",
-    "vot": "vot",
-    "votic": "vot",
-    "vera'a": "vra",
-    "võro": "vro",
-    "varisi": "vrs",
-    "burmbar": "vrt",
-    "moldova sign language": "vsi",
-    "venezuelan sign language": "vsl",
-    "valencian sign language": "vsv",
-    "vitou": "vto",
-    "vumbu": "vum",
-    "vunjo": "vun",
-    "vute": "vut",
-    "awa (china)": "vwa",
-    "walla walla": "waa",
-    "wasco-wishram": "wac",
-    "wamesa": "wad",
-    "walser": "wae",
-    "wakoná": "waf",
-    "wa'ema": "wag",
-    "watubela": "wah",
-    "wares": "wai",
-    "waffa": "waj",
-    "wal": "wal",
-    "wolaytta": "wal",
-    "wampanoag": "wam",
-    "wappo": "wao",
-    "wapishana": "wap",
-    "wagiman": "waq",
-    "war": "war",
-    "waray (philippines)": "war",
-    "was": "was",
-    "washo": "was",
-    "kaninuwa": "wat",
-    "waurá": "wau",
-    "waka": "wav",
-    "waiwai": "waw",
-    "watam": "wax",
-    "wayana": "way",
-    "wampur": "waz",
-    "warao": "wba",
-    "wabo": "wbb",
-    "waritai": "wbe",
-    "wara": "wbf",
-    "wanda": "wbh",
-    "vwanji": "wbi",
-    "alagwa": "wbj",
-    "waigali": "wbk",
-    "wakhi": "wbl",
-    "warlpiri": "wbp",
-    "waddar": "wbq",
-    "wagdi": "wbr",
-    "west bengal sign language": "wbs",
-    "warnman": "wbt",
-    "wajarri": "wbv",
-    "yanomámi": "wca",
-    "waci gbe": "wci",
-    "wandji": "wdd",
-    "wadaginam": "wdg",
-    "wadjiginy": "wdj",
-    "wadikali": "wdk",
-    "wadjigu": "wdu",
-    "wadjabangayi": "wdy",
-    "wewaw": "wea",
-    "wè western": "wec",
-    "wedau": "wed",
-    "wergaia": "weg",
-    "kiunum": "wei",
-    "weme gbe": "wem",
-    "wemale": "weo",
-    "westphalien": "wep",
-    "weri": "wer",
-    "cameroon pidgin": "wes",
-    "perai": "wet",
-    "rawngtu chin": "weu",
-    "wejewa": "wew",
-    "yafi": "wfg",
-    "wagaya": "wga",
-    "wagawaga": "wgb",
-    "wangkangurru": "wgg",
-    "wahgi": "wgi",
-    "waigeo": "wgo",
-    "wirangu": "wgu",
-    "warrgamay": "wgy",
-    "sou upaa": "wha",
-    "north wahgi": "whg",
-    "wahau kenyah": "whk",
-    "wahau kayan": "whu",
-    "southern toussian": "wib",
-    "wichita": "wic",
-    "wik-epa": "wie",
-    "wik-keyangan": "wif",
-    "wik ngathan": "wig",
-    "wik-me'anha": "wih",
-    "minidien": "wii",
-    "wik-iiyanh": "wij",
-    "wikalkan": "wik",
-    "wilawila": "wil",
-    "wik-mungkan": "wim",
-    "ho-chunk": "win",
-    "wiraféd": "wir",
-    "wiru": "wiu",
-    "vitu": "wiv",
-    "wiyot": "wiy",
-    "waja": "wja",
-    "warji": "wji",
-    "kw'adza": "wka",
-    "kumbaran": "wkb",
-    "wakde": "wkd",
-    "kalanadi": "wkl",
-    "keerray-woorroong": "wkr",
-    "kunduvadi": "wku",
-    "wakawaka": "wkw",
-    "wangkayutyuru": "wky",
-    "walio": "wla",
-    "mwali comorian": "wlc",
-    "wolane": "wle",
-    "kunbarlang": "wlg",
-    "welaun": "wlh",
-    "waioli": "wli",
-    "wailaki": "wlk",
-    "wali (sudan)": "wll",
-    "middle welsh": "wlm",
-    "wa": "wln",
-    "wln": "wln",
-    "walloon": "wln",
-    "wolio": "wlo",
-    "wailapa": "wlr",
-    "wallisian": "wls",
-    "wuliwuli": "wlu",
-    "wichí lhamtés vejoz": "wlv",
-    "walak": "wlw",
-    "wali (ghana)": "wlx",
-    "waling": "wly",
-    "mawa (nigeria)": "wma",
-    "wambaya": "wmb",
-    "wamas": "wmc",
-    "mamaindé": "wmd",
-    "wambule": "wme",
-    "western minyag": "wmg",
-    "waima'a": "wmh",
-    "wamin": "wmi",
-    "maiwa (indonesia)": "wmm",
-    "waamwang": "wmn",
-    "wom (papua new guinea)": "wmo",
-    "wambon": "wms",
-    "walmajarri": "wmt",
-    "mwani": "wmw",
-    "womo": "wmx",
-    "wanambre": "wnb",
-    "wantoat": "wnc",
-    "wandarang": "wnd",
-    "waneci": "wne",
-    "wanggom": "wng",
-    "ndzwani comorian": "wni",
-    "wanukaka": "wnk",
-    "wanggamala": "wnm",
-    "wunumara": "wnn",
-    "wano": "wno",
-    "wanap": "wnp",
-    "usan": "wnu",
-    "wintu": "wnw",
-    "wanyi": "wny",
-    "kuwema": "woa",
-    "wè northern": "wob",
-    "wogeo": "woc",
-    "wolani": "wod",
-    "woleaian": "woe",
-    "gambian wolof": "wof",
-    "wogamusin": "wog",
-    "kamang": "woi",
-    "longto": "wok",
-    "wo": "wol",
-    "wol": "wol",
-    "wolof": "wol",
-    "wom (nigeria)": "wom",
-    "wongo": "won",
-    "manombai": "woo",
-    "woria": "wor",
-    "hanga hundi": "wos",
-    "wawonii": "wow",
-    "weyto": "woy",
-    "maco": "wpc",
-    "waluwarra": "wrb",
-    "warduji": "wrd",
-    "warungu": "wrg",
-    "wiradjuri": "wrh",
-    "wariyangga": "wri",
-    "garrwa": "wrk",
-    "warlmanpa": "wrl",
-    "warumungu": "wrm",
-    "warnang": "wrn",
-    "worrorra": "wro",
-    "waropen": "wrp",
-    "wardaman": "wrr",
-    "waris": "wrs",
-    "waru": "wru",
-    "waruna": "wrv",
-    "gugu warra": "wrw",
-    "wae rana": "wrx",
-    "merwari": "wry",
-    "waray (australia)": "wrz",
-    "warembori": "wsa",
-    "adilabad gondi": "wsg",
-    "wusi": "wsi",
-    "waskia": "wsk",
-    "owenia": "wsr",
-    "wasa": "wss",
-    "wasu": "wsu",
-    "wotapuri-katarqalai": "wsv",
-    "watiwa": "wtf",
-    "wathawurrung": "wth",
-    "berta": "wti",
-    "watakataui": "wtk",
-    "mewati": "wtm",
-    "wotu": "wtw",
-    "wikngenchera": "wua",
-    "wunambal": "wub",
-    "wudu": "wud",
-    "wutunhua": "wuh",
-    "silimo": "wul",
-    "wumbvu": "wum",
-    "bungu": "wun",
-    "wurrugu": "wur",
-    "wutung": "wut",
-    "wu chinese": "wuu",
-    "wuvulu-aua": "wuv",
-    "wulna": "wux",
-    "wauyai": "wuy",
-    "waama": "wwa",
-    "wakabunga": "wwb",
-    "wetamut": "wwo",
-    "warrwa": "wwr",
-    "wawa": "www",
-    "waxianghua": "wxa",
-    "wardandi": "wxw",
-    "wyandot": "wya",
-    "wangaaybuwan-ngiyambaa": "wyb",
-    "woiwurrung": "wyi",
-    "wymysorys": "wym",
-    "wayoró": "wyr",
-    "western fijian": "wyy",
-    "andalusian arabic": "xaa",
-    "sambe": "xab",
-    "kachari": "xac",
-    "adai": "xad",
-    "aequian": "xae",
-    "aghwan": "xag",
-    "kaimbé": "xai",
-    "ararandewára": "xaj",
-    "máku": "xak",
-    "xal": "xal",
-    "kalmyk": "xal",
-    "ǀxam": "xam",
-    "xamtanga": "xan",
-    "khao": "xao",
-    "apalachee": "xap",
-    "aquitanian": "xaq",
-    "karami": "xar",
-    "kamas": "xas",
-    "katawixi": "xat",
-    "kauwera": "xau",
-    "xavánte": "xav",
-    "kawaiisu": "xaw",
-    "kayan mahakam": "xay",
-    "lower burdekin": "xbb",
-    "bactrian": "xbc",
-    "bindal": "xbd",
-    "bigambal": "xbe",
-    "bunganditj": "xbg",
-    "kombio": "xbi",
-    "birrpayi": "xbj",
-    "middle breton": "xbm",
-    "kenaboi": "xbn",
-    "bolgarian": "xbo",
-    "bibbulman": "xbp",
-    "kambera": "xbr",
-    "kambiwá": "xbw",
-    "batjala": "xby",
-    "cumbric": "xcb",
-    "camunic": "xcc",
-    "celtiberian": "xce",
-    "cisalpine gaulish": "xcg",
-    "chemakum": "xch",
-    "classical armenian": "xcl",
-    "comecrudo": "xcm",
-    "cotoname": "xcn",
-    "chorasmian": "xco",
-    "carian": "xcr",
-    "classical tibetan": "xct",
-    "curonian": "xcu",
-    "chuvantsy": "xcv",
-    "coahuilteco": "xcw",
-    "cayuse": "xcy",
-    "darkinyung": "xda",
-    "dacian": "xdc",
-    "dharuk": "xdk",
-    "edomite": "xdm",
-    "kwandu": "xdo",
-    "malayic dayak": "xdy",
-    "eblan": "xeb",
-    "ǁxegwi": "xeg",
-    "kelo": "xel",
-    "kembayan": "xem",
-    "epi-olmec": "xep",
-    "xerénte": "xer",
-    "kesawai": "xes",
-    "xetá": "xet",
-    "keoru-ahia": "xeu",
-    "faliscan": "xfa",
-    "galatian": "xga",
-    "gbin": "xgb",
-    "gudang": "xgd",
-    "gabrielino-fernandeño": "xgf",
-    "goreng": "xgg",
-    "garingbal": "xgi",
-    "galindan": "xgl",
-    "dharumbal": "xgm",
-    "garza": "xgr",
-    "unggumi": "xgu",
-    "guwa": "xgw",
-    "harami": "xha",
-    "hunnic": "xhc",
-    "hadrami": "xhd",
-    "khetrani": "xhe",
-    "xh": "xho",
-    "xho": "xho",
-    "xhosa": "xho",
-    "hernican": "xhr",
-    "hattic": "xht",
-    "hurrian": "xhu",
-    "khua": "xhv",
-    "iberian": "xib",
-    "xiri": "xii",
-    "illyrian": "xil",
-    "xinca": "xin",
-    "xiriâna": "xir",
-    "kisan": "xis",
-    "indus valley language": "xiv",
-    "xipaya": "xiy",
-    "minjungbal": "xjb",
-    "jaitmatang": "xjt",
-    "kalkoti": "xka",
-    "northern nago": "xkb",
-    "kho'ini": "xkc",
-    "mendalam kayan": "xkd",
-    "kereho": "xke",
-    "khengkha": "xkf",
-    "kagoro": "xkg",
-    "kenyan sign language": "xki",
-    "kajali": "xkj",
-    "kaco'": "xkk",
-    "mainstream kenyah": "xkl",
-    "kayan river kayan": "xkn",
-    "kiorr": "xko",
-    "kabatei": "xkp",
-    "koroni": "xkq",
-    "xakriabá": "xkr",
-    "kumbewaha": "xks",
-    "kantosi": "xkt",
-    "kaamba": "xku",
-    "kgalagadi": "xkv",
-    "kembra": "xkw",
-    "karore": "xkx",
-    "uma' lasan": "xky",
-    "kurtokha": "xkz",
-    "kamula": "xla",
-    "loup b": "xlb",
-    "lycian": "xlc",
-    "lydian": "xld",
-    "lemnian": "xle",
-    "ligurian (ancient)": "xlg",
-    "liburnian": "xli",
-    "alanic": "xln",
-    "loup a": "xlo",
-    "lepontic": "xlp",
-    "lusitanian": "xls",
-    "cuneiform luwian": "xlu",
-    "elymian": "xly",
-    "mushungulu": "xma",
-    "mbonga": "xmb",
-    "makhuwa-marrevone": "xmc",
-    "mbudum": "xmd",
-    "median": "xme",
-    "mingrelian": "xmf",
-    "mengaka": "xmg",
-    "kugu-muminh": "xmh",
-    "majera": "xmj",
-    "ancient macedonian": "xmk",
-    "malaysian sign language": "xml",
-    "manado malay": "xmm",
-    "manichaean middle persian": "xmn",
-    "morerebi": "xmo",
-    "kuku-mu'inh": "xmp",
-    "kuku-mangk": "xmq",
-    "meroitic": "xmr",
-    "moroccan sign language": "xms",
-    "matbat": "xmt",
-    "kamu": "xmu",
-    "antankarana malagasy": "xmv",
-    "tsimihety malagasy": "xmw",
-    "maden": "xmx",
-    "mayaguduna": "xmy",
-    "mori bawah": "xmz",
-    "ancient north arabian": "xna",
-    "kanakanabu": "xnb",
-    "middle mongolian": "xng",
-    "kuanhua": "xnh",
-    "ngarigu": "xni",
-    "ngoni (tanzania)": "xnj",
-    "nganakarti": "xnk",
-    "ngumbarl": "xnm",
-    "northern kankanay": "xnn",
-    "anglo-norman": "xno",
-    "ngoni (mozambique)": "xnq",
-    "kangri": "xnr",
-    "kanashi": "xns",
-    "narragansett": "xnt",
-    "nukunul": "xnu",
-    "nyiyaparli": "xny",
-    "kenzi": "xnz",
-    "o'chi'chi'": "xoc",
-    "kokoda": "xod",
-    "soga": "xog",
-    "kominimung": "xoi",
-    "xokleng": "xok",
-    "komo (sudan)": "xom",
-    "konkomba": "xon",
-    "xukurú": "xoo",
-    "kopar": "xop",
-    "korubo": "xor",
-    "kowaki": "xow",
-    "pirriya": "xpa",
-    "northeastern tasmanian": "xpb",
-    "pecheneg": "xpc",
-    "oyster bay tasmanian": "xpd",
-    "liberia kpelle": "xpe",
-    "southeast tasmanian": "xpf",
-    "phrygian": "xpg",
-    "north midlands tasmanian": "xph",
-    "pictish": "xpi",
-    "mpalitjanh": "xpj",
-    "kulina pano": "xpk",
-    "port sorell tasmanian": "xpl",
-    "pumpokol": "xpm",
-    "kapinawá": "xpn",
-    "pochutec": "xpo",
-    "puyo-paekche": "xpp",
-    "mohegan-pequot": "xpq",
-    "parthian": "xpr",
-    "pisidian": "xps",
-    "punthamara": "xpt",
-    "punic": "xpu",
-    "northern tasmanian": "xpv",
-    "northwestern tasmanian": "xpw",
-    "southwestern tasmanian": "xpx",
-    "puyo": "xpy",
-    "bruny island tasmanian": "xpz",
-    "karakhanid": "xqa",
-    "qatabanian": "xqt",
-    "krahô": "xra",
-    "eastern karaboro": "xrb",
-    "gundungurra": "xrd",
-    "kreye": "xre",
-    "minang": "xrg",
-    "krikati-timbira": "xri",
-    "armazic": "xrm",
-    "arin": "xrn",
-    "raetic": "xrr",
-    "aranama-tamique": "xrt",
-    "marriammu": "xru",
-    "karawa": "xrw",
-    "sabaean": "xsa",
-    "sambal": "xsb",
-    "scythian": "xsc",
-    "sidetic": "xsd",
-    "sempan": "xse",
-    "shamang": "xsh",
-    "subi": "xsj",
-    "south slavey": "xsl",
-    "kasem": "xsm",
-    "sanga (nigeria)": "xsn",
-    "solano": "xso",
-    "silopi": "xsp",
-    "makhuwa-saka": "xsq",
-    "sherpa": "xsr",
-    "assan": "xss",
-    "sanumá": "xsu",
-    "sudovian": "xsv",
-    "saisiyat": "xsy",
-    "alcozauca mixtec": "xta",
-    "chazumba mixtec": "xtb",
-    "katcha-kadugli-miri": "xtc",
-    "diuxi-tilantongo mixtec": "xtd",
-    "ketengban": "xte",
-    "transalpine gaulish": "xtg",
-    "yitha yitha": "xth",
-    "sinicahua mixtec": "xti",
-    "san juan teita mixtec": "xtj",
-    "tijaltepec mixtec": "xtl",
-    "magdalena peñasco mixtec": "xtm",
-    "northern tlaxiaco mixtec": "xtn",
-    "tokharian a": "xto",
-    "san miguel piedras mixtec": "xtp",
-    "tumshuqese": "xtq",
-    "early tripuri": "xtr",
-    "sindihui mixtec": "xts",
-    "tacahua mixtec": "xtt",
-    "cuyamecalco mixtec": "xtu",
-    "thawa": "xtv",
-    "tawandê": "xtw",
-    "yoloxochitl mixtec": "xty",
-    "alu kurumba": "xua",
-    "betta kurumba": "xub",
-    "umiida": "xud",
-    "kunigami": "xug",
-    "jennu kurumba": "xuj",
-    "ngunawal": "xul",
-    "umbrian": "xum",
-    "unggaranggu": "xun",
-    "upper umpqua": "xup",
-    "urartian": "xur",
-    "kuthant": "xut",
-    "kxoe": "xuu",
-    "venetic": "xve",
-    "kamviri": "xvi",
-    "vandalic": "xvn",
-    "volscian": "xvo",
-    "vestinian": "xvs",
-    "kwaza": "xwa",
-    "woccon": "xwc",
-    "wadi wadi": "xwd",
-    "xwela gbe": "xwe",
-    "kwegu": "xwg",
-    "wajuk": "xwj",
-    "wangkumara": "xwk",
-    "western xwla gbe": "xwl",
-    "written oirat": "xwo",
-    "kwerba mamberamo": "xwr",
-    "wotjobaluk": "xwt",
-    "wemba wemba": "xww",
-    "boro (ghana)": "xxb",
-    "ke'o": "xxk",
-    "minkin": "xxm",
-    "koropó": "xxr",
-    "tambora": "xxt",
-    "yaygir": "xya",
-    "yandjibara": "xyb",
-    "mayi-yapi": "xyj",
-    "mayi-kulan": "xyk",
-    "yalakalore": "xyl",
-    "mayi-thakurti": "xyt",
-    "yorta yorta": "xyy",
-    "zhang-zhung": "xzh",
-    "zemgalian": "xzm",
-    "ancient zapotec": "xzp",
-    "yaminahua": "yaa",
-    "yuhup": "yab",
-    "pass valley yali": "yac",
-    "yagua": "yad",
-    "pumé": "yae",
-    "yaka (democratic republic of congo)": "yaf",
-    "yámana": "yag",
-    "yazgulyam": "yah",
-    "yagnobi": "yai",
-    "banda-yangere": "yaj",
-    "yakama": "yak",
-    "yalunka": "yal",
-    "yamba": "yam",
-    "mayangna": "yan",
-    "yao": "yao",
-    "yap": "yap",
-    "yapese": "yap",
-    "yaqui": "yaq",
-    "yabarana": "yar",
-    "nugunu (cameroon)": "yas",
-    "yambeta": "yat",
-    "yuwana": "yau",
-    "yangben": "yav",
-    "yawalapití": "yaw",
-    "yauma": "yax",
-    "agwagwune": "yay",
-    "lokaa": "yaz",
-    "yala": "yba",
-    "yemba": "ybb",
-    "west yugur": "ybe",
-    "yakha": "ybh",
-    "yamphu": "ybi",
-    "hasha": "ybj",
-    "bokha": "ybk",
-    "yukuben": "ybl",
-    "yaben": "ybm",
-    "yabaâna": "ybn",
-    "yabong": "ybo",
-    "yawiyo": "ybx",
-    "yaweyuha": "yby",
-    "chesu": "ych",
-    "lolopo": "ycl",
-    "yucuna": "ycn",
-    "chepya": "ycp",
-    "yanda": "yda",
-    "eastern yiddish": "ydd",
-    "yangum dey": "yde",
-    "yidgha": "ydg",
-    "yoidik": "ydk",
-    "ravula": "yea",
-    "yeniche": "yec",
-    "yimas": "yee",
-    "yeni": "yei",
-    "yevanic": "yej",
-    "yela": "yel",
-    "tarok": "yer",
-    "nyankpa": "yes",
-    "yetfa": "yet",
-    "yerukula": "yeu",
-    "yapunda": "yev",
-    "yeyi": "yey",
-    "malyangapa": "yga",
-    "yiningayi": "ygi",
-    "yangum gel": "ygl",
-    "yagomi": "ygm",
-    "gepo": "ygp",
-    "yagaria": "ygr",
-    "yolŋu sign language": "ygs",
-    "yugul": "ygu",
-    "yagwoia": "ygw",
-    "baha buyang": "yha",
-    "judeo-iraqi arabic": "yhd",
-    "hlepho phowa": "yhl",
-    "yan-nhaŋu sign language": "yhs",
-    "yinggarda": "yia",
-    "yi": "yid",
-    "yid": "yid",
-    "yiddish": "yid",
-    "ache": "yif",
-    "wusa nasu": "yig",
-    "western yiddish": "yih",
-    "yidiny": "yii",
-    "yindjibarndi": "yij",
-    "dongshanba lalo": "yik",
-    "yindjilandji": "yil",
-    "yimchungru naga": "yim",
-    "riang lai": "yin",
-    "pholo": "yip",
-    "miqie": "yiq",
-    "north awyu": "yir",
-    "eastern lalu": "yit",
-    "northern nisu": "yiv",
-    "axi yi": "yix",
-    "azhe": "yiz",
-    "yakan": "yka",
-    "northern yukaghir": "ykg",
-    "yoke": "yki",
-    "yakaikeke": "ykk",
-    "khlula": "ykl",
-    "kua-nsi": "ykn",
-    "yasa": "yko",
-    "yekora": "ykr",
-    "kathu": "ykt",
-    "kuamasi": "yku",
-    "yakoma": "yky",
-    "yaul": "yla",
-    "yaleba": "ylb",
-    "yele": "yle",
-    "yelogu": "ylg",
-    "angguruk yali": "yli",
-    "limi": "ylm",
-    "langnian buyang": "yln",
-    "naluo yi": "ylo",
-    "yalarnnga": "ylr",
-    "aribwaung": "ylu",
-    "nyâlayu": "yly",
-    "yambes": "ymb",
-    "southern muji": "ymc",
-    "muda": "ymd",
-    "yameo": "yme",
-    "yamongeri": "ymg",
-    "mili": "ymh",
-    "moji": "ymi",
-    "makwe": "ymk",
-    "iamalele": "yml",
-    "maay": "ymm",
-    "yamna": "ymn",
-    "yangum mon": "ymo",
-    "yamap": "ymp",
-    "qila muji": "ymq",
-    "malasar": "ymr",
-    "mysian": "yms",
-    "northern muji": "ymx",
-    "muzi": "ymz",
-    "aluo": "yna",
-    "yandruwandha": "ynd",
-    "lang'e": "yne",
-    "yango": "yng",
-    "naukan yupik": "ynk",
-    "yangulam": "ynl",
-    "yana": "ynn",
-    "yong": "yno",
-    "yendang": "ynq",
-    "yansi": "yns",
-    "yahuna": "ynu",
-    "yoba": "yob",
-    "yogad": "yog",
-    "yonaguni": "yoi",
-    "yokuts": "yok",
-    "yola": "yol",
-    "yombe": "yom",
-    "yongkom": "yon",
-    "yo": "yor",
-    "yor": "yor",
-    "yoruba": "yor",
-    "yotti": "yot",
-    "yoron": "yox",
-    "phala": "ypa",
-    "labo phowa": "ypb",
-    "phola": "ypg",
-    "phupha": "yph",
-    "phuma": "ypm",
-    "ani phowa": "ypn",
-    "alo phola": "ypo",
-    "phupa": "ypp",
-    "phuza": "ypz",
-    "yerakai": "yra",
-    "yareba": "yrb",
-    "yaouré": "yre",
-    "nenets": "yrk",
-    "nhengatu": "yrl",
-    "yirrk-mel": "yrm",
-    "yerong": "yrn",
-    "yaroamë": "yro",
-    "yarsun": "yrs",
-    "yarawata": "yrw",
-    "yarluyandi": "yry",
-    "yassic": "ysc",
-    "samatao": "ysd",
-    "sonaga": "ysg",
-    "yugoslavian sign language": "ysl",
-    "myanmar sign language": "ysm",
-    "sani": "ysn",
-    "nisi (china)": "yso",
-    "southern lolopo": "ysp",
-    "sirenik yupik": "ysr",
-    "yessan-mayo": "yss",
-    "sanie": "ysy",
-    "talu": "yta",
-    "tanglang": "ytl",
-    "thopho": "ytp",
-    "yout wam": "ytw",
-    "yatay": "yty",
-    "yucateco": "yua",
-    "yugambal": "yub",
-    "yuchi": "yuc",
-    "judeo-tripolitanian arabic": "yud",
-    "yue chinese": "yue",
-    "havasupai-walapai-yavapai": "yuf",
-    "yurutí": "yui",
-    "karkar-yuri": "yuj",
-    "yuki": "yuk",
-    "yulu": "yul",
-    "quechan": "yum",
-    "bena (nigeria)": "yun",
-    "yukpa": "yup",
-    "yuqui": "yuq",
-    "yurok": "yur",
-    "yopno": "yut",
-    "yau (morobe province)": "yuw",
-    "southern yukaghir": "yux",
-    "east yugur": "yuy",
-    "yuracare": "yuz",
-    "yawa": "yva",
-    "yavitero": "yvt",
-    "kalou": "ywa",
-    "yinhawangka": "ywg",
-    "western lalu": "ywl",
-    "yawanawa": "ywn",
-    "wuding-luquan yi": "ywq",
-    "yawuru": "ywr",
-    "xishanba lalo": "ywt",
-    "wumeng nasu": "ywu",
-    "yawarawarga": "yww",
-    "mayawali": "yxa",
-    "yagara": "yxg",
-    "yardliyawarra": "yxl",
-    "yinwum": "yxm",
-    "yuyu": "yxu",
-    "yabula yabula": "yxy",
-    "yir yoront": "yyr",
-    "yau (sandaun province)": "yyu",
-    "ayizi": "yyz",
-    "e'ma buyang": "yzg",
-    "zokhuo": "yzk",
-    "sierra de juárez zapotec": "zaa",
-    "western tlacolula valley zapotec": "zab",
-    "ocotlán zapotec": "zac",
-    "cajonos zapotec": "zad",
-    "yareni zapotec": "zae",
-    "ayoquesco zapotec": "zaf",
-    "zaghawa": "zag",
-    "zangwal": "zah",
-    "isthmus zapotec": "zai",
-    "zaramo": "zaj",
-    "zanaki": "zak",
-    "zauzou": "zal",
-    "miahuatlán zapotec": "zam",
-    "ozolotepec zapotec": "zao",
-    "zap": "zap",
-    "zapotec": "zap",
-    "aloápam zapotec": "zaq",
-    "rincón zapotec": "zar",
-    "santo domingo albarradas zapotec": "zas",
-    "tabaa zapotec": "zat",
-    "zangskari": "zau",
-    "yatzachi zapotec": "zav",
-    "mitla zapotec": "zaw",
-    "xadani zapotec": "zax",
-    "zayse-zergulla": "zay",
-    "zari": "zaz",
-    "balaibalan": "zba",
-    "central berawan": "zbc",
-    "east berawan": "zbe",
-    "zbl": "zbl",
-    "blissymbols": "zbl",
-    "batui": "zbt",
-    "bu (bauchi state)": "zbu",
-    "west berawan": "zbw",
-    "coatecas altas zapotec": "zca",
-    "central hongshuihe zhuang": "zch",
-    "ngazidja comorian": "zdj",
-    "zeeuws": "zea",
-    "zenag": "zeg",
-    "eastern hongshuihe zhuang": "zeh",
-    "zen": "zen",
-    "zenaga": "zen",
-    "kinga": "zga",
-    "guibei zhuang": "zgb",
-    "zgh": "zgh",
-    "standard moroccan tamazight": "zgh",
-    "minz zhuang": "zgm",
-    "guibian zhuang": "zgn",
-    "magori": "zgr",
-    "za": "zha",
-    "zha": "zha",
-    "zhuang": "zha",
-    "zhaba": "zhb",
-    "dai zhuang": "zhd",
-    "zhire": "zhi",
-    "nong zhuang": "zhn",
-    "zh": "zho",
-    "chi": "zho",
-    "zho": "zho",
-    "chinese": "zho",
-    "zhoa": "zhw",
-    "zimbabwe sign language": "zib",
-    "zimakani": "zik",
-    "zialo": "zil",
-    "mesme": "zim",
-    "zinza": "zin",
-    "zigula": "ziw",
-    "zizilivakan": "ziz",
-    "kaimbulawa": "zka",
-    "koibal": "zkb",
-    "kadu": "zkd",
-    "koguryo": "zkg",
-    "khorezmian": "zkh",
-    "karankawa": "zkk",
-    "kanan": "zkn",
-    "kott": "zko",
-    "são paulo kaingáng": "zkp",
-    "zakhring": "zkr",
-    "kitan": "zkt",
-    "kaurna": "zku",
-    "krevinian": "zkv",
-    "khazar": "zkz",
-    "zula": "zla",
-    "liujiang zhuang": "zlj",
-    "malay (individual language)": "zlm",
-    "lianshan zhuang": "zln",
-    "liuqian zhuang": "zlq",
-    "manda (australia)": "zma",
-    "zimba": "zmb",
-    "margany": "zmc",
-    "maridan": "zmd",
-    "mangerr": "zme",
-    "mfinu": "zmf",
-    "marti ke": "zmg",
-    "makolkol": "zmh",
-    "negeri sembilan malay": "zmi",
-    "maridjabin": "zmj",
-    "mandandanyi": "zmk",
-    "matngala": "zml",
-    "marimanindji": "zmm",
-    "mbangwe": "zmn",
-    "molo": "zmo",
-    "mpuono": "zmp",
-    "mituku": "zmq",
-    "maranunggu": "zmr",
-    "mbesa": "zms",
-    "maringarr": "zmt",
-    "muruwari": "zmu",
-    "mbariman-gudhinma": "zmv",
-    "mbo (democratic republic of congo)": "zmw",
-    "bomitaba": "zmx",
-    "mariyedi": "zmy",
-    "mbandja": "zmz",
-    "zan gula": "zna",
-    "zande (individual language)": "zne",
-    "mang": "zng",
-    "manangkari": "znk",
-    "mangas": "zns",
-    "copainalá zoque": "zoc",
-    "chimalapa zoque": "zoh",
-    "asunción mixtepec zapotec": "zoo",
-    "tabasco zoque": "zoq",
-    "rayón zoque": "zor",
-    "francisco león zoque": "zos",
-    "lachiguiri zapotec": "zpa",
-    "yautepec zapotec": "zpb",
-    "choapan zapotec": "zpc",
-    "southeastern ixtlán zapotec": "zpd",
-    "petapa zapotec": "zpe",
-    "san pedro quiatoni zapotec": "zpf",
-    "guevea de humboldt zapotec": "zpg",
-    "totomachapan zapotec": "zph",
-    "santa maría quiegolani zapotec": "zpi",
-    "quiavicuzas zapotec": "zpj",
-    "tlacolulita zapotec": "zpk",
-    "lachixío zapotec": "zpl",
-    "mixtepec zapotec": "zpm",
-    "santa inés yatzechi zapotec": "zpn",
-    "amatlán zapotec": "zpo",
-    "el alto zapotec": "zpp",
-    "zoogocho zapotec": "zpq",
-    "santiago xanica zapotec": "zpr",
-    "coatlán zapotec": "zps",
-    "san vicente coatlán zapotec": "zpt",
-    "yalálag zapotec": "zpu",
-    "chichicapan zapotec": "zpv",
-    "zaniza zapotec": "zpw",
-    "san baltazar loxicha zapotec": "zpx",
-    "mazaltepec zapotec": "zpy",
-    "texmelucan zapotec": "zpz",
-    "qiubei zhuang": "zqe",
-    "kara (korea)": "zra",
-    "mirgan": "zrg",
-    "zerenkel": "zrn",
-    "záparo": "zro",
-    "zarphatic": "zrp",
-    "mairasi": "zrs",
-    "sarasira": "zsa",
-    "kaskean": "zsk",
-    "zambian sign language": "zsl",
-    "standard malay": "zsm",
-    "southern rincon zapotec": "zsr",
-    "sukurum": "zsu",
-    "elotepec zapotec": "zte",
-    "xanaguía zapotec": "ztg",
-    "lapaguía-guivini zapotec": "ztl",
-    "san agustín mixtepec zapotec": "ztm",
-    "santa catarina albarradas zapotec": "ztn",
-    "loxicha zapotec": "ztp",
-    "quioquitani-quierí zapotec": "ztq",
-    "tilquiapan zapotec": "zts",
-    "tejalapan zapotec": "ztt",
-    "güilá zapotec": "ztu",
-    "zaachila zapotec": "ztx",
-    "yatee zapotec": "zty",
-    "zeem": "zua",
-    "tokano": "zuh",
-    "zu": "zul",
-    "zul": "zul",
-    "zulu": "zul",
-    "kumzari": "zum",
-    "zun": "zun",
-    "zuni": "zun",
-    "zumaya": "zuy",
-    "zxx": "zxx",
-    "no linguistic content": "zxx",
-    "yongbei zhuang": "zyb",
-    "yang zhuang": "zyg",
-    "youjiang zhuang": "zyj",
-    "yongnan zhuang": "zyn",
-    "zyphe chin": "zyp",
-    "zza": "zza",
-    "zaza": "zza",
-    "zuojiang zhuang": "zzj",
-    "африкаанс": "afr",
-    "afrikáans": "afr",
-    "الأفريقانية": "afr",
-    "阿非利卡语": "afr",
-    "አማርኛ": "amh",
-    "амхарский язык": "amh",
-    "amharique": "amh",
-    "amhárico": "amh",
-    "амхарська мова": "amh",
-    "الأمهرية": "amh",
-    "阿姆哈拉语": "amh",
-    "العربية": "ara",
-    "arb": "ara",
-    "arz": "ara",
-    "apc": "ara",
-    "acm": "ara",
-    "арабский язык": "ara",
-    "arabe": "ara",
-    "árabe": "ara",
-    "арабська мова": "ara",
-    "阿拉伯语": "ara",
-    "azərbaycan": "aze",
-    "azeri": "aze",
-    "aze_cyrl": "aze",
-    "азербайджанский язык": "aze",
-    "azéri": "aze",
-    "azerí": "aze",
-    "азербайджанська мова": "aze",
-    "الأذرية": "aze",
-    "阿塞拜疆语": "aze",
-    "belarussian": "bel",
-    "белорусский язык": "bel",
-    "biélorusse": "bel",
-    "bielorruso": "bel",
-    "білоруська мова": "bel",
-    "البيلاروسية": "bel",
-    "白俄罗斯语": "bel",
-    "byelorussian": "bel",
-    "belorussian": "bel",
-    "বাংলা": "ben",
-    "бенгальский язык": "ben",
-    "bengalí": "ben",
-    "бенгальська мова": "ben",
-    "البنغالية": "ben",
-    "孟加拉语": "ben",
-    "bosanski": "bos",
-    "боснийский язык": "bos",
-    "bosnien": "bos",
-    "bosnio": "bos",
-    "боснійська мова": "bos",
-    "البوسنية": "bos",
-    "波斯尼亚语": "bos",
-    "български": "bul",
-    "болгарский язык": "bul",
-    "bulgare": "bul",
-    "búlgaro": "bul",
-    "болгарська мова": "bul",
-    "البلغارية": "bul",
-    "保加利亞語": "bul",
-    "català": "cat",
-    "каталанский язык": "cat",
-    "catalán": "cat",
-    "каталанська мова": "cat",
-    "الكتالونية": "cat",
-    "加泰罗尼亚语": "cat",
-    "čeština": "ces",
-    "чешский язык": "ces",
-    "tchèque": "ces",
-    "checo": "ces",
-    "чеська мова": "ces",
-    "التشيكية": "ces",
-    "捷克語": "ces",
-    "crnogorski": "cnr",
-    "черногорский язык": "cnr",
-    "monténégrin": "cnr",
-    "montenegrino": "cnr",
-    "чорногорська мова": "cnr",
-    "المونتنغرية": "cnr",
-    "蒙特內哥羅語": "cnr",
-    "dansk": "dan",
-    "датский язык": "dan",
-    "danois": "dan",
-    "danés": "dan",
-    "данська мова": "dan",
-    "الدنماركية": "dan",
-    "丹麦语": "dan",
-    "deutsch": "deu",
-    "немецкий язык": "deu",
-    "allemand": "deu",
-    "alemán": "deu",
-    "німецька мова": "deu",
-    "الألمانية": "deu",
-    "德语": "deu",
-    "greek": "ell",
-    "ελληνικά": "ell",
-    "новогреческий язык": "ell",
-    "grec moderne": "ell",
-    "griego": "ell",
-    "новогрецька мова": "ell",
-    "اليونانية الحديثة": "ell",
-    "现代希腊语": "ell",
-    "englisch": "eng",
-    "anglais": "eng",
-    "английский язык": "eng",
-    "inglés": "eng",
-    "англійська мова": "eng",
-    "الإنجليزية": "eng",
-    "英語": "eng",
-    "eesti": "est",
-    "eesti keel": "est",
-    "эстонский язык": "est",
-    "estonien": "est",
-    "estonio": "est",
-    "естонська мова": "est",
-    "الإستونية": "est",
-    "愛沙尼亞語": "est",
-    "iranian": "fas",
-    "فارسی": "fas",
-    "farsi": "fas",
-    "персидский язык": "fas",
-    "persan": "fas",
-    "persa": "fas",
-    "перська мова": "fas",
-    "الفارسية": "fas",
-    "波斯語": "fas",
-    "suomi": "fin",
-    "финский язык": "fin",
-    "finnois": "fin",
-    "finés": "fin",
-    "фінська мова": "fin",
-    "الفنلندية": "fin",
-    "芬兰语": "fin",
-    "pilipino": "fil",
-    "филиппинский язык": "fil",
-    "philippin": "fil",
-    "idioma filipino": "fil",
-    "філіппінська": "fil",
-    "الفلبينية": "fil",
-    "菲律賓語": "fil",
-    "französisch": "fra",
-    "français": "fra",
-    "французский язык": "fra",
-    "francés": "fra",
-    "французька мова": "fra",
-    "الفرنسية": "fra",
-    "法语": "fra",
-    "gaeilge": "gle",
-    "ирландский язык": "gle",
-    "irlandais": "gle",
-    "irlandés": "gle",
-    "ірландська мова": "gle",
-    "الأيرلندية": "gle",
-    "爱尔兰语": "gle",
-    "ગુજરાતી": "guj",
-    "עברית": "heb",
-    "iw": "heb",
-    "иврит": "heb",
-    "hébreu": "heb",
-    "hebreo": "heb",
-    "іврит": "heb",
-    "العبرية الحديثة": "heb",
-    "現代希伯來語": "heb",
-    "हिंदी": "hin",
-    "хинди": "hin",
-    "гінді": "hin",
-    "الهندية": "hin",
-    "印地語": "hin",
-    "hrvatski": "hrv",
-    "cro": "hrv",
-    "scr": "hrv",
-    "хорватский язык": "hrv",
-    "croate": "hrv",
-    "croata": "hrv",
-    "хорватська мова": "hrv",
-    "الكرواتية": "hrv",
-    "克罗地亚语": "hrv",
-    "magyar": "hun",
-    "венгерский язык": "hun",
-    "hongrois": "hun",
-    "húngaro": "hun",
-    "угорська мова": "hun",
-    "المجرية": "hun",
-    "匈牙利語": "hun",
-    "հայերեն": "hye",
-    "армянский язык": "hye",
-    "arménien": "hye",
-    "armenio": "hye",
-    "вірменська мова": "hye",
-    "الأرمنية": "hye",
-    "亞美尼亞語": "hye",
-    "bahasa indonesia": "ind",
-    "in": "ind",
-    "индонезийский язык": "ind",
-    "indonésien": "ind",
-    "indonesio": "ind",
-    "індонезійська мова": "ind",
-    "الإندونيسية": "ind",
-    "印尼語": "ind",
-    "íslenska": "isl",
-    "исландский язык": "isl",
-    "islandais": "isl",
-    "islandés": "isl",
-    "ісландська мова": "isl",
-    "الآيسلندية": "isl",
-    "冰島語": "isl",
-    "italiano": "ita",
-    "итальянский язык": "ita",
-    "italien": "ita",
-    "італійська мова": "ita",
-    "الإيطالية": "ita",
-    "意大利語": "ita",
-    "jawa": "jav",
-    "jw": "jav",
-    "jaw": "jav",
-    "日本語": "jpn",
-    "японский язык": "jpn",
-    "japonais": "jpn",
-    "japonés": "jpn",
-    "японська мова": "jpn",
-    "اليابانية": "jpn",
-    "日語": "jpn",
-    "ಕನ್ನಡ": "kan",
-    "каннада": "kan",
-    "kannara": "kan",
-    "canarés": "kan",
-    "الكنادية": "kan",
-    "卡纳达语": "kan",
-    "ქართული": "kat",
-    "грузинский язык": "kat",
-    "géorgien": "kat",
-    "georgiano": "kat",
-    "грузинська мова": "kat",
-    "الجورجية": "kat",
-    "格鲁吉亚语": "kat",
-    "қазақша": "kaz",
-    "qazaq": "kaz",
-    "казахский язык": "kaz",
-    "kazajo": "kaz",
-    "казахська мова": "kaz",
-    "القزاقية": "kaz",
-    "哈薩克語": "kaz",
-    "central khmer": "khm",
-    "ខ្មែរ": "khm",
-    "кхмерский язык": "khm",
-    "camboyano": "khm",
-    "кхмерська мова": "khm",
-    "الخميرية": "khm",
-    "高棉语": "khm",
-    "cambodian": "khm",
-    "kirghiz; kyrgyz": "kir",
-    "kyrgyz": "kir",
-    "киргизский язык": "kir",
-    "kirghize": "kir",
-    "kirguís": "kir",
-    "киргизька мова": "kir",
-    "القرغيزية": "kir",
-    "柯尔克孜语": "kir",
-    "한국어": "kor",
-    "корейский язык": "kor",
-    "coréen": "kor",
-    "coreano": "kor",
-    "корейська мова": "kor",
-    "الكورية": "kor",
-    "朝鮮語": "kor",
-    "ລາວ": "lao",
-    "лаосский язык": "lao",
-    "лаоська мова": "lao",
-    "لاو": "lao",
-    "老挝语": "lao",
-    "latviešu": "lav",
-    "latviešu valoda": "lav",
-    "латышский язык": "lav",
-    "letton": "lav",
-    "letón": "lav",
-    "латиська мова": "lav",
-    "اللاتفية": "lav",
-    "拉脫維亞語": "lav",
-    "lietuvių": "lit",
-    "lietuvių kalba": "lit",
-    "литовский язык": "lit",
-    "lituanien": "lit",
-    "lituano": "lit",
-    "литовська мова": "lit",
-    "اللتوانية": "lit",
-    "立陶宛語": "lit",
-    "lëtzebuergesch": "ltz",
-    "люксембургский язык": "ltz",
-    "luxembourgeois": "ltz",
-    "luxemburgués": "ltz",
-    "люксембурзька мова": "ltz",
-    "اللوكسمبورغية": "ltz",
-    "卢森堡语": "ltz",
-    "മലയാളം": "mal",
-    "मराठी": "mar",
-    "македонски": "mkd",
-    "македонский язык": "mkd",
-    "macédonien": "mkd",
-    "macedonio": "mkd",
-    "македонська мова": "mkd",
-    "المقدونية": "mkd",
-    "马其顿语": "mkd",
-    "malti": "mlt",
-    "мальтийский язык": "mlt",
-    "maltais": "mlt",
-    "maltés": "mlt",
-    "мальтійська мова": "mlt",
-    "المالطية": "mlt",
-    "马耳他语": "mlt",
-    "монгол хэл": "mon",
-    "монгольский язык": "mon",
-    "монгольська мова": "mon",
-    "المغولية": "mon",
-    "蒙古语": "mon",
-    "malay": "msa",
-    "bahasa melayu": "msa",
-    "малайский язык": "msa",
-    "malais": "msa",
-    "малайська мова": "msa",
-    "الملايوية": "msa",
-    "马来语": "msa",
-    "မြန်မာ": "mya",
-    "бирманский язык": "mya",
-    "birman": "mya",
-    "idioma birmano": "mya",
-    "бірманська мова": "mya",
-    "البورمية": "mya",
-    "缅甸语": "mya",
-    "nepali": "nep",
-    "nepalese": "nep",
-    "नेपाली": "nep",
-    "npi": "nep",
-    "непальский язык": "nep",
-    "népalais": "nep",
-    "nepalí": "nep",
-    "непальська мова": "nep",
-    "النيبالية": "nep",
-    "尼泊尔语": "nep",
-    "nederlands": "nld",
-    "нидерландский язык": "nld",
-    "néerlandais": "nld",
-    "neerlandés": "nld",
-    "нідерландська мова": "nld",
-    "الهولندية": "nld",
-    "荷蘭語": "nld",
-    "flemish": "nld",
-    "norsk": "nor",
-    "норвежский язык": "nor",
-    "norvégien": "nor",
-    "noruego": "nor",
-    "норвезька мова": "nor",
-    "النرويجية": "nor",
-    "挪威語": "nor",
-    "bokmål": "nor",
-    "bokmal": "nor",
-    "punjabi": "pan",
-    "ਪੰਜਾਬੀ": "pan",
-    "polski": "pol",
-    "польский язык": "pol",
-    "polonais": "pol",
-    "polaco": "pol",
-    "польська мова": "pol",
-    "البولندية": "pol",
-    "波蘭語": "pol",
-    "português": "por",
-    "португальский язык": "por",
-    "portugais": "por",
-    "portugués": "por",
-    "португальська мова": "por",
-    "البرتغالية": "por",
-    "葡萄牙语": "por",
-    "pashto": "pus",
-    "pashtu": "pus",
-    "پښتو": "pus",
-    "пушту": "pus",
-    "pachto": "pus",
-    "pastún": "pus",
-    "البشتوية": "pus",
-    "普什圖語": "pus",
-    "pushtu": "pus",
-    "română": "ron",
-    "moldavian": "ron",
-    "moldovan": "ron",
-    "mo": "ron",
-    "mol": "ron",
-    "romanian; moldavian; moldovan": "ron",
-    "румынский язык": "ron",
-    "roumain": "ron",
-    "rumano": "ron",
-    "румунська мова": "ron",
-    "الرومانية": "ron",
-    "羅馬尼亞語": "ron",
-    "русский": "rus",
-    "русский язык": "rus",
-    "russe": "rus",
-    "ruso": "rus",
-    "російська мова": "rus",
-    "الروسية": "rus",
-    "俄語": "rus",
-    "සිංහල": "sin",
-    "сингальский язык": "sin",
-    "singhalais": "sin",
-    "cingalés": "sin",
-    "сингальська мова": "sin",
-    "السنهالية": "sin",
-    "僧伽罗语": "sin",
-    "slovenčina": "slk",
-    "словацкий язык": "slk",
-    "slovaque": "slk",
-    "eslovaco": "slk",
-    "словацька мова": "slk",
-    "السلوفاكية": "slk",
-    "斯洛伐克語": "slk",
-    "slovene": "slv",
-    "slovenščina": "slv",
-    "словенский язык": "slv",
-    "slovène": "slv",
-    "esloveno": "slv",
-    "словенська мова": "slv",
-    "السلوفينية": "slv",
-    "斯洛文尼亚语": "slv",
-    "español": "spa",
-    "испанский язык": "spa",
-    "espagnol": "spa",
-    "іспанська мова": "spa",
-    "الإسبانية": "spa",
-    "西班牙語": "spa",
-    "castilian": "spa",
-    "shqip": "sqi",
-    "албанский язык": "sqi",
-    "albanais": "sqi",
-    "albanés": "sqi",
-    "албанська мова": "sqi",
-    "الألبانية": "sqi",
-    "阿爾巴尼亞語": "sqi",
-    "српски": "srp",
-    "scc": "srp",
-    "сербский язык": "srp",
-    "serbe": "srp",
-    "serbio": "srp",
-    "сербська мова": "srp",
-    "الصربية": "srp",
-    "塞尔维亚语": "srp",
-    "kiswahili": "swa",
-    "swahili": "swa",
-    "суахили": "swa",
-    "suajili": "swa",
-    "суахілі": "swa",
-    "السواحلية": "swa",
-    "斯瓦希里語": "swa",
-    "svenska": "swe",
-    "шведский язык": "swe",
-    "suédois": "swe",
-    "sueco": "swe",
-    "шведська мова": "swe",
-    "السويدية": "swe",
-    "瑞典語": "swe",
-    "தமிழ்": "tam",
-    "тамильский язык": "tam",
-    "tamoul": "tam",
-    "тамільська мова": "tam",
-    "التملية": "tam",
-    "泰米爾語": "tam",
-    "తెలుగు": "tel",
-    "телугу": "tel",
-    "télougou": "tel",
-    "télugu": "tel",
-    "التيلوغوية": "tel",
-    "泰卢固语": "tel",
-    "tajiki": "tgk",
-    "тоҷикӣ": "tgk",
-    "стандартный таджикский язык": "tgk",
-    "tadjik": "tgk",
-    "tayiko": "tgk",
-    "таджицька мова": "tgk",
-    "الطاجيكية": "tgk",
-    "塔吉克语": "tgk",
-    "wikang tagalog": "tgl",
-    "тагальский язык": "tgl",
-    "tagalo": "tgl",
-    "тагальська мова": "tgl",
-    "التاغالوغية": "tgl",
-    "他加祿語": "tgl",
-    "ภาษาไทย": "tha",
-    "тайский язык": "tha",
-    "thaï": "tha",
-    "tailandés": "tha",
-    "тайська мова": "tha",
-    "التايلندية": "tha",
-    "泰語": "tha",
-    "türkçe": "tur",
-    "турецкий язык": "tur",
-    "turc": "tur",
-    "turco": "tur",
-    "турецька мова": "tur",
-    "التركية": "tur",
-    "土耳其語": "tur",
-    "türkmençe": "tuk",
-    "туркменский язык": "tuk",
-    "turkmène": "tuk",
-    "turcomano": "tuk",
-    "туркменська мова": "tuk",
-    "التركمانية": "tuk",
-    "土库曼语": "tuk",
-    "українська": "ukr",
-    "украинский язык": "ukr",
-    "ukrainien": "ukr",
-    "ucraniano": "ukr",
-    "українська мова": "ukr",
-    "الأوكرانية": "ukr",
-    "乌克兰语": "ukr",
-    "اردو": "urd",
-    "урду": "urd",
-    "ourdou": "urd",
-    "الأردية": "urd",
-    "乌尔都语": "urd",
-    "oʻzbek": "uzb",
-    "ўзбек тили": "uzb",
-    "узбекский язык": "uzb",
-    "ouzbek": "uzb",
-    "uzbeko": "uzb",
-    "узбецька мова": "uzb",
-    "الأوزبكية": "uzb",
-    "乌兹别克语": "uzb",
-    "tiếng việt": "vie",
-    "вьетнамский язык": "vie",
-    "vietnamien": "vie",
-    "vietnamita": "vie",
-    "в'єтнамська": "vie",
-    "الفيتنامية": "vie",
-    "越南语": "vie",
-    "ji": "yid",
-    "yorùbá": "yor",
-    "中文": "zho",
-    "chi_sim": "zho",
-    "chi_tra": "zho",
-    "китайский язык": "zho",
-    "chinois": "zho",
-    "chino": "zho",
-    "китайська мова": "zho",
-    "الصينية": "zho",
-    "mandarin": "zho",
-    "isizulu": "zul",
-}  # noqa
-ISO2_MAP: Dict[str, str] = {
-    "aar": "aa",
-    "abk": "ab",
-    "afr": "af",
-    "aka": "ak",
-    "amh": "am",
-    "ara": "ar",
-    "arg": "an",
-    "asm": "as",
-    "ava": "av",
-    "ave": "ae",
-    "aym": "ay",
-    "aze": "az",
-    "bak": "ba",
-    "bam": "bm",
-    "bel": "be",
-    "ben": "bn",
-    "bis": "bi",
-    "bod": "bo",
-    "bos": "bs",
-    "bre": "br",
-    "bul": "bg",
-    "cat": "ca",
-    "ces": "cs",
-    "cha": "ch",
-    "che": "ce",
-    "chu": "cu",
-    "chv": "cv",
-    "cor": "kw",
-    "cos": "co",
-    "cre": "cr",
-    "cym": "cy",
-    "dan": "da",
-    "deu": "de",
-    "div": "dv",
-    "dzo": "dz",
-    "ell": "el",
-    "eng": "en",
-    "epo": "eo",
-    "est": "et",
-    "eus": "eu",
-    "ewe": "ee",
-    "fao": "fo",
-    "fas": "fa",
-    "fij": "fj",
-    "fin": "fi",
-    "fra": "fr",
-    "fry": "fy",
-    "ful": "ff",
-    "gla": "gd",
-    "gle": "ga",
-    "glg": "gl",
-    "glv": "gv",
-    "grn": "gn",
-    "guj": "gu",
-    "hat": "ht",
-    "hau": "ha",
-    "hbs": "sh",
-    "heb": "he",
-    "her": "hz",
-    "hin": "hi",
-    "hmo": "ho",
-    "hrv": "hr",
-    "hun": "hu",
-    "hye": "hy",
-    "ibo": "ig",
-    "ido": "io",
-    "iii": "ii",
-    "iku": "iu",
-    "ile": "ie",
-    "ina": "ia",
-    "ind": "id",
-    "ipk": "ik",
-    "isl": "is",
-    "ita": "it",
-    "jav": "jv",
-    "jpn": "ja",
-    "kal": "kl",
-    "kan": "kn",
-    "kas": "ks",
-    "kat": "ka",
-    "kau": "kr",
-    "kaz": "kk",
-    "khm": "km",
-    "kik": "ki",
-    "kin": "rw",
-    "kir": "ky",
-    "kom": "kv",
-    "kon": "kg",
-    "kor": "ko",
-    "kua": "kj",
-    "kur": "ku",
-    "lao": "lo",
-    "lat": "la",
-    "lav": "lv",
-    "lim": "li",
-    "lin": "ln",
-    "lit": "lt",
-    "ltz": "lb",
-    "lub": "lu",
-    "lug": "lg",
-    "mah": "mh",
-    "mal": "ml",
-    "mar": "mr",
-    "mkd": "mk",
-    "mlg": "mg",
-    "mlt": "mt",
-    "mon": "mn",
-    "mri": "mi",
-    "msa": "ms",
-    "mya": "my",
-    "nau": "na",
-    "nav": "nv",
-    "nbl": "nr",
-    "nde": "nd",
-    "ndo": "ng",
-    "nep": "ne",
-    "nld": "nl",
-    "nno": "nn",
-    "nob": "nb",
-    "nor": "no",
-    "nya": "ny",
-    "oci": "oc",
-    "oji": "oj",
-    "ori": "or",
-    "orm": "om",
-    "oss": "os",
-    "pan": "pa",
-    "pli": "pi",
-    "pol": "pl",
-    "por": "pt",
-    "pus": "ps",
-    "que": "qu",
-    "roh": "rm",
-    "ron": "ro",
-    "run": "rn",
-    "rus": "ru",
-    "sag": "sg",
-    "san": "sa",
-    "sin": "si",
-    "slk": "sk",
-    "slv": "sl",
-    "sme": "se",
-    "smo": "sm",
-    "sna": "sn",
-    "snd": "sd",
-    "som": "so",
-    "sot": "st",
-    "spa": "es",
-    "sqi": "sq",
-    "srd": "sc",
-    "srp": "sr",
-    "ssw": "ss",
-    "sun": "su",
-    "swa": "sw",
-    "swe": "sv",
-    "tah": "ty",
-    "tam": "ta",
-    "tat": "tt",
-    "tel": "te",
-    "tgk": "tg",
-    "tgl": "tl",
-    "tha": "th",
-    "tir": "ti",
-    "ton": "to",
-    "tsn": "tn",
-    "tso": "ts",
-    "tuk": "tk",
-    "tur": "tr",
-    "twi": "tw",
-    "uig": "ug",
-    "ukr": "uk",
-    "urd": "ur",
-    "uzb": "uz",
-    "ven": "ve",
-    "vie": "vi",
-    "vol": "vo",
-    "wln": "wa",
-    "wol": "wo",
-    "xho": "xh",
-    "yid": "yi",
-    "yor": "yo",
-    "zha": "za",
-    "zho": "zh",
-    "zul": "zu",
-}  # noqa
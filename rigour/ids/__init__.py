@@ -9,49 +9,67 @@ need to introduce a proper, structured identification scheme for identifiers, wi
 """
 
 from functools import cache
-from typing import List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type
 from typing_extensions import TypedDict
 
-from rigour.ids.wikidata import WikidataQID
-from rigour.ids.stdnum_ import ISIN, IBAN, FIGI, BIC, INN, LEI, USCC
-from rigour.ids.stdnum_ import CPF, CNPJ, SSN
-from rigour.ids.ogrn import OGRN
-from rigour.ids.npi import NPI
-from rigour.ids.uei import UEI
-from rigour.ids.imo import IMO
-from rigour.ids.strict import StrictFormat
 from rigour.ids.common import IdentifierFormat
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.ids.wikidata import WikidataQID
+    from rigour.ids.stdnum_ import ISIN, IBAN, FIGI, BIC, INN, LEI, USCC
+    from rigour.ids.stdnum_ import CPF, CNPJ, SSN
+    from rigour.ids.ogrn import OGRN
+    from rigour.ids.npi import NPI
+    from rigour.ids.uei import UEI
+    from rigour.ids.imo import IMO
+    from rigour.ids.strict import StrictFormat
+    from rigour.ids.batch import normalize_identifiers, validate_identifiers
 
 FormatType = Type[IdentifierFormat]
 
-_FORMATS: Tuple[FormatType, ...] = (
-    WikidataQID,
-    OGRN,
-    IMO,
-    ISIN,
-    IBAN,
-    FIGI,
-    BIC,
-    INN,
-    NPI,
-    LEI,
-    UEI,
-    SSN,
-    CPF,
-    CNPJ,
-    USCC,
-    IdentifierFormat,
-    StrictFormat,
-)
-
+# Alias -> format name. Literal names, so that resolving an alias
+# doesn't import the format modules (and python-stdnum with them).
 FORMAT_ALIASES = {
-    "qid": WikidataQID.NAME,
-    "swift": BIC.NAME,
-    "openfigi": FIGI.NAME,
+    "qid": "wikidata",
+    "swift": "bic",
+    "openfigi": "figi",
     "null": IdentifierFormat.NAME,
 }
 
 
+@cache
+def _formats() -> Tuple[FormatType, ...]:
+    from rigour.ids.wikidata import WikidataQID
+    from rigour.ids.stdnum_ import ISIN, IBAN, FIGI, BIC, INN, LEI, USCC
+    from rigour.ids.stdnum_ import CPF, CNPJ, SSN
+    from rigour.ids.ogrn import OGRN
+    from rigour.ids.npi import NPI
+    from rigour.ids.uei import UEI
+    from rigour.ids.imo import IMO
+    from rigour.ids.strict import StrictFormat
+
+    return (
+        WikidataQID,
+        OGRN,
+        IMO,
+        ISIN,
+        IBAN,
+        FIGI,
+        BIC,
+        INN,
+        NPI,
+        LEI,
+        UEI,
+        SSN,
+        CPF,
+        CNPJ,
+        USCC,
+        IdentifierFormat,
+        StrictFormat,
+    )
+
+
 class FormatSpec(TypedDict):
     """An identifier format specification."""
 
@@ -65,7 +83,7 @@ class FormatSpec(TypedDict):
 def get_identifier_format(name: str) -> Optional[FormatType]:
     """Get the identifier type class for the given format name."""
     name = FORMAT_ALIASES.get(name, name)
-    for fmt in _FORMATS:
+    for fmt in _formats():
         if fmt.NAME == name:
             return fmt
     return None
@@ -73,13 +91,13 @@ def get_identifier_format(name: str) -> Optional[FormatType]:
 
 def get_identifier_format_names() -> List[str]:
     """Get a list of all identifier type names."""
-    return [fmt.NAME for fmt in _FORMATS]
+    return [fmt.NAME for fmt in _formats()]
 
 
 def get_identifier_formats() -> List[FormatSpec]:
     """Get a list of all identifier formats."""
     formats: List[FormatSpec] = []
-    for type_ in _FORMATS:
+    for type_ in _formats():
         name = type_.NAME
         fmt: FormatSpec = {
             "name": name,
@@ -94,7 +112,7 @@ def get_identifier_formats() -> List[FormatSpec]:
 @cache
 def get_strong_format_names() -> List[str]:
     """Get a list of all strong identifier type names."""
-    return [fmt.NAME for fmt in _FORMATS if fmt.STRONG]
+    return [fmt.NAME for fmt in _formats() if fmt.STRONG]
 
 
 __all__ = [
@@ -118,4 +136,31 @@ __all__ = [
     "get_identifier_format",
     "get_identifier_formats",
     "get_identifier_format_names",
+    "normalize_identifiers",
+    "validate_identifiers",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.ids.wikidata": ["WikidataQID"],
+        "rigour.ids.stdnum_": [
+            "ISIN",
+            "IBAN",
+            "FIGI",
+            "BIC",
+            "INN",
+            "LEI",
+            "USCC",
+            "CPF",
+            "CNPJ",
+            "SSN",
+        ],
+        "rigour.ids.ogrn": ["OGRN"],
+        "rigour.ids.npi": ["NPI"],
+        "rigour.ids.uei": ["UEI"],
+        "rigour.ids.imo": ["IMO"],
+        "rigour.ids.strict": ["StrictFormat"],
+        "rigour.ids.batch": ["normalize_identifiers", "validate_identifiers"],
+    },
+)
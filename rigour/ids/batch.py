@@ -0,0 +1,111 @@
+from functools import cache
+from typing import Iterable, List, Optional
+
+from rigour._core import STDNUM_VERSION
+from rigour._core import normalize_identifiers as _normalize_identifiers
+from rigour._core import validate_identifiers as _validate_identifiers
+from rigour.ids import FormatType, get_identifier_format
+
+# Formats without a port in the Rust core: `strict` transliterates
+# through normality.
+PYTHON_FORMATS = ("strict",)
+
+# Formats wrapping python-stdnum. Their ports in the Rust core carry
+# tables and checks copied from one stdnum release (`STDNUM_VERSION`),
+# so they only stand in for the formats under that release.
+STDNUM_FORMATS = (
+    "isin",
+    "iban",
+    "figi",
+    "bic",
+    "inn",
+    "lei",
+    "ssn",
+    "cpf",
+    "cnpj",
+    "uscc",
+)
+
+
+def _get_format(format: str) -> FormatType:
+    fmt = get_identifier_format(format)
+    if fmt is None:
+        raise ValueError("Unknown identifier format: %r" % format)
+    return fmt
+
+
+@cache
+def _stdnum_matches() -> bool:
+    """Whether the installed python-stdnum is the release the Rust
+    core's identifier tables were generated from."""
+    import stdnum
+
+    return bool(stdnum.__version__ == STDNUM_VERSION)
+
+
+def _in_python(fmt: FormatType) -> bool:
+    if fmt.NAME in PYTHON_FORMATS:
+        return True
+    return fmt.NAME in STDNUM_FORMATS and not _stdnum_matches()
+
+
+@cache
+def _iban_country_check(country: str) -> bool:
+    """Whether python-stdnum checks the account number in IBANs of the
+    given country; the Rust core doesn't."""
+    from stdnum.util import get_cc_module
+
+    return get_cc_module(country.lower(), "iban") is not None
+
+
+def normalize_identifiers(format: str, values: Iterable[str]) -> List[Optional[str]]:
+    """Normalize many identifiers of one format at once, as the format's
+    `normalize` method would. The values are processed in the Rust core
+    without the GIL, spread over the available CPU cores.
+
+    Args:
+        format: The name or alias of an identifier format, e.g. `"isin"`.
+        values: The identifiers to normalize.
+
+    Returns:
+        The normalized identifiers, in order; None for invalid values.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    fmt = _get_format(format)
+    items = list(values)
+    if _in_python(fmt):
+        return [fmt.normalize(value) for value in items]
+    results = _normalize_identifiers(fmt.NAME, items)
+    if fmt.NAME == "iban":
+        for idx, norm in enumerate(results):
+            if norm is not None and _iban_country_check(norm[:2]):
+                results[idx] = fmt.normalize(items[idx])
+    return results
+
+
+def validate_identifiers(format: str, values: Iterable[str]) -> List[bool]:
+    """Check many identifiers of one format at once, as the format's
+    `is_valid` method would. The values are processed in the Rust core
+    without the GIL, spread over the available CPU cores.
+
+    Args:
+        format: The name or alias of an identifier format, e.g. `"isin"`.
+        values: The identifiers to check.
+
+    Returns:
+        Whether each value is valid, in order.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    fmt = _get_format(format)
+    items = list(values)
+    if _in_python(fmt):
+        return [fmt.is_valid(value) for value in items]
+    if fmt.NAME == "iban":
+        # An IBAN is valid exactly when it normalizes; this picks up the
+        # national checks.
+        return [norm is not None for norm in normalize_identifiers(format, items)]
+    return _validate_identifiers(fmt.NAME, items)
@@ -18,11 +18,10 @@ See also: https://www.loc.gov/standards/iso639-2/php/code_list.php
 
 from typing import Iterable, Optional, Set
 
-
-from rigour.data.langs.iso639 import ISO3_ALL, ISO2_MAP, ISO3_MAP
-from rigour.langs.synonyms import NON_LANGS, expand_synonyms
+from rigour._core import iso_639_alpha2 as _iso_639_alpha2
+from rigour._core import iso_639_alpha3 as _iso_639_alpha3
+from rigour._core import list_to_alpha3 as _list_to_alpha3
 from rigour.langs.text import LangStr
-from rigour.langs.util import normalize_code
 from rigour.env import PREFERRED_LANG as PREFERRED_LANG_
 
 # The world is a cruel and dark place so here we're picking a list of
@@ -75,18 +74,7 @@ def iso_639_alpha3(code: str) -> Optional[str]:
     >>> iso_639_alpha3('en')
     'eng'
     """
-    norm = normalize_code(code)
-    if norm is None:
-        return None
-    resolved = ISO3_MAP.get(norm, norm)
-    if resolved in ISO3_ALL and resolved not in NON_LANGS:
-        return resolved
-    # The full tag takes precedence (the synonym table has entries like
-    # "chi_sim"); only then fall back to the primary subtag.
-    for sep in ("-", "_"):
-        if sep in norm:
-            return iso_639_alpha3(norm.split(sep, 1)[0])
-    return None
+    return _iso_639_alpha3(str(code))
 
 
 def iso_639_alpha2(code: str) -> Optional[str]:
@@ -94,31 +82,19 @@ def iso_639_alpha2(code: str) -> Optional[str]:
     or "de". For languages which do not have a two-letter identifier, or
     invalid language codes, ``None`` will be returned.
     """
-    alpha3 = iso_639_alpha3(code)
-    if alpha3 is None:
-        return None
-    return ISO2_MAP.get(alpha3)
+    return _iso_639_alpha2(str(code))
 
 
 def list_to_alpha3(languages: Iterable[str], synonyms: bool = True) -> Set[str]:
     """Parse all the language codes in a given list into ISO 639 Part 2 codes
     and optionally expand them with synonyms (i.e. other names for the same
-    language).
+    language). The whole list is resolved in a single call into the Rust
+    core, including the BCP 47 subtag fallback of `iso_639_alpha3`.
 
     Synonym groups mix in ISO 639-2/B and Tesseract-style codes (e.g. ``ger``,
     ``chi``) which aid input matching but are not valid ISO 639-3 identifiers;
     they are filtered out so the returned set only contains canonical codes."""
-    codes: Set[str] = set()
-    for language in languages:
-        code = iso_639_alpha3(language)
-        if code is None:
-            continue
-        codes.add(code)
-        if synonyms:
-            for synonym in expand_synonyms(code):
-                if synonym in ISO3_ALL and synonym not in NON_LANGS:
-                    codes.add(synonym)
-    return codes
+    return _list_to_alpha3([str(lang) for lang in languages], synonyms)
 
 
 def is_lang_better(candidate: str, baseline: str) -> bool:
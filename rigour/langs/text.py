@@ -1,5 +1,6 @@
 from typing import Optional
-from rigour.data.langs.iso639 import ISO3_ALL
+
+from rigour._core import is_iso_639_3
 
 
 class LangStr(str):
@@ -15,8 +16,9 @@ class LangStr(str):
         return instance
 
     def __init__(self, content: str, lang: Optional[str] = None) -> None:
-        if lang is not None and lang not in ISO3_ALL:
-            raise ValueError(f"Invalid ISO 639-3 language code: {lang}")
+        if lang is not None:
+            if not is_iso_639_3(lang):
+                raise ValueError(f"Invalid ISO 639-3 language code: {lang}")
         self.lang = lang
 
     def __repr__(self) -> str:
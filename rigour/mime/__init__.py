@@ -35,12 +35,17 @@ assert parsed.label == 'Plain text'
 This module is an inlined version of the `pantomime` library.
 """
 
-from rigour.mime.parse import MIMEType
-from rigour.mime.types import DEFAULT, PLAIN
-from rigour.mime.mime import parse_mimetype, normalize_mimetype
-from rigour.mime.mime import useful_mimetype
-from rigour.mime.filename import FileName
-from rigour.mime.filename import normalize_extension, mimetype_extension
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.mime.parse import MIMEType
+    from rigour.mime.types import DEFAULT, PLAIN
+    from rigour.mime.mime import parse_mimetype, normalize_mimetype
+    from rigour.mime.mime import useful_mimetype
+    from rigour.mime.filename import FileName
+    from rigour.mime.filename import normalize_extension, mimetype_extension
 
 __all__ = [
     "MIMEType",
@@ -53,3 +58,17 @@ __all__ = [
     "normalize_extension",
     "mimetype_extension",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.mime.parse": ["MIMEType"],
+        "rigour.mime.types": ["DEFAULT", "PLAIN"],
+        "rigour.mime.mime": ["parse_mimetype", "normalize_mimetype", "useful_mimetype"],
+        "rigour.mime.filename": [
+            "FileName",
+            "normalize_extension",
+            "mimetype_extension",
+        ],
+    },
+)
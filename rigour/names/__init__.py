@@ -12,23 +12,34 @@ is used to represent individual parts of a name, such as the first name, middle
 * [Falsehoods Programmers Believe About Names](https://www.kalzumeus.com/2010/06/17/falsehoods-programmers-believe-about-names/)
 """
 
-from rigour.names.name import Name
-from rigour.names.symbol import Symbol, SymbolCategory, pair_symbols
-from rigour.names.part import NamePart, Span
-from rigour.names.tag import NamePartTag, NameTypeTag
-from rigour.names.pick import pick_name, pick_case, reduce_names
-from rigour.names.pick import representative_names
-from rigour.names.check import is_name, is_stopword
-from rigour.names.tokenize import tokenize_name, normalize_name
-from rigour.names.prefix import remove_person_prefixes, remove_org_prefixes
-from rigour.names.prefix import remove_obj_prefixes
-from rigour.names.analyze import analyze_names
-from rigour.names.compare import Alignment, CompareConfig, compare_parts
-from rigour.names.org_types import replace_org_types_display
-from rigour.names.org_types import replace_org_types_compare
-from rigour.names.org_types import extract_org_types, remove_org_types
-from rigour.names.ordering import align_person_name_order
-from rigour.names.split_phrases import contains_split_phrase
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.names.name import Name, dump_names, load_names
+    from rigour.names.symbol import Symbol, SymbolCategory, pair_symbols
+    from rigour.names.part import NamePart, Span
+    from rigour.names.tag import NamePartTag, NameTypeTag
+    from rigour.names.pick import pick_name, pick_case, reduce_names
+    from rigour.names.pick import representative_names
+    from rigour.names.check import is_name, is_stopword
+    from rigour.names.tokenize import tokenize_name, normalize_name
+    from rigour.names.prefix import remove_person_prefixes, remove_org_prefixes
+    from rigour.names.prefix import remove_obj_prefixes
+    from rigour.names.analyze import analyze_names, analyze_names_batch
+    from rigour.names.analyze import save_tagger_images
+    from rigour.names.cache import NameCache, NameCacheStats
+    from rigour.names.columns import NameColumns, name_columns, analyze_names_columns
+    from rigour.names.compare import Alignment, CompareConfig, compare_parts
+    from rigour.names.set_match import MatchConfig, NameSetMatch, match_name_sets
+    from rigour.names.set_match import score_upper_bound
+    from rigour.names.prepared import PreparedName
+    from rigour.names.org_types import replace_org_types_display
+    from rigour.names.org_types import replace_org_types_compare
+    from rigour.names.org_types import extract_org_types, remove_org_types
+    from rigour.names.ordering import align_person_name_order
+    from rigour.names.split_phrases import contains_split_phrase
 
 __all__ = [
     "pick_name",
@@ -40,6 +51,8 @@ __all__ = [
     "is_name",
     "is_stopword",
     "Name",
+    "dump_names",
+    "load_names",
     "Symbol",
     "SymbolCategory",
     "pair_symbols",
@@ -56,8 +69,70 @@ __all__ = [
     "extract_org_types",
     "remove_org_types",
     "analyze_names",
+    "analyze_names_batch",
+    "save_tagger_images",
+    "NameCache",
+    "NameCacheStats",
+    "NameColumns",
+    "name_columns",
+    "analyze_names_columns",
     "Alignment",
     "CompareConfig",
     "compare_parts",
+    "MatchConfig",
+    "NameSetMatch",
+    "match_name_sets",
+    "score_upper_bound",
+    "PreparedName",
     "contains_split_phrase",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.names.name": ["Name", "dump_names", "load_names"],
+        "rigour.names.symbol": ["Symbol", "SymbolCategory", "pair_symbols"],
+        "rigour.names.part": ["NamePart", "Span"],
+        "rigour.names.tag": ["NamePartTag", "NameTypeTag"],
+        "rigour.names.pick": [
+            "pick_name",
+            "pick_case",
+            "reduce_names",
+            "representative_names",
+        ],
+        "rigour.names.check": ["is_name", "is_stopword"],
+        "rigour.names.tokenize": ["tokenize_name", "normalize_name"],
+        "rigour.names.prefix": [
+            "remove_person_prefixes",
+            "remove_org_prefixes",
+            "remove_obj_prefixes",
+        ],
+        "rigour.names.analyze": [
+            "analyze_names",
+            "analyze_names_batch",
+            "save_tagger_images",
+        ],
+        "rigour.names.cache": ["NameCache", "NameCacheStats"],
+        "rigour.names.columns": [
+            "NameColumns",
+            "name_columns",
+            "analyze_names_columns",
+        ],
+        "rigour.names.compare": ["Alignment", "CompareConfig", "compare_parts"],
+        "rigour.names.set_match": [
+            "MatchConfig",
+            "NameSetMatch",
+            "match_name_sets",
+            "score_upper_bound",
+        ],
+        "rigour.names.prepared": ["PreparedName"],
+        "rigour.names.org_types": [
+            "replace_org_types_display",
+            "replace_org_types_compare",
+            "extract_org_types",
+            "remove_org_types",
+        ],
+        "rigour.names.ordering": ["align_person_name_order"],
+        "rigour.names.split_phrases": ["contains_split_phrase"],
+    },
+)
@@ -20,15 +20,40 @@ tagging via `Name.tag_text` → tagger match-and-apply → `NUMERIC` /
 tokenises the value and walks the name parts looking for the token
 sequence. The tokens of the value don't need to be adjacent in the
 name, just present in order.
+
+## Tagger images
+
+The first symbol-tagging call in a process builds the org and person
+taggers from the embedded corpora, which dominates cold-start time.
+When the `RIGOUR_TAGGER_CACHE` environment variable names a
+directory, the built taggers are written there as flat images that
+every process memory-maps instead of rebuilding. The mapped pages
+are shared, so worker processes on one host hold a single copy of
+the taggers between them. Images carry a
+fingerprint of the rigour build and its data, so a stale image is
+ignored and replaced. `save_tagger_images` writes them ahead of
+time, e.g. as a container build step.
 """
 
-from typing import Mapping, Optional, Sequence, Set
+import os
+from typing import List, Mapping, Optional, Sequence, Set, Union
 
 from rigour._core import analyze_names as _analyze_names
+from rigour._core import analyze_names_batch as _analyze_names_batch
+from rigour._core import save_tagger_images as _save_tagger_images
+from rigour.names.cache import NameCache, cache_key
 from rigour.names.name import Name
 from rigour.names.tag import NamePartTag, NameTypeTag
 
-__all__ = ["analyze_names"]
+__all__ = ["analyze_names", "analyze_names_batch", "save_tagger_images"]
+
+
+def _tag_dict(
+    part_tags: Optional[Mapping[NamePartTag, Sequence[str]]],
+) -> Optional[dict[NamePartTag, list[str]]]:
+    if part_tags is None:
+        return None
+    return {tag: list(values) for tag, values in part_tags.items()}
 
 
 def analyze_names(
@@ -42,6 +67,7 @@ def analyze_names(
     numerics: bool = True,
     consolidate: bool = True,
     rewrite: bool = True,
+    cache: Optional[NameCache] = None,
 ) -> Set[Name]:
     """Build a set of tagged [Name][rigour.names.Name] objects from raw strings.
 
@@ -116,20 +142,74 @@ def analyze_names(
             original and canonical forms. Useful for debugging the
             tagger in isolation and for callers that want to display
             or index a name without the canonical substitutions.
+        cache: Optional [NameCache][rigour.names.NameCache]. A hit
+            returns the stored result without running the pipeline;
+            a miss is analysed and recorded. See the module docstring.
 
     Returns:
         A set of tagged `Name` objects, de-duplicated by normalised
         form. Empty if every input normalised to an empty string.
     """
-    tag_dict: dict[NamePartTag, list[str]] | None
-    if part_tags is None:
-        tag_dict = None
-    else:
-        tag_dict = {tag: list(values) for tag, values in part_tags.items()}
-    return _analyze_names(
-        type_tag,
-        list(names),
-        tag_dict,
+    flags = dict(
+        infer_initials=infer_initials,
+        symbols=symbols,
+        phonetics=phonetics,
+        numerics=numerics,
+        consolidate=consolidate,
+        rewrite=rewrite,
+    )
+    names = list(names)
+    if cache is None:
+        return _analyze_names(type_tag, names, _tag_dict(part_tags), **flags)
+    key = cache_key(type_tag, names, part_tags, flags)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    result = _analyze_names(type_tag, names, _tag_dict(part_tags), **flags)
+    cache.put(key, result)
+    return result
+
+
+def analyze_names_batch(
+    type_tags: Sequence[NameTypeTag],
+    names: Sequence[Sequence[str]],
+    part_tags: Optional[
+        Sequence[Optional[Mapping[NamePartTag, Sequence[str]]]]
+    ] = None,
+    *,
+    infer_initials: bool = False,
+    symbols: bool = True,
+    phonetics: bool = True,
+    numerics: bool = True,
+    consolidate: bool = True,
+    rewrite: bool = True,
+    threads: Optional[int] = None,
+    cache: Optional[NameCache] = None,
+) -> List[Set[Name]]:
+    """Run [analyze_names][rigour.names.analyze_names] for many entities at once.
+
+    Entity `i` is described by `type_tags[i]`, `names[i]` and, when
+    given, `part_tags[i]`. The keyword flags apply to every entity and
+    mean the same as on `analyze_names`.
+
+    Args:
+        type_tags: One [NameTypeTag][rigour.names.NameTypeTag] per entity.
+        names: One sequence of raw name strings per entity.
+        part_tags: Optional per-entity part annotations, parallel to
+            `names`. `None` entries mean no part tags for that entity.
+        threads: Upper bound on worker threads for the GIL-free stages.
+            `None` (default) uses the machine's available parallelism;
+            `1` runs everything on the calling thread.
+        cache: Optional [NameCache][rigour.names.NameCache], consulted
+            per entity. Only the misses are sent through the pipeline.
+
+    Returns:
+        One set of tagged `Name` objects per entity, in input order.
+
+    Raises:
+        ValueError: If `type_tags`, `names` and `part_tags` differ in length.
+    """
+    flags = dict(
         infer_initials=infer_initials,
         symbols=symbols,
         phonetics=phonetics,
@@ -137,3 +217,54 @@ def analyze_names(
         consolidate=consolidate,
         rewrite=rewrite,
     )
+    type_tags = list(type_tags)
+    name_lists = [list(n) for n in names]
+    tags = list(part_tags) if part_tags is not None else None
+    if tags is not None and len(tags) != len(name_lists):
+        raise ValueError("part_tags must have one entry per entity")
+    if len(type_tags) != len(name_lists):
+        raise ValueError("type_tags and names must have the same length")
+
+    results: List[Optional[Set[Name]]] = [None] * len(name_lists)
+    todo = list(range(len(name_lists)))
+    keys: List[bytes] = []
+    if cache is not None:
+        keys = [
+            cache_key(t, n, tags[i] if tags is not None else None, flags)
+            for i, (t, n) in enumerate(zip(type_tags, name_lists))
+        ]
+        for idx, key in enumerate(keys):
+            results[idx] = cache.get(key)
+        todo = [idx for idx, res in enumerate(results) if res is None]
+
+    tag_dicts: Optional[List[Optional[dict[NamePartTag, list[str]]]]] = None
+    if tags is not None:
+        tag_dicts = [_tag_dict(tags[idx]) for idx in todo]
+    fresh = _analyze_names_batch(
+        [type_tags[idx] for idx in todo],
+        [name_lists[idx] for idx in todo],
+        tag_dicts,
+        threads=threads,
+        **flags,
+    )
+    for idx, result in zip(todo, fresh):
+        results[idx] = result
+        if cache is not None:
+            cache.put(keys[idx], result)
+    return [r if r is not None else set() for r in results]
+
+
+def save_tagger_images(directory: Union[str, os.PathLike[str]]) -> List[str]:
+    """Write the org and person tagger images into `directory`.
+
+    Point `RIGOUR_TAGGER_CACHE` at the same directory in the processes
+    that should load them. Builds the taggers first if this process has
+    not used them yet.
+
+    Args:
+        directory: Target directory; created if missing.
+
+    Returns:
+        The paths of the written image files.
+    """
+    return _save_tagger_images(os.fspath(directory))
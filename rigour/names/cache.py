@@ -0,0 +1,291 @@
+"""Persistent on-disk cache of analysed names.
+
+Re-indexing a dataset runs [analyze_names][rigour.names.analyze_names]
+over entity name lists that are, run to run, overwhelmingly
+unchanged. `NameCache` stores each call's result — encoded with
+[dump_names][rigour.names.dump_names] — in a single file, keyed by a
+hash of everything the call depends on: the type tag, the raw name
+strings, `part_tags` and every pipeline flag. Pass it as `cache=` to
+`analyze_names` / `analyze_names_batch` to use it; it is strictly
+opt-in.
+
+The file is memory-mapped read-only, so any number of worker
+processes can open the same cache and share its pages. New results
+are held in memory and written out by `save()` (or on leaving a
+`with` block): the current on-disk entries and the new ones are
+merged into a fresh file that atomically replaces the old one.
+Readers that mapped the old file keep reading it undisturbed. When
+several processes save to the same path, each merges whatever is on
+disk at that moment, but entries added between another writer's read
+and its replace can be lost — give concurrent writers their own
+files, or save from one process.
+
+Every file is stamped with
+[name_data_version][rigour.names.cache.name_data_version] — a
+fingerprint of the rigour build and its embedded tagger / org-type /
+stopword data. A file written by a different build is ignored on
+open and overwritten on the next save, so upgrading the package
+never serves stale analyses.
+
+File layout (little-endian): a header (magic, format, data version,
+entry count), a key-sorted index of fixed-size entries (16-byte key,
+blob offset, blob length), then the encoded name blobs. Lookups are a
+binary search over the mapped index.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Set, Type, Union
+
+from rigour._core import name_data_version
+from rigour.names.name import Name, dump_names, load_names
+from rigour.names.tag import NamePartTag, NameTypeTag
+
+__all__ = ["NameCache", "NameCacheStats", "name_data_version"]
+
+MAGIC = b"RGNC"
+FORMAT = 1
+_HEADER = struct.Struct("<4sB3xQQ")
+_ENTRY = struct.Struct("<16sQI4x")
+KEY_SIZE = 16
+
+
+@dataclass(frozen=True)
+class NameCacheStats:
+    """Usage and size counters for a [NameCache][rigour.names.NameCache]."""
+
+    hits: int
+    """Lookups answered from the cache since it was opened."""
+    misses: int
+    """Lookups that had to run the analysis pipeline."""
+    entries: int
+    """Results in the cache: on disk plus not-yet-saved."""
+    pending: int
+    """Results added since the last save."""
+    nbytes: int
+    """Size of the mapped cache file in bytes."""
+    pending_bytes: int
+    """Encoded size of the not-yet-saved results."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits; `0.0` before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def cache_key(
+    type_tag: NameTypeTag,
+    names: Sequence[str],
+    part_tags: Optional[Mapping[NamePartTag, Sequence[str]]],
+    flags: Mapping[str, bool],
+) -> bytes:
+    """Hash one `analyze_names` call's inputs into a 16-byte cache key."""
+    # Tags are applied first-writer-wins, so their order is part of the
+    # input: keep it rather than sorting.
+    tags = [(tag.value, list(values)) for tag, values in (part_tags or {}).items()]
+    payload = [type_tag.value, list(names), tags, sorted(flags.items())]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=KEY_SIZE).digest()
+
+
+class _Segment(object):
+    """A read-only view of one cache file."""
+
+    def __init__(self, path: Path, version: int) -> None:
+        self.count = 0
+        self.nbytes = 0
+        self._mmap: Optional[mmap.mmap] = None
+        try:
+            fh = open(path, "rb")
+        except FileNotFoundError:
+            return
+        with fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < _HEADER.size:
+                return
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, stamp, count = _HEADER.unpack_from(mm, 0)
+        index_end = _HEADER.size + count * _ENTRY.size
+        valid = magic == MAGIC and fmt == FORMAT and stamp == version
+        if not valid or index_end > size:
+            mm.close()
+            return
+        self._mmap = mm
+        self.count = count
+        self.nbytes = size
+
+    def _key_at(self, idx: int) -> bytes:
+        assert self._mmap is not None
+        start = _HEADER.size + idx * _ENTRY.size
+        return self._mmap[start : start + KEY_SIZE]
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        if self._mmap is None:
+            return None
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self.count or self._key_at(lo) != key:
+            return None
+        _, offset, length = _ENTRY.unpack_from(
+            self._mmap, _HEADER.size + lo * _ENTRY.size
+        )
+        return self._mmap[offset : offset + length]
+
+    def items(self) -> Iterable[tuple[bytes, bytes]]:
+        if self._mmap is None:
+            return
+        for idx in range(self.count):
+            key, offset, length = _ENTRY.unpack_from(
+                self._mmap, _HEADER.size + idx * _ENTRY.size
+            )
+            yield key, self._mmap[offset : offset + length]
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+class NameCache(object):
+    """A memory-mapped, file-backed cache of `analyze_names` results.
+
+    Args:
+        path: Cache file location. Need not exist yet; it is created
+            on the first `save()`.
+        readonly: When `True`, new results are never recorded and
+            `save()` is a no-op — for worker processes that only read
+            a cache prepared elsewhere.
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike[str]], readonly: bool = False
+    ) -> None:
+        self.path = Path(path)
+        self.readonly = readonly
+        self.version = name_data_version()
+        self.hits = 0
+        self.misses = 0
+        self._pending: Dict[bytes, bytes] = {}
+        self._segment = _Segment(self.path, self.version)
+
+    def get(self, key: bytes) -> Optional[Set[Name]]:
+        """Return the cached result for `key`, or `None` on a miss."""
+        blob = self.get_blob(key)
+        if blob is None:
+            return None
+        return set(load_names(blob))
+
+    def get_blob(self, key: bytes) -> Optional[bytes]:
+        """Return the cached result for `key` still encoded, as written
+        by `dump_names`, or `None` on a miss."""
+        blob = self._pending.get(key)
+        if blob is None:
+            blob = self._segment.get(key)
+        if blob is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return blob
+
+    def put(self, key: bytes, names: Iterable[Name]) -> None:
+        """Record the result for `key`, to be written by the next `save()`."""
+        if not self.readonly:
+            self._pending[key] = dump_names(list(names))
+
+    def put_blob(self, key: bytes, blob: bytes) -> None:
+        """Record an already-encoded result for `key`."""
+        if not self.readonly:
+            self._pending[key] = blob
+
+    def save(self) -> None:
+        """Merge pending results with the file on disk and replace it.
+
+        Re-reads the file first, so entries another process saved since
+        this cache was opened are kept. The new file is written next to
+        the old one and moved into place atomically.
+        """
+        if self.readonly or not self._pending:
+            return
+        current = _Segment(self.path, self.version)
+        merged = dict(current.items())
+        merged.update(self._pending)
+        keys = sorted(merged)
+        offset = _HEADER.size + len(keys) * _ENTRY.size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_HEADER.pack(MAGIC, FORMAT, self.version, len(keys)))
+                for key in keys:
+                    fh.write(_ENTRY.pack(key, offset, len(merged[key])))
+                    offset += len(merged[key])
+                for key in keys:
+                    fh.write(merged[key])
+            # Drop our own mappings first: Windows refuses to replace
+            # a file that this process still has mapped.
+            current.close()
+            self._segment.close()
+            os.replace(tmp, self.path)
+        except BaseException:
+            current.close()
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            # The file wasn't replaced: map it again, so the cache
+            # stays usable and the pending results can be saved later.
+            self._segment.close()
+            self._segment = _Segment(self.path, self.version)
+            raise
+        self._pending.clear()
+        self._segment = _Segment(self.path, self.version)
+
+    def close(self) -> None:
+        """Release the file mapping. Unsaved results are discarded."""
+        self._segment.close()
+        self._pending.clear()
+
+    @property
+    def stats(self) -> NameCacheStats:
+        """Current hit/miss counters and sizes."""
+        return NameCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=self._segment.count
+            + sum(1 for k in self._pending if self._segment.get(k) is None),
+            pending=len(self._pending),
+            nbytes=self._segment.nbytes,
+            pending_bytes=sum(len(b) for b in self._pending.values()),
+        )
+
+    def __len__(self) -> int:
+        return self.stats.entries
+
+    def __enter__(self) -> "NameCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.save()
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<NameCache({str(self.path)!r}, entries={len(self)})>"
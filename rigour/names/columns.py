@@ -0,0 +1,112 @@
+"""Columnar export of analysed names for bulk consumers.
+
+An indexer that reads `part.comparable`, `part.metaphone`, `part.tag`
+and `name.symbols` off every `NamePart` one attribute at a time
+spends most of its time in Python attribute lookups. `name_columns`
+and `analyze_names_columns` lay the same data out as flat arrays
+instead — a `NameColumns` batch whose fields are `Column` objects
+exporting their Rust storage through the buffer protocol, so
+`memoryview(col)`, `numpy.frombuffer(col, dtype=...)` and
+`pyarrow.py_buffer(col)` read it in place without building per-part
+Python objects.
+
+Layout:
+
+* strings (`name_form`, `part_form`, `part_comparable`,
+  `part_metaphone`, `symbol_id`) are Arrow `utf8` pairs — an `int32`
+  `*_offsets` array with one entry more than there are rows, and a
+  `uint8` `*_data` buffer. Missing metaphones are empty strings with
+  a cleared bit in the Arrow-style `part_metaphone_validity` bitmap.
+* enums (`name_tag`, `part_tag`, `symbol_category`) are `uint8`
+  codes; `NameColumns.type_tags`, `.part_tags` and
+  `.symbol_categories` map a code back to its enum member.
+* relations are CSR: `entity_name_offsets`, `name_part_offsets`,
+  `name_span_offsets` and `span_part_offsets` slice the next level
+  down; `span_parts` holds global part rows and `span_symbol` a row
+  into the de-duplicated symbol table.
+
+A name's symbols are the `span_symbol` entries of its spans.
+"""
+
+from typing import Iterable, List, Mapping, Optional, Sequence
+
+from rigour._core import Column, NameColumns, names_to_columns
+from rigour._core import analyze_names_columns as _analyze_names_columns
+from rigour.names.analyze import _tag_dict
+from rigour.names.cache import NameCache, cache_key
+from rigour.names.name import Name
+from rigour.names.tag import NamePartTag, NameTypeTag
+
+__all__ = ["Column", "NameColumns", "name_columns", "analyze_names_columns"]
+
+
+def name_columns(names: Iterable[Name]) -> NameColumns:
+    """Lay out already-analysed names as one-entity `NameColumns`."""
+    return names_to_columns([list(names)])
+
+
+def analyze_names_columns(
+    type_tags: Sequence[NameTypeTag],
+    names: Sequence[Sequence[str]],
+    part_tags: Optional[
+        Sequence[Optional[Mapping[NamePartTag, Sequence[str]]]]
+    ] = None,
+    *,
+    infer_initials: bool = False,
+    symbols: bool = True,
+    phonetics: bool = True,
+    numerics: bool = True,
+    consolidate: bool = True,
+    rewrite: bool = True,
+    threads: Optional[int] = None,
+    cache: Optional[NameCache] = None,
+) -> NameColumns:
+    """Analyse many entities' names straight into `NameColumns`.
+
+    Takes the same arguments as
+    [analyze_names_batch][rigour.names.analyze_names_batch] and runs the
+    same pipeline, but fills the columns in Rust without building any
+    `Name` or `NamePart` objects. Entity `i`'s names are rows
+    `entity_name_offsets[i]` to `entity_name_offsets[i + 1]`; within an
+    entity, names have no particular order.
+    """
+    flags = dict(
+        infer_initials=infer_initials,
+        symbols=symbols,
+        phonetics=phonetics,
+        numerics=numerics,
+        consolidate=consolidate,
+        rewrite=rewrite,
+    )
+    type_tags = list(type_tags)
+    name_lists = [list(n) for n in names]
+    tags = list(part_tags) if part_tags is not None else None
+    if tags is not None and len(tags) != len(name_lists):
+        raise ValueError("part_tags must have one entry per entity")
+    if len(type_tags) != len(name_lists):
+        raise ValueError("type_tags and names must have the same length")
+    tag_dicts = [_tag_dict(t) for t in tags] if tags is not None else None
+
+    # Cached entities go to the Rust side still encoded and are
+    # decoded there; the others come back encoded for the cache.
+    keys: List[bytes] = []
+    cached: Optional[List[Optional[bytes]]] = None
+    if cache is not None:
+        keys = [
+            cache_key(t, n, tags[i] if tags is not None else None, flags)
+            for i, (t, n) in enumerate(zip(type_tags, name_lists))
+        ]
+        cached = [cache.get_blob(key) for key in keys]
+    columns, fresh = _analyze_names_columns(
+        type_tags,
+        name_lists,
+        tag_dicts,
+        threads=threads,
+        cached=cached,
+        **flags,
+    )
+    if cache is not None:
+        for key, blob in zip(keys, fresh):
+            if blob is not None:
+                cache.put_blob(key, blob)
+    return columns
@@ -14,11 +14,15 @@ Rust-backed via `rigour._core`. Python-side surface:
 * `Name.consolidate_names(names)` classmethod — drops names that are
   substrings of longer names in the same iterable
 * `__hash__` / `__eq__` by `form` (stable across tag mutation)
+* `to_bytes()` / `Name.from_bytes(data)` and the bulk
+  `dump_names(names)` / `load_names(data)` — a compact binary form
+  carrying every derived field and the tagger spans, so a decoded
+  name needs no re-analysis. Pickling goes through the same codec.
 
 `parts` is a tuple built once at construction — attribute reads are
 zero-copy INCREFs. `spans` starts empty and grows via `apply_phrase`
 / `apply_part`.
 """
-from rigour._core import Name
+from rigour._core import Name, dump_names, load_names
 
-__all__ = ["Name"]
+__all__ = ["Name", "dump_names", "load_names"]
@@ -0,0 +1,30 @@
+"""Score one query name against many candidates.
+
+A screening request compares a single analysed query `Name` with every
+name of every candidate. The free functions
+([pair_symbols][rigour.names.pair_symbols],
+[compare_parts][rigour.names.compare_parts],
+[score_upper_bound][rigour.names.score_upper_bound],
+[match_name_sets][rigour.names.match_name_sets]) rebuild the query's
+internal representation on each call.
+[PreparedName][rigour.names.prepared.PreparedName] builds it once:
+
+```python
+prepared = query.prepare()  # or PreparedName(query)
+for candidate in candidates:
+    pairings = prepared.pair_symbols(candidate)
+    ...
+```
+
+Each method returns exactly what the free function returns with the
+prepared name as the query side; `compare_parts` takes the query
+residue (a subset of the prepared name's parts, in the order the
+matcher scores them) and reuses its internal form for every later call
+with the same residue. The `*_many` variants take a list of candidates
+and answer for all of them in one call. A prepared name is a snapshot:
+prepare it after analysis and tagging are done.
+"""
+
+from rigour._core import PreparedName
+
+__all__ = ["PreparedName"]
@@ -0,0 +1,38 @@
+"""Best-pair matching between two sets of names.
+
+An entity in a screening list carries many names — aliases, scripts,
+transliterations — and so does the record it is checked against. The
+matcher wants the best-scoring pair, and comparing every pair from
+Python means two Rust calls (`pair_symbols`, `compare_parts`) per pair.
+[match_name_sets][rigour.names.set_match.match_name_sets] runs the
+whole cross product in one call:
+
+* a pair with identical `Name.comparable` forms is a literal hit and
+  ends the search with score `1.0`;
+* pairs written in different scripts that share no tagger symbol
+  (other than initials) are filtered out unscored;
+* the remaining pairs are scored in descending order of a cheap upper
+  bound on their score, and the search stops once no remaining pair
+  can beat the best found so far;
+* each scored pair takes its best symbol pairing: symbol edges get a
+  per-category score and weight, the leftover parts are ordered
+  (`align_person_name_order` for people, tag order otherwise) and
+  scored with `compare_parts`.
+
+The returned [NameSetMatch][rigour.names.set_match.NameSetMatch]
+carries the winning pair, its alignments and counters showing how
+many pairs were filtered, skipped by the bound or scored.
+[MatchConfig][rigour.names.set_match.MatchConfig] tunes symbol-edge
+scores and weights, the weights of unmatched parts and, through its
+`compare` field, the residue scorer.
+
+[score_upper_bound][rigour.names.set_match.score_upper_bound] exposes
+the per-pair ceiling the search orders by, for matchers that run their
+own pair loop: it never undershoots what `match_name_sets` would score
+for that pair alone, and costs a few set intersections.
+"""
+
+from rigour._core import MatchConfig, NameSetMatch, match_name_sets
+from rigour._core import score_upper_bound
+
+__all__ = ["MatchConfig", "NameSetMatch", "match_name_sets", "score_upper_bound"]
@@ -5,6 +5,7 @@ from rigour.text.phonetics import soundex, metaphone
 from rigour.territories.territory import get_index
 from rigour.territories.lookup import lookup_territory
 from rigour.territories.lookup import _get_identifier_map, _get_territory_names
+from rigour.territories.lookup import _get_fuzzy_index
 from rigour.text.scripts import codepoint_script
 from rigour.names.tokenize import normalize_name
 from rigour.names.prefix import (
@@ -13,12 +14,12 @@ from rigour.names.prefix import (
     _obj_prefix_regex,
 )
 from rigour.names.split_phrases import _split_phrase_regex
-from rigour.addresses.format import _load_formats, _load_template
-from rigour.addresses.normalize import _address_replacer
+from rigour.addresses.format import _get_formatter, _load_formats, _load_template
 # Tagger caches live Rust-side, keyed on (TaggerKind, Normalize,
 # Cleanup) in a process-lifetime RwLock<HashMap>. There's no
 # Python-side handle to reset; the built automata stay until process
-# exit. Same shape as the org_types Replacer cache.
+# exit. Same shape as the org_types Replacer cache and the address
+# keyword replacers.
 
 
 def reset_caches() -> None:
@@ -32,7 +33,7 @@ def reset_caches() -> None:
     codepoint_script.cache_clear()
     _load_formats.cache_clear()
     _load_template.cache_clear()
-    _address_replacer.cache_clear()
+    _get_formatter.cache_clear()
     _person_prefix_regex.cache_clear()
     _org_prefix_regex.cache_clear()
     _obj_prefix_regex.cache_clear()
@@ -40,5 +41,6 @@ def reset_caches() -> None:
     get_index.cache_clear()
     _get_identifier_map.cache_clear()
     _get_territory_names.cache_clear()
+    _get_fuzzy_index.cache_clear()
     lookup_territory.cache_clear()
     gc.collect()
@@ -11,12 +11,28 @@ to retrieve territories by their codes or QIDs.
 """
 
 from functools import cache
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from rigour.territories.territory import Territory
 from rigour.territories.territory import get_index as _get_index
-from rigour.territories.lookup import lookup_by_identifier, lookup_territory
-from rigour.territories.match import territories_intersect
-from rigour.territories.util import clean_code
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.territories.lookup import (
+        lookup_by_identifier,
+        lookup_territories,
+        lookup_territory,
+    )
+    from rigour.territories.match import (
+        descendants,
+        is_within,
+        territories_intersect,
+        territories_intersect_batch,
+    )
+    from rigour.territories.mentions import (
+        TerritoryMention,
+        find_territories,
+        find_territories_batch,
+    )
 
 
 __all__ = [
@@ -26,9 +42,38 @@ __all__ = [
     "get_ftm_countries",
     "lookup_by_identifier",
     "lookup_territory",
+    "lookup_territories",
     "territories_intersect",
+    "territories_intersect_batch",
+    "is_within",
+    "descendants",
+    "find_territories",
+    "find_territories_batch",
+    "TerritoryMention",
 ]
 
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.territories.lookup": [
+            "lookup_by_identifier",
+            "lookup_territory",
+            "lookup_territories",
+        ],
+        "rigour.territories.match": [
+            "territories_intersect",
+            "territories_intersect_batch",
+            "is_within",
+            "descendants",
+        ],
+        "rigour.territories.mentions": [
+            "find_territories",
+            "find_territories_batch",
+            "TerritoryMention",
+        ],
+    },
+)
+
 
 def get_territory(code: str) -> Optional[Territory]:
     """Get a territory object for the given code.
@@ -39,9 +84,11 @@ def get_territory(code: str) -> Optional[Territory]:
     Returns:
         A territory object.
     """
-    index = _get_index()
-    code = clean_code(code)
-    return index.get(code)
+    # Imported here: `util` pulls in `normality`, which a bare
+    # `import rigour.territories` shouldn't pay for.
+    from rigour.territories.util import clean_code
+
+    return _get_index().get(clean_code(code))
 
 
 @cache
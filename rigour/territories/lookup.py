@@ -1,18 +1,19 @@
 import logging
-from functools import cache, lru_cache
-from typing import Dict, Generator, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
 
-from rigour._core import raw_levenshtein_cutoff, territories_jsonl
+from rigour._core import FuzzyNameIndex, territories_jsonl
 from rigour.data import iter_jsonl_text
 from rigour.territories.territory import Territory
 from rigour.territories.territory import get_index as _get_index
 from rigour.territories.util import clean_code, normalize_territory_name
-from rigour.util import MEMO_MEDIUM, resource_lock
+from rigour.territories.util import normalize_territory_names
+from rigour.util import MEMO_MEDIUM, build_once
 
 log = logging.getLogger(__name__)
 
 
-@cache
+@build_once
 def _get_identifier_map() -> Dict[str, Territory]:
     """Create a mapping of territory codes and names to Territory objects."""
     index = _get_index()
@@ -64,15 +65,19 @@ def _load_territory_names() -> Generator[
         yield territory, strongs, weaks
 
 
-@cache
+@build_once
 def _get_territory_names() -> Dict[str, Territory]:
     """Get a mapping of names to Territory objects."""
+    records = list(_load_territory_names())
+    # Every distinct name goes through the normaliser in a single call.
+    unique = list({n for _, strongs, weaks_ in records for n in strongs + weaks_})
+    normalized = dict(zip(unique, normalize_territory_names(unique)))
     mapping: Dict[str, Territory] = {}
     weaks: Dict[Territory, List[str]] = {}
-    for territory, strongs, weaks_ in _load_territory_names():
+    for territory, strongs, weaks_ in records:
         weaks[territory] = weaks_
         for name in strongs:
-            nname = normalize_territory_name(name)
+            nname = normalized[name]
             if nname in mapping and mapping[nname] != territory:  # pragma: no cover
                 log.warning(
                     "Duplicate strong name found: %r for %s and %s",
@@ -85,7 +90,7 @@ def _get_territory_names() -> Dict[str, Territory]:
     weak_mapping: Dict[str, Territory] = {}
     for territory, names_weak in weaks.items():
         for name in names_weak:
-            nname = normalize_territory_name(name)
+            nname = normalized[name]
             if nname in mapping:
                 continue
             if (
@@ -102,28 +107,38 @@ def _get_territory_names() -> Dict[str, Territory]:
     return mapping
 
 
-def _fuzzy_search(name: str) -> Optional[Territory]:
-    best_territory: Optional[Territory] = None
-    cutoff = int(len(name) * 0.3)
-    best_distance = cutoff + 1
-    with resource_lock:
-        names = _get_territory_names()
-    for cand, territory in names.items():
-        if len(cand) <= 4:
+@build_once
+def _get_fuzzy_index() -> Tuple[FuzzyNameIndex, List[Territory]]:
+    """Build the approximate-match index over the territory names."""
+    names = _get_territory_names()
+    return FuzzyNameIndex(list(names.keys())), list(names.values())
+
+
+def _fuzzy_results(
+    territories: List[Territory],
+    names: List[str],
+    results: List[Optional[Tuple[int, int]]],
+) -> List[Optional[Territory]]:
+    out: List[Optional[Territory]] = []
+    for name, result in zip(names, results):
+        if result is None:
+            out.append(None)
             continue
-        distance = raw_levenshtein_cutoff(name, cand, cutoff)
-        if distance < best_distance:
-            best_distance = distance
-            best_territory = territory
-    if best_territory is None:
-        return None
-    log.debug(
-        "Guessing country: %r -> %s (distance %d)",
-        name,
-        best_territory.code,
-        best_distance,
-    )
-    return best_territory
+        position, distance = result
+        territory = territories[position]
+        log.debug(
+            "Guessing country: %r -> %s (distance %d)",
+            name,
+            territory.code,
+            distance,
+        )
+        out.append(territory)
+    return out
+
+
+def _fuzzy_search(name: str) -> Optional[Territory]:
+    index, territories = _get_fuzzy_index()
+    return _fuzzy_results(territories, [name], [index.search(name)])[0]
 
 
 @lru_cache(maxsize=MEMO_MEDIUM)
@@ -141,11 +156,45 @@ def lookup_territory(text: str, fuzzy: bool = False) -> Optional[Territory]:
     if territory is not None:
         return territory
     normalized_name = normalize_territory_name(text)
-    with resource_lock:
-        names = _get_territory_names()
+    names = _get_territory_names()
     if normalized_name in names:
         return names[normalized_name]
     if fuzzy:
         return _fuzzy_search(normalized_name)
     log.debug("No territory found for %r", text)
     return None
+
+
+def lookup_territories(
+    texts: Iterable[str], fuzzy: bool = False
+) -> List[Optional[Territory]]:
+    """Lookup many territories at once; the batch form of :func:`lookup_territory`.
+
+    Direct matches go through the memoized :func:`lookup_territory`; the texts
+    that need a fuzzy search are deduplicated and sent to the name index in a
+    single call, which runs without the GIL.
+
+    Args:
+        texts: The texts to lookup.
+        fuzzy: If true, try a fuzzy search for texts without a direct match.
+
+    Returns:
+        A list with a Territory or None for each of the given texts.
+    """
+    results: List[Optional[Territory]] = []
+    pending: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        territory = lookup_territory(text)
+        results.append(territory)
+        if territory is None and fuzzy:
+            normalized_name = normalize_territory_name(text)
+            pending.setdefault(normalized_name, []).append(i)
+    if pending:
+        index, territories = _get_fuzzy_index()
+        queries = list(pending.keys())
+        matches = index.search_batch(queries)
+        found = _fuzzy_results(territories, queries, matches)
+        for query, territory in zip(queries, found):
+            for i in pending[query]:
+                results[i] = territory
+    return results
@@ -1,5 +1,9 @@
-from typing import Iterable, Set
-from rigour.territories.territory import Territory, get_index
+from typing import Iterable, List, Set
+
+from rigour._core import territories_intersect_batch as _intersect_batch
+from rigour._core import territories_intersect as _intersect
+from rigour._core import territory_descendants, territory_is_within
+from rigour.territories.territory import Territory
 
 
 def territories_intersect(left: Iterable[str], right: Iterable[str]) -> Set[str]:
@@ -14,25 +18,49 @@ def territories_intersect(left: Iterable[str], right: Iterable[str]) -> Set[str]
         A set of territory codes that are common to both lists, considering
         hierarchical and claim relationships. The most narrow codes are returned.
     """
-    index = get_index()
-    left_set: Set[Territory] = set(index[code] for code in left if code in index)
-    right_set: Set[Territory] = set(index[code] for code in right if code in index)
-    common: Set[Territory] = set()
-    for cand in left_set:
-        if cand in right_set:
-            common.add(cand)
-            continue
-        if cand.parent is not None and cand.parent in right_set:
-            common.add(cand)
-            continue
-        for claim in cand.claims:
-            if claim in right_set:
-                common.add(cand)
-    for cand in right_set:
-        if cand.parent is not None and cand.parent in left_set:
-            common.add(cand)
-            continue
-        for claim in cand.claims:
-            if claim in left_set:
-                common.add(cand)
-    return {t.code for t in common}
+    return _intersect(list(left), list(right))
+
+
+def territories_intersect_batch(
+    query: Iterable[str], candidates: Iterable[Iterable[str]]
+) -> List[Set[str]]:
+    """Intersect one territory code list with each of many others, as
+    :func:`territories_intersect` would.
+
+    Args:
+        query: A list of territory codes.
+        candidates: The territory code lists to intersect `query` with.
+
+    Returns:
+        One set of common territory codes per candidate list, in order.
+    """
+    return _intersect_batch(list(query), [list(cand) for cand in candidates])
+
+
+def is_within(code: str, ancestor: str) -> bool:
+    """Check if a territory is part of another one, at any depth of the
+    parent-child hierarchy. A territory is within itself; contested claims
+    are not considered.
+
+    Args:
+        code: A territory code.
+        ancestor: The code of the potentially enclosing territory.
+
+    Returns:
+        True if `code` is `ancestor` or one of its descendants, False otherwise
+        or if either code is unknown.
+    """
+    return territory_is_within(code, ancestor)
+
+
+def descendants(code: str) -> List[Territory]:
+    """Get all the territories beneath a territory in the parent-child
+    hierarchy, at any depth.
+
+    Args:
+        code: A territory code.
+
+    Returns:
+        A list of territories, empty if the code is unknown.
+    """
+    return territory_descendants(code)
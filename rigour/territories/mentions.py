@@ -0,0 +1,55 @@
+from typing import Iterable, List, NamedTuple
+
+from rigour._core import find_territories as _find_territories
+from rigour._core import find_territories_batch as _find_territories_batch
+from rigour.territories.territory import Territory
+
+
+class TerritoryMention(NamedTuple):
+    """A territory name found in a text by :func:`find_territories`."""
+
+    start: int
+    """Offset of the first character of the name in the text."""
+    end: int
+    """Offset just past the last character of the name."""
+    territory: Territory
+    """The territory the name refers to."""
+    strong: bool
+    """Whether the name is a strong name of the territory. Weak names
+    include many common words and short forms, so most callers will want
+    to ignore weak mentions."""
+
+
+def find_territories(text: str) -> List[TerritoryMention]:
+    """Find the territory names mentioned in a text, such as the country or
+    state in a free-text address.
+
+    The text is scanned once for every strong and weak territory name known
+    to :func:`lookup_territory`, normalised the same way. Names only match
+    whole words, and overlapping names resolve to the longest one starting
+    leftmost. Codes (`"DE"`, `"DEU"`) are not matched unless they are also
+    names (`"UK"`, `"USA"`).
+
+    Args:
+        text: The text to scan.
+
+    Returns:
+        The mentions, in order of appearance. `text[m.start:m.end]` is the
+        text of mention `m`.
+    """
+    return [TerritoryMention(*m) for m in _find_territories(text)]
+
+
+def find_territories_batch(texts: Iterable[str]) -> List[List[TerritoryMention]]:
+    """Find the territory names mentioned in many texts at once, as
+    :func:`find_territories` would. The texts are scanned without the GIL,
+    spread over the available CPU cores.
+
+    Args:
+        texts: The texts to scan.
+
+    Returns:
+        One list of mentions per text, in order.
+    """
+    results = _find_territories_batch(list(texts))
+    return [[TerritoryMention(*m) for m in mentions] for mentions in results]
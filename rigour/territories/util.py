@@ -1,10 +1,7 @@
-import unicodedata
 from typing import List
-from normality import latinize_text, squash_spaces
 
-from rigour.text.scripts import can_latinize
-
-SKIP_CHARACTERS = ".()[],;:_-/ʻ'’"
+from rigour._core import normalize_territory_name as _normalize_territory_name
+from rigour._core import normalize_territory_names as _normalize_territory_names
 
 
 def clean_code(code: str) -> str:
@@ -19,18 +16,9 @@ def clean_codes(codes: List[str]) -> List[str]:
 
 def normalize_territory_name(name: str) -> str:
     """Normalize a territory name for lookup."""
-    name = unicodedata.normalize("NFKD", name).casefold()
-    filtered: List[str] = []
-    for char in name:
-        if char in SKIP_CHARACTERS:
-            continue
-        if not char.isalnum():
-            filtered.append(" ")
-            continue
-        filtered.append(char)
-    normalized = "".join(filtered)
-    if can_latinize(normalized):
-        normalized = latinize_text(normalized)
-    normalized = unicodedata.normalize("NFKC", normalized)
-    normalized = squash_spaces(normalized)
-    return normalized
+    return _normalize_territory_name(name)
+
+
+def normalize_territory_names(names: List[str]) -> List[str]:
+    """Normalize a list of territory names for lookup, in one call."""
+    return _normalize_territory_names(names)
@@ -1,11 +1,16 @@
-from rigour.text.distance import levenshtein
-from rigour.text.distance import levenshtein_similarity
-from rigour.text.distance import is_levenshtein_plausible
-from rigour.text.distance import jaro_winkler
-from rigour.text.checksum import text_hash
-from rigour.text.phonetics import metaphone, soundex
-from rigour.text.cleaning import remove_bracketed_text, remove_emoji
-from rigour.text.stopwords import is_stopword, is_nullword, is_nullplace
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.text.distance import levenshtein
+    from rigour.text.distance import levenshtein_similarity
+    from rigour.text.distance import is_levenshtein_plausible
+    from rigour.text.distance import jaro_winkler
+    from rigour.text.checksum import text_hash
+    from rigour.text.phonetics import metaphone, soundex
+    from rigour.text.cleaning import remove_bracketed_text, remove_emoji
+    from rigour.text.stopwords import is_stopword, is_nullword, is_nullplace
 
 __all__ = [
     "levenshtein",
@@ -21,3 +26,19 @@ __all__ = [
     "is_nullword",
     "is_nullplace",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.text.distance": [
+            "levenshtein",
+            "levenshtein_similarity",
+            "is_levenshtein_plausible",
+            "jaro_winkler",
+        ],
+        "rigour.text.checksum": ["text_hash"],
+        "rigour.text.phonetics": ["metaphone", "soundex"],
+        "rigour.text.cleaning": ["remove_bracketed_text", "remove_emoji"],
+        "rigour.text.stopwords": ["is_stopword", "is_nullword", "is_nullplace"],
+    },
+)
@@ -1,5 +1,19 @@
-from rigour.urls.cleaning import clean_url, clean_url_compare, build_url
-from rigour.urls.compare import compare_urls
-from rigour.urls.util import ParamsType
+from typing import TYPE_CHECKING
+
+from rigour.util import lazy_exports
+
+if TYPE_CHECKING:
+    from rigour.urls.cleaning import clean_url, clean_url_compare, build_url
+    from rigour.urls.compare import compare_urls
+    from rigour.urls.util import ParamsType
 
 __all__ = ["clean_url", "clean_url_compare", "build_url", "compare_urls", "ParamsType"]
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "rigour.urls.cleaning": ["clean_url", "clean_url_compare", "build_url"],
+        "rigour.urls.compare": ["compare_urls"],
+        "rigour.urls.util": ["ParamsType"],
+    },
+)
@@ -1,9 +1,24 @@
 import gc
+import importlib
 import sys
-from typing import List
+from functools import update_wrapper
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from threading import RLock
 
 
+T = TypeVar("T")
+
 MEMO_TINY = 128
 MEMO_SMALL = 2000
 MEMO_MEDIUM = 20000
@@ -14,6 +29,53 @@ resource_lock = RLock()
 in loading large resource files."""
 
 
+class BuildInfo(NamedTuple):
+    builds: int
+    currsize: int
+
+
+class build_once(Generic[T]):
+    """Decorator for the builders of large, immutable lookup tables.
+
+    Works like `functools.cache`, keyed on the call's arguments, but is
+    meant for read-heavy tables shared between threads: the build runs
+    under :data:`resource_lock`, so a table is only ever built once, and
+    every later call is a plain dictionary read that takes no lock at all.
+    A value is only published once its builder has returned, so readers
+    never see a partially built table, with or without the GIL.
+
+    The cached values must not be mutated after the build.
+    """
+
+    def __init__(self, func: Callable[..., T]) -> None:
+        self._func = func
+        self._values: Dict[Any, T] = {}
+        self._builds = 0
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        key = args + tuple(kwargs.items()) if kwargs else args
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with resource_lock:
+            values = self._values
+            if key not in values:
+                values[key] = self._func(*args, **kwargs)
+                self._builds += 1
+            return values[key]
+
+    def cache_clear(self) -> None:
+        """Drop the built values; the next call rebuilds them."""
+        with resource_lock:
+            self._values = {}
+
+    def cache_info(self) -> BuildInfo:
+        """Number of builds run so far and of values currently held."""
+        return BuildInfo(self._builds, len(self._values))
+
+
 def unload_module(module_name: str) -> None:
     """Unload a module from sys.modules, if it is loaded.
 
@@ -43,3 +105,40 @@ def list_intersection(left: List[str], right: List[str]) -> List[str]:
         except ValueError:
             pass
     return overlap
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Mapping[str, Sequence[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build PEP 562 `__getattr__` / `__dir__` hooks for a package that
+    re-exports names from its submodules.
+
+    A submodule is imported the first time one of its names is read
+    from the package, and the value is then stored in the package
+    namespace so later reads are plain attribute lookups. This keeps
+    `import rigour.names` from importing every submodule (and their
+    dependencies) that the caller never uses.
+
+    Args:
+        namespace: The package's `globals()`.
+        exports: Submodule name → the names the package re-exports
+            from it.
+
+    Returns:
+        The `(__getattr__, __dir__)` pair to assign in the package.
+    """
+    package = namespace["__name__"]
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__
@@ -0,0 +1,190 @@
+"""Eager construction of rigour's lazily built data structures.
+
+Taggers, org-type replacers, prefix regexes, the territory indexes,
+the address keyword replacer and the stopword sets are all built on
+first use. In a server that means the first requests after a deploy
+pay for them, and in a pre-fork server every child builds (or
+copy-on-write faults in) its own copy. Call
+[preload][rigour.preload] once at startup, before forking, to build
+them up front.
+"""
+
+import gc
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from rigour._core import preload_data
+
+__all__ = ["preload"]
+
+Builder = Tuple[str, Callable[[], object]]
+
+# Rust-side components built for `names=True`; see rust/src/preload.rs.
+NAMES_RUST = [
+    "org_tagger",
+    "person_tagger",
+    "org_types",
+    "name_prefixes",
+    "name_stopwords",
+    "name_symbols",
+]
+# Rust-side components built for `territories=True`.
+TERRITORIES_RUST = ["territory_mentions"]
+# Rust-side components built for `addresses=True`.
+ADDRESSES_RUST = ["address_keywords"]
+
+
+def _names_builders() -> List[Builder]:
+    from rigour.names.check import _load_generic_person_names
+    from rigour.names.prefix import (
+        _obj_prefix_regex,
+        _org_prefix_regex,
+        _person_prefix_regex,
+    )
+    from rigour.names.split_phrases import _split_phrase_regex
+    from rigour.names.tokenize import normalize_name
+
+    def prefix_regexes() -> None:
+        _person_prefix_regex()
+        _org_prefix_regex()
+        _obj_prefix_regex()
+
+    return [
+        ("name_prefix_regexes", prefix_regexes),
+        ("split_phrases", _split_phrase_regex),
+        ("generic_person_names", lambda: _load_generic_person_names(normalize_name)),
+    ]
+
+
+def _territories_builders() -> List[Builder]:
+    from rigour.territories import get_territories
+    from rigour.territories.lookup import _get_identifier_map, _get_territory_names
+    from rigour.territories.territory import get_index
+
+    return [
+        ("territory_index", get_index),
+        ("territory_list", get_territories),
+        ("territory_identifiers", _get_identifier_map),
+        ("territory_names", _get_territory_names),
+    ]
+
+
+def _addresses_builders() -> List[Builder]:
+    from rigour.addresses.format import _get_formatter, _load_formats
+
+    def formatters() -> None:
+        # Compile every country's template, keyed as callers pass them.
+        for country, fmt in _load_formats().items():
+            if isinstance(fmt, dict):
+                _get_formatter(country)
+
+    return [("address_formats", formatters)]
+
+
+def _text_builders() -> List[Builder]:
+    from rigour.text.stopwords import (
+        _load_nullplaces,
+        _load_nullwords,
+        _load_stopwords,
+        normalize_text,
+    )
+    from rigour.text.normalize import noop_normalizer
+
+    def nullwords() -> None:
+        # `is_nullword(..., normalize=False)` reads the raw list.
+        _load_nullwords(normalize_text)
+        _load_nullwords(noop_normalizer)
+
+    return [
+        ("stopwords", lambda: _load_stopwords(normalize_text)),
+        ("nullwords", nullwords),
+        ("nullplaces", lambda: _load_nullplaces(normalize_text)),
+    ]
+
+
+def preload(
+    names: bool = True,
+    territories: bool = True,
+    addresses: bool = True,
+    text: bool = True,
+    freeze: bool = True,
+) -> Dict[str, float]:
+    """Build rigour's lazily constructed data structures now.
+
+    The Rust-side builds (taggers, org-type replacers, the other name
+    tables, the territory name scanner and the address keyword
+    replacers) run concurrently on background threads with the GIL
+    released, while the Python-side caches are filled on the calling
+    thread. Components that are already built cost next to nothing,
+    so calling this more than once is harmless.
+
+    Call it in the parent process before a pre-fork server forks its
+    workers: the children then inherit the built structures instead
+    of each building their own.
+
+    Args:
+        names: Build the name taggers, org-type replacers, prefix
+            regexes and name wordlists.
+        territories: Build the territory index, name lookups and name
+            scanner.
+        addresses: Build the address keyword replacers and format
+            table.
+        text: Build the stopword, nullword and nullplace sets.
+        freeze: Finish with `gc.collect()` and `gc.freeze()`, moving
+            every live object into the permanent generation. The
+            collector then never touches the preloaded objects, so
+            forked children don't copy their pages by writing GC
+            bookkeeping to them.
+
+    Returns:
+        Build time in seconds per component, plus `"total"` for the
+        wall-clock time of the whole call.
+    """
+    start = time.perf_counter()
+    builders: List[Builder] = []
+    rust_components: List[str] = []
+    if names:
+        builders.extend(_names_builders())
+        rust_components.extend(NAMES_RUST)
+    if territories:
+        builders.extend(_territories_builders())
+        rust_components.extend(TERRITORIES_RUST)
+    if addresses:
+        builders.extend(_addresses_builders())
+        rust_components.extend(ADDRESSES_RUST)
+    if text:
+        builders.extend(_text_builders())
+
+    rust_timings: List[Tuple[str, float]] = []
+    errors: List[BaseException] = []
+
+    def build_rust() -> None:
+        try:
+            rust_timings.extend(preload_data(rust_components))
+        except BaseException as exc:  # re-raised on the calling thread
+            errors.append(exc)
+
+    worker = threading.Thread(target=build_rust, name="rigour-preload")
+    if rust_components:
+        worker.start()
+    timings: Dict[str, float] = {}
+    try:
+        for name, build in builders:
+            began = time.perf_counter()
+            build()
+            timings[name] = time.perf_counter() - began
+    finally:
+        # Never return, or raise a builder's error, with the Rust
+        # builds still running behind the caller's back.
+        if rust_components:
+            worker.join()
+    if errors:
+        raise errors[0]
+    timings.update(rust_timings)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    timings["total"] = time.perf_counter() - start
+    return timings
@@ -0,0 +1,9392 @@
+// This file is automatically generated by genscripts/generate_langs.py,
+// do not edit it. Run `make build-iso639` to regenerate.
+//
+// All tables are sorted by key (byte order) for binary search; see
+// `rust/src/langs.rs`.
+
+/// Every ISO 639-3 code, packed three bytes per code.
+pub(crate) static ISO3_ALL: &str = "\
+    aaaaabaacaadaaeaafaagaahaaiaakaalaanaaoaapaaqaaraasaataauaawaaxaazabaabb\
+    abcabdabeabfabgabhabiabjabkablabmabnaboabpabqabrabsabtabuabvabwabxabyabz\
+    acaacbacdaceacfachaciackaclacmacnacpacqacracsactacuacvacwacxacyaczadaadb\
+    addadeadfadgadhadiadjadladnadoadqadradsadtaduadwadxadyadzaeaaebaecaedaee\
+    aekaelaemaenaeqaeraesaeuaewaeyaezafbafdafeafgafhafiafkafnafoafpafrafsaft\
+    afuafzagaagbagcagdageagfaggaghagiagjagkaglagmagnagoagqagragsagtaguagvagw\
+    agxagyagzahaahbahgahhahiahkahlahmahnahoahpahrahsahtaiaaibaicaidaieaifaig\
+    aihaiiaijaikailaimainaioaipaiqairaitaiwaixaiyajaajgajiajnajpajtajuajwajz\
+    akaakbakcakdakeakfakgakhakiakjakkaklakmakoakpakqakraksaktakuakvakwakxaky\
+    akzalaalcaldalealfalhalialjalkallalmalnaloalpalqalralsaltalualwalxalyalz\
+    amaambamcameamfamgamhamiamjamkamlammamnamoampamqamramsamtamuamvamwamxamy\
+    amzanaanbancandaneanfanganhanianjankanlanmannanoanpanqanransantanuanvanw\
+    anxanyanzaoaaobaocaodaoeaofaogaoiaojaokaolaomaonaoraosaotaouaoxaozapbapc\
+    apdapeapfapgaphapiapjapkaplapmapnapoappapqaprapsaptapuapvapwapxapyapzaqc\
+    aqdaqgaqkaqmaqnaqpaqraqtaqzaraarbarcardareargarhariarjarkarlarnaroarparq\
+    arrarsaruarvarwarxaryarzasaasbascaseasfasgashasiasjaskaslasmasnasoaspasq\
+    asrassastasuasvaswasxasyaszataatbatcatdateatgatiatjatkatlatmatnatoatpatq\
+    atratsattatuatvatwatxatyatzauaaubaucaudaugauhauiaujaukaulaumaunauoaupauq\
+    aurautauuauwauxauyauzavaavbavdaveaviavkavlavmavnavoavsavtavuavvawaawbawc\
+    aweawgawhawiawkawmawnawoawrawsawtawuawvawwawxawyaxbaxeaxgaxkaxlaxmaxxaya\
+    aybaycaydayeaygayhayiaykaylaymaynayoaypayqayraysaytayuayzazaazbazdazeazg\
+    azjazmaznazoaztazzbaababbacbaebafbagbahbajbakbalbambanbaobapbarbasbaubav\
+    bawbaxbaybbabbbbbcbbdbbebbfbbgbbhbbibbjbbkbblbbmbbnbbobbpbbqbbrbbsbbtbbu\
+    bbvbbwbbxbbybcabcbbccbcdbcebcfbcgbchbcibcjbckbclbcmbcnbcobcpbcqbcrbcsbct\
+    bcubcvbcwbcybczbdabdbbdcbddbdebdfbdgbdhbdibdjbdkbdlbdmbdnbdobdpbdqbdrbds\
+    bdtbdubdvbdwbdxbdybdzbeabebbecbedbeebefbegbehbeibejbekbelbembenbeobepbeq\
+    besbetbeubevbewbexbeybezbfabfbbfcbfdbfebffbfgbfhbfibfjbfkbflbfmbfnbfobfp\
+    bfqbfrbfsbftbfubfwbfxbfybfzbgabgbbgcbgdbgebgfbggbgibgjbgkbglbgnbgobgpbgq\
+    bgrbgsbgtbgubgvbgwbgxbgybgzbhabhbbhcbhdbhebhfbhgbhhbhibhjbhlbhmbhnbhobhp\
+    bhqbhrbhsbhtbhubhvbhwbhxbhybhzbiabibbidbiebifbigbikbilbimbinbiobipbiqbir\
+    bisbitbiubivbiwbixbiybizbjabjbbjcbjebjfbjgbjhbjibjjbjkbjlbjmbjnbjobjpbjr\
+    bjsbjtbjubjvbjwbjxbjybjzbkabkcbkdbkfbkgbkhbkibkjbkkbklbkmbknbkobkpbkqbkr\
+    bksbktbkubkvbkwbkxbkybkzblablbblcbldbleblfblhblibljblkbllblmblnbloblpblq\
+    blrblsbltblvblwblxblyblzbmabmbbmcbmdbmebmfbmgbmhbmibmjbmkbmlbmmbmnbmobmp\
+    bmqbmrbmsbmtbmubmvbmwbmxbmzbnabnbbncbndbnebnfbngbnibnjbnkbnlbnmbnnbnobnp\
+    bnqbnrbnsbnubnvbnwbnxbnybnzboabobbodboebofbogbohboibojbokbolbombonboobop\
+    boqborbosbotboubovbowboxboybozbpabpdbpebpgbphbpibpjbpkbplbpmbpnbpobppbpq\
+    bprbpsbptbpubpvbpwbpxbpybpzbqabqbbqcbqdbqfbqgbqhbqibqjbqkbqlbqmbqnbqobqp\
+    bqqbqrbqsbqtbqubqvbqwbqxbqybqzbrabrbbrcbrdbrebrfbrgbrhbribrjbrkbrlbrmbrn\
+    brobrpbrqbrrbrsbrtbrubrvbrwbrxbrybrzbsabsbbscbsebsfbsgbshbsibsjbskbslbsm\
+    bsnbsobspbsqbsrbssbstbsubsvbswbsxbsybtabtcbtdbtebtfbtgbthbtibtjbtmbtnbto\
+    btpbtqbtrbtsbttbtubtvbtwbtxbtybtzbuabubbucbudbuebufbugbuhbuibujbukbulbum\
+    bunbuobupbuqbusbutbuubuvbuwbuxbuybuzbvabvbbvcbvdbvebvfbvgbvhbvibvjbvkbvl\
+    bvmbvnbvobvpbvqbvrbvtbvubvvbvwbvxbvybvzbwabwbbwcbwdbwebwfbwgbwhbwibwjbwk\
+    bwlbwmbwnbwobwpbwqbwrbwsbwtbwubwwbwxbwybwzbxabxbbxcbxdbxebxfbxgbxhbxibxj\
+    bxkbxlbxmbxnbxobxpbxqbxrbxsbxubxvbxwbxzbyabybbycbydbyebyfbygbyhbyibyjbyk\
+    bylbymbynbyobypbyqbyrbysbytbyvbywbyxbyzbzabzbbzcbzdbzebzfbzgbzhbzibzjbzk\
+    bzlbzmbznbzobzpbzqbzrbzsbztbzubzvbzwbzxbzybzzcaacabcaccadcaecafcagcahcaj\
+    cakcalcamcancaocapcaqcarcascatcavcawcaxcaycazcbbcbccbdcbgcbicbjcbkcblcbn\
+    cbocbqcbrcbscbtcbucbvcbwcbycccccdcceccgcchccjcclccmccoccpccrcdacdecdfcdh\
+    cdicdjcdmcdncdocdrcdscdycdzceacebcegcekcencescetceycfacfdcfgcfmcgacgccgg\
+    cgkchachbchcchdchechfchgchhchjchkchlchmchnchochpchqchrchtchuchvchwchxchy\
+    chzciacibciccidciecihcikcimcincipcirciwciycjacjecjhcjicjkcjmcjncjocjpcjs\
+    cjvcjyckbckhcklckmcknckockqckrckscktckuckvckxckyckzclaclccldcleclhcliclj\
+    clkcllclmclocltcluclwclycmacmecmgcmicmlcmmcmncmocmrcmscmtcnacnbcnccngcnh\
+    cnicnkcnlcnocnpcnrcnscntcnucnwcnxcoacobcoccodcoecofcogcohcojcokcolcomcon\
+    coocopcoqcorcoscotcoucovcowcoxcozcpacpbcpccpgcpicpncpocpscpucpxcpycqdcra\
+    crbcrccrdcrecrfcrgcrhcricrjcrkcrlcrmcrncrocrqcrrcrscrtcrvcrwcrxcrycrzcsa\
+    csbcsccsdcsecsfcsgcshcsicsjcskcslcsmcsncsocspcsqcsrcsscstcsvcswcsxcsycsz\
+    ctactcctdctectgcthctlctmctnctoctpctscttctuctyctzcuacubcuccugcuhcuicujcuk\
+    culcuocupcuqcurcutcuucuvcuwcuxcuycvgcvncwacwbcwdcwecwgcwtcyacybcymcyoczh\
+    czkcznczocztdaadacdaddaedagdahdaidajdakdaldamdandaodaqdardasdaudavdawdax\
+    dazdbadbbdbddbedbfdbgdbidbjdbldbmdbndbodbpdbqdbrdbtdbudbvdbwdbydccdcrdda\
+    dddddeddgddiddjddnddoddrddsddwdecdeddeedefdegdehdeidekdeldemdendepdeqder\
+    desdeudevdezdgadgbdgcdgddgedggdghdgidgkdgldgndgodgrdgsdgtdgwdgxdgzdhddhg\
+    dhidhldhmdhndhodhrdhsdhudhvdhwdhxdiadibdicdiddifdigdihdiidijdikdildimdin\
+    diodipdiqdirdisdiudivdiwdixdiydizdjadjbdjcdjddjedjfdjidjjdjkdjmdjndjodjr\
+    djudjwdkadkgdkkdkrdksdkxdlgdlkdlmdlndmadmbdmcdmddmedmfdmgdmkdmldmmdmodmr\
+    dmsdmudmvdmwdmxdmydnadnddnedngdnidnjdnkdnndnodnrdntdnudnvdnwdnydoadobdoc\
+    doedofdohdoidokdoldondoodopdoqdordosdotdovdowdoxdoydozdppdrbdrcdrddredrg\
+    dridrldrndrodrqdrsdrtdrudrydsbdsedshdsidsldsndsodsqdtadtbdtddthdtidtkdtm\
+    dtndtodtpdtrdtsdttdtudtyduadubducduedufdugduhduidukduldumdunduodupduqdur\
+    dusduuduvduwduxduyduzdvadwadwkdwrdwsdwudwwdwydwzdyadybdyddygdyidymdyndyo\
+    dyudyydzadzedzgdzldzndzoeaaebcebgebkeboebrebuecrecsecyeeeefaefeefiegaegl\
+    egoegyehsehueipeiteivejaekaekeekgekiekkeklekmekoekpekrekyeleelhelielkell\
+    elmeloeluelxemaembemeemgemiemkemmemnempemqemsemuemwemxemyemzenaenbencend\
+    enfengenhenlenmennenoenqenrenuenvenwenxeotepiepoeraergerherierkeroerrers\
+    erterweseesgeshesieskeslesmesnesoesqessestesuesyetbetcethetnetoetretsett\
+    etuetxetzeuseveevhevneweewoexteyaeyoezaezefaafabfadfaffagfahfaifajfakfal\
+    famfanfaofapfarfasfatfaufaxfayfazfblfcsferffiffmfgrfiafiefiffijfilfinfip\
+    firfitfiwfkkfkvflaflhflifllflnflrflyfmpfmufnbfngfnifodfoifomfonforfosfpe\
+    fqsfrafrcfrdfrkfrmfrofrpfrqfrrfrsfrtfryfsefslfssfubfucfudfuefuffuhfuifuj\
+    fulfumfunfuqfurfutfuufuvfuyfvrfwafwegaagabgacgadgaegafgaggahgaigajgakgal\
+    gamgangaogapgaqgargasgatgaugawgaxgaygazgbagbbgbdgbegbfgbggbhgbigbjgbkgbl\
+    gbmgbngbogbpgbqgbrgbsgbugbvgbwgbxgbygbzgccgcdgcegcfgclgcngcrgctgdagdbgdc\
+    gddgdegdfgdggdhgdigdjgdkgdlgdmgdngdogdqgdrgdsgdtgdugdxgeagebgecgedgefgeg\
+    gehgeigejgekgelgeqgesgevgewgexgeygezgfkgftggaggbggdggegggggkgglggtgguggw\
+    ghaghcgheghhghkghlghnghoghrghsghtgiagibgicgidgiegiggihgiigilgimgingipgiq\
+    girgisgitgiugiwgixgiygizgjkgjmgjngjrgjugkagkdgkegkngkogkpgkuglaglbglcgld\
+    gleglgglhgljglkgllgloglrgluglvglwglygmagmbgmdgmggmhgmlgmmgmngmrgmugmvgmx\
+    gmygmzgnagnbgncgndgnegnggnhgnignjgnkgnlgnmgnngnognqgnrgntgnugnwgnzgoagob\
+    gocgodgoegofgoggohgoigojgokgolgomgongoogopgoqgorgosgotgougowgoxgoygozgpa\
+    gpegpngqagqigqngqrgqugragrbgrcgrdgrggrhgrigrjgrmgrngrogrqgrrgrsgrtgrugrv\
+    grwgrxgrygrzgsegsggslgsmgsngsogspgssgswgtagtuguagubgucgudguegufgugguhgui\
+    gujgukgulgumgunguogupguqgurgusgutguuguwguxguzgvagvcgvegvfgvjgvlgvmgvngvo\
+    gvpgvrgvsgvygwagwbgwcgwdgwegwfgwggwigwjgwmgwngwrgwtgwugwwgwxgxxgyagybgyd\
+    gyegyfgyggyigylgymgyngyogyrgyygyzgzagzigznhaahabhachadhaehafhaghahhaihaj\
+    hakhalhamhanhaohaphaqharhashathauhavhawhaxhayhazhbahbbhbnhbohbshbuhcahch\
+    hdnhdshdyheahebhedheghehheihemherhgmhgwhhihhrhhyhiahibhidhifhighihhiihij\
+    hikhilhinhiohirhithiwhixhjihkahkehkhhkkhknhkshlahlbhldhlehlthluhmahmbhmc\
+    hmdhmehmfhmghmhhmihmjhmkhmlhmmhmnhmohmphmqhmrhmshmthmuhmvhmwhmyhmzhnahnd\
+    hnehnghnhhnihnjhnnhnohnshnuhoahobhochodhoehohhoihojholhomhoohophorhoshot\
+    hovhowhoyhozhpohpshrahrchrehrkhrmhrohrphrthruhrvhrwhrxhrzhsbhshhslhsnhss\
+    htihtohtshtuhtxhubhuchudhuehufhughuhhuihujhukhulhumhunhuohuphuqhurhushut\
+    huuhuvhuwhuxhuyhuzhvchvehvkhvnhvvhwahwchwohyahyehywiaiianiaribaibbibdibe\
+    ibgibhiblibmibniboibribuibyicaichiclicridaidbidciddideidiidoidridsidtidu\
+    ifaifbifeiffifkifmifuifyigbigeiggigligmignigoigsigwihbihiihpihwiiiiinijc\
+    ijeijjijnijsikeikiikkiklikoikpikriksiktikuikvikwikxikzilailbileilgiliilk\
+    ilmiloilpilsiluilvimaimiimlimnimoimrimsimyinainbindinginhinjinlinminnino\
+    inpinsintinzioriouiowipiipkipoiquiqwireirhiriirkirnirriruirxiryisaiscisd\
+    iseisgishisiiskislismisnisoisristisuitaitbitditeitiitkitlitmitoitritsitt\
+    itvitwitxityitziumivbivviwkiwmiwoiwsixcixliyaiyoiyxizhizrizzjaajabjacjad\
+    jaejafjahjajjakjaljamjanjaojaqjasjatjaujavjaxjayjazjbejbijbjjbkjbmjbnjbo\
+    jbrjbtjbujbwjcsjctjdajdgjdtjebjeejehjeijekjeljenjerjetjeujgbjgejgkjgojhi\
+    jhsjiajibjicjidjiejigjihjiijiljimjiojiqjitjiujivjiyjjejjrjkajkmjkojkpjkr\
+    jksjkujlejlsjmajmbjmcjmdjmijmljmnjmrjmsjmwjmxjnajndjngjnijnjjnljnsjobjod\
+    jogjorjosjowjpajpnjprjqrjrajrbjrrjrtjrujsljuajubjucjudjuhjuijukjuljumjun\
+    juojupjurjusjutjuujuwjuyjvdjvnjwijyajyejyykaakabkackadkaekafkagkahkaikaj\
+    kakkalkamkankaokapkaqkaskatkaukavkawkaxkaykazkbakbbkbckbdkbekbgkbhkbikbj\
+    kbkkblkbmkbnkbokbpkbqkbrkbskbtkbukbvkbwkbxkbykbzkcakcbkcckcdkcekcfkcgkch\
+    kcikcjkckkclkcmkcnkcokcpkcqkcrkcskctkcukcvkcwkcxkcykczkdakdckddkdekdfkdg\
+    kdhkdikdjkdkkdlkdmkdnkdpkdqkdrkdtkdukdwkdxkdykdzkeakebkeckedkeekefkegkeh\
+    keikejkekkelkemkenkeokepkeqkerkesketkeukevkewkexkeykezkfakfbkfckfdkfekff\
+    kfgkfhkfikfjkfkkflkfmkfnkfokfpkfqkfrkfskftkfukfvkfwkfxkfykfzkgakgbkgekgf\
+    kggkgikgjkgkkglkgmkgnkgokgpkgqkgrkgskgtkgukgvkgwkgxkgykhakhbkhckhdkhekhf\
+    khgkhhkhjkhkkhlkhmkhnkhokhpkhqkhrkhskhtkhukhvkhwkhxkhykhzkiakibkickidkie\
+    kifkigkihkiikijkikkilkimkinkiokipkiqkirkiskitkiukivkiwkixkiykizkjakjbkjc\
+    kjdkjekjgkjhkjikjjkjkkjlkjmkjnkjokjpkjqkjrkjskjtkjukjvkjxkjykjzkkakkbkkc\
+    kkdkkekkfkkgkkhkkikkjkkkkklkkmkknkkokkpkkqkkrkkskktkkukkvkkwkkxkkykkzkla\
+    klbklckldkleklfklgklhklikljklkkllklmklnkloklpklqklrklskltkluklvklwklxkly\
+    klzkmakmbkmckmdkmekmfkmgkmhkmikmjkmkkmlkmmkmnkmokmpkmqkmrkmskmtkmukmvkmw\
+    kmxkmykmzknaknbknckndkneknfkngkniknjknkknlknmknnknoknpknqknrknskntknuknv\
+    knwknxknyknzkoakockodkoekofkogkohkoikokkolkomkonkookopkoqkorkoskotkoukov\
+    kowkoykozkpakpbkpckpdkpekpfkpgkphkpikpjkpkkplkpmkpnkpokpqkprkpskptkpukpv\
+    kpwkpxkpykpzkqakqbkqckqdkqekqfkqgkqhkqikqjkqkkqlkqmkqnkqokqpkqqkqrkqskqt\
+    kqukqvkqwkqxkqykqzkrakrbkrckrdkrekrfkrhkrikrjkrkkrlkrnkrpkrrkrskrtkrukrv\
+    krwkrxkrykrzksaksbkscksdkseksfksgkshksiksjkskkslksmksnksokspksqksrksskst\
+    ksuksvkswksxksykszktaktbktcktdktektfktgkthktiktjktkktlktmktnktoktpktqkts\
+    kttktuktvktwktxktyktzkuakubkuckudkuekufkugkuhkuikujkukkulkumkunkuokupkuq\
+    kurkuskutkuukuvkuwkuxkuykuzkvakvbkvckvdkvekvfkvgkvhkvikvjkvkkvlkvmkvnkvo\
+    kvpkvqkvrkvtkvukvvkvwkvxkvykvzkwakwbkwckwdkwekwfkwgkwhkwikwjkwkkwlkwmkwn\
+    kwokwpkwrkwskwtkwukwvkwwkwxkwykwzkxakxbkxckxdkxfkxhkxikxjkxkkxmkxnkxokxp\
+    kxqkxrkxskxtkxvkxwkxxkxykxzkyakybkyckydkyekyfkygkyhkyikyjkykkylkymkynkyo\
+    kypkyqkyrkyskytkyukyvkywkyxkyykyzkzakzbkzckzdkzekzfkzgkzikzkkzlkzmkznkzo\
+    kzpkzqkzrkzskzukzvkzwkzxkzykzzlaalablacladlaelaflaglahlailajlaklallamlan\
+    laolaplaqlarlaslatlaulavlawlaxlaylazlbblbclbelbflbglbilbjlbklbllbmlbnlbo\
+    lbqlbrlbslbtlbulbvlbwlbxlbylbzlcclcdlcelcflchlcllcmlcplcqlcsldaldblddldg\
+    ldhldildjldkldlldmldnldoldpldqlealeblecledleeleflehleilejleklellemlenleo\
+    lepleqlerlesletleulevlewlexleylezlfalfnlgalgblgglghlgilgklgllgmlgnlgqlgr\
+    lgtlgulgzlhalhhlhilhllhmlhnlhplhslhtlhulialibliclidlielifliglihlijliklil\
+    limlinliolipliqlirlislitliulivliwlixliylizljaljeljiljlljpljwljxlkalkblkc\
+    lkdlkelkhlkilkjlkllkmlknlkolkrlkslktlkulkyllallbllclldllellfllgllhllillj\
+    llklllllmllnllpllqllsllullxlmalmblmclmdlmelmflmglmhlmilmjlmklmllmnlmolmp\
+    lmqlmrlmulmvlmwlmxlmylnalnblndlnglnhlnilnjlnllnmlnnlnolnslnulnwlnzloalob\
+    locloelofloglohloilojloklollomlonlooloploqlorloslotloulovlowloxloylozlpa\
+    lpelpnlpolpxlralrclrelrglrilrklrllrmlrnlrolrrlrtlrvlrzlsalsblsdlselshlsi\
+    lsllsmlsnlsolsplsrlsslstlsvlsyltcltglthltiltnltoltsltultzlualublucludlue\
+    luflugluilujluklullumlunluolupluqlurluslutluuluvluwluyluzlvalvilvklvslvu\
+    lwalwelwglwhlwllwmlwolwslwtlwulwwlxmlyalyglynlzhlzllznlzzmaamabmadmaemaf\
+    magmahmaimajmakmalmammanmaqmarmasmatmaumavmawmaxmazmbambbmbcmbdmbembfmbh\
+    mbimbjmbkmblmbmmbnmbombpmbqmbrmbsmbtmbumbvmbwmbxmbymbzmcamcbmccmcdmcemcf\
+    mcgmchmcimcjmckmclmcmmcnmcomcpmcqmcrmcsmctmcumcvmcwmcxmcymczmdamdbmdcmdd\
+    mdemdfmdgmdhmdimdjmdkmdlmdmmdnmdpmdqmdrmdsmdtmdumdvmdwmdxmdymdzmeamebmec\
+    medmeemefmehmeimejmekmelmemmenmeomepmeqmermesmetmeumevmewmeymezmfamfbmfc\
+    mfdmfemffmfgmfhmfimfjmfkmflmfmmfnmfomfpmfqmfrmfsmftmfumfvmfwmfxmfymfzmga\
+    mgbmgcmgdmgemgfmggmghmgimgjmgkmglmgmmgnmgomgpmgqmgrmgsmgtmgumgvmgwmgymgz\
+    mhamhbmhcmhdmhemhfmhgmhimhjmhkmhlmhmmhnmhomhpmhqmhrmhsmhtmhumhwmhxmhymhz\
+    miamibmicmidmiemifmigmihmiimijmikmilmimminmiomipmiqmirmismitmiumiwmixmiy\
+    mizmjbmjcmjdmjemjgmjhmjimjjmjkmjlmjmmjnmjomjpmjqmjrmjsmjtmjumjvmjwmjxmjy\
+    mjzmkamkbmkcmkdmkemkfmkgmkimkjmkkmklmkmmknmkomkpmkqmkrmksmktmkumkvmkwmkx\
+    mkymkzmlamlbmlcmlemlfmlgmlhmlimljmlkmllmlmmlnmlomlpmlqmlrmlsmltmlumlvmlw\
+    mlxmlzmmammbmmcmmdmmemmfmmgmmhmmimmjmmkmmlmmmmmnmmommpmmqmmrmmtmmummvmmw\
+    mmxmmymmzmnamnbmncmndmnemnfmngmnhmnimnjmnkmnlmnmmnnmnpmnqmnrmnsmnumnvmnw\
+    mnxmnymnzmoamocmodmoemogmohmoimojmokmommonmoomopmoqmormosmotmoumovmowmox\
+    moymozmpampbmpcmpdmpempgmphmpimpjmpkmplmpmmpnmpomppmpqmprmpsmptmpumpvmpw\
+    mpxmpympzmqamqbmqcmqemqfmqgmqhmqimqjmqkmqlmqmmqnmqomqpmqqmqrmqsmqtmqumqv\
+    mqwmqxmqymqzmramrbmrcmrdmremrfmrgmrhmrimrjmrkmrlmrmmrnmromrpmrqmrrmrsmrt\
+    mrumrvmrwmrxmrymrzmsamsbmscmsdmsemsfmsgmshmsimsjmskmslmsmmsnmsomspmsqmsr\
+    mssmsumsvmswmsxmsymszmtamtbmtcmtdmtemtfmtgmthmtimtjmtkmtlmtmmtnmtomtpmtq\
+    mtrmtsmttmtumtvmtwmtxmtymuamubmucmudmuemugmuhmuimujmukmulmummuomupmuqmur\
+    musmutmuumuvmuxmuymuzmvamvbmvdmvemvfmvgmvhmvimvkmvlmvnmvomvpmvqmvrmvsmvt\
+    mvumvvmvwmvxmvymvzmwamwbmwcmwemwfmwgmwhmwimwkmwlmwmmwnmwomwpmwqmwrmwsmwt\
+    mwumwvmwwmwzmxamxbmxcmxdmxemxfmxgmxhmximxjmxkmxlmxmmxnmxomxpmxqmxrmxsmxt\
+    mxumxvmxwmxxmxymxzmyamybmycmyemyfmygmyhmyjmykmylmymmyomypmyrmysmyumyvmyw\
+    myxmyymyzmzamzbmzcmzdmzemzgmzhmzimzjmzkmzlmzmmznmzomzpmzqmzrmzsmztmzumzv\
+    mzwmzxmzymzznaanabnacnaenafnagnajnaknalnamnannaonapnaqnarnasnatnaunavnaw\
+    naxnaynaznbanbbnbcnbdnbenbgnbhnbinbjnbknblnbmnbnnbonbpnbqnbrnbsnbtnbunbv\
+    nbwnbyncancbnccncdncencfncgnchncincjncknclncmncnnconcqncrncsnctncuncxncz\
+    ndandbndcnddndendfndgndhndindjndkndlndmndnndondpndqndrndsndtndundvndwndx\
+    ndyndzneanebnecnedneenefnegnehneinejneknemnenneonepneqnernesnetneunevnew\
+    nexneyneznfanfdnflnfrnfungangbngcngdngenggnghngingjngknglngmngnngongpngq\
+    ngrngsngtngungvngwngxngyngznhanhbnhcnhdnhenhfnhgnhhnhinhknhmnhnnhonhpnhq\
+    nhrnhtnhunhvnhwnhxnhynhznianibnidnienifnignihniinijniknilnimninnioniqnir\
+    nisnitniunivniwnixniyniznjanjbnjdnjhnjinjjnjlnjmnjnnjonjrnjsnjtnjunjxnjy\
+    njznkankbnkcnkdnkenkfnkgnkhnkinkjnkknkmnknnkonkpnkqnkrnksnktnkunkvnkwnkx\
+    nkznlanlcnldnlenlgnlinljnlknllnlmnlonlqnlunlvnlwnlxnlynlznmanmbnmcnmdnme\
+    nmfnmgnmhnminmjnmknmlnmmnmnnmonmpnmqnmrnmsnmtnmunmvnmwnmxnmynmznnannbnnc\
+    nndnnennfnngnnhnninnjnnknnlnnmnnnnnonnpnnqnnrnntnnunnvnnwnnynnznoanobnoc\
+    nodnoenofnognohnoinojnoknolnomnonnopnoqnornosnotnounovnownoynoznpanpbnpg\
+    nphnpinplnpnnponpsnpunpxnpynqgnqknqlnqmnqnnqonqqnqtnqynranrbnrcnrenrfnrg\
+    nrinrknrlnrmnrnnrpnrrnrtnrunrxnrznsansbnscnsdnsensfnsgnshnsinsknslnsmnsn\
+    nsonspnsqnsrnssnstnsunsvnswnsxnsynszntdntentgntintjntkntmntontpntrntuntw\
+    ntxntyntznuanucnudnuenufnugnuhnuinujnuknulnumnunnuonupnuqnurnusnutnuunuv\
+    nuwnuxnuynuznvhnvmnvonwanwbnwcnwenwgnwinwmnwonwrnwxnwynxanxdnxenxgnxinxk\
+    nxlnxmnxnnxonxqnxrnxxnyanybnycnydnyenyfnygnyhnyinyjnyknylnymnynnyonypnyq\
+    nyrnysnytnyunyvnywnyxnyynzanzbnzdnzinzknzmnzsnzunzynzzoaaoacoaroavobiobk\
+    oblobmoboobrobtobuocaochociocmocoocuodaodkodtoduofoofsofuogbogcogeoggogo\
+    oguohtohuoiaoinojbojcojgojiojpojsojvojwokaokbokcokdokeokgokhokiokjokkokl\
+    okmoknokookroksokuokvokxokzolaoldoleolkolmoloolroltoluomaombomcomgomiomk\
+    omlomnomoompomromtomuomwomxomyonaonboneongonionjonkonnonoonponronsontonu\
+    onwonxoodoogoonooroosopaopkopmopooptopyoraorcoreorgorhoriormornoroorrors\
+    ortoruorvorworxoryorzosaoscosiosnosoospossostosuosxotaotbotdoteotiotkotl\
+    otmotnotqotrotsottotuotwotxotyotzouaouboueouioumovdowiowloyboydoymoyyozm\
+    pabpacpadpaepafpagpahpaipakpalpampanpaopappaqparpaspaupavpawpaxpaypazpbb\
+    pbcpbepbfpbgpbhpbipblpbmpbnpbopbppbrpbspbtpbupbvpbypcapcbpccpcdpcepcfpcg\
+    pchpcipcjpckpclpcmpcnpcppcwpdapdcpdipdnpdopdtpdupeapebpedpeepefpegpehpei\
+    pejpekpelpempeopeppeqpespevpexpeypezpfapfepflpgapgdpggpgipgkpglpgnpgspgu\
+    pgzphaphdphgphhphkphlphmphnphophqphrphtphuphvphwpiapibpicpidpiepifpigpih\
+    piipijpilpimpinpiopippirpispitpiupivpiwpixpiypizpjtpkapkbpkcpkgpkhpknpko\
+    pkppkrpkspktpkuplaplbplcpldpleplgplhplipljplkpllplnploplqplrplspltpluplv\
+    plwplyplzpmapmbpmdpmepmfpmhpmipmjpmkpmlpmmpmnpmopmqpmrpmspmtpmwpmxpmypmz\
+    pnapnbpncpndpnepngpnhpnipnjpnkpnlpnmpnnpnopnppnqpnrpnspntpnupnvpnwpnxpny\
+    pnzpocpoepofpogpohpoipokpolpomponpoopoppoqporpospotpovpowpoxpoyppeppippk\
+    pplppmppnppopppppqppspptppupqapqmprcprdpreprfprgprhpriprkprlprmprnproprp\
+    prqprrprsprtpruprwprxprzpsapscpsdpsepsgpshpsipslpsmpsnpsopsppsqpsrpsspst\
+    psupswpsyptapthptiptnptoptpptqptrpttptuptvptwptypuapubpucpudpuepufpugpui\
+    pujpumpuopuppuqpurpusputpuupuwpuxpuypwapwbpwgpwipwmpwnpwopwrpwwpxmpyepym\
+    pynpyspyupyxpyypznquaqubqucqudquequfqugquhquiqukqulqumqunqupquqqurqusquv\
+    quwquxquyquzqvaqvcqveqvhqviqvjqvlqvmqvnqvoqvpqvsqvwqvyqvzqwaqwcqwhqwmqws\
+    qwtqxaqxcqxhqxlqxnqxoqxpqxqqxrqxsqxtqxuqxwqyaqypraarabracradrafragrahrai\
+    rajrakralramranraorapraqrarrasratrauravrawraxrayrazrbbrbkrblrbprcfrdbrea\
+    rebreeregreirejrelremrenrerresretreyrgargergkrgnrgrrgsrgurhgrhpriarifril\
+    rimrinrirritriurjgrjirjsrkarkbrkhrkirkmrktrkwrmarmbrmcrmdrmermfrmgrmhrmi\
+    rmkrmlrmmrmnrmormprmqrmsrmtrmurmvrmwrmxrmyrmzrndrngrnlrnnrnprnrrnwrobroc\
+    rodroerofrogrohrolromronrooroprorrourowrpnrptrrirrorrtrsbrslrsmrtcrthrtm\
+    rtsrtwrubrucruerufrugruhruirukrunruorupruqrusrutruuruyruzrwarwkrwlrwmrwo\
+    rwrrxdrxwrynrysryurzhsaasabsacsadsaesafsagsahsajsaksamsansaosaqsarsassat\
+    sausavsawsaxsaysazsbasbbsbcsbdsbesbfsbgsbhsbisbjsbksblsbmsbnsbosbpsbqsbr\
+    sbssbtsbusbvsbwsbxsbysbzscbscescfscgschsciscksclscnscoscpscqscssctscuscv\
+    scwscxsdasdbsdcsdesdfsdgsdhsdjsdksdlsdnsdosdpsdqsdrsdssdtsdusdxsdzseaseb\
+    secsedseesefsegsehseisejsekselsenseosepseqsersessetseusevsewseysezsfbsfe\
+    sfmsfssfwsgasgbsgcsgdsgesggsghsgisgjsgksgmsgpsgrsgssgtsgusgwsgxsgysgzsha\
+    shbshcshdsheshgshhshishjshkshlshmshnshoshpshqshrshsshtshushvshwshxshyshz\
+    siasibsidsiesifsigsihsiisijsiksilsimsinsipsiqsirsissiusivsiwsixsiysizsja\
+    sjbsjdsjesjgsjksjlsjmsjnsjosjpsjrsjssjtsjusjwskaskbskcskdskeskfskgskhski\
+    skjskmsknskoskpskqskrskssktskuskvskwskxskyskzslcsldsleslfslgslhslisljslk\
+    sllslmslnslpslqslrslssltsluslvslwslxslyslzsmasmbsmcsmdsmesmfsmgsmhsmjsmk\
+    smlsmmsmnsmosmpsmqsmrsmssmtsmusmvsmwsmxsmysmzsnasnbsncsndsnesnfsngsnisnj\
+    snksnlsnmsnnsnosnpsnqsnrsnssnusnvsnwsnxsnysnzsoasobsocsodsoesogsohsoisoj\
+    soksolsomsoosopsoqsorsossotsousovsowsoxsoysozspaspbspcspdspespgspispkspl\
+    spmspnsposppspqsprspssptspuspvspxspysqasqhsqisqksqmsqnsqosqqsqrsqssqtsqu\
+    sqxsrasrbsrcsrdsresrfsrgsrhsrisrksrlsrmsrnsrosrpsrqsrrsrssrtsrusrvsrwsrx\
+    srysrzssbsscssdssessfssgsshssissjssksslssmssnssosspssqssrssssstssussvssw\
+    ssxssysszstastbstdstestfstgsthstistjstkstlstmstnstostpstqstrstssttstustv\
+    stwstysuasubsucsuesugsuisujsuksunsuosuqsursussutsuvsuwsuxsuysuzsvasvbsvc\
+    svesvksvmsvssvxswaswbswcsweswfswgswhswiswjswkswlswmswnswoswpswqswrswsswt\
+    swuswvswwswxswysxbsxcsxesxgsxksxlsxmsxnsxosxrsxssxusxwsyasybsycsyisyksyl\
+    symsynsyosyrsyssywsyxsyyszaszbszcszdszeszgszlsznszpszsszvszwszytaatabtac\
+    tadtaetaftagtahtajtaktaltamtantaotaptaqtartastattautavtawtaxtaytaztbatbc\
+    tbdtbetbftbgtbhtbitbjtbktbltbmtbntbotbptbrtbstbttbutbvtbwtbxtbytbztcatcb\
+    tcctcdtcetcftcgtchtcitcktcltcmtcntcotcptcqtcstcttcutcwtcxtcytcztdatdbtdc\
+    tddtdetdftdgtdhtditdjtdktdltdmtdntdotdqtdrtdstdttdvtdxtdyteatebtectedtee\
+    teftegtehteitekteltemtenteotepteqtertestetteutevtewtexteyteztfitfntfotfr\
+    tfttgatgbtgctgdtgetgftghtgitgjtgktgltgntgotgptgqtgrtgstgttgutgvtgwtgxtgy\
+    tgzthathdthethfthhthithkthlthmthnthpthqthrthsthtthuthvthythztiatictiftig\
+    tihtiitijtiktiltimtintiotiptiqtirtistittiutivtiwtixtiytiztjatjgtjitjjtjl\
+    tjmtjntjotjptjstjutjwtkatkbtkdtketkftkgtkltkmtkntkptkqtkrtkstkttkutkvtkw\
+    tkxtkztlatlbtlctldtlftlgtlhtlitljtlktlltlmtlntlotlptlqtlrtlstlttlutlvtlx\
+    tlytmatmbtmctmdtmetmftmgtmhtmitmjtmktmltmmtmntmotmqtmrtmstmttmutmvtmwtmy\
+    tmztnatnbtnctndtngtnhtnitnktnltnmtnntnotnptnqtnrtnstnttnutnvtnwtnxtnytnz\
+    tobtoctodtoftogtohtoitojtoltomtontootoptoqtortostoutovtowtoxtoytoztpatpc\
+    tpetpftpgtpitpjtpktpltpmtpntpotpptpqtprtpttputpvtpwtpxtpytpztqbtqltqmtqn\
+    tqotqptqqtqrtqttqutqwtratrbtrctrdtretrftrgtrhtritrjtrltrmtrntrotrptrqtrr\
+    trstrttrutrvtrwtrxtrytrztsatsbtsctsdtsetsgtshtsitsjtsktsltsmtsntsotsptsq\
+    tsrtsststtsutsvtswtsxtsytszttattbttcttdttettfttgtthttittjttkttlttmttntto\
+    ttpttqttrttstttttuttvttwttyttztuatubtuctudtuetuftugtuhtuitujtuktultumtun\
+    tuotuqturtustuutuvtuxtuytuztvatvdtvetvktvltvmtvntvotvstvttvutvwtvxtvytwa\
+    twbtwctwdtwetwftwgtwhtwitwltwmtwntwotwptwqtwrtwttwutwwtwxtwytxatxbtxctxe\
+    txgtxhtxitxjtxmtxntxotxqtxrtxstxttxutxxtxytyatyetyhtyityjtyltyntyptyrtys\
+    tyttyutyvtyxtyytyztzatzhtzjtzltzmtzntzotzxuamuanuarubaubiublubrubuubyuda\
+    udeudgudiudjudludmuduuesufiugaugbugeugnugougyuhauhnuiguisuivujiukaukgukh\
+    ukiukkuklukpukqukruksukuukvukwukyulaulbulculeulfuliulkullulmulnuluulwuma\
+    umbumcumdumgumiummumnumoumpumrumsumuunaunduneunguniunkunmunnunrunuunxunz\
+    upiupvuraurburcurdureurfurgurhuriurkurlurmurnurourpurrurturuurvurwurxury\
+    urzusaushusiuskuspussusuutauteuthutputrutuuumuunuuruuuuveuvhuvluwauyauzb\
+    uznuzsvaavaevafvagvahvaivajvalvamvanvaovapvarvasvauvavvayvbbvbkvecvedvel\
+    vemvenveovepvervgrvgtvicvidvievifvigvilvinvisvitvivvkavkjvkkvklvkmvknvko\
+    vkpvktvkuvkzvlpvlsvmavmbvmcvmdvmevmfvmgvmhvmivmjvmkvmlvmmvmpvmqvmrvmsvmu\
+    vmvvmwvmxvmyvmzvnkvnmvnpvolvorvotvravrovrsvrtvsivslvsvvtovumvunvutvwawaa\
+    wabwacwadwaewafwagwahwaiwajwalwamwanwaowapwaqwarwaswatwauwavwawwaxwaywaz\
+    wbawbbwbewbfwbhwbiwbjwbkwblwbmwbpwbqwbrwbswbtwbvwbwwcawciwddwdgwdjwdkwdu\
+    wdyweawecwedwegwehweiwemweowepwerweswetweuwewwfgwgawgbwggwgiwgowguwgywha\
+    whgwhkwhuwibwicwiewifwigwihwiiwijwikwilwimwinwirwiuwivwiywjawjiwkawkbwkd\
+    wklwkrwkuwkwwkywlawlcwlewlgwlhwliwlkwllwlmwlnwlowlrwlswluwlvwlwwlxwlywma\
+    wmbwmcwmdwmewmgwmhwmiwmmwmnwmowmswmtwmwwmxwnbwncwndwnewngwniwnkwnmwnnwno\
+    wnpwnuwnwwnywoawobwocwodwoewofwogwoiwokwolwomwonwooworwoswowwoywpcwrbwrd\
+    wrgwrhwriwrkwrlwrmwrnwrowrpwrrwrswruwrvwrwwrxwrywrzwsawsgwsiwskwsrwsswsu\
+    wsvwtfwthwtiwtkwtmwtwwuawubwudwuhwulwumwunwurwutwuuwuvwuxwuywwawwbwwowwr\
+    wwwwxawxwwyawybwyiwymwyrwyyxaaxabxacxadxaexagxaixajxakxalxamxanxaoxapxaq\
+    xarxasxatxauxavxawxayxbbxbcxbdxbexbgxbixbjxbmxbnxboxbpxbrxbwxbyxcbxccxce\
+    xcgxchxclxcmxcnxcoxcrxctxcuxcvxcwxcyxdaxdcxdkxdmxdoxdyxebxedxegxelxemxep\
+    xerxesxetxeuxfaxgaxgbxgdxgfxggxgixglxgmxgrxguxgwxhaxhcxhdxhexhoxhrxhtxhu\
+    xhvxibxiixilxinxirxisxivxiyxjbxjtxkaxkbxkcxkdxkexkfxkgxkixkjxkkxklxknxko\
+    xkpxkqxkrxksxktxkuxkvxkwxkxxkyxkzxlaxlbxlcxldxlexlgxlixlnxloxlpxlsxluxly\
+    xmaxmbxmcxmdxmexmfxmgxmhxmjxmkxmlxmmxmnxmoxmpxmqxmrxmsxmtxmuxmvxmwxmxxmy\
+    xmzxnaxnbxngxnhxnixnjxnkxnmxnnxnoxnqxnrxnsxntxnuxnyxnzxocxodxogxoixokxom\
+    xonxooxopxorxowxpaxpbxpcxpdxpexpfxpgxphxpixpjxpkxplxpmxpnxpoxppxpqxprxps\
+    xptxpuxpvxpwxpxxpyxpzxqaxqtxraxrbxrdxrexrgxrixrmxrnxrrxrtxruxrwxsaxsbxsc\
+    xsdxsexshxsixsjxslxsmxsnxsoxspxsqxsrxssxsuxsvxsyxtaxtbxtcxtdxtextgxthxti\
+    xtjxtlxtmxtnxtoxtpxtqxtrxtsxttxtuxtvxtwxtyxuaxubxudxugxujxulxumxunxuoxup\
+    xurxutxuuxvexvixvnxvoxvsxwaxwcxwdxwexwgxwjxwkxwlxwoxwrxwtxwwxxbxxkxxmxxr\
+    xxtxyaxybxyjxykxylxytxyyxzhxzmxzpyaayabyacyadyaeyafyagyahyaiyajyakyalyam\
+    yanyaoyapyaqyaryasyatyauyavyawyaxyayyazybaybbybeybhybiybjybkyblybmybnybo\
+    ybxybyychyclycnycpydayddydeydgydkyeayecyeeyeiyejyelyeryesyetyeuyevyeyyga\
+    ygiyglygmygpygrygsyguygwyhayhdyhlyhsyiayidyifyigyihyiiyijyikyilyimyinyip\
+    yiqyiryisyityiuyivyixyizykaykgykiykkyklykmyknykoykryktykuykyylaylbyleylg\
+    yliyllylmylnyloylryluylyymbymcymdymeymgymhymiymkymlymmymnymoympymqymryms\
+    ymxymzynayndyneyngynkynlynnynoynqynsynuyobyogyoiyokyolyomyonyoryotyoxyoy\
+    ypaypbypgyphypmypnypoyppypzyrayrbyreyrkyrlyrmyrnyroyrsyrwyryyscysdysgysl\
+    ysmysnysoyspysryssysyytaytlytpytwytyyuayubyucyudyueyufyugyuiyujyukyulyum\
+    yunyupyuqyuryutyuwyuxyuyyuzyvayvtywaywgywlywnywqywrywtywuywwyxayxgyxlyxm\
+    yxuyxyyyryyuyyzyzgyzkzaazabzaczadzaezafzagzahzaizajzakzalzamzaozapzaqzar\
+    zaszatzauzavzawzaxzayzazzbazbczbezblzbtzbuzbwzcazchzdjzeazegzehzenzgazgb\
+    zghzgmzgnzgrzhazhbzhdzhizhnzhozhwziazibzikzilzimzinziwzizzkazkbzkdzkgzkh\
+    zkkzknzkozkpzkrzktzkuzkvzkzzlazljzlmzlnzlqzmazmbzmczmdzmezmfzmgzmhzmizmj\
+    zmkzmlzmmzmnzmozmpzmqzmrzmszmtzmuzmvzmwzmxzmyzmzznaznezngznkznszoczohzom\
+    zoozoqzorzoszpazpbzpczpdzpezpfzpgzphzpizpjzpkzplzpmzpnzpozppzpqzprzpszpt\
+    zpuzpvzpwzpxzpyzpzzqezrazrgzrnzrozrpzrszsazskzslzsmzsrzsuzteztgztlztmztn\
+    ztpztqztszttztuztxztyzuazuhzulzumzunzuyzwazxxzybzygzyjzynzypzzazzj\
+";
+
+/// Two-letter, ISO 639-2 and language name → ISO 639-3 code.
+pub(crate) static ISO3_MAP: &[(&str, &str)] = &[
+    ("'are'are", "alu"),
+    ("'auhelawa", "kud"),
+    ("a'ou", "aou"),
+    ("a-pucikwar", "apq"),
+    ("aa", "aar"),
+    ("aar", "aar"),
+    ("aari", "aiw"),
+    ("aasáx", "aas"),
+    ("ab", "abk"),
+    ("abadi", "kbt"),
+    ("abaga", "abg"),
+    ("abai sungai", "abf"),
+    ("abanyom", "abm"),
+    ("abar", "mij"),
+    ("abau", "aau"),
+    ("abaza", "abq"),
+    ("abellen ayta", "abp"),
+    ("abidji", "abi"),
+    ("abinomn", "bsa"),
+    ("abipon", "axb"),
+    ("abishira", "ash"),
+    ("abk", "abk"),
+    ("abkhazian", "abk"),
+    ("abom", "aob"),
+    ("abon", "abo"),
+    ("abron", "abr"),
+    ("abu' arapesh", "aah"),
+    ("abua", "abn"),
+    ("abui", "abz"),
+    ("abun", "kgr"),
+    ("abure", "abu"),
+    ("abureni", "mgj"),
+    ("acatepec me'phaa", "tpx"),
+    ("ace", "ace"),
+    ("ach", "ach"),
+    ("achagua", "aca"),
+    ("achang", "acn"),
+    ("ache", "yif"),
+    ("acheron", "acz"),
+    ("achi", "acr"),
+    ("achinese", "ace"),
+    ("achterhoeks", "act"),
+    ("achuar-shiwiar", "acu"),
+    ("achumawi", "acv"),
+    ("aché", "guq"),
+    ("acm", "ara"),
+    ("acoli", "ach"),
+    ("acroá", "acs"),
+    ("ada", "ada"),
+    ("adai", "xad"),
+    ("adamawa fulfulde", "fub"),
+    ("adamorobe sign language", "ads"),
+    ("adang", "adn"),
+    ("adangbe", "adq"),
+    ("adangme", "ada"),
+    ("adara", "kad"),
+    ("adasen", "tiu"),
+    ("adele", "ade"),
+    ("adhola", "adh"),
+    ("adilabad gondi", "wsg"),
+    ("adioukrou", "adj"),
+    ("adithinngithigh", "dth"),
+    ("adivasi oriya", "ort"),
+    ("adiwasi garasia", "gas"),
+    ("adnyamathanha", "adt"),
+    ("adonara", "adr"),
+    ("aduge", "adu"),
+    ("ady", "ady"),
+    ("adyghe", "ady"),
+    ("adzera", "adz"),
+    ("ae", "ave"),
+    ("aeka", "aez"),
+    ("aekyom", "awi"),
+    ("aequian", "xae"),
+    ("af", "afr"),
+    ("afade", "aal"),
+    ("afar", "aar"),
+    ("afghan sign language", "afg"),
+    ("afh", "afh"),
+    ("afitti", "aft"),
+    ("afr", "afr"),
+    ("afrihili", "afh"),
+    ("afrikaans", "afr"),
+    ("afrikáans", "afr"),
+    ("afro-seminole creole", "afs"),
+    ("agarabi", "agd"),
+    ("agariya", "agi"),
+    ("agatu", "agc"),
+    ("agavotaguerra", "avo"),
+    ("aghem", "agq"),
+    ("aghu", "ahh"),
+    ("aghu-tharnggala", "gtu"),
+    ("aghul", "agx"),
+    ("aghwan", "xag"),
+    ("agob", "kit"),
+    ("agoi", "ibm"),
+    ("aguacateco", "agu"),
+    ("aguano", "aga"),
+    ("aguaruna", "agr"),
+    ("aguna", "aug"),
+    ("agusan manobo", "msm"),
+    ("agutaynen", "agn"),
+    ("agwagwune", "yay"),
+    ("ahanta", "aha"),
+    ("aheri gondi", "esg"),
+    ("aheu", "thm"),
+    ("ahirani", "ahr"),
+    ("ahom", "aho"),
+    ("ahtena", "aht"),
+    ("ahwai", "nfd"),
+    ("ai-cham", "aih"),
+    ("aighon", "aix"),
+    ("aikanã", "tba"),
+    ("aiklep", "mwg"),
+    ("aimaq", "aiq"),
+    ("aimele", "ail"),
+    ("aimol", "aim"),
+    ("ain", "ain"),
+    ("ainbai", "aic"),
+    ("ainu (china)", "aib"),
+    ("ainu (japan)", "ain"),
+    ("aiome", "aki"),
+    ("airoran", "air"),
+    ("aiton", "aio"),
+    ("aja (benin)", "ajg"),
+    ("aja (south sudan)", "aja"),
+    ("ajawa", "ajw"),
+    ("ajië", "aji"),
+    ("ajumbu", "muc"),
+    ("ajyíninka apurucayali", "cpc"),
+    ("ak", "aka"),
+    ("aka", "aka"),
+    ("aka-bea", "abj"),
+    ("aka-bo", "akm"),
+    ("aka-cari", "aci"),
+    ("aka-jeru", "akj"),
+    ("aka-kede", "akx"),
+    ("aka-kol", "aky"),
+    ("aka-kora", "ack"),
+    ("akan", "aka"),
+    ("akar-bale", "acl"),
+    ("akaselem", "aks"),
+    ("akawaio", "ake"),
+    ("akebu", "keu"),
+    ("akei", "tsr"),
+    ("akeu", "aeu"),
+    ("akha", "ahk"),
+    ("akhvakh", "akv"),
+    ("akk", "akk"),
+    ("akkadian", "akk"),
+    ("akkala sami", "sia"),
+    ("aklanon", "akl"),
+    ("akolet", "akt"),
+    ("akoose", "bss"),
+    ("akoye", "miw"),
+    ("akpa", "akf"),
+    ("akpes", "ibe"),
+    ("akrukay", "afi"),
+    ("akukem", "spm"),
+    ("akuku", "ayk"),
+    ("akum", "aku"),
+    ("akuntsu", "aqz"),
+    ("akurio", "ako"),
+    ("akwa", "akw"),
+    ("akyaung ari naga", "nqy"),
+    ("al-sayyid bedouin sign language", "syy"),
+    ("alaba-k’abeena", "alw"),
+    ("alabama", "akz"),
+    ("alabat island agta", "dul"),
+    ("alacatlatzala mixtec", "mim"),
+    ("alago", "ala"),
+    ("alagwa", "wbj"),
+    ("alak", "alk"),
+    ("alamblak", "amp"),
+    ("alangan", "alj"),
+    ("alanic", "xln"),
+    ("alapmunte", "apv"),
+    ("alawa", "alh"),
+    ("alb", "sqi"),
+    ("albanais", "sqi"),
+    ("albanian", "sqi"),
+    ("albanian sign language", "sqk"),
+    ("albanés", "sqi"),
+    ("alcozauca mixtec", "xta"),
+    ("ale", "ale"),
+    ("alege", "alf"),
+    ("alekano", "gah"),
+    ("alemán", "deu"),
+    ("aleut", "ale"),
+    ("algerian arabic", "arq"),
+    ("algerian saharan arabic", "aao"),
+    ("algerian sign language", "asp"),
+    ("algonquin", "alq"),
+    ("alladian", "ald"),
+    ("allar", "all"),
+    ("allemand", "deu"),
+    ("alngith", "aid"),
+    ("alo phola", "ypo"),
+    ("alor", "aol"),
+    ("aloápam zapotec", "zaq"),
+    ("alsea", "aes"),
+    ("alt", "alt"),
+    ("alu kurumba", "xua"),
+    ("alugu", "aub"),
+    ("alumu-tesu", "aab"),
+    ("alune", "alp"),
+    ("aluo", "yna"),
+    ("alur", "alz"),
+    ("alutor", "alr"),
+    ("alviri-vidari", "avd"),
+    ("alyawarr", "aly"),
+    ("am", "amh"),
+    ("ama (papua new guinea)", "amm"),
+    ("ama (sudan)", "nyi"),
+    ("amahai", "amq"),
+    ("amahuaca", "amc"),
+    ("amaimon", "ali"),
+    ("amal", "aad"),
+    ("amami koniya sign language", "jks"),
+    ("amanab", "amn"),
+    ("amanayé", "ama"),
+    ("amara", "aie"),
+    ("amarakaeri", "amr"),
+    ("amarasi", "aaz"),
+    ("amatlán zapotec", "zpo"),
+    ("amba (solomon islands)", "utp"),
+    ("amba (uganda)", "rwm"),
+    ("ambai", "amk"),
+    ("ambakich", "aew"),
+    ("ambala ayta", "abc"),
+    ("ambelau", "amv"),
+    ("ambele", "ael"),
+    ("amblong", "alm"),
+    ("ambo", "amb"),
+    ("ambo-pasco quechua", "qva"),
+    ("ambonese malay", "abs"),
+    ("ambrak", "aag"),
+    ("ambul", "apo"),
+    ("ambulas", "abt"),
+    ("amdang", "amj"),
+    ("amdo tibetan", "adx"),
+    ("amele", "aey"),
+    ("american sign language", "ase"),
+    ("amganad ifugao", "ifa"),
+    ("amh", "amh"),
+    ("amharic", "amh"),
+    ("amharique", "amh"),
+    ("amhárico", "amh"),
+    ("amis", "ami"),
+    ("amol", "alx"),
+    ("amoltepec mixtec", "mbz"),
+    ("ampanang", "apg"),
+    ("ampari dogon", "aqd"),
+    ("amri karbi", "ajz"),
+    ("amto", "amt"),
+    ("amundava", "adw"),
+    ("amurdak", "amg"),
+    ("an", "arg"),
+    ("ana tinga dogon", "dti"),
+    ("anaang", "anw"),
+    ("anakalangu", "akg"),
+    ("anal", "anm"),
+    ("anam", "pda"),
+    ("anambé", "aan"),
+    ("anamgura", "imi"),
+    ("anasi", "bpo"),
+    ("ancient greek (to 1453)", "grc"),
+    ("ancient hebrew", "hbo"),
+    ("ancient macedonian", "xmk"),
+    ("ancient north arabian", "xna"),
+    ("ancient zapotec", "xzp"),
+    ("andaandi", "dgl"),
+    ("andai", "afd"),
+    ("andajin", "ajn"),
+    ("andalusian arabic", "xaa"),
+    ("andaman creole hindi", "hca"),
+    ("andaqui", "ana"),
+    ("andarum", "aod"),
+    ("andegerebinha", "adg"),
+    ("andh", "anr"),
+    ("andi", "ani"),
+    ("andio", "bzb"),
+    ("andoa", "anb"),
+    ("andoque", "ano"),
+    ("andra-hus", "anx"),
+    ("aneityum", "aty"),
+    ("anem", "anz"),
+    ("aneme wake", "aby"),
+    ("anfillo", "myo"),
+    ("ang", "ang"),
+    ("angaataha", "agm"),
+    ("angaité", "aqt"),
+    ("angal", "age"),
+    ("angal enen", "aoe"),
+    ("angal heneng", "akh"),
+    ("angami naga", "njm"),
+    ("angguruk yali", "yli"),
+    ("angika", "anp"),
+    ("angkamuthi", "avm"),
+    ("anglais", "eng"),
+    ("anglo-norman", "xno"),
+    ("angloromani", "rme"),
+    ("angolar", "aoa"),
+    ("angor", "agg"),
+    ("angoram", "aog"),
+    ("angosturas tunebo", "tnd"),
+    ("anguthimri", "awg"),
+    ("ani phowa", "ypn"),
+    ("anii", "blo"),
+    ("animere", "anf"),
+    ("anindilyakwa", "aoi"),
+    ("aninka", "aqk"),
+    ("anjam", "boj"),
+    ("ankave", "aak"),
+    ("anmatyerre", "amx"),
+    ("anong", "nun"),
+    ("anor", "anj"),
+    ("anp", "anp"),
+    ("anserma", "ans"),
+    ("ansus", "and"),
+    ("antakarinya", "ant"),
+    ("antankarana malagasy", "xmv"),
+    ("antigua and barbuda creole english", "aig"),
+    ("anu-hkongso chin", "anl"),
+    ("anuak", "anu"),
+    ("anufo", "cko"),
+    ("anuki", "aui"),
+    ("anus", "auq"),
+    ("anuta", "aud"),
+    ("anyin", "any"),
+    ("anyin morofo", "mtb"),
+    ("ao naga", "njo"),
+    ("aoheng", "pni"),
+    ("aore", "aor"),
+    ("ap ma", "kbx"),
+    ("apalachee", "xap"),
+    ("apalaí", "apy"),
+    ("apali", "ena"),
+    ("apasco-apoala mixtec", "mip"),
+    ("apatani", "apt"),
+    ("apc", "ara"),
+    ("apiaká", "api"),
+    ("apinayé", "apn"),
+    ("apma", "app"),
+    ("aproumu aizi", "ahp"),
+    ("apurinã", "apu"),
+    ("aputai", "apx"),
+    ("aquitanian", "xaq"),
+    ("ar", "ara"),
+    ("ara", "ara"),
+    ("arabana", "ard"),
+    ("arabe", "ara"),
+    ("arabela", "arl"),
+    ("arabic", "ara"),
+    ("aragonese", "arg"),
+    ("araki", "akr"),
+    ("arakwal", "rkw"),
+    ("aralle-tabulahan", "atq"),
+    ("arammba", "stk"),
+    ("aranadan", "aaf"),
+    ("aranama-tamique", "xrt"),
+    ("arandai", "jbj"),
+    ("araona", "aro"),
+    ("arapaho", "arp"),
+    ("arapaso", "arj"),
+    ("ararandewára", "xaj"),
+    ("arawak", "arw"),
+    ("araweté", "awt"),
+    ("arawum", "awm"),
+    ("arb", "ara"),
+    ("arbore", "arv"),
+    ("arbëreshë albanian", "aae"),
+    ("arc", "arc"),
+    ("archi", "aqc"),
+    ("ardhamāgadhī prākrit", "pka"),
+    ("areba", "aea"),
+    ("arem", "aem"),
+    ("arequipa-la unión quechua", "qxu"),
+    ("arg", "arg"),
+    ("argentine sign language", "aed"),
+    ("argobba", "agj"),
+    ("arguni", "agf"),
+    ("arhuaco", "arh"),
+    ("arhâ", "aqr"),
+    ("arhö", "aok"),
+    ("aribwatsa", "laz"),
+    ("aribwaung", "ylu"),
+    ("arifama-miniafia", "aai"),
+    ("arigidi", "aqg"),
+    ("arikapú", "ark"),
+    ("arikara", "ari"),
+    ("arikem", "ait"),
+    ("arin", "xrn"),
+    ("aringa", "luc"),
+    ("arm", "hye"),
+    ("armazic", "xrm"),
+    ("armenian", "hye"),
+    ("armenian sign language", "aen"),
+    ("armenio", "hye"),
+    ("arménien", "hye"),
+    ("arn", "arn"),
+    ("arop-lokep", "apr"),
+    ("arop-sissano", "aps"),
+    ("arosi", "aia"),
+    ("arp", "arp"),
+    ("arpitan", "frp"),
+    ("arritinngithigh", "rrt"),
+    ("arta", "atz"),
+    ("aruamu", "msy"),
+    ("aruek", "aur"),
+    ("aruop", "lsr"),
+    ("arutani", "atx"),
+    ("aruá (amazonas state)", "aru"),
+    ("aruá (rodonia state)", "arx"),
+    ("arvanitika albanian", "aat"),
+    ("arw", "arw"),
+    ("arz", "ara"),
+    ("as", "asm"),
+    ("asaro'o", "mtv"),
+    ("ashe", "ahs"),
+    ("ashkun", "ask"),
+    ("asho chin", "csh"),
+    ("ashtiani", "atn"),
+    ("asháninka", "cni"),
+    ("ashéninka pajonal", "cjo"),
+    ("ashéninka perené", "prq"),
+    ("asilulu", "asl"),
+    ("askopan", "eiv"),
+    ("asm", "asm"),
+    ("asoa", "asv"),
+    ("assamese", "asm"),
+    ("assan", "xss"),
+    ("assangori", "sjg"),
+    ("assiniboine", "asb"),
+    ("assyrian neo-aramaic", "aii"),
+    ("ast", "ast"),
+    ("asturian", "ast"),
+    ("asu (nigeria)", "aum"),
+    ("asu (tanzania)", "asa"),
+    ("asue awyu", "psa"),
+    ("asumboa", "aua"),
+    ("asunción mixtepec zapotec", "zoo"),
+    ("asuri", "asr"),
+    ("ata manobo", "atd"),
+    ("atakapa", "aqp"),
+    ("atampaya", "amz"),
+    ("atatláhuca mixtec", "mib"),
+    ("atauran", "adb"),
+    ("atayal", "tay"),
+    ("atemble", "ate"),
+    ("athpariya", "aph"),
+    ("atikamekw", "atj"),
+    ("atohwaim", "aqm"),
+    ("atong (cameroon)", "ato"),
+    ("atong (india)", "aot"),
+    ("atorada", "aox"),
+    ("atsahuaca", "atc"),
+    ("atsam", "cch"),
+    ("atsugewi", "atw"),
+    ("attapady kurumba", "pkr"),
+    ("attié", "ati"),
+    ("atzingo matlatzinca", "ocu"),
+    ("aulua", "aul"),
+    ("aurá", "aux"),
+    ("aushi", "auh"),
+    ("aushiri", "avs"),
+    ("auslan", "asf"),
+    ("austral", "aut"),
+    ("australian aborigines sign language", "asw"),
+    ("austrian sign language", "asq"),
+    ("auwe", "smf"),
+    ("auye", "auu"),
+    ("auyokawa", "auo"),
+    ("av", "ava"),
+    ("ava", "ava"),
+    ("avaric", "ava"),
+    ("avatime", "avn"),
+    ("avau", "avb"),
+    ("ave", "ave"),
+    ("avestan", "ave"),
+    ("avikam", "avi"),
+    ("avokaya", "avu"),
+    ("avá-canoeiro", "avv"),
+    ("awa", "awa"),
+    ("awa (china)", "vwa"),
+    ("awa (papua new guinea)", "awb"),
+    ("awa-cuaiquer", "kwi"),
+    ("awabakal", "awk"),
+    ("awad bing", "bcu"),
+    ("awadhi", "awa"),
+    ("awak", "awo"),
+    ("awar", "aya"),
+    ("awara", "awx"),
+    ("awbono", "awh"),
+    ("aweer", "bob"),
+    ("awera", "awr"),
+    ("awetí", "awe"),
+    ("awing", "azo"),
+    ("awiyaana", "auy"),
+    ("awjilah", "auj"),
+    ("awngi", "awn"),
+    ("awngthim", "gwm"),
+    ("awtuw", "kmn"),
+    ("awun", "aww"),
+    ("awutu", "afu"),
+    ("awyi", "auw"),
+    ("axamb", "ahb"),
+    ("axi yi", "yix"),
+    ("ay", "aym"),
+    ("ayabadhu", "ayd"),
+    ("ayacucho quechua", "quy"),
+    ("ayautla mazatec", "vmy"),
+    ("ayere", "aye"),
+    ("ayerrerenge", "axe"),
+    ("ayi (papua new guinea)", "ayq"),
+    ("ayiwo", "nfl"),
+    ("ayizi", "yyz"),
+    ("ayizo gbe", "ayb"),
+    ("aym", "aym"),
+    ("aymara", "aym"),
+    ("ayoquesco zapotec", "zaf"),
+    ("ayoreo", "ayo"),
+    ("ayutla mixtec", "miy"),
+    ("az", "aze"),
+    ("aze", "aze"),
+    ("aze_cyrl", "aze"),
+    ("azerbaijani", "aze"),
+    ("azeri", "aze"),
+    ("azerí", "aze"),
+    ("azha", "aza"),
+    ("azhe", "yiz"),
+    ("azoyú me'phaa", "tpc"),
+    ("azéri", "aze"),
+    ("azərbaycan", "aze"),
+    ("ba", "bak"),
+    ("baan", "bvj"),
+    ("baangi", "bqx"),
+    ("baatonum", "bba"),
+    ("baba", "bbw"),
+    ("baba malay", "mbf"),
+    ("babango", "bbm"),
+    ("babanki", "bbk"),
+    ("babatana", "baa"),
+    ("babine", "bcr"),
+    ("babuza", "bzg"),
+    ("bacama", "bcy"),
+    ("bacanese malay", "btj"),
+    ("bactrian", "xbc"),
+    ("bada (indonesia)", "bhz"),
+    ("bada (nigeria)", "bau"),
+    ("badaga", "bfq"),
+    ("bade", "bde"),
+    ("badeshi", "bdz"),
+    ("badimaya", "bia"),
+    ("badjiri", "jbi"),
+    ("badui", "bac"),
+    ("badyara", "pbp"),
+    ("baeggu", "bvd"),
+    ("baelelea", "bvc"),
+    ("baetora", "btr"),
+    ("bafanji", "bfj"),
+    ("bafaw-balong", "bwt"),
+    ("bafia", "ksf"),
+    ("bafut", "bfd"),
+    ("baga kaloum", "bqf"),
+    ("baga koga", "bgo"),
+    ("baga manduri", "bmd"),
+    ("baga pokur", "bcg"),
+    ("baga sitemu", "bsp"),
+    ("baga sobané", "bsv"),
+    ("bagheli", "bfy"),
+    ("bagirmi", "bmi"),
+    ("bagirmi fulfulde", "fui"),
+    ("bago-kusuntu", "bqg"),
+    ("bagri", "bgq"),
+    ("bagupi", "bpi"),
+    ("bagusa", "bqb"),
+    ("bagvalal", "kva"),
+    ("baha buyang", "yha"),
+    ("baham", "bdw"),
+    ("bahamas creole english", "bah"),
+    ("baharna arabic", "abv"),
+    ("bahasa indonesia", "ind"),
+    ("bahasa melayu", "msa"),
+    ("bahau", "bhv"),
+    ("bahinemo", "bjh"),
+    ("bahing", "bhj"),
+    ("bahnar", "bdq"),
+    ("bahonsuai", "bsu"),
+    ("bai (south sudan)", "bdj"),
+    ("baibai", "bbf"),
+    ("baikeno", "bkx"),
+    ("baima", "bqh"),
+    ("baimak", "bmx"),
+    ("bainouk-gunyaamolo", "bcz"),
+    ("bainouk-gunyuño", "bab"),
+    ("bainouk-samik", "bcb"),
+    ("baiso", "bsw"),
+    ("baissa fali", "fah"),
+    ("bajan", "bjs"),
+    ("bajelani", "bjm"),
+    ("bak", "bak"),
+    ("baka (cameroon)", "bkc"),
+    ("baka (south sudan)", "bdh"),
+    ("bakairí", "bkq"),
+    ("bakaka", "bqz"),
+    ("bakhtiari", "bqi"),
+    ("baki", "bki"),
+    ("bakoko", "bkh"),
+    ("bakole", "kme"),
+    ("bakpinka", "bbs"),
+    ("bakumpai", "bkr"),
+    ("bakwé", "bjw"),
+    ("bal", "bal"),
+    ("balaesang", "bls"),
+    ("balaibalan", "zba"),
+    ("balangao", "blw"),
+    ("balangingi", "sse"),
+    ("balanta-ganja", "bjt"),
+    ("balanta-kentohe", "ble"),
+    ("balantak", "blz"),
+    ("baldemu", "bdn"),
+    ("bali (democratic republic of congo)", "bcp"),
+    ("bali (nigeria)", "bcn"),
+    ("balinese", "ban"),
+    ("balinese malay", "mhp"),
+    ("balkan gagauz turkish", "bgx"),
+    ("balkan romani", "rmn"),
+    ("balo", "bqo"),
+    ("baloi", "biz"),
+    ("balti", "bft"),
+    ("baltic romani", "rml"),
+    ("baluan-pam", "blq"),
+    ("baluchi", "bal"),
+    ("bam", "bam"),
+    ("bamako sign language", "bog"),
+    ("bamali", "bbq"),
+    ("bambalang", "bmo"),
+    ("bambam", "ptu"),
+    ("bambara", "bam"),
+    ("bambassi", "myf"),
+    ("bambili-bambui", "baw"),
+    ("bamenyam", "bce"),
+    ("bamu", "bcf"),
+    ("bamukumbit", "bqt"),
+    ("bamun", "bax"),
+    ("bamunka", "bvm"),
+    ("bamwe", "bmg"),
+    ("ban", "ban"),
+    ("ban khor sign language", "bfk"),
+    ("bana", "bcw"),
+    ("banao itneg", "bjx"),
+    ("banaro", "byz"),
+    ("banda (indonesia)", "bnd"),
+    ("banda malay", "bpq"),
+    ("banda-bambari", "liy"),
+    ("banda-banda", "bpd"),
+    ("banda-mbrès", "bqk"),
+    ("banda-ndélé", "bfl"),
+    ("banda-yangere", "yaj"),
+    ("bandi", "bza"),
+    ("bandial", "bqj"),
+    ("bandjalang", "bdy"),
+    ("bangala", "bxg"),
+    ("bangandu", "bgf"),
+    ("bangba", "bbe"),
+    ("banggai", "bgz"),
+    ("banggarla", "bjb"),
+    ("bangi", "bni"),
+    ("bangime", "dba"),
+    ("bangka", "mfb"),
+    ("bangolan", "bgj"),
+    ("bangubangu", "bnx"),
+    ("bangwinji", "bsj"),
+    ("baniva", "bvv"),
+    ("baniwa", "bwi"),
+    ("banjar", "bjn"),
+    ("bankagooma", "bxw"),
+    ("bankal", "jjr"),
+    ("bankan tey dogon", "dbw"),
+    ("bankon", "abb"),
+    ("bannoni", "bcm"),
+    ("bantawa", "bap"),
+    ("bantayanon", "bfx"),
+    ("bantik", "bnq"),
+    ("bantoanon", "bno"),
+    ("banyjima", "pnw"),
+    ("baoulé", "bci"),
+    ("baq", "eus"),
+    ("bara malagasy", "bhr"),
+    ("baraamu", "brd"),
+    ("barababaraba", "rbp"),
+    ("barai", "bbb"),
+    ("barakai", "baj"),
+    ("baram kayan", "kys"),
+    ("barama", "bbg"),
+    ("barambu", "brm"),
+    ("baramu", "bmz"),
+    ("barapasi", "brp"),
+    ("baras", "brs"),
+    ("barasana-eduria", "bsn"),
+    ("barbaram", "vmb"),
+    ("barbareño", "boi"),
+    ("barclayville grebo", "gry"),
+    ("bardi", "bcj"),
+    ("barein", "bva"),
+    ("bargam", "mlp"),
+    ("bari", "bfa"),
+    ("bariai", "bch"),
+    ("bariji", "bjc"),
+    ("barikanchi", "bxo"),
+    ("barikewa", "jbk"),
+    ("barok", "bjk"),
+    ("barombi", "bbi"),
+    ("barro negro tunebo", "tbn"),
+    ("barrow point", "bpt"),
+    ("baruga", "bjz"),
+    ("baruya", "byr"),
+    ("barwe", "bwg"),
+    ("barzani jewish neo-aramaic", "bjf"),
+    ("baré", "bae"),
+    ("barí", "mot"),
+    ("bas", "bas"),
+    ("basa (cameroon)", "bas"),
+    ("basa (nigeria)", "bzw"),
+    ("basa-gumna", "bsl"),
+    ("basa-gurmana", "buj"),
+    ("basap", "bdb"),
+    ("basay", "byq"),
+    ("bashkardi", "bsg"),
+    ("bashkir", "bak"),
+    ("basketo", "bst"),
+    ("basque", "eus"),
+    ("bassa", "bsq"),
+    ("bassa-kontagora", "bsr"),
+    ("bassari", "bsc"),
+    ("bassossi", "bsi"),
+    ("bata", "bta"),
+    ("batad ifugao", "ifb"),
+    ("batak", "bya"),
+    ("batak alas-kluet", "btz"),
+    ("batak angkola", "akb"),
+    ("batak dairi", "btd"),
+    ("batak karo", "btx"),
+    ("batak mandailing", "btm"),
+    ("batak simalungun", "bts"),
+    ("batak toba", "bbc"),
+    ("batanga", "bnm"),
+    ("batek", "btq"),
+    ("bateri", "btv"),
+    ("bathari", "bhm"),
+    ("bati (cameroon)", "btc"),
+    ("bati (indonesia)", "bvt"),
+    ("batjala", "xby"),
+    ("bats", "bbl"),
+    ("batu", "btu"),
+    ("batui", "zbt"),
+    ("batuley", "bay"),
+    ("bau bidayuh", "sne"),
+    ("bauchi", "bsf"),
+    ("bauni", "bpe"),
+    ("baure", "brg"),
+    ("bauria", "bge"),
+    ("bauwaki", "bwk"),
+    ("bauzi", "bvz"),
+    ("bavarian", "bar"),
+    ("bawm chin", "bgr"),
+    ("bay miwok", "mkq"),
+    ("bayali", "bjy"),
+    ("baybayanon", "bvy"),
+    ("baygo", "byg"),
+    ("bayono", "byl"),
+    ("bayot", "bda"),
+    ("bayungu", "bxj"),
+    ("bazigar", "bfr"),
+    ("be", "bel"),
+    ("beami", "beo"),
+    ("beaver", "bea"),
+    ("beba", "bfp"),
+    ("bebele", "beb"),
+    ("bebeli", "bek"),
+    ("bebil", "bxp"),
+    ("bedjond", "bjv"),
+    ("bedoanas", "bed"),
+    ("beeke", "bkf"),
+    ("beele", "bxq"),
+    ("beembe", "beq"),
+    ("beezen", "bnz"),
+    ("befang", "bby"),
+    ("beginci", "ebc"),
+    ("bej", "bej"),
+    ("beja", "bej"),
+    ("bekati'", "bei"),
+    ("bekwarra", "bkv"),
+    ("bekwel", "bkw"),
+    ("bel", "bel"),
+    ("belait", "beg"),
+    ("belanda bor", "bxb"),
+    ("belanda viri", "bvi"),
+    ("belarusian", "bel"),
+    ("belarussian", "bel"),
+    ("belhariya", "byw"),
+    ("beli (papua new guinea)", "bey"),
+    ("beli (south sudan)", "blm"),
+    ("belize kriol english", "bzj"),
+    ("bella coola", "blc"),
+    ("bellari", "brw"),
+    ("belning", "glb"),
+    ("belorussian", "bel"),
+    ("bem", "bem"),
+    ("bemba (zambia)", "bem"),
+    ("bembe", "bmb"),
+    ("ben", "ben"),
+    ("ben tey dogon", "dbt"),
+    ("bena (nigeria)", "yun"),
+    ("bena (tanzania)", "bez"),
+    ("benabena", "bef"),
+    ("bench", "bcq"),
+    ("bende", "bdp"),
+    ("bendi", "bct"),
+    ("beng", "nhb"),
+    ("benga", "bng"),
+    ("bengali", "ben"),
+    ("bengalí", "ben"),
+    ("benggoi", "bgy"),
+    ("bengkala sign language", "bqy"),
+    ("bentong", "bnu"),
+    ("benyadu'", "byd"),
+    ("beothuk", "bue"),
+    ("bepour", "bie"),
+    ("berakou", "bxv"),
+    ("berau malay", "bve"),
+    ("berbice creole dutch", "brc"),
+    ("berik", "bkl"),
+    ("berinomo", "bit"),
+    ("berom", "bom"),
+    ("berta", "wti"),
+    ("berti", "byt"),
+    ("besisi", "mhe"),
+    ("besme", "bes"),
+    ("besoa", "bep"),
+    ("betaf", "bfe"),
+    ("betawi", "bew"),
+    ("bete", "byf"),
+    ("bete-bendi", "btt"),
+    ("beti (côte d'ivoire)", "eot"),
+    ("betta kurumba", "xub"),
+    ("bezhta", "kap"),
+    ("bg", "bul"),
+    ("bhadrawahi", "bhd"),
+    ("bhalay", "bhx"),
+    ("bharia", "bha"),
+    ("bhatri", "bgw"),
+    ("bhattiyali", "bht"),
+    ("bhaya", "bhe"),
+    ("bhele", "bhy"),
+    ("bhilali", "bhi"),
+    ("bhili", "bhb"),
+    ("bho", "bho"),
+    ("bhojpuri", "bho"),
+    ("bhoti kinnauri", "nes"),
+    ("bhujel", "byh"),
+    ("bhunjia", "bhu"),
+    ("bi", "bis"),
+    ("biafada", "bif"),
+    ("biage", "bdf"),
+    ("biak", "bhw"),
+    ("biali", "beh"),
+    ("bian marind", "bpv"),
+    ("biangai", "big"),
+    ("biao", "byk"),
+    ("biao mon", "bmt"),
+    ("biao-jiao mien", "bje"),
+    ("biatah bidayuh", "bth"),
+    ("bibbulman", "xbp"),
+    ("bidhawal", "ihw"),
+    ("bidiyo", "bid"),
+    ("bidjara", "bym"),
+    ("bidyogo", "bjg"),
+    ("bielorruso", "bel"),
+    ("biem", "bmc"),
+    ("bierebo", "bnk"),
+    ("bieria", "brj"),
+    ("biete", "biu"),
+    ("big nambas", "nmb"),
+    ("biga", "bhc"),
+    ("bigambal", "xbe"),
+    ("bijim", "jbm"),
+    ("bijori", "bix"),
+    ("bik", "bik"),
+    ("bikol", "bik"),
+    ("bikya", "byb"),
+    ("bila", "bip"),
+    ("bilakura", "bql"),
+    ("bilaspuri", "kfs"),
+    ("bilba", "bpz"),
+    ("bilbil", "brz"),
+    ("bile", "bil"),
+    ("bilin", "byn"),
+    ("bilma kanuri", "bms"),
+    ("biloxi", "bll"),
+    ("bilua", "blb"),
+    ("bilur", "bxf"),
+    ("bima", "bhp"),
+    ("bimin", "bhl"),
+    ("bimoba", "bim"),
+    ("bin", "bin"),
+    ("bina (nigeria)", "byj"),
+    ("bina (papua new guinea)", "bmn"),
+    ("binahari", "bxz"),
+    ("binandere", "bhg"),
+    ("bindal", "xbd"),
+    ("bine", "bon"),
+    ("bini", "bin"),
+    ("binji", "bpj"),
+    ("binongan itneg", "itb"),
+    ("bintauna", "bne"),
+    ("bintulu", "bny"),
+    ("binukid", "bkd"),
+    ("binumarien", "bjr"),
+    ("bipi", "biq"),
+    ("bira", "brf"),
+    ("birale", "bxe"),
+    ("birao", "brr"),
+    ("birgit", "btf"),
+    ("birhor", "biy"),
+    ("biri", "bzr"),
+    ("biritai", "bqq"),
+    ("birked", "brk"),
+    ("birman", "mya"),
+    ("birri", "bvq"),
+    ("birrpayi", "xbj"),
+    ("birwa", "brl"),
+    ("bis", "bis"),
+    ("biseni", "ije"),
+    ("bishnupriya", "bpy"),
+    ("bishuo", "bwh"),
+    ("bisis", "bnw"),
+    ("bislama", "bis"),
+    ("bisorio", "bir"),
+    ("bissa", "bib"),
+    ("bisu", "bzi"),
+    ("bitare", "brt"),
+    ("bitur", "mcc"),
+    ("biwat", "bwm"),
+    ("biyo", "byo"),
+    ("biyom", "bpm"),
+    ("biélorusse", "bel"),
+    ("bla", "bla"),
+    ("blablanga", "blp"),
+    ("blafe", "bfh"),
+    ("blagar", "beu"),
+    ("blang", "blr"),
+    ("blissymbols", "zbl"),
+    ("bm", "bam"),
+    ("bn", "ben"),
+    ("bo", "bod"),
+    ("bo (laos)", "bgl"),
+    ("bo (papua new guinea)", "bpw"),
+    ("bo-rukul", "mae"),
+    ("bo-ung", "mux"),
+    ("boano (maluku)", "bzn"),
+    ("boano (sulawesi)", "bzl"),
+    ("bobongko", "bgb"),
+    ("bobot", "bty"),
+    ("bod", "bod"),
+    ("bodo (central african republic)", "boy"),
+    ("bodo (india)", "brx"),
+    ("bodo gadaba", "gbj"),
+    ("bodo parja", "bdv"),
+    ("bofi", "bff"),
+    ("boga", "bvw"),
+    ("bogaya", "boq"),
+    ("boghom", "bux"),
+    ("boguru", "bqu"),
+    ("bohtan neo-aramaic", "bhn"),
+    ("boikin", "bzf"),
+    ("bokha", "ybk"),
+    ("bokmal", "nor"),
+    ("bokmål", "nor"),
+    ("boko (benin)", "bqc"),
+    ("boko (democratic republic of congo)", "bkp"),
+    ("bokobaru", "bus"),
+    ("bokoto", "bdt"),
+    ("bokyi", "bky"),
+    ("bola", "bnp"),
+    ("bolango", "bld"),
+    ("bole", "bol"),
+    ("bolgarian", "xbo"),
+    ("bolgo", "bvo"),
+    ("bolia", "bli"),
+    ("bolinao", "smk"),
+    ("bolivian sign language", "bvl"),
+    ("boloki", "bkt"),
+    ("bolon", "bof"),
+    ("bolondo", "bzm"),
+    ("bolongan", "blj"),
+    ("bolyu", "ply"),
+    ("bom-kim", "bmf"),
+    ("boma", "boh"),
+    ("bomboli", "bml"),
+    ("bomboma", "bws"),
+    ("bomitaba", "zmx"),
+    ("bomu", "bmq"),
+    ("bomwali", "bmw"),
+    ("bon gula", "glc"),
+    ("bonan", "peh"),
+    ("bondei", "bou"),
+    ("bondo", "bfw"),
+    ("bondoukou kulango", "kzc"),
+    ("bondum dom dogon", "dbu"),
+    ("bonerate", "bna"),
+    ("bonerif", "bnv"),
+    ("bonggi", "bdg"),
+    ("bonggo", "bpg"),
+    ("bongili", "bui"),
+    ("bongo", "bot"),
+    ("bongu", "bpu"),
+    ("bonjo", "bok"),
+    ("bonkeng", "bvg"),
+    ("bonkiman", "bop"),
+    ("bontok", "bnc"),
+    ("bookan", "bnb"),
+    ("boon", "bnl"),
+    ("boor", "bvf"),
+    ("bora", "boa"),
+    ("borana-arsi-guji oromo", "gax"),
+    ("border kuna", "kvn"),
+    ("borei", "gai"),
+    ("borgu fulfulde", "fue"),
+    ("boro (ethiopia)", "bwo"),
+    ("boro (ghana)", "xxb"),
+    ("borong", "ksr"),
+    ("boruca", "brn"),
+    ("borôro", "bor"),
+    ("bos", "bos"),
+    ("bosanski", "bos"),
+    ("boselewa", "bwf"),
+    ("bosngun", "bqs"),
+    ("bosnian", "bos"),
+    ("bosnien", "bos"),
+    ("bosnio", "bos"),
+    ("bote-majhi", "bmj"),
+    ("botlikh", "bph"),
+    ("botolan sambal", "sbl"),
+    ("bouna kulango", "nku"),
+    ("bouni", "suo"),
+    ("bouyei", "pcc"),
+    ("bozaba", "bzo"),
+    ("br", "bre"),
+    ("bra", "bra"),
+    ("bragat", "aof"),
+    ("brahui", "brh"),
+    ("braj", "bra"),
+    ("brazilian sign language", "bzs"),
+    ("bre", "bre"),
+    ("brem", "buq"),
+    ("breri", "brq"),
+    ("breton", "bre"),
+    ("bribri", "bzd"),
+    ("brithenig", "bzt"),
+    ("british sign language", "bfi"),
+    ("brokkat", "bro"),
+    ("brokpake", "sgt"),
+    ("brokskat", "bkk"),
+    ("brooke's point palawano", "plw"),
+    ("broome pearling lugger pidgin", "bpl"),
+    ("brunei", "kxd"),
+    ("brunei bisaya", "bsb"),
+    ("bruny island tasmanian", "xpz"),
+    ("bs", "bos"),
+    ("bu (bauchi state)", "zbu"),
+    ("bu (kaduna state)", "jid"),
+    ("bu-nao bunu", "bwx"),
+    ("bua", "bua"),
+    ("bualkhaw chin", "cbl"),
+    ("buamu", "box"),
+    ("bube", "bvb"),
+    ("bubi", "buw"),
+    ("bubia", "bbx"),
+    ("budeh stieng", "stt"),
+    ("budibud", "btp"),
+    ("budong-budong", "bdx"),
+    ("budu", "buu"),
+    ("budukh", "bdk"),
+    ("buduma", "bdm"),
+    ("budza", "bja"),
+    ("bug", "bug"),
+    ("bugan", "bbh"),
+    ("bugawac", "buk"),
+    ("bughotu", "bgt"),
+    ("buginese", "bug"),
+    ("buglere", "sab"),
+    ("bugun", "bgg"),
+    ("buhi'non bikol", "ubl"),
+    ("buhid", "bku"),
+    ("buhutu", "bxh"),
+    ("bukar-sadung bidayuh", "sdo"),
+    ("bukat", "bvk"),
+    ("bukharic", "bhh"),
+    ("bukit malay", "bvu"),
+    ("bukitan", "bkn"),
+    ("bukiyip", "ape"),
+    ("buksa", "tkb"),
+    ("bukusu", "bxk"),
+    ("bukwen", "buz"),
+    ("bul", "bul"),
+    ("bulgare", "bul"),
+    ("bulgarian", "bul"),
+    ("bulgarian sign language", "bqn"),
+    ("bulgebi", "bmp"),
+    ("buli (ghana)", "bwu"),
+    ("buli (indonesia)", "bzq"),
+    ("bullom so", "buy"),
+    ("bulo stieng", "sti"),
+    ("bulu (cameroon)", "bum"),
+    ("bulu (papua new guinea)", "bjl"),
+    ("bumaji", "byp"),
+    ("bumang", "bvp"),
+    ("bumbita arapesh", "aon"),
+    ("bumthangkha", "kjz"),
+    ("buna", "bvn"),
+    ("bunak", "bfn"),
+    ("bunama", "bdd"),
+    ("bundeli", "bns"),
+    ("bung", "bqd"),
+    ("bungain", "but"),
+    ("bunganditj", "xbg"),
+    ("bungku", "bkz"),
+    ("bungu", "wun"),
+    ("bunoge dogon", "dgb"),
+    ("bunuba", "bck"),
+    ("bunun", "bnn"),
+    ("buol", "blf"),
+    ("bur", "mya"),
+    ("bura-pabir", "bwr"),
+    ("burak", "bys"),
+    ("buraka", "bkg"),
+    ("burarra", "bvr"),
+    ("burate", "bti"),
+    ("burduna", "bxn"),
+    ("bure", "bvh"),
+    ("buriat", "bua"),
+    ("burji", "bji"),
+    ("burmbar", "vrt"),
+    ("burmese", "mya"),
+    ("burmeso", "bzu"),
+    ("buru (indonesia)", "mhs"),
+    ("buru (nigeria)", "bqw"),
+    ("burui", "bry"),
+    ("burumakok", "aip"),
+    ("burun", "bdi"),
+    ("burundian sign language", "lsb"),
+    ("burunge", "bds"),
+    ("burushaski", "bsk"),
+    ("burusu", "bqr"),
+    ("buruwai", "asi"),
+    ("busa", "bqp"),
+    ("busam", "bxs"),
+    ("busami", "bsm"),
+    ("busang kayan", "bfg"),
+    ("bushi", "buc"),
+    ("bushoong", "buf"),
+    ("buso", "bso"),
+    ("busoa", "bup"),
+    ("bussa", "dox"),
+    ("busuu", "bju"),
+    ("butbut kalinga", "kyb"),
+    ("butmas-tur", "bnr"),
+    ("butuanon", "btw"),
+    ("buwal", "bhs"),
+    ("buyu", "byi"),
+    ("buyuan jinuo", "jiy"),
+    ("bwaidoka", "bwd"),
+    ("bwanabwana", "tte"),
+    ("bwatoo", "bwa"),
+    ("bwe karen", "bwe"),
+    ("bwela", "bwl"),
+    ("bwile", "bwc"),
+    ("bwisi", "bwz"),
+    ("byangsi", "bee"),
+    ("byelorussian", "bel"),
+    ("byep", "mkk"),
+    ("byn", "byn"),
+    ("bädi kanum", "khd"),
+    ("búlgaro", "bul"),
+    ("c'lela", "dri"),
+    ("ca", "cat"),
+    ("caac", "msq"),
+    ("cabiyarí", "cbb"),
+    ("cabécar", "cjp"),
+    ("cacaloxtepec mixtec", "miu"),
+    ("cacaopera", "ccr"),
+    ("cacgia roglai", "roc"),
+    ("cacua", "cbv"),
+    ("cad", "cad"),
+    ("caddo", "cad"),
+    ("cafundo creole", "ccd"),
+    ("cahuarano", "cah"),
+    ("cahuilla", "chl"),
+    ("cajamarca quechua", "qvc"),
+    ("cajatambo north lima quechua", "qvl"),
+    ("cajonos zapotec", "zad"),
+    ("cajun french", "frc"),
+    ("caka", "ckx"),
+    ("cakchiquel-quiché mixed language", "ckz"),
+    ("cakfem-mushere", "cky"),
+    ("calamian tagbanwa", "tbk"),
+    ("calderón highland quichua", "qud"),
+    ("callawalla", "caw"),
+    ("caluyanun", "clu"),
+    ("caló", "rmq"),
+    ("cambodian", "khm"),
+    ("cambodian sign language", "csx"),
+    ("camboyano", "khm"),
+    ("cameroon mambila", "mcu"),
+    ("cameroon pidgin", "wes"),
+    ("camling", "rab"),
+    ("campalagian", "cml"),
+    ("campidanese sardinian", "sro"),
+    ("camsá", "kbh"),
+    ("camtho", "cmt"),
+    ("camunic", "xcc"),
+    ("canarés", "kan"),
+    ("candoshi-shapra", "cbu"),
+    ("canela", "ram"),
+    ("canichana", "caz"),
+    ("cao lan", "mlc"),
+    ("cao miao", "cov"),
+    ("capanahua", "kaq"),
+    ("capiznon", "cps"),
+    ("cappadocian greek", "cpg"),
+    ("caquinte", "cot"),
+    ("car", "car"),
+    ("car nicobarese", "caq"),
+    ("cara", "cfd"),
+    ("carabayo", "cby"),
+    ("caramanta", "crf"),
+    ("carapana", "cbc"),
+    ("carian", "xcr"),
+    ("caribbean hindustani", "hns"),
+    ("caribbean javanese", "jvn"),
+    ("carijona", "cbd"),
+    ("carolina algonquian", "crr"),
+    ("carolinian", "cal"),
+    ("carpathian romani", "rmc"),
+    ("carrier", "crx"),
+    ("cashibo-cacataibo", "cbr"),
+    ("cashinahua", "cbs"),
+    ("casiguran dumagat agta", "dgc"),
+    ("castilian", "spa"),
+    ("casuarina coast asmat", "asc"),
+    ("cat", "cat"),
+    ("catalan", "cat"),
+    ("catalan sign language", "csc"),
+    ("català", "cat"),
+    ("catalán", "cat"),
+    ("catawba", "chc"),
+    ("cavineña", "cav"),
+    ("cayubaba", "cyb"),
+    ("cayuga", "cay"),
+    ("cayuse", "xcy"),
+    ("cañar highland quichua", "qxr"),
+    ("ca̱hungwa̱rya̱", "nat"),
+    ("ce", "che"),
+    ("ceb", "ceb"),
+    ("cebaara senoufo", "sef"),
+    ("cebuano", "ceb"),
+    ("celtiberian", "xce"),
+    ("cemuhî", "cam"),
+    ("central asmat", "cns"),
+    ("central atlas tamazight", "tzm"),
+    ("central awyu", "awu"),
+    ("central aymara", "ayr"),
+    ("central bai", "bca"),
+    ("central berawan", "zbc"),
+    ("central bikol", "bcl"),
+    ("central bontok", "lbk"),
+    ("central cagayan agta", "agt"),
+    ("central grebo", "grv"),
+    ("central hongshuihe zhuang", "zch"),
+    ("central huasteca nahuatl", "nch"),
+    ("central huishui hmong", "hmc"),
+    ("central kanuri", "knc"),
+    ("central khmer", "khm"),
+    ("central kurdish", "ckb"),
+    ("central maewo", "mwo"),
+    ("central malay", "pse"),
+    ("central masela", "mxz"),
+    ("central mashan hmong", "hmm"),
+    ("central mazahua", "maz"),
+    ("central melanau", "mel"),
+    ("central mnong", "cmo"),
+    ("central nahuatl", "nhn"),
+    ("central nicobarese", "ncb"),
+    ("central ojibwa", "ojc"),
+    ("central okinawan", "ryu"),
+    ("central palawano", "plc"),
+    ("central pame", "pbs"),
+    ("central pashto", "pst"),
+    ("central pomo", "poo"),
+    ("central puebla nahuatl", "ncx"),
+    ("central sama", "sml"),
+    ("central siberian yupik", "ess"),
+    ("central sierra miwok", "csm"),
+    ("central subanen", "syb"),
+    ("central tagbanwa", "tgt"),
+    ("central tarahumara", "tar"),
+    ("central tunebo", "tuf"),
+    ("central yupik", "esu"),
+    ("central-eastern niger fulfulde", "fuq"),
+    ("centúúm", "cet"),
+    ("cerma", "cme"),
+    ("ces", "ces"),
+    ("ch", "cha"),
+    ("cha", "cha"),
+    ("chabu", "sbf"),
+    ("chachapoyas quechua", "quk"),
+    ("chachi", "cbi"),
+    ("chadian arabic", "shu"),
+    ("chadian sign language", "cds"),
+    ("chadong", "cdy"),
+    ("chagatai", "chg"),
+    ("chaima", "ciy"),
+    ("chak", "ckh"),
+    ("chakali", "cli"),
+    ("chakavian", "ckm"),
+    ("chakma", "ccp"),
+    ("chala", "cll"),
+    ("chaldean neo-aramaic", "cld"),
+    ("chalikha", "tgf"),
+    ("chamacoco", "ceg"),
+    ("chamalal", "cji"),
+    ("chambeali", "cdh"),
+    ("chambri", "can"),
+    ("chamicuro", "ccc"),
+    ("chamorro", "cha"),
+    ("chang naga", "nbc"),
+    ("changriwa", "cga"),
+    ("changthang", "cna"),
+    ("chantyal", "chx"),
+    ("chané", "caj"),
+    ("chara", "cra"),
+    ("chaudangsi", "cdn"),
+    ("chaura", "crv"),
+    ("chavacano", "cbk"),
+    ("chayahuita", "cbt"),
+    ("chayuco mixtec", "mih"),
+    ("chazumba mixtec", "xtb"),
+    ("chb", "chb"),
+    ("che", "che"),
+    ("chechen", "che"),
+    ("checo", "ces"),
+    ("cheke holo", "mrn"),
+    ("chemakum", "xch"),
+    ("chenapian", "cjn"),
+    ("chenchu", "cde"),
+    ("chenoua", "cnu"),
+    ("chepang", "cdm"),
+    ("chepya", "ycp"),
+    ("cherepon", "cpn"),
+    ("cherokee", "chr"),
+    ("chesu", "ych"),
+    ("chetco", "ctc"),
+    ("chewong", "cwg"),
+    ("cheyenne", "chy"),
+    ("chg", "chg"),
+    ("chhattisgarhi", "hne"),
+    ("chhintange", "ctn"),
+    ("chhulung", "cur"),
+    ("chi", "zho"),
+    ("chi_sim", "zho"),
+    ("chi_tra", "zho"),
+    ("chiangmai sign language", "csd"),
+    ("chiapanec", "cip"),
+    ("chibcha", "chb"),
+    ("chicahuaxtla triqui", "trs"),
+    ("chichicapan zapotec", "zpv"),
+    ("chichimeca-jonaz", "pei"),
+    ("chickasaw", "cic"),
+    ("chicomuceltec", "cob"),
+    ("chiga", "cgg"),
+    ("chigmecatitlán mixtec", "mii"),
+    ("chilcotin", "clc"),
+    ("chilean sign language", "csg"),
+    ("chilisso", "clh"),
+    ("chiltepec chinantec", "csa"),
+    ("chimalapa zoque", "zoh"),
+    ("chimariko", "cid"),
+    ("chimborazo highland quichua", "qug"),
+    ("chimila", "cbg"),
+    ("china buriat", "bxu"),
+    ("chinali", "cih"),
+    ("chinbon chin", "cnb"),
+    ("chincha quechua", "qxc"),
+    ("chinese", "zho"),
+    ("chinese pidgin english", "cpi"),
+    ("chinese sign language", "csl"),
+    ("chino", "zho"),
+    ("chinois", "zho"),
+    ("chinook", "chh"),
+    ("chinook jargon", "chn"),
+    ("chipaya", "cap"),
+    ("chipewyan", "chp"),
+    ("chippewa", "ciw"),
+    ("chiquihuitlán mazatec", "maq"),
+    ("chiquitano", "cax"),
+    ("chiquián ancash quechua", "qxa"),
+    ("chiripá", "nhd"),
+    ("chiru", "cdf"),
+    ("chitimacha", "ctm"),
+    ("chitkuli kinnauri", "cik"),
+    ("chittagonian", "ctg"),
+    ("chitwania tharu", "the"),
+    ("chk", "chk"),
+    ("chm", "chm"),
+    ("chn", "chn"),
+    ("cho", "cho"),
+    ("choapan zapotec", "zpc"),
+    ("chocangacakha", "cgk"),
+    ("chochotec", "coz"),
+    ("choctaw", "cho"),
+    ("chodri", "cdi"),
+    ("chokri naga", "nri"),
+    ("chokwe", "cjk"),
+    ("chol", "ctu"),
+    ("cholón", "cht"),
+    ("chong", "cog"),
+    ("choni", "cda"),
+    ("chonyi-dzihana-kauma", "coh"),
+    ("chopi", "cce"),
+    ("chorasmian", "xco"),
+    ("chortí", "caa"),
+    ("chothe naga", "nct"),
+    ("chp", "chp"),
+    ("chr", "chr"),
+    ("chrau", "crw"),
+    ("chru", "cje"),
+    ("chu", "chu"),
+    ("chuanqiandian cluster miao", "cqd"),
+    ("chuave", "cjv"),
+    ("chug", "cvg"),
+    ("chuj", "cac"),
+    ("chuka", "cuh"),
+    ("chukot", "ckt"),
+    ("chukwa", "cuw"),
+    ("chulym", "clw"),
+    ("chumburung", "ncu"),
+    ("chungmboko", "cug"),
+    ("churahi", "cdj"),
+    ("church slavic", "chu"),
+    ("chut", "scb"),
+    ("chuukese", "chk"),
+    ("chuvantsy", "xcv"),
+    ("chuvash", "chv"),
+    ("chuwabu", "chw"),
+    ("chv", "chv"),
+    ("chy", "chy"),
+    ("chácobo", "cao"),
+    ("ci gbe", "cib"),
+    ("cia-cia", "cia"),
+    ("cibak", "ckl"),
+    ("cicipu", "awc"),
+    ("cimbrian", "cim"),
+    ("cinda-regi-tiyal", "cdr"),
+    ("cineni", "cie"),
+    ("cingalés", "sin"),
+    ("cinta larga", "cin"),
+    ("cisalpine gaulish", "xcg"),
+    ("cishingini", "asg"),
+    ("citak", "txt"),
+    ("ciwogai", "tgd"),
+    ("clallam", "clm"),
+    ("classical armenian", "xcl"),
+    ("classical mandaic", "myz"),
+    ("classical mongolian", "cmg"),
+    ("classical nahuatl", "nci"),
+    ("classical newari", "nwc"),
+    ("classical quechua", "qwc"),
+    ("classical syriac", "syc"),
+    ("classical tibetan", "xct"),
+    ("cnr", "cnr"),
+    ("co", "cos"),
+    ("coahuilteco", "xcw"),
+    ("coast miwok", "csi"),
+    ("coastal konjo", "kjc"),
+    ("coatecas altas zapotec", "zca"),
+    ("coatepec nahuatl", "naz"),
+    ("coatlán mixe", "mco"),
+    ("coatlán zapotec", "zps"),
+    ("coatzospan mixtec", "miz"),
+    ("cocama-cocamilla", "cod"),
+    ("cochimi", "coj"),
+    ("cocopa", "coc"),
+    ("cocos islands malay", "coa"),
+    ("coeur d'alene", "crd"),
+    ("cofán", "con"),
+    ("cogui", "kog"),
+    ("colombian sign language", "csn"),
+    ("colonia tovar german", "gct"),
+    ("colorado", "cof"),
+    ("columbia-wenatchi", "col"),
+    ("comaltepec chinantec", "cco"),
+    ("comanche", "com"),
+    ("comecrudo", "xcm"),
+    ("como karim", "cfg"),
+    ("comox", "coo"),
+    ("congo swahili", "swc"),
+    ("coos", "csz"),
+    ("cop", "cop"),
+    ("copainalá zoque", "zoc"),
+    ("copala triqui", "trc"),
+    ("coptic", "cop"),
+    ("coquille", "coq"),
+    ("cor", "cor"),
+    ("coreano", "kor"),
+    ("cori", "cry"),
+    ("cornish", "cor"),
+    ("corongo ancash quechua", "qwa"),
+    ("corsican", "cos"),
+    ("coréen", "kor"),
+    ("cos", "cos"),
+    ("costa rican sign language", "csr"),
+    ("cotabato manobo", "mta"),
+    ("cotoname", "xcn"),
+    ("cowlitz", "cow"),
+    ("coyotepec popoloca", "pbf"),
+    ("coyutla totonac", "toc"),
+    ("cr", "cre"),
+    ("cre", "cre"),
+    ("cree", "cre"),
+    ("creek", "mus"),
+    ("crh", "crh"),
+    ("crimean tatar", "crh"),
+    ("crnogorski", "cnr"),
+    ("cro", "hrv"),
+    ("croata", "hrv"),
+    ("croate", "hrv"),
+    ("croatia sign language", "csq"),
+    ("croatian", "hrv"),
+    ("cross river mbembe", "mfn"),
+    ("crow", "cro"),
+    ("cruzeño", "crz"),
+    ("cs", "ces"),
+    ("csb", "csb"),
+    ("cu", "chu"),
+    ("cuba sign language", "csf"),
+    ("cubeo", "cub"),
+    ("cuiba", "cui"),
+    ("cuitlatec", "cuy"),
+    ("culina", "cul"),
+    ("cumanagoto", "cuo"),
+    ("cumbric", "xcb"),
+    ("cuneiform luwian", "xlu"),
+    ("cupeño", "cup"),
+    ("curonian", "xcu"),
+    ("curripaco", "kpc"),
+    ("cusco quechua", "quz"),
+    ("cutchi-swahili", "ccl"),
+    ("cuvok", "cuv"),
+    ("cuyamecalco mixtec", "xtu"),
+    ("cuyonon", "cyo"),
+    ("cv", "chv"),
+    ("cwi bwamu", "bwy"),
+    ("cy", "cym"),
+    ("cym", "cym"),
+    ("cypriot arabic", "acy"),
+    ("cze", "ces"),
+    ("czech", "ces"),
+    ("czech sign language", "cse"),
+    ("côông", "cnc"),
+    ("da", "dan"),
+    ("da'a kaili", "kzf"),
+    ("daai chin", "dao"),
+    ("daakaka", "bpa"),
+    ("daantanai'", "lni"),
+    ("daasanach", "dsh"),
+    ("daatsʼíin", "dtn"),
+    ("daba", "dbq"),
+    ("dabarre", "dbr"),
+    ("dabe", "dbe"),
+    ("dacian", "xdc"),
+    ("dadi dadi", "dda"),
+    ("dadibi", "mps"),
+    ("dadiya", "dbd"),
+    ("daga", "dgz"),
+    ("dagaari dioula", "dgd"),
+    ("dagba", "dgk"),
+    ("dagbani", "dag"),
+    ("dagik", "dec"),
+    ("dagoman", "dgn"),
+    ("dahalik", "dlk"),
+    ("dahalo", "dal"),
+    ("daho-doo", "das"),
+    ("dai zhuang", "zhd"),
+    ("dair", "drb"),
+    ("dak", "dak"),
+    ("dakka", "dkk"),
+    ("dakota", "dak"),
+    ("dakpakha", "dka"),
+    ("dalabon", "ngk"),
+    ("dalmatian", "dlm"),
+    ("daloa bété", "bev"),
+    ("dama", "dmm"),
+    ("damakawa", "dam"),
+    ("damal", "uhn"),
+    ("dambi", "dac"),
+    ("dameli", "dml"),
+    ("dampelas", "dms"),
+    ("dan", "dan"),
+    ("danaru", "dnr"),
+    ("danau", "dnu"),
+    ("dandami maria", "daq"),
+    ("dangaléat", "daa"),
+    ("dangaura tharu", "thl"),
+    ("danish", "dan"),
+    ("danish sign language", "dsl"),
+    ("dano", "aso"),
+    ("danois", "dan"),
+    ("dansk", "dan"),
+    ("danu", "dnv"),
+    ("danés", "dan"),
+    ("daonda", "dnd"),
+    ("dar", "dar"),
+    ("dar daju daju", "djc"),
+    ("dar fur daju", "daj"),
+    ("dar sila daju", "dau"),
+    ("darai", "dry"),
+    ("dargwa", "dar"),
+    ("dari", "prs"),
+    ("darkinyung", "xda"),
+    ("darlong", "dln"),
+    ("darmiya", "drd"),
+    ("daro-matu melanau", "dro"),
+    ("dass", "dot"),
+    ("datooga", "tcc"),
+    ("daungwurrung", "dgw"),
+    ("daur", "dta"),
+    ("davawenyo", "daw"),
+    ("dawawa", "dww"),
+    ("dawera-daweloor", "ddw"),
+    ("dawik kui", "dwk"),
+    ("dawro", "dwr"),
+    ("dayi", "dax"),
+    ("dazaga", "dzg"),
+    ("de", "deu"),
+    ("deccan", "dcc"),
+    ("dedua", "ded"),
+    ("defaka", "afn"),
+    ("defi gbe", "gbh"),
+    ("degema", "deg"),
+    ("degenan", "dge"),
+    ("degexit'an", "ing"),
+    ("dehu", "dhv"),
+    ("dehwari", "deh"),
+    ("del", "del"),
+    ("dela-oenale", "row"),
+    ("delaware", "del"),
+    ("delo", "ntr"),
+    ("dema", "dmx"),
+    ("demisa", "dei"),
+    ("demta", "dmy"),
+    ("den", "den"),
+    ("dendi (benin)", "ddn"),
+    ("dendi (central african republic)", "deq"),
+    ("dengese", "dez"),
+    ("dengka", "dnk"),
+    ("deno", "dbb"),
+    ("denya", "anv"),
+    ("dení", "dny"),
+    ("deori", "der"),
+    ("dera (indonesia)", "kbv"),
+    ("dera (nigeria)", "kna"),
+    ("desano", "des"),
+    ("desiya", "dso"),
+    ("deu", "deu"),
+    ("deutsch", "deu"),
+    ("dewas rai", "dwz"),
+    ("dewoin", "dee"),
+    ("dezfuli", "def"),
+    ("dghwede", "dgh"),
+    ("dgr", "dgr"),
+    ("dhaiso", "dhs"),
+    ("dhalandji", "dhl"),
+    ("dhangu-djangu", "dhg"),
+    ("dhanki", "dhn"),
+    ("dhanwar (nepal)", "dhw"),
+    ("dhao", "nfa"),
+    ("dharawal", "tbh"),
+    ("dhargari", "dhr"),
+    ("dharuk", "xdk"),
+    ("dharumbal", "xgm"),
+    ("dhatki", "mki"),
+    ("dhimal", "dhi"),
+    ("dhivehi", "div"),
+    ("dhodia", "dho"),
+    ("dhofari arabic", "adf"),
+    ("dhudhuroa", "ddr"),
+    ("dhundari", "dhd"),
+    ("dhungaloo", "dhx"),
+    ("dhurga", "dhu"),
+    ("dhuwal", "dwu"),
+    ("dhuwaya", "dwy"),
+    ("dibabawon manobo", "mbd"),
+    ("dibiyaso", "dby"),
+    ("dibo", "dio"),
+    ("dibole", "bvx"),
+    ("dicamay agta", "duy"),
+    ("didinga", "did"),
+    ("dido", "ddo"),
+    ("dieri", "dif"),
+    ("digaro-mishmi", "mhu"),
+    ("digo", "dig"),
+    ("dijim-bwilim", "cfa"),
+    ("dilling", "dil"),
+    ("dima", "jma"),
+    ("dimasa", "dis"),
+    ("dimbong", "dii"),
+    ("dime", "dim"),
+    ("dimli (individual language)", "diq"),
+    ("din", "din"),
+    ("ding", "diz"),
+    ("dinka", "din"),
+    ("dirasha", "gdl"),
+    ("diri", "dwa"),
+    ("diriku", "diu"),
+    ("dirim", "dir"),
+    ("disa", "dsi"),
+    ("ditammari", "tbz"),
+    ("ditidaht", "dtd"),
+    ("diuwe", "diy"),
+    ("diuxi-tilantongo mixtec", "xtd"),
+    ("div", "div"),
+    ("dixon reef", "dix"),
+    ("dizin", "mdx"),
+    ("djabugay", "dyy"),
+    ("djabwurrung", "tjw"),
+    ("djadjawurrung", "dja"),
+    ("djambarrpuyngu", "djr"),
+    ("djamindjung", "djd"),
+    ("djangun", "djf"),
+    ("djawi", "djw"),
+    ("djeebbana", "djj"),
+    ("djimini senoufo", "dyi"),
+    ("djinang", "dji"),
+    ("djinba", "djb"),
+    ("djiwarli", "dze"),
+    ("dobel", "kvo"),
+    ("dobu", "dob"),
+    ("doga", "dgg"),
+    ("doghoro", "dgx"),
+    ("dogoso", "dgs"),
+    ("dogosé", "dos"),
+    ("dogri (individual language)", "dgo"),
+    ("dogri (macrolanguage)", "doi"),
+    ("dogrib", "dgr"),
+    ("dogul dom dogon", "dbg"),
+    ("doi", "doi"),
+    ("doka", "dbi"),
+    ("doko-uyanga", "uya"),
+    ("dolgan", "dlg"),
+    ("dolpo", "dre"),
+    ("domaaki", "dmk"),
+    ("domari", "rmt"),
+    ("dombe", "dov"),
+    ("dominican sign language", "doq"),
+    ("dompo", "doy"),
+    ("domu", "dof"),
+    ("domung", "dev"),
+    ("dondo", "dok"),
+    ("dong", "doh"),
+    ("dongo", "doo"),
+    ("dongotono", "ddd"),
+    ("dongshanba lalo", "yik"),
+    ("dongxiang", "sce"),
+    ("donno so dogon", "dds"),
+    ("doondo", "dde"),
+    ("dori'o", "dor"),
+    ("doromu-koki", "kqc"),
+    ("dorze", "doz"),
+    ("doso", "dol"),
+    ("dotyali", "dty"),
+    ("doutai", "tds"),
+    ("doyayo", "dow"),
+    ("drents", "drt"),
+    ("drung", "duu"),
+    ("dsb", "dsb"),
+    ("dua", "dua"),
+    ("duala", "dua"),
+    ("duano", "dup"),
+    ("duau", "dva"),
+    ("dubli", "dub"),
+    ("dubu", "dmu"),
+    ("dugun", "ndu"),
+    ("duguri", "dbm"),
+    ("dugwor", "dme"),
+    ("duhwa", "kbz"),
+    ("duke", "nke"),
+    ("dulbu", "dbo"),
+    ("duli-gey", "duz"),
+    ("dum", "dum"),
+    ("duma", "dma"),
+    ("dumbea", "duf"),
+    ("dumi", "dus"),
+    ("dumpas", "dmv"),
+    ("dumun", "dui"),
+    ("duna", "duc"),
+    ("dungan", "dng"),
+    ("dungmali", "raa"),
+    ("dungra bhil", "duh"),
+    ("dungu", "dbv"),
+    ("dupaninan agta", "duo"),
+    ("dura", "drq"),
+    ("duri", "mvp"),
+    ("duriankere", "dbn"),
+    ("duruma", "dug"),
+    ("duruwa", "pci"),
+    ("dusner", "dsn"),
+    ("dusun deyah", "dun"),
+    ("dusun malang", "duq"),
+    ("dusun witu", "duw"),
+    ("dut", "nld"),
+    ("dutch", "nld"),
+    ("dutch sign language", "dse"),
+    ("dutton world speedwords", "dws"),
+    ("duungooma", "dux"),
+    ("duupa", "dae"),
+    ("duvle", "duv"),
+    ("duwai", "dbp"),
+    ("duwet", "gve"),
+    ("dũya", "ldb"),
+    ("dv", "div"),
+    ("dwang", "nnu"),
+    ("dyaberdyaber", "dyb"),
+    ("dyan", "dya"),
+    ("dyangadi", "dyn"),
+    ("dyirbal", "dbl"),
+    ("dyu", "dyu"),
+    ("dyugun", "dyd"),
+    ("dyula", "dyu"),
+    ("dz", "dzo"),
+    ("dzalakha", "dzl"),
+    ("dzando", "dzn"),
+    ("dzao min", "bpn"),
+    ("dzo", "dzo"),
+    ("dzongkha", "dzo"),
+    ("dzùùngoo", "dnn"),
+    ("e'ma buyang", "yzg"),
+    ("e'ñapa woromaipu", "pbh"),
+    ("early tripuri", "xtr"),
+    ("east ambae", "omb"),
+    ("east berawan", "zbe"),
+    ("east damar", "dmr"),
+    ("east futuna", "fud"),
+    ("east kewa", "kjs"),
+    ("east limba", "lma"),
+    ("east makian", "mky"),
+    ("east masela", "vme"),
+    ("east nyala", "nle"),
+    ("east tarangan", "tre"),
+    ("east yugur", "yuy"),
+    ("eastern abnaki", "aaq"),
+    ("eastern acipa", "acp"),
+    ("eastern apurímac quechua", "qve"),
+    ("eastern arrernte", "aer"),
+    ("eastern balochi", "bgp"),
+    ("eastern bolivian guaraní", "gui"),
+    ("eastern bontok", "ebk"),
+    ("eastern bru", "bru"),
+    ("eastern canadian inuktitut", "ike"),
+    ("eastern cham", "cjm"),
+    ("eastern durango nahuatl", "azd"),
+    ("eastern egyptian bedawi arabic", "avl"),
+    ("eastern frisian", "frs"),
+    ("eastern gorkha tamang", "tge"),
+    ("eastern highland chatino", "cly"),
+    ("eastern highland otomi", "otm"),
+    ("eastern hongshuihe zhuang", "zeh"),
+    ("eastern huasteca nahuatl", "nhe"),
+    ("eastern huishui hmong", "hme"),
+    ("eastern karaboro", "xrb"),
+    ("eastern katu", "ktv"),
+    ("eastern kayah", "eky"),
+    ("eastern keres", "kee"),
+    ("eastern khumi chin", "cek"),
+    ("eastern krahn", "kqo"),
+    ("eastern lalu", "yit"),
+    ("eastern lawa", "lwl"),
+    ("eastern magar", "mgp"),
+    ("eastern maninkakan", "emk"),
+    ("eastern mari", "mhr"),
+    ("eastern maroon creole", "djk"),
+    ("eastern meohang", "emg"),
+    ("eastern minyag", "emq"),
+    ("eastern mnong", "mng"),
+    ("eastern muria", "emu"),
+    ("eastern ngad'a", "nea"),
+    ("eastern nisu", "nos"),
+    ("eastern ojibwa", "ojg"),
+    ("eastern oromo", "hae"),
+    ("eastern parbate kham", "kif"),
+    ("eastern penan", "pez"),
+    ("eastern pomo", "peb"),
+    ("eastern qiandong miao", "hmq"),
+    ("eastern subanen", "sfe"),
+    ("eastern tamang", "taj"),
+    ("eastern tawbuid", "bnj"),
+    ("eastern xiangxi miao", "muq"),
+    ("eastern xwla gbe", "gbx"),
+    ("eastern yiddish", "ydd"),
+    ("ebira", "igb"),
+    ("eblan", "xeb"),
+    ("ebrié", "ebr"),
+    ("ebughu", "ebg"),
+    ("ecuadorian sign language", "ecs"),
+    ("ede cabe", "cbj"),
+    ("ede ica", "ica"),
+    ("ede idaca", "idd"),
+    ("ede ije", "ijj"),
+    ("edera awyu", "awy"),
+    ("edolo", "etr"),
+    ("edomite", "xdm"),
+    ("edopi", "dbf"),
+    ("ee", "ewe"),
+    ("eesti", "est"),
+    ("eesti keel", "est"),
+    ("efai", "efa"),
+    ("efi", "efi"),
+    ("efik", "efi"),
+    ("efutop", "ofu"),
+    ("eggon", "ego"),
+    ("egy", "egy"),
+    ("egypt sign language", "esl"),
+    ("egyptian (ancient)", "egy"),
+    ("egyptian arabic", "arz"),
+    ("ehueun", "ehu"),
+    ("eipomek", "eip"),
+    ("eitiep", "eit"),
+    ("ejagham", "etu"),
+    ("ejamat", "eja"),
+    ("eka", "eka"),
+    ("ekai chin", "cey"),
+    ("ekajuk", "eka"),
+    ("ekari", "ekg"),
+    ("ekit", "eke"),
+    ("ekpeye", "ekp"),
+    ("el", "ell"),
+    ("el alto zapotec", "zpp"),
+    ("el hugeirat", "elh"),
+    ("el molo", "elo"),
+    ("el nayar cora", "crn"),
+    ("elamite", "elx"),
+    ("eleme", "elm"),
+    ("elepi", "ele"),
+    ("elfdalian", "ovd"),
+    ("elip", "ekm"),
+    ("elkei", "elk"),
+    ("ell", "ell"),
+    ("elotepec zapotec", "zte"),
+    ("eloyi", "afo"),
+    ("elseng", "mrf"),
+    ("elx", "elx"),
+    ("elymian", "xly"),
+    ("emae", "mmw"),
+    ("emai-iuleha-ora", "ema"),
+    ("eman", "emn"),
+    ("embaloh", "emb"),
+    ("emberá-baudó", "bdc"),
+    ("emberá-catío", "cto"),
+    ("emberá-chamí", "cmi"),
+    ("emberá-tadó", "tdc"),
+    ("embu", "ebu"),
+    ("emerillon", "eme"),
+    ("emilian", "egl"),
+    ("emplawas", "emw"),
+    ("emumu", "enr"),
+    ("en", "eng"),
+    ("enawené-nawé", "unk"),
+    ("ende", "end"),
+    ("eng", "eng"),
+    ("enga", "enq"),
+    ("engdewu", "ngr"),
+    ("engenni", "enn"),
+    ("enggano", "eno"),
+    ("englisch", "eng"),
+    ("english", "eng"),
+    ("enlhet", "enl"),
+    ("enm", "enm"),
+    ("enrekang", "ptt"),
+    ("enwan (akwa ibom state)", "enw"),
+    ("enwan (edu state)", "env"),
+    ("enxet", "enx"),
+    ("enya", "gey"),
+    ("eo", "epo"),
+    ("epena", "sja"),
+    ("epi-olmec", "xep"),
+    ("epie", "epi"),
+    ("epigraphic mayan", "emy"),
+    ("epo", "epo"),
+    ("eravallan", "era"),
+    ("erave", "kjy"),
+    ("eritai", "ert"),
+    ("erokwanas", "erw"),
+    ("erre", "err"),
+    ("erromintxela", "emx"),
+    ("ersu", "ers"),
+    ("eruwa", "erh"),
+    ("erzya", "myv"),
+    ("es", "spa"),
+    ("esan", "ish"),
+    ("ese ejja", "ese"),
+    ("eshtehardi", "esh"),
+    ("esimbi", "ags"),
+    ("eskayan", "esy"),
+    ("eslovaco", "slk"),
+    ("esloveno", "slv"),
+    ("espagnol", "spa"),
+    ("español", "spa"),
+    ("esperanto", "epo"),
+    ("esselen", "esq"),
+    ("est", "est"),
+    ("estado de méxico otomi", "ots"),
+    ("estonian", "est"),
+    ("estonian sign language", "eso"),
+    ("estonien", "est"),
+    ("estonio", "est"),
+    ("esuma", "esm"),
+    ("et", "est"),
+    ("etchemin", "etc"),
+    ("etebi", "etb"),
+    ("eten", "etx"),
+    ("eteocretan", "ecr"),
+    ("eteocypriot", "ecy"),
+    ("ethiopian sign language", "eth"),
+    ("etkywan", "ich"),
+    ("eton (cameroon)", "eto"),
+    ("eton (vanuatu)", "etn"),
+    ("etruscan", "ett"),
+    ("etulo", "utr"),
+    ("eu", "eus"),
+    ("eus", "eus"),
+    ("evant", "bzz"),
+    ("even", "eve"),
+    ("evenki", "evn"),
+    ("eviya", "gev"),
+    ("ewage-notu", "nou"),
+    ("ewe", "ewe"),
+    ("ewo", "ewo"),
+    ("ewondo", "ewo"),
+    ("extremaduran", "ext"),
+    ("eyak", "eya"),
+    ("ezaa", "eza"),
+    ("fa", "fas"),
+    ("fa d'ambu", "fab"),
+    ("fagani", "faf"),
+    ("faifi", "fif"),
+    ("faire atta", "azt"),
+    ("faita", "faj"),
+    ("faiwol", "fai"),
+    ("fala", "fax"),
+    ("falam chin", "cfm"),
+    ("fali", "fli"),
+    ("faliscan", "xfa"),
+    ("fan", "fan"),
+    ("fanagalo", "fng"),
+    ("fanamaket", "bjp"),
+    ("fanbak", "fnb"),
+    ("fang (cameroon)", "fak"),
+    ("fang (equatorial guinea)", "fan"),
+    ("fania", "fni"),
+    ("fanti", "fat"),
+    ("fao", "fao"),
+    ("far western muria", "fmu"),
+    ("farefare", "gur"),
+    ("faroese", "fao"),
+    ("farsi", "fas"),
+    ("fas", "fas"),
+    ("fasu", "faa"),
+    ("fat", "fat"),
+    ("fataleka", "far"),
+    ("fataluku", "ddg"),
+    ("fayu", "fau"),
+    ("fe'fe'", "fmp"),
+    ("fembe", "agl"),
+    ("fernando po creole english", "fpe"),
+    ("feroge", "fer"),
+    ("ff", "ful"),
+    ("fi", "fin"),
+    ("fij", "fij"),
+    ("fiji hindi", "hif"),
+    ("fijian", "fij"),
+    ("fil", "fil"),
+    ("filipino", "fil"),
+    ("filomena mata-coahuitlán totonac", "tlp"),
+    ("fin", "fin"),
+    ("finland-swedish sign language", "fss"),
+    ("finnish", "fin"),
+    ("finnish sign language", "fse"),
+    ("finnois", "fin"),
+    ("finongan", "fag"),
+    ("finés", "fin"),
+    ("fipa", "fip"),
+    ("firan", "fir"),
+    ("fiwaga", "fiw"),
+    ("fj", "fij"),
+    ("flaaitaal", "fly"),
+    ("flemish", "nld"),
+    ("flinders island", "fln"),
+    ("fo", "fao"),
+    ("foau", "flh"),
+    ("foia foia", "ffi"),
+    ("folopa", "ppo"),
+    ("foma", "fom"),
+    ("fon", "fon"),
+    ("fongoro", "fgr"),
+    ("foodo", "fod"),
+    ("forak", "frq"),
+    ("fordata", "frd"),
+    ("fore", "for"),
+    ("forest enets", "enf"),
+    ("fortsenal", "frt"),
+    ("fr", "fra"),
+    ("fra", "fra"),
+    ("francisco león zoque", "zos"),
+    ("francés", "fra"),
+    ("frankish", "frk"),
+    ("französisch", "fra"),
+    ("français", "fra"),
+    ("fre", "fra"),
+    ("french", "fra"),
+    ("french sign language", "fsl"),
+    ("friulian", "fur"),
+    ("frm", "frm"),
+    ("fro", "fro"),
+    ("frr", "frr"),
+    ("frs", "frs"),
+    ("fry", "fry"),
+    ("ful", "ful"),
+    ("fulah", "ful"),
+    ("fuliiru", "flr"),
+    ("fulniô", "fun"),
+    ("fungwa", "ula"),
+    ("fur", "fur"),
+    ("furu", "fuu"),
+    ("futuna-aniwa", "fut"),
+    ("fuyug", "fuy"),
+    ("fwâi", "fwa"),
+    ("fy", "fry"),
+    ("fyam", "pym"),
+    ("fyer", "fie"),
+    ("ga", "gle"),
+    ("ga'anda", "gqa"),
+    ("ga'dang", "gdg"),
+    ("gaa", "gaa"),
+    ("gaam", "tbi"),
+    ("gabi-gabi", "gbw"),
+    ("gabri", "gab"),
+    ("gabrielino-fernandeño", "xgf"),
+    ("gadang", "gdk"),
+    ("gaddang", "gad"),
+    ("gaddi", "gbk"),
+    ("gade", "ged"),
+    ("gade lohar", "gda"),
+    ("gadjerawang", "gdh"),
+    ("gadsup", "gaj"),
+    ("gaeilge", "gle"),
+    ("gafat", "gft"),
+    ("gagadu", "gbu"),
+    ("gagauz", "gag"),
+    ("gagnoa bété", "btg"),
+    ("gagu", "ggu"),
+    ("gahri", "bfu"),
+    ("gaikundi", "gbf"),
+    ("gail", "gic"),
+    ("gaina", "gcn"),
+    ("galambu", "glo"),
+    ("galatian", "xga"),
+    ("galela", "gbi"),
+    ("galeya", "gar"),
+    ("galibi carib", "car"),
+    ("galice", "gce"),
+    ("galician", "glg"),
+    ("galindan", "xgl"),
+    ("gallurese sardinian", "sdn"),
+    ("galo", "adl"),
+    ("galolen", "gal"),
+    ("gamale kham", "kgj"),
+    ("gambera", "gma"),
+    ("gambian wolof", "wof"),
+    ("gamilaraay", "kld"),
+    ("gamit", "gbl"),
+    ("gamkonora", "gak"),
+    ("gamo", "gmv"),
+    ("gamo-ningi", "bte"),
+    ("gan chinese", "gan"),
+    ("gana", "gnq"),
+    ("ganang", "gne"),
+    ("ganda", "lug"),
+    ("gane", "gzn"),
+    ("ganggalida", "gcd"),
+    ("ganglau", "ggl"),
+    ("gangte", "gnb"),
+    ("gangulu", "gnl"),
+    ("gants", "gao"),
+    ("ganza", "gza"),
+    ("ganzi", "gnz"),
+    ("gapapaiwa", "pwg"),
+    ("garhwali", "gbm"),
+    ("garifuna", "cab"),
+    ("garig-ilgar", "ilg"),
+    ("garingbal", "xgi"),
+    ("garlali", "gll"),
+    ("garo", "grt"),
+    ("garre", "gex"),
+    ("garrwa", "wrk"),
+    ("garus", "gyb"),
+    ("garza", "xgr"),
+    ("gata'", "gaq"),
+    ("gavak", "dmc"),
+    ("gavar", "gou"),
+    ("gavião do jiparaná", "gvo"),
+    ("gawar-bati", "gwt"),
+    ("gawri", "gwc"),
+    ("gawwada", "gwd"),
+    ("gay", "gay"),
+    ("gayil", "gyl"),
+    ("gayo", "gay"),
+    ("gazi", "gzi"),
+    ("gaɓogbo", "gie"),
+    ("gba", "gba"),
+    ("gbagyi", "gbr"),
+    ("gbanu", "gbv"),
+    ("gbanziri", "gbg"),
+    ("gbari", "gby"),
+    ("gbaya (central african republic)", "gba"),
+    ("gbaya (sudan)", "krs"),
+    ("gbaya-bossangoa", "gbp"),
+    ("gbaya-bozoum", "gbq"),
+    ("gbaya-mbodomo", "gmm"),
+    ("gbayi", "gyg"),
+    ("gbesi gbe", "gbs"),
+    ("gbii", "ggb"),
+    ("gbin", "xgb"),
+    ("gbiri-niragu", "grh"),
+    ("gboloo grebo", "gec"),
+    ("gd", "gla"),
+    ("geba karen", "kvq"),
+    ("gebe", "gei"),
+    ("gedaged", "gdd"),
+    ("gedeo", "drs"),
+    ("geez", "gez"),
+    ("geji", "gyz"),
+    ("geko karen", "ghk"),
+    ("gela", "nlg"),
+    ("geme", "geq"),
+    ("gende", "gaf"),
+    ("gengle", "geg"),
+    ("geo", "kat"),
+    ("georgian", "kat"),
+    ("georgiano", "kat"),
+    ("gepo", "ygp"),
+    ("ger", "deu"),
+    ("gera", "gew"),
+    ("gerai", "gef"),
+    ("german", "deu"),
+    ("german sign language", "gsg"),
+    ("geruma", "gea"),
+    ("geser-gorom", "ges"),
+    ("gez", "gez"),
+    ("ghadamès", "gha"),
+    ("ghanaian pidgin english", "gpe"),
+    ("ghanaian sign language", "gse"),
+    ("ghandruk sign language", "gds"),
+    ("ghanongga", "ghn"),
+    ("ghari", "gri"),
+    ("ghayavi", "bmk"),
+    ("gheg albanian", "aln"),
+    ("ghera", "ghr"),
+    ("ghodoberi", "gdo"),
+    ("ghomara", "gho"),
+    ("ghomálá'", "bbj"),
+    ("ghotuo", "aaa"),
+    ("ghulfan", "ghl"),
+    ("giangan", "bgi"),
+    ("gibanawa", "gib"),
+    ("gidar", "gid"),
+    ("giiwo", "kks"),
+    ("gikyode", "acd"),
+    ("gil", "gil"),
+    ("gilaki", "glk"),
+    ("gilbertese", "gil"),
+    ("gilima", "gix"),
+    ("gilyak", "niv"),
+    ("gimi (eastern highlands)", "gim"),
+    ("gimi (west new britain)", "gip"),
+    ("gimme", "kmp"),
+    ("gimnime", "gmn"),
+    ("ginuman", "gnm"),
+    ("ginyanga", "ayg"),
+    ("girawa", "bbr"),
+    ("girirra", "gii"),
+    ("giryama", "nyf"),
+    ("githabul", "gih"),
+    ("gitonga", "toh"),
+    ("gitua", "ggt"),
+    ("gitxsan", "git"),
+    ("giyug", "giy"),
+    ("gizrra", "tof"),
+    ("gl", "glg"),
+    ("gla", "gla"),
+    ("glaro-twabo", "glr"),
+    ("glavda", "glw"),
+    ("gle", "gle"),
+    ("glg", "glg"),
+    ("glio-oubi", "oub"),
+    ("glv", "glv"),
+    ("gmh", "gmh"),
+    ("gn", "grn"),
+    ("gnau", "gnu"),
+    ("goan konkani", "gom"),
+    ("goaria", "gig"),
+    ("gobasi", "goi"),
+    ("gobu", "gox"),
+    ("godié", "god"),
+    ("godwari", "gdx"),
+    ("goemai", "ank"),
+    ("gofa", "gof"),
+    ("gogo", "gog"),
+    ("gogodala", "ggw"),
+    ("goh", "goh"),
+    ("gokana", "gkn"),
+    ("gola", "gol"),
+    ("golin", "gvf"),
+    ("golpa", "lja"),
+    ("gon", "gon"),
+    ("gondi", "gon"),
+    ("gone dau", "goo"),
+    ("gongduk", "goe"),
+    ("gonja", "gjn"),
+    ("gooniyandi", "gni"),
+    ("gor", "gor"),
+    ("gorakor", "goc"),
+    ("gorap", "goq"),
+    ("goreng", "xgg"),
+    ("gorontalo", "gor"),
+    ("gorovu", "grq"),
+    ("gorowa", "gow"),
+    ("got", "got"),
+    ("gothic", "got"),
+    ("goundo", "goy"),
+    ("gourmanchéma", "gux"),
+    ("gowlan", "goj"),
+    ("gowli", "gok"),
+    ("gowro", "gwf"),
+    ("gozarkhani", "goz"),
+    ("grangali", "nli"),
+    ("grass koiari", "kbk"),
+    ("grb", "grb"),
+    ("grc", "grc"),
+    ("gre", "ell"),
+    ("grebo", "grb"),
+    ("grec moderne", "ell"),
+    ("greek", "ell"),
+    ("greek sign language", "gss"),
+    ("green gelao", "giq"),
+    ("grenadian creole english", "gcl"),
+    ("gresi", "grs"),
+    ("griego", "ell"),
+    ("grn", "grn"),
+    ("groma", "gro"),
+    ("gronings", "gos"),
+    ("gros ventre", "ats"),
+    ("gsw", "gsw"),
+    ("gu", "guj"),
+    ("guadeloupean creole french", "gcf"),
+    ("guahibo", "guh"),
+    ("guajajára", "gub"),
+    ("guajá", "gvj"),
+    ("guambiano", "gum"),
+    ("guana (brazil)", "gqn"),
+    ("guana (paraguay)", "gva"),
+    ("guanano", "gvc"),
+    ("guanche", "gnc"),
+    ("guanyinqiao", "jiq"),
+    ("guarani", "grn"),
+    ("guarayu", "gyr"),
+    ("guarequena", "gae"),
+    ("guatemalan sign language", "gsm"),
+    ("guató", "gta"),
+    ("guayabero", "guo"),
+    ("gudang", "xgd"),
+    ("gudanji", "nji"),
+    ("gude", "gde"),
+    ("gudu", "gdu"),
+    ("guduf-gava", "gdf"),
+    ("guerrero amuzgo", "amu"),
+    ("guerrero nahuatl", "ngu"),
+    ("guevea de humboldt zapotec", "zpg"),
+    ("gugadj", "ggd"),
+    ("gugu badhun", "gdc"),
+    ("gugu warra", "wrw"),
+    ("gugubera", "kkp"),
+    ("guhu-samane", "ghs"),
+    ("guianese creole french", "gcr"),
+    ("guibei zhuang", "zgb"),
+    ("guiberoua béte", "bet"),
+    ("guibian zhuang", "zgn"),
+    ("guinea kpelle", "gkp"),
+    ("guinean sign language", "gus"),
+    ("guiqiong", "gqi"),
+    ("guj", "guj"),
+    ("gujarati", "guj"),
+    ("gujari", "gju"),
+    ("gula (central african republic)", "kcm"),
+    ("gula (chad)", "glu"),
+    ("gula iro", "glj"),
+    ("gula'alaa", "gmb"),
+    ("gulay", "gvl"),
+    ("gule", "gly"),
+    ("gulf arabic", "afb"),
+    ("gumalu", "gmu"),
+    ("gumatj", "gnn"),
+    ("gumawana", "gvs"),
+    ("gumuz", "guk"),
+    ("gundi", "gdi"),
+    ("gunditjmara", "gjm"),
+    ("gundungurra", "xrd"),
+    ("gungabula", "gyf"),
+    ("gungu", "rub"),
+    ("guntai", "gnt"),
+    ("gunwinggu", "gup"),
+    ("gunya", "gyy"),
+    ("gupa-abawa", "gpa"),
+    ("gupapuyngu", "guf"),
+    ("guramalum", "grz"),
+    ("gurani", "hac"),
+    ("gurdjar", "gdj"),
+    ("gureng gureng", "gnr"),
+    ("gurgula", "ggg"),
+    ("guriaso", "grx"),
+    ("gurindji", "gue"),
+    ("gurindji kriol", "gjr"),
+    ("gurmana", "gvm"),
+    ("guro", "goa"),
+    ("gurr-goni", "gge"),
+    ("gurung", "gvr"),
+    ("guruntum-mbaaru", "grd"),
+    ("gusii", "guz"),
+    ("gusilay", "gsl"),
+    ("guugu yimidhirr", "kky"),
+    ("guwa", "xgw"),
+    ("guwamu", "gwu"),
+    ("guya", "gka"),
+    ("guyanese creole english", "gyn"),
+    ("guyani", "gvy"),
+    ("gv", "glv"),
+    ("gvoko", "ngs"),
+    ("gwahatike", "dah"),
+    ("gwak", "jgk"),
+    ("gwamhi-wuri", "bga"),
+    ("gwandara", "gwn"),
+    ("gweda", "grw"),
+    ("gweno", "gwe"),
+    ("gwere", "gwr"),
+    ("gwi", "gwi"),
+    ("gwichʼin", "gwi"),
+    ("gyalsumdo", "gyo"),
+    ("gyele", "gyi"),
+    ("gyem", "gye"),
+    ("géorgien", "kat"),
+    ("güilá zapotec", "ztu"),
+    ("gāndhārī", "pgd"),
+    ("ha", "hau"),
+    ("habu", "hbu"),
+    ("hadiyya", "hdy"),
+    ("hadothi", "hoj"),
+    ("hadrami", "xhd"),
+    ("hadrami arabic", "ayh"),
+    ("hadza", "hts"),
+    ("haeke", "aek"),
+    ("hahon", "hah"),
+    ("hai", "hai"),
+    ("haida", "hai"),
+    ("haigwai", "hgw"),
+    ("haiphong sign language", "haf"),
+    ("haisla", "has"),
+    ("haitian", "hat"),
+    ("haitian vodoun culture language", "hvc"),
+    ("haiǁom", "hgm"),
+    ("haji", "hji"),
+    ("hajong", "haj"),
+    ("hakha chin", "cnh"),
+    ("hakka chinese", "hak"),
+    ("hakö", "hao"),
+    ("halang", "hal"),
+    ("halang doan", "hld"),
+    ("halbi", "hlb"),
+    ("halh mongolian", "khk"),
+    ("halia", "hla"),
+    ("halkomelem", "hur"),
+    ("hamap", "hmu"),
+    ("hamba", "hba"),
+    ("hamer-banna", "amf"),
+    ("hamtai", "hmt"),
+    ("hanga", "hag"),
+    ("hanga hundi", "wos"),
+    ("hangaza", "han"),
+    ("hani", "hni"),
+    ("hano", "lml"),
+    ("hanoi sign language", "hab"),
+    ("hanunoo", "hnn"),
+    ("harami", "xha"),
+    ("harari", "har"),
+    ("harijan kinnauri", "kjo"),
+    ("haroi", "hro"),
+    ("harsusi", "hss"),
+    ("haruai", "tmd"),
+    ("haruku", "hrk"),
+    ("haryanvi", "bgc"),
+    ("harzani", "hrz"),
+    ("hasha", "ybj"),
+    ("hassaniyya", "mey"),
+    ("hat", "hat"),
+    ("hatam", "had"),
+    ("hattic", "xht"),
+    ("hau", "hau"),
+    ("hausa", "hau"),
+    ("hausa sign language", "hsl"),
+    ("havasupai-walapai-yavapai", "yuf"),
+    ("haveke", "hvk"),
+    ("havu", "hav"),
+    ("haw", "haw"),
+    ("hawai'i creole english", "hwc"),
+    ("hawai'i sign language (hsl)", "hps"),
+    ("hawaiian", "haw"),
+    ("haya", "hay"),
+    ("hazaragi", "haz"),
+    ("he", "heb"),
+    ("heb", "heb"),
+    ("hebreo", "heb"),
+    ("hebrew", "heb"),
+    ("hehe", "heh"),
+    ("heiban", "hbn"),
+    ("heiltsuk", "hei"),
+    ("helong", "heg"),
+    ("hema", "nix"),
+    ("hemba", "hem"),
+    ("her", "her"),
+    ("herdé", "hed"),
+    ("herero", "her"),
+    ("hermit", "llf"),
+    ("hernican", "xhr"),
+    ("hewa", "ham"),
+    ("heyo", "auk"),
+    ("hi", "hin"),
+    ("hiberno-scottish gaelic", "ghc"),
+    ("hibito", "hib"),
+    ("hidatsa", "hid"),
+    ("hieroglyphic luwian", "hlu"),
+    ("higaonon", "mba"),
+    ("highland konjo", "kjk"),
+    ("highland oaxaca chontal", "chd"),
+    ("highland popoluca", "poi"),
+    ("highland puebla nahuatl", "azz"),
+    ("highland totonac", "tos"),
+    ("hijazi arabic", "acw"),
+    ("hijuk", "hij"),
+    ("hil", "hil"),
+    ("hiligaynon", "hil"),
+    ("himarimã", "hir"),
+    ("hin", "hin"),
+    ("hindi", "hin"),
+    ("hinduri", "hii"),
+    ("hinukh", "gin"),
+    ("hiri motu", "hmo"),
+    ("hit", "hit"),
+    ("hittite", "hit"),
+    ("hitu", "htu"),
+    ("hixkaryána", "hix"),
+    ("hlai", "lic"),
+    ("hlepho phowa", "yhl"),
+    ("hlersu", "hle"),
+    ("hmar", "hmr"),
+    ("hmn", "hmn"),
+    ("hmo", "hmo"),
+    ("hmong", "hmn"),
+    ("hmong daw", "mww"),
+    ("hmong don", "hmf"),
+    ("hmong dô", "hmv"),
+    ("hmong njua", "hnj"),
+    ("hmong shua", "hmz"),
+    ("hmwaveke", "mrk"),
+    ("ho", "hmo"),
+    ("ho chi minh city sign language", "hos"),
+    ("ho-chunk", "win"),
+    ("hoava", "hoa"),
+    ("hobyót", "hoh"),
+    ("hoia hoia", "hhi"),
+    ("holikachuk", "hoi"),
+    ("holiya", "hoy"),
+    ("holma", "hod"),
+    ("holoholo", "hoo"),
+    ("holu", "hol"),
+    ("homa", "hom"),
+    ("honduras sign language", "hds"),
+    ("hong kong sign language", "hks"),
+    ("hongrois", "hun"),
+    ("honi", "how"),
+    ("hopi", "hop"),
+    ("horned miao", "hrm"),
+    ("horo", "hor"),
+    ("horom", "hoe"),
+    ("horpa", "ero"),
+    ("hote", "hot"),
+    ("hoti", "hti"),
+    ("hovongan", "hov"),
+    ("hoyahoya", "hhy"),
+    ("hozo", "hoz"),
+    ("hpon", "hpo"),
+    ("hr", "hrv"),
+    ("hrangkhol", "hra"),
+    ("hruso", "hru"),
+    ("hrv", "hrv"),
+    ("hrvatski", "hrv"),
+    ("hsb", "hsb"),
+    ("ht", "hat"),
+    ("hu", "hun"),
+    ("huachipaeri", "hug"),
+    ("huallaga huánuco quechua", "qub"),
+    ("huamalíes-dos de mayo huánuco quechua", "qvh"),
+    ("huambisa", "hub"),
+    ("huarijio", "var"),
+    ("huastec", "hus"),
+    ("huaulu", "hud"),
+    ("huautla mazatec", "mau"),
+    ("huaxcaleca nahuatl", "nhq"),
+    ("huaylas ancash quechua", "qwh"),
+    ("huaylla wanca quechua", "qvw"),
+    ("huba", "hbb"),
+    ("huehuetla tepehua", "tee"),
+    ("huichol", "hch"),
+    ("huilliche", "huh"),
+    ("huitepec mixtec", "mxs"),
+    ("huizhou chinese", "czh"),
+    ("hukumina", "huw"),
+    ("hula", "hul"),
+    ("hulaulá", "huy"),
+    ("huli", "hui"),
+    ("hulung", "huk"),
+    ("humburi senni songhay", "hmb"),
+    ("humene", "huf"),
+    ("humla", "hut"),
+    ("hun", "hun"),
+    ("hunde", "hke"),
+    ("hung", "hnu"),
+    ("hungana", "hum"),
+    ("hungarian", "hun"),
+    ("hungarian sign language", "hsh"),
+    ("hungu", "hng"),
+    ("hunjara-kaina ke", "hkk"),
+    ("hunnic", "xhc"),
+    ("hunsrik", "hrx"),
+    ("hunzib", "huz"),
+    ("hup", "hup"),
+    ("hupa", "hup"),
+    ("hupdë", "jup"),
+    ("hupla", "hap"),
+    ("hurrian", "xhu"),
+    ("hutterite german", "geh"),
+    ("hwana", "hwo"),
+    ("hy", "hye"),
+    ("hyam", "jab"),
+    ("hye", "hye"),
+    ("hyolmo", "scp"),
+    ("hz", "her"),
+    ("hébreu", "heb"),
+    ("hértevin", "hrt"),
+    ("hõne", "juh"),
+    ("húngaro", "hun"),
+    ("i-wak", "iwk"),
+    ("ia", "ina"),
+    ("iaai", "iai"),
+    ("iamalele", "yml"),
+    ("iatmul", "ian"),
+    ("iba", "iba"),
+    ("ibali teke", "tek"),
+    ("ibaloi", "ibl"),
+    ("iban", "iba"),
+    ("ibanag", "ibg"),
+    ("ibani", "iby"),
+    ("ibatan", "ivb"),
+    ("iberian", "xib"),
+    ("ibibio", "ibb"),
+    ("ibino", "ibn"),
+    ("ibo", "ibo"),
+    ("ibuoro", "ibr"),
+    ("ice", "isl"),
+    ("icelandic", "isl"),
+    ("icelandic sign language", "icl"),
+    ("iceve-maci", "bec"),
+    ("id", "ind"),
+    ("ida'an", "dbj"),
+    ("idakho-isukha-tiriki", "ida"),
+    ("idaté", "idt"),
+    ("idere", "ide"),
+    ("idesa", "ids"),
+    ("idioma birmano", "mya"),
+    ("idioma filipino", "fil"),
+    ("ido", "ido"),
+    ("idoma", "idu"),
+    ("idon", "idc"),
+    ("idu-mishmi", "clk"),
+    ("iduna", "viv"),
+    ("ie", "ile"),
+    ("ig", "ibo"),
+    ("igala", "igl"),
+    ("igana", "igg"),
+    ("igbo", "ibo"),
+    ("igede", "ige"),
+    ("ignaciano", "ign"),
+    ("iguta", "nar"),
+    ("igwe", "igw"),
+    ("iha based pidgin", "ihb"),
+    ("ihievbe", "ihi"),
+    ("ii", "iii"),
+    ("iii", "iii"),
+    ("ik", "ipk"),
+    ("ikaranggal", "ikr"),
+    ("ikizu", "ikz"),
+    ("ikobi", "meb"),
+    ("ikoma-nata-isenye", "ntk"),
+    ("ikpeng", "txi"),
+    ("ikpeshi", "ikp"),
+    ("ikposo", "kpo"),
+    ("iku", "iku"),
+    ("iku-gora-ankwa", "ikv"),
+    ("ikulu", "ikl"),
+    ("ikwere", "ikw"),
+    ("ikwo", "iqw"),
+    ("ile", "ile"),
+    ("ile ape", "ila"),
+    ("ili turki", "ili"),
+    ("ili'uun", "ilu"),
+    ("ilianen manobo", "mbi"),
+    ("illyrian", "xil"),
+    ("ilo", "ilo"),
+    ("iloko", "ilo"),
+    ("ilongot", "ilk"),
+    ("ilue", "ilv"),
+    ("ilwana", "mlk"),
+    ("imbabura highland quichua", "qvi"),
+    ("imbongu", "imo"),
+    ("imonda", "imn"),
+    ("imroing", "imr"),
+    ("in", "ind"),
+    ("ina", "ina"),
+    ("inabaknon", "abx"),
+    ("inapang", "mzu"),
+    ("inari sami", "smn"),
+    ("ind", "ind"),
+    ("indian sign language", "ins"),
+    ("indo-portuguese", "idb"),
+    ("indonesian", "ind"),
+    ("indonesian bajau", "bdl"),
+    ("indonesian sign language", "inl"),
+    ("indonesio", "ind"),
+    ("indonésien", "ind"),
+    ("indri", "idr"),
+    ("indus kohistani", "mvy"),
+    ("indus valley language", "xiv"),
+    ("inebu one", "oin"),
+    ("ineseño", "inz"),
+    ("inga", "inb"),
+    ("inglés", "eng"),
+    ("ingrian", "izh"),
+    ("ingush", "inh"),
+    ("inh", "inh"),
+    ("inlaod itneg", "iti"),
+    ("innu", "moe"),
+    ("inoke-yate", "ino"),
+    ("inonhan", "loc"),
+    ("inor", "ior"),
+    ("inpui naga", "nkf"),
+    ("interglossa", "igs"),
+    ("interlingua (international auxiliary language association)", "ina"),
+    ("interlingue", "ile"),
+    ("international sign", "ils"),
+    ("intha", "int"),
+    ("inuinnaqtun", "ikt"),
+    ("inuit sign language", "iks"),
+    ("inuktitut", "iku"),
+    ("inupiaq", "ipk"),
+    ("io", "ido"),
+    ("iowa-oto", "iow"),
+    ("ipalapa amuzgo", "azm"),
+    ("ipiko", "ipo"),
+    ("ipili", "ipi"),
+    ("ipk", "ipk"),
+    ("ipulo", "ass"),
+    ("iquito", "iqu"),
+    ("iranian", "fas"),
+    ("iranian persian", "pes"),
+    ("iranun (malaysia)", "ilm"),
+    ("iranun (philippines)", "ilp"),
+    ("iraqw", "irk"),
+    ("irarutu", "irh"),
+    ("iraya", "iry"),
+    ("iresim", "ire"),
+    ("irish", "gle"),
+    ("irish sign language", "isg"),
+    ("irlandais", "gle"),
+    ("irlandés", "gle"),
+    ("irula", "iru"),
+    ("irántxe", "irn"),
+    ("is", "isl"),
+    ("isabi", "isa"),
+    ("isanzu", "isn"),
+    ("isarog agta", "agk"),
+    ("isconahua", "isc"),
+    ("isebe", "igo"),
+    ("isekiri", "its"),
+    ("ishkashimi", "isk"),
+    ("isinai", "inn"),
+    ("isirawa", "srl"),
+    ("isizulu", "zul"),
+    ("isl", "isl"),
+    ("island carib", "crb"),
+    ("islandais", "isl"),
+    ("islander creole english", "icr"),
+    ("islandés", "isl"),
+    ("isnag", "isd"),
+    ("isoko", "iso"),
+    ("israeli sign language", "isr"),
+    ("isthmus mixe", "mir"),
+    ("isthmus zapotec", "zai"),
+    ("isthmus-cosoleacaque nahuatl", "nhk"),
+    ("isthmus-mecayapan nahuatl", "nhx"),
+    ("isthmus-pajapan nahuatl", "nhp"),
+    ("istriot", "ist"),
+    ("istro romanian", "ruo"),
+    ("isu (fako division)", "szv"),
+    ("isu (menchum division)", "isu"),
+    ("it", "ita"),
+    ("ita", "ita"),
+    ("italian", "ita"),
+    ("italian sign language", "ise"),
+    ("italiano", "ita"),
+    ("italien", "ita"),
+    ("itawit", "itv"),
+    ("itelmen", "itl"),
+    ("itene", "ite"),
+    ("iteri", "itr"),
+    ("itik", "itx"),
+    ("itonama", "ito"),
+    ("itu mbon uzo", "itm"),
+    ("itundujia mixtec", "mce"),
+    ("itzá", "itz"),
+    ("iu", "iku"),
+    ("iu mien", "ium"),
+    ("ivatan", "ivv"),
+    ("ivbie north-okpela-arhe", "atg"),
+    ("iw", "heb"),
+    ("iwaidja", "ibd"),
+    ("iwal", "kbm"),
+    ("iwam", "iwm"),
+    ("iwur", "iwo"),
+    ("ixcatec", "ixc"),
+    ("ixcatlán mazatec", "mzi"),
+    ("ixil", "ixl"),
+    ("ixtayutla mixtec", "vmj"),
+    ("ixtenco otomi", "otz"),
+    ("iyayu", "iya"),
+    ("iyive", "uiv"),
+    ("iyo'wujwa chorote", "crq"),
+    ("iyojwa'ja chorote", "crt"),
+    ("izere", "izr"),
+    ("izii", "izz"),
+    ("izon", "ijc"),
+    ("izora", "cbo"),
+    ("iñapari", "inp"),
+    ("ja", "jpn"),
+    ("jabutí", "jbt"),
+    ("jadgali", "jdg"),
+    ("jah hut", "jah"),
+    ("jahanka", "jad"),
+    ("jair awyu", "awv"),
+    ("jaitmatang", "xjt"),
+    ("jakati", "jat"),
+    ("jakattoe", "jrt"),
+    ("jakun", "jak"),
+    ("jalapa de díaz mazatec", "maj"),
+    ("jalkunan", "bxl"),
+    ("jamaican country sign language", "jcs"),
+    ("jamaican creole english", "jam"),
+    ("jamaican sign language", "jls"),
+    ("jamamadí", "jaa"),
+    ("jambi malay", "jax"),
+    ("jamiltepec mixtec", "mxt"),
+    ("jamsay dogon", "djm"),
+    ("jandai", "jan"),
+    ("jandavra", "jnd"),
+    ("jangkang", "djo"),
+    ("jangshung", "jna"),
+    ("janji", "jni"),
+    ("japanese", "jpn"),
+    ("japanese sign language", "jsl"),
+    ("japonais", "jpn"),
+    ("japonés", "jpn"),
+    ("japrería", "jru"),
+    ("jaqaru", "jqr"),
+    ("jara", "jaf"),
+    ("jarai", "jra"),
+    ("jarawa (india)", "anq"),
+    ("jaru", "ddj"),
+    ("jauja wanca quechua", "qxw"),
+    ("jaunsari", "jns"),
+    ("jav", "jav"),
+    ("javanese", "jav"),
+    ("javindo", "jvd"),
+    ("jaw", "jav"),
+    ("jawa", "jav"),
+    ("jawe", "jaz"),
+    ("jawoyn", "djn"),
+    ("jaya", "jyy"),
+    ("jbo", "jbo"),
+    ("jebero", "jeb"),
+    ("jehai", "jhi"),
+    ("jejueo", "jje"),
+    ("jemez", "tow"),
+    ("jenaama bozo", "bze"),
+    ("jennu kurumba", "xuj"),
+    ("jere", "jer"),
+    ("jeri kuo", "jek"),
+    ("jerung", "jee"),
+    ("jewish babylonian aramaic (ca. 200-1200 ce)", "tmr"),
+    ("jewish palestinian aramaic", "jpa"),
+    ("jhankot sign language", "jhs"),
+    ("ji", "yid"),
+    ("jiamao", "jio"),
+    ("jiarong", "jya"),
+    ("jiba", "juo"),
+    ("jibu", "jib"),
+    ("jicarilla apache", "apj"),
+    ("jiiddu", "jii"),
+    ("jilbe", "jie"),
+    ("jilim", "jil"),
+    ("jimi (cameroon)", "jim"),
+    ("jimi (nigeria)", "jmi"),
+    ("jina", "jia"),
+    ("jingulu", "jig"),
+    ("jinyu chinese", "cjy"),
+    ("jiongnai bunu", "pnu"),
+    ("jirel", "jul"),
+    ("jiru", "jrr"),
+    ("jita", "jit"),
+    ("joba", "job"),
+    ("jofotek-bromnya", "jbr"),
+    ("jogi", "jog"),
+    ("jola-fonyi", "dyo"),
+    ("jola-kasa", "csk"),
+    ("jonkor bourmataguil", "jeu"),
+    ("jordanian sign language", "jos"),
+    ("jorá", "jor"),
+    ("jowulu", "jow"),
+    ("jpn", "jpn"),
+    ("jpr", "jpr"),
+    ("jrb", "jrb"),
+    ("juang", "jun"),
+    ("judeo-arabic", "jrb"),
+    ("judeo-berber", "jbe"),
+    ("judeo-georgian", "jge"),
+    ("judeo-iraqi arabic", "yhd"),
+    ("judeo-italian", "itk"),
+    ("judeo-moroccan arabic", "aju"),
+    ("judeo-persian", "jpr"),
+    ("judeo-tat", "jdt"),
+    ("judeo-tripolitanian arabic", "yud"),
+    ("judeo-tunisian arabic", "ajt"),
+    ("judeo-yemeni arabic", "jye"),
+    ("jukun takum", "jbu"),
+    ("jumjum", "jum"),
+    ("jumla sign language", "jus"),
+    ("jumli", "jml"),
+    ("jungle inga", "inj"),
+    ("juquila mixe", "mxq"),
+    ("jur modo", "bex"),
+    ("juray", "juy"),
+    ("jurchen", "juc"),
+    ("jurúna", "jur"),
+    ("jutish", "jut"),
+    ("juwal", "mwb"),
+    ("juxtlahuaca mixtec", "vmc"),
+    ("juǀʼhoan", "ktz"),
+    ("jv", "jav"),
+    ("jw", "jav"),
+    ("jwira-pepesa", "jwi"),
+    ("jèrriais", "nrf"),
+    ("júma", "jua"),
+    ("k'iche'", "quc"),
+    ("ka", "kat"),
+    ("kaa", "kaa"),
+    ("kaamba", "xku"),
+    ("kaan", "ldl"),
+    ("kaang chin", "ckn"),
+    ("kaansa", "gna"),
+    ("kab", "kab"),
+    ("kaba", "ksp"),
+    ("kabalai", "kvf"),
+    ("kabardian", "kbd"),
+    ("kabatei", "xkp"),
+    ("kabiyè", "kbp"),
+    ("kabola", "klz"),
+    ("kabore one", "onk"),
+    ("kabras", "lkb"),
+    ("kaburi", "uka"),
+    ("kabutra", "kbu"),
+    ("kabuverdianu", "kea"),
+    ("kabwa", "cwa"),
+    ("kabwari", "kcw"),
+    ("kabyle", "kab"),
+    ("kac", "kac"),
+    ("kachama-ganjule", "kcx"),
+    ("kachari", "xac"),
+    ("kachhi", "kfr"),
+    ("kachi koli", "gjk"),
+    ("kachin", "kac"),
+    ("kacipo-bale suri", "koe"),
+    ("kaco'", "xkk"),
+    ("kadai", "kzd"),
+    ("kadar", "kej"),
+    ("kadaru", "kdu"),
+    ("kadazan dusun", "dtp"),
+    ("kadiwéu", "kbc"),
+    ("kadu", "zkd"),
+    ("kadung", "dkg"),
+    ("kaduo", "ktp"),
+    ("kaeku", "kkq"),
+    ("kaera", "jka"),
+    ("kafa", "kbr"),
+    ("kafoa", "kpu"),
+    ("kagan kalagan", "kll"),
+    ("kagate", "syw"),
+    ("kagayanen", "cgc"),
+    ("kagoma", "kdm"),
+    ("kagoro", "xkg"),
+    ("kagulu", "kki"),
+    ("kahe", "hka"),
+    ("kahua", "agw"),
+    ("kaian", "kct"),
+    ("kaibobo", "kzb"),
+    ("kaidipang", "kzp"),
+    ("kaiep", "kbw"),
+    ("kaikadi", "kep"),
+    ("kaikavian literary language", "kjv"),
+    ("kaike", "kzq"),
+    ("kaimbulawa", "zka"),
+    ("kaimbé", "xai"),
+    ("kaingang", "kgp"),
+    ("kairak", "ckr"),
+    ("kairiru", "kxa"),
+    ("kairui-midiki", "krd"),
+    ("kais", "kzm"),
+    ("kaivi", "kce"),
+    ("kaiwá", "kgk"),
+    ("kaiy", "tcq"),
+    ("kajakse", "ckq"),
+    ("kajali", "xkj"),
+    ("kajaman", "kag"),
+    ("kakabai", "kqf"),
+    ("kakabe", "kke"),
+    ("kakanda", "kka"),
+    ("kaki ae", "tbd"),
+    ("kako", "kkj"),
+    ("kakwa", "keo"),
+    ("kal", "kal"),
+    ("kala lagaw ya", "mwp"),
+    ("kalaallisut", "kal"),
+    ("kalaamaya", "lkm"),
+    ("kalabakan", "kve"),
+    ("kalabari", "ijn"),
+    ("kalabra", "kzz"),
+    ("kalagan", "kqe"),
+    ("kalaktang monpa", "kkf"),
+    ("kalam", "kmh"),
+    ("kalamsé", "knz"),
+    ("kalanadi", "wkl"),
+    ("kalanga", "kck"),
+    ("kalanguya", "kak"),
+    ("kalao", "kly"),
+    ("kalapuya", "kyl"),
+    ("kalarko", "kba"),
+    ("kalasha", "kls"),
+    ("kalenjin", "kln"),
+    ("kalispel-pend d'oreille", "fla"),
+    ("kalkoti", "xka"),
+    ("kalkutung", "ktg"),
+    ("kalmyk", "xal"),
+    ("kalo finnish romani", "rmf"),
+    ("kalou", "ywa"),
+    ("kaluli", "bco"),
+    ("kalumpang", "kli"),
+    ("kam", "kam"),
+    ("kamakan", "vkm"),
+    ("kamang", "woi"),
+    ("kamano", "kbq"),
+    ("kamantan", "kci"),
+    ("kamar", "keq"),
+    ("kamara", "jmr"),
+    ("kamarian", "kzx"),
+    ("kamaru", "kgx"),
+    ("kamas", "xas"),
+    ("kamasa", "klp"),
+    ("kamasau", "kms"),
+    ("kamayo", "kyk"),
+    ("kamayurá", "kay"),
+    ("kamba (kenya)", "kam"),
+    ("kambaata", "ktb"),
+    ("kambaira", "kyy"),
+    ("kambera", "xbr"),
+    ("kamberau", "irx"),
+    ("kambiwá", "xbw"),
+    ("kami (nigeria)", "kmi"),
+    ("kami (tanzania)", "kcu"),
+    ("kamo", "kcq"),
+    ("kamoro", "kgq"),
+    ("kamu", "xmu"),
+    ("kamula", "xla"),
+    ("kamviri", "xvi"),
+    ("kamwe", "hig"),
+    ("kan", "kan"),
+    ("kanakanabu", "xnb"),
+    ("kanamarí", "knm"),
+    ("kanan", "zkn"),
+    ("kanashi", "xns"),
+    ("kanasi", "soq"),
+    ("kanauji", "bjj"),
+    ("kandas", "kqw"),
+    ("kandawo", "gam"),
+    ("kande", "kbs"),
+    ("kanembu", "kbl"),
+    ("kang", "kyp"),
+    ("kanga", "kcp"),
+    ("kangean", "kkv"),
+    ("kanggape", "igm"),
+    ("kangjia", "kxs"),
+    ("kango (bas-uélé district)", "kty"),
+    ("kango (tshopo district)", "kzy"),
+    ("kangri", "xnr"),
+    ("kaniet", "ktk"),
+    ("kanikkaran", "kev"),
+    ("kaningdon-nindem", "kdp"),
+    ("kaningi", "kzo"),
+    ("kaningra", "knr"),
+    ("kaninuwa", "wat"),
+    ("kanite", "kmu"),
+    ("kanjari", "kft"),
+    ("kanju", "kbe"),
+    ("kankanaey", "kne"),
+    ("kannada", "kan"),
+    ("kannada kurumba", "kfi"),
+    ("kannara", "kan"),
+    ("kanowit-tanjong melanau", "kxn"),
+    ("kanoé", "kxo"),
+    ("kansa", "ksk"),
+    ("kantosi", "xkt"),
+    ("kanu", "khx"),
+    ("kanufi", "kni"),
+    ("kanuri", "kau"),
+    ("kanyok", "kny"),
+    ("kaonde", "kqn"),
+    ("kapin", "tbx"),
+    ("kapinawá", "xpn"),
+    ("kapingamarangi", "kpg"),
+    ("kapori", "khp"),
+    ("kapriman", "dju"),
+    ("kaptiau", "kbi"),
+    ("kapya", "klo"),
+    ("kaqchikel", "cak"),
+    ("kara (central african republic)", "kah"),
+    ("kara (korea)", "zra"),
+    ("kara (papua new guinea)", "leu"),
+    ("kara (tanzania)", "reg"),
+    ("kara-kalpak", "kaa"),
+    ("karachay-balkar", "krc"),
+    ("karagas", "kim"),
+    ("karaim", "kdr"),
+    ("karajarri", "gbd"),
+    ("karajá", "kpj"),
+    ("karakhanid", "xqa"),
+    ("karami", "xar"),
+    ("karamojong", "kdj"),
+    ("karang", "kzr"),
+    ("karanga", "kth"),
+    ("karankawa", "zkk"),
+    ("karao", "kyj"),
+    ("karas", "kgv"),
+    ("karata", "kpt"),
+    ("karawa", "xrw"),
+    ("karbi", "mjw"),
+    ("kare (central african republic)", "kbn"),
+    ("kare (papua new guinea)", "kmf"),
+    ("karekare", "kai"),
+    ("karelian", "krl"),
+    ("karenggapa", "eaa"),
+    ("karey", "kyd"),
+    ("kari", "kbj"),
+    ("karingani", "kgn"),
+    ("karipuna", "kuq"),
+    ("karipúna", "kgm"),
+    ("karipúna creole french", "kmv"),
+    ("karirí-xocó", "kzw"),
+    ("karitiâna", "ktn"),
+    ("kariya", "kil"),
+    ("kariyarra", "vka"),
+    ("karkar-yuri", "yuj"),
+    ("karkin", "krb"),
+    ("karko", "kko"),
+    ("karnai", "bbv"),
+    ("karo (brazil)", "arr"),
+    ("karo (ethiopia)", "kxh"),
+    ("karok", "kyh"),
+    ("karon", "krx"),
+    ("karon dori", "kgw"),
+    ("karore", "xkx"),
+    ("karuwali", "rxw"),
+    ("kas", "kas"),
+    ("kasanga", "ccj"),
+    ("kasem", "xsm"),
+    ("kashaya", "kju"),
+    ("kashmiri", "kas"),
+    ("kashubian", "csb"),
+    ("kasiguranin", "ksn"),
+    ("kaska", "kkz"),
+    ("kaskean", "zsk"),
+    ("kasua", "khs"),
+    ("kat", "kat"),
+    ("katabaga", "ktq"),
+    ("katawixi", "xat"),
+    ("katbol", "tmb"),
+    ("katcha-kadugli-miri", "xtc"),
+    ("kathoriya tharu", "tkt"),
+    ("kathu", "ykt"),
+    ("kati", "bsh"),
+    ("katkari", "kfu"),
+    ("katla", "kcr"),
+    ("kato", "ktw"),
+    ("katso", "kaf"),
+    ("katua", "kta"),
+    ("katukína", "kav"),
+    ("kau", "kau"),
+    ("kaulong", "pss"),
+    ("kaur", "vkk"),
+    ("kaure", "bpp"),
+    ("kaurna", "zku"),
+    ("kauwera", "xau"),
+    ("kavalan", "ckv"),
+    ("kavet", "krv"),
+    ("kaw", "kaw"),
+    ("kawacha", "kcb"),
+    ("kawaiisu", "xaw"),
+    ("kawe", "kgb"),
+    ("kawi", "kaw"),
+    ("kaxararí", "ktx"),
+    ("kaxuiâna", "kbb"),
+    ("kayabí", "kyz"),
+    ("kayagar", "kyt"),
+    ("kayan", "pdu"),
+    ("kayan mahakam", "xay"),
+    ("kayan river kayan", "xkn"),
+    ("kayapó", "txu"),
+    ("kayardild", "gyd"),
+    ("kayaw", "kvl"),
+    ("kayeli", "kzl"),
+    ("kayong", "kxy"),
+    ("kayort", "kyv"),
+    ("kaytetye", "gbb"),
+    ("kayupulau", "kzu"),
+    ("kaz", "kaz"),
+    ("kazajo", "kaz"),
+    ("kazakh", "kaz"),
+    ("kazukuru", "kzk"),
+    ("kbd", "kbd"),
+    ("ke'o", "xxk"),
+    ("keak", "keh"),
+    ("keapara", "khz"),
+    ("kedah malay", "meo"),
+    ("kedang", "ksx"),
+    ("keder", "kdy"),
+    ("keerray-woorroong", "wkr"),
+    ("kehu", "khh"),
+    ("keiga", "kec"),
+    ("kein", "bmh"),
+    ("keiyo", "eyo"),
+    ("kekchí", "kek"),
+    ("kela (democratic republic of congo)", "kel"),
+    ("kela (papua new guinea)", "kcl"),
+    ("kelabit", "kzi"),
+    ("kele (democratic republic of congo)", "khy"),
+    ("kele (papua new guinea)", "sbc"),
+    ("keley-i kallahan", "ify"),
+    ("keliko", "kbo"),
+    ("kelo", "xel"),
+    ("kelon", "kyo"),
+    ("kemak", "kem"),
+    ("kembayan", "xem"),
+    ("kemberano", "bzp"),
+    ("kembra", "xkw"),
+    ("kemedzung", "dmo"),
+    ("kemi sami", "sjk"),
+    ("kemiehua", "kfj"),
+    ("kemtuik", "kmt"),
+    ("kenaboi", "xbn"),
+    ("kenati", "gat"),
+    ("kendayan", "knx"),
+    ("kendeje", "klf"),
+    ("kendem", "kvm"),
+    ("kenga", "kyq"),
+    ("keningau murut", "kxi"),
+    ("keninjal", "knl"),
+    ("kensiu", "kns"),
+    ("kenswei nsei", "ndb"),
+    ("kenyan sign language", "xki"),
+    ("kenyang", "ken"),
+    ("kenyi", "lke"),
+    ("kenzi", "xnz"),
+    ("keoru-ahia", "xeu"),
+    ("kepkiriwát", "kpn"),
+    ("kepo'", "kuk"),
+    ("kera", "ker"),
+    ("kerak", "hhr"),
+    ("kereho", "xke"),
+    ("kerek", "krk"),
+    ("kerewe", "ked"),
+    ("kerewo", "kxz"),
+    ("kerinci", "kvr"),
+    ("kesawai", "xes"),
+    ("ketangalan", "kae"),
+    ("kete", "kcv"),
+    ("ketengban", "xte"),
+    ("ketum", "ktt"),
+    ("keyagana", "kyg"),
+    ("kg", "kon"),
+    ("kgalagadi", "xkv"),
+    ("kha", "kha"),
+    ("khah", "hkh"),
+    ("khakas", "kjh"),
+    ("khalaj", "klj"),
+    ("khaling", "klr"),
+    ("khamba", "kbg"),
+    ("khams tibetan", "khg"),
+    ("khamti", "kht"),
+    ("khamyang", "ksu"),
+    ("khana", "ogo"),
+    ("khandesi", "khn"),
+    ("khanty", "kca"),
+    ("khao", "xao"),
+    ("kharam naga", "kfw"),
+    ("kharia", "khr"),
+    ("kharia thar", "ksy"),
+    ("khasi", "kha"),
+    ("khayo", "lko"),
+    ("khazar", "zkz"),
+    ("khehek", "tlx"),
+    ("khengkha", "xkf"),
+    ("khetrani", "xhe"),
+    ("khezha naga", "nkh"),
+    ("khiamniungan naga", "kix"),
+    ("khinalugh", "kjj"),
+    ("khirwar", "kwx"),
+    ("khisa", "kqm"),
+    ("khlula", "ykl"),
+    ("khm", "khm"),
+    ("khmer", "khm"),
+    ("khmu", "kjg"),
+    ("kho", "kho"),
+    ("kho'ini", "xkc"),
+    ("khoekhoe", "naq"),
+    ("khoibu naga", "nkb"),
+    ("kholok", "ktc"),
+    ("khorasani turkish", "kmz"),
+    ("khorezmian", "zkh"),
+    ("khotanese", "kho"),
+    ("khowar", "khw"),
+    ("khua", "xhv"),
+    ("khuen", "khf"),
+    ("khumi chin", "cnk"),
+    ("khunsari", "kfm"),
+    ("khvarshi", "khv"),
+    ("kháng", "kjm"),
+    ("khün", "kkh"),
+    ("ki", "kik"),
+    ("kibala", "blv"),
+    ("kibet", "kie"),
+    ("kibiri", "prm"),
+    ("kickapoo", "kic"),
+    ("kija", "gia"),
+    ("kik", "kik"),
+    ("kikai", "kzg"),
+    ("kikuyu", "kik"),
+    ("kildin sami", "sjd"),
+    ("kilivila", "kij"),
+    ("kiliwa", "klb"),
+    ("kilmeri", "kih"),
+    ("kim mun", "mji"),
+    ("kimaama", "kig"),
+    ("kimaragang", "kqr"),
+    ("kimbu", "kiv"),
+    ("kimbundu", "kmb"),
+    ("kimki", "sbt"),
+    ("kimré", "kqp"),
+    ("kin", "kin"),
+    ("kinabalian", "cbw"),
+    ("kinalakna", "kco"),
+    ("kinamiging manobo", "mkx"),
+    ("kinaray-a", "krj"),
+    ("kinga", "zga"),
+    ("kinnauri", "kfk"),
+    ("kintaq", "knq"),
+    ("kinuku", "kkd"),
+    ("kinyarwanda", "kin"),
+    ("kioko", "ues"),
+    ("kiong", "kkm"),
+    ("kiorr", "xko"),
+    ("kiowa", "kio"),
+    ("kiowa apache", "apk"),
+    ("kipsigis", "sgc"),
+    ("kiput", "kyi"),
+    ("kir", "kir"),
+    ("kir-balar", "kkr"),
+    ("kire", "geb"),
+    ("kirghiz", "kir"),
+    ("kirghiz; kyrgyz", "kir"),
+    ("kirghize", "kir"),
+    ("kirguís", "kir"),
+    ("kirike", "okr"),
+    ("kirikiri", "kiy"),
+    ("kirmanjki (individual language)", "kiu"),
+    ("kirya-konzəl", "fkk"),
+    ("kisa", "lks"),
+    ("kisan", "xis"),
+    ("kisankasa", "kqh"),
+    ("kisar", "kje"),
+    ("kisi", "kiz"),
+    ("kistane", "gru"),
+    ("kiswahili", "swa"),
+    ("kita maninkakan", "mwk"),
+    ("kitan", "zkt"),
+    ("kitsai", "kii"),
+    ("kituba (congo)", "mkw"),
+    ("kituba (democratic republic of congo)", "ktu"),
+    ("kiunum", "wei"),
+    ("kj", "kua"),
+    ("kk", "kaz"),
+    ("kl", "kal"),
+    ("kla-dan", "lda"),
+    ("klamath-modoc", "kla"),
+    ("klao", "klu"),
+    ("klias river kadazan", "kqt"),
+    ("klingon", "tlh"),
+    ("km", "khm"),
+    ("kmb", "kmb"),
+    ("kn", "kan"),
+    ("knaanic", "czk"),
+    ("ko", "kor"),
+    ("koalib", "kib"),
+    ("koasati", "cku"),
+    ("koba", "kpd"),
+    ("kobiana", "kcj"),
+    ("kobo", "okc"),
+    ("kobol", "kgu"),
+    ("kobon", "kpw"),
+    ("koch", "kdq"),
+    ("kochila tharu", "thq"),
+    ("koda", "cdz"),
+    ("kodaku", "ksz"),
+    ("kodava", "kfa"),
+    ("kodeoha", "vko"),
+    ("kodi", "kod"),
+    ("kodia", "kwp"),
+    ("koenoem", "kcs"),
+    ("kofa", "kso"),
+    ("kofei", "kpi"),
+    ("kofyar", "kwl"),
+    ("koguryo", "zkg"),
+    ("kohin", "kkx"),
+    ("kohistani shina", "plk"),
+    ("koho", "kpm"),
+    ("kohumono", "bcs"),
+    ("koibal", "zkb"),
+    ("koireng", "nkd"),
+    ("koitabu", "kqi"),
+    ("koiwat", "kxt"),
+    ("kok", "kok"),
+    ("kok borok", "trp"),
+    ("kok-nar", "gko"),
+    ("kokata", "ktd"),
+    ("koke", "kou"),
+    ("koki naga", "nxk"),
+    ("koko babangk", "okg"),
+    ("kokoda", "xod"),
+    ("kokola", "kzn"),
+    ("kokota", "kkk"),
+    ("kol (bangladesh)", "ekl"),
+    ("kol (cameroon)", "biw"),
+    ("kol (papua new guinea)", "kol"),
+    ("kola", "kvv"),
+    ("kolbila", "klc"),
+    ("kolibugan subanon", "skn"),
+    ("koluwawa", "klx"),
+    ("kom", "kom"),
+    ("kom (cameroon)", "bkm"),
+    ("kom (india)", "kmm"),
+    ("koma", "kmy"),
+    ("komba", "kpf"),
+    ("kombai", "tyn"),
+    ("kombio", "xbi"),
+    ("komering", "kge"),
+    ("komi", "kom"),
+    ("komi-permyak", "koi"),
+    ("komi-zyrian", "kpv"),
+    ("kominimung", "xoi"),
+    ("komo (democratic republic of congo)", "kmw"),
+    ("komo (sudan)", "xom"),
+    ("komodo", "kvh"),
+    ("kompane", "kvp"),
+    ("komyandaret", "kzv"),
+    ("kon", "kon"),
+    ("kon keu", "kkn"),
+    ("konai", "kxw"),
+    ("konda", "knd"),
+    ("konda-dora", "kfc"),
+    ("koneraw", "kdw"),
+    ("kongo", "kon"),
+    ("konkani (individual language)", "knn"),
+    ("konkani (macrolanguage)", "kok"),
+    ("konkomba", "xon"),
+    ("konni", "kma"),
+    ("kono (guinea)", "knu"),
+    ("kono (nigeria)", "klk"),
+    ("kono (sierra leone)", "kno"),
+    ("konomala", "koa"),
+    ("konongo", "kcz"),
+    ("konso", "kxc"),
+    ("konyak naga", "nbe"),
+    ("konyanka maninka", "mku"),
+    ("konzo", "koo"),
+    ("koongo", "kng"),
+    ("koonzime", "ozm"),
+    ("koorete", "kqy"),
+    ("kopar", "xop"),
+    ("kopkaka", "opk"),
+    ("kor", "kor"),
+    ("korafe-yegha", "kpr"),
+    ("korak", "koz"),
+    ("korana", "kqz"),
+    ("korandje", "kcy"),
+    ("korean", "kor"),
+    ("korean sign language", "kvk"),
+    ("koreguaje", "coe"),
+    ("koresh-e rostam", "okh"),
+    ("korku", "kfq"),
+    ("korlai creole portuguese", "vkp"),
+    ("koro (côte d'ivoire)", "kfo"),
+    ("koro (india)", "jkr"),
+    ("koro (papua new guinea)", "kxr"),
+    ("koro (vanuatu)", "krf"),
+    ("koro nulu", "vkn"),
+    ("koro wachi", "bqv"),
+    ("koro zuba", "vkz"),
+    ("koromfé", "kfz"),
+    ("koromira", "kqj"),
+    ("koronadal blaan", "bpr"),
+    ("koroni", "xkq"),
+    ("korop", "krp"),
+    ("koropó", "xxr"),
+    ("koroshi", "ktl"),
+    ("korowai", "khe"),
+    ("korra koraga", "kfd"),
+    ("korubo", "xor"),
+    ("korupun-sela", "kpq"),
+    ("korwa", "kfp"),
+    ("koryak", "kpy"),
+    ("kos", "kos"),
+    ("kosadle", "kiq"),
+    ("kosarek yale", "kkl"),
+    ("kosena", "kze"),
+    ("koshin", "kid"),
+    ("kosraean", "kos"),
+    ("kota (gabon)", "koq"),
+    ("kota (india)", "kfe"),
+    ("kota bangun kutai malay", "mqg"),
+    ("kota marudu talantang", "grm"),
+    ("kotafon gbe", "kqk"),
+    ("kotava", "avk"),
+    ("koti", "eko"),
+    ("kott", "zko"),
+    ("kouya", "kyf"),
+    ("kovai", "kqb"),
+    ("kove", "kvc"),
+    ("kowaki", "xow"),
+    ("kowiai", "kwh"),
+    ("koy sanjaq surat", "kqd"),
+    ("koya", "kff"),
+    ("koyaga", "kga"),
+    ("koyo", "koh"),
+    ("koyra chiini songhay", "khq"),
+    ("koyraboro senni songhai", "ses"),
+    ("koyukon", "koy"),
+    ("kpagua", "kuw"),
+    ("kpala", "kpl"),
+    ("kpan", "kpk"),
+    ("kpasam", "pbn"),
+    ("kpati", "koc"),
+    ("kpatili", "kym"),
+    ("kpe", "kpe"),
+    ("kpeego", "cpo"),
+    ("kpelle", "kpe"),
+    ("kpessi", "kef"),
+    ("kplang", "kph"),
+    ("kr", "kau"),
+    ("krache", "kye"),
+    ("krahô", "xra"),
+    ("kraol", "rka"),
+    ("krc", "krc"),
+    ("krenak", "kqq"),
+    ("krevinian", "zkv"),
+    ("kreye", "xre"),
+    ("kriang", "ngt"),
+    ("krikati-timbira", "xri"),
+    ("krio", "kri"),
+    ("kriol", "rop"),
+    ("krisa", "ksi"),
+    ("krl", "krl"),
+    ("krobu", "kxb"),
+    ("krongo", "kgo"),
+    ("kru", "kru"),
+    ("krung", "krr"),
+    ("krymchak", "jct"),
+    ("kryts", "kry"),
+    ("ks", "kas"),
+    ("ku", "kur"),
+    ("kua", "kua"),
+    ("kua-nsi", "ykn"),
+    ("kuamasi", "yku"),
+    ("kuan", "uan"),
+    ("kuanhua", "xnh"),
+    ("kuanua", "ksd"),
+    ("kuanyama", "kua"),
+    ("kube", "kgf"),
+    ("kubi", "kof"),
+    ("kubo", "jko"),
+    ("kubu", "kvb"),
+    ("kucong", "lkc"),
+    ("kudiya", "kfg"),
+    ("kudmali", "kyw"),
+    ("kudu-camo", "kov"),
+    ("kufr qassem sign language (kqsl)", "sqx"),
+    ("kugama", "kow"),
+    ("kugbo", "kes"),
+    ("kugu-muminh", "xmh"),
+    ("kui (india)", "uki"),
+    ("kui (indonesia)", "kvd"),
+    ("kuijau", "dkr"),
+    ("kuikúro-kalapálo", "kui"),
+    ("kujarge", "vkj"),
+    ("kukatja", "kux"),
+    ("kuke", "ght"),
+    ("kukele", "kez"),
+    ("kukna", "kex"),
+    ("kuku", "ukv"),
+    ("kuku-mangk", "xmq"),
+    ("kuku-mu'inh", "xmp"),
+    ("kuku-ugbanh", "ugb"),
+    ("kuku-uwanh", "uwa"),
+    ("kuku-yalanji", "gvn"),
+    ("kula", "tpg"),
+    ("kulere", "kul"),
+    ("kulfa", "kxj"),
+    ("kulina pano", "xpk"),
+    ("kulisusu", "vkl"),
+    ("kullu pahari", "kfx"),
+    ("kulon-pazeh", "uun"),
+    ("kulung (nepal)", "kle"),
+    ("kulung (nigeria)", "bbu"),
+    ("kum", "kum"),
+    ("kumalu", "ksl"),
+    ("kumam", "kdi"),
+    ("kuman (papua new guinea)", "kue"),
+    ("kuman (russia)", "qwm"),
+    ("kumaoni", "kfy"),
+    ("kumarbhag paharia", "kmj"),
+    ("kumba", "ksm"),
+    ("kumbainggar", "kgs"),
+    ("kumbaran", "wkb"),
+    ("kumbewaha", "xks"),
+    ("kumhali", "kra"),
+    ("kumiai", "dih"),
+    ("kumukio", "kuo"),
+    ("kumyk", "kum"),
+    ("kumzari", "zum"),
+    ("kunama", "kun"),
+    ("kunbarlang", "wlg"),
+    ("kunda", "kdn"),
+    ("kundal shahi", "shd"),
+    ("kunduvadi", "wku"),
+    ("kung", "kfl"),
+    ("kung-ekoka", "knw"),
+    ("kungarakany", "ggk"),
+    ("kungardutyi", "gdt"),
+    ("kunggari", "kgl"),
+    ("kungkari", "lku"),
+    ("kuni", "kse"),
+    ("kuni-boazi", "kvg"),
+    ("kunigami", "xug"),
+    ("kunimaipa", "kup"),
+    ("kunja", "pep"),
+    ("kunjen", "kjn"),
+    ("kunyi", "njx"),
+    ("kunza", "kuz"),
+    ("kuot", "kto"),
+    ("kupa", "kug"),
+    ("kupang malay", "mkn"),
+    ("kupia", "key"),
+    ("kupsabiny", "kpz"),
+    ("kur", "kur"),
+    ("kura ede nago", "nqk"),
+    ("kurama", "krh"),
+    ("kuranko", "knk"),
+    ("kurdish", "kur"),
+    ("kuri", "nbn"),
+    ("kuria", "kuj"),
+    ("kurichiya", "kfh"),
+    ("kurmukar", "kfv"),
+    ("kurnai", "unn"),
+    ("kurrama", "vku"),
+    ("kurti", "ktm"),
+    ("kurtokha", "xkz"),
+    ("kurudu", "kjr"),
+    ("kurukh", "kru"),
+    ("kuruáya", "kyr"),
+    ("kusaal", "kus"),
+    ("kusaghe", "ksg"),
+    ("kushi", "kuh"),
+    ("kusu", "ksv"),
+    ("kusunda", "kgg"),
+    ("kut", "kut"),
+    ("kutenai", "kut"),
+    ("kutep", "kub"),
+    ("kuthant", "xut"),
+    ("kutong", "skm"),
+    ("kutto", "kpa"),
+    ("kutu", "kdc"),
+    ("kuturmi", "khj"),
+    ("kuuk thaayorre", "thd"),
+    ("kuuk-yak", "uky"),
+    ("kuuku-ya'u", "kuy"),
+    ("kuvale", "olu"),
+    ("kuvi", "kxv"),
+    ("kuwaa", "blh"),
+    ("kuwaataay", "cwt"),
+    ("kuwema", "woa"),
+    ("kv", "kom"),
+    ("kven finnish", "fkv"),
+    ("kw", "cor"),
+    ("kw'adza", "wka"),
+    ("kwa'", "bko"),
+    ("kwaami", "ksq"),
+    ("kwadi", "kwz"),
+    ("kwaio", "kwd"),
+    ("kwaja", "kdz"),
+    ("kwakiutl", "kwk"),
+    ("kwakum", "kwu"),
+    ("kwalhioqua-tlatskanai", "qwt"),
+    ("kwama", "kmq"),
+    ("kwambi", "kwm"),
+    ("kwamera", "tnk"),
+    ("kwami", "ktf"),
+    ("kwamtim one", "okk"),
+    ("kwandu", "xdo"),
+    ("kwang", "kvi"),
+    ("kwanga", "kwj"),
+    ("kwangali", "kwn"),
+    ("kwanja", "knp"),
+    ("kwara'ae", "kwf"),
+    ("kwasio", "nmg"),
+    ("kwaya", "kya"),
+    ("kwaza", "xwa"),
+    ("kwegu", "xwg"),
+    ("kwer", "kwr"),
+    ("kwerba", "kwe"),
+    ("kwerba mamberamo", "xwr"),
+    ("kwere", "cwe"),
+    ("kwerisa", "kkb"),
+    ("kwese", "kws"),
+    ("kwesten", "kwt"),
+    ("kwini", "gww"),
+    ("kwinsu", "kuc"),
+    ("kwinti", "kww"),
+    ("kwoma", "kmo"),
+    ("kwomtari", "kwo"),
+    ("kxoe", "xuu"),
+    ("ky", "kir"),
+    ("kyak", "bka"),
+    ("kyaka", "kyc"),
+    ("kyan-karyaw naga", "nqq"),
+    ("kyanga", "tye"),
+    ("kyenele", "kql"),
+    ("kyerung", "kgy"),
+    ("kyrgyz", "kir"),
+    ("kâte", "kmg"),
+    ("kélé", "keb"),
+    ("kölsch", "ksh"),
+    ("kɛlɛngaxo bozo", "bzx"),
+    ("la", "lat"),
+    ("la'bi", "lbi"),
+    ("laal", "gdm"),
+    ("laari", "ldi"),
+    ("laba", "lau"),
+    ("label", "lbb"),
+    ("labir", "jku"),
+    ("labo", "mwi"),
+    ("labo phowa", "ypb"),
+    ("labu", "lbu"),
+    ("labuk-kinabatangan kadazan", "dtb"),
+    ("lacandon", "lac"),
+    ("lachi", "lbt"),
+    ("lachiguiri zapotec", "zpa"),
+    ("lachixío zapotec", "zpl"),
+    ("lad", "lad"),
+    ("ladakhi", "lbj"),
+    ("ladin", "lld"),
+    ("ladino", "lad"),
+    ("ladji ladji", "llj"),
+    ("laeko-libuat", "lkl"),
+    ("lafofa", "laf"),
+    ("laghu", "lgb"),
+    ("laghuu", "lgh"),
+    ("lagwan", "kot"),
+    ("lah", "lah"),
+    ("laha (indonesia)", "lhh"),
+    ("laha (viet nam)", "lha"),
+    ("lahanan", "lhn"),
+    ("lahnda", "lah"),
+    ("lahta karen", "kvt"),
+    ("lahu", "lhu"),
+    ("lahu shi", "lhi"),
+    ("lahul lohar", "lhl"),
+    ("laimbue", "lmx"),
+    ("laitu chin", "clj"),
+    ("laiyolo", "lji"),
+    ("laka (chad)", "lap"),
+    ("laka (nigeria)", "lak"),
+    ("lakalei", "lka"),
+    ("lake miwok", "lmw"),
+    ("lakha", "lkh"),
+    ("laki", "lki"),
+    ("lakkia", "lbc"),
+    ("lakon", "lkn"),
+    ("lakondê", "lkd"),
+    ("lakota", "lkt"),
+    ("lakota dida", "dic"),
+    ("lakurumau", "lxm"),
+    ("lala", "nrz"),
+    ("lala-bisa", "leb"),
+    ("lala-roba", "lla"),
+    ("lalana chinantec", "cnl"),
+    ("lalia", "lal"),
+    ("lam", "lam"),
+    ("lama (togo)", "las"),
+    ("lama bai", "lay"),
+    ("lamaholot", "slp"),
+    ("lamalama", "lby"),
+    ("lamalera", "lmr"),
+    ("lamang", "hia"),
+    ("lamatuka", "lmq"),
+    ("lamba", "lam"),
+    ("lambadi", "lmn"),
+    ("lambayeque quechua", "quf"),
+    ("lambichhong", "lmh"),
+    ("lamboya", "lmy"),
+    ("lambya", "lai"),
+    ("lame", "bma"),
+    ("lamenu", "lmu"),
+    ("lamja-dengsa-tola", "ldh"),
+    ("lamkang", "lmk"),
+    ("lamma", "lev"),
+    ("lamnso'", "lns"),
+    ("lamogai", "lmg"),
+    ("lampung api", "ljp"),
+    ("lampung nyo", "abl"),
+    ("lamu", "llh"),
+    ("lanas lobu", "ruu"),
+    ("landoma", "ldm"),
+    ("lang'e", "yne"),
+    ("langam", "lnm"),
+    ("langbashe", "lna"),
+    ("langi", "lag"),
+    ("langnian buyang", "yln"),
+    ("lango (south sudan)", "lno"),
+    ("lango (uganda)", "laj"),
+    ("langobardic", "lng"),
+    ("langue des signes de belgique francophone", "sfb"),
+    ("lanima", "lnw"),
+    ("lanoh", "lnh"),
+    ("lao", "lao"),
+    ("lao naga", "nlq"),
+    ("laomian", "lwm"),
+    ("laopang", "lbg"),
+    ("laos sign language", "lso"),
+    ("lapaguía-guivini zapotec", "ztl"),
+    ("laragia", "lrg"),
+    ("larantuka malay", "lrt"),
+    ("lardil", "lbz"),
+    ("larevat", "lrv"),
+    ("large flowery miao", "hmd"),
+    ("lari", "lrl"),
+    ("larike-wakasihu", "alo"),
+    ("laro", "lro"),
+    ("larteh", "lar"),
+    ("laru", "lan"),
+    ("lasalimu", "llm"),
+    ("lasgerdi", "lsa"),
+    ("lashi", "lsi"),
+    ("lasi", "lss"),
+    ("lat", "lat"),
+    ("late middle chinese", "ltc"),
+    ("latgalian", "ltg"),
+    ("latin", "lat"),
+    ("latu", "ltu"),
+    ("latundê", "ltn"),
+    ("latvian", "lav"),
+    ("latvian sign language", "lsl"),
+    ("latviešu", "lav"),
+    ("latviešu valoda", "lav"),
+    ("laua", "luf"),
+    ("lauan", "llx"),
+    ("lauje", "law"),
+    ("laura", "lur"),
+    ("laurentian", "lre"),
+    ("lautu chin", "clt"),
+    ("lav", "lav"),
+    ("lavatbura-lamusong", "lbv"),
+    ("lave", "brb"),
+    ("laven", "lbo"),
+    ("lavi", "lvi"),
+    ("lavukaleve", "lvk"),
+    ("lawangan", "lbx"),
+    ("lawu", "lwu"),
+    ("lawunuia", "tgi"),
+    ("layakha", "lya"),
+    ("lb", "ltz"),
+    ("lealao chinantec", "cle"),
+    ("leco", "lec"),
+    ("ledo kaili", "lew"),
+    ("leelau", "ldk"),
+    ("lefa", "lfa"),
+    ("lega-mwenga", "lgm"),
+    ("lega-shabunda", "lea"),
+    ("legbo", "agb"),
+    ("legenyem", "lcc"),
+    ("lehali", "tql"),
+    ("lehalurup", "urr"),
+    ("lehar", "cae"),
+    ("leinong naga", "lzn"),
+    ("leipon", "lek"),
+    ("lelak", "llk"),
+    ("lele (chad)", "lln"),
+    ("lele (democratic republic of congo)", "lel"),
+    ("lele (guinea)", "llc"),
+    ("lele (papua new guinea)", "lle"),
+    ("lelemi", "lef"),
+    ("lelepa", "lpa"),
+    ("lembena", "leq"),
+    ("lemerig", "lrz"),
+    ("lemio", "lei"),
+    ("lemnian", "xle"),
+    ("lemolang", "ley"),
+    ("lemoro", "ldj"),
+    ("lenakel", "tnl"),
+    ("lenca", "len"),
+    ("lendu", "led"),
+    ("lengilu", "lgi"),
+    ("lengo", "lgr"),
+    ("lengola", "lej"),
+    ("leningitij", "lnj"),
+    ("lenje", "leh"),
+    ("lenkau", "ler"),
+    ("lenyima", "ldg"),
+    ("lepcha", "lep"),
+    ("lepki", "lpe"),
+    ("lepontic", "xlp"),
+    ("lere", "gnh"),
+    ("lese", "les"),
+    ("lesing-gelimi", "let"),
+    ("letemboi", "nms"),
+    ("leti (cameroon)", "leo"),
+    ("leti (indonesia)", "lti"),
+    ("letton", "lav"),
+    ("letón", "lav"),
+    ("levuka", "lvu"),
+    ("lewo", "lww"),
+    ("lewo eleng", "lwe"),
+    ("lewotobi", "lwt"),
+    ("leyigha", "ayi"),
+    ("lez", "lez"),
+    ("lezghian", "lez"),
+    ("lg", "lug"),
+    ("lhokpu", "lhp"),
+    ("lhomi", "lhm"),
+    ("li", "lim"),
+    ("li'o", "ljl"),
+    ("liabuku", "lix"),
+    ("liana-seti", "ste"),
+    ("liangmai naga", "njn"),
+    ("lianshan zhuang", "zln"),
+    ("liberia kpelle", "xpe"),
+    ("liberian english", "lir"),
+    ("libido", "liq"),
+    ("libinza", "liz"),
+    ("libon bikol", "lbl"),
+    ("liburnian", "xli"),
+    ("libyan arabic", "ayl"),
+    ("libyan sign language", "lbs"),
+    ("lidzonka", "add"),
+    ("lietuvių", "lit"),
+    ("lietuvių kalba", "lit"),
+    ("ligbi", "lig"),
+    ("ligenza", "lgz"),
+    ("ligurian", "lij"),
+    ("ligurian (ancient)", "xlg"),
+    ("lihir", "lih"),
+    ("lijili", "mgi"),
+    ("lika", "lik"),
+    ("liki", "lio"),
+    ("likila", "lie"),
+    ("likuba", "kxx"),
+    ("likum", "lib"),
+    ("likwala", "kwc"),
+    ("lilau", "lll"),
+    ("lillooet", "lil"),
+    ("lim", "lim"),
+    ("limassa", "bme"),
+    ("limbu", "lif"),
+    ("limbum", "lmp"),
+    ("limburgan", "lim"),
+    ("limi", "ylm"),
+    ("limilngan", "lmc"),
+    ("limos kalinga", "kmk"),
+    ("lin", "lin"),
+    ("linear a", "lab"),
+    ("lingala", "lin"),
+    ("lingao", "onb"),
+    ("lingarak", "lgk"),
+    ("lingua franca", "pml"),
+    ("lingua franca nova", "lfn"),
+    ("lipan apache", "apl"),
+    ("lipo", "lpo"),
+    ("lisabata-nuniali", "lcs"),
+    ("lisela", "lcl"),
+    ("lish", "lsh"),
+    ("lishana deni", "lsd"),
+    ("lishanid noshan", "aij"),
+    ("lishán didán", "trg"),
+    ("lisu", "lis"),
+    ("lit", "lit"),
+    ("literary chinese", "lzh"),
+    ("lithuanian", "lit"),
+    ("lithuanian sign language", "lls"),
+    ("lituanien", "lit"),
+    ("lituano", "lit"),
+    ("litzlitz", "lzl"),
+    ("liujiang zhuang", "zlj"),
+    ("liuqian zhuang", "zlq"),
+    ("livvi", "olo"),
+    ("ln", "lin"),
+    ("lo", "lao"),
+    ("lo-toga", "lht"),
+    ("loarki", "lrk"),
+    ("lobala", "loq"),
+    ("lobi", "lob"),
+    ("lodhi", "lbm"),
+    ("logba", "lgq"),
+    ("logo", "log"),
+    ("logol", "lof"),
+    ("logooli", "rag"),
+    ("logorik", "liu"),
+    ("logudorese sardinian", "src"),
+    ("lohorung", "lbr"),
+    ("loja highland quichua", "qvj"),
+    ("lojban", "jbo"),
+    ("lokaa", "yaz"),
+    ("loke", "loy"),
+    ("loko", "lok"),
+    ("lokoya", "lky"),
+    ("lol", "lol"),
+    ("lola", "lcd"),
+    ("lolak", "llq"),
+    ("lole", "llg"),
+    ("lolo", "llb"),
+    ("loloda", "loa"),
+    ("lolopo", "ycl"),
+    ("loma (côte d'ivoire)", "loi"),
+    ("loma (liberia)", "lom"),
+    ("lomaiviti", "lmv"),
+    ("lomavren", "rmi"),
+    ("lombard", "lmo"),
+    ("lombi", "lmi"),
+    ("lombo", "loo"),
+    ("lomwe", "ngl"),
+    ("loncong", "lce"),
+    ("long phuri naga", "lpn"),
+    ("long wat", "ttw"),
+    ("longgu", "lgu"),
+    ("longto", "wok"),
+    ("longuda", "lnu"),
+    ("loniu", "los"),
+    ("lonwolwol", "crc"),
+    ("lonzo", "lnz"),
+    ("lopa", "lop"),
+    ("lopi", "lov"),
+    ("lopit", "lpx"),
+    ("lorang", "lrn"),
+    ("lorediakarkar", "lnn"),
+    ("loreto-ucayali spanish", "spq"),
+    ("lote", "uvl"),
+    ("lotha naga", "njh"),
+    ("lotud", "dtr"),
+    ("louisiana creole", "lou"),
+    ("loun", "lox"),
+    ("loup a", "xlo"),
+    ("loup b", "xlb"),
+    ("low german", "nds"),
+    ("lower burdekin", "xbb"),
+    ("lower chehalis", "cea"),
+    ("lower grand valley dani", "dni"),
+    ("lower nossob", "nsb"),
+    ("lower silesian", "sli"),
+    ("lower sorbian", "dsb"),
+    ("lower southern aranda", "axl"),
+    ("lower ta'oih", "tto"),
+    ("lower tanana", "taa"),
+    ("lowland oaxaca chontal", "clo"),
+    ("lowland tarahumara", "tac"),
+    ("loxicha zapotec", "ztp"),
+    ("loz", "loz"),
+    ("lozi", "loz"),
+    ("lt", "lit"),
+    ("ltz", "ltz"),
+    ("lu", "lub"),
+    ("lua", "lua"),
+    ("luang", "lex"),
+    ("lub", "lub"),
+    ("luba-katanga", "lub"),
+    ("luba-lulua", "lua"),
+    ("lubila", "kcc"),
+    ("lubu", "lcf"),
+    ("lubuagan kalinga", "knb"),
+    ("luchazi", "lch"),
+    ("lucumi", "luq"),
+    ("ludian", "lud"),
+    ("lufu", "ldq"),
+    ("lug", "lug"),
+    ("lugbara", "lgg"),
+    ("luguru", "ruf"),
+    ("luhu", "lcq"),
+    ("lui", "lui"),
+    ("luimbi", "lum"),
+    ("luiseno", "lui"),
+    ("lukpa", "dop"),
+    ("lule", "ule"),
+    ("lule sami", "smj"),
+    ("lumba-yakkha", "luu"),
+    ("lumbu", "lup"),
+    ("lumun", "lmd"),
+    ("lun", "lun"),
+    ("luna", "luj"),
+    ("lunanakha", "luk"),
+    ("lunda", "lun"),
+    ("lundayeh", "lnd"),
+    ("lungalunga", "vmg"),
+    ("lungga", "lga"),
+    ("luo", "luo"),
+    ("luo (cameroon)", "luw"),
+    ("luo (kenya and tanzania)", "luo"),
+    ("luopohe hmong", "hml"),
+    ("luri", "ldd"),
+    ("lus", "lus"),
+    ("lusengo", "lse"),
+    ("lushai", "lus"),
+    ("lushootseed", "lut"),
+    ("lusi", "khl"),
+    ("lusitanian", "xls"),
+    ("lutos", "ndy"),
+    ("luvale", "lue"),
+    ("luwati", "luv"),
+    ("luwo", "lwo"),
+    ("luxembourgeois", "ltz"),
+    ("luxembourgish", "ltz"),
+    ("luxemburgués", "ltz"),
+    ("luyana", "lyn"),
+    ("luyia", "luy"),
+    ("lv", "lav"),
+    ("lwalu", "lwa"),
+    ("lycian", "xlc"),
+    ("lydian", "xld"),
+    ("lyngngam", "lyg"),
+    ("lyélé", "lee"),
+    ("láadan", "ldn"),
+    ("láá láá bwamu", "bwj"),
+    ("lëtzebuergesch", "ltz"),
+    ("ma (democratic republic of congo)", "msj"),
+    ("ma (papua new guinea)", "mjn"),
+    ("ma manda", "skc"),
+    ("ma'anyan", "mhy"),
+    ("ma'di", "mhi"),
+    ("ma'ya", "slz"),
+    ("maaka", "mew"),
+    ("maasina fulfulde", "ffm"),
+    ("maay", "ymm"),
+    ("maba (chad)", "mde"),
+    ("maba (indonesia)", "mqa"),
+    ("mabaale", "mmz"),
+    ("mabaan", "mfz"),
+    ("mabaka valley kalinga", "kkg"),
+    ("mabire", "muj"),
+    ("mac", "mkd"),
+    ("maca", "mca"),
+    ("macaguaje", "mcl"),
+    ("macaguán", "mbn"),
+    ("macanese", "mzs"),
+    ("macedo-romanian", "rup"),
+    ("macedonian", "mkd"),
+    ("macedonio", "mkd"),
+    ("machame", "jmc"),
+    ("machiguenga", "mcb"),
+    ("machinere", "mpd"),
+    ("machinga", "mvw"),
+    ("maco", "wpc"),
+    ("macuna", "myy"),
+    ("macushi", "mbc"),
+    ("macédonien", "mkd"),
+    ("mad", "mad"),
+    ("mada (cameroon)", "mxu"),
+    ("mada (nigeria)", "mda"),
+    ("madagascar sign language", "mzc"),
+    ("madak", "mmx"),
+    ("maden", "xmx"),
+    ("madhi madhi", "dmd"),
+    ("madi", "grg"),
+    ("madurese", "mad"),
+    ("maek", "hmk"),
+    ("maeng itneg", "itt"),
+    ("mafa", "maf"),
+    ("mafea", "mkv"),
+    ("mag", "mag"),
+    ("mag-antsi ayta", "sgb"),
+    ("mag-indi ayta", "blx"),
+    ("magahi", "mag"),
+    ("magbukun ayta", "ayt"),
+    ("magdalena peñasco mixtec", "xtm"),
+    ("magoma", "gmx"),
+    ("magori", "zgr"),
+    ("maguindanaon", "mdh"),
+    ("magyar", "hun"),
+    ("magɨ (madang province)", "gkd"),
+    ("magɨyi", "gmg"),
+    ("mah", "mah"),
+    ("mahali", "mjx"),
+    ("mahasu pahari", "bfz"),
+    ("mahican", "mjy"),
+    ("mahongwe", "mhb"),
+    ("mahou", "mxx"),
+    ("mai", "mai"),
+    ("mai brat", "ayz"),
+    ("maia", "sks"),
+    ("maiadomu", "mzz"),
+    ("maiani", "tnh"),
+    ("maii", "mmm"),
+    ("mailu", "mgu"),
+    ("maindo", "cwb"),
+    ("mainfränkisch", "vmf"),
+    ("mainstream kenyah", "xkl"),
+    ("mairasi", "zrs"),
+    ("maisin", "mbq"),
+    ("maithili", "mai"),
+    ("maiwa (indonesia)", "wmm"),
+    ("maiwa (papua new guinea)", "mti"),
+    ("maiwala", "mum"),
+    ("majang", "mpe"),
+    ("majera", "xmj"),
+    ("majhi", "mjz"),
+    ("majhwar", "mmj"),
+    ("majukayang kalinga", "kmd"),
+    ("mak", "mak"),
+    ("mak (china)", "mkg"),
+    ("mak (nigeria)", "pbl"),
+    ("makaa", "mcp"),
+    ("makah", "myh"),
+    ("makalero", "mjb"),
+    ("makasae", "mkz"),
+    ("makasar", "mak"),
+    ("makassar malay", "mfp"),
+    ("makayam", "aup"),
+    ("makhuwa", "vmw"),
+    ("makhuwa-marrevone", "xmc"),
+    ("makhuwa-meetto", "mgh"),
+    ("makhuwa-moniga", "mhm"),
+    ("makhuwa-saka", "xsq"),
+    ("makhuwa-shirima", "vmk"),
+    ("maklew", "mgf"),
+    ("makolkol", "zmh"),
+    ("makonde", "kde"),
+    ("maku'a", "lva"),
+    ("makuri naga", "jmn"),
+    ("makuráp", "mpu"),
+    ("makwe", "ymk"),
+    ("makyan naga", "umn"),
+    ("mal", "mal"),
+    ("mal paharia", "mkb"),
+    ("mala (nigeria)", "ruy"),
+    ("mala (papua new guinea)", "ped"),
+    ("mala malasar", "ima"),
+    ("malaccan creole malay", "ccm"),
+    ("malaccan creole portuguese", "mcm"),
+    ("malagasy", "mlg"),
+    ("malais", "msa"),
+    ("malak malak", "mpb"),
+    ("malalamai", "mmt"),
+    ("malango", "mln"),
+    ("malankuravan", "mjo"),
+    ("malapandaram", "mjp"),
+    ("malaryan", "mjq"),
+    ("malas", "mkr"),
+    ("malasar", "ymr"),
+    ("malavedan", "mjr"),
+    ("malawi lomwe", "lon"),
+    ("malawi sena", "swk"),
+    ("malawian sign language", "lws"),
+    ("malay", "msa"),
+    ("malay (individual language)", "zlm"),
+    ("malay (macrolanguage)", "msa"),
+    ("malayalam", "mal"),
+    ("malayic dayak", "xdy"),
+    ("malaynon", "mlz"),
+    ("malayo", "msa"),
+    ("malaysian sign language", "xml"),
+    ("malba birifor", "bfo"),
+    ("male (ethiopia)", "mdy"),
+    ("male (papua new guinea)", "mdc"),
+    ("malecite-passamaquoddy", "pqm"),
+    ("maleng", "pkt"),
+    ("maleu-kilenge", "mgl"),
+    ("malfaxal", "mlx"),
+    ("malgana", "vml"),
+    ("malgbe", "mxf"),
+    ("mali", "gcc"),
+    ("malila", "mgq"),
+    ("malimba", "mzd"),
+    ("malimpung", "mli"),
+    ("malinaltepec me'phaa", "tcf"),
+    ("malo", "mla"),
+    ("malol", "mbk"),
+    ("maltais", "mlt"),
+    ("maltese", "mlt"),
+    ("maltese sign language", "mdl"),
+    ("malti", "mlt"),
+    ("maltés", "mlt"),
+    ("malua bay", "mll"),
+    ("malvi", "mup"),
+    ("malyangapa", "yga"),
+    ("maléku jaíka", "gut"),
+    ("mama", "mma"),
+    ("mamaa", "mhf"),
+    ("mamaindé", "wmd"),
+    ("mamanwa", "mmn"),
+    ("mamara senoufo", "myk"),
+    ("mamasa", "mqj"),
+    ("mambae", "mgm"),
+    ("mambai", "mcs"),
+    ("mamboru", "mvd"),
+    ("mambwe-lungu", "mgr"),
+    ("mampruli", "maw"),
+    ("mamuju", "mqx"),
+    ("mamulique", "emm"),
+    ("mamusi", "kdf"),
+    ("mamvu", "mdi"),
+    ("man", "man"),
+    ("man met", "mml"),
+    ("manado malay", "xmm"),
+    ("manam", "mva"),
+    ("manambu", "mle"),
+    ("manangba", "nmm"),
+    ("manangkari", "znk"),
+    ("manchu", "mnc"),
+    ("manda (australia)", "zma"),
+    ("manda (india)", "mha"),
+    ("manda (tanzania)", "mgs"),
+    ("mandahuaca", "mht"),
+    ("mandaic", "mid"),
+    ("mandan", "mhq"),
+    ("mandandanyi", "zmk"),
+    ("mandar", "mdr"),
+    ("mandara", "tbf"),
+    ("mandari", "mqu"),
+    ("mandarin", "zho"),
+    ("mandarin chinese", "cmn"),
+    ("mandaya", "mry"),
+    ("mandeali", "mjl"),
+    ("mander", "mqr"),
+    ("mandingo", "man"),
+    ("mandinka", "mnk"),
+    ("mandjak", "mfv"),
+    ("mandobo atas", "aax"),
+    ("mandobo bawah", "bwp"),
+    ("manem", "jet"),
+    ("mang", "zng"),
+    ("manga kanuri", "kby"),
+    ("mangala", "mem"),
+    ("mangareva", "mrv"),
+    ("mangarrayi", "mpc"),
+    ("mangas", "zns"),
+    ("mangayat", "myj"),
+    ("mangbetu", "mdj"),
+    ("mangbutu", "mdk"),
+    ("mangerr", "zme"),
+    ("mangga buang", "mmo"),
+    ("manggarai", "mqy"),
+    ("mango", "mge"),
+    ("mangole", "mqc"),
+    ("mangseng", "mbh"),
+    ("mangue", "mom"),
+    ("manichaean middle persian", "xmn"),
+    ("manide", "abd"),
+    ("manikion", "mnx"),
+    ("manipa", "mqp"),
+    ("manipuri", "mni"),
+    ("mankanya", "knf"),
+    ("mankiyali", "nlm"),
+    ("manna-dora", "mju"),
+    ("mannan", "mjv"),
+    ("mano", "mev"),
+    ("manombai", "woo"),
+    ("mansaka", "msk"),
+    ("mansi", "mns"),
+    ("mansoanka", "msw"),
+    ("manta", "myg"),
+    ("mantsi", "nty"),
+    ("manumanaw karen", "kxf"),
+    ("manx", "glv"),
+    ("manya", "mzj"),
+    ("manyawa", "mny"),
+    ("manyika", "mxc"),
+    ("manza", "mzv"),
+    ("mao", "mri"),
+    ("mao naga", "nbi"),
+    ("maonan", "mmd"),
+    ("maore comorian", "swb"),
+    ("maori", "mri"),
+    ("mape", "mlh"),
+    ("mapena", "mnm"),
+    ("mapia", "mpy"),
+    ("mapidian", "mpw"),
+    ("mapos buang", "bzh"),
+    ("mapoyo", "mcg"),
+    ("mapudungun", "arn"),
+    ("mapun", "sjm"),
+    ("maquiritari", "mch"),
+    ("mar", "mar"),
+    ("mara chin", "mrh"),
+    ("marachi", "lri"),
+    ("maraghei", "vmh"),
+    ("maragus", "mrs"),
+    ("maram naga", "nma"),
+    ("marama", "lrm"),
+    ("maranao", "mrw"),
+    ("maranunggu", "zmr"),
+    ("mararit", "mgb"),
+    ("marathi", "mar"),
+    ("marau", "mvr"),
+    ("marba", "mpg"),
+    ("maremgi", "mrx"),
+    ("marenje", "vmr"),
+    ("marfa", "mvu"),
+    ("margany", "zmc"),
+    ("marghi central", "mrt"),
+    ("marghi south", "mfm"),
+    ("margos-yarowilca-lauricocha quechua", "qvm"),
+    ("margu", "mhg"),
+    ("mari (east sepik province)", "mbx"),
+    ("mari (madang province)", "hob"),
+    ("mari (russia)", "chm"),
+    ("maria (india)", "mrr"),
+    ("maria (papua new guinea)", "mds"),
+    ("maricopa", "mrc"),
+    ("maridan", "zmd"),
+    ("maridjabin", "zmj"),
+    ("marik", "dad"),
+    ("marimanindji", "zmm"),
+    ("marind", "mrz"),
+    ("maring", "mbw"),
+    ("maring naga", "nng"),
+    ("maringarr", "zmt"),
+    ("marino", "mrb"),
+    ("mariri", "mqi"),
+    ("maritime sign language", "nsr"),
+    ("maritsauá", "msp"),
+    ("mariyedi", "zmy"),
+    ("marka", "rkm"),
+    ("markweeta", "enb"),
+    ("marma", "rmz"),
+    ("marovo", "mvo"),
+    ("marra", "mec"),
+    ("marriammu", "xru"),
+    ("marrithiyel", "mfr"),
+    ("marrucinian", "umc"),
+    ("marshallese", "mah"),
+    ("marsian", "ims"),
+    ("martha's vineyard sign language", "mre"),
+    ("marti ke", "zmg"),
+    ("martu wangka", "mpj"),
+    ("martuyhunira", "vma"),
+    ("maru", "mhx"),
+    ("marwari", "mwr"),
+    ("marwari (india)", "rwr"),
+    ("marwari (pakistan)", "mve"),
+    ("marúbo", "mzr"),
+    ("mas", "mas"),
+    ("masaaba", "myx"),
+    ("masadiit itneg", "tis"),
+    ("masai", "mas"),
+    ("masalit", "mls"),
+    ("masana", "mcn"),
+    ("masbatenyo", "msb"),
+    ("mashco piro", "cuj"),
+    ("mashi (nigeria)", "jms"),
+    ("mashi (zambia)", "mho"),
+    ("masikoro malagasy", "msh"),
+    ("masimasi", "ism"),
+    ("masiwang", "bnf"),
+    ("maskelynes", "klv"),
+    ("maslam", "msv"),
+    ("masmaje", "mes"),
+    ("massalat", "mdg"),
+    ("massep", "mvs"),
+    ("matagalpa", "mtn"),
+    ("matal", "mfh"),
+    ("matbat", "xmt"),
+    ("matengo", "mgv"),
+    ("matepi", "mqe"),
+    ("matigsalug manobo", "mbt"),
+    ("matipuhy", "mzo"),
+    ("matngala", "zml"),
+    ("mato", "met"),
+    ("mato grosso arára", "axg"),
+    ("mator", "mtm"),
+    ("matsés", "mcf"),
+    ("mattole", "mvb"),
+    ("matu chin", "hlt"),
+    ("matukar", "mjk"),
+    ("matumbi", "mgw"),
+    ("matya samo", "stj"),
+    ("matís", "mpq"),
+    ("maung", "mph"),
+    ("mauritian sign language", "lsy"),
+    ("mauwake", "mhl"),
+    ("mawa (chad)", "mcw"),
+    ("mawa (nigeria)", "wma"),
+    ("mawak", "mjj"),
+    ("mawan", "mcz"),
+    ("mawayana", "mzx"),
+    ("mawchi", "mke"),
+    ("mawes", "mgk"),
+    ("maxakalí", "mbl"),
+    ("maxi gbe", "mxl"),
+    ("may", "msa"),
+    ("maya samo", "sym"),
+    ("mayaguduna", "xmy"),
+    ("mayangna", "yan"),
+    ("mayawali", "yxa"),
+    ("mayeka", "myc"),
+    ("mayi-kulan", "xyk"),
+    ("mayi-thakurti", "xyt"),
+    ("mayi-yapi", "xyj"),
+    ("mayo", "mfy"),
+    ("mayogo", "mdm"),
+    ("mayoyao ifugao", "ifu"),
+    ("mazagway", "dkx"),
+    ("mazaltepec zapotec", "zpy"),
+    ("mazanderani", "mzn"),
+    ("mazatlán mazatec", "vmz"),
+    ("mazatlán mixe", "mzl"),
+    ("mbala", "mdp"),
+    ("mbalanhu", "lnb"),
+    ("mbandja", "zmz"),
+    ("mbangala", "mxg"),
+    ("mbangi", "mgn"),
+    ("mbangwe", "zmn"),
+    ("mbara (australia)", "mvl"),
+    ("mbara (chad)", "mpk"),
+    ("mbariman-gudhinma", "zmv"),
+    ("mbati", "mdn"),
+    ("mbato", "gwa"),
+    ("mbay", "myb"),
+    ("mbe'", "mtk"),
+    ("mbelime", "mql"),
+    ("mbere", "mdt"),
+    ("mbesa", "zms"),
+    ("mbessa", "emz"),
+    ("mbo (cameroon)", "mbo"),
+    ("mbo (democratic republic of congo)", "zmw"),
+    ("mboi", "moi"),
+    ("mboko", "mdu"),
+    ("mbole", "mdq"),
+    ("mbonga", "xmb"),
+    ("mbongno", "bgu"),
+    ("mbosi", "mdw"),
+    ("mbowe", "mxo"),
+    ("mbre", "mka"),
+    ("mbudum", "xmd"),
+    ("mbugu", "mhd"),
+    ("mbugwe", "mgz"),
+    ("mbuko", "mqb"),
+    ("mbukushu", "mhw"),
+    ("mbula", "mna"),
+    ("mbula-bwazza", "mbu"),
+    ("mbule", "mlb"),
+    ("mbulungish", "mbv"),
+    ("mbum", "mdd"),
+    ("mbunda", "mck"),
+    ("mbunga", "mgy"),
+    ("mburku", "bbt"),
+    ("mbwela", "mfu"),
+    ("mbyá guaraní", "gun"),
+    ("mdf", "mdf"),
+    ("mdr", "mdr"),
+    ("me'en", "mym"),
+    ("medebur", "mjm"),
+    ("medefaidrin", "dmf"),
+    ("media lengua", "mue"),
+    ("median", "xme"),
+    ("mednyj aleut", "mud"),
+    ("medumba", "byv"),
+    ("mefele", "mfj"),
+    ("megam", "mef"),
+    ("megleno romanian", "ruq"),
+    ("mehek", "nux"),
+    ("mehináku", "mmh"),
+    ("mehri", "gdq"),
+    ("mekeo", "mek"),
+    ("mekmek", "mvk"),
+    ("mekwei", "msf"),
+    ("mel-khaonh", "hkn"),
+    ("mele-fila", "mxe"),
+    ("melo", "mfx"),
+    ("melpa", "med"),
+    ("memoni", "mby"),
+    ("men", "men"),
+    ("mendalam kayan", "xkd"),
+    ("mendankwe-nkwen", "mfd"),
+    ("mende (papua new guinea)", "sim"),
+    ("mende (sierra leone)", "men"),
+    ("mengaka", "xmg"),
+    ("mengen", "mee"),
+    ("mengisa", "mct"),
+    ("menka", "mea"),
+    ("menominee", "mez"),
+    ("mentawai", "mwv"),
+    ("menya", "mcr"),
+    ("meoswar", "mvx"),
+    ("meramera", "mxm"),
+    ("merei", "lmb"),
+    ("merey", "meq"),
+    ("meriam mir", "ulk"),
+    ("merlav", "mrm"),
+    ("meroitic", "xmr"),
+    ("meru", "mer"),
+    ("merwari", "wry"),
+    ("mesaka", "iyo"),
+    ("mescalero-chiricahua apache", "apm"),
+    ("mese", "mci"),
+    ("meskwaki", "sac"),
+    ("mesme", "zim"),
+    ("mesmes", "mys"),
+    ("mesopotamian arabic", "acm"),
+    ("mesqan", "mvz"),
+    ("messapic", "cms"),
+    ("meta'", "mgo"),
+    ("metlatónoc mixtec", "mxv"),
+    ("mewari", "mtr"),
+    ("mewati", "wtm"),
+    ("mexican sign language", "mfs"),
+    ("meyah", "mej"),
+    ("mezontla popoloca", "pbe"),
+    ("mezquital otomi", "ote"),
+    ("mfinu", "zmf"),
+    ("mfumte", "nfu"),
+    ("mg", "mlg"),
+    ("mga", "mga"),
+    ("mgbolizhia", "gmz"),
+    ("mh", "mah"),
+    ("mi", "mri"),
+    ("mi'kmaq", "mic"),
+    ("miahuatlán zapotec", "zam"),
+    ("miami", "mia"),
+    ("mian", "mpt"),
+    ("miani", "pla"),
+    ("mic", "mic"),
+    ("michif", "crg"),
+    ("michigamea", "cmm"),
+    ("michoacán mazahua", "mmc"),
+    ("michoacán nahuatl", "ncl"),
+    ("mid grand valley dani", "dnt"),
+    ("mid-southern banda", "bjo"),
+    ("middle armenian", "axm"),
+    ("middle breton", "xbm"),
+    ("middle cornish", "cnx"),
+    ("middle dutch (ca. 1050-1350)", "dum"),
+    ("middle english (1100-1500)", "enm"),
+    ("middle french (ca. 1400-1600)", "frm"),
+    ("middle high german (ca. 1050-1500)", "gmh"),
+    ("middle hittite", "htx"),
+    ("middle irish (900-1200)", "mga"),
+    ("middle korean (10th-16th cent.)", "okm"),
+    ("middle low german", "gml"),
+    ("middle mongolian", "xng"),
+    ("middle newar", "nwx"),
+    ("middle watut", "mpl"),
+    ("middle welsh", "wlm"),
+    ("midob", "mei"),
+    ("migaama", "mmy"),
+    ("migabac", "mpp"),
+    ("migum", "klm"),
+    ("miju-mishmi", "mxj"),
+    ("mikasuki", "mik"),
+    ("mili", "ymh"),
+    ("miltu", "mlj"),
+    ("miluk", "iml"),
+    ("milyan", "imy"),
+    ("min", "min"),
+    ("min bei chinese", "mnp"),
+    ("min dong chinese", "cdo"),
+    ("min nan chinese", "nan"),
+    ("min zhong chinese", "czo"),
+    ("mina (cameroon)", "hna"),
+    ("minaean", "inm"),
+    ("minang", "xrg"),
+    ("minangkabau", "min"),
+    ("minanibai", "mcv"),
+    ("minaveha", "mvn"),
+    ("minderico", "drc"),
+    ("mindiri", "mpn"),
+    ("mingang doso", "mko"),
+    ("mingrelian", "xmf"),
+    ("minica huitoto", "hto"),
+    ("minidien", "wii"),
+    ("minjungbal", "xjb"),
+    ("minkin", "xxm"),
+    ("minoan", "omn"),
+    ("minokok", "mqq"),
+    ("minriq", "mnq"),
+    ("mintil", "mzt"),
+    ("minz zhuang", "zgm"),
+    ("miqie", "yiq"),
+    ("mirandese", "mwl"),
+    ("miraya bikol", "rbl"),
+    ("mirgan", "zrg"),
+    ("miriti", "mmv"),
+    ("miriwoong", "mep"),
+    ("miriwoong sign language", "rsm"),
+    ("mirning", "gmr"),
+    ("mis", "mis"),
+    ("miship", "mjs"),
+    ("misima-panaeati", "mpx"),
+    ("mising", "mrg"),
+    ("mitla zapotec", "zaw"),
+    ("mitlatongo mixtec", "vmm"),
+    ("mittu", "mwu"),
+    ("mituku", "zmq"),
+    ("miwa", "vmi"),
+    ("mixed great andamanese", "gac"),
+    ("mixtepec mixtec", "mix"),
+    ("mixtepec zapotec", "zpm"),
+    ("miya", "mkf"),
+    ("miyako", "mvi"),
+    ("miyakubo sign language", "ehs"),
+    ("miyobe", "soy"),
+    ("mk", "mkd"),
+    ("mkd", "mkd"),
+    ("ml", "mal"),
+    ("mlabri", "mra"),
+    ("mlahsö", "lhs"),
+    ("mlap", "kja"),
+    ("mlg", "mlg"),
+    ("mlomp", "mlo"),
+    ("mlt", "mlt"),
+    ("mmaala", "mmu"),
+    ("mmen", "bfm"),
+    ("mn", "mon"),
+    ("mnc", "mnc"),
+    ("mni", "mni"),
+    ("mo", "ron"),
+    ("mo'da", "gbn"),
+    ("moabite", "obm"),
+    ("moba", "mfq"),
+    ("mobilian", "mod"),
+    ("mobumrin aizi", "ahm"),
+    ("mobwa karen", "jkm"),
+    ("mochi", "old"),
+    ("mochica", "omc"),
+    ("mocho", "mhc"),
+    ("mocoví", "moc"),
+    ("modang", "mxd"),
+    ("modern greek (1453-)", "ell"),
+    ("modole", "mqo"),
+    ("moere", "mvq"),
+    ("mofu-gudur", "mif"),
+    ("mogholi", "mhj"),
+    ("mogofin", "mfg"),
+    ("mogum", "mou"),
+    ("moh", "moh"),
+    ("mohave", "mov"),
+    ("mohawk", "moh"),
+    ("mohegan-pequot", "xpq"),
+    ("moi (congo)", "mow"),
+    ("moi (indonesia)", "mxn"),
+    ("moikodi", "mkp"),
+    ("moingi", "mwz"),
+    ("moji", "ymi"),
+    ("moken", "mwt"),
+    ("mokerang", "mft"),
+    ("mokilese", "mkj"),
+    ("moklen", "mkm"),
+    ("mokole", "mkl"),
+    ("mokpwe", "bri"),
+    ("moksela", "vms"),
+    ("moksha", "mdf"),
+    ("mol", "ron"),
+    ("molale", "mbe"),
+    ("molbog", "pwm"),
+    ("moldavian", "ron"),
+    ("moldova sign language", "vsi"),
+    ("moldovan", "ron"),
+    ("molengue", "bxc"),
+    ("molima", "mox"),
+    ("molmo one", "aun"),
+    ("molo", "zmo"),
+    ("molof", "msl"),
+    ("moloko", "mlw"),
+    ("mom jango", "ver"),
+    ("moma", "myl"),
+    ("momare", "msz"),
+    ("mombo dogon", "dmb"),
+    ("mombum", "mso"),
+    ("momina", "mmb"),
+    ("momuna", "mqf"),
+    ("mon", "mon"),
+    ("monastic sign language", "mzg"),
+    ("mondropolon", "npn"),
+    ("mondé", "mnd"),
+    ("mongo", "lol"),
+    ("mongol", "mon"),
+    ("mongolia buriat", "bxm"),
+    ("mongolian", "mon"),
+    ("mongolian sign language", "msr"),
+    ("mongondow", "mog"),
+    ("moni", "mnz"),
+    ("mono (cameroon)", "mru"),
+    ("mono (democratic republic of congo)", "mnh"),
+    ("mono (solomon islands)", "mte"),
+    ("mono (usa)", "mnr"),
+    ("monom", "moo"),
+    ("monsang naga", "nmh"),
+    ("montenegrin", "cnr"),
+    ("montenegrino", "cnr"),
+    ("montol", "mtl"),
+    ("monténégrin", "cnr"),
+    ("monumbo", "mxk"),
+    ("monzombo", "moj"),
+    ("moose cree", "crm"),
+    ("mopán maya", "mop"),
+    ("mor (bomberai peninsula)", "moq"),
+    ("mor (mor islands)", "mhz"),
+    ("moraid", "msg"),
+    ("morawa", "mze"),
+    ("morelos nahuatl", "nhm"),
+    ("morerebi", "xmo"),
+    ("moresada", "msx"),
+    ("mori atas", "mzq"),
+    ("mori bawah", "xmz"),
+    ("morigi", "mdb"),
+    ("morisyen", "mfe"),
+    ("moro", "mor"),
+    ("moroccan arabic", "ary"),
+    ("moroccan sign language", "xms"),
+    ("morokodo", "mgc"),
+    ("morom", "bdo"),
+    ("moronene", "mqn"),
+    ("morori", "mok"),
+    ("morouas", "mrp"),
+    ("morrobalama", "umg"),
+    ("mortlockese", "mrl"),
+    ("moru", "mgd"),
+    ("mos", "mos"),
+    ("mosimo", "mqv"),
+    ("moskona", "mtj"),
+    ("mossi", "mos"),
+    ("mota", "mtt"),
+    ("motlav", "mlv"),
+    ("motu", "meu"),
+    ("mouk-aria", "mwh"),
+    ("moundadan chetty", "cty"),
+    ("mountain koiali", "kpx"),
+    ("mouwase", "jmw"),
+    ("movima", "mzp"),
+    ("moyadan itneg", "ity"),
+    ("moyon naga", "nmo"),
+    ("mozambican sign language", "mzy"),
+    ("mozarabic", "mxi"),
+    ("mpade", "mpi"),
+    ("mpalitjanh", "xpj"),
+    ("mpiemo", "mcx"),
+    ("mpinda", "pnd"),
+    ("mpoto", "mpa"),
+    ("mpotovoro", "mvt"),
+    ("mpumpong", "mgg"),
+    ("mpuono", "zmp"),
+    ("mpur", "akc"),
+    ("mr", "mar"),
+    ("mri", "mri"),
+    ("mro-khimi chin", "cmr"),
+    ("ms", "msa"),
+    ("msa", "msa"),
+    ("mser", "kqx"),
+    ("mt", "mlt"),
+    ("mt. iraya agta", "atl"),
+    ("mt. iriga agta", "agz"),
+    ("muak sa-aak", "ukk"),
+    ("mualang", "mtd"),
+    ("mubami", "tsx"),
+    ("mubi", "mub"),
+    ("muda", "ymd"),
+    ("mudburra", "dmw"),
+    ("mudhili gadaba", "gau"),
+    ("mudu koraga", "vmd"),
+    ("muduga", "udg"),
+    ("mufian", "aoj"),
+    ("mugom", "muk"),
+    ("muinane", "bmr"),
+    ("mukha-dora", "mmk"),
+    ("mukulu", "moz"),
+    ("mul", "mul"),
+    ("mulaha", "mfw"),
+    ("mulam", "mlm"),
+    ("mulao", "giu"),
+    ("mulgi", "mvh"),
+    ("mullu kurumba", "kpb"),
+    ("multiple languages", "mul"),
+    ("muluridyi", "vmu"),
+    ("mumuye", "mzm"),
+    ("muna", "mnb"),
+    ("munda", "unx"),
+    ("mundabli", "boe"),
+    ("mundang", "mua"),
+    ("mundani", "mnf"),
+    ("mundari", "unr"),
+    ("mundat", "mmf"),
+    ("mundurukú", "myu"),
+    ("mungaka", "mhk"),
+    ("munggui", "mth"),
+    ("mungkip", "mpv"),
+    ("muniche", "myr"),
+    ("munit", "mtc"),
+    ("munji", "mnj"),
+    ("munsee", "umu"),
+    ("muong", "mtq"),
+    ("mur pano", "tkv"),
+    ("muratayak", "asx"),
+    ("murik (malaysia)", "mxr"),
+    ("murik (papua new guinea)", "mtf"),
+    ("murkim", "rmh"),
+    ("murle", "mur"),
+    ("murrinh-patha", "mwf"),
+    ("mursi", "muz"),
+    ("murui huitoto", "huu"),
+    ("murupi", "mqw"),
+    ("muruwari", "zmu"),
+    ("mus", "mus"),
+    ("musak", "mmq"),
+    ("musar", "mmi"),
+    ("musasa", "smm"),
+    ("musey", "mse"),
+    ("musgu", "mug"),
+    ("mushungulu", "xma"),
+    ("musi", "mui"),
+    ("muskum", "mje"),
+    ("muslim tat", "ttt"),
+    ("musom", "msu"),
+    ("mussau-emira", "emi"),
+    ("muthuvan", "muv"),
+    ("mutu", "tuc"),
+    ("muyang", "muy"),
+    ("muyuw", "myw"),
+    ("muzi", "ymz"),
+    ("mvanip", "mcj"),
+    ("mvuba", "mxh"),
+    ("mwaghavul", "sur"),
+    ("mwali comorian", "wlc"),
+    ("mwan", "moa"),
+    ("mwani", "wmw"),
+    ("mwatebu", "mwa"),
+    ("mwera (chimwera)", "mwe"),
+    ("mwera (nyasa)", "mjh"),
+    ("mwimbi-muthambi", "mws"),
+    ("mwl", "mwl"),
+    ("mwr", "mwr"),
+    ("my", "mya"),
+    ("mya", "mya"),
+    ("myanmar sign language", "ysm"),
+    ("mycenaean greek", "gmy"),
+    ("myene", "mye"),
+    ("mysian", "yms"),
+    ("myv", "myv"),
+    ("mzieme naga", "nme"),
+    ("mághdì", "gmd"),
+    ("máku", "xak"),
+    ("ménik", "tnr"),
+    ("mískito", "miq"),
+    ("mócheno", "mhn"),
+    ("mün chin", "mwq"),
+    ("mündü", "muh"),
+    ("māhārāṣṭri prākrit", "pmh"),
+    ("n'ko", "nqo"),
+    ("na", "nau"),
+    ("na-kara", "nck"),
+    ("naaba", "nao"),
+    ("naami", "bzv"),
+    ("naasioi", "nas"),
+    ("naba", "mne"),
+    ("nabak", "naf"),
+    ("nabi", "mty"),
+    ("nachering", "ncd"),
+    ("nadruvian", "ndf"),
+    ("nadëb", "mbj"),
+    ("nafaanra", "nfr"),
+    ("nafi", "srf"),
+    ("nafri", "nxx"),
+    ("nafusi", "jbn"),
+    ("naga pidgin", "nag"),
+    ("nagarchal", "nbg"),
+    ("nage", "nxe"),
+    ("nagumi", "ngv"),
+    ("nahali", "nlx"),
+    ("nahari", "nhh"),
+    ("najdi arabic", "ars"),
+    ("naka'ela", "nae"),
+    ("nakai", "nkj"),
+    ("nakame", "nib"),
+    ("nakanai", "nak"),
+    ("nake", "nbk"),
+    ("naki", "mff"),
+    ("nakwi", "nax"),
+    ("nalca", "nlc"),
+    ("nali", "nss"),
+    ("nalik", "nal"),
+    ("nalu", "naj"),
+    ("naluo yi", "ylo"),
+    ("nalögo", "nlz"),
+    ("nama (papua new guinea)", "nmx"),
+    ("namakura", "nmk"),
+    ("namat", "nkm"),
+    ("nambo", "ncm"),
+    ("nambya", "nmq"),
+    ("namia", "nnm"),
+    ("namiae", "nvm"),
+    ("namibian sign language", "nbs"),
+    ("namla", "naa"),
+    ("namo", "mxw"),
+    ("namonuito", "nmt"),
+    ("namosi-naitasiri-serua", "bwb"),
+    ("namuyi", "nmy"),
+    ("nanai", "gld"),
+    ("nancere", "nnc"),
+    ("nande", "nnb"),
+    ("nandi", "niq"),
+    ("nanerigé sénoufo", "sen"),
+    ("nanga dama dogon", "nzz"),
+    ("nankina", "nnk"),
+    ("nanti", "cox"),
+    ("nanticoke", "nnt"),
+    ("nanubae", "afk"),
+    ("nap", "nap"),
+    ("napo lowland quechua", "qvo"),
+    ("napu", "npy"),
+    ("nar phu", "npa"),
+    ("nara", "nrb"),
+    ("narak", "nac"),
+    ("narango", "nrg"),
+    ("nari nari", "rnr"),
+    ("narim", "loh"),
+    ("naro", "nhr"),
+    ("narom", "nrm"),
+    ("narragansett", "xnt"),
+    ("narua", "nru"),
+    ("narungga", "nnr"),
+    ("nasal", "nsy"),
+    ("nasarian", "nvh"),
+    ("naskapi", "nsk"),
+    ("natanzi", "ntz"),
+    ("natchez", "ncz"),
+    ("nateni", "ntm"),
+    ("nathembo", "nte"),
+    ("natioro", "nti"),
+    ("natügu", "ntu"),
+    ("nau", "nau"),
+    ("nauete", "nxa"),
+    ("naukan yupik", "ynk"),
+    ("nauna", "ncn"),
+    ("nauo", "nwo"),
+    ("nauru", "nau"),
+    ("nav", "nav"),
+    ("navajo", "nav"),
+    ("navut", "nsw"),
+    ("nawaru", "nwr"),
+    ("nawathinehena", "nwa"),
+    ("nawdm", "nmz"),
+    ("nawuri", "naw"),
+    ("naxi", "nxq"),
+    ("nayi", "noz"),
+    ("nayini", "nyq"),
+    ("nb", "nob"),
+    ("nbl", "nbl"),
+    ("ncane", "ncr"),
+    ("nchumbulu", "nlu"),
+    ("nd", "nde"),
+    ("nda'nda'", "nnz"),
+    ("ndai", "gke"),
+    ("ndaka", "ndk"),
+    ("ndali", "ndh"),
+    ("ndam", "ndm"),
+    ("ndamba", "ndj"),
+    ("ndambomo", "nxo"),
+    ("ndasa", "nda"),
+    ("ndau", "ndc"),
+    ("nde", "nde"),
+    ("nde-gbite", "ned"),
+    ("nde-nsele-nta", "ndd"),
+    ("ndemli", "nml"),
+    ("ndendeule", "dne"),
+    ("ndengereko", "ndg"),
+    ("nding", "eli"),
+    ("ndo", "ndo"),
+    ("ndobo", "ndw"),
+    ("ndoe", "nbb"),
+    ("ndogo", "ndz"),
+    ("ndolo", "ndl"),
+    ("ndom", "nqm"),
+    ("ndombe", "ndq"),
+    ("ndonde hamba", "njd"),
+    ("ndonga", "ndo"),
+    ("ndoola", "ndr"),
+    ("ndra'ngith", "dgt"),
+    ("ndrulo", "dno"),
+    ("nds", "nds"),
+    ("nduga", "ndx"),
+    ("ndumu", "nmd"),
+    ("ndunda", "nuh"),
+    ("ndunga", "ndt"),
+    ("ndut", "ndv"),
+    ("ndyuka-trio pidgin", "njt"),
+    ("ndzwani comorian", "wni"),
+    ("ne", "nep"),
+    ("neapolitan", "nap"),
+    ("nedebang", "nec"),
+    ("nederlands", "nld"),
+    ("neerlandés", "nld"),
+    ("nefamese", "nef"),
+    ("negerhollands", "dcr"),
+    ("negeri sembilan malay", "zmi"),
+    ("negidal", "neg"),
+    ("nehan", "nsn"),
+    ("nekgini", "nkg"),
+    ("neko", "nej"),
+    ("neku", "nek"),
+    ("nema", "gsn"),
+    ("neme", "nex"),
+    ("nemi", "nem"),
+    ("nend", "anh"),
+    ("nenets", "yrk"),
+    ("nengone", "nen"),
+    ("neo-hittite", "nei"),
+    ("nep", "nep"),
+    ("nepalese", "nep"),
+    ("nepalese sign language", "nsp"),
+    ("nepali", "nep"),
+    ("nepali (individual language)", "npi"),
+    ("nepali (macrolanguage)", "nep"),
+    ("nepalí", "nep"),
+    ("nete", "net"),
+    ("new", "new"),
+    ("new caledonian javanese", "jas"),
+    ("new zealand sign language", "nzs"),
+    ("newari", "new"),
+    ("neyo", "ney"),
+    ("nez perce", "nez"),
+    ("ng", "ndo"),
+    ("ngaanyatjarra", "ntj"),
+    ("ngad'a", "nxg"),
+    ("ngadjunmaya", "nju"),
+    ("ngadjuri", "jui"),
+    ("ngaing", "nnf"),
+    ("ngaju", "nij"),
+    ("ngala", "nud"),
+    ("ngalakgan", "nig"),
+    ("ngalum", "szb"),
+    ("ngam", "nmc"),
+    ("ngamambo", "nbv"),
+    ("ngambay", "sba"),
+    ("ngamini", "nmv"),
+    ("ngamo", "nbh"),
+    ("ngan'gityemerri", "nam"),
+    ("nganakarti", "xnk"),
+    ("nganasan", "nio"),
+    ("ngandi", "nid"),
+    ("ngando (central african republic)", "ngd"),
+    ("ngando (democratic republic of congo)", "nxd"),
+    ("ngandyera", "nne"),
+    ("ngangam", "gng"),
+    ("ngantangarra", "ntg"),
+    ("nganyaywana", "nyx"),
+    ("ngardi", "rxd"),
+    ("ngarigu", "xni"),
+    ("ngarinyin", "ung"),
+    ("ngarinyman", "nbj"),
+    ("ngarla", "nrk"),
+    ("ngarluma", "nrl"),
+    ("ngarrindjeri", "nay"),
+    ("ngas", "anc"),
+    ("ngasa", "nsg"),
+    ("ngatik men's creole", "ngm"),
+    ("ngawn chin", "cnw"),
+    ("ngawun", "nxn"),
+    ("ngayawung", "nwg"),
+    ("ngazidja comorian", "zdj"),
+    ("ngbaka", "nga"),
+    ("ngbaka ma'bo", "nbm"),
+    ("ngbaka manza", "ngg"),
+    ("ngbee", "jgb"),
+    ("ngbinda", "nbd"),
+    ("ngbundu", "nuu"),
+    ("ngelima", "agh"),
+    ("ngemba", "nge"),
+    ("ngen", "gnj"),
+    ("ngendelengo", "nql"),
+    ("ngete", "nnn"),
+    ("nggem", "nbq"),
+    ("nggwahyi", "ngx"),
+    ("ngie", "ngj"),
+    ("ngiemboon", "nnh"),
+    ("ngile", "jle"),
+    ("ngindo", "nnq"),
+    ("ngiti", "niy"),
+    ("ngizim", "ngi"),
+    ("ngkâlmpw kanum", "kcd"),
+    ("ngom", "nra"),
+    ("ngomba", "jgo"),
+    ("ngombale", "nla"),
+    ("ngombe (central african republic)", "nmj"),
+    ("ngombe (democratic republic of congo)", "ngc"),
+    ("ngongo", "noq"),
+    ("ngoni", "ngo"),
+    ("ngoni (mozambique)", "xnq"),
+    ("ngoni (tanzania)", "xnj"),
+    ("ngoshie", "nsh"),
+    ("ngul", "nlo"),
+    ("ngulu", "ngp"),
+    ("nguluwan", "nuw"),
+    ("ngumbarl", "xnm"),
+    ("ngumbi", "nui"),
+    ("ngunawal", "xul"),
+    ("ngundi", "ndn"),
+    ("ngundu", "nue"),
+    ("ngungwel", "ngz"),
+    ("ngurimi", "ngq"),
+    ("ngurmbur", "nrx"),
+    ("nguôn", "nuo"),
+    ("ngwaba", "ngw"),
+    ("ngwe", "nwe"),
+    ("ngwo", "ngn"),
+    ("ngäbere", "gym"),
+    ("nhanda", "nha"),
+    ("nhengatu", "yrl"),
+    ("nhirrpi", "hrp"),
+    ("nhuwala", "nhf"),
+    ("nia", "nia"),
+    ("nias", "nia"),
+    ("nicaragua creole english", "bzk"),
+    ("nicaraguan sign language", "ncs"),
+    ("niellim", "nie"),
+    ("nigeria mambila", "mzk"),
+    ("nigerian fulfulde", "fuv"),
+    ("nigerian pidgin", "pcm"),
+    ("nigerian sign language", "nsi"),
+    ("nihali", "nll"),
+    ("niksek", "gbe"),
+    ("nila", "nil"),
+    ("nilamba", "nim"),
+    ("nimadi", "noe"),
+    ("nimanbur", "nmp"),
+    ("nimbari", "nmr"),
+    ("nimboran", "nir"),
+    ("nimi", "nis"),
+    ("nimo", "niw"),
+    ("nimoa", "nmw"),
+    ("ninam", "shb"),
+    ("nindi", "nxi"),
+    ("ningera", "nby"),
+    ("ninggerum", "nxr"),
+    ("ningil", "niz"),
+    ("ninia yali", "nlk"),
+    ("ninzo", "nin"),
+    ("nipsan", "nps"),
+    ("nisa", "njs"),
+    ("nisenan", "nsz"),
+    ("nisga'a", "ncg"),
+    ("nisi (china)", "yso"),
+    ("niu", "niu"),
+    ("niuafo'ou", "num"),
+    ("niuatoputapu", "nkp"),
+    ("niuean", "niu"),
+    ("nivaclé", "cag"),
+    ("niwer mil", "hrc"),
+    ("njalgulgule", "njl"),
+    ("njebi", "nzb"),
+    ("njen", "njj"),
+    ("njerep", "njr"),
+    ("njyem", "njy"),
+    ("nkami", "nkq"),
+    ("nkangala", "nkn"),
+    ("nkari", "nkz"),
+    ("nkem-nkum", "isi"),
+    ("nkhumbi", "khu"),
+    ("nkongho", "nkc"),
+    ("nkonya", "nko"),
+    ("nkoroo", "nkx"),
+    ("nkoya", "nka"),
+    ("nkukoli", "nbo"),
+    ("nkutu", "nkw"),
+    ("nl", "nld"),
+    ("nld", "nld"),
+    ("nn", "nno"),
+    ("nnam", "nbp"),
+    ("nno", "nor"),
+    ("no", "nor"),
+    ("no linguistic content", "zxx"),
+    ("nob", "nob"),
+    ("nobiin", "fia"),
+    ("nobonob", "gaw"),
+    ("nocamán", "nom"),
+    ("nocte naga", "njb"),
+    ("nog", "nog"),
+    ("nogai", "nog"),
+    ("noipx", "npx"),
+    ("noiri", "noi"),
+    ("nokuku", "nkk"),
+    ("nomaande", "lem"),
+    ("nomane", "nof"),
+    ("nomatsiguenga", "not"),
+    ("nomlaki", "nol"),
+    ("nomu", "noh"),
+    ("non", "non"),
+    ("nong zhuang", "zhn"),
+    ("nonuya", "noj"),
+    ("nooksack", "nok"),
+    ("noon", "snf"),
+    ("noone", "nhu"),
+    ("nopala chatino", "cya"),
+    ("nor", "nor"),
+    ("noric", "nrc"),
+    ("norn", "nrn"),
+    ("norra", "nrr"),
+    ("norsk", "nor"),
+    ("north alaskan inupiatun", "esi"),
+    ("north ambrym", "mmg"),
+    ("north asmat", "nks"),
+    ("north awyu", "yir"),
+    ("north azerbaijani", "azj"),
+    ("north babar", "bcd"),
+    ("north bolivian quechua", "qul"),
+    ("north central mixe", "neq"),
+    ("north efate", "llp"),
+    ("north fali", "fll"),
+    ("north giziga", "gis"),
+    ("north junín quechua", "qvn"),
+    ("north levantine arabic", "apc"),
+    ("north marquesan", "mrq"),
+    ("north mesopotamian arabic", "ayp"),
+    ("north midlands tasmanian", "xph"),
+    ("north mofu", "mfk"),
+    ("north moluccan malay", "max"),
+    ("north muyu", "kti"),
+    ("north ndebele", "nde"),
+    ("north nuaulu", "nni"),
+    ("north picene", "nrp"),
+    ("north slavey", "scs"),
+    ("north tairora", "tbg"),
+    ("north tanna", "tnn"),
+    ("north wahgi", "whg"),
+    ("north watut", "una"),
+    ("northeast kiwai", "kiw"),
+    ("northeast maidu", "nmu"),
+    ("northeast pashai", "aee"),
+    ("northeastern dinka", "dip"),
+    ("northeastern pomo", "pef"),
+    ("northeastern tasmanian", "xpb"),
+    ("northeastern thai", "tts"),
+    ("northern alta", "aqn"),
+    ("northern altai", "atv"),
+    ("northern amami-oshima", "ryn"),
+    ("northern betsimisaraka malagasy", "bmm"),
+    ("northern binukidnon", "kyn"),
+    ("northern bobo madaré", "bbo"),
+    ("northern bontok", "rbk"),
+    ("northern catanduanes bikol", "cts"),
+    ("northern conchucos ancash quechua", "qxn"),
+    ("northern dagara", "dgi"),
+    ("northern dong", "doc"),
+    ("northern east cree", "crl"),
+    ("northern emberá", "emp"),
+    ("northern frisian", "frr"),
+    ("northern ghale", "ghh"),
+    ("northern gondi", "gno"),
+    ("northern grebo", "gbo"),
+    ("northern guiyang hmong", "huj"),
+    ("northern haida", "hdn"),
+    ("northern hindko", "hno"),
+    ("northern huishui hmong", "hmi"),
+    ("northern kalapuya", "nrt"),
+    ("northern kankanay", "xnn"),
+    ("northern katang", "ncq"),
+    ("northern khmer", "kxm"),
+    ("northern kissi", "kqs"),
+    ("northern kurdish", "kmr"),
+    ("northern luri", "lrc"),
+    ("northern mashan hmong", "hmp"),
+    ("northern muji", "ymx"),
+    ("northern nago", "xkb"),
+    ("northern ngbandi", "ngb"),
+    ("northern nisu", "yiv"),
+    ("northern nuni", "nuv"),
+    ("northern oaxaca nahuatl", "nhy"),
+    ("northern ohlone", "cst"),
+    ("northern one", "onr"),
+    ("northern paiute", "pao"),
+    ("northern pame", "pmq"),
+    ("northern pashto", "pbu"),
+    ("northern pastaza quichua", "qvz"),
+    ("northern ping chinese", "cnp"),
+    ("northern pomo", "pej"),
+    ("northern puebla nahuatl", "ncj"),
+    ("northern pumi", "pmi"),
+    ("northern qiandong miao", "hea"),
+    ("northern qiang", "cng"),
+    ("northern rengma naga", "nnl"),
+    ("northern roglai", "rog"),
+    ("northern sami", "sme"),
+    ("northern sierra miwok", "nsq"),
+    ("northern sorsoganon", "bks"),
+    ("northern subanen", "stb"),
+    ("northern tarahumara", "thh"),
+    ("northern tasmanian", "xpv"),
+    ("northern tepehuan", "ntp"),
+    ("northern thai", "nod"),
+    ("northern tidung", "ntd"),
+    ("northern tiwa", "twf"),
+    ("northern tlaxiaco mixtec", "xtn"),
+    ("northern toussian", "tsp"),
+    ("northern tujia", "tji"),
+    ("northern tutchone", "ttm"),
+    ("northern uzbek", "uzn"),
+    ("northern yukaghir", "ykg"),
+    ("northwest alaska inupiatun", "esk"),
+    ("northwest gbaya", "gya"),
+    ("northwest maidu", "mjd"),
+    ("northwest oaxaca mixtec", "mxa"),
+    ("northwest pashai", "glh"),
+    ("northwestern dinka", "diw"),
+    ("northwestern fars", "faz"),
+    ("northwestern kolami", "kfb"),
+    ("northwestern nisu", "nsf"),
+    ("northwestern ojibwa", "ojb"),
+    ("northwestern tamang", "tmk"),
+    ("northwestern tasmanian", "xpw"),
+    ("noruego", "nor"),
+    ("norvégien", "nor"),
+    ("norwegian", "nor"),
+    ("norwegian bokmål", "nob"),
+    ("norwegian nynorsk", "nno"),
+    ("norwegian sign language", "nsl"),
+    ("notre", "bly"),
+    ("notsi", "ncf"),
+    ("nottoway", "ntw"),
+    ("nottoway-meherrin", "nwy"),
+    ("novial", "nov"),
+    ("npi", "nep"),
+    ("nqo", "nqo"),
+    ("nr", "nbl"),
+    ("nsenga", "nse"),
+    ("nshi", "nsc"),
+    ("nso", "nso"),
+    ("nsongo", "nsx"),
+    ("ntcham", "bud"),
+    ("nteng", "nqt"),
+    ("ntomba", "nto"),
+    ("nubaca", "baf"),
+    ("nubi", "kcn"),
+    ("nubri", "kte"),
+    ("nuer", "nus"),
+    ("nugunu (australia)", "nnv"),
+    ("nugunu (cameroon)", "yas"),
+    ("nukak makú", "mbr"),
+    ("nukna", "klt"),
+    ("nukuini", "nuc"),
+    ("nukumanu", "nuq"),
+    ("nukunul", "xnu"),
+    ("nukuoro", "nkr"),
+    ("nukuria", "nur"),
+    ("numana", "nbr"),
+    ("numanggang", "nop"),
+    ("numbami", "sij"),
+    ("nume", "tgs"),
+    ("numidian", "nxm"),
+    ("numèè", "kdk"),
+    ("nung (viet nam)", "nut"),
+    ("nungali", "nug"),
+    ("nunggubuyu", "nuy"),
+    ("nungu", "rin"),
+    ("nupbikha", "npb"),
+    ("nupe-nupe-tako", "nup"),
+    ("nusa laut", "nul"),
+    ("nusu", "nuf"),
+    ("nuu-chah-nulth", "nuk"),
+    ("nv", "nav"),
+    ("nwc", "nwc"),
+    ("ny", "nya"),
+    ("nya", "nya"),
+    ("nyabwa", "nwb"),
+    ("nyaheun", "nev"),
+    ("nyahkur", "cbn"),
+    ("nyakyusa-ngonde", "nyy"),
+    ("nyali", "nlj"),
+    ("nyam", "nmi"),
+    ("nyamal", "nly"),
+    ("nyambo", "now"),
+    ("nyamusa-molo", "nwm"),
+    ("nyamwanga", "mwn"),
+    ("nyamwezi", "nym"),
+    ("nyaneka", "nyk"),
+    ("nyang'i", "nyp"),
+    ("nyanga", "nyj"),
+    ("nyanga-li", "nyc"),
+    ("nyangatom", "nnj"),
+    ("nyangbo", "nyb"),
+    ("nyangga", "nny"),
+    ("nyangumarta", "nna"),
+    ("nyanja", "nya"),
+    ("nyankole", "nyn"),
+    ("nyankpa", "yes"),
+    ("nyarafolo senoufo", "sev"),
+    ("nyaturu", "rim"),
+    ("nyaw", "nyw"),
+    ("nyawaygi", "nyt"),
+    ("nyemba", "nba"),
+    ("nyengo", "nye"),
+    ("nyenkha", "neh"),
+    ("nyeu", "nyl"),
+    ("nyiha (malawi)", "nyr"),
+    ("nyiha (tanzania)", "nih"),
+    ("nyika (malawi and zambia)", "nkv"),
+    ("nyika (tanzania)", "nkt"),
+    ("nyikina", "nyh"),
+    ("nyindrou", "lid"),
+    ("nyindu", "nyg"),
+    ("nyishi", "njz"),
+    ("nyiyaparli", "xny"),
+    ("nym", "nym"),
+    ("nyn", "nyn"),
+    ("nyo", "nyo"),
+    ("nyokon", "nvo"),
+    ("nyole", "nuj"),
+    ("nyong", "muo"),
+    ("nyore", "nyd"),
+    ("nyoro", "nyo"),
+    ("nyulnyul", "nyv"),
+    ("nyungar", "nys"),
+    ("nyungwe", "nyu"),
+    ("nyâlayu", "yly"),
+    ("nzadi", "nzd"),
+    ("nzakambay", "nzy"),
+    ("nzakara", "nzk"),
+    ("nzanyi", "nja"),
+    ("nzi", "nzi"),
+    ("nzima", "nzi"),
+    ("ná-meo", "neo"),
+    ("néerlandais", "nld"),
+    ("népalais", "nep"),
+    ("nêlêmwa-nixumwak", "nee"),
+    ("nüpode huitoto", "hux"),
+    ("nǁng", "ngh"),
+    ("o'chi'chi'", "xoc"),
+    ("o'du", "tyh"),
+    ("obanliku", "bzy"),
+    ("obispeño", "obi"),
+    ("oblo", "obl"),
+    ("obo manobo", "obo"),
+    ("obokuitai", "afz"),
+    ("obolo", "ann"),
+    ("obulom", "obu"),
+    ("oc", "oci"),
+    ("ocaina", "oca"),
+    ("occitan (post 1500)", "oci"),
+    ("oci", "oci"),
+    ("ocotepec mixtec", "mie"),
+    ("ocotlán zapotec", "zac"),
+    ("odia", "ory"),
+    ("odiai", "bhf"),
+    ("odoodee", "kkc"),
+    ("odual", "odu"),
+    ("odut", "oda"),
+    ("ofayé", "opy"),
+    ("official aramaic (700-300 bce)", "arc"),
+    ("ogbah", "ogc"),
+    ("ogbia", "ogb"),
+    ("ogbogolo", "ogg"),
+    ("ogbronuagum", "ogu"),
+    ("ogea", "eri"),
+    ("oirata", "oia"),
+    ("oj", "oji"),
+    ("oji", "oji"),
+    ("ojibwa", "oji"),
+    ("ojitlán chinantec", "chj"),
+    ("okanagan", "oka"),
+    ("oki-no-erabu", "okn"),
+    ("okiek", "oki"),
+    ("oko-eni-osayen", "oks"),
+    ("oko-juwoi", "okj"),
+    ("okobo", "okb"),
+    ("okodia", "okd"),
+    ("okolod", "kqv"),
+    ("okpamheri", "opa"),
+    ("okpe (northwestern edo)", "okx"),
+    ("okpe (southwestern edo)", "oke"),
+    ("oksapmin", "opm"),
+    ("old aramaic (up to 700 bce)", "oar"),
+    ("old avar", "oav"),
+    ("old breton", "obt"),
+    ("old burmese", "obr"),
+    ("old cham", "ocm"),
+    ("old chinese", "och"),
+    ("old cornish", "oco"),
+    ("old dutch", "odt"),
+    ("old english (ca. 450-1100)", "ang"),
+    ("old french (842-ca. 1400)", "fro"),
+    ("old frisian", "ofs"),
+    ("old georgian", "oge"),
+    ("old high german (ca. 750-1050)", "goh"),
+    ("old hittite", "oht"),
+    ("old hungarian", "ohu"),
+    ("old irish (to 900)", "sga"),
+    ("old japanese", "ojp"),
+    ("old kentish sign language", "okl"),
+    ("old khmer", "okz"),
+    ("old korean (3rd-9th cent.)", "oko"),
+    ("old lithuanian", "olt"),
+    ("old malay", "omy"),
+    ("old manipuri", "omp"),
+    ("old marathi", "omr"),
+    ("old mon", "omx"),
+    ("old norse", "non"),
+    ("old nubian", "onw"),
+    ("old ossetic", "oos"),
+    ("old persian (ca. 600-400 b.c.)", "peo"),
+    ("old provençal (to 1500)", "pro"),
+    ("old russian", "orv"),
+    ("old saxon", "osx"),
+    ("old spanish", "osp"),
+    ("old sundanese", "osn"),
+    ("old tamil", "oty"),
+    ("old tibetan", "otb"),
+    ("old turkish", "otk"),
+    ("old uighur", "oui"),
+    ("old welsh", "owl"),
+    ("olekha", "ole"),
+    ("olkol", "olk"),
+    ("oloma", "olm"),
+    ("olrat", "olr"),
+    ("olu'bo", "lul"),
+    ("olulumo-ikom", "iko"),
+    ("oluta popoluca", "plo"),
+    ("om", "orm"),
+    ("omagua", "omg"),
+    ("omaha-ponca", "oma"),
+    ("omani arabic", "acx"),
+    ("ombamba", "mbm"),
+    ("ombo", "oml"),
+    ("ometepec nahuatl", "nht"),
+    ("omok", "omk"),
+    ("omotik", "omt"),
+    ("omurano", "omu"),
+    ("oneida", "one"),
+    ("onin", "oni"),
+    ("onin based pidgin", "onx"),
+    ("onjob", "onj"),
+    ("onobasulu", "onn"),
+    ("onondaga", "ono"),
+    ("ontenu", "ont"),
+    ("ontong java", "ojv"),
+    ("oorlams", "oor"),
+    ("opao", "opo"),
+    ("opata", "opt"),
+    ("or", "ori"),
+    ("orang kanaq", "orn"),
+    ("orang seletar", "ors"),
+    ("oraon sadri", "sdr"),
+    ("orejón", "ore"),
+    ("ori", "ori"),
+    ("oring", "org"),
+    ("oriya (macrolanguage)", "ori"),
+    ("orizaba nahuatl", "nlv"),
+    ("orm", "orm"),
+    ("orma", "orc"),
+    ("ormu", "orz"),
+    ("ormuri", "oru"),
+    ("oro win", "orw"),
+    ("oroch", "oac"),
+    ("oroha", "ora"),
+    ("orok", "oaa"),
+    ("orokaiva", "okv"),
+    ("oroko", "bdu"),
+    ("orokolo", "oro"),
+    ("oromo", "orm"),
+    ("oroqen", "orh"),
+    ("orowe", "bpk"),
+    ("oruma", "orr"),
+    ("orya", "ury"),
+    ("os", "oss"),
+    ("osa", "osa"),
+    ("osage", "osa"),
+    ("osatu", "ost"),
+    ("oscan", "osc"),
+    ("osing", "osi"),
+    ("ososo", "oso"),
+    ("oss", "oss"),
+    ("ossetian", "oss"),
+    ("ot danum", "otd"),
+    ("ota", "ota"),
+    ("otank", "uta"),
+    ("otoro", "otr"),
+    ("ottawa", "otw"),
+    ("ottoman turkish (1500-1928)", "ota"),
+    ("otuho", "lot"),
+    ("otuke", "otu"),
+    ("ouma", "oum"),
+    ("oune", "oue"),
+    ("ourdou", "urd"),
+    ("ouzbek", "uzb"),
+    ("owenia", "wsr"),
+    ("owiniga", "owi"),
+    ("oya'oya", "oyy"),
+    ("oyda", "oyd"),
+    ("oyster bay tasmanian", "xpd"),
+    ("ozolotepec zapotec", "zao"),
+    ("ozumacín chinantec", "chz"),
+    ("oʻzbek", "uzb"),
+    ("pa", "pan"),
+    ("pa di", "pdi"),
+    ("pa'a", "pqa"),
+    ("pa'o karen", "blk"),
+    ("pa-hng", "pha"),
+    ("paakantyi", "drl"),
+    ("paama", "pma"),
+    ("paasaal", "sig"),
+    ("pacahuara", "pcp"),
+    ("pacaraos quechua", "qvp"),
+    ("pachto", "pus"),
+    ("pacific gulf yupik", "ems"),
+    ("pacoh", "pac"),
+    ("padoe", "pdo"),
+    ("paekche", "pkc"),
+    ("paelignian", "pgn"),
+    ("pag", "pag"),
+    ("pagi", "pgi"),
+    ("pagibete", "pae"),
+    ("pagu", "pgu"),
+    ("pahanan agta", "apf"),
+    ("pahari-potwari", "phr"),
+    ("pahi", "lgt"),
+    ("pahlavani", "phv"),
+    ("pahlavi", "pal"),
+    ("pai tavytera", "pta"),
+    ("paicî", "pri"),
+    ("paipai", "ppi"),
+    ("paite chin", "pck"),
+    ("paiwan", "pwn"),
+    ("pak-tong", "pkg"),
+    ("pakanha", "pkn"),
+    ("pakaásnovos", "pav"),
+    ("pakistan sign language", "pks"),
+    ("paku", "pku"),
+    ("paku karen", "jkp"),
+    ("pal", "pal"),
+    ("palaic", "plq"),
+    ("palaka senoufo", "plr"),
+    ("palantla chinantec", "cpa"),
+    ("palauan", "pau"),
+    ("paleni", "pnl"),
+    ("palenquero", "pln"),
+    ("pali", "pli"),
+    ("palikúr", "plu"),
+    ("paliyan", "pcf"),
+    ("pallanganmiddang", "pmd"),
+    ("paloor", "fap"),
+    ("palu'e", "ple"),
+    ("paluan", "plz"),
+    ("palya bareli", "bpx"),
+    ("pam", "pam"),
+    ("pambia", "pmb"),
+    ("pamlico", "pmk"),
+    ("pamona", "pmf"),
+    ("pamosu", "hih"),
+    ("pampanga", "pam"),
+    ("pamplona atta", "att"),
+    ("pan", "pan"),
+    ("pana (burkina faso)", "pnq"),
+    ("pana (central african republic)", "pnz"),
+    ("panamanian sign language", "lsp"),
+    ("panamint", "par"),
+    ("panao huánuco quechua", "qxh"),
+    ("panará", "kre"),
+    ("panasuan", "psn"),
+    ("panawa", "pwb"),
+    ("pancana", "pnp"),
+    ("panchpargania", "tdb"),
+    ("pande", "bkj"),
+    ("pangasinan", "pag"),
+    ("pangseng", "pgs"),
+    ("pangu", "png"),
+    ("pangutaran sama", "slm"),
+    ("pangwa", "pbr"),
+    ("pangwali", "pgg"),
+    ("panim", "pnr"),
+    ("paniya", "pcg"),
+    ("panjabi", "pan"),
+    ("pankararé", "pax"),
+    ("pankararú", "paz"),
+    ("pankhu", "pkh"),
+    ("pannei", "pnc"),
+    ("pano", "mqz"),
+    ("panoan katukína", "knt"),
+    ("panobo", "pno"),
+    ("panyi bai", "bfc"),
+    ("pap", "pap"),
+    ("papantla totonac", "top"),
+    ("papapana", "ppn"),
+    ("papar", "dpp"),
+    ("papasena", "pas"),
+    ("papel", "pbo"),
+    ("papi", "ppe"),
+    ("papiamento", "pap"),
+    ("papora", "ppu"),
+    ("papua new guinean sign language", "pgz"),
+    ("papuan malay", "pmy"),
+    ("papuma", "ppm"),
+    ("para naga", "pzn"),
+    ("parachi", "prc"),
+    ("paraguayan guaraní", "gug"),
+    ("paraguayan sign language", "pys"),
+    ("parakanã", "pak"),
+    ("paranan", "prf"),
+    ("paranawát", "paf"),
+    ("paraujano", "pbg"),
+    ("parauk", "prk"),
+    ("parawen", "prw"),
+    ("pardhan", "pch"),
+    ("pardhi", "pcl"),
+    ("pare", "ppt"),
+    ("parecís", "pab"),
+    ("parenga", "pcj"),
+    ("parkari koli", "kvx"),
+    ("parkwa", "pbi"),
+    ("parsi", "prp"),
+    ("parsi-dari", "prd"),
+    ("parthian", "xpr"),
+    ("parya", "paq"),
+    ("pará arára", "aap"),
+    ("pará gavião", "gvp"),
+    ("pashto", "pus"),
+    ("pashtu", "pus"),
+    ("pasi", "psq"),
+    ("pass valley yali", "yac"),
+    ("pastún", "pus"),
+    ("patamona", "pbc"),
+    ("patani", "ptn"),
+    ("pataxó hã-ha-hãe", "pth"),
+    ("patep", "ptp"),
+    ("pathiya", "pty"),
+    ("patpatar", "gfk"),
+    ("pattani", "lae"),
+    ("pattani malay", "mfa"),
+    ("pattapu", "ptq"),
+    ("patwin", "pwi"),
+    ("pau", "pau"),
+    ("paulohi", "plh"),
+    ("paumarí", "pad"),
+    ("paunaka", "pnk"),
+    ("pauri bareli", "bfb"),
+    ("pauserna", "psm"),
+    ("pawaia", "pwa"),
+    ("pawnee", "paw"),
+    ("paynamar", "pmr"),
+    ("pear", "pcb"),
+    ("pech", "pay"),
+    ("pecheneg", "xpc"),
+    ("pedi", "nso"),
+    ("pekal", "pel"),
+    ("pela", "bxd"),
+    ("pele-ata", "ata"),
+    ("pelende", "ppp"),
+    ("pemon", "aoc"),
+    ("penang sign language", "psg"),
+    ("penchal", "pek"),
+    ("pendau", "ums"),
+    ("pengo", "peg"),
+    ("pennsylvania german", "pdc"),
+    ("penrhyn", "pnh"),
+    ("pentlatch", "ptw"),
+    ("peo", "peo"),
+    ("per", "fas"),
+    ("perai", "wet"),
+    ("peranakan indonesian", "pea"),
+    ("pere", "pfe"),
+    ("peripheral mongolian", "mvf"),
+    ("pero", "pip"),
+    ("persa", "fas"),
+    ("persan", "fas"),
+    ("persian", "fas"),
+    ("persian sign language", "psc"),
+    ("peruvian sign language", "prl"),
+    ("petapa zapotec", "zpe"),
+    ("petats", "pex"),
+    ("petjo", "pey"),
+    ("peñoles mixtec", "mil"),
+    ("pfaelzisch", "pfl"),
+    ("phai", "prt"),
+    ("phake", "phk"),
+    ("phala", "ypa"),
+    ("phalura", "phl"),
+    ("phana'", "phq"),
+    ("phangduwali", "phw"),
+    ("phende", "pem"),
+    ("philippin", "fil"),
+    ("philippine sign language", "psp"),
+    ("phimbi", "phm"),
+    ("phn", "phn"),
+    ("phoenician", "phn"),
+    ("phola", "ypg"),
+    ("pholo", "yip"),
+    ("phom naga", "nph"),
+    ("phong-kniang", "pnx"),
+    ("phrae pwo karen", "kjt"),
+    ("phrygian", "xpg"),
+    ("phu thai", "pht"),
+    ("phuan", "phu"),
+    ("phudagi", "phd"),
+    ("phuie", "pug"),
+    ("phukha", "phh"),
+    ("phuma", "ypm"),
+    ("phunoi", "pho"),
+    ("phuong", "phg"),
+    ("phupa", "ypp"),
+    ("phupha", "yph"),
+    ("phuza", "ypz"),
+    ("pi", "pli"),
+    ("piamatsina", "ptr"),
+    ("piame", "pin"),
+    ("piapoco", "pio"),
+    ("piaroa", "pid"),
+    ("picard", "pcd"),
+    ("pichis ashéninka", "cpu"),
+    ("pictish", "xpi"),
+    ("pidgin delaware", "dep"),
+    ("piemontese", "pms"),
+    ("pijao", "pij"),
+    ("pije", "piz"),
+    ("pijin", "pis"),
+    ("pilagá", "plg"),
+    ("pileni", "piv"),
+    ("pilipino", "fil"),
+    ("pima bajo", "pia"),
+    ("pimbwe", "piw"),
+    ("pinai-hagahai", "pnn"),
+    ("pindiini", "pti"),
+    ("pingelapese", "pif"),
+    ("pini", "pii"),
+    ("pinigura", "pnv"),
+    ("pinjarup", "pnj"),
+    ("pinji", "pic"),
+    ("pinotepa nacional mixtec", "mio"),
+    ("pintupi-luritja", "piu"),
+    ("pinyin", "pny"),
+    ("pipil", "ppl"),
+    ("pirahã", "myp"),
+    ("piratapuyo", "pir"),
+    ("pirlatapa", "bxi"),
+    ("piro", "pie"),
+    ("pirriya", "xpa"),
+    ("pisabo", "pig"),
+    ("pisaflores tepehua", "tpp"),
+    ("piscataway", "psy"),
+    ("pisidian", "xps"),
+    ("pitcairn-norfolk", "pih"),
+    ("pite sami", "sje"),
+    ("piti", "pcn"),
+    ("pitjantjatjara", "pjt"),
+    ("pitta pitta", "pit"),
+    ("piya-kwonci", "piy"),
+    ("pl", "pol"),
+    ("plains cree", "crk"),
+    ("plains indian sign language", "psd"),
+    ("plains miwok", "pmw"),
+    ("plapo krumen", "ktj"),
+    ("plateau malagasy", "plt"),
+    ("plautdietsch", "pdt"),
+    ("playero", "gob"),
+    ("pli", "pli"),
+    ("pnar", "pbv"),
+    ("pochuri naga", "npo"),
+    ("pochutec", "xpo"),
+    ("podena", "pdn"),
+    ("pogolo", "poy"),
+    ("pohnpeian", "pon"),
+    ("pokangá", "pok"),
+    ("poke", "pof"),
+    ("pokomo", "pkb"),
+    ("pol", "pol"),
+    ("polabian", "pox"),
+    ("polaco", "pol"),
+    ("polari", "pld"),
+    ("polci", "plj"),
+    ("polish", "pol"),
+    ("polish sign language", "pso"),
+    ("polonais", "pol"),
+    ("polonombauk", "plb"),
+    ("polski", "pol"),
+    ("pomo", "pmm"),
+    ("pon", "pon"),
+    ("ponam", "ncc"),
+    ("ponosakan", "pns"),
+    ("pontic", "pnt"),
+    ("ponyo-gongwang naga", "npg"),
+    ("popti'", "jac"),
+    ("poqomam", "poc"),
+    ("poqomchi'", "poh"),
+    ("por", "por"),
+    ("porohanon", "prh"),
+    ("port sandwich", "psw"),
+    ("port sorell tasmanian", "xpl"),
+    ("port vato", "ptv"),
+    ("portugais", "por"),
+    ("portuguese", "por"),
+    ("portuguese sign language", "psr"),
+    ("portugués", "por"),
+    ("português", "por"),
+    ("potawatomi", "pot"),
+    ("potiguára", "pog"),
+    ("pottangi ollar gadaba", "gdb"),
+    ("poumei naga", "pmx"),
+    ("pouye", "bye"),
+    ("powari", "pwr"),
+    ("powhatan", "pim"),
+    ("poyanáwa", "pyn"),
+    ("prasuni", "prn"),
+    ("primitive irish", "pgl"),
+    ("principense", "pre"),
+    ("pro", "pro"),
+    ("providencia sign language", "prz"),
+    ("prussian", "prg"),
+    ("ps", "pus"),
+    ("psikye", "kvj"),
+    ("pt", "por"),
+    ("pu-xian chinese", "cpx"),
+    ("puare", "pux"),
+    ("pudtol atta", "atp"),
+    ("puebla mazatec", "pbm"),
+    ("puelche", "pue"),
+    ("puerto rican sign language", "psl"),
+    ("puimei naga", "npu"),
+    ("puinave", "pui"),
+    ("pukapuka", "pkp"),
+    ("pulaar", "fuc"),
+    ("pulabu", "pup"),
+    ("pular", "fuf"),
+    ("puluwatese", "puw"),
+    ("puma", "pum"),
+    ("pumpokol", "xpm"),
+    ("pumé", "yae"),
+    ("punan aput", "pud"),
+    ("punan bah-biau", "pna"),
+    ("punan batu 1", "pnm"),
+    ("punan merah", "puf"),
+    ("punan merap", "puc"),
+    ("punan tubu", "puj"),
+    ("punic", "xpu"),
+    ("punjabi", "pan"),
+    ("puno quechua", "qxp"),
+    ("punthamara", "xpt"),
+    ("punu", "puu"),
+    ("puoc", "puo"),
+    ("puquina", "puq"),
+    ("puragi", "pru"),
+    ("purari", "iar"),
+    ("purepecha", "tsz"),
+    ("puri", "prr"),
+    ("purik", "prx"),
+    ("purisimeño", "puy"),
+    ("puroik", "suv"),
+    ("puruborá", "pur"),
+    ("purum", "pub"),
+    ("pus", "pus"),
+    ("pushto", "pus"),
+    ("pushtu", "pus"),
+    ("putai", "mfl"),
+    ("putoh", "put"),
+    ("putukwam", "afe"),
+    ("puyo", "xpy"),
+    ("puyo-paekche", "xpp"),
+    ("puyuma", "pyu"),
+    ("pwaamei", "pme"),
+    ("pwapwâ", "pop"),
+    ("pwo eastern karen", "kjp"),
+    ("pwo northern karen", "pww"),
+    ("pwo western karen", "pwo"),
+    ("pyapun", "pcw"),
+    ("pye krumen", "pye"),
+    ("pyen", "pyy"),
+    ("pyu (myanmar)", "pyx"),
+    ("pyu (papua new guinea)", "pby"),
+    ("páez", "pbb"),
+    ("pááfang", "pfa"),
+    ("päri", "lkr"),
+    ("pémono", "pev"),
+    ("pévé", "lme"),
+    ("pökoot", "pko"),
+    ("q'anjob'al", "kjb"),
+    ("qabiao", "laq"),
+    ("qaqet", "byx"),
+    ("qashqa'i", "qxq"),
+    ("qatabanian", "xqt"),
+    ("qawasqar", "alc"),
+    ("qazaq", "kaz"),
+    ("qila muji", "ymq"),
+    ("qimant", "ahg"),
+    ("qiubei zhuang", "zqe"),
+    ("qu", "que"),
+    ("quapaw", "qua"),
+    ("que", "que"),
+    ("quebec sign language", "fcs"),
+    ("quechan", "yum"),
+    ("quechua", "que"),
+    ("quenya", "qya"),
+    ("querétaro otomi", "otq"),
+    ("quetzaltepec mixe", "pxm"),
+    ("queyu", "qvy"),
+    ("quiavicuzas zapotec", "zpj"),
+    ("quileute", "qui"),
+    ("quinault", "qun"),
+    ("quinqui", "quq"),
+    ("quioquitani-quierí zapotec", "ztq"),
+    ("quiotepec chinantec", "chq"),
+    ("quiripi", "qyp"),
+    ("rabha", "rah"),
+    ("rade", "rad"),
+    ("raetic", "xrr"),
+    ("rahambuu", "raz"),
+    ("raj", "raj"),
+    ("rajah kabunsuwan manobo", "mqk"),
+    ("rajasthani", "raj"),
+    ("rajbanshi", "rjs"),
+    ("raji", "rji"),
+    ("rajong", "rjg"),
+    ("rajput garasia", "gra"),
+    ("rakahanga-manihiki", "rkh"),
+    ("rakhine", "rki"),
+    ("ralte", "ral"),
+    ("rama", "rma"),
+    ("ramoaaina", "rai"),
+    ("ramopa", "kjx"),
+    ("rampi", "lje"),
+    ("rana tharu", "thr"),
+    ("rang", "rax"),
+    ("rangkas", "rgk"),
+    ("ranglong", "rnl"),
+    ("rangpuri", "rkt"),
+    ("rap", "rap"),
+    ("rapa", "ray"),
+    ("rapanui", "rap"),
+    ("rapoisi", "kyx"),
+    ("rapting", "rpt"),
+    ("rar", "rar"),
+    ("rara bakati'", "lra"),
+    ("rarotongan", "rar"),
+    ("rasawa", "rac"),
+    ("ratagnon", "btn"),
+    ("ratahan", "rth"),
+    ("rathawi", "rtw"),
+    ("rathwi bareli", "bgd"),
+    ("raute", "rau"),
+    ("ravula", "yea"),
+    ("rawa", "rwo"),
+    ("rawang", "raw"),
+    ("rawat", "jnl"),
+    ("rawngtu chin", "weu"),
+    ("rawo", "rwa"),
+    ("rayón zoque", "zor"),
+    ("razajerdi", "rat"),
+    ("red gelao", "gir"),
+    ("reel", "atu"),
+    ("rejang", "rej"),
+    ("rejang kayan", "ree"),
+    ("reli", "rei"),
+    ("rema", "bow"),
+    ("rembarrnga", "rmb"),
+    ("rembong", "reb"),
+    ("remo", "rem"),
+    ("remontado dumagat", "agv"),
+    ("rempi", "rmp"),
+    ("remun", "lkj"),
+    ("rendille", "rel"),
+    ("rengao", "ren"),
+    ("rennell-bellona", "mnv"),
+    ("repanbitip", "rpn"),
+    ("rer bare", "rer"),
+    ("rerau", "rea"),
+    ("rerep", "pgk"),
+    ("reshe", "res"),
+    ("resígaro", "rgr"),
+    ("retta", "ret"),
+    ("reyesano", "rey"),
+    ("riang (india)", "ria"),
+    ("riang lai", "yin"),
+    ("riang lang", "ril"),
+    ("riantana", "ran"),
+    ("ribun", "rir"),
+    ("rigwe", "iri"),
+    ("rikbaktsa", "rkb"),
+    ("rinconada bikol", "bto"),
+    ("rincón zapotec", "zar"),
+    ("ringgou", "rgu"),
+    ("ririo", "rri"),
+    ("ritharrngu", "rit"),
+    ("riung", "riu"),
+    ("riverain sango", "snj"),
+    ("rm", "roh"),
+    ("rmeet", "lbn"),
+    ("rn", "run"),
+    ("ro", "ron"),
+    ("rogo", "rod"),
+    ("roh", "roh"),
+    ("rohingya", "rhg"),
+    ("rom", "ron"),
+    ("roma", "rmm"),
+    ("romagnol", "rgn"),
+    ("romam", "rmx"),
+    ("romanian", "ron"),
+    ("romanian sign language", "rms"),
+    ("romanian; moldavian; moldovan", "ron"),
+    ("romano-greek", "rge"),
+    ("romano-serbian", "rsb"),
+    ("romanova", "rmv"),
+    ("romansh", "roh"),
+    ("romany", "rom"),
+    ("romblomanon", "rol"),
+    ("rombo", "rof"),
+    ("romkun", "rmk"),
+    ("română", "ron"),
+    ("ron", "ron"),
+    ("ronga", "rng"),
+    ("rongga", "ror"),
+    ("rongmei naga", "nbu"),
+    ("rongpo", "rnp"),
+    ("ronji", "roe"),
+    ("roon", "rnn"),
+    ("roria", "rga"),
+    ("rotokas", "roo"),
+    ("rotuman", "rtm"),
+    ("roumain", "ron"),
+    ("roviana", "rug"),
+    ("ru", "rus"),
+    ("ruching palaung", "pce"),
+    ("rudbari", "rdb"),
+    ("rufiji", "rui"),
+    ("ruga", "ruh"),
+    ("rukai", "dru"),
+    ("rum", "ron"),
+    ("ruma", "ruz"),
+    ("rumai palaung", "rbb"),
+    ("rumano", "ron"),
+    ("rumu", "klq"),
+    ("run", "run"),
+    ("rundi", "run"),
+    ("runga", "rou"),
+    ("rungtu chin", "rtc"),
+    ("rungus", "drg"),
+    ("rungwa", "rnw"),
+    ("rup", "rup"),
+    ("rus", "rus"),
+    ("ruso", "rus"),
+    ("russe", "rus"),
+    ("russia buriat", "bxr"),
+    ("russian", "rus"),
+    ("russian sign language", "rsl"),
+    ("rusyn", "rue"),
+    ("rutul", "rut"),
+    ("ruuli", "ruc"),
+    ("ruund", "rnd"),
+    ("ruwila", "rwl"),
+    ("rw", "kin"),
+    ("réunion creole french", "rcf"),
+    ("rāziḥī", "rzh"),
+    ("s'gaw karen", "ksw"),
+    ("sa", "san"),
+    ("sa'a", "apb"),
+    ("sa'ban", "snv"),
+    ("sa'och", "scq"),
+    ("saafi-saafi", "sav"),
+    ("saam", "raq"),
+    ("saamia", "lsm"),
+    ("saaroa", "sxr"),
+    ("saba", "saa"),
+    ("sabaean", "xsa"),
+    ("sabah bisaya", "bsy"),
+    ("sabah malay", "msi"),
+    ("sabanê", "sae"),
+    ("sabaot", "spy"),
+    ("sabine", "sbv"),
+    ("sabu", "hvn"),
+    ("sabüm", "sbo"),
+    ("sacapulteco", "quv"),
+    ("sad", "sad"),
+    ("sadri", "sck"),
+    ("saek", "skb"),
+    ("saep", "spd"),
+    ("safaliba", "saf"),
+    ("safeyoka", "apz"),
+    ("safwa", "sbk"),
+    ("sag", "sag"),
+    ("sagala", "sbm"),
+    ("sagalla", "tga"),
+    ("sah", "sah"),
+    ("saho", "ssy"),
+    ("sahu", "saj"),
+    ("saidi arabic", "aec"),
+    ("saint lucian creole french", "acf"),
+    ("saisiyat", "xsy"),
+    ("sajalong", "sjl"),
+    ("sajau basap", "sjb"),
+    ("sakachep", "sch"),
+    ("sakalava malagasy", "skg"),
+    ("sakao", "sku"),
+    ("sakata", "skt"),
+    ("sake", "sak"),
+    ("sakirabiá", "skf"),
+    ("sakizaya", "szy"),
+    ("sala", "shq"),
+    ("salampasu", "slx"),
+    ("salar", "slr"),
+    ("salas", "sgu"),
+    ("salasaca highland quichua", "qxl"),
+    ("salchuq", "slq"),
+    ("saleman", "sau"),
+    ("saliba", "sbe"),
+    ("salinan", "sln"),
+    ("sallands", "sdz"),
+    ("salt-yui", "sll"),
+    ("saluan", "loe"),
+    ("salumá", "slj"),
+    ("salvadoran sign language", "esn"),
+    ("sam", "sam"),
+    ("sama", "smd"),
+    ("samaritan", "smp"),
+    ("samaritan aramaic", "sam"),
+    ("samarokena", "tmj"),
+    ("samatao", "ysd"),
+    ("samay", "syx"),
+    ("samba", "smx"),
+    ("samba daka", "ccg"),
+    ("samba leko", "ndi"),
+    ("sambal", "xsb"),
+    ("sambalpuri", "spv"),
+    ("sambe", "xab"),
+    ("samberigi", "ssx"),
+    ("samburu", "saq"),
+    ("samei", "smh"),
+    ("samo", "smq"),
+    ("samoan", "smo"),
+    ("samogitian", "sgs"),
+    ("samosa", "swm"),
+    ("sampang", "rav"),
+    ("samre", "sxm"),
+    ("samtao", "stu"),
+    ("samvedi", "smv"),
+    ("san", "san"),
+    ("san agustín mixtepec zapotec", "ztm"),
+    ("san baltazar loxicha zapotec", "zpx"),
+    ("san blas kuna", "cuk"),
+    ("san dionisio del mar huave", "hve"),
+    ("san felipe otlaltepec popoloca", "pow"),
+    ("san francisco del mar huave", "hue"),
+    ("san francisco matlatzinca", "mat"),
+    ("san jerónimo tecóatl mazatec", "maa"),
+    ("san juan atzingo popoloca", "poe"),
+    ("san juan colorado mixtec", "mjc"),
+    ("san juan teita mixtec", "xtj"),
+    ("san luís temalacayuca popoloca", "pps"),
+    ("san marcos tlacoyalco popoloca", "pls"),
+    ("san martín itunyoso triqui", "trq"),
+    ("san martín quechua", "qvs"),
+    ("san mateo del mar huave", "huv"),
+    ("san miguel creole french", "scf"),
+    ("san miguel el grande mixtec", "mig"),
+    ("san miguel piedras mixtec", "xtp"),
+    ("san pedro amuzgos amuzgo", "azg"),
+    ("san pedro quiatoni zapotec", "zpf"),
+    ("san salvador kongo", "kwy"),
+    ("san vicente coatlán zapotec", "zpt"),
+    ("sanaani arabic", "ayn"),
+    ("sanapaná", "spn"),
+    ("sandawe", "sad"),
+    ("sanga (democratic republic of congo)", "sng"),
+    ("sanga (nigeria)", "xsn"),
+    ("sanggau", "scg"),
+    ("sangil", "snl"),
+    ("sangir", "sxn"),
+    ("sangisari", "sgr"),
+    ("sangkong", "sgk"),
+    ("sanglechi", "sgy"),
+    ("sango", "sag"),
+    ("sangtam naga", "nsa"),
+    ("sangu (gabon)", "snq"),
+    ("sangu (tanzania)", "sbp"),
+    ("sani", "ysn"),
+    ("sanie", "ysy"),
+    ("saniyo-hiyewe", "sny"),
+    ("sankaran maninka", "msc"),
+    ("sansi", "ssi"),
+    ("sanskrit", "san"),
+    ("santa ana de tusi pasco quechua", "qxt"),
+    ("santa catarina albarradas zapotec", "ztn"),
+    ("santa inés ahuatempan popoloca", "pca"),
+    ("santa inés yatzechi zapotec", "zpn"),
+    ("santa lucía monteverde mixtec", "mdv"),
+    ("santa maría del mar huave", "hvv"),
+    ("santa maría la alta nahuatl", "nhz"),
+    ("santa maría quiegolani zapotec", "zpi"),
+    ("santa maría zacatepec mixtec", "mza"),
+    ("santa teresa cora", "cok"),
+    ("santali", "sat"),
+    ("santiago del estero quichua", "qus"),
+    ("santiago xanica zapotec", "zpr"),
+    ("santo domingo albarradas zapotec", "zas"),
+    ("sanumá", "xsu"),
+    ("saparua", "spr"),
+    ("sapo", "krn"),
+    ("saponi", "spi"),
+    ("saposa", "sps"),
+    ("sapuan", "spu"),
+    ("sapé", "spc"),
+    ("sara", "sre"),
+    ("sara kaba", "sbz"),
+    ("sara kaba deme", "kwg"),
+    ("sara kaba náà", "kwv"),
+    ("saraiki", "skr"),
+    ("saramaccan", "srm"),
+    ("sarangani blaan", "bps"),
+    ("sarangani manobo", "mbs"),
+    ("sarasira", "zsa"),
+    ("saraveca", "sar"),
+    ("sardinian", "srd"),
+    ("sari", "asj"),
+    ("sarikoli", "srh"),
+    ("sarli", "sdf"),
+    ("sarsi", "srs"),
+    ("sartang", "onp"),
+    ("sarua", "swy"),
+    ("sarudu", "sdu"),
+    ("saruga", "sra"),
+    ("sas", "sas"),
+    ("sasak", "sas"),
+    ("sasaru", "sxs"),
+    ("sassarese sardinian", "sdc"),
+    ("sat", "sat"),
+    ("satawalese", "stw"),
+    ("saterfriesisch", "stq"),
+    ("sateré-mawé", "mav"),
+    ("saudi arabian sign language", "sdl"),
+    ("sauraseni prākrit", "psu"),
+    ("saurashtra", "saz"),
+    ("sauri", "srt"),
+    ("sauria paharia", "mjt"),
+    ("sause", "sao"),
+    ("sausi", "ssj"),
+    ("savi", "sdg"),
+    ("savosavo", "svs"),
+    ("sawai", "szw"),
+    ("saweru", "swr"),
+    ("sawi", "saw"),
+    ("sawila", "swt"),
+    ("sawknah", "swn"),
+    ("saxwe gbe", "sxw"),
+    ("saya", "say"),
+    ("sayula popoluca", "pos"),
+    ("sc", "srd"),
+    ("scc", "srp"),
+    ("scn", "scn"),
+    ("sco", "sco"),
+    ("scots", "sco"),
+    ("scottish gaelic", "gla"),
+    ("scr", "hrv"),
+    ("scythian", "xsc"),
+    ("sd", "snd"),
+    ("se", "sme"),
+    ("sea island creole english", "gul"),
+    ("seba", "kdg"),
+    ("sebat bet gurage", "sgw"),
+    ("seberuang", "sbx"),
+    ("sebop", "sib"),
+    ("sebuyau", "snb"),
+    ("sechelt", "sec"),
+    ("secoya", "sey"),
+    ("sedang", "sed"),
+    ("sedoa", "tvw"),
+    ("seeku", "sos"),
+    ("segai", "sge"),
+    ("segeju", "seg"),
+    ("seget", "sbg"),
+    ("sehwi", "sfw"),
+    ("seimat", "ssg"),
+    ("seit-kaitetu", "hik"),
+    ("sekani", "sek"),
+    ("sekapan", "skp"),
+    ("sekar", "skz"),
+    ("seke (nepal)", "skj"),
+    ("seke (vanuatu)", "ske"),
+    ("sekele", "vaj"),
+    ("seki", "syi"),
+    ("seko padang", "skx"),
+    ("seko tengah", "sko"),
+    ("sekpele", "lip"),
+    ("sel", "sel"),
+    ("selangor sign language", "kgi"),
+    ("selaru", "slu"),
+    ("selayar", "sly"),
+    ("selee", "snw"),
+    ("selepet", "spl"),
+    ("selian", "sxl"),
+    ("selkup", "sel"),
+    ("selungai murut", "slg"),
+    ("seluwasan", "sws"),
+    ("semai", "sea"),
+    ("semandang", "sdq"),
+    ("semaq beri", "szc"),
+    ("sembakung murut", "sbr"),
+    ("semelai", "sza"),
+    ("semimi", "etz"),
+    ("semnam", "ssm"),
+    ("semnani", "smy"),
+    ("sempan", "xse"),
+    ("sena", "seh"),
+    ("senara sénoufo", "seq"),
+    ("senaya", "syn"),
+    ("sene", "sej"),
+    ("seneca", "see"),
+    ("sened", "sds"),
+    ("sengele", "szg"),
+    ("senggi", "snu"),
+    ("sengo", "spk"),
+    ("sengseng", "ssz"),
+    ("senhaja de srair", "sjs"),
+    ("sensi", "sni"),
+    ("sentani", "set"),
+    ("senthang chin", "sez"),
+    ("sentinel", "std"),
+    ("sepa (indonesia)", "spb"),
+    ("sepa (papua new guinea)", "spe"),
+    ("sepik iwam", "iws"),
+    ("sera", "sry"),
+    ("serbe", "srp"),
+    ("serbian", "srp"),
+    ("serbio", "srp"),
+    ("serbo-croatian", "hbs"),
+    ("sere", "swf"),
+    ("serer", "srr"),
+    ("seri", "sei"),
+    ("serili", "sve"),
+    ("seroa", "kqu"),
+    ("serrano", "ser"),
+    ("seru", "szd"),
+    ("serua", "srw"),
+    ("serudung murut", "srk"),
+    ("serui-laut", "seu"),
+    ("seselwa creole french", "crs"),
+    ("seta", "stf"),
+    ("setaman", "stm"),
+    ("seti", "sbi"),
+    ("settla", "sta"),
+    ("severn ojibwa", "ojs"),
+    ("sewa bay", "sew"),
+    ("seze", "sze"),
+    ("sg", "sag"),
+    ("sga", "sga"),
+    ("sh", "hbs"),
+    ("shabak", "sdb"),
+    ("shahmirzadi", "srz"),
+    ("shahrudi", "shm"),
+    ("shall-zwall", "sha"),
+    ("shama-sambuga", "sqa"),
+    ("shamang", "xsh"),
+    ("shambala", "ksb"),
+    ("shan", "shn"),
+    ("shanenawa", "swo"),
+    ("shanga", "sho"),
+    ("sharanahua", "mcd"),
+    ("shark bay", "ssv"),
+    ("sharwa", "swq"),
+    ("shasta", "sht"),
+    ("shatt", "shj"),
+    ("shau", "sqh"),
+    ("shawnee", "sjw"),
+    ("shehri", "shv"),
+    ("shekhawati", "swv"),
+    ("shekkacho", "moy"),
+    ("sheko", "she"),
+    ("shelta", "sth"),
+    ("shempire senoufo", "seb"),
+    ("shendu", "shl"),
+    ("sheni", "scv"),
+    ("sherbro", "bun"),
+    ("sherdukpen", "sdp"),
+    ("sherpa", "xsr"),
+    ("sheshi kham", "kip"),
+    ("shihhi arabic", "ssh"),
+    ("shiki", "gua"),
+    ("shilluk", "shk"),
+    ("shina", "scl"),
+    ("shipibo-conibo", "shp"),
+    ("shn", "shn"),
+    ("sholaga", "sle"),
+    ("shom peng", "sii"),
+    ("shona", "sna"),
+    ("shoo-minda-nye", "bcv"),
+    ("shor", "cjs"),
+    ("shoshoni", "shh"),
+    ("shqip", "sqi"),
+    ("shua", "shg"),
+    ("shuadit", "sdt"),
+    ("shuar", "jiv"),
+    ("shubi", "suj"),
+    ("shughni", "sgh"),
+    ("shuhi", "sxg"),
+    ("shumashti", "sts"),
+    ("shumcho", "scu"),
+    ("shuswap", "shs"),
+    ("shuwa-zamani", "ksa"),
+    ("shwai", "shw"),
+    ("shwe palaung", "pll"),
+    ("si", "sin"),
+    ("sialum", "slw"),
+    ("siamou", "sif"),
+    ("sian", "spg"),
+    ("siane", "snp"),
+    ("siang", "sya"),
+    ("siar-lak", "sjr"),
+    ("siawi", "mmp"),
+    ("sibe", "nco"),
+    ("siberian tatar", "sty"),
+    ("sibu melanau", "sdx"),
+    ("sicanian", "sxc"),
+    ("sicel", "scx"),
+    ("sichuan yi", "iii"),
+    ("sicilian", "scn"),
+    ("siculo arabic", "sqr"),
+    ("sid", "sid"),
+    ("sidamo", "sid"),
+    ("sidetic", "xsd"),
+    ("sierra de juárez zapotec", "zaa"),
+    ("sierra leone sign language", "sgx"),
+    ("sierra negra nahuatl", "nsu"),
+    ("sighu", "sxe"),
+    ("sihan", "snr"),
+    ("sihuas ancash quechua", "qws"),
+    ("sika", "ski"),
+    ("sikaiana", "sky"),
+    ("sikaritai", "tty"),
+    ("sikiana", "sik"),
+    ("sikkimese", "sip"),
+    ("siksika", "bla"),
+    ("sikule", "skh"),
+    ("sila", "slt"),
+    ("silacayoapan mixtec", "mks"),
+    ("sileibi", "sbq"),
+    ("silesian", "szl"),
+    ("silimo", "wul"),
+    ("siliput", "mkc"),
+    ("silopi", "xsp"),
+    ("silt'e", "stv"),
+    ("simaa", "sie"),
+    ("simba", "sbw"),
+    ("simbali", "smg"),
+    ("simbari", "smb"),
+    ("simbo", "sbb"),
+    ("simeku", "smz"),
+    ("simeulue", "smr"),
+    ("simte", "smt"),
+    ("sin", "sin"),
+    ("sinagen", "siu"),
+    ("sinasina", "sst"),
+    ("sinaugoro", "snc"),
+    ("sindarin", "sjn"),
+    ("sindhi", "snd"),
+    ("sindhi bhil", "sbn"),
+    ("sindihui mixtec", "xts"),
+    ("singa", "sgm"),
+    ("singapore sign language", "sls"),
+    ("singhalais", "sin"),
+    ("singpho", "sgp"),
+    ("sinhala", "sin"),
+    ("sinicahua mixtec", "xti"),
+    ("sininkere", "skq"),
+    ("sinte romani", "rmo"),
+    ("sinyar", "sys"),
+    ("siona", "snn"),
+    ("sipacapense", "qum"),
+    ("sira", "swj"),
+    ("siraya", "fos"),
+    ("sirenik yupik", "ysr"),
+    ("siri", "sir"),
+    ("siriano", "sri"),
+    ("sirionó", "srq"),
+    ("sirmauri", "srx"),
+    ("siroi", "ssd"),
+    ("sissala", "sld"),
+    ("sissano", "sso"),
+    ("siuslaw", "sis"),
+    ("sivandi", "siy"),
+    ("sivia sign language", "lsv"),
+    ("siwai", "siw"),
+    ("siwi", "siz"),
+    ("siwu", "akp"),
+    ("siyin chin", "csy"),
+    ("sk", "slk"),
+    ("skagit", "ska"),
+    ("skalvian", "svx"),
+    ("skepi creole dutch", "skw"),
+    ("skolt sami", "sms"),
+    ("skou", "skv"),
+    ("sl", "slv"),
+    ("slave (athapascan)", "den"),
+    ("slavomolisano", "svm"),
+    ("slk", "slk"),
+    ("slo", "slk"),
+    ("slovak", "slk"),
+    ("slovakian sign language", "svk"),
+    ("slovaque", "slk"),
+    ("slovene", "slv"),
+    ("slovenian", "slv"),
+    ("slovenčina", "slk"),
+    ("slovenščina", "slv"),
+    ("slovène", "slv"),
+    ("slv", "slv"),
+    ("sm", "smo"),
+    ("sma", "sma"),
+    ("small flowery miao", "sfm"),
+    ("sme", "sme"),
+    ("smj", "smj"),
+    ("smn", "smn"),
+    ("smo", "smo"),
+    ("sms", "sms"),
+    ("smärky kanum", "kxq"),
+    ("sn", "sna"),
+    ("sna", "sna"),
+    ("snd", "snd"),
+    ("snk", "snk"),
+    ("snohomish", "sno"),
+    ("so", "som"),
+    ("so (democratic republic of congo)", "soc"),
+    ("so'a", "ssq"),
+    ("sobei", "sob"),
+    ("sochiapam chinantec", "cso"),
+    ("sog", "sog"),
+    ("soga", "xog"),
+    ("sogdian", "sog"),
+    ("sokoro", "sok"),
+    ("solano", "xso"),
+    ("soli", "sby"),
+    ("solomon islands sign language", "szs"),
+    ("solong", "aaw"),
+    ("solos", "sol"),
+    ("som", "som"),
+    ("somali", "som"),
+    ("somba-siawari", "bmu"),
+    ("somrai", "sor"),
+    ("somray", "smu"),
+    ("somyev", "kgt"),
+    ("sonaga", "ysg"),
+    ("sonde", "shc"),
+    ("songe", "sop"),
+    ("songlai chin", "csj"),
+    ("songo", "soo"),
+    ("songomeno", "soe"),
+    ("songoora", "sod"),
+    ("sonha", "soi"),
+    ("sonia", "siq"),
+    ("soninke", "snk"),
+    ("sonsorol", "sov"),
+    ("soqotri", "sqt"),
+    ("sora", "srb"),
+    ("sori-harengan", "sbh"),
+    ("sorkhei", "sqo"),
+    ("sorothaptic", "sxo"),
+    ("sorsogon ayta", "ays"),
+    ("sos kundi", "sdk"),
+    ("sot", "sot"),
+    ("sota kanum", "krz"),
+    ("sou nama", "tlt"),
+    ("sou upaa", "wha"),
+    ("south african sign language", "sfs"),
+    ("south awyu", "aws"),
+    ("south azerbaijani", "azb"),
+    ("south bolivian quechua", "quh"),
+    ("south central banda", "lnl"),
+    ("south central dinka", "dib"),
+    ("south efate", "erk"),
+    ("south fali", "fal"),
+    ("south giziga", "giz"),
+    ("south lembata", "lmf"),
+    ("south levantine arabic", "ajp"),
+    ("south marquesan", "mqm"),
+    ("south muyu", "kts"),
+    ("south ndebele", "nbl"),
+    ("south nuaulu", "nxl"),
+    ("south picene", "spx"),
+    ("south slavey", "xsl"),
+    ("south tairora", "omw"),
+    ("south ucayali ashéninka", "cpy"),
+    ("south watut", "mcy"),
+    ("south west bay", "sns"),
+    ("southeast ambrym", "tvk"),
+    ("southeast babar", "vbb"),
+    ("southeast ijo", "ijs"),
+    ("southeast pashai", "psi"),
+    ("southeast tasmanian", "xpf"),
+    ("southeastern dinka", "dks"),
+    ("southeastern ixtlán zapotec", "zpd"),
+    ("southeastern kolami", "nit"),
+    ("southeastern nochixtlán mixtec", "mxy"),
+    ("southeastern pomo", "pom"),
+    ("southeastern puebla nahuatl", "npl"),
+    ("southeastern tarahumara", "tcu"),
+    ("southeastern tepehuan", "stp"),
+    ("southern alta", "agy"),
+    ("southern altai", "alt"),
+    ("southern amami-oshima", "ams"),
+    ("southern aymara", "ayc"),
+    ("southern bai", "bfs"),
+    ("southern balochi", "bcc"),
+    ("southern betsimisaraka malagasy", "bzc"),
+    ("southern binukidnon", "mtw"),
+    ("southern birifor", "biv"),
+    ("southern bobo madaré", "bwq"),
+    ("southern bontok", "obk"),
+    ("southern carrier", "caf"),
+    ("southern catanduanes bikol", "bln"),
+    ("southern conchucos ancash quechua", "qxo"),
+    ("southern dagaare", "dga"),
+    ("southern dong", "kmc"),
+    ("southern east cree", "crj"),
+    ("southern ghale", "ghe"),
+    ("southern grebo", "grj"),
+    ("southern guiyang hmong", "hmy"),
+    ("southern haida", "hax"),
+    ("southern hindko", "hnd"),
+    ("southern kalapuya", "sxk"),
+    ("southern kalinga", "ksc"),
+    ("southern katang", "sct"),
+    ("southern kisi", "kss"),
+    ("southern kiwai", "kjd"),
+    ("southern kurdish", "sdh"),
+    ("southern lolopo", "ysp"),
+    ("southern luri", "luz"),
+    ("southern ma'di", "snm"),
+    ("southern mashan hmong", "hma"),
+    ("southern mnong", "mnn"),
+    ("southern muji", "ymc"),
+    ("southern nago", "nqg"),
+    ("southern nambikuára", "nab"),
+    ("southern ngbandi", "nbw"),
+    ("southern nicobarese", "nik"),
+    ("southern nisu", "nsd"),
+    ("southern nuni", "nnw"),
+    ("southern ohlone", "css"),
+    ("southern one", "osu"),
+    ("southern pame", "pmz"),
+    ("southern pashto", "pbt"),
+    ("southern pastaza quechua", "qup"),
+    ("southern ping chinese", "csp"),
+    ("southern pomo", "peq"),
+    ("southern puebla mixtec", "mit"),
+    ("southern puget sound salish", "slh"),
+    ("southern pumi", "pmj"),
+    ("southern qiandong miao", "hms"),
+    ("southern qiang", "qxs"),
+    ("southern rengma naga", "nre"),
+    ("southern rincon zapotec", "zsr"),
+    ("southern roglai", "rgs"),
+    ("southern sama", "ssb"),
+    ("southern sami", "sma"),
+    ("southern samo", "sbd"),
+    ("southern sierra miwok", "skd"),
+    ("southern sorsoganon", "srv"),
+    ("southern sotho", "sot"),
+    ("southern subanen", "laa"),
+    ("southern thai", "sou"),
+    ("southern tidung", "itd"),
+    ("southern tiwa", "tix"),
+    ("southern toussian", "wib"),
+    ("southern tujia", "tjs"),
+    ("southern tutchone", "tce"),
+    ("southern uzbek", "uzs"),
+    ("southern yamphu", "lrr"),
+    ("southern yukaghir", "yux"),
+    ("southwest gbaya", "gso"),
+    ("southwest palawano", "plv"),
+    ("southwest pashai", "psh"),
+    ("southwest tanna", "nwi"),
+    ("southwestern bontok", "vbk"),
+    ("southwestern dinka", "dik"),
+    ("southwestern fars", "fay"),
+    ("southwestern guiyang hmong", "hmg"),
+    ("southwestern huishui hmong", "hmh"),
+    ("southwestern nisu", "nsv"),
+    ("southwestern tarahumara", "twr"),
+    ("southwestern tasmanian", "xpx"),
+    ("southwestern tepehuan", "tla"),
+    ("southwestern tlaxiaco mixtec", "meh"),
+    ("sowa", "sww"),
+    ("sowanda", "sow"),
+    ("soyaltepec mazatec", "vmp"),
+    ("soyaltepec mixtec", "vmq"),
+    ("spa", "spa"),
+    ("spanish", "spa"),
+    ("spanish sign language", "ssp"),
+    ("spiti bhoti", "spt"),
+    ("spokane", "spo"),
+    ("sq", "sqi"),
+    ("sqi", "sqi"),
+    ("squamish", "squ"),
+    ("sr", "srp"),
+    ("sranan tongo", "srn"),
+    ("srd", "srd"),
+    ("sri lankan creole malay", "sci"),
+    ("sri lankan sign language", "sqs"),
+    ("srn", "srn"),
+    ("srp", "srp"),
+    ("srr", "srr"),
+    ("ss", "ssw"),
+    ("ssw", "ssw"),
+    ("st", "sot"),
+    ("standard arabic", "arb"),
+    ("standard estonian", "ekk"),
+    ("standard latvian", "lvs"),
+    ("standard malay", "zsm"),
+    ("standard moroccan tamazight", "zgh"),
+    ("stellingwerfs", "stl"),
+    ("stod bhoti", "sbu"),
+    ("stodsde", "jih"),
+    ("stoney", "sto"),
+    ("straits salish", "str"),
+    ("su", "sun"),
+    ("suabo", "szp"),
+    ("suajili", "swa"),
+    ("suarmin", "seo"),
+    ("suau", "swp"),
+    ("suba", "sxb"),
+    ("suba-simbiti", "ssc"),
+    ("subi", "xsj"),
+    ("subiya", "sbs"),
+    ("subtiaba", "sut"),
+    ("sudanese arabic", "apd"),
+    ("sudanese creole arabic", "pga"),
+    ("sudest", "tgo"),
+    ("sudovian", "xsv"),
+    ("sueco", "swe"),
+    ("suena", "sue"),
+    ("suga", "sgi"),
+    ("suganga", "sug"),
+    ("sugut dusun", "kzs"),
+    ("suk", "suk"),
+    ("suki", "sui"),
+    ("suku", "sub"),
+    ("sukuma", "suk"),
+    ("sukur", "syk"),
+    ("sukurum", "zsu"),
+    ("sula", "szn"),
+    ("sulka", "sua"),
+    ("sulod", "srg"),
+    ("suma", "sqm"),
+    ("sumariup", "siv"),
+    ("sumau", "six"),
+    ("sumbawa", "smw"),
+    ("sumbwa", "suw"),
+    ("sumerian", "sux"),
+    ("sumi naga", "nsm"),
+    ("sumtu chin", "csv"),
+    ("sun", "sun"),
+    ("sunam", "ssk"),
+    ("sundanese", "sun"),
+    ("sunwar", "suz"),
+    ("suomi", "fin"),
+    ("suoy", "syo"),
+    ("supyire senoufo", "spp"),
+    ("surbakhal", "sbj"),
+    ("surgujia", "sgj"),
+    ("surigaonon", "sgd"),
+    ("surjapuri", "sjp"),
+    ("sursurunga", "sgz"),
+    ("suruahá", "swx"),
+    ("surubu", "sde"),
+    ("suruí", "sru"),
+    ("suruí do pará", "mdz"),
+    ("sus", "sus"),
+    ("susquehannock", "sqn"),
+    ("susu", "sus"),
+    ("susuami", "ssu"),
+    ("suundi", "sdj"),
+    ("suwawa", "swu"),
+    ("sux", "sux"),
+    ("suyá", "suy"),
+    ("suédois", "swe"),
+    ("sv", "swe"),
+    ("svan", "sva"),
+    ("svenska", "swe"),
+    ("sw", "swa"),
+    ("swa", "swa"),
+    ("swabian", "swg"),
+    ("swahili", "swa"),
+    ("swahili (individual language)", "swh"),
+    ("swahili (macrolanguage)", "swa"),
+    ("swampy cree", "csw"),
+    ("swati", "ssw"),
+    ("swe", "swe"),
+    ("swedish", "swe"),
+    ("swedish sign language", "swl"),
+    ("swiss german", "gsw"),
+    ("swiss-french sign language", "ssr"),
+    ("swiss-german sign language", "sgg"),
+    ("swiss-italian sign language", "slf"),
+    ("syc", "syc"),
+    ("syenara senoufo", "shz"),
+    ("sylheti", "syl"),
+    ("syr", "syr"),
+    ("syriac", "syr"),
+    ("sáliba", "slc"),
+    ("são paulo kaingáng", "zkp"),
+    ("sãotomense", "cri"),
+    ("sìcìté sénoufo", "sep"),
+    ("t'apo", "lgn"),
+    ("t'en", "tct"),
+    ("ta", "tam"),
+    ("ta'izzi-adeni arabic", "acq"),
+    ("taabwa", "tap"),
+    ("tabaa zapotec", "zat"),
+    ("tabaru", "tby"),
+    ("tabasco chontal", "chf"),
+    ("tabasco nahuatl", "nhc"),
+    ("tabasco zoque", "zoq"),
+    ("tabassaran", "tab"),
+    ("tabla", "tnm"),
+    ("tabo", "knv"),
+    ("tabriak", "tzx"),
+    ("tacahua mixtec", "xtt"),
+    ("tacana", "tna"),
+    ("tachawit", "shy"),
+    ("tachelhit", "shi"),
+    ("tachoni", "lts"),
+    ("tadaksahak", "dsq"),
+    ("tadjik", "tgk"),
+    ("tado", "klw"),
+    ("tadyawan", "tdy"),
+    ("tae'", "rob"),
+    ("tafi", "tcd"),
+    ("tagabawa", "bgs"),
+    ("tagakaulo", "klg"),
+    ("tagal murut", "mvv"),
+    ("tagalaka", "tgz"),
+    ("tagalo", "tgl"),
+    ("tagalog", "tgl"),
+    ("tagargrent", "oua"),
+    ("tagbanwa", "tbw"),
+    ("tagbu", "tbm"),
+    ("tagdal", "tda"),
+    ("tagin", "tgj"),
+    ("tagish", "tgx"),
+    ("tagoi", "tag"),
+    ("tagwana senoufo", "tgw"),
+    ("tah", "tah"),
+    ("tahaggart tamahaq", "thv"),
+    ("tahitian", "tah"),
+    ("tahltan", "tht"),
+    ("tai daeng", "tyr"),
+    ("tai dam", "blt"),
+    ("tai do", "tyj"),
+    ("tai dón", "twh"),
+    ("tai hongjin", "tiz"),
+    ("tai laing", "tjl"),
+    ("tai loi", "tlq"),
+    ("tai long", "thi"),
+    ("tai nüa", "tdd"),
+    ("tai pao", "tpo"),
+    ("tai thanh", "tmm"),
+    ("tai ya", "cuu"),
+    ("taiap", "gpn"),
+    ("taikat", "aos"),
+    ("tailandés", "tha"),
+    ("tainae", "ago"),
+    ("taino", "tnq"),
+    ("tairaha", "bxa"),
+    ("tairuma", "uar"),
+    ("taita", "dav"),
+    ("taivoan", "tvx"),
+    ("taiwan sign language", "tss"),
+    ("taje", "pee"),
+    ("tajik", "tgk"),
+    ("tajiki", "tgk"),
+    ("tajiki arabic", "abh"),
+    ("tajio", "tdj"),
+    ("tajuasohn", "tja"),
+    ("takelma", "tkm"),
+    ("takestani", "tks"),
+    ("takia", "tbc"),
+    ("takua", "tkz"),
+    ("takuu", "nho"),
+    ("takwane", "tke"),
+    ("tala", "tak"),
+    ("talaud", "tld"),
+    ("taliabu", "tlv"),
+    ("talieng", "tdf"),
+    ("talinga-bwisi", "tlj"),
+    ("talise", "tlr"),
+    ("talodi", "tlo"),
+    ("taloki", "tlk"),
+    ("talondo'", "tln"),
+    ("talossan", "tzl"),
+    ("talu", "yta"),
+    ("talysh", "tly"),
+    ("tam", "tam"),
+    ("tama (chad)", "tma"),
+    ("tama (colombia)", "ten"),
+    ("tamagario", "tcg"),
+    ("taman (indonesia)", "tmn"),
+    ("taman (myanmar)", "tcl"),
+    ("tamanaku", "tmz"),
+    ("tamashek", "tmh"),
+    ("tamasheq", "taq"),
+    ("tamazola mixtec", "vmx"),
+    ("tambas", "tdk"),
+    ("tambora", "xxt"),
+    ("tambotalo", "tls"),
+    ("tami", "tmy"),
+    ("tamil", "tam"),
+    ("tamki", "tax"),
+    ("tamnim citak", "tml"),
+    ("tamoul", "tam"),
+    ("tampias lobu", "low"),
+    ("tampuan", "tpu"),
+    ("tampulma", "tpm"),
+    ("tanacross", "tcb"),
+    ("tanahmerah", "tcm"),
+    ("tanaina", "tfn"),
+    ("tanapag", "tpv"),
+    ("tandaganon", "tgn"),
+    ("tandia", "tni"),
+    ("tandroy-mahafaly malagasy", "tdx"),
+    ("tanema", "tnx"),
+    ("tangale", "tan"),
+    ("tangchangya", "tnv"),
+    ("tanggu", "tgu"),
+    ("tangkhul naga (india)", "nmf"),
+    ("tangkhul naga (myanmar)", "ntx"),
+    ("tangko", "tkx"),
+    ("tanglang", "ytl"),
+    ("tangoa", "tgp"),
+    ("tanguat", "tbs"),
+    ("tangut", "txg"),
+    ("tanimbili", "tbe"),
+    ("tanimuca-retuarã", "tnc"),
+    ("tanjijili", "uji"),
+    ("tanosy malagasy", "txy"),
+    ("tanudan kalinga", "kml"),
+    ("tanzanian sign language", "tza"),
+    ("tapei", "afp"),
+    ("tapieté", "tpj"),
+    ("tapirapé", "taf"),
+    ("tarao naga", "tro"),
+    ("tareng", "tgr"),
+    ("tariana", "tae"),
+    ("tarifit", "rif"),
+    ("tarjumo", "txj"),
+    ("tarok", "yer"),
+    ("taroko", "trv"),
+    ("tarpia", "tpf"),
+    ("tartessian", "txr"),
+    ("taruma", "tdm"),
+    ("tasawaq", "twq"),
+    ("tase naga", "nst"),
+    ("tasmate", "tmt"),
+    ("tat", "tat"),
+    ("tataltepec chatino", "cta"),
+    ("tatana", "txx"),
+    ("tatar", "tat"),
+    ("tatuyo", "tav"),
+    ("tauade", "ttd"),
+    ("taulil", "tuh"),
+    ("taungyo", "tco"),
+    ("taupota", "tpa"),
+    ("tause", "tad"),
+    ("taushiro", "trr"),
+    ("tausug", "tsg"),
+    ("tauya", "tya"),
+    ("taveta", "tvs"),
+    ("tavoyan", "tvn"),
+    ("tavringer romani", "rmu"),
+    ("tawala", "tbo"),
+    ("tawallammat tamajaq", "ttq"),
+    ("tawandê", "xtw"),
+    ("tawang monpa", "twm"),
+    ("tawara", "twl"),
+    ("taworta", "tbp"),
+    ("tawoyan", "twy"),
+    ("tawr chin", "tcp"),
+    ("tay boi", "tas"),
+    ("tay khang", "tnu"),
+    ("tayart tamajeq", "thz"),
+    ("tayiko", "tgk"),
+    ("tayo", "cks"),
+    ("taznatit", "grr"),
+    ("tboli", "tbl"),
+    ("tchitchege", "tck"),
+    ("tchumbuli", "bqa"),
+    ("tchèque", "ces"),
+    ("te", "tel"),
+    ("te'un", "tve"),
+    ("teanu", "tkw"),
+    ("tebul sign language", "tsy"),
+    ("tebul ure dogon", "dtu"),
+    ("tecpatlán totonac", "tcw"),
+    ("tedaga", "tuq"),
+    ("tedim chin", "ctd"),
+    ("tefaro", "tfo"),
+    ("tegali", "ras"),
+    ("tehit", "kps"),
+    ("tehuelche", "teh"),
+    ("tejalapan zapotec", "ztt"),
+    ("teke-ebo", "ebo"),
+    ("teke-fuumu", "ifm"),
+    ("teke-kukuya", "kkw"),
+    ("teke-laali", "lli"),
+    ("teke-nzikou", "nzu"),
+    ("teke-tege", "teg"),
+    ("teke-tsaayi", "tyi"),
+    ("teke-tyee", "tyx"),
+    ("tektiteko", "ttc"),
+    ("tel", "tel"),
+    ("tela-masbuar", "tvm"),
+    ("telefol", "tlf"),
+    ("telugu", "tel"),
+    ("tem", "tem"),
+    ("temacine tamazight", "tjo"),
+    ("temascaltepec nahuatl", "nhv"),
+    ("tembo (kitembo)", "tbt"),
+    ("tembo (motembo)", "tmv"),
+    ("tembé", "tqb"),
+    ("teme", "tdo"),
+    ("temein", "teq"),
+    ("temi", "soz"),
+    ("temiar", "tea"),
+    ("temoaya otomi", "ott"),
+    ("temoq", "tmo"),
+    ("temuan", "tmw"),
+    ("ten'edn", "tnz"),
+    ("tena lowland quichua", "quw"),
+    ("tenango otomi", "otn"),
+    ("tene kan dogon", "dtk"),
+    ("tenggarong kutai malay", "vkt"),
+    ("tengger", "tes"),
+    ("tenharim", "pah"),
+    ("tenino", "tqn"),
+    ("tenis", "tns"),
+    ("tennet", "tex"),
+    ("teop", "tio"),
+    ("teor", "tev"),
+    ("tepecano", "tep"),
+    ("tepetotutla chinantec", "cnt"),
+    ("tepeuxila cuicatec", "cux"),
+    ("tepinapa chinantec", "cte"),
+    ("tepo krumen", "ted"),
+    ("ter", "ter"),
+    ("ter sami", "sjt"),
+    ("tera", "ttr"),
+    ("terebu", "trb"),
+    ("terei", "buo"),
+    ("tereno", "ter"),
+    ("teressa", "tef"),
+    ("tereweng", "twg"),
+    ("teribe", "tfr"),
+    ("terik", "tec"),
+    ("termanu", "twu"),
+    ("ternate", "tft"),
+    ("ternateño", "tmg"),
+    ("tesaka malagasy", "tkg"),
+    ("tese", "keg"),
+    ("teshenawa", "twc"),
+    ("teso", "teo"),
+    ("tet", "tet"),
+    ("tetela", "tll"),
+    ("tetelcingo nahuatl", "nhg"),
+    ("tetete", "teb"),
+    ("tetserret", "tez"),
+    ("tetum", "tet"),
+    ("tetun dili", "tdt"),
+    ("teutila cuicatec", "cut"),
+    ("tewa (indonesia)", "twe"),
+    ("tewa (usa)", "tew"),
+    ("tewe", "twx"),
+    ("texcatepec otomi", "otx"),
+    ("texistepec popoluca", "poq"),
+    ("texmelucan zapotec", "zpz"),
+    ("tezoatlán mixtec", "mxb"),
+    ("tg", "tgk"),
+    ("tgk", "tgk"),
+    ("tgl", "tgl"),
+    ("th", "tha"),
+    ("tha", "tha"),
+    ("thachanadan", "thn"),
+    ("thado chin", "tcz"),
+    ("thai", "tha"),
+    ("thai sign language", "tsq"),
+    ("thai song", "soa"),
+    ("thaiphum chin", "cth"),
+    ("thakali", "ths"),
+    ("thangal naga", "nki"),
+    ("thangmi", "thf"),
+    ("thao", "ssf"),
+    ("tharaka", "thk"),
+    ("thawa", "xtv"),
+    ("thaypan", "typ"),
+    ("thaï", "tha"),
+    ("thiin", "iin"),
+    ("thompson", "thp"),
+    ("thopho", "ytp"),
+    ("thracian", "txh"),
+    ("thu lao", "tyl"),
+    ("thulung", "tdh"),
+    ("thur", "lth"),
+    ("thuri", "thu"),
+    ("ti", "tir"),
+    ("tiagbamrin aizi", "ahi"),
+    ("tiale", "mnl"),
+    ("tiang", "tbj"),
+    ("tib", "bod"),
+    ("tibea", "ngy"),
+    ("tibetan", "bod"),
+    ("tibetan sign language", "lsn"),
+    ("tichurong", "tcn"),
+    ("ticuna", "tca"),
+    ("tidaá mixtec", "mtx"),
+    ("tidikelt tamazight", "tia"),
+    ("tidore", "tvo"),
+    ("tiemacèwè bozo", "boo"),
+    ("tiene", "tii"),
+    ("tifal", "tif"),
+    ("tig", "tig"),
+    ("tigak", "tgc"),
+    ("tigon mbembe", "nza"),
+    ("tigre", "tig"),
+    ("tigrinya", "tir"),
+    ("tijaltepec mixtec", "xtl"),
+    ("tikar", "tik"),
+    ("tikopia", "tkp"),
+    ("tilapa otomi", "otl"),
+    ("tillamook", "til"),
+    ("tilquiapan zapotec", "zts"),
+    ("tilung", "tij"),
+    ("tima", "tms"),
+    ("timbe", "tim"),
+    ("timne", "tem"),
+    ("timor pidgin", "tvy"),
+    ("timucua", "tjm"),
+    ("timugon murut", "tih"),
+    ("tinani", "lbf"),
+    ("tindi", "tin"),
+    ("tingui-boto", "tgv"),
+    ("tinigua", "tit"),
+    ("tinputz", "tpz"),
+    ("tippera", "tpe"),
+    ("tir", "tir"),
+    ("tira", "tic"),
+    ("tirahi", "tra"),
+    ("tiranige diga dogon", "tde"),
+    ("tiri", "cir"),
+    ("tirmaga-chai suri", "suq"),
+    ("tiruray", "tiy"),
+    ("tita", "tdq"),
+    ("titan", "ttv"),
+    ("tiv", "tiv"),
+    ("tiwa", "lax"),
+    ("tiwi", "tiw"),
+    ("tiyaa", "tyy"),
+    ("tiéfo", "tiq"),
+    ("tiéyaxo bozo", "boz"),
+    ("tiếng việt", "vie"),
+    ("tjungundji", "tjj"),
+    ("tjupany", "tjp"),
+    ("tjurruru", "tju"),
+    ("tk", "tuk"),
+    ("tkl", "tkl"),
+    ("tl", "tgl"),
+    ("tlachichilco tepehua", "tpt"),
+    ("tlacoapa me'phaa", "tpl"),
+    ("tlacoatzintepec chinantec", "ctl"),
+    ("tlacolulita zapotec", "zpk"),
+    ("tlahuitoltepec mixe", "mxp"),
+    ("tlamacazapa nahuatl", "nuz"),
+    ("tlazoyaltepec mixtec", "mqh"),
+    ("tlh", "tlh"),
+    ("tli", "tli"),
+    ("tlingit", "tli"),
+    ("tmh", "tmh"),
+    ("tn", "tsn"),
+    ("to", "ton"),
+    ("to'abaita", "mlu"),
+    ("toaripi", "tqo"),
+    ("toba", "tob"),
+    ("toba-maskoy", "tmf"),
+    ("tobagonian creole english", "tgh"),
+    ("tobanga", "tng"),
+    ("tobati", "tti"),
+    ("tobelo", "tlb"),
+    ("tobian", "tox"),
+    ("tobilung", "tgb"),
+    ("tobo", "tbv"),
+    ("tocantins asurini", "asu"),
+    ("tocho", "taz"),
+    ("toda", "tcx"),
+    ("todrah", "tdr"),
+    ("tofanma", "tlg"),
+    ("tofin gbe", "tfi"),
+    ("tog", "tog"),
+    ("togbo-vara banda", "tor"),
+    ("togoyo", "tgy"),
+    ("tohono o'odham", "ood"),
+    ("tojolabal", "toj"),
+    ("tok pisin", "tpi"),
+    ("tokano", "zuh"),
+    ("tokelau", "tkl"),
+    ("tokharian a", "xto"),
+    ("tokharian b", "txb"),
+    ("toku-no-shima", "tkn"),
+    ("tolaki", "lbw"),
+    ("tolomako", "tlm"),
+    ("tolowa", "tol"),
+    ("toma", "tod"),
+    ("tomadino", "tdi"),
+    ("tombelala", "ttp"),
+    ("tombonuo", "txa"),
+    ("tombulu", "tom"),
+    ("tomini", "txm"),
+    ("tommo so dogon", "dto"),
+    ("tomo kan dogon", "dtm"),
+    ("tomoip", "tqp"),
+    ("ton", "ton"),
+    ("tondano", "tdn"),
+    ("tondi songway kiini", "tst"),
+    ("tonga (nyasa)", "tog"),
+    ("tonga (tonga islands)", "ton"),
+    ("tonga (zambia)", "toi"),
+    ("tongwe", "tny"),
+    ("tonjon", "tjn"),
+    ("tonkawa", "tqw"),
+    ("tonsawang", "tnw"),
+    ("tonsea", "txs"),
+    ("tontemboan", "tnt"),
+    ("tooro", "ttj"),
+    ("topoiyo", "toy"),
+    ("toposa", "toq"),
+    ("toraja-sa'dan", "sda"),
+    ("toram", "trj"),
+    ("torau", "ttu"),
+    ("tornedalen finnish", "fit"),
+    ("toro", "tdv"),
+    ("toro so dogon", "dts"),
+    ("toro tegu dogon", "dtt"),
+    ("toromono", "tno"),
+    ("torona", "tqr"),
+    ("torres strait creole", "tcs"),
+    ("torricelli", "tei"),
+    ("torwali", "trw"),
+    ("torá", "trz"),
+    ("tosk albanian", "als"),
+    ("totela", "ttl"),
+    ("toto", "txo"),
+    ("totoli", "txe"),
+    ("totomachapan zapotec", "zph"),
+    ("totontepec mixe", "mto"),
+    ("totoro", "ttk"),
+    ("touo", "tqu"),
+    ("toura (côte d'ivoire)", "neb"),
+    ("toura (papua new guinea)", "don"),
+    ("towei", "ttn"),
+    ("tpi", "tpi"),
+    ("tr", "tur"),
+    ("transalpine gaulish", "xtg"),
+    ("traveller danish", "rmd"),
+    ("traveller norwegian", "rmg"),
+    ("traveller scottish", "trl"),
+    ("tregami", "trm"),
+    ("tremembé", "tme"),
+    ("trieng", "stg"),
+    ("trimuris", "tip"),
+    ("tring", "tgq"),
+    ("tringgus-sembaan bidayuh", "trx"),
+    ("trinidad and tobago sign language", "lst"),
+    ("trinidadian creole english", "trf"),
+    ("trinitario", "trn"),
+    ("trió", "tri"),
+    ("truká", "tka"),
+    ("trumai", "tpy"),
+    ("ts", "tso"),
+    ("ts'ün-lao", "tsl"),
+    ("tsaangi", "tsa"),
+    ("tsakhur", "tkr"),
+    ("tsakonian", "tsd"),
+    ("tsakwambo", "kvz"),
+    ("tsamai", "tsb"),
+    ("tsat", "huq"),
+    ("tseku", "tsk"),
+    ("tsetsaut", "txc"),
+    ("tshangla", "tsj"),
+    ("tsi", "tsi"),
+    ("tsikimba", "kdl"),
+    ("tsimané", "cas"),
+    ("tsimihety malagasy", "xmw"),
+    ("tsimshian", "tsi"),
+    ("tsishingini", "tsw"),
+    ("tsn", "tsn"),
+    ("tso", "tso"),
+    ("tsoa", "hio"),
+    ("tsogo", "tsv"),
+    ("tsonga", "tso"),
+    ("tsotso", "lto"),
+    ("tsou", "tsu"),
+    ("tsucuba", "cbq"),
+    ("tsum", "ttz"),
+    ("tsuvadi", "tvd"),
+    ("tsuvan", "tsh"),
+    ("tswa", "tsc"),
+    ("tswana", "tsn"),
+    ("tswapong", "two"),
+    ("tt", "tat"),
+    ("tuamotuan", "pmt"),
+    ("tubar", "tbu"),
+    ("tucano", "tuo"),
+    ("tugen", "tuy"),
+    ("tugun", "tzn"),
+    ("tugutil", "tuj"),
+    ("tuk", "tuk"),
+    ("tukang besi north", "khc"),
+    ("tukang besi south", "bhq"),
+    ("tuki", "bag"),
+    ("tukpa", "tpq"),
+    ("tukudede", "tkd"),
+    ("tukumanféd", "tkf"),
+    ("tula", "tul"),
+    ("tulehu", "tlu"),
+    ("tulishi", "tey"),
+    ("tulu", "tcy"),
+    ("tulu-bohuai", "rak"),
+    ("tum", "tum"),
+    ("tuma-irumu", "iou"),
+    ("tumak", "tmc"),
+    ("tumari kanuri", "krt"),
+    ("tumbuka", "tum"),
+    ("tumi", "kku"),
+    ("tumleo", "tmq"),
+    ("tumshuqese", "xtq"),
+    ("tumtum", "tbr"),
+    ("tumulung sisaala", "sil"),
+    ("tumzabt", "mzb"),
+    ("tundra enets", "enh"),
+    ("tunen", "tvu"),
+    ("tungag", "lcm"),
+    ("tunggare", "trt"),
+    ("tunia", "tug"),
+    ("tunica", "tun"),
+    ("tunisian arabic", "aeb"),
+    ("tunisian sign language", "tse"),
+    ("tunjung", "tjg"),
+    ("tunni", "tqq"),
+    ("tunzu", "dza"),
+    ("tuotomb", "ttf"),
+    ("tuparí", "tpr"),
+    ("tupinambá", "tpn"),
+    ("tupinikin", "tpk"),
+    ("tupuri", "tui"),
+    ("tupí", "tpw"),
+    ("tur", "tur"),
+    ("turaka", "trh"),
+    ("turc", "tur"),
+    ("turco", "tur"),
+    ("turcomano", "tuk"),
+    ("turi", "trd"),
+    ("turiwára", "twt"),
+    ("turka", "tuz"),
+    ("turkana", "tuv"),
+    ("turkish", "tur"),
+    ("turkish sign language", "tsm"),
+    ("turkmen", "tuk"),
+    ("turkmène", "tuk"),
+    ("turks and caicos creole english", "tch"),
+    ("turoyo", "tru"),
+    ("turumsa", "tqm"),
+    ("turung", "try"),
+    ("tuscarora", "tus"),
+    ("tutelo", "tta"),
+    ("tutong", "ttg"),
+    ("tutsa naga", "tvt"),
+    ("tutuba", "tmi"),
+    ("tututepec mixtec", "mtu"),
+    ("tututni", "tuu"),
+    ("tuvalu", "tvl"),
+    ("tuvinian", "tyv"),
+    ("tuwali ifugao", "ifk"),
+    ("tuwari", "tww"),
+    ("tuwuli", "bov"),
+    ("tuxináwa", "tux"),
+    ("tuxá", "tud"),
+    ("tuyuca", "tue"),
+    ("tvl", "tvl"),
+    ("tw", "twi"),
+    ("twana", "twa"),
+    ("twendi", "twn"),
+    ("twents", "twd"),
+    ("twi", "twi"),
+    ("ty", "tah"),
+    ("tyap", "kcg"),
+    ("tyv", "tyv"),
+    ("tz'utujil", "tzj"),
+    ("tzeltal", "tzh"),
+    ("tzotzil", "tzo"),
+    ("tày sa pa", "tys"),
+    ("tày tac", "tyt"),
+    ("télougou", "tel"),
+    ("télugu", "tel"),
+    ("téén", "lor"),
+    ("tübatulabal", "tub"),
+    ("türkmençe", "tuk"),
+    ("türkçe", "tur"),
+    ("uab meto", "aoz"),
+    ("uamué", "uam"),
+    ("uare", "ksj"),
+    ("ubaghara", "byc"),
+    ("ubang", "uba"),
+    ("ubir", "ubr"),
+    ("ubykh", "uby"),
+    ("ucayali-yurúa ashéninka", "cpb"),
+    ("ucraniano", "ukr"),
+    ("udihe", "ude"),
+    ("udm", "udm"),
+    ("udmurt", "udm"),
+    ("uduk", "udu"),
+    ("ufim", "ufi"),
+    ("ug", "uig"),
+    ("uga", "uga"),
+    ("ugandan sign language", "ugn"),
+    ("ugaritic", "uga"),
+    ("ughele", "uge"),
+    ("ugong", "ugo"),
+    ("uhami", "uha"),
+    ("uig", "uig"),
+    ("uighur", "uig"),
+    ("uisai", "uis"),
+    ("ujir", "udj"),
+    ("uk", "ukr"),
+    ("ukaan", "kcf"),
+    ("ukhwejo", "ukh"),
+    ("ukit", "umi"),
+    ("ukpe-bayobiri", "ukp"),
+    ("ukpet-ehom", "akd"),
+    ("ukr", "ukr"),
+    ("ukrainian", "ukr"),
+    ("ukrainian sign language", "ukl"),
+    ("ukrainien", "ukr"),
+    ("ukue", "uku"),
+    ("ukuriguma", "ukg"),
+    ("ukwa", "ukq"),
+    ("ukwuani-aboh-ndoni", "ukw"),
+    ("ulau-suain", "svb"),
+    ("ulch", "ulc"),
+    ("ulithian", "uli"),
+    ("ullatan", "ull"),
+    ("ulukwumi", "ulb"),
+    ("ulumanda'", "ulm"),
+    ("ulwa", "ulw"),
+    ("uma' lasan", "xky"),
+    ("uma' lung", "ulu"),
+    ("umanakaina", "gdn"),
+    ("umatilla", "uma"),
+    ("umb", "umb"),
+    ("umbindhamu", "umd"),
+    ("umbrian", "xum"),
+    ("umbu-ungu", "ubu"),
+    ("umbugarla", "umr"),
+    ("umbundu", "umb"),
+    ("ume sami", "sju"),
+    ("umeda", "upi"),
+    ("umiida", "xud"),
+    ("umiray dumaget agta", "due"),
+    ("umon", "umm"),
+    ("umotína", "umo"),
+    ("umpila", "ump"),
+    ("unami", "unm"),
+    ("uncoded languages", "mis"),
+    ("und", "und"),
+    ("unde kaili", "unz"),
+    ("undetermined", "und"),
+    ("uneapa", "bbn"),
+    ("uneme", "une"),
+    ("unggaranggu", "xun"),
+    ("unggumi", "xgu"),
+    ("unserdeutsch", "uln"),
+    ("unua", "onu"),
+    ("unubahe", "unu"),
+    ("upper chehalis", "cjh"),
+    ("upper grand valley dani", "dna"),
+    ("upper guinea crioulo", "pov"),
+    ("upper kinabatangan", "dmg"),
+    ("upper kuskokwim", "kuu"),
+    ("upper necaxa totonac", "tku"),
+    ("upper saxon", "sxu"),
+    ("upper sorbian", "hsb"),
+    ("upper ta'oih", "tth"),
+    ("upper tanana", "tau"),
+    ("upper taromi", "tov"),
+    ("upper umpqua", "xup"),
+    ("ur", "urd"),
+    ("ura (papua new guinea)", "uro"),
+    ("ura (vanuatu)", "uur"),
+    ("uradhi", "urf"),
+    ("urak lawoi'", "urk"),
+    ("urali", "url"),
+    ("urapmin", "urm"),
+    ("urarina", "ura"),
+    ("urartian", "xur"),
+    ("urat", "urt"),
+    ("urd", "urd"),
+    ("urdu", "urd"),
+    ("urhobo", "urh"),
+    ("urigina", "urg"),
+    ("urim", "uri"),
+    ("urimo", "urx"),
+    ("uripiv-wala-rano-atchin", "upv"),
+    ("urningangg", "urc"),
+    ("uru-eu-wau-wau", "urz"),
+    ("uru-pa-in", "urp"),
+    ("uruangnirin", "urn"),
+    ("uruava", "urv"),
+    ("urubú-kaapor", "urb"),
+    ("urubú-kaapor sign language", "uks"),
+    ("uruguayan sign language", "ugy"),
+    ("urum", "uum"),
+    ("urumi", "uru"),
+    ("us-saare", "uss"),
+    ("usaghade", "usk"),
+    ("usan", "wnu"),
+    ("usarufa", "usa"),
+    ("ushojo", "ush"),
+    ("usila chinantec", "cuc"),
+    ("usku", "ulf"),
+    ("uspanteco", "usp"),
+    ("usui", "usi"),
+    ("ut-hun", "uth"),
+    ("ut-ma'in", "gel"),
+    ("utarmbung", "omo"),
+    ("ute-southern paiute", "ute"),
+    ("uvbie", "evh"),
+    ("uyajitaya", "duk"),
+    ("uz", "uzb"),
+    ("uzb", "uzb"),
+    ("uzbek", "uzb"),
+    ("uzbeki arabic", "auz"),
+    ("uzbeko", "uzb"),
+    ("uzekwe", "eze"),
+    ("vaagri booli", "vaa"),
+    ("vafsi", "vaf"),
+    ("vaghri", "vgr"),
+    ("vaghua", "tva"),
+    ("vagla", "vag"),
+    ("vai", "vai"),
+    ("vaiphei", "vap"),
+    ("vale", "vae"),
+    ("valencian sign language", "vsv"),
+    ("valle nacional chinantec", "cvn"),
+    ("valley maidu", "vmv"),
+    ("valman", "van"),
+    ("valpei", "vlp"),
+    ("vamale", "mkt"),
+    ("vame", "mlr"),
+    ("vandalic", "xvn"),
+    ("vangunu", "mpr"),
+    ("vanimo", "vam"),
+    ("vano", "vnk"),
+    ("vanuma", "vau"),
+    ("varhadi-nagpuri", "vah"),
+    ("varisi", "vrs"),
+    ("varli", "vav"),
+    ("vasavi", "vas"),
+    ("ve", "ven"),
+    ("veddah", "ved"),
+    ("vehes", "val"),
+    ("veluws", "vel"),
+    ("vemgo-mabas", "vem"),
+    ("ven", "ven"),
+    ("venda", "ven"),
+    ("venetian", "vec"),
+    ("venetic", "xve"),
+    ("venezuelan sign language", "vsl"),
+    ("vengo", "bav"),
+    ("ventureño", "veo"),
+    ("veps", "vep"),
+    ("vera'a", "vra"),
+    ("vestinian", "xvs"),
+    ("vi", "vie"),
+    ("vidunda", "vid"),
+    ("vie", "vie"),
+    ("viemo", "vig"),
+    ("vietnamese", "vie"),
+    ("vietnamien", "vie"),
+    ("vietnamita", "vie"),
+    ("vilela", "vil"),
+    ("vili", "vif"),
+    ("villa viciosa agta", "dyg"),
+    ("vincentian creole english", "svc"),
+    ("vinmavis", "vnm"),
+    ("vinza", "vin"),
+    ("virgin islands creole english", "vic"),
+    ("vishavan", "vis"),
+    ("viti", "vit"),
+    ("vitou", "vto"),
+    ("vitu", "wiv"),
+    ("vlaams", "vls"),
+    ("vlaamse gebarentaal", "vgt"),
+    ("vlax romani", "rmy"),
+    ("vo", "vol"),
+    ("vol", "vol"),
+    ("volapük", "vol"),
+    ("volscian", "xvo"),
+    ("vono", "kch"),
+    ("voro", "vor"),
+    ("vot", "vot"),
+    ("votic", "vot"),
+    ("vumbu", "vum"),
+    ("vunapu", "vnp"),
+    ("vunjo", "vun"),
+    ("vurës", "msn"),
+    ("vute", "vut"),
+    ("vwanji", "wbi"),
+    ("võro", "vro"),
+    ("wa", "wln"),
+    ("wa'ema", "wag"),
+    ("waama", "wwa"),
+    ("waamwang", "wmn"),
+    ("waata", "ssn"),
+    ("wabo", "wbb"),
+    ("waboda", "kmx"),
+    ("waci gbe", "wci"),
+    ("wadaginam", "wdg"),
+    ("waddar", "wbq"),
+    ("wadi wadi", "xwd"),
+    ("wadikali", "wdk"),
+    ("wadiyara koli", "kxp"),
+    ("wadjabangayi", "wdy"),
+    ("wadjiginy", "wdj"),
+    ("wadjigu", "wdu"),
+    ("wae rana", "wrx"),
+    ("waffa", "waj"),
+    ("wagawaga", "wgb"),
+    ("wagaya", "wga"),
+    ("wagdi", "wbr"),
+    ("wagi", "fad"),
+    ("wagiman", "waq"),
+    ("wahau kayan", "whu"),
+    ("wahau kenyah", "whk"),
+    ("wahgi", "wgi"),
+    ("waigali", "wbk"),
+    ("waigeo", "wgo"),
+    ("wailaki", "wlk"),
+    ("wailapa", "wlr"),
+    ("waima", "rro"),
+    ("waima'a", "wmh"),
+    ("waimaha", "bao"),
+    ("waimiri-atroari", "atr"),
+    ("waioli", "wli"),
+    ("waiwai", "waw"),
+    ("waja", "wja"),
+    ("wajarri", "wbv"),
+    ("wajuk", "xwj"),
+    ("waka", "wav"),
+    ("wakabunga", "wwb"),
+    ("wakawaka", "wkw"),
+    ("wakde", "wkd"),
+    ("wakhi", "wbl"),
+    ("wakoná", "waf"),
+    ("wal", "wal"),
+    ("wala", "lgl"),
+    ("walak", "wlw"),
+    ("walangama", "nlw"),
+    ("wali (ghana)", "wlx"),
+    ("wali (sudan)", "wll"),
+    ("waling", "wly"),
+    ("walio", "wla"),
+    ("walla walla", "waa"),
+    ("wallisian", "wls"),
+    ("walloon", "wln"),
+    ("walmajarri", "wmt"),
+    ("walser", "wae"),
+    ("walungge", "ola"),
+    ("waluwarra", "wrb"),
+    ("wamas", "wmc"),
+    ("wambaya", "wmb"),
+    ("wambon", "wms"),
+    ("wambule", "wme"),
+    ("wamesa", "wad"),
+    ("wamey", "cou"),
+    ("wamin", "wmi"),
+    ("wampanoag", "wam"),
+    ("wampar", "lbq"),
+    ("wampur", "waz"),
+    ("wanambre", "wnb"),
+    ("wanap", "wnp"),
+    ("wancho naga", "nnp"),
+    ("wanda", "wbh"),
+    ("wandala", "mfi"),
+    ("wandarang", "wnd"),
+    ("wandji", "wdd"),
+    ("waneci", "wne"),
+    ("wanga", "lwg"),
+    ("wangaaybuwan-ngiyambaa", "wyb"),
+    ("wanggamala", "wnm"),
+    ("wanggom", "wng"),
+    ("wangkangurru", "wgg"),
+    ("wangkayutyuru", "wky"),
+    ("wangkumara", "xwk"),
+    ("wannu", "jub"),
+    ("wano", "wno"),
+    ("wantoat", "wnc"),
+    ("wanukaka", "wnk"),
+    ("wanyi", "wny"),
+    ("wané", "hwa"),
+    ("waorani", "auc"),
+    ("wapan", "juk"),
+    ("wapishana", "wap"),
+    ("wappo", "wao"),
+    ("war", "war"),
+    ("war-jaintia", "aml"),
+    ("wara", "wbf"),
+    ("warao", "wba"),
+    ("waray (australia)", "wrz"),
+    ("waray (philippines)", "war"),
+    ("wardaman", "wrr"),
+    ("wardandi", "wxw"),
+    ("warduji", "wrd"),
+    ("warembori", "wsa"),
+    ("wares", "wai"),
+    ("waris", "wrs"),
+    ("waritai", "wbe"),
+    ("wariyangga", "wri"),
+    ("warji", "wji"),
+    ("warkay-bipim", "bgv"),
+    ("warlmanpa", "wrl"),
+    ("warlpiri", "wbp"),
+    ("warnang", "wrn"),
+    ("warnman", "wbt"),
+    ("waropen", "wrp"),
+    ("warrgamay", "wgy"),
+    ("warrwa", "wwr"),
+    ("waru", "wru"),
+    ("warumungu", "wrm"),
+    ("waruna", "wrv"),
+    ("warungu", "wrg"),
+    ("warwar feni", "hrw"),
+    ("was", "was"),
+    ("wasa", "wss"),
+    ("wasco-wishram", "wac"),
+    ("wasembo", "gsp"),
+    ("washo", "was"),
+    ("waskia", "wsk"),
+    ("wasu", "wsu"),
+    ("watakataui", "wtk"),
+    ("watam", "wax"),
+    ("wathawurrung", "wth"),
+    ("watiwa", "wtf"),
+    ("watubela", "wah"),
+    ("waube", "kop"),
+    ("waurá", "wau"),
+    ("wauyai", "wuy"),
+    ("wawa", "www"),
+    ("wawonii", "wow"),
+    ("waxianghua", "wxa"),
+    ("wayampi", "oym"),
+    ("wayana", "way"),
+    ("wayanad chetti", "ctt"),
+    ("wayoró", "wyr"),
+    ("wayu", "vay"),
+    ("wayuu", "guc"),
+    ("wedau", "wed"),
+    ("wejewa", "wew"),
+    ("wel", "cym"),
+    ("welaun", "wlh"),
+    ("weliki", "klh"),
+    ("welsh", "cym"),
+    ("welsh romani", "rmw"),
+    ("wemale", "weo"),
+    ("wemba wemba", "xww"),
+    ("weme gbe", "wem"),
+    ("wergaia", "weg"),
+    ("weri", "wer"),
+    ("wersing", "kvw"),
+    ("west albay bikol", "fbl"),
+    ("west ambae", "nnd"),
+    ("west bengal sign language", "wbs"),
+    ("west berawan", "zbw"),
+    ("west central banda", "bbp"),
+    ("west central oromo", "gaz"),
+    ("west coast bajau", "bdr"),
+    ("west damar", "drn"),
+    ("west goodenough", "ddi"),
+    ("west kewa", "kew"),
+    ("west lembata", "lmj"),
+    ("west makian", "mqs"),
+    ("west masela", "mss"),
+    ("west tarangan", "txn"),
+    ("west uvean", "uve"),
+    ("west yugur", "ybe"),
+    ("west-central limba", "lia"),
+    ("western abnaki", "abe"),
+    ("western apache", "apw"),
+    ("western armenian", "hyw"),
+    ("western arrarnta", "are"),
+    ("western balochi", "bgn"),
+    ("western bolivian guaraní", "gnw"),
+    ("western bru", "brv"),
+    ("western bukidnon manobo", "mbb"),
+    ("western cham", "cja"),
+    ("western dani", "dnw"),
+    ("western durango nahuatl", "azn"),
+    ("western fijian", "wyy"),
+    ("western frisian", "fry"),
+    ("western highland chatino", "ctp"),
+    ("western highland purepecha", "pua"),
+    ("western huasteca nahuatl", "nhw"),
+    ("western juxtlahuaca mixtec", "jmx"),
+    ("western kanjobal", "knj"),
+    ("western karaboro", "kza"),
+    ("western katu", "kuf"),
+    ("western kayah", "kyu"),
+    ("western keres", "kjq"),
+    ("western krahn", "krw"),
+    ("western lalu", "ywl"),
+    ("western lawa", "lcp"),
+    ("western magar", "mrd"),
+    ("western maninkakan", "mlq"),
+    ("western mari", "mrj"),
+    ("western mashan hmong", "hmw"),
+    ("western meohang", "raf"),
+    ("western minyag", "wmg"),
+    ("western muria", "mut"),
+    ("western neo-aramaic", "amw"),
+    ("western niger fulfulde", "fuh"),
+    ("western ojibwa", "ojw"),
+    ("western panjabi", "pnb"),
+    ("western parbate kham", "kjl"),
+    ("western penan", "pne"),
+    ("western sisaala", "ssl"),
+    ("western subanon", "suc"),
+    ("western tamang", "tdg"),
+    ("western tawbuid", "twb"),
+    ("western tlacolula valley zapotec", "zab"),
+    ("western totonac", "tqt"),
+    ("western tunebo", "tnb"),
+    ("western xiangxi miao", "mmr"),
+    ("western xwla gbe", "xwl"),
+    ("western yiddish", "yih"),
+    ("westphalien", "wep"),
+    ("wetamut", "wwo"),
+    ("wewaw", "wea"),
+    ("weyto", "woy"),
+    ("white gelao", "giw"),
+    ("white lachi", "lwh"),
+    ("whitesands", "tnp"),
+    ("wiarumus", "tua"),
+    ("wichita", "wic"),
+    ("wichí lhamtés güisnay", "mzh"),
+    ("wichí lhamtés nocten", "mtp"),
+    ("wichí lhamtés vejoz", "wlv"),
+    ("wik ngathan", "wig"),
+    ("wik-epa", "wie"),
+    ("wik-iiyanh", "wij"),
+    ("wik-keyangan", "wif"),
+    ("wik-me'anha", "wih"),
+    ("wik-mungkan", "wim"),
+    ("wikalkan", "wik"),
+    ("wikang tagalog", "tgl"),
+    ("wikngenchera", "wua"),
+    ("wilawila", "wil"),
+    ("wintu", "wnw"),
+    ("winyé", "kst"),
+    ("wipi", "gdr"),
+    ("wiradjuri", "wrh"),
+    ("wiraféd", "wir"),
+    ("wirangu", "wgu"),
+    ("wiru", "wiu"),
+    ("wiyot", "wiy"),
+    ("wln", "wln"),
+    ("wo", "wol"),
+    ("woccon", "xwc"),
+    ("wogamusin", "wog"),
+    ("wogeo", "woc"),
+    ("woiwurrung", "wyi"),
+    ("wojenaka", "jod"),
+    ("wol", "wol"),
+    ("wolane", "wle"),
+    ("wolani", "wod"),
+    ("wolaytta", "wal"),
+    ("woleaian", "woe"),
+    ("wolio", "wlo"),
+    ("wolof", "wol"),
+    ("wom (nigeria)", "wom"),
+    ("wom (papua new guinea)", "wmo"),
+    ("womo", "wmx"),
+    ("wongo", "won"),
+    ("woods cree", "cwd"),
+    ("woria", "wor"),
+    ("worimi", "kda"),
+    ("worodougou", "jud"),
+    ("worrorra", "wro"),
+    ("wotapuri-katarqalai", "wsv"),
+    ("wotjobaluk", "xwt"),
+    ("wotu", "wtw"),
+    ("woun meu", "noa"),
+    ("written oirat", "xwo"),
+    ("wu chinese", "wuu"),
+    ("wuding-luquan yi", "ywq"),
+    ("wudu", "wud"),
+    ("wuliwuli", "wlu"),
+    ("wulna", "wux"),
+    ("wumboko", "bqm"),
+    ("wumbvu", "wum"),
+    ("wumeng nasu", "ywu"),
+    ("wunai bunu", "bwn"),
+    ("wunambal", "wub"),
+    ("wunumara", "wnn"),
+    ("wurrugu", "wur"),
+    ("wusa nasu", "yig"),
+    ("wushi", "bse"),
+    ("wusi", "wsi"),
+    ("wutung", "wut"),
+    ("wutunhua", "wuh"),
+    ("wuvulu-aua", "wuv"),
+    ("wuzlam", "udl"),
+    ("wyandot", "wya"),
+    ("wymysorys", "wym"),
+    ("wára", "tci"),
+    ("wãpha", "juw"),
+    ("wè northern", "wob"),
+    ("wè southern", "gxx"),
+    ("wè western", "wec"),
+    ("xaasongaxango", "kao"),
+    ("xadani zapotec", "zax"),
+    ("xakriabá", "xkr"),
+    ("xal", "xal"),
+    ("xamtanga", "xan"),
+    ("xanaguía zapotec", "ztg"),
+    ("xavánte", "xav"),
+    ("xerénte", "xer"),
+    ("xetá", "xet"),
+    ("xh", "xho"),
+    ("xho", "xho"),
+    ("xhosa", "xho"),
+    ("xiang chinese", "hsn"),
+    ("xibe", "sjo"),
+    ("xicotepec de juárez totonac", "too"),
+    ("xinca", "xin"),
+    ("xingú asuriní", "asn"),
+    ("xipaya", "xiy"),
+    ("xiri", "xii"),
+    ("xiriâna", "xir"),
+    ("xishanba lalo", "ywt"),
+    ("xokleng", "xok"),
+    ("xukurú", "xoo"),
+    ("xwela gbe", "xwe"),
+    ("xârâcùù", "ane"),
+    ("xârâgurè", "axx"),
+    ("yaaku", "muu"),
+    ("yabarana", "yar"),
+    ("yabaâna", "ybn"),
+    ("yabem", "jae"),
+    ("yaben", "ybm"),
+    ("yabong", "ybo"),
+    ("yabula yabula", "yxy"),
+    ("yace", "ekr"),
+    ("yaeyama", "rys"),
+    ("yafi", "wfg"),
+    ("yagara", "yxg"),
+    ("yagaria", "ygr"),
+    ("yagnobi", "yai"),
+    ("yagomi", "ygm"),
+    ("yagua", "yad"),
+    ("yagwoia", "ygw"),
+    ("yahadian", "ner"),
+    ("yahang", "rhp"),
+    ("yahuna", "ynu"),
+    ("yaka (central african republic)", "axk"),
+    ("yaka (congo)", "iyx"),
+    ("yaka (democratic republic of congo)", "yaf"),
+    ("yakaikeke", "ykk"),
+    ("yakama", "yak"),
+    ("yakan", "yka"),
+    ("yakha", "ybh"),
+    ("yakoma", "yky"),
+    ("yakut", "sah"),
+    ("yala", "yba"),
+    ("yalahatan", "jal"),
+    ("yalakalore", "xyl"),
+    ("yalarnnga", "ylr"),
+    ("yale", "nce"),
+    ("yaleba", "ylb"),
+    ("yalunka", "yal"),
+    ("yalálag zapotec", "zpu"),
+    ("yamap", "ymp"),
+    ("yamba", "yam"),
+    ("yambes", "ymb"),
+    ("yambeta", "yat"),
+    ("yamdena", "jmd"),
+    ("yameo", "yme"),
+    ("yami", "tao"),
+    ("yaminahua", "yaa"),
+    ("yamna", "ymn"),
+    ("yamongeri", "ymg"),
+    ("yamphu", "ybi"),
+    ("yan-nhangu", "jay"),
+    ("yan-nhaŋu sign language", "yhs"),
+    ("yana", "ynn"),
+    ("yanahuanca pasco quechua", "qur"),
+    ("yanda", "yda"),
+    ("yanda dom dogon", "dym"),
+    ("yandjibara", "xyb"),
+    ("yandruwandha", "ynd"),
+    ("yanesha'", "ame"),
+    ("yang zhuang", "zyg"),
+    ("yangben", "yav"),
+    ("yangkam", "bsx"),
+    ("yangman", "jng"),
+    ("yango", "yng"),
+    ("yangulam", "ynl"),
+    ("yangum dey", "yde"),
+    ("yangum gel", "ygl"),
+    ("yangum mon", "ymo"),
+    ("yankunytjatjara", "kdd"),
+    ("yanomamö", "guu"),
+    ("yanomámi", "wca"),
+    ("yansi", "yns"),
+    ("yanyuwa", "jao"),
+    ("yao", "yao"),
+    ("yaosakor asmat", "asy"),
+    ("yaouré", "yre"),
+    ("yap", "yap"),
+    ("yapese", "yap"),
+    ("yapunda", "yev"),
+    ("yaqay", "jaq"),
+    ("yaqui", "yaq"),
+    ("yarawata", "yrw"),
+    ("yardliyawarra", "yxl"),
+    ("yareba", "yrb"),
+    ("yareni zapotec", "zae"),
+    ("yarluyandi", "yry"),
+    ("yaroamë", "yro"),
+    ("yarsun", "yrs"),
+    ("yasa", "yko"),
+    ("yassic", "ysc"),
+    ("yatay", "yty"),
+    ("yatee zapotec", "zty"),
+    ("yatzachi zapotec", "zav"),
+    ("yau (morobe province)", "yuw"),
+    ("yau (sandaun province)", "yyu"),
+    ("yaul", "yla"),
+    ("yauma", "yax"),
+    ("yaur", "jau"),
+    ("yautepec zapotec", "zpb"),
+    ("yauyos quechua", "qux"),
+    ("yavitero", "yvt"),
+    ("yawa", "yva"),
+    ("yawalapití", "yaw"),
+    ("yawanawa", "ywn"),
+    ("yawarawarga", "yww"),
+    ("yaweyuha", "yby"),
+    ("yawijibaya", "jbw"),
+    ("yawiyo", "ybx"),
+    ("yawuru", "ywr"),
+    ("yaygir", "xya"),
+    ("yazgulyam", "yah"),
+    ("yecuatla totonac", "tlc"),
+    ("yekhee", "ets"),
+    ("yekora", "ykr"),
+    ("yela", "yel"),
+    ("yele", "yle"),
+    ("yelmek", "jel"),
+    ("yelogu", "ylg"),
+    ("yemba", "ybb"),
+    ("yemsa", "jnj"),
+    ("yendang", "ynq"),
+    ("yeni", "yei"),
+    ("yeniche", "yec"),
+    ("yerakai", "yra"),
+    ("yeretuar", "gop"),
+    ("yerong", "yrn"),
+    ("yerukula", "yeu"),
+    ("yessan-mayo", "yss"),
+    ("yetfa", "yet"),
+    ("yevanic", "yej"),
+    ("yeyi", "yey"),
+    ("yi", "yid"),
+    ("yid", "yid"),
+    ("yiddish", "yid"),
+    ("yidgha", "ydg"),
+    ("yidiny", "yii"),
+    ("yimas", "yee"),
+    ("yimchungru naga", "yim"),
+    ("yinbaw karen", "kvu"),
+    ("yindjibarndi", "yij"),
+    ("yindjilandji", "yil"),
+    ("yine", "pib"),
+    ("yinggarda", "yia"),
+    ("yinhawangka", "ywg"),
+    ("yiningayi", "ygi"),
+    ("yintale karen", "kvy"),
+    ("yinwum", "yxm"),
+    ("yir yoront", "yyr"),
+    ("yirandali", "ljw"),
+    ("yirrk-mel", "yrm"),
+    ("yitha yitha", "xth"),
+    ("yo", "yor"),
+    ("yoba", "yob"),
+    ("yocoboué dida", "gud"),
+    ("yogad", "yog"),
+    ("yoidik", "ydk"),
+    ("yoke", "yki"),
+    ("yokuts", "yok"),
+    ("yola", "yol"),
+    ("yoloxochitl mixtec", "xty"),
+    ("yolŋu sign language", "ygs"),
+    ("yombe", "yom"),
+    ("yonaguni", "yoi"),
+    ("yong", "yno"),
+    ("yongbei zhuang", "zyb"),
+    ("yongkom", "yon"),
+    ("yongnan zhuang", "zyn"),
+    ("yopno", "yut"),
+    ("yor", "yor"),
+    ("yora", "mts"),
+    ("yoron", "yox"),
+    ("yorta yorta", "xyy"),
+    ("yoruba", "yor"),
+    ("yorùbá", "yor"),
+    ("yosondúa mixtec", "mpm"),
+    ("yotti", "yot"),
+    ("youjiang zhuang", "zyj"),
+    ("youle jinuo", "jiu"),
+    ("younuo bunu", "buh"),
+    ("yout wam", "ytw"),
+    ("yuanga", "nua"),
+    ("yucatec maya sign language", "msd"),
+    ("yucateco", "yua"),
+    ("yuchi", "yuc"),
+    ("yucuañe mixtec", "mvg"),
+    ("yucuna", "ycn"),
+    ("yue chinese", "yue"),
+    ("yugambal", "yub"),
+    ("yugoslavian sign language", "ysl"),
+    ("yugul", "ygu"),
+    ("yuhup", "yab"),
+    ("yuki", "yuk"),
+    ("yukpa", "yup"),
+    ("yukuben", "ybl"),
+    ("yulu", "yul"),
+    ("yuqui", "yuq"),
+    ("yuracare", "yuz"),
+    ("yurats", "rts"),
+    ("yurok", "yur"),
+    ("yuru", "ljx"),
+    ("yurutí", "yui"),
+    ("yutanduchi mixtec", "mab"),
+    ("yuwana", "yau"),
+    ("yuyu", "yxu"),
+    ("ywom", "gek"),
+    ("yámana", "yag"),
+    ("za", "zha"),
+    ("zaachila zapotec", "ztx"),
+    ("zabana", "kji"),
+    ("zacatepec chatino", "ctz"),
+    ("zacatlán-ahuacatlán-tepetzintla nahuatl", "nhi"),
+    ("zaghawa", "zag"),
+    ("zaiwa", "atb"),
+    ("zakhring", "zkr"),
+    ("zambian sign language", "zsl"),
+    ("zan gula", "zna"),
+    ("zanaki", "zak"),
+    ("zande (individual language)", "zne"),
+    ("zangskari", "zau"),
+    ("zangwal", "zah"),
+    ("zaniza zapotec", "zpw"),
+    ("zap", "zap"),
+    ("zapotec", "zap"),
+    ("zaramo", "zaj"),
+    ("zari", "zaz"),
+    ("zarma", "dje"),
+    ("zarphatic", "zrp"),
+    ("zauzou", "zal"),
+    ("zayein karen", "kxk"),
+    ("zayse-zergulla", "zay"),
+    ("zaza", "zza"),
+    ("zazao", "jaj"),
+    ("zbl", "zbl"),
+    ("zeem", "zua"),
+    ("zeeuws", "zea"),
+    ("zemba", "dhm"),
+    ("zeme naga", "nzm"),
+    ("zemgalian", "xzm"),
+    ("zen", "zen"),
+    ("zenag", "zeg"),
+    ("zenaga", "zen"),
+    ("zenzontepec chatino", "czn"),
+    ("zerenkel", "zrn"),
+    ("zgh", "zgh"),
+    ("zh", "zho"),
+    ("zha", "zha"),
+    ("zhaba", "zhb"),
+    ("zhang-zhung", "xzh"),
+    ("zhire", "zhi"),
+    ("zho", "zho"),
+    ("zhoa", "zhw"),
+    ("zhuang", "zha"),
+    ("zialo", "zil"),
+    ("zigula", "ziw"),
+    ("zimakani", "zik"),
+    ("zimba", "zmb"),
+    ("zimbabwe sign language", "zib"),
+    ("zinza", "zin"),
+    ("zire", "sih"),
+    ("zizilivakan", "ziz"),
+    ("zo'é", "pto"),
+    ("zokhuo", "yzk"),
+    ("zoogocho zapotec", "zpq"),
+    ("zoroastrian dari", "gbz"),
+    ("zotung chin", "czt"),
+    ("zu", "zul"),
+    ("zul", "zul"),
+    ("zula", "zla"),
+    ("zulgo-gemzek", "gnd"),
+    ("zulu", "zul"),
+    ("zumaya", "zuy"),
+    ("zumbun", "jmb"),
+    ("zun", "zun"),
+    ("zuni", "zun"),
+    ("zuojiang zhuang", "zzj"),
+    ("zxx", "zxx"),
+    ("zyphe chin", "zyp"),
+    ("zza", "zza"),
+    ("záparo", "zro"),
+    ("àhàn", "ahn"),
+    ("áncá", "acb"),
+    ("árabe", "ara"),
+    ("íslenska", "isl"),
+    ("ömie", "aom"),
+    ("önge", "oon"),
+    ("čeština", "ces"),
+    ("ǀgwi", "gwj"),
+    ("ǀxam", "xam"),
+    ("ǁani", "hnh"),
+    ("ǁgana", "gnk"),
+    ("ǁxegwi", "xeg"),
+    ("ǂhua", "huc"),
+    ("ǂungkue", "gku"),
+    ("ǃxóõ", "nmn"),
+    ("ελληνικά", "ell"),
+    ("азербайджанский язык", "aze"),
+    ("азербайджанська мова", "aze"),
+    ("албанский язык", "sqi"),
+    ("албанська мова", "sqi"),
+    ("амхарский язык", "amh"),
+    ("амхарська мова", "amh"),
+    ("английский язык", "eng"),
+    ("англійська мова", "eng"),
+    ("арабский язык", "ara"),
+    ("арабська мова", "ara"),
+    ("армянский язык", "hye"),
+    ("африкаанс", "afr"),
+    ("белорусский язык", "bel"),
+    ("бенгальский язык", "ben"),
+    ("бенгальська мова", "ben"),
+    ("бирманский язык", "mya"),
+    ("болгарский язык", "bul"),
+    ("болгарська мова", "bul"),
+    ("боснийский язык", "bos"),
+    ("боснійська мова", "bos"),
+    ("български", "bul"),
+    ("білоруська мова", "bel"),
+    ("бірманська мова", "mya"),
+    ("в'єтнамська", "vie"),
+    ("венгерский язык", "hun"),
+    ("вьетнамский язык", "vie"),
+    ("вірменська мова", "hye"),
+    ("грузинский язык", "kat"),
+    ("грузинська мова", "kat"),
+    ("гінді", "hin"),
+    ("данська мова", "dan"),
+    ("датский язык", "dan"),
+    ("естонська мова", "est"),
+    ("иврит", "heb"),
+    ("индонезийский язык", "ind"),
+    ("ирландский язык", "gle"),
+    ("исландский язык", "isl"),
+    ("испанский язык", "spa"),
+    ("итальянский язык", "ita"),
+    ("казахский язык", "kaz"),
+    ("казахська мова", "kaz"),
+    ("каннада", "kan"),
+    ("каталанский язык", "cat"),
+    ("каталанська мова", "cat"),
+    ("киргизский язык", "kir"),
+    ("киргизька мова", "kir"),
+    ("китайский язык", "zho"),
+    ("китайська мова", "zho"),
+    ("корейский язык", "kor"),
+    ("корейська мова", "kor"),
+    ("кхмерский язык", "khm"),
+    ("кхмерська мова", "khm"),
+    ("лаосский язык", "lao"),
+    ("лаоська мова", "lao"),
+    ("латиська мова", "lav"),
+    ("латышский язык", "lav"),
+    ("литовский язык", "lit"),
+    ("литовська мова", "lit"),
+    ("люксембургский язык", "ltz"),
+    ("люксембурзька мова", "ltz"),
+    ("македонски", "mkd"),
+    ("македонский язык", "mkd"),
+    ("македонська мова", "mkd"),
+    ("малайский язык", "msa"),
+    ("малайська мова", "msa"),
+    ("мальтийский язык", "mlt"),
+    ("мальтійська мова", "mlt"),
+    ("монгол хэл", "mon"),
+    ("монгольский язык", "mon"),
+    ("монгольська мова", "mon"),
+    ("немецкий язык", "deu"),
+    ("непальский язык", "nep"),
+    ("непальська мова", "nep"),
+    ("нидерландский язык", "nld"),
+    ("новогрецька мова", "ell"),
+    ("новогреческий язык", "ell"),
+    ("норвежский язык", "nor"),
+    ("норвезька мова", "nor"),
+    ("нідерландська мова", "nld"),
+    ("німецька мова", "deu"),
+    ("персидский язык", "fas"),
+    ("перська мова", "fas"),
+    ("польский язык", "pol"),
+    ("польська мова", "pol"),
+    ("португальский язык", "por"),
+    ("португальська мова", "por"),
+    ("пушту", "pus"),
+    ("російська мова", "rus"),
+    ("румунська мова", "ron"),
+    ("румынский язык", "ron"),
+    ("русский", "rus"),
+    ("русский язык", "rus"),
+    ("сербский язык", "srp"),
+    ("сербська мова", "srp"),
+    ("сингальский язык", "sin"),
+    ("сингальська мова", "sin"),
+    ("словацкий язык", "slk"),
+    ("словацька мова", "slk"),
+    ("словенский язык", "slv"),
+    ("словенська мова", "slv"),
+    ("српски", "srp"),
+    ("стандартный таджикский язык", "tgk"),
+    ("суахили", "swa"),
+    ("суахілі", "swa"),
+    ("тагальский язык", "tgl"),
+    ("тагальська мова", "tgl"),
+    ("таджицька мова", "tgk"),
+    ("тайский язык", "tha"),
+    ("тайська мова", "tha"),
+    ("тамильский язык", "tam"),
+    ("тамільська мова", "tam"),
+    ("телугу", "tel"),
+    ("тоҷикӣ", "tgk"),
+    ("турецкий язык", "tur"),
+    ("турецька мова", "tur"),
+    ("туркменский язык", "tuk"),
+    ("туркменська мова", "tuk"),
+    ("угорська мова", "hun"),
+    ("узбекский язык", "uzb"),
+    ("узбецька мова", "uzb"),
+    ("украинский язык", "ukr"),
+    ("українська", "ukr"),
+    ("українська мова", "ukr"),
+    ("урду", "urd"),
+    ("филиппинский язык", "fil"),
+    ("финский язык", "fin"),
+    ("французский язык", "fra"),
+    ("французька мова", "fra"),
+    ("філіппінська", "fil"),
+    ("фінська мова", "fin"),
+    ("хинди", "hin"),
+    ("хорватский язык", "hrv"),
+    ("хорватська мова", "hrv"),
+    ("черногорский язык", "cnr"),
+    ("чеська мова", "ces"),
+    ("чешский язык", "ces"),
+    ("чорногорська мова", "cnr"),
+    ("шведский язык", "swe"),
+    ("шведська мова", "swe"),
+    ("эстонский язык", "est"),
+    ("японский язык", "jpn"),
+    ("японська мова", "jpn"),
+    ("іврит", "heb"),
+    ("індонезійська мова", "ind"),
+    ("ірландська мова", "gle"),
+    ("ісландська мова", "isl"),
+    ("іспанська мова", "spa"),
+    ("італійська мова", "ita"),
+    ("ўзбек тили", "uzb"),
+    ("қазақша", "kaz"),
+    ("հայերեն", "hye"),
+    ("עברית", "heb"),
+    ("اردو", "urd"),
+    ("الآيسلندية", "isl"),
+    ("الأذرية", "aze"),
+    ("الأردية", "urd"),
+    ("الأرمنية", "hye"),
+    ("الأفريقانية", "afr"),
+    ("الألبانية", "sqi"),
+    ("الألمانية", "deu"),
+    ("الأمهرية", "amh"),
+    ("الأوزبكية", "uzb"),
+    ("الأوكرانية", "ukr"),
+    ("الأيرلندية", "gle"),
+    ("الإسبانية", "spa"),
+    ("الإستونية", "est"),
+    ("الإنجليزية", "eng"),
+    ("الإندونيسية", "ind"),
+    ("الإيطالية", "ita"),
+    ("البرتغالية", "por"),
+    ("البشتوية", "pus"),
+    ("البلغارية", "bul"),
+    ("البنغالية", "ben"),
+    ("البورمية", "mya"),
+    ("البوسنية", "bos"),
+    ("البولندية", "pol"),
+    ("البيلاروسية", "bel"),
+    ("التاغالوغية", "tgl"),
+    ("التايلندية", "tha"),
+    ("التركمانية", "tuk"),
+    ("التركية", "tur"),
+    ("التشيكية", "ces"),
+    ("التملية", "tam"),
+    ("التيلوغوية", "tel"),
+    ("الجورجية", "kat"),
+    ("الخميرية", "khm"),
+    ("الدنماركية", "dan"),
+    ("الروسية", "rus"),
+    ("الرومانية", "ron"),
+    ("السلوفاكية", "slk"),
+    ("السلوفينية", "slv"),
+    ("السنهالية", "sin"),
+    ("السواحلية", "swa"),
+    ("السويدية", "swe"),
+    ("الصربية", "srp"),
+    ("الصينية", "zho"),
+    ("الطاجيكية", "tgk"),
+    ("العبرية الحديثة", "heb"),
+    ("العربية", "ara"),
+    ("الفارسية", "fas"),
+    ("الفرنسية", "fra"),
+    ("الفلبينية", "fil"),
+    ("الفنلندية", "fin"),
+    ("الفيتنامية", "vie"),
+    ("القرغيزية", "kir"),
+    ("القزاقية", "kaz"),
+    ("الكتالونية", "cat"),
+    ("الكرواتية", "hrv"),
+    ("الكنادية", "kan"),
+    ("الكورية", "kor"),
+    ("اللاتفية", "lav"),
+    ("اللتوانية", "lit"),
+    ("اللوكسمبورغية", "ltz"),
+    ("المالطية", "mlt"),
+    ("المجرية", "hun"),
+    ("المغولية", "mon"),
+    ("المقدونية", "mkd"),
+    ("الملايوية", "msa"),
+    ("المونتنغرية", "cnr"),
+    ("النرويجية", "nor"),
+    ("النيبالية", "nep"),
+    ("الهندية", "hin"),
+    ("الهولندية", "nld"),
+    ("اليابانية", "jpn"),
+    ("اليونانية الحديثة", "ell"),
+    ("فارسی", "fas"),
+    ("لاو", "lao"),
+    ("پښتو", "pus"),
+    ("नेपाली", "nep"),
+    ("मराठी", "mar"),
+    ("हिंदी", "hin"),
+    ("বাংলা", "ben"),
+    ("ਪੰਜਾਬੀ", "pan"),
+    ("ગુજરાતી", "guj"),
+    ("தமிழ்", "tam"),
+    ("తెలుగు", "tel"),
+    ("ಕನ್ನಡ", "kan"),
+    ("മലയാളം", "mal"),
+    ("සිංහල", "sin"),
+    ("ภาษาไทย", "tha"),
+    ("ລາວ", "lao"),
+    ("မြန်မာ", "mya"),
+    ("ქართული", "kat"),
+    ("አማርኛ", "amh"),
+    ("ខ្មែរ", "khm"),
+    ("中文", "zho"),
+    ("丹麦语", "dan"),
+    ("乌克兰语", "ukr"),
+    ("乌兹别克语", "uzb"),
+    ("乌尔都语", "urd"),
+    ("亞美尼亞語", "hye"),
+    ("他加祿語", "tgl"),
+    ("俄語", "rus"),
+    ("保加利亞語", "bul"),
+    ("僧伽罗语", "sin"),
+    ("克罗地亚语", "hrv"),
+    ("冰島語", "isl"),
+    ("加泰罗尼亚语", "cat"),
+    ("匈牙利語", "hun"),
+    ("卡纳达语", "kan"),
+    ("卢森堡语", "ltz"),
+    ("印地語", "hin"),
+    ("印尼語", "ind"),
+    ("哈薩克語", "kaz"),
+    ("土库曼语", "tuk"),
+    ("土耳其語", "tur"),
+    ("塔吉克语", "tgk"),
+    ("塞尔维亚语", "srp"),
+    ("孟加拉语", "ben"),
+    ("尼泊尔语", "nep"),
+    ("德语", "deu"),
+    ("意大利語", "ita"),
+    ("愛沙尼亞語", "est"),
+    ("拉脫維亞語", "lav"),
+    ("挪威語", "nor"),
+    ("捷克語", "ces"),
+    ("斯洛伐克語", "slk"),
+    ("斯洛文尼亚语", "slv"),
+    ("斯瓦希里語", "swa"),
+    ("日本語", "jpn"),
+    ("日語", "jpn"),
+    ("普什圖語", "pus"),
+    ("朝鮮語", "kor"),
+    ("柯尔克孜语", "kir"),
+    ("格鲁吉亚语", "kat"),
+    ("法语", "fra"),
+    ("波斯尼亚语", "bos"),
+    ("波斯語", "fas"),
+    ("波蘭語", "pol"),
+    ("泰卢固语", "tel"),
+    ("泰米爾語", "tam"),
+    ("泰語", "tha"),
+    ("爱尔兰语", "gle"),
+    ("现代希腊语", "ell"),
+    ("現代希伯來語", "heb"),
+    ("瑞典語", "swe"),
+    ("白俄罗斯语", "bel"),
+    ("立陶宛語", "lit"),
+    ("缅甸语", "mya"),
+    ("羅馬尼亞語", "ron"),
+    ("老挝语", "lao"),
+    ("芬兰语", "fin"),
+    ("英語", "eng"),
+    ("荷蘭語", "nld"),
+    ("菲律賓語", "fil"),
+    ("葡萄牙语", "por"),
+    ("蒙古语", "mon"),
+    ("蒙特內哥羅語", "cnr"),
+    ("西班牙語", "spa"),
+    ("越南语", "vie"),
+    ("阿塞拜疆语", "aze"),
+    ("阿姆哈拉语", "amh"),
+    ("阿拉伯语", "ara"),
+    ("阿爾巴尼亞語", "sqi"),
+    ("阿非利卡语", "afr"),
+    ("马其顿语", "mkd"),
+    ("马来语", "msa"),
+    ("马耳他语", "mlt"),
+    ("高棉语", "khm"),
+    ("한국어", "kor"),
+];
+
+/// ISO 639-3 → ISO 639-1 code.
+pub(crate) static ISO2_MAP: &[(&str, &str)] = &[
+    ("aar", "aa"),
+    ("abk", "ab"),
+    ("afr", "af"),
+    ("aka", "ak"),
+    ("amh", "am"),
+    ("ara", "ar"),
+    ("arg", "an"),
+    ("asm", "as"),
+    ("ava", "av"),
+    ("ave", "ae"),
+    ("aym", "ay"),
+    ("aze", "az"),
+    ("bak", "ba"),
+    ("bam", "bm"),
+    ("bel", "be"),
+    ("ben", "bn"),
+    ("bis", "bi"),
+    ("bod", "bo"),
+    ("bos", "bs"),
+    ("bre", "br"),
+    ("bul", "bg"),
+    ("cat", "ca"),
+    ("ces", "cs"),
+    ("cha", "ch"),
+    ("che", "ce"),
+    ("chu", "cu"),
+    ("chv", "cv"),
+    ("cor", "kw"),
+    ("cos", "co"),
+    ("cre", "cr"),
+    ("cym", "cy"),
+    ("dan", "da"),
+    ("deu", "de"),
+    ("div", "dv"),
+    ("dzo", "dz"),
+    ("ell", "el"),
+    ("eng", "en"),
+    ("epo", "eo"),
+    ("est", "et"),
+    ("eus", "eu"),
+    ("ewe", "ee"),
+    ("fao", "fo"),
+    ("fas", "fa"),
+    ("fij", "fj"),
+    ("fin", "fi"),
+    ("fra", "fr"),
+    ("fry", "fy"),
+    ("ful", "ff"),
+    ("gla", "gd"),
+    ("gle", "ga"),
+    ("glg", "gl"),
+    ("glv", "gv"),
+    ("grn", "gn"),
+    ("guj", "gu"),
+    ("hat", "ht"),
+    ("hau", "ha"),
+    ("hbs", "sh"),
+    ("heb", "he"),
+    ("her", "hz"),
+    ("hin", "hi"),
+    ("hmo", "ho"),
+    ("hrv", "hr"),
+    ("hun", "hu"),
+    ("hye", "hy"),
+    ("ibo", "ig"),
+    ("ido", "io"),
+    ("iii", "ii"),
+    ("iku", "iu"),
+    ("ile", "ie"),
+    ("ina", "ia"),
+    ("ind", "id"),
+    ("ipk", "ik"),
+    ("isl", "is"),
+    ("ita", "it"),
+    ("jav", "jv"),
+    ("jpn", "ja"),
+    ("kal", "kl"),
+    ("kan", "kn"),
+    ("kas", "ks"),
+    ("kat", "ka"),
+    ("kau", "kr"),
+    ("kaz", "kk"),
+    ("khm", "km"),
+    ("kik", "ki"),
+    ("kin", "rw"),
+    ("kir", "ky"),
+    ("kom", "kv"),
+    ("kon", "kg"),
+    ("kor", "ko"),
+    ("kua", "kj"),
+    ("kur", "ku"),
+    ("lao", "lo"),
+    ("lat", "la"),
+    ("lav", "lv"),
+    ("lim", "li"),
+    ("lin", "ln"),
+    ("lit", "lt"),
+    ("ltz", "lb"),
+    ("lub", "lu"),
+    ("lug", "lg"),
+    ("mah", "mh"),
+    ("mal", "ml"),
+    ("mar", "mr"),
+    ("mkd", "mk"),
+    ("mlg", "mg"),
+    ("mlt", "mt"),
+    ("mon", "mn"),
+    ("mri", "mi"),
+    ("msa", "ms"),
+    ("mya", "my"),
+    ("nau", "na"),
+    ("nav", "nv"),
+    ("nbl", "nr"),
+    ("nde", "nd"),
+    ("ndo", "ng"),
+    ("nep", "ne"),
+    ("nld", "nl"),
+    ("nno", "nn"),
+    ("nob", "nb"),
+    ("nor", "no"),
+    ("nya", "ny"),
+    ("oci", "oc"),
+    ("oji", "oj"),
+    ("ori", "or"),
+    ("orm", "om"),
+    ("oss", "os"),
+    ("pan", "pa"),
+    ("pli", "pi"),
+    ("pol", "pl"),
+    ("por", "pt"),
+    ("pus", "ps"),
+    ("que", "qu"),
+    ("roh", "rm"),
+    ("ron", "ro"),
+    ("run", "rn"),
+    ("rus", "ru"),
+    ("sag", "sg"),
+    ("san", "sa"),
+    ("sin", "si"),
+    ("slk", "sk"),
+    ("slv", "sl"),
+    ("sme", "se"),
+    ("smo", "sm"),
+    ("sna", "sn"),
+    ("snd", "sd"),
+    ("som", "so"),
+    ("sot", "st"),
+    ("spa", "es"),
+    ("sqi", "sq"),
+    ("srd", "sc"),
+    ("srp", "sr"),
+    ("ssw", "ss"),
+    ("sun", "su"),
+    ("swa", "sw"),
+    ("swe", "sv"),
+    ("tah", "ty"),
+    ("tam", "ta"),
+    ("tat", "tt"),
+    ("tel", "te"),
+    ("tgk", "tg"),
+    ("tgl", "tl"),
+    ("tha", "th"),
+    ("tir", "ti"),
+    ("ton", "to"),
+    ("tsn", "tn"),
+    ("tso", "ts"),
+    ("tuk", "tk"),
+    ("tur", "tr"),
+    ("twi", "tw"),
+    ("uig", "ug"),
+    ("ukr", "uk"),
+    ("urd", "ur"),
+    ("uzb", "uz"),
+    ("ven", "ve"),
+    ("vie", "vi"),
+    ("vol", "vo"),
+    ("wln", "wa"),
+    ("wol", "wo"),
+    ("xho", "xh"),
+    ("yid", "yi"),
+    ("yor", "yo"),
+    ("zha", "za"),
+    ("zho", "zh"),
+    ("zul", "zu"),
+];
+
+/// Codes that are not a language (`rigour.langs.synonyms.NON_LANGS`).
+pub(crate) static NON_LANGS: &[&str] = &["mis", "mul", "und", "xzz", "zxx"];
+
+/// Synonym groups (`rigour.langs.synonyms.LANG_SYNONYMS`), in order.
+pub(crate) static SYNONYMS: &[&[&str]] = &[
+    &["srp", "hbs", "hrv", "bos"],
+    &["sqi", "alb"],
+    &["slk", "slo"],
+    &["ron", "rum"],
+    &["nld", "dut"],
+    &["mya", "bur"],
+    &["msa", "may"],
+    &["mkd", "mac"],
+    &["kat", "geo"],
+    &["isl", "ice"],
+    &["isl", "ice"],
+    &["fre", "fra"],
+    &["fas", "per"],
+    &["eus", "baq"],
+    &["ell", "gre"],
+    &["ger", "deu"],
+    &["wel", "cym"],
+    &["chi_sim", "chi_tra", "chi", "zho"],
+    &["ces", "cze"],
+    &["bod", "tib"],
+    &["aze_cyrl", "aze"],
+    &["fil", "tgl"],
+    &["nep", "npi"],
+];
@@ -0,0 +1,140 @@
+// Identifier validation and normalisation — the batch path behind
+// `rigour.ids.normalize_identifiers` / `validate_identifiers`.
+//
+// Every format except `strict` (which transliterates through
+// normality) has a port here that agrees with its `IdentifierFormat`
+// class value for value: the python-stdnum validators in `stdnum.rs`,
+// the formats rigour defines itself in `formats.rs`. Both rest on
+// `pystr.rs`, which reproduces the Python string and regex semantics
+// the originals lean on — Unicode `\d` and `\w`, `str.strip()`,
+// `int()` over any script's digits.
+//
+// One gap is left to the caller: for a few countries stdnum runs a
+// national check on the account number inside an IBAN (`iban.py`'s
+// `check_country`). The Python wrapper re-checks the IBANs of those
+// countries with stdnum.
+//
+// The stdnum lookup tables (look-alike characters, ISIN and BIC
+// country codes, IBAN BBAN structures) live in
+// `generated/stdnum.rs`, emitted by `genscripts/generate_ids.py`
+// from the installed python-stdnum. They are frozen at that release
+// (`STDNUM_VERSION`); the Python wrapper defers to the formats
+// themselves when another python-stdnum is installed.
+
+pub mod formats;
+pub mod pystr;
+pub mod stdnum;
+
+#[rustfmt::skip]
+#[path = "generated/stdnum.rs"]
+mod tables;
+
+pub use tables::STDNUM_VERSION;
+
+/// An identifier format, as named by `IdentifierFormat.NAME`.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum Format {
+    Generic,
+    Wikidata,
+    Ogrn,
+    Imo,
+    Isin,
+    Iban,
+    Figi,
+    Bic,
+    Inn,
+    Npi,
+    Lei,
+    Uei,
+    Ssn,
+    Cpf,
+    Cnpj,
+    Uscc,
+}
+
+impl Format {
+    /// The format with the given canonical name; aliases are resolved
+    /// on the Python side.
+    pub fn from_name(name: &str) -> Option<Format> {
+        let format = match name {
+            "generic" => Format::Generic,
+            "wikidata" => Format::Wikidata,
+            "ogrn" => Format::Ogrn,
+            "imo" => Format::Imo,
+            "isin" => Format::Isin,
+            "iban" => Format::Iban,
+            "figi" => Format::Figi,
+            "bic" => Format::Bic,
+            "inn" => Format::Inn,
+            "npi" => Format::Npi,
+            "lei" => Format::Lei,
+            "uei" => Format::Uei,
+            "ssn" => Format::Ssn,
+            "cpf" => Format::Cpf,
+            "cnpj" => Format::Cnpj,
+            "uscc" => Format::Uscc,
+            _ => return None,
+        };
+        Some(format)
+    }
+
+    /// `IdentifierFormat.normalize`. For the stdnum formats this is
+    /// the validated, compact number.
+    pub fn normalize(self, value: &str) -> Option<String> {
+        match self {
+            Format::Generic => Some(pystr::strip(value).to_string()),
+            Format::Wikidata => formats::normalize_wikidata(value),
+            Format::Ogrn => formats::normalize_ogrn(value),
+            Format::Imo => formats::normalize_imo(value),
+            Format::Npi => formats::normalize_npi(value),
+            Format::Uei => formats::normalize_uei(value),
+            Format::Isin => stdnum::validate_isin(value),
+            Format::Iban => stdnum::validate_iban(value),
+            Format::Figi => stdnum::validate_figi(value),
+            Format::Bic => stdnum::normalize_bic(value),
+            Format::Inn => stdnum::validate_inn(value),
+            Format::Lei => stdnum::validate_lei(value),
+            Format::Ssn => stdnum::validate_ssn(value),
+            Format::Cpf => stdnum::validate_cpf(value),
+            Format::Cnpj => stdnum::validate_cnpj(value),
+            Format::Uscc => stdnum::validate_uscc(value),
+        }
+    }
+
+    /// `IdentifierFormat.is_valid`.
+    pub fn is_valid(self, value: &str) -> bool {
+        match self {
+            Format::Generic => !pystr::strip(value).is_empty(),
+            Format::Wikidata => formats::is_valid_wikidata(value),
+            Format::Ogrn => formats::is_valid_ogrn(value),
+            Format::Npi => formats::is_valid_npi(value),
+            Format::Uei => formats::is_valid_uei(value),
+            _ => self.normalize(value).is_some(),
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn formats_by_name() {
+        assert_eq!(Format::from_name("isin"), Some(Format::Isin));
+        assert_eq!(Format::from_name("strict"), None);
+        assert_eq!(Format::from_name("qid"), None);
+    }
+
+    #[test]
+    fn generic() {
+        assert_eq!(Format::Generic.normalize(" abc\n").unwrap(), "abc");
+        assert!(!Format::Generic.is_valid(" \t"));
+    }
+
+    #[test]
+    fn bic_is_truncated() {
+        let bic = Format::Bic.normalize("DEUTDEFF500").unwrap();
+        assert_eq!(bic, "DEUTDEFF");
+        assert!(Format::Bic.is_valid("DEUTDEFF500"));
+    }
+}
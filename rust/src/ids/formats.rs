@@ -0,0 +1,309 @@
+// The identifier formats `rigour.ids` implements itself rather than
+// through python-stdnum: OGRN, NPI, UEI, IMO and Wikidata QIDs.
+//
+// Most of them pull the identifier out of a longer text with a
+// regex — `\b(\d{13}|\d{15})\b` and the like — and the matching here
+// walks the characters the way Python's `re` would: `\d` and `\w` are
+// the Unicode classes, and a match is only tried where the one before
+// it failed. Inputs are held as `char` slices so offsets and lengths
+// count characters, as Python's do.
+
+use std::cmp::Reverse;
+
+use super::pystr::{digit_value, is_digit, is_space, is_word, parse_int, strip};
+
+/// Length of the run of `\d` at `start`, counting no further than
+/// `limit`.
+fn digit_run(text: &[char], start: usize, limit: usize) -> usize {
+    text[start..]
+        .iter()
+        .take(limit)
+        .take_while(|c| is_digit(**c))
+        .count()
+}
+
+/// `\b(\d{a}|\d{b})\b` tried at `start`: the length of the match.
+fn match_digits(text: &[char], start: usize, lengths: &[usize]) -> Option<usize> {
+    if start > 0 && is_word(text[start - 1]) {
+        return None;
+    }
+    let longest = lengths.iter().max().copied().unwrap_or_default();
+    let run = digit_run(text, start, longest + 1);
+    lengths
+        .iter()
+        .copied()
+        .find(|&len| run >= len && text.get(start + len).is_none_or(|c| !is_word(*c)))
+}
+
+/// The leftmost match of `\b(\d{a}|\d{b})\b`.
+fn search_digits<'a>(text: &'a [char], lengths: &[usize]) -> Option<&'a [char]> {
+    (0..text.len())
+        .find_map(|start| match_digits(text, start, lengths).map(|len| &text[start..start + len]))
+}
+
+fn ogrn_valid(text: &[char]) -> bool {
+    if match_digits(text, 0, &[13, 15]).is_none() || text[0] == '0' {
+        return false;
+    }
+    // The check digit is the last character of the text, and the
+    // number the text up to it: both can run past the match, where
+    // `int()` either skips whitespace or raises.
+    let Some(control) = parse_int(&text[text.len() - 1..]) else {
+        return false;
+    };
+    let (digits, modulus) = match text.len() {
+        13 => (12, 11),
+        15 => (14, 13),
+        _ => return false,
+    };
+    let Some(number) = parse_int(&text[..digits]) else {
+        return false;
+    };
+    let expected = match number % modulus {
+        10 => 0,
+        rest => rest,
+    };
+    control == expected
+}
+
+/// `OGRN.is_valid`. Texts on which it raises are invalid here.
+pub fn is_valid_ogrn(text: &str) -> bool {
+    ogrn_valid(&text.chars().collect::<Vec<_>>())
+}
+
+pub fn normalize_ogrn(text: &str) -> Option<String> {
+    let chars: Vec<char> = text.chars().collect();
+    let value = search_digits(&chars, &[13, 15])?;
+    ogrn_valid(value).then(|| value.iter().collect())
+}
+
+const NPI_INVALID: &[&str] = &["0000000000", "000000000000000", "808400000000000"];
+
+/// `stdnum.luhn.is_valid` over decimal digits.
+fn luhn(number: &[char]) -> bool {
+    if number.is_empty() || !number.iter().all(char::is_ascii_digit) {
+        return false;
+    }
+    let total: u32 = number
+        .iter()
+        .rev()
+        .enumerate()
+        .map(|(i, c)| {
+            let value = *c as u32 - '0' as u32;
+            if i % 2 == 0 {
+                value
+            } else {
+                (value * 2) / 10 + (value * 2) % 10
+            }
+        })
+        .sum();
+    total % 10 == 0
+}
+
+fn npi_valid(text: &[char]) -> bool {
+    if match_digits(text, 0, &[10, 15]).is_none() {
+        return false;
+    }
+    let value: String = text.iter().collect();
+    if NPI_INVALID.contains(&value.as_str()) {
+        return false;
+    }
+    if text.len() == 10 {
+        let prefixed: Vec<char> = "80840".chars().chain(text.iter().copied()).collect();
+        return luhn(&prefixed);
+    }
+    luhn(text)
+}
+
+pub fn is_valid_npi(text: &str) -> bool {
+    npi_valid(&text.chars().collect::<Vec<_>>())
+}
+
+pub fn normalize_npi(text: &str) -> Option<String> {
+    let chars: Vec<char> = text.chars().collect();
+    let value = search_digits(&chars, &[10, 15])?;
+    npi_valid(value).then(|| value.iter().collect())
+}
+
+const UEI_LENGTH: usize = 12;
+
+/// `[0-9ABCDEFGHJKLMNPQRSTUVWXYZ]` under `re.IGNORECASE`, which also
+/// takes the long s and the Kelvin sign, as case variants of S and K.
+fn is_uei_char(c: char) -> bool {
+    let upper = c.to_ascii_uppercase();
+    matches!(upper, '0'..='9' | 'A'..='H' | 'J'..='N' | 'P'..='Z') || c == 'ſ' || c == 'K'
+}
+
+fn match_uei(text: &[char], start: usize) -> Option<&[char]> {
+    if start > 0 && is_word(text[start - 1]) {
+        return None;
+    }
+    let end = start + UEI_LENGTH;
+    let value = text.get(start..end)?;
+    if !value.iter().all(|c| is_uei_char(*c)) {
+        return None;
+    }
+    text.get(end).is_none_or(|c| !is_word(*c)).then_some(value)
+}
+
+pub fn is_valid_uei(text: &str) -> bool {
+    let chars: Vec<char> = strip(text).chars().collect();
+    chars.len() == UEI_LENGTH && match_uei(&chars, 0).is_some() && chars[0] != '0'
+}
+
+pub fn normalize_uei(text: &str) -> Option<String> {
+    let chars: Vec<char> = text.chars().collect();
+    let value = (0..chars.len()).find_map(|start| match_uei(&chars, start))?;
+    if value[0] == '0' {
+        return None;
+    }
+    Some(value.iter().collect::<String>().to_uppercase())
+}
+
+/// Separators allowed between an `IMO` prefix and the number, along
+/// with whitespace.
+const IMO_SEPARATORS: &[char] = &[':', '.', '#', '-'];
+
+/// A run of five to seven digits, as `IMO_RE` finds them.
+struct ImoCandidate {
+    start: usize,
+    end: usize,
+    prefixed: bool,
+}
+
+/// What `IMO_RE.finditer` yields, in the order `IMO._extract` tries it.
+/// The regex only ever matches whole runs of `\d`; a run has the
+/// prefix when `IMO` and separators come right before it.
+fn imo_candidates(text: &[char]) -> Vec<ImoCandidate> {
+    let mut candidates = Vec::new();
+    let mut pos = 0;
+    while pos < text.len() {
+        if !is_digit(text[pos]) {
+            pos += 1;
+            continue;
+        }
+        let start = pos;
+        while pos < text.len() && is_digit(text[pos]) {
+            pos += 1;
+        }
+        if !(5..=7).contains(&(pos - start)) {
+            continue;
+        }
+        let before = &text[..start];
+        let keep = before
+            .iter()
+            .rposition(|c| !is_space(*c) && !IMO_SEPARATORS.contains(c))
+            .map_or(0, |i| i + 1);
+        candidates.push(ImoCandidate {
+            start,
+            end: pos,
+            prefixed: before[..keep].ends_with(&['I', 'M', 'O']),
+        });
+    }
+    candidates.sort_by_key(|c| (Reverse(c.end - c.start), !c.prefixed, c.start));
+    candidates
+}
+
+fn vessel_checksum(digits: &[u32; 7]) -> bool {
+    let total: u32 = (0..6).map(|i| digits[i] * (7 - i as u32)).sum();
+    total % 10 == digits[6]
+}
+
+fn company_checksum(digits: &[u32; 7]) -> bool {
+    let weights = [8, 6, 4, 2, 9, 7];
+    let total: u32 = (0..6).map(|i| digits[i] * weights[i]).sum();
+    (11 - total % 11) % 10 == digits[6]
+}
+
+/// `IMO.normalize`: the first candidate, zero-padded to seven digits,
+/// that passes either checksum. Digits keep their script.
+pub fn normalize_imo(text: &str) -> Option<String> {
+    let chars: Vec<char> = text.chars().collect();
+    for candidate in imo_candidates(&chars) {
+        let run = &chars[candidate.start..candidate.end];
+        let mut value = vec!['0'; 7 - run.len()];
+        value.extend_from_slice(run);
+        let mut digits = [0; 7];
+        for (digit, c) in digits.iter_mut().zip(&value) {
+            *digit = digit_value(*c).unwrap_or_default();
+        }
+        if digits.iter().all(|d| *d == 0) {
+            continue;
+        }
+        if vessel_checksum(&digits) || company_checksum(&digits) {
+            return Some(format!("IMO{}", value.iter().collect::<String>()));
+        }
+    }
+    None
+}
+
+/// `^Q\d+$`, where `$` also matches before a final newline.
+fn is_qid(text: &str) -> bool {
+    let Some(number) = text.strip_prefix('Q') else {
+        return false;
+    };
+    let number = number.strip_suffix('\n').unwrap_or(number);
+    !number.is_empty() && number.chars().all(is_digit)
+}
+
+pub fn is_valid_wikidata(text: &str) -> bool {
+    is_qid(text)
+}
+
+pub fn normalize_wikidata(text: &str) -> Option<String> {
+    let tail = text.rsplit('/').next().unwrap_or(text);
+    let norm = strip(tail).to_uppercase();
+    is_qid(&norm).then_some(norm)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn ogrn() {
+        assert!(is_valid_ogrn("1027739552642"));
+        assert!(!is_valid_ogrn("1027739552643"));
+        assert!(!is_valid_ogrn("1027739552642x"));
+        assert_eq!(
+            normalize_ogrn("ОГРН 1027739552642.").unwrap(),
+            "1027739552642"
+        );
+        assert!(normalize_ogrn("10277395526421").is_none());
+    }
+
+    #[test]
+    fn npi() {
+        assert!(is_valid_npi("1245319599"));
+        assert!(!is_valid_npi("1245319598"));
+        assert!(!is_valid_npi("0000000000"));
+        assert_eq!(normalize_npi("NPI: 1245319599").unwrap(), "1245319599");
+    }
+
+    #[test]
+    fn uei() {
+        assert!(is_valid_uei(" J7M9HPTGJ1S9 "));
+        assert!(!is_valid_uei("07M9HPTGJ1S9"));
+        assert!(!is_valid_uei("I7M9HPTGJ1S9"));
+        assert_eq!(normalize_uei("uei j7m9hptgj1s9").unwrap(), "J7M9HPTGJ1S9");
+    }
+
+    #[test]
+    fn imo() {
+        assert_eq!(normalize_imo("IMO 9321483").unwrap(), "IMO9321483");
+        assert_eq!(normalize_imo("IMO: 5363641").unwrap(), "IMO5363641");
+        assert!(normalize_imo("9321484").is_none());
+        assert!(normalize_imo("0000000").is_none());
+        assert!(normalize_imo("93214830").is_none());
+    }
+
+    #[test]
+    fn wikidata() {
+        assert!(is_valid_wikidata("Q42"));
+        assert!(is_valid_wikidata("Q42\n"));
+        assert!(!is_valid_wikidata("q42"));
+        let url = "https://www.wikidata.org/wiki/q42 ";
+        assert_eq!(normalize_wikidata(url).unwrap(), "Q42");
+        assert!(normalize_wikidata("Q").is_none());
+    }
+}
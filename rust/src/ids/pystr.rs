@@ -0,0 +1,120 @@
+// Python `str` and `re` character semantics, as the identifier
+// formats rely on them: `str.strip()` whitespace, the Unicode `\d`
+// and `\w` classes, and `int()` over decimal digits of any script.
+
+use icu::properties::{
+    CodePointMapData,
+    props::{GeneralCategory, GeneralCategoryGroup},
+};
+
+/// `str.isspace()`: the Unicode `White_Space` characters plus the four
+/// ASCII separators (FS, GS, RS, US) Python also counts.
+pub fn is_space(c: char) -> bool {
+    c.is_whitespace() || ('\u{1c}'..='\u{1f}').contains(&c)
+}
+
+/// `str.strip()` with no arguments.
+pub fn strip(text: &str) -> &str {
+    text.trim_matches(is_space)
+}
+
+/// `re`'s `\d` on `str` patterns: general category Nd.
+pub fn is_digit(c: char) -> bool {
+    if c.is_ascii() {
+        return c.is_ascii_digit();
+    }
+    CodePointMapData::<GeneralCategory>::new().get(c) == GeneralCategory::DecimalNumber
+}
+
+/// `re`'s `\w` on `str` patterns: letters, numbers and the underscore.
+pub fn is_word(c: char) -> bool {
+    if c.is_ascii() {
+        return c.is_ascii_alphanumeric() || c == '_';
+    }
+    let cat = CodePointMapData::<GeneralCategory>::new().get(c);
+    GeneralCategoryGroup::Letter.contains(cat) || GeneralCategoryGroup::Number.contains(cat)
+}
+
+/// The value of a `\d` character, as `int()` reads it. Unicode lays
+/// every decimal digit out in contiguous runs of ten, zero first, so
+/// the value is the offset from the start of the run.
+pub fn digit_value(c: char) -> Option<u32> {
+    if c.is_ascii_digit() {
+        return Some(c as u32 - '0' as u32);
+    }
+    if !is_digit(c) {
+        return None;
+    }
+    let mut start = c as u32;
+    while let Some(prev) = char::from_u32(start - 1) {
+        if !is_digit(prev) {
+            break;
+        }
+        start -= 1;
+    }
+    Some((c as u32 - start) % 10)
+}
+
+/// `int(text)` over unsigned text: surrounding whitespace and single
+/// underscores between digits are accepted. `None` where Python would
+/// raise `ValueError`, or for a sign, which no caller can pass.
+pub fn parse_int(text: &[char]) -> Option<u64> {
+    let start = text
+        .iter()
+        .position(|c| !is_space(*c))
+        .unwrap_or(text.len());
+    let end = text
+        .iter()
+        .rposition(|c| !is_space(*c))
+        .map_or(start, |i| i + 1);
+    let rest = &text[start..end];
+    if rest.is_empty() || rest[0] == '_' || rest[rest.len() - 1] == '_' {
+        return None;
+    }
+    let mut value: u64 = 0;
+    let mut underscore = false;
+    for &c in rest {
+        if c == '_' {
+            if underscore {
+                return None;
+            }
+            underscore = true;
+            continue;
+        }
+        underscore = false;
+        let digit = digit_value(c)?;
+        value = value.checked_mul(10)?.checked_add(digit as u64)?;
+    }
+    Some(value)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn chars(text: &str) -> Vec<char> {
+        text.chars().collect()
+    }
+
+    #[test]
+    fn character_classes() {
+        assert!(is_space('\u{1f}') && is_space('\u{3000}'));
+        assert!(!is_space('\u{200b}'));
+        assert_eq!(strip("\u{a0} Q42\n"), "Q42");
+        assert!(is_digit('٣') && !is_digit('²'));
+        assert!(is_word('²') && is_word('_') && !is_word('-'));
+        assert_eq!(digit_value('٣'), Some(3));
+        assert_eq!(digit_value('𝟗'), Some(9));
+        assert_eq!(digit_value('x'), None);
+    }
+
+    #[test]
+    fn parses_ints() {
+        assert_eq!(parse_int(&chars(" 1_234\t")), Some(1234));
+        assert_eq!(parse_int(&chars("٤٢")), Some(42));
+        assert_eq!(parse_int(&chars("1__2")), None);
+        assert_eq!(parse_int(&chars("12_")), None);
+        assert_eq!(parse_int(&chars("1 2")), None);
+        assert_eq!(parse_int(&chars("")), None);
+    }
+}
@@ -0,0 +1,421 @@
+// Ports of the python-stdnum validators that `rigour.ids.stdnum_`
+// wraps. Each `validate_*` follows its stdnum module step by step —
+// the same `compact`, the same checks in the same order — and returns
+// the compact number where `validate` would, `None` where it raises.
+// A validated number is already compact, so it is also what the
+// `normalize` of the format returns (BIC aside, which truncates).
+//
+// stdnum's regexes are spelt out by hand. Its `isdigits` is
+// ASCII-only, while the `\d` in the CNPJ pattern is the Unicode one.
+
+use super::pystr::{digit_value, is_digit, strip};
+use super::tables::{BIC_COUNTRIES, CLEAN_CHARS, IBAN_BBAN, ISIN_COUNTRIES};
+
+/// `stdnum.util.clean`: map look-alike characters to ASCII, then drop
+/// the characters in `delete`.
+fn clean(number: &str, delete: &[char]) -> String {
+    number
+        .chars()
+        .map(
+            |c| match CLEAN_CHARS.binary_search_by_key(&c, |&(k, _)| k) {
+                Ok(i) => CLEAN_CHARS[i].1,
+                Err(_) => c,
+            },
+        )
+        .filter(|c| !delete.contains(c))
+        .collect()
+}
+
+/// `clean(number, delete).strip().upper()`, the usual `compact`.
+fn compact_upper(number: &str, delete: &[char]) -> Vec<char> {
+    strip(&clean(number, delete))
+        .to_uppercase()
+        .chars()
+        .collect()
+}
+
+/// `clean(number, delete).strip()`.
+fn compact(number: &str, delete: &[char]) -> Vec<char> {
+    strip(&clean(number, delete)).chars().collect()
+}
+
+/// `stdnum.util.isdigits`.
+fn is_digits(number: &[char]) -> bool {
+    !number.is_empty() && number.iter().all(char::is_ascii_digit)
+}
+
+fn digits(number: &[char]) -> Vec<u32> {
+    number.iter().map(|c| *c as u32 - '0' as u32).collect()
+}
+
+fn has_code(codes: &[&str], code: &[char]) -> bool {
+    let code: String = code.iter().collect();
+    codes.binary_search(&code.as_str()).is_ok()
+}
+
+/// Index in `0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ`.
+fn alnum_index(c: char) -> Option<u32> {
+    match c {
+        '0'..='9' => Some(c as u32 - '0' as u32),
+        'A'..='Z' => Some(c as u32 - 'A' as u32 + 10),
+        _ => None,
+    }
+}
+
+/// Sum of the decimal digits of a number below 100.
+fn digit_sum(n: u32) -> u32 {
+    n / 10 + n % 10
+}
+
+/// `stdnum.iso7064.mod_97_10.checksum`; `None` where `int(x, 36)`
+/// raises, or for an empty number.
+fn mod_97_10(number: impl Iterator<Item = char>) -> Option<u32> {
+    let mut rest = 0;
+    let mut empty = true;
+    for c in number {
+        empty = false;
+        let value = match c {
+            'A'..='Z' | 'a'..='z' => c.to_ascii_uppercase() as u32 - 'A' as u32 + 10,
+            _ => digit_value(c)?,
+        };
+        rest = if value < 10 {
+            (rest * 10 + value) % 97
+        } else {
+            (rest * 100 + value) % 97
+        };
+    }
+    (!empty).then_some(rest)
+}
+
+pub fn validate_isin(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ']);
+    let values = number
+        .iter()
+        .map(|c| alnum_index(*c))
+        .collect::<Option<Vec<u32>>>()?;
+    if number.len() != 12 || !has_code(ISIN_COUNTRIES, &number[..2]) {
+        return None;
+    }
+    // The alphabet indexes are written out in decimal, then every
+    // other digit from the right is doubled.
+    let mut expanded = Vec::with_capacity(22);
+    for value in &values[..11] {
+        if *value >= 10 {
+            expanded.push(value / 10);
+        }
+        expanded.push(value % 10);
+    }
+    let total: u32 = expanded
+        .iter()
+        .rev()
+        .enumerate()
+        .map(|(i, d)| digit_sum(if i % 2 == 0 { d * 2 } else { *d }))
+        .sum();
+    let check = (10 - total as i64).rem_euclid(10) as u32;
+    (values[11] == check).then(|| number.iter().collect())
+}
+
+const FIGI_ALPHABET: &str = "0123456789BCDFGHJKLMNPQRSTVWXYZ";
+const FIGI_EXCLUDED: &[&str] = &["BS", "BM", "GG", "GB", "VG"];
+
+pub fn validate_figi(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ']);
+    if !number.iter().all(|c| FIGI_ALPHABET.contains(*c)) || number.len() != 12 {
+        return None;
+    }
+    if number[0].is_ascii_digit() || number[1].is_ascii_digit() {
+        return None;
+    }
+    let prefix: String = number[..2].iter().collect();
+    if FIGI_EXCLUDED.contains(&prefix.as_str()) || number[2] != 'G' {
+        return None;
+    }
+    let total: u32 = number[..11]
+        .iter()
+        .enumerate()
+        .map(|(i, c)| {
+            let value = alnum_index(*c).unwrap_or_default();
+            digit_sum(if i % 2 == 0 { value } else { value * 2 })
+        })
+        .sum();
+    let check = (10 - total as i64).rem_euclid(10) as u32;
+    (alnum_index(number[11]) == Some(check)).then(|| number.iter().collect())
+}
+
+pub fn validate_bic(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ', '-']);
+    if number.len() != 8 && number.len() != 11 {
+        return None;
+    }
+    let letters = number[..6].iter().all(char::is_ascii_uppercase);
+    let rest = number[6..]
+        .iter()
+        .all(|c| c.is_ascii_uppercase() || c.is_ascii_digit());
+    if !letters || !rest || !has_code(BIC_COUNTRIES, &number[4..6]) {
+        return None;
+    }
+    Some(number.iter().collect())
+}
+
+/// `BIC.normalize`: the eight-character form of a valid BIC.
+pub fn normalize_bic(number: &str) -> Option<String> {
+    let number = validate_bic(number)?;
+    let norm = number[..8].to_string();
+    validate_bic(&norm)?;
+    Some(norm)
+}
+
+pub fn validate_lei(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ', '-']);
+    (mod_97_10(number.iter().copied())? == 1).then(|| number.iter().collect())
+}
+
+/// Matches an IBAN BBAN against a structure in SWIFT notation, where
+/// `4!n` is four digits, `a` stands for upper-case letters and `c`
+/// for letters and digits.
+fn matches_structure(bban: &[char], structure: &str) -> bool {
+    let mut rest = bban;
+    let mut count = 0;
+    for c in structure.chars() {
+        match c {
+            '0'..='9' => count = count * 10 + (c as usize - '0' as usize),
+            '!' => {}
+            kind => {
+                if rest.len() < count {
+                    return false;
+                }
+                let (head, tail) = rest.split_at(count);
+                let ok = match kind {
+                    'n' => head.iter().all(char::is_ascii_digit),
+                    'a' => head.iter().all(char::is_ascii_uppercase),
+                    _ => head.iter().all(char::is_ascii_alphanumeric),
+                };
+                if !ok {
+                    return false;
+                }
+                rest = tail;
+                count = 0;
+            }
+        }
+    }
+    rest.is_empty()
+}
+
+/// `stdnum.iban.validate(number, check_country=False)`: stdnum's
+/// national checks (the Belgian bank registry, Spanish, Montenegrin and
+/// Norwegian account numbers) are left to the caller.
+pub fn validate_iban(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ', '-', '.']);
+    let split = number.len().min(4);
+    let rotated = number[split..].iter().chain(&number[..split]).copied();
+    if mod_97_10(rotated)? != 1 || number.len() < 2 {
+        return None;
+    }
+    let country: String = number[..2].iter().collect();
+    let entry = IBAN_BBAN.binary_search_by_key(&country.as_str(), |&(cc, _)| cc);
+    let structure = IBAN_BBAN[entry.ok()?].1;
+    matches_structure(&number[split..], structure).then(|| number.iter().collect())
+}
+
+/// `sum(w * int(n) for w, n in zip(weights, number)) % 11 % 10`
+fn inn_check(digits: &[u32], weights: &[u32]) -> u32 {
+    digits.iter().zip(weights).map(|(d, w)| d * w).sum::<u32>() % 11 % 10
+}
+
+pub fn validate_inn(number: &str) -> Option<String> {
+    let number = compact(number, &[' ']);
+    if !is_digits(&number) {
+        return None;
+    }
+    let d = digits(&number);
+    let valid = match d.len() {
+        10 => inn_check(&d, &[2, 4, 10, 3, 5, 9, 4, 6, 8]) == d[9],
+        12 => {
+            let d1 = inn_check(&d, &[7, 2, 4, 10, 3, 5, 9, 4, 6, 8]);
+            let mut head = d[..10].to_vec();
+            head.push(d1);
+            let d2 = inn_check(&head, &[3, 7, 2, 4, 10, 3, 5, 9, 4, 6, 8]);
+            d1 == d[10] && d2 == d[11]
+        }
+        _ => false,
+    };
+    valid.then(|| number.iter().collect())
+}
+
+const SSN_BLACKLIST: &[&str] = &["078-05-1120", "457-55-5462", "219-09-9999"];
+
+/// Takes `count` ASCII digits from the front of `rest`.
+fn take_digits<'a>(rest: &mut &'a [char], count: usize) -> Option<&'a [char]> {
+    if rest.len() < count || !rest[..count].iter().all(char::is_ascii_digit) {
+        return None;
+    }
+    let (head, tail) = rest.split_at(count);
+    *rest = tail;
+    Some(head)
+}
+
+fn skip_dash(rest: &mut &[char]) {
+    if rest.first() == Some(&'-') {
+        *rest = &rest[1..];
+    }
+}
+
+pub fn validate_ssn(number: &str) -> Option<String> {
+    // `^([0-9]{3})-?([0-9]{2})-?([0-9]{4})$`
+    let cleaned = compact(number, &[]);
+    let mut rest = cleaned.as_slice();
+    let area = take_digits(&mut rest, 3)?;
+    skip_dash(&mut rest);
+    let group = take_digits(&mut rest, 2)?;
+    skip_dash(&mut rest);
+    let serial = take_digits(&mut rest, 4)?;
+    if !rest.is_empty() {
+        return None;
+    }
+    if area == ['0'; 3] || area == ['6'; 3] || area[0] == '9' {
+        return None;
+    }
+    if group == ['0'; 2] || serial == ['0'; 4] {
+        return None;
+    }
+    // `ssn.format` of the number as given: dashes go in only when it
+    // is exactly nine characters long.
+    let raw: Vec<char> = number.chars().collect();
+    let formatted = if raw.len() == 9 {
+        let part = |range: std::ops::Range<usize>| raw[range].iter().collect::<String>();
+        format!("{}-{}-{}", part(0..3), part(3..5), part(5..9))
+    } else {
+        number.to_string()
+    };
+    if SSN_BLACKLIST.contains(&formatted.as_str()) {
+        return None;
+    }
+    Some(compact(number, &['-']).into_iter().collect())
+}
+
+pub fn validate_cpf(number: &str) -> Option<String> {
+    let number = compact(number, &[' ', '-', '.']);
+    if !is_digits(&number) || number.iter().all(|c| *c == '0') {
+        return None;
+    }
+    if number.len() != 11 {
+        return None;
+    }
+    let d = digits(&number);
+    let sum1: i64 = (0..9).map(|i| (10 - i as i64) * d[i] as i64).sum();
+    let d1 = (11 - sum1).rem_euclid(11) % 10;
+    let sum2: i64 = (0..9).map(|i| (11 - i as i64) * d[i] as i64).sum::<i64>() + 2 * d1;
+    let d2 = (11 - sum2).rem_euclid(11) % 10;
+    (d[9] as i64 == d1 && d[10] as i64 == d2).then(|| number.iter().collect())
+}
+
+/// `(11 - sum(w * v for w, v in zip(weights, values))) % 11 % 10`
+fn cnpj_check(values: &[i64], weights: &[i64]) -> i64 {
+    let total: i64 = values.iter().zip(weights).map(|(v, w)| v * w).sum();
+    (11 - total).rem_euclid(11) % 10
+}
+
+pub fn validate_cnpj(number: &str) -> Option<String> {
+    let number = compact_upper(number, &[' ', '-', '.', '/']);
+    // `^[\dA-Z]+$`, with the Unicode `\d`.
+    let valid_chars = number
+        .iter()
+        .all(|c| is_digit(*c) || c.is_ascii_uppercase());
+    if number.is_empty() || !valid_chars || number.starts_with(&['0'; 12]) {
+        return None;
+    }
+    if number.len() != 14 {
+        return None;
+    }
+    // Values are code points less 48: the digit value for ASCII
+    // digits, 17 up for letters.
+    let mut values: Vec<i64> = number[..12].iter().map(|c| *c as i64 - 48).collect();
+    let d1 = cnpj_check(&values, &[5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]);
+    values.push(d1);
+    let d2 = cnpj_check(&values, &[6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]);
+    let check = [d1, d2].map(|d| char::from(b'0' + d as u8));
+    (number[12..] == check).then(|| number.iter().collect())
+}
+
+const USCC_ALPHABET: &str = "0123456789ABCDEFGHJKLMNPQRTUWXY";
+const USCC_WEIGHTS: [usize; 17] = [
+    1, 3, 9, 27, 19, 26, 16, 17, 20, 29, 25, 13, 8, 24, 10, 30, 28,
+];
+
+pub fn validate_uscc(number: &str) -> Option<String> {
+    // Upper-cased before stripping, unlike the other formats.
+    let number: Vec<char> = strip(&clean(number, &[' ', '-']).to_uppercase())
+        .chars()
+        .collect();
+    if number.len() != 18 || !is_digits(&number[..8]) {
+        return None;
+    }
+    let indexes = number
+        .iter()
+        .map(|c| USCC_ALPHABET.find(*c))
+        .collect::<Option<Vec<usize>>>()?;
+    let total: usize = indexes.iter().zip(USCC_WEIGHTS).map(|(i, w)| i * w).sum();
+    let check = (31 - (total % 31)) % 31;
+    (indexes[17] == check).then(|| number.iter().collect())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn cleans_look_alikes() {
+        assert_eq!(clean("12\u{2013}34 56", &[' ']), "12-3456");
+        assert_eq!(clean("１２", &[]), "12");
+    }
+
+    #[test]
+    fn securities() {
+        assert_eq!(validate_isin(" us0378331005").unwrap(), "US0378331005");
+        assert!(validate_isin("US0378331004").is_none());
+        assert!(validate_isin("ZZ0378331005").is_none());
+        assert_eq!(validate_figi("BBG000BLNQ16").unwrap(), "BBG000BLNQ16");
+        assert!(validate_figi("BBG000BLNQ17").is_none());
+        assert_eq!(
+            validate_lei("5493 0084UKLVMY22DS16").unwrap(),
+            "54930084UKLVMY22DS16"
+        );
+        assert!(validate_lei("54930084UKLVMY22DS17").is_none());
+        assert!(validate_lei("").is_none());
+    }
+
+    #[test]
+    fn banking() {
+        let iban = validate_iban("GB82 WEST 1234 5698 7654 32").unwrap();
+        assert_eq!(iban, "GB82WEST12345698765432");
+        assert!(validate_iban("GB82WEST12345698765433").is_none());
+        assert!(validate_iban("1").is_none());
+        assert_eq!(validate_bic("deut de ff").unwrap(), "DEUTDEFF");
+        assert_eq!(normalize_bic("DEUTDEFF500").unwrap(), "DEUTDEFF");
+        assert!(validate_bic("DEUTZZFF").is_none());
+    }
+
+    #[test]
+    fn national_ids() {
+        assert_eq!(validate_inn("7707083893").unwrap(), "7707083893");
+        assert_eq!(validate_inn("500100732259").unwrap(), "500100732259");
+        assert!(validate_inn("7707083894").is_none());
+        assert_eq!(validate_ssn("536-90-4399").unwrap(), "536904399");
+        assert!(validate_ssn("078-05-1120").is_none());
+        assert!(validate_ssn("666-90-4399").is_none());
+        assert_eq!(validate_cpf("390.533.447-05").unwrap(), "39053344705");
+        assert!(validate_cpf("000.000.000-00").is_none());
+        assert_eq!(
+            validate_cnpj("16.727.230/0001-97").unwrap(),
+            "16727230000197"
+        );
+        assert_eq!(
+            validate_cnpj("12.ABC.345/01DE-35").unwrap(),
+            "12ABC34501DE35"
+        );
+        assert!(validate_cnpj("16.727.230/0001-98").is_none());
+        let uscc = validate_uscc("91110000600037341L").unwrap();
+        assert_eq!(uscc, "91110000600037341L");
+        assert!(validate_uscc("91110000600037341M").is_none());
+    }
+}
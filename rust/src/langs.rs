@@ -0,0 +1,168 @@
+// ISO 639 language code resolution — the Rust side of `rigour.langs`.
+//
+// The tables live in `generated/iso639.rs`, emitted by
+// `genscripts/generate_langs.py` from `resources/langs/` as static,
+// sorted arrays: they sit in the binary's read-only data, cost
+// nothing to load and are shared between every process mapping the
+// extension. Lookups are binary searches (13–14 probes over ~8.8k
+// keys), which beats hashing the short keys we see in practice and
+// needs no build step at first use.
+//
+// Resolution rules, matching the former Python implementation:
+//
+//   1. normalise: Unicode casefold, strip surrounding whitespace;
+//   2. map two-letter / ISO 639-2 / name aliases via `ISO3_MAP`;
+//   3. accept if the result is an ISO 639-3 code and not one of
+//      `NON_LANGS` ("mul", "und", "zxx", ...);
+//   4. otherwise, for BCP 47-style tags ("pt-BR", "zh_Hans"), retry
+//      with the primary subtag. The full tag is tried first so that
+//      synonym-table entries such as "chi_sim" win.
+
+use std::collections::BTreeSet;
+
+use crate::text::normalize::casefold;
+
+#[rustfmt::skip]
+#[path = "generated/iso639.rs"]
+mod iso639;
+
+use iso639::{ISO2_MAP, ISO3_ALL, ISO3_MAP, NON_LANGS, SYNONYMS};
+
+fn lookup(table: &'static [(&'static str, &'static str)], key: &str) -> Option<&'static str> {
+    table
+        .binary_search_by(|(k, _)| (*k).cmp(key))
+        .ok()
+        .map(|i| table[i].1)
+}
+
+/// The interned ISO 639-3 code equal to `code`, if it is one.
+fn iso3_code(code: &str) -> Option<&'static str> {
+    if code.len() != 3 {
+        return None;
+    }
+    let (mut lo, mut hi) = (0, ISO3_ALL.len() / 3);
+    while lo < hi {
+        let mid = (lo + hi) / 2;
+        let candidate = &ISO3_ALL[mid * 3..mid * 3 + 3];
+        match candidate.cmp(code) {
+            std::cmp::Ordering::Less => lo = mid + 1,
+            std::cmp::Ordering::Greater => hi = mid,
+            std::cmp::Ordering::Equal => return Some(candidate),
+        }
+    }
+    None
+}
+
+/// A valid ISO 639-3 code that denotes an actual language.
+fn language_code(code: &str) -> Option<&'static str> {
+    iso3_code(code).filter(|c| NON_LANGS.binary_search(c).is_err())
+}
+
+/// Casefold and strip; `None` for blank input. ASCII input (nearly
+/// all of it) skips the ICU case mapper.
+pub fn normalize_code(code: &str) -> Option<String> {
+    let folded = if code.is_ascii() {
+        code.to_ascii_lowercase()
+    } else {
+        casefold(code)
+    };
+    let trimmed = folded.trim();
+    if trimmed.is_empty() {
+        return None;
+    }
+    Some(trimmed.to_string())
+}
+
+/// Whether `code` is, verbatim, an ISO 639-3 code.
+pub fn is_iso_639_3(code: &str) -> bool {
+    iso3_code(code).is_some()
+}
+
+/// Resolve a language code, name or BCP 47-style tag to its
+/// ISO 639-3 code.
+pub fn alpha3(code: &str) -> Option<&'static str> {
+    let norm = normalize_code(code)?;
+    let resolved = lookup(ISO3_MAP, &norm).unwrap_or(norm.as_str());
+    if let Some(found) = language_code(resolved) {
+        return Some(found);
+    }
+    for sep in ['-', '_'] {
+        if let Some((head, _)) = norm.split_once(sep) {
+            return alpha3(head);
+        }
+    }
+    None
+}
+
+/// Resolve a language identifier to its ISO 639-1 (two-letter) code.
+pub fn alpha2(code: &str) -> Option<&'static str> {
+    alpha3(code).and_then(|c| lookup(ISO2_MAP, c))
+}
+
+/// Resolve every code in `codes`, skipping the unresolvable ones;
+/// with `synonyms`, add the other valid codes of each result's
+/// synonym group (e.g. "srp" brings "hrv" and "bos").
+pub fn list_to_alpha3<S: AsRef<str>>(codes: &[S], synonyms: bool) -> BTreeSet<&'static str> {
+    let mut out = BTreeSet::new();
+    for code in codes {
+        let Some(found) = alpha3(code.as_ref()) else {
+            continue;
+        };
+        out.insert(found);
+        if !synonyms {
+            continue;
+        }
+        if let Some(group) = SYNONYMS.iter().find(|g| g.contains(&found)) {
+            out.extend(group.iter().filter_map(|s| language_code(s)));
+        }
+    }
+    out
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn tables_are_sorted() {
+        assert_eq!(ISO3_ALL.len() % 3, 0);
+        let codes: Vec<&str> = (0..ISO3_ALL.len() / 3)
+            .map(|i| &ISO3_ALL[i * 3..i * 3 + 3])
+            .collect();
+        assert!(codes.windows(2).all(|w| w[0] < w[1]));
+        assert!(ISO3_MAP.windows(2).all(|w| w[0].0 < w[1].0));
+        assert!(ISO2_MAP.windows(2).all(|w| w[0].0 < w[1].0));
+        assert!(NON_LANGS.windows(2).all(|w| w[0] < w[1]));
+    }
+
+    #[test]
+    fn resolves_codes() {
+        assert_eq!(alpha3("en"), Some("eng"));
+        assert_eq!(alpha3("ENG "), Some("eng"));
+        assert_eq!(alpha3("ger"), Some("deu"));
+        assert_eq!(alpha3("gub"), Some("gub"));
+        assert_eq!(alpha3("npi"), Some("nep"));
+        assert_eq!(alpha3(""), None);
+        assert_eq!(alpha3("banana"), None);
+        assert_eq!(alpha3("mul"), None);
+        assert_eq!(alpha2("ENG "), Some("en"));
+        assert_eq!(alpha2("gub"), None);
+    }
+
+    #[test]
+    fn resolves_subtags() {
+        assert_eq!(alpha3("pt-BR"), Some("por"));
+        assert_eq!(alpha3("zh_Hans"), Some("zho"));
+        assert_eq!(alpha3("chi_sim"), Some("zho"));
+        assert_eq!(alpha3("mul-x-foo"), None);
+    }
+
+    #[test]
+    fn list_expands_synonyms() {
+        let out = list_to_alpha3(&["bs", "de", "xy", ""], true);
+        assert!(out.contains("srp") && out.contains("deu"));
+        assert!(!out.contains("ger"));
+        let out = list_to_alpha3(&["bs"], false);
+        assert_eq!(out.into_iter().collect::<Vec<_>>(), vec!["bos"]);
+    }
+}
@@ -1,8 +1,16 @@
 pub mod constants;
+pub mod ids;
+pub mod langs;
 pub mod names;
+pub mod parallel;
+#[cfg(feature = "python")]
+pub mod preload;
+pub mod sharded;
 pub mod territories;
 pub mod text;
 
+#[cfg(feature = "python")]
+use pyo3::exceptions::PyValueError;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -53,8 +61,12 @@ fn py_should_ascii(text: &str) -> bool {
 #[cfg(feature = "python")]
 #[pyfunction]
 #[pyo3(name = "maybe_ascii", signature = (text, drop=false))]
-fn py_maybe_ascii(text: &str, drop: bool) -> String {
-    text::translit::maybe_ascii(text, drop)
+fn py_maybe_ascii(py: Python<'_>, text: &str, drop: bool) -> String {
+    // Pure-ASCII input is a copy; not worth a GIL round-trip.
+    if text.is_ascii() {
+        return text.to_string();
+    }
+    py.detach(|| text::translit::maybe_ascii(text, drop))
 }
 
 #[cfg(feature = "python")]
@@ -71,9 +83,223 @@ fn py_tokenize_name(text: &str, token_min_length: usize) -> Vec<String> {
 #[cfg(feature = "python")]
 #[pyfunction]
 #[pyo3(name = "_normalize")]
-fn py_normalize(text: &str, flags: u16, cleanup: u8) -> Option<String> {
+fn py_normalize(py: Python<'_>, text: &str, flags: u16, cleanup: u8) -> Option<String> {
     let (flags, cleanup) = _decode_flags(flags, cleanup);
-    text::normalize::normalize(text, flags, cleanup)
+    py.detach(|| text::normalize::normalize(text, flags, cleanup))
+}
+
+// Territory-name lookup key; see `rigour.territories.util`. The
+// batch form crosses the FFI once for a whole list — building the
+// name index normalises every territory's names.
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "normalize_territory_name")]
+fn py_normalize_territory_name(py: Python<'_>, name: &str) -> String {
+    py.detach(|| text::normalize::normalize_territory_name(name))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "normalize_territory_names")]
+fn py_normalize_territory_names(py: Python<'_>, names: Vec<String>) -> Vec<String> {
+    py.detach(|| {
+        names
+            .iter()
+            .map(|name| text::normalize::normalize_territory_name(name))
+            .collect()
+    })
+}
+
+// Address comparison key; see `rigour.addresses.normalize`. The batch
+// form fans out over `parallel::map_ordered` with the GIL released.
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "normalize_address", signature = (address, latinize=false, min_length=4))]
+fn py_normalize_address(
+    py: Python<'_>,
+    address: &str,
+    latinize: bool,
+    min_length: usize,
+) -> Option<String> {
+    // ASCII input is a short byte loop, cheaper than a GIL round trip.
+    if address.is_ascii() {
+        return text::address::normalize_address(address, latinize, min_length);
+    }
+    py.detach(|| text::address::normalize_address(address, latinize, min_length))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "normalize_addresses",
+    signature = (addresses, latinize=false, min_length=4, threads=None)
+)]
+fn py_normalize_addresses(
+    py: Python<'_>,
+    addresses: Vec<String>,
+    latinize: bool,
+    min_length: usize,
+    threads: Option<usize>,
+) -> Vec<Option<String>> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    py.detach(|| {
+        parallel::map_ordered(&addresses, threads, |address| {
+            text::address::normalize_address(address, latinize, min_length)
+        })
+    })
+}
+
+// Address keyword replacers. Single calls are a short automaton walk,
+// so they keep the GIL; the batch forms release it and fan out.
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "shorten_address_keywords", signature = (address, latinize=false))]
+fn py_shorten_address_keywords(address: &str, latinize: bool) -> String {
+    text::address::shorten_address_keywords(address, latinize)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "shorten_address_keywords_batch",
+    signature = (addresses, latinize=false, threads=None)
+)]
+fn py_shorten_address_keywords_batch(
+    py: Python<'_>,
+    addresses: Vec<String>,
+    latinize: bool,
+    threads: Option<usize>,
+) -> Vec<String> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    py.detach(|| {
+        parallel::map_ordered(&addresses, threads, |address| {
+            text::address::shorten_address_keywords(address, latinize)
+        })
+    })
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "remove_address_keywords",
+    signature = (address, latinize=false, replacement=" ")
+)]
+fn py_remove_address_keywords(address: &str, latinize: bool, replacement: &str) -> String {
+    text::address::remove_address_keywords(address, latinize, replacement)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "remove_address_keywords_batch",
+    signature = (addresses, latinize=false, replacement=" ", threads=None)
+)]
+fn py_remove_address_keywords_batch(
+    py: Python<'_>,
+    addresses: Vec<String>,
+    latinize: bool,
+    replacement: &str,
+    threads: Option<usize>,
+) -> Vec<String> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    py.detach(|| {
+        parallel::map_ordered(&addresses, threads, |address| {
+            text::address::remove_address_keywords(address, latinize, replacement)
+        })
+    })
+}
+
+// Address comparison and blocking keys. The batch forms are what
+// deduplication jobs call; they release the GIL and fan out.
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "compare_addresses", signature = (left, right, latinize=false))]
+fn py_compare_addresses(left: &str, right: &str, latinize: bool) -> f64 {
+    text::address_compare::compare_addresses(left, right, latinize)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "compare_addresses_batch",
+    signature = (pairs, latinize=false, threads=None)
+)]
+fn py_compare_addresses_batch(
+    py: Python<'_>,
+    pairs: Vec<(String, String)>,
+    latinize: bool,
+    threads: Option<usize>,
+) -> Vec<f64> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    py.detach(|| {
+        parallel::map_ordered(&pairs, threads, |(left, right)| {
+            text::address_compare::compare_addresses(left, right, latinize)
+        })
+    })
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "address_keys", signature = (address, latinize=false))]
+fn py_address_keys(address: &str, latinize: bool) -> Vec<String> {
+    text::address_compare::address_keys(address, latinize)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(
+    name = "address_keys_batch",
+    signature = (addresses, latinize=false, threads=None)
+)]
+fn py_address_keys_batch(
+    py: Python<'_>,
+    addresses: Vec<String>,
+    latinize: bool,
+    threads: Option<usize>,
+) -> Vec<Vec<String>> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    py.detach(|| {
+        parallel::map_ordered(&addresses, threads, |address| {
+            text::address_compare::address_keys(address, latinize)
+        })
+    })
+}
+
+// Identifier formats; see `rigour.ids.batch`. The format is looked
+// up once per call and the values run without the GIL. Only
+// canonical names are accepted: aliases resolve on the Python side.
+#[cfg(feature = "python")]
+fn _identifier_format(name: &str) -> PyResult<ids::Format> {
+    ids::Format::from_name(name)
+        .ok_or_else(|| PyValueError::new_err(format!("unknown identifier format: {:?}", name)))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "normalize_identifiers", signature = (format, values, threads=None))]
+fn py_normalize_identifiers(
+    py: Python<'_>,
+    format: &str,
+    values: Vec<String>,
+    threads: Option<usize>,
+) -> PyResult<Vec<Option<String>>> {
+    let format = _identifier_format(format)?;
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    Ok(py.detach(|| parallel::map_ordered(&values, threads, |value| format.normalize(value))))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "validate_identifiers", signature = (format, values, threads=None))]
+fn py_validate_identifiers(
+    py: Python<'_>,
+    format: &str,
+    values: Vec<String>,
+    threads: Option<usize>,
+) -> PyResult<Vec<bool>> {
+    let format = _identifier_format(format)?;
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    Ok(py.detach(|| parallel::map_ordered(&values, threads, |value| format.is_valid(value))))
 }
 
 // Distance / similarity primitives. The Python wrappers in
@@ -253,6 +479,40 @@ fn py_ordinals_dict() -> std::collections::HashMap<u32, Vec<String>> {
     text::ordinals::ordinals_dict()
 }
 
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "iso_639_alpha3")]
+fn py_iso_639_alpha3(code: &str) -> Option<&'static str> {
+    langs::alpha3(code)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "iso_639_alpha2")]
+fn py_iso_639_alpha2(code: &str) -> Option<&'static str> {
+    langs::alpha2(code)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "is_iso_639_3")]
+fn py_is_iso_639_3(code: &str) -> bool {
+    langs::is_iso_639_3(code)
+}
+
+// Batch form of `iso_639_alpha3` with synonym expansion: one FFI hop
+// for a whole list of codes.
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "list_to_alpha3", signature = (codes, synonyms=true))]
+fn py_list_to_alpha3<'py>(
+    py: Python<'py>,
+    codes: Vec<String>,
+    synonyms: bool,
+) -> PyResult<Bound<'py, PySet>> {
+    PySet::new(py, langs::list_to_alpha3(&codes, synonyms))
+}
+
 // The full territory database as raw JSONL. Python consumers in
 // `rigour.territories.*` parse line-by-line with orjson at import
 // time under `@cache`-decorated index builders, so the FFI cost is
@@ -267,8 +527,18 @@ fn py_territories_jsonl() -> String {
     territories::decompressed()
 }
 
+// Declared free-threading safe. Process-global state is either
+// immutable after first build (taggers, replacers: leaked `&'static`,
+// thread-local fronted), striped over independent locks (the
+// `maybe_ascii` LRU, the symbol interner: `sharded::Sharded`) or
+// thread-local (ICU4X transliterators). The mutable pyclasses —
+// `Name.tag` / `Name.spans`, `NamePart.tag`, `Alignment.score` /
+// `weight` — rely on PyO3's per-object borrow flag, which is atomic
+// on free-threaded builds: a conflicting concurrent write raises
+// `RuntimeError` rather than racing. `Name.spans` is a `list`, whose
+// appends CPython locks per object.
 #[cfg(feature = "python")]
-#[pymodule]
+#[pymodule(gil_used = false)]
 fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_metaphone, m)?)?;
     m.add_function(wrap_pyfunction!(py_soundex, m)?)?;
@@ -279,6 +549,20 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_maybe_ascii, m)?)?;
     m.add_function(wrap_pyfunction!(py_tokenize_name, m)?)?;
     m.add_function(wrap_pyfunction!(py_normalize, m)?)?;
+    m.add_function(wrap_pyfunction!(py_normalize_territory_name, m)?)?;
+    m.add_function(wrap_pyfunction!(py_normalize_territory_names, m)?)?;
+    m.add_function(wrap_pyfunction!(py_normalize_address, m)?)?;
+    m.add_function(wrap_pyfunction!(py_normalize_addresses, m)?)?;
+    m.add_function(wrap_pyfunction!(py_shorten_address_keywords, m)?)?;
+    m.add_function(wrap_pyfunction!(py_shorten_address_keywords_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(py_remove_address_keywords, m)?)?;
+    m.add_function(wrap_pyfunction!(py_remove_address_keywords_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(py_compare_addresses, m)?)?;
+    m.add_function(wrap_pyfunction!(py_compare_addresses_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(py_address_keys, m)?)?;
+    m.add_function(wrap_pyfunction!(py_address_keys_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(py_normalize_identifiers, m)?)?;
+    m.add_function(wrap_pyfunction!(py_validate_identifiers, m)?)?;
     m.add_function(wrap_pyfunction!(py_raw_levenshtein, m)?)?;
     m.add_function(wrap_pyfunction!(py_raw_levenshtein_cutoff, m)?)?;
     m.add_function(wrap_pyfunction!(py_raw_jaro, m)?)?;
@@ -300,14 +584,66 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_generic_person_names_list, m)?)?;
     m.add_function(wrap_pyfunction!(py_ordinals_dict, m)?)?;
     m.add_function(wrap_pyfunction!(py_territories_jsonl, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territory_index,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territory_by_code,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territories_intersect,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territories_intersect_batch,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territory_is_within,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_territory_descendants,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_find_territories,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        territories::territory::py_find_territories_batch,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(py_iso_639_alpha3, m)?)?;
+    m.add_function(wrap_pyfunction!(py_iso_639_alpha2, m)?)?;
+    m.add_function(wrap_pyfunction!(py_is_iso_639_3, m)?)?;
+    m.add_function(wrap_pyfunction!(py_list_to_alpha3, m)?)?;
     m.add_function(wrap_pyfunction!(names::analyze::py_analyze_names, m)?)?;
+    m.add_function(wrap_pyfunction!(names::analyze::py_analyze_names_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(names::analyze::py_save_tagger_images, m)?)?;
+    m.add_function(wrap_pyfunction!(preload::py_preload_data, m)?)?;
+    m.add_function(wrap_pyfunction!(names::codec::py_dump_names, m)?)?;
+    m.add_function(wrap_pyfunction!(names::codec::py_load_names, m)?)?;
+    m.add_function(wrap_pyfunction!(names::codec::py_name_data_version, m)?)?;
+    m.add_function(wrap_pyfunction!(names::columns::py_names_to_columns, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        names::columns::py_analyze_names_columns,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(
         names::ordering::py_align_person_name_order,
         m
     )?)?;
     m.add_function(wrap_pyfunction!(names::pairing::py_pair_symbols, m)?)?;
     m.add_function(wrap_pyfunction!(names::compare::py_compare_parts, m)?)?;
+    m.add_function(wrap_pyfunction!(names::set_match::py_match_name_sets, m)?)?;
+    m.add_function(wrap_pyfunction!(names::set_match::py_score_upper_bound, m)?)?;
     m.add_class::<names::compare::CompareConfig>()?;
+    m.add_class::<names::set_match::MatchConfig>()?;
+    m.add_class::<names::set_match::NameSetMatch>()?;
+    m.add_class::<names::prepared::PreparedName>()?;
     m.add_class::<names::alignment::Alignment>()?;
     m.add_class::<names::symbol::Symbol>()?;
     m.add_class::<names::symbol::SymbolCategory>()?;
@@ -316,9 +652,16 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<names::part::NamePart>()?;
     m.add_class::<names::part::Span>()?;
     m.add_class::<names::name::Name>()?;
+    m.add_class::<names::columns::Column>()?;
+    m.add_class::<names::columns::NameColumns>()?;
+    m.add_class::<territories::territory::Territory>()?;
+    m.add_class::<territories::fuzzy::FuzzyNameIndex>()?;
     // Single source of truth for the name-length cap: the Rust DP
     // paths use this const directly, and `rigour.env` re-exports it
     // so the Python distance wrappers truncate to the same value.
     m.add("MAX_NAME_LENGTH", names::constants::MAX_NAME_LENGTH)?;
+    // The python-stdnum release the identifier tables were generated
+    // from; `rigour.ids.batch` compares it with the installed one.
+    m.add("STDNUM_VERSION", ids::STDNUM_VERSION)?;
     Ok(())
 }
@@ -198,6 +198,35 @@ impl Alignment {
         self.hash
     }
 
+    /// Pickle support: rebuilt through the constructor, carrying the
+    /// current (possibly policy-adjusted) `score` and `weight`.
+    #[allow(clippy::type_complexity)]
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> (
+        Bound<'py, pyo3::types::PyType>,
+        (
+            Py<PyTuple>,
+            Py<PyTuple>,
+            Option<Py<Symbol>>,
+            Py<PyFloat>,
+            Py<PyFloat>,
+        ),
+    ) {
+        let py = slf.py();
+        let a = slf.borrow();
+        (
+            slf.get_type(),
+            (
+                a.qps.clone_ref(py),
+                a.rps.clone_ref(py),
+                a.symbol.as_ref().map(|s| s.clone_ref(py)),
+                a.score.clone_ref(py),
+                a.weight.clone_ref(py),
+            ),
+        )
+    }
+
     fn __eq__(&self, py: Python<'_>, other: &Bound<'_, PyAny>) -> PyResult<bool> {
         let Ok(o) = other.extract::<PyRef<'_, Alignment>>() else {
             return Ok(false);
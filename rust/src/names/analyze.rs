@@ -9,8 +9,8 @@
 //   3. For ORG/ENT, if `rewrite`: replace_org_types_compare +
 //      remove_org_prefixes; for OBJ, if `rewrite`: remove_obj_prefixes
 //   4. Dedup by form
-//   5. Construct Name + NamePart objects (all eager on construction)
-//   6. Apply part_tags via Name.tag_text for each (tag, values) entry
+//   5. Tokenise + compute per-part data
+//   6. Apply part_tags via tag_text for each (tag, values) entry
 //   7. For PER: INITIAL-symbol preamble (if `symbols`)
 //   8. Tagger dispatch (if `symbols`):
 //        - PER: person tagger.
@@ -21,7 +21,14 @@
 //               and leave the tag at ENT.
 //   9. infer_part_tags post-pass (NUMERIC / STOP / LEGAL promotion)
 // Optionally:
-//   10. Name::consolidate_names to drop substring-dominated names
+//   10. consolidate_names to drop substring-dominated names
+//
+// All of it runs in plain Rust over `NameData` — `prepare_names`
+// for steps 1–5 and the automaton scans of 8, `resolve` for the
+// rest — so the whole pipeline runs with the GIL released and the
+// batch entry points fan it out over a worker pool (see
+// `crate::parallel`). Only the final boxing into `Name` objects
+// holds the GIL, and the columnar export skips even that.
 //
 // The `rewrite` flag gates the two pre-tagger canonicalisation
 // stages. Callers that want to index or display a name in its
@@ -32,18 +39,21 @@
 use std::collections::HashSet;
 use std::sync::LazyLock;
 
+use pyo3::exceptions::{PyOSError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PySet};
 
-use crate::names::name::Name;
+use crate::names::name::NameData;
 use crate::names::org_types;
-use crate::names::part::{NamePart, Span};
+use crate::names::part::PartData;
 use crate::names::prefix::{remove_obj_prefixes, remove_org_prefixes, remove_person_prefixes};
 use crate::names::symbol::{Symbol, SymbolCategory};
 use crate::names::tag::{INITIAL_TAGS, NamePartTag, NameTypeTag};
-use crate::names::tagger::{TaggerKind, get_tagger};
+use crate::names::tagger::{TaggerKind, get_tagger, save_images};
+use crate::parallel;
 use crate::text::normalize::{Cleanup, Normalize, casefold, normalize};
 use crate::text::stopwords::stopwords_list;
+use crate::text::tokenize::tokenize_name;
 
 /// Normalise-flag combination for the tagger's alias set.
 ///
@@ -95,46 +105,67 @@ static STOPWORD_SET: LazyLock<HashSet<String>> = LazyLock::new(|| {
         .collect()
 });
 
+/// Build the `analyze_names` tagger of `kind` now rather than on
+/// first use.
+pub fn preload_tagger(kind: TaggerKind) {
+    get_tagger(kind, TAGGER_FLAGS);
+}
+
+/// Build the STOP-promotion stopword set now rather than on first use.
+pub fn preload_stopwords() {
+    LazyLock::force(&STOPWORD_SET);
+}
+
 fn is_stopword(form: &str) -> bool {
     STOPWORD_SET.contains(form)
 }
 
-/// Public entry point — called from PyO3 `py_analyze_names`. See the
-/// Python-side docstring at `rigour/names/analyze.py::analyze_names`
-/// for the semantic spec.
+/// Flag set shared by the single-entity and batch entry points. See
+/// the Python-side docstring at `rigour/names/analyze.py::analyze_names`
+/// for what each flag does.
+#[derive(Clone, Copy, Debug)]
+pub struct AnalyzeOptions {
+    pub infer_initials: bool,
+    pub symbols: bool,
+    pub phonetics: bool,
+    pub numerics: bool,
+    pub consolidate: bool,
+    pub rewrite: bool,
+}
+
+/// The first half of one name's analysis: canonicalised form,
+/// per-part cached data (transliteration, metaphone, numeric parse)
+/// and the raw tagger hits against its `norm_form`. Built by
+/// [`prepare_names`]; finished into a [`NameData`] by [`resolve`].
+struct NameDraft {
+    original: String,
+    form: String,
+    parts: Vec<PartData>,
+    org_matches: Vec<(String, Symbol)>,
+    person_matches: Vec<(String, Symbol)>,
+}
+
+/// Pipeline steps 1–5 plus the expensive half of 8: prefix strip,
+/// casefold, org-type rewrite, dedup, per-part data and tagger
+/// matching.
 ///
-/// `part_tags` is an ordered sequence, not a map: tag application
-/// is first-writer-wins (a later compatible tag no-ops, an
-/// incompatible one flips the part to AMBIGUOUS), so the caller's
-/// dict insertion order is semantic and must survive the FFI
-/// crossing.
-#[allow(clippy::too_many_arguments)]
-pub fn analyze_names(
-    py: Python<'_>,
-    type_tag: NameTypeTag,
-    names: Vec<String>,
-    part_tags: Vec<(NamePartTag, Vec<String>)>,
-    infer_initials: bool,
-    symbols: bool,
-    phonetics: bool,
-    numerics: bool,
-    consolidate: bool,
-    rewrite: bool,
-) -> PyResult<Py<PySet>> {
+/// ENT inputs get both tagger passes here; whether the person hits
+/// are applied is decided in [`resolve`] once the org spans exist.
+fn prepare_names(type_tag: NameTypeTag, names: &[String], opts: AnalyzeOptions) -> Vec<NameDraft> {
     let mut seen: HashSet<String> = HashSet::new();
-    let mut built: Vec<Py<Name>> = Vec::with_capacity(names.len());
+    let mut drafts: Vec<NameDraft> = Vec::with_capacity(names.len());
 
     for raw in names {
-        let working = if rewrite && matches!(type_tag, NameTypeTag::PER) {
-            remove_person_prefixes(&raw)
+        let working = if opts.rewrite && matches!(type_tag, NameTypeTag::PER) {
+            remove_person_prefixes(raw)
         } else {
-            raw
+            raw.clone()
         };
         let mut form = casefold(&working);
-        if rewrite && matches!(type_tag, NameTypeTag::ORG | NameTypeTag::ENT) {
+        if opts.rewrite && matches!(type_tag, NameTypeTag::ORG | NameTypeTag::ENT) {
             form = org_types::replace_compare(&form, Normalize::CASEFOLD, Cleanup::Noop, false);
             form = remove_org_prefixes(&form);
-        } else if rewrite && matches!(type_tag, NameTypeTag::OBJ) {
+        } else if opts.rewrite && matches!(type_tag, NameTypeTag::OBJ) {
             form = remove_obj_prefixes(&form);
         }
         if form.is_empty() || seen.contains(&form) {
@@ -142,42 +173,90 @@ pub fn analyze_names(
         }
         seen.insert(form.clone());
 
-        // Construct Name (which tokenises internally). `working` is
-        // the post-prefix-strip raw; Name's `original` remembers it.
-        let name_obj = Name::new(py, &working, Some(&form), type_tag, phonetics)?;
-        let name_py = Py::new(py, name_obj)?;
+        let parts: Vec<PartData> = tokenize_name(&form, 1)
+            .iter()
+            .enumerate()
+            .map(|(i, token)| {
+                PartData::compute(token, i as u32, NamePartTag::UNSET, opts.phonetics)
+            })
+            .collect();
+
+        let (mut org_matches, mut person_matches) = (Vec::new(), Vec::new());
+        if opts.symbols {
+            let norm_form = parts
+                .iter()
+                .map(|p| p.form.as_str())
+                .collect::<Vec<_>>()
+                .join(" ");
+            if matches!(type_tag, NameTypeTag::ORG | NameTypeTag::ENT) {
+                org_matches = get_tagger(TaggerKind::Org, TAGGER_FLAGS).tag(&norm_form);
+            }
+            if matches!(type_tag, NameTypeTag::PER | NameTypeTag::ENT) {
+                person_matches = get_tagger(TaggerKind::Person, TAGGER_FLAGS).tag(&norm_form);
+            }
+        }
+
+        drafts.push(NameDraft {
+            original: working,
+            form,
+            parts,
+            org_matches,
+            person_matches,
+        });
+    }
+    drafts
+}
+
+/// Pipeline steps 6–10: apply `part_tags`, attach the tagger hits
+/// and run the inference and consolidation passes.
+fn resolve(
+    type_tag: NameTypeTag,
+    drafts: Vec<NameDraft>,
+    part_tags: &[(NamePartTag, Vec<String>)],
+    opts: AnalyzeOptions,
+) -> Vec<NameData> {
+    let mut built: Vec<NameData> = Vec::with_capacity(drafts.len());
+
+    for draft in drafts {
+        // `original` is the post-prefix-strip raw; Name remembers it.
+        let mut name = NameData {
+            original: draft.original,
+            form: draft.form,
+            tag: type_tag,
+            parts: draft.parts,
+            spans: Vec::new(),
+        };
 
         // Apply part_tags — each value is prenormalised then fed to
-        // Name.tag_text, which tokenises + walks parts.
-        for (tag, values) in &part_tags {
+        // tag_text, which tokenises + walks parts.
+        for (tag, values) in part_tags {
             for value in values {
-                let folded = casefold(value);
-                name_py.bind(py).borrow().tag_text(py, &folded, *tag, 1)?;
+                name.tag_text(&casefold(value), *tag, 1);
             }
         }
 
-        if symbols {
+        if opts.symbols {
             match type_tag {
                 NameTypeTag::PER => {
-                    apply_initial_preamble(py, &name_py, infer_initials)?;
-                    apply_tagger(py, &name_py, TaggerKind::Person)?;
+                    apply_initial_preamble(&mut name, opts.infer_initials);
+                    apply_matches(&mut name, &draft.person_matches);
                 }
                 NameTypeTag::ORG => {
-                    apply_tagger(py, &name_py, TaggerKind::Org)?;
+                    apply_matches(&mut name, &draft.org_matches);
                 }
                 NameTypeTag::ENT => {
                     // Org tagger first; if its ORG_CLASS evidence is
                     // strong enough to upgrade ENT→ORG, the structural
                     // signal wins and we don't sprinkle person-name
                     // symbols over what's clearly an organisation
-                    // ("Eli Lilly LLP"). Otherwise run the person
-                    // tagger to surface NAME / honorific / patronymic
-                    // evidence; the tag stays ENT.
-                    apply_tagger(py, &name_py, TaggerKind::Org)?;
-                    if upgrade_ent_to_org(py, &name_py)? {
-                        name_py.bind(py).borrow_mut().tag = NameTypeTag::ORG;
+                    // ("Eli Lilly LLP"). Otherwise apply the person
+                    // tagger hits to surface NAME / honorific /
+                    // patronymic evidence; the tag stays ENT.
+                    apply_matches(&mut name, &draft.org_matches);
+                    if upgrade_ent_to_org(&name) {
+                        name.tag = NameTypeTag::ORG;
                     } else {
-                        apply_tagger(py, &name_py, TaggerKind::Person)?;
+                        apply_matches(&mut name, &draft.person_matches);
                     }
                 }
                 NameTypeTag::OBJ | NameTypeTag::UNK => {
@@ -186,103 +265,154 @@ pub fn analyze_names(
             }
         }
 
-        infer_part_tags(py, &name_py, symbols, numerics)?;
-        built.push(name_py);
+        infer_part_tags(&mut name, opts.symbols, opts.numerics);
+        built.push(name);
     }
 
-    if consolidate {
-        consolidate_names(py, built)
+    if opts.consolidate {
+        consolidate_names(built)
     } else {
-        let out = PySet::empty(py)?;
-        for n in &built {
-            out.add(n.clone_ref(py))?;
-        }
-        Ok(out.unbind())
+        built
     }
 }
 
+/// The whole pipeline for one entity's names.
+pub(crate) fn analyze_entity(
+    type_tag: NameTypeTag,
+    names: &[String],
+    part_tags: &[(NamePartTag, Vec<String>)],
+    opts: AnalyzeOptions,
+) -> Vec<NameData> {
+    resolve(
+        type_tag,
+        prepare_names(type_tag, names, opts),
+        part_tags,
+        opts,
+    )
+}
+
+/// Build the taggers `opts` needs before a batch, so the workers
+/// don't all block on the cache's write lock racing to construct
+/// them.
+pub(crate) fn warm_taggers(opts: AnalyzeOptions) {
+    if opts.symbols {
+        get_tagger(TaggerKind::Org, TAGGER_FLAGS);
+        get_tagger(TaggerKind::Person, TAGGER_FLAGS);
+    }
+}
+
+fn into_set(py: Python<'_>, names: Vec<NameData>) -> PyResult<Py<PySet>> {
+    let out = PySet::empty(py)?;
+    for name in names {
+        out.add(name.into_py(py)?)?;
+    }
+    Ok(out.unbind())
+}
+
+/// Public entry point — called from PyO3 `py_analyze_names`. See the
+/// Python-side docstring at `rigour/names/analyze.py::analyze_names`
+/// for the semantic spec. Everything but the `Name` construction
+/// runs with the GIL released.
+///
+/// `part_tags` is an ordered sequence, not a map: tag application
+/// is first-writer-wins (a later compatible tag no-ops, an
+/// incompatible one flips the part to AMBIGUOUS), so the caller's
+/// dict insertion order is semantic and must survive the FFI
+/// crossing.
+pub fn analyze_names(
+    py: Python<'_>,
+    type_tag: NameTypeTag,
+    names: Vec<String>,
+    part_tags: Vec<(NamePartTag, Vec<String>)>,
+    opts: AnalyzeOptions,
+) -> PyResult<Py<PySet>> {
+    let data = py.detach(|| analyze_entity(type_tag, &names, &part_tags, opts));
+    into_set(py, data)
+}
+
+/// Batch form of [`analyze_names`] without the objects: one list of
+/// analysed names per entity, in input order, computed on up to
+/// `threads` workers. Callers release the GIL around it.
+pub(crate) fn analyze_entities(
+    entities: &[(NameTypeTag, Vec<String>)],
+    part_tags: &[Vec<(NamePartTag, Vec<String>)>],
+    opts: AnalyzeOptions,
+    threads: usize,
+) -> Vec<Vec<NameData>> {
+    warm_taggers(opts);
+    let jobs: Vec<_> = entities.iter().zip(part_tags).collect();
+    parallel::map_ordered(&jobs, threads, |(entity, tags)| {
+        analyze_entity(entity.0, &entity.1, tags, opts)
+    })
+}
+
+/// Batch form of [`analyze_names`]: one result set per entity, in
+/// input order. The analysis runs for all entities on up to
+/// `threads` workers with the GIL released; the `Name` objects are
+/// then built entity by entity on the calling thread.
+pub fn analyze_names_batch(
+    py: Python<'_>,
+    entities: Vec<(NameTypeTag, Vec<String>)>,
+    part_tags: Vec<Vec<(NamePartTag, Vec<String>)>>,
+    opts: AnalyzeOptions,
+    threads: usize,
+) -> PyResult<Vec<Py<PySet>>> {
+    let data = py.detach(|| analyze_entities(&entities, &part_tags, opts, threads));
+    data.into_iter().map(|names| into_set(py, names)).collect()
+}
+
 /// INITIAL-symbol pre-pass for PER names. Attaches `INITIAL:<char>`
 /// to single-character latin parts (when `infer_initials`) or to
 /// parts already tagged with one of [`INITIAL_TAGS`] (GIVEN,
 /// MIDDLE, PATRONYMIC, MATRONYMIC). Runs before the AC tagger so
 /// INITIAL symbols are visible to downstream matchers that
 /// compare against spelled-out given names.
-fn apply_initial_preamble(py: Python<'_>, name: &Py<Name>, infer_initials: bool) -> PyResult<()> {
-    let parts_list = name.bind(py).borrow().parts.clone_ref(py);
-    for item in parts_list.bind(py).iter() {
-        let part_py = item.cast::<NamePart>()?;
-        let part = part_py.borrow();
+fn apply_initial_preamble(name: &mut NameData, infer_initials: bool) {
+    for idx in 0..name.parts.len() {
+        let part = &name.parts[idx];
         if !part.latinize {
             continue;
         }
-        let Some(first_char) = part.comparable_str().chars().next() else {
+        let Some(first_char) = part.comparable.chars().next() else {
             continue;
         };
-        let sym_id = first_char.to_string();
-        let sym = Symbol::from_str(SymbolCategory::INITIAL, &sym_id);
-        let sym_py = Py::new(py, sym)?;
-
-        let form_str = part.form_str().to_string();
-        let tag = part.tag;
-        drop(part);
-
-        let apply = if infer_initials && form_str.chars().count() == 1 {
+        let apply = if infer_initials && part.form.chars().count() == 1 {
             true
         } else {
-            INITIAL_TAGS.contains(&tag)
+            INITIAL_TAGS.contains(&part.tag)
         };
         if apply {
-            let part_ref = part_py.clone().unbind();
-            name.bind(py).borrow().apply_part(py, part_ref, sym_py)?;
+            let sym = Symbol::from_str(SymbolCategory::INITIAL, &first_char.to_string());
+            name.apply_part(idx as u32, sym);
         }
     }
-    Ok(())
 }
 
-/// Run the AC tagger for `kind`, applying every (phrase, symbol) match
-/// to `name` via `apply_phrase`.
-fn apply_tagger(py: Python<'_>, name: &Py<Name>, kind: TaggerKind) -> PyResult<()> {
-    let norm_form: String = name.bind(py).borrow().norm_form.bind(py).extract()?;
-    let tagger = get_tagger(kind, TAGGER_FLAGS);
-    let matches = tagger.tag(&norm_form);
+/// Attach precomputed tagger hits to `name` via `apply_phrase`.
+fn apply_matches(name: &mut NameData, matches: &[(String, Symbol)]) {
     for (phrase, symbol) in matches {
-        let sym_py = Py::new(py, symbol)?;
-        name.bind(py).borrow().apply_phrase(py, &phrase, sym_py)?;
+        name.apply_phrase(phrase, symbol);
     }
-    Ok(())
 }
 
 /// Decide whether the ENT→ORG upgrade fires based on the org tagger's
 /// output already attached to `name`. Returns `true` iff there is at
-/// least one `ORG_CLASS` span whose combined `form_str` char count
+/// least one `ORG_CLASS` span whose combined `form` char count
 /// meets [`ORG_CLASS_UPGRADE_MIN_CHARS`]. Used as a routing gate on
 /// ENT inputs to skip the person tagger when the structural ORG
 /// signal is strong.
-fn upgrade_ent_to_org(py: Python<'_>, name: &Py<Name>) -> PyResult<bool> {
-    let name_ref = name.bind(py).borrow();
-    let spans = name_ref.spans.bind(py);
-    for span_item in spans.iter() {
-        let span = span_item.cast::<Span>()?.borrow();
-        let sym = span.symbol.bind(py).borrow();
-        if !matches!(sym.category, SymbolCategory::ORG_CLASS) {
-            continue;
+fn upgrade_ent_to_org(name: &NameData) -> bool {
+    name.spans.iter().any(|span| {
+        if !matches!(span.symbol.category, SymbolCategory::ORG_CLASS) {
+            return false;
         }
         let span_len: usize = span
             .parts
-            .bind(py)
             .iter()
-            .map(|p| {
-                p.cast::<NamePart>()
-                    .ok()
-                    .map(|b| b.borrow().form_str().chars().count())
-                    .unwrap_or(0)
-            })
+            .map(|&i| name.parts[i as usize].form.chars().count())
             .sum();
-        if span_len >= ORG_CLASS_UPGRADE_MIN_CHARS {
-            return Ok(true);
-        }
-    }
-    Ok(false)
+        span_len >= ORG_CLASS_UPGRADE_MIN_CHARS
+    })
 }
 
 /// Post-tagger inference pass. Walks the spans produced by the
@@ -296,107 +426,91 @@ fn upgrade_ent_to_org(py: Python<'_>, name: &Py<Name>) -> PyResult<bool> {
 ///
 /// `symbols` gates NUMERIC-symbol emission: when `false`, NUM /
 /// STOP / LEGAL part-tag promotions still fire but no new Symbol
-/// is attached. Mutates the Name and its NamePart tags in place.
+/// is attached.
 ///
 /// The ENT→ORG upgrade is no longer made here — it has moved
 /// upstream into the tagger dispatch, where it acts as a routing
 /// gate that decides whether the person tagger runs (see
 /// [`upgrade_ent_to_org`]).
-fn infer_part_tags(py: Python<'_>, name: &Py<Name>, symbols: bool, numerics: bool) -> PyResult<()> {
+fn infer_part_tags(name: &mut NameData, symbols: bool, numerics: bool) {
     // First pass: walk spans, collect numeric-symbol parts, promote
     // ORG_CLASS-covered parts to LEGAL.
-    let mut numeric_part_hashes: HashSet<isize> = HashSet::new();
-    {
-        let name_ref = name.bind(py).borrow();
-        let spans = name_ref.spans.bind(py);
-        for span_item in spans.iter() {
-            let span = span_item.cast::<Span>()?.borrow();
-            let sym = span.symbol.bind(py).borrow();
-            match sym.category {
-                SymbolCategory::ORG_CLASS => {
-                    for p_item in span.parts.bind(py).iter() {
-                        let part_b = p_item.cast::<NamePart>()?;
-                        let part = part_b.borrow();
-                        if matches!(part.tag, NamePartTag::UNSET) {
-                            drop(part);
-                            part_b.borrow_mut().tag = NamePartTag::LEGAL;
-                        }
+    let mut numeric_parts: HashSet<u32> = HashSet::new();
+    for span in &name.spans {
+        match span.symbol.category {
+            SymbolCategory::ORG_CLASS => {
+                for &i in &span.parts {
+                    let part = &mut name.parts[i as usize];
+                    if matches!(part.tag, NamePartTag::UNSET) {
+                        part.tag = NamePartTag::LEGAL;
                     }
                 }
-                SymbolCategory::NUMERIC => {
-                    for p_item in span.parts.bind(py).iter() {
-                        let part_b = p_item.cast::<NamePart>()?;
-                        let h: isize = part_b.borrow().hash_isize();
-                        numeric_part_hashes.insert(h);
-                    }
-                }
-                _ => {}
             }
+            SymbolCategory::NUMERIC => numeric_parts.extend(&span.parts),
+            _ => {}
         }
     }
 
     // Second pass: walk parts, promote UNSET numerics → NUM (+ NUMERIC
     // symbol when `numerics`), UNSET stopwords → STOP.
-    let parts_list = name.bind(py).borrow().parts.clone_ref(py);
-    for item in parts_list.bind(py).iter() {
-        let part_b = item.cast::<NamePart>()?;
-        let (is_numeric, integer_val, form_str, current_tag, part_hash) = {
-            let p = part_b.borrow();
-            (
-                p.numeric,
-                p.integer,
-                p.form_str().to_string(),
-                p.tag,
-                p.hash_isize(),
-            )
-        };
-        if !matches!(current_tag, NamePartTag::UNSET) {
+    for idx in 0..name.parts.len() {
+        let part = &mut name.parts[idx];
+        if !matches!(part.tag, NamePartTag::UNSET) {
             continue;
         }
-        if is_numeric {
-            part_b.borrow_mut().tag = NamePartTag::NUM;
-            if symbols && numerics && !numeric_part_hashes.contains(&part_hash) {
-                if let Some(v) = integer_val {
-                    let sym = Symbol::from_i64(SymbolCategory::NUMERIC, v);
-                    let sym_py = Py::new(py, sym)?;
-                    let part_py = part_b.clone().unbind();
-                    name.bind(py).borrow().apply_part(py, part_py, sym_py)?;
+        if part.numeric {
+            part.tag = NamePartTag::NUM;
+            let integer = part.integer;
+            let index = idx as u32;
+            if symbols && numerics && !numeric_parts.contains(&index) {
+                if let Some(v) = integer {
+                    name.apply_part(index, Symbol::from_i64(SymbolCategory::NUMERIC, v));
                 }
-                numeric_part_hashes.insert(part_hash);
+                numeric_parts.insert(index);
             }
-        } else if is_stopword(&form_str) {
-            part_b.borrow_mut().tag = NamePartTag::STOP;
+        } else if is_stopword(&part.form) {
+            part.tag = NamePartTag::STOP;
         }
     }
-    Ok(())
 }
 
-/// `Name::consolidate_names` invoked through Rust code.
-fn consolidate_names(py: Python<'_>, names: Vec<Py<Name>>) -> PyResult<Py<PySet>> {
-    // Replicate the pymethod's HashSet logic here so we don't need
-    // to go through `PyAny.try_iter`.
+/// Drop names contained in another name of the set, as
+/// `Name.consolidate_names` does.
+fn consolidate_names(names: Vec<NameData>) -> Vec<NameData> {
     let len = names.len();
-    let mut kept: HashSet<usize> = (0..len).collect();
+    let mut kept = vec![true; len];
     for i in 0..len {
-        if !kept.contains(&i) {
+        if !kept[i] {
             continue;
         }
-        let name_i = names[i].bind(py).borrow();
-        for (j, other) in names.iter().enumerate() {
-            if i == j {
-                continue;
-            }
-            let name_j = other.bind(py).borrow();
-            if name_i.contains(py, name_j)? {
-                kept.remove(&j);
+        for j in 0..len {
+            if i != j && names[i].contains(&names[j]) {
+                kept[j] = false;
             }
         }
     }
-    let out = PySet::empty(py)?;
-    for idx in &kept {
-        out.add(names[*idx].clone_ref(py))?;
+    names
+        .into_iter()
+        .zip(kept)
+        .filter_map(|(name, keep)| keep.then_some(name))
+        .collect()
+}
+
+/// Read a `part_tags` dict into an ordered tag list. Iterates the
+/// dict rather than extracting a HashMap: PyDict iteration follows
+/// Python's insertion order, which is load-bearing for
+/// first-writer-wins tag application.
+pub(crate) fn extract_part_tags(
+    part_tags: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<(NamePartTag, Vec<String>)>> {
+    let mut tags: Vec<(NamePartTag, Vec<String>)> = Vec::new();
+    if let Some(dict) = part_tags {
+        tags.reserve(dict.len());
+        for (key, value) in dict.iter() {
+            tags.push((key.extract()?, value.extract()?));
+        }
     }
-    Ok(out.unbind())
+    Ok(tags)
 }
 
 /// PyO3 wrapper.
@@ -416,26 +530,102 @@ pub fn py_analyze_names(
     consolidate: bool,
     rewrite: bool,
 ) -> PyResult<Py<PySet>> {
-    // Convert by iterating the dict, not by extracting a HashMap:
-    // PyDict iteration follows Python's insertion order, which is
-    // load-bearing for first-writer-wins tag application.
-    let mut tags: Vec<(NamePartTag, Vec<String>)> = Vec::new();
-    if let Some(dict) = &part_tags {
-        tags.reserve(dict.len());
-        for (key, value) in dict.iter() {
-            tags.push((key.extract()?, value.extract()?));
-        }
-    }
-    analyze_names(
-        py,
-        type_tag,
-        names,
-        tags,
+    let tags = extract_part_tags(part_tags.as_ref())?;
+    let opts = AnalyzeOptions {
         infer_initials,
         symbols,
         phonetics,
         numerics,
         consolidate,
         rewrite,
-    )
+    };
+    analyze_names(py, type_tag, names, tags, opts)
+}
+
+/// PyO3 wrapper for the batch path. `part_tags`, when given, must be
+/// the same length as `type_tags` / `names`; `None` entries mean no
+/// part tags for that entity. `threads=None` uses the machine's
+/// available parallelism.
+#[pyfunction]
+#[pyo3(name = "analyze_names_batch")]
+#[pyo3(signature = (type_tags, names, part_tags = None, *, infer_initials = false, symbols = true, phonetics = true, numerics = true, consolidate = true, rewrite = true, threads = None))]
+#[allow(clippy::too_many_arguments)]
+pub fn py_analyze_names_batch(
+    py: Python<'_>,
+    type_tags: Vec<NameTypeTag>,
+    names: Vec<Vec<String>>,
+    part_tags: Option<Vec<Option<Bound<'_, PyDict>>>>,
+    infer_initials: bool,
+    symbols: bool,
+    phonetics: bool,
+    numerics: bool,
+    consolidate: bool,
+    rewrite: bool,
+    threads: Option<usize>,
+) -> PyResult<Vec<Py<PySet>>> {
+    let (entities, tags) = batch_inputs(type_tags, names, part_tags)?;
+    let opts = AnalyzeOptions {
+        infer_initials,
+        symbols,
+        phonetics,
+        numerics,
+        consolidate,
+        rewrite,
+    };
+    let threads = threads.unwrap_or_else(parallel::default_threads).max(1);
+    analyze_names_batch(py, entities, tags, opts, threads)
+}
+
+/// Check the batch entry points' parallel arguments and pair each
+/// entity's type tag with its names. `part_tags`, when given, must be
+/// the same length as `type_tags` / `names`; `None` entries mean no
+/// part tags for that entity.
+#[allow(clippy::type_complexity)]
+pub(crate) fn batch_inputs(
+    type_tags: Vec<NameTypeTag>,
+    names: Vec<Vec<String>>,
+    part_tags: Option<Vec<Option<Bound<'_, PyDict>>>>,
+) -> PyResult<(
+    Vec<(NameTypeTag, Vec<String>)>,
+    Vec<Vec<(NamePartTag, Vec<String>)>>,
+)> {
+    if type_tags.len() != names.len() {
+        return Err(PyValueError::new_err(format!(
+            "type_tags and names differ in length: {} != {}",
+            type_tags.len(),
+            names.len()
+        )));
+    }
+    let tags: Vec<Vec<(NamePartTag, Vec<String>)>> = match part_tags {
+        Some(dicts) => {
+            if dicts.len() != names.len() {
+                return Err(PyValueError::new_err(format!(
+                    "part_tags and names differ in length: {} != {}",
+                    dicts.len(),
+                    names.len()
+                )));
+            }
+            dicts
+                .iter()
+                .map(|d| extract_part_tags(d.as_ref()))
+                .collect::<PyResult<_>>()?
+        }
+        None => vec![Vec::new(); names.len()],
+    };
+    Ok((type_tags.into_iter().zip(names).collect(), tags))
+}
+
+/// Write the tagger images `analyze_names` loads from
+/// `RIGOUR_TAGGER_CACHE` into `directory`, building the taggers if
+/// this process has not yet. Returns the image paths.
+#[pyfunction]
+#[pyo3(name = "save_tagger_images")]
+pub fn py_save_tagger_images(
+    py: Python<'_>,
+    directory: std::path::PathBuf,
+) -> PyResult<Vec<String>> {
+    let paths = py
+        .detach(|| save_images(&directory, TAGGER_FLAGS))
+        .map_err(|e| PyOSError::new_err(format!("{}: {}", directory.display(), e)))?;
+    Ok(paths.iter().map(|p| p.display().to_string()).collect())
 }
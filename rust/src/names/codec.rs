@@ -0,0 +1,565 @@
+//! Compact binary codec for analysed [`Name`]s.
+//!
+//! Stores everything `analyze_names` produced — forms, part tags,
+//! the derived per-part fields (`ascii`, `comparable`, `integer`,
+//! `metaphone`) and the tagger spans as part indices + symbol — so
+//! decoding never re-runs transliteration, phonetics or the tagger.
+//! Used by `Name.to_bytes` / `Name.from_bytes`, `Name.__reduce__`
+//! (pickle) and the bulk `dump_names` / `load_names`.
+//!
+//! Layout (all integers unsigned LEB128 varints unless noted):
+//!
+//! ```text
+//! blob    := "RGN" version:u8 count name*count
+//! name    := original:str form:str type_tag:u8 nparts part*nparts
+//!            nspans span*nspans
+//! part    := form:str tag:u8 flags:u8 [ascii:str] [integer:i64le]
+//!            [comparable:str] [metaphone:str]
+//! span    := category:u8 id:str nidx index*nidx
+//! str     := len utf8-bytes
+//! ```
+//!
+//! `flags` carries `latinize` / `numeric`, presence bits for the
+//! optional fields, and three "comparable is derivable" bits — for
+//! nearly every part `comparable` equals `ascii`, `form` or the
+//! integer's decimal string, so it is only stored when it doesn't.
+//! Part `index` is implied by position. Enum tags are encoded as
+//! their declaration ordinal; the `*_CODES` tables below pin that
+//! order and must only ever be appended to.
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+use crate::names::name::{Name, NameData};
+use crate::names::part::{NamePart, PartData, Span, SpanData};
+use crate::names::symbol::{Symbol, SymbolCategory};
+use crate::names::tag::{NamePartTag, NameTypeTag};
+
+const MAGIC: &[u8; 3] = b"RGN";
+const VERSION: u8 = 1;
+
+const F_LATINIZE: u8 = 1;
+const F_NUMERIC: u8 = 1 << 1;
+const F_ASCII: u8 = 1 << 2;
+const F_INTEGER: u8 = 1 << 3;
+const F_METAPHONE: u8 = 1 << 4;
+const F_CMP_ASCII: u8 = 1 << 5;
+const F_CMP_FORM: u8 = 1 << 6;
+const F_CMP_INTEGER: u8 = 1 << 7;
+
+pub(crate) const TYPE_TAG_CODES: [NameTypeTag; 5] = [
+    NameTypeTag::UNK,
+    NameTypeTag::ENT,
+    NameTypeTag::PER,
+    NameTypeTag::ORG,
+    NameTypeTag::OBJ,
+];
+
+pub(crate) const PART_TAG_CODES: [NamePartTag; 15] = [
+    NamePartTag::UNSET,
+    NamePartTag::AMBIGUOUS,
+    NamePartTag::TITLE,
+    NamePartTag::GIVEN,
+    NamePartTag::MIDDLE,
+    NamePartTag::FAMILY,
+    NamePartTag::TRIBAL,
+    NamePartTag::PATRONYMIC,
+    NamePartTag::MATRONYMIC,
+    NamePartTag::HONORIFIC,
+    NamePartTag::SUFFIX,
+    NamePartTag::NICK,
+    NamePartTag::STOP,
+    NamePartTag::NUM,
+    NamePartTag::LEGAL,
+];
+
+pub(crate) const CATEGORY_CODES: [SymbolCategory; 9] = SymbolCategory::ALL;
+
+// --- writing ---------------------------------------------------------
+
+fn put_varint(out: &mut Vec<u8>, mut v: u64) {
+    while v >= 0x80 {
+        out.push((v as u8) | 0x80);
+        v >>= 7;
+    }
+    out.push(v as u8);
+}
+
+fn put_str(out: &mut Vec<u8>, s: &str) {
+    put_varint(out, s.len() as u64);
+    out.extend_from_slice(s.as_bytes());
+}
+
+fn put_header(out: &mut Vec<u8>, count: usize) {
+    out.extend_from_slice(MAGIC);
+    out.push(VERSION);
+    put_varint(out, count as u64);
+}
+
+/// The fields of a part that get written, borrowed from either a
+/// `NamePart` or a [`PartData`].
+struct PartFields<'a> {
+    form: &'a str,
+    tag: NamePartTag,
+    latinize: bool,
+    numeric: bool,
+    ascii: Option<&'a str>,
+    integer: Option<i64>,
+    comparable: &'a str,
+    metaphone: Option<&'a str>,
+}
+
+impl<'a> PartFields<'a> {
+    fn of_part(py: Python<'_>, part: &'a NamePart) -> PyResult<Self> {
+        let ascii = match &part.ascii {
+            Some(a) => Some(a.bind(py).to_str()?),
+            None => None,
+        };
+        let metaphone = match &part.metaphone {
+            Some(m) => Some(m.bind(py).to_str()?),
+            None => None,
+        };
+        Ok(Self {
+            form: part.form_str(),
+            tag: part.tag,
+            latinize: part.latinize,
+            numeric: part.numeric,
+            ascii,
+            integer: part.integer,
+            comparable: part.comparable_str(),
+            metaphone,
+        })
+    }
+
+    fn of_data(part: &'a PartData) -> Self {
+        Self {
+            form: &part.form,
+            tag: part.tag,
+            latinize: part.latinize,
+            numeric: part.numeric,
+            ascii: part.ascii.as_deref(),
+            integer: part.integer,
+            comparable: &part.comparable,
+            metaphone: part.metaphone.as_deref(),
+        }
+    }
+}
+
+fn put_part(out: &mut Vec<u8>, part: PartFields<'_>) {
+    let PartFields {
+        form,
+        tag,
+        latinize,
+        numeric,
+        ascii,
+        integer,
+        comparable,
+        metaphone,
+    } = part;
+
+    let mut flags = 0u8;
+    if latinize {
+        flags |= F_LATINIZE;
+    }
+    if numeric {
+        flags |= F_NUMERIC;
+    }
+    if ascii.is_some() {
+        flags |= F_ASCII;
+    }
+    if integer.is_some() {
+        flags |= F_INTEGER;
+    }
+    if metaphone.is_some() {
+        flags |= F_METAPHONE;
+    }
+    if ascii == Some(comparable) {
+        flags |= F_CMP_ASCII;
+    } else if form == comparable {
+        flags |= F_CMP_FORM;
+    } else if integer.is_some_and(|i| i.to_string() == comparable) {
+        flags |= F_CMP_INTEGER;
+    }
+
+    put_str(out, form);
+    out.push(tag as u8);
+    out.push(flags);
+    if let Some(a) = ascii {
+        put_str(out, a);
+    }
+    if let Some(i) = integer {
+        out.extend_from_slice(&i.to_le_bytes());
+    }
+    if flags & (F_CMP_ASCII | F_CMP_FORM | F_CMP_INTEGER) == 0 {
+        put_str(out, comparable);
+    }
+    if let Some(m) = metaphone {
+        put_str(out, m);
+    }
+}
+
+fn put_span(out: &mut Vec<u8>, symbol: &Symbol, indices: &[u32]) {
+    out.push(symbol.category as u8);
+    put_str(out, &symbol.id);
+    put_varint(out, indices.len() as u64);
+    for index in indices {
+        put_varint(out, *index as u64);
+    }
+}
+
+fn put_name(py: Python<'_>, out: &mut Vec<u8>, name: &Name) -> PyResult<()> {
+    put_str(out, name.original.bind(py).to_str()?);
+    put_str(out, name.form_str());
+    out.push(name.tag as u8);
+
+    let parts = name.parts.bind(py);
+    put_varint(out, parts.len() as u64);
+    for item in parts.iter() {
+        let part = item.cast::<NamePart>()?.borrow();
+        put_part(out, PartFields::of_part(py, &part)?);
+    }
+
+    let spans = name.spans.bind(py);
+    put_varint(out, spans.len() as u64);
+    for item in spans.iter() {
+        let span = item.cast::<Span>()?.borrow();
+        let mut indices = Vec::new();
+        for p in span.parts.bind(py).iter() {
+            let index = p.cast::<NamePart>()?.borrow().index;
+            if index as usize >= parts.len() {
+                return Err(PyValueError::new_err(
+                    "span references a part outside its name",
+                ));
+            }
+            indices.push(index);
+        }
+        put_span(out, &span.symbol.bind(py).borrow(), &indices);
+    }
+    Ok(())
+}
+
+fn put_name_data(out: &mut Vec<u8>, name: &NameData) {
+    put_str(out, &name.original);
+    put_str(out, &name.form);
+    out.push(name.tag as u8);
+    put_varint(out, name.parts.len() as u64);
+    for part in &name.parts {
+        put_part(out, PartFields::of_data(part));
+    }
+    put_varint(out, name.spans.len() as u64);
+    for span in &name.spans {
+        put_span(out, &span.symbol, &span.parts);
+    }
+}
+
+/// Encode `names` into one blob.
+pub fn encode<'a>(
+    py: Python<'_>,
+    names: impl ExactSizeIterator<Item = &'a Name>,
+) -> PyResult<Vec<u8>> {
+    let mut out = Vec::with_capacity(64 * names.len());
+    put_header(&mut out, names.len());
+    for name in names {
+        put_name(py, &mut out, name)?;
+    }
+    Ok(out)
+}
+
+/// Encode plain-Rust names into one blob, without the GIL.
+pub(crate) fn encode_data(names: &[NameData]) -> Vec<u8> {
+    let mut out = Vec::with_capacity(64 * names.len());
+    put_header(&mut out, names.len());
+    for name in names {
+        put_name_data(&mut out, name);
+    }
+    out
+}
+
+// --- reading ---------------------------------------------------------
+
+struct Reader<'a> {
+    buf: &'a [u8],
+    pos: usize,
+}
+
+type Decoded<T> = Result<T, String>;
+
+impl<'a> Reader<'a> {
+    fn u8(&mut self) -> Decoded<u8> {
+        let b = *self.buf.get(self.pos).ok_or("truncated name data")?;
+        self.pos += 1;
+        Ok(b)
+    }
+
+    fn varint(&mut self) -> Decoded<u64> {
+        let mut v: u64 = 0;
+        for shift in (0..64).step_by(7) {
+            let b = self.u8()?;
+            v |= u64::from(b & 0x7f) << shift;
+            if b & 0x80 == 0 {
+                return Ok(v);
+            }
+        }
+        Err("malformed varint in name data".into())
+    }
+
+    fn count(&mut self) -> Decoded<usize> {
+        let n = self.varint()? as usize;
+        // Every counted item takes at least one byte, so a count past
+        // the remaining input is corrupt — reject before allocating.
+        if n > self.buf.len() - self.pos {
+            return Err("truncated name data".into());
+        }
+        Ok(n)
+    }
+
+    fn bytes(&mut self, n: usize) -> Decoded<&'a [u8]> {
+        let end = self.pos.checked_add(n).filter(|&e| e <= self.buf.len());
+        let end = end.ok_or("truncated name data")?;
+        let out = &self.buf[self.pos..end];
+        self.pos = end;
+        Ok(out)
+    }
+
+    fn str(&mut self) -> Decoded<String> {
+        let n = self.count()?;
+        let raw = self.bytes(n)?;
+        String::from_utf8(raw.to_vec()).map_err(|_| "invalid UTF-8 in name data".into())
+    }
+
+    fn i64(&mut self) -> Decoded<i64> {
+        let raw = self.bytes(8)?;
+        Ok(i64::from_le_bytes(raw.try_into().expect("8 bytes")))
+    }
+
+    fn code<T: Copy>(&mut self, table: &[T], what: &str) -> Decoded<T> {
+        let c = self.u8()? as usize;
+        table
+            .get(c)
+            .copied()
+            .ok_or_else(|| format!("unknown {what} code {c} in name data"))
+    }
+
+    fn part(&mut self, index: u32) -> Decoded<PartData> {
+        let form = self.str()?;
+        let tag = self.code(&PART_TAG_CODES, "part tag")?;
+        let flags = self.u8()?;
+        let ascii = if flags & F_ASCII != 0 {
+            Some(self.str()?)
+        } else {
+            None
+        };
+        let integer = if flags & F_INTEGER != 0 {
+            Some(self.i64()?)
+        } else {
+            None
+        };
+        let comparable = if flags & F_CMP_ASCII != 0 {
+            ascii
+                .clone()
+                .ok_or("comparable refers to a missing ascii form")?
+        } else if flags & F_CMP_FORM != 0 {
+            form.clone()
+        } else if flags & F_CMP_INTEGER != 0 {
+            integer
+                .ok_or("comparable refers to a missing integer")?
+                .to_string()
+        } else {
+            self.str()?
+        };
+        let metaphone = if flags & F_METAPHONE != 0 {
+            Some(self.str()?)
+        } else {
+            None
+        };
+        Ok(PartData {
+            form,
+            index,
+            tag,
+            latinize: flags & F_LATINIZE != 0,
+            numeric: flags & F_NUMERIC != 0,
+            ascii,
+            integer,
+            comparable,
+            metaphone,
+        })
+    }
+
+    fn name(&mut self) -> Decoded<NameData> {
+        let original = self.str()?;
+        let form = self.str()?;
+        let tag = self.code(&TYPE_TAG_CODES, "name type")?;
+        let nparts = self.count()?;
+        let mut parts = Vec::with_capacity(nparts);
+        for i in 0..nparts {
+            parts.push(self.part(i as u32)?);
+        }
+        let nspans = self.count()?;
+        let mut spans = Vec::with_capacity(nspans);
+        for _ in 0..nspans {
+            let category = self.code(&CATEGORY_CODES, "symbol category")?;
+            let id = self.str()?;
+            let nidx = self.count()?;
+            let mut idx = Vec::with_capacity(nidx);
+            for _ in 0..nidx {
+                let i = self.varint()?;
+                if i as usize >= nparts {
+                    return Err("span references a part outside its name".into());
+                }
+                idx.push(i as u32);
+            }
+            spans.push(SpanData {
+                parts: idx,
+                symbol: Symbol::from_str(category, &id),
+            });
+        }
+        Ok(NameData {
+            original,
+            form,
+            tag,
+            parts,
+            spans,
+        })
+    }
+}
+
+/// Parse a blob into plain-Rust names. Touches no Python objects.
+pub(crate) fn decode_data(data: &[u8]) -> Decoded<Vec<NameData>> {
+    let mut r = Reader { buf: data, pos: 0 };
+    if r.bytes(MAGIC.len()).ok() != Some(MAGIC.as_slice()) {
+        return Err("not rigour name data".into());
+    }
+    let version = r.u8()?;
+    if version != VERSION {
+        return Err(format!("unsupported name data version {version}"));
+    }
+    let count = r.count()?;
+    let mut out = Vec::with_capacity(count);
+    for _ in 0..count {
+        out.push(r.name()?);
+    }
+    if r.pos != data.len() {
+        return Err("trailing bytes after name data".into());
+    }
+    Ok(out)
+}
+
+/// Decode a blob into `Name` objects. Parsing runs with the GIL
+/// released; only object construction holds it.
+pub fn decode(py: Python<'_>, data: &[u8]) -> PyResult<Vec<Py<Name>>> {
+    let names = py
+        .detach(|| decode_data(data))
+        .map_err(PyValueError::new_err)?;
+    names.into_iter().map(|n| n.into_py(py)).collect()
+}
+
+/// Fingerprint of everything an analysed name depends on besides its
+/// inputs: the crate version, this codec's format version and the
+/// embedded data tables the pipeline reads (org types, tagger
+/// symbols, person names, territories, stopwords / prefixes,
+/// ordinals). Two builds
+/// with the same fingerprint produce byte-identical `dump_names`
+/// output for the same `analyze_names` call, so persistent caches of
+/// encoded names use it to invalidate themselves on upgrade.
+pub fn data_version() -> u64 {
+    // FNV-1a: stable across Rust releases, unlike `DefaultHasher`,
+    // and only run once per process.
+    const OFFSET: u64 = 0xcbf2_9ce4_8422_2325;
+    const PRIME: u64 = 0x0000_0100_0000_01b3;
+    let parts: [&[u8]; 9] = [
+        env!("CARGO_PKG_VERSION").as_bytes(),
+        &[VERSION],
+        crate::names::org_types::ORG_TYPES_ZST,
+        crate::names::symbols::SYMBOLS_ZST,
+        crate::names::person_names::COMPRESSED,
+        crate::territories::COMPRESSED,
+        crate::names::stopwords::JSON.as_bytes(),
+        crate::text::stopwords::JSON.as_bytes(),
+        crate::text::ordinals::JSON.as_bytes(),
+    ];
+    let mut h = OFFSET;
+    for part in parts {
+        // Length-prefix each segment so boundaries can't shift.
+        for b in (part.len() as u64).to_le_bytes().iter().chain(part) {
+            h ^= *b as u64;
+            h = h.wrapping_mul(PRIME);
+        }
+    }
+    h
+}
+
+/// Python-facing [`data_version`].
+#[pyfunction]
+#[pyo3(name = "name_data_version")]
+pub fn py_name_data_version() -> u64 {
+    data_version()
+}
+
+/// Encode a list of names into one blob — the bulk counterpart of
+/// `Name.to_bytes`, sharing its format.
+#[pyfunction]
+#[pyo3(name = "dump_names")]
+pub fn py_dump_names<'py>(
+    py: Python<'py>,
+    names: Vec<PyRef<'py, Name>>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let out = encode(py, names.iter().map(|n| &**n))?;
+    Ok(PyBytes::new(py, &out))
+}
+
+/// Decode a blob written by `dump_names` (or `Name.to_bytes`).
+#[pyfunction]
+#[pyo3(name = "load_names")]
+pub fn py_load_names(py: Python<'_>, data: &[u8]) -> PyResult<Vec<Py<Name>>> {
+    decode(py, data)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn data_version_is_stable() {
+        assert_eq!(data_version(), data_version());
+        assert_ne!(data_version(), 0);
+    }
+
+    #[test]
+    fn code_tables_match_declaration_order() {
+        for (i, t) in TYPE_TAG_CODES.iter().enumerate() {
+            assert_eq!(*t as usize, i);
+        }
+        for (i, t) in PART_TAG_CODES.iter().enumerate() {
+            assert_eq!(*t as usize, i);
+        }
+        for (i, c) in CATEGORY_CODES.iter().enumerate() {
+            assert_eq!(*c as usize, i);
+        }
+    }
+
+    #[test]
+    fn varint_roundtrip() {
+        for v in [0u64, 1, 127, 128, 300, u32::MAX as u64, u64::MAX] {
+            let mut out = Vec::new();
+            put_varint(&mut out, v);
+            let mut r = Reader { buf: &out, pos: 0 };
+            assert_eq!(r.varint().unwrap(), v);
+            assert_eq!(r.pos, out.len());
+        }
+    }
+
+    #[test]
+    fn rejects_bad_header() {
+        assert!(decode_data(b"").is_err());
+        assert!(decode_data(b"XYZ\x01\x00").is_err());
+        assert!(decode_data(b"RGN\x09\x00").is_err());
+        assert_eq!(decode_data(b"RGN\x01\x00").unwrap().len(), 0);
+    }
+
+    #[test]
+    fn rejects_truncated_count() {
+        // Claims one name but carries no bytes for it.
+        assert!(decode_data(b"RGN\x01\x01").is_err());
+    }
+}
@@ -0,0 +1,522 @@
+//! Columnar export of analysed [`Name`]s for bulk consumers.
+//!
+//! An indexer that reads `part.comparable`, `part.metaphone`,
+//! `part.tag` and `name.symbols` one attribute at a time pays a
+//! Python attribute lookup (and often a string INCREF) per field per
+//! part. [`NameColumns`] walks a batch of analysed names once, as
+//! plain-Rust [`NameData`], and lays the same data out as flat
+//! arrays: UTF-8 data
+//! buffers with Arrow-style `int32` offsets for the strings, `uint8`
+//! codes for the enums and CSR offset / index arrays for the
+//! name → part, name → span and span → part relations. Every array
+//! is a [`Column`], which exports itself through the buffer protocol
+//! — `memoryview(col)`, `numpy.frombuffer(col, …)` and
+//! `pyarrow.py_buffer(col)` all read the Rust allocation in place.
+//!
+//! Enum codes are the declaration ordinals pinned by the tables in
+//! [`crate::names::codec`]; `NameColumns.type_tags` /
+//! `part_tags` / `symbol_categories` map them back.
+//!
+//! `analyze_names_columns` runs the analysis pipeline straight into
+//! the columns: names go from the pipeline's `NameData` to the arrays
+//! with the GIL released, and no `Name` or `NamePart` object is ever
+//! built.
+
+use std::collections::HashMap;
+use std::ffi::{CStr, c_int, c_void};
+
+use pyo3::exceptions::{PyBufferError, PyValueError};
+use pyo3::ffi;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict};
+
+use crate::names::analyze::{self, AnalyzeOptions};
+use crate::names::codec::{self, CATEGORY_CODES, PART_TAG_CODES, TYPE_TAG_CODES};
+use crate::names::name::{Name, NameData};
+use crate::names::symbol::{Symbol, SymbolCategory};
+use crate::names::tag::{NamePartTag, NameTypeTag};
+use crate::parallel;
+
+/// Typed storage behind a [`Column`].
+enum ColumnData {
+    U8(Vec<u8>),
+    I32(Vec<i32>),
+}
+
+/// One read-only, one-dimensional array exported through the buffer
+/// protocol. `format` is `"B"` (`uint8`) or `"i"` (`int32`).
+#[pyclass(frozen, module = "rigour._core")]
+pub struct Column {
+    data: ColumnData,
+    // Backing storage for `Py_buffer.shape` / `.strides`, which must
+    // stay valid for as long as the exporter is alive.
+    shape: [ffi::Py_ssize_t; 1],
+    strides: [ffi::Py_ssize_t; 1],
+}
+
+impl Column {
+    fn new(data: ColumnData) -> Self {
+        let (len, itemsize) = match &data {
+            ColumnData::U8(v) => (v.len(), 1),
+            ColumnData::I32(v) => (v.len(), 4),
+        };
+        Self {
+            data,
+            shape: [len as ffi::Py_ssize_t],
+            strides: [itemsize],
+        }
+    }
+
+    fn format(&self) -> &'static CStr {
+        match self.data {
+            ColumnData::U8(_) => c"B",
+            ColumnData::I32(_) => c"i",
+        }
+    }
+
+    fn as_ptr(&self) -> *const c_void {
+        match &self.data {
+            ColumnData::U8(v) => v.as_ptr() as *const c_void,
+            ColumnData::I32(v) => v.as_ptr() as *const c_void,
+        }
+    }
+}
+
+#[pymethods]
+impl Column {
+    /// Element count.
+    fn __len__(&self) -> usize {
+        self.shape[0] as usize
+    }
+
+    /// Struct-module format character of the elements.
+    #[getter(format)]
+    fn py_format(&self) -> &'static str {
+        self.format().to_str().unwrap_or("B")
+    }
+
+    /// Bytes per element.
+    #[getter]
+    fn itemsize(&self) -> isize {
+        self.strides[0]
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<Column(format={:?}, len={})>",
+            self.py_format(),
+            self.shape[0]
+        )
+    }
+
+    /// Buffer protocol export. Read-only and C-contiguous; the view
+    /// holds a reference to the column, which keeps the storage alive.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("view is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("column is read-only"));
+        }
+        let col = slf.get();
+        unsafe {
+            (*view).buf = col.as_ptr() as *mut c_void;
+            (*view).len = col.shape[0] * col.strides[0];
+            (*view).readonly = 1;
+            (*view).itemsize = col.strides[0];
+            (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+                col.format().as_ptr() as *mut _
+            } else {
+                std::ptr::null_mut()
+            };
+            (*view).ndim = 1;
+            (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+                col.shape.as_ptr() as *mut _
+            } else {
+                std::ptr::null_mut()
+            };
+            (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+                col.strides.as_ptr() as *mut _
+            } else {
+                std::ptr::null_mut()
+            };
+            (*view).suboffsets = std::ptr::null_mut();
+            (*view).internal = std::ptr::null_mut();
+            (*view).obj = slf.into_any().into_ptr();
+        }
+        Ok(())
+    }
+}
+
+/// A UTF-8 string column under construction: Arrow `utf8` layout.
+struct StrColumn {
+    offsets: Vec<i32>,
+    data: Vec<u8>,
+}
+
+impl StrColumn {
+    fn new() -> Self {
+        Self {
+            offsets: vec![0],
+            data: Vec::new(),
+        }
+    }
+
+    fn push(&mut self, s: &str) -> PyResult<()> {
+        self.data.extend_from_slice(s.as_bytes());
+        self.offsets.push(offset(self.data.len())?);
+        Ok(())
+    }
+}
+
+fn offset(n: usize) -> PyResult<i32> {
+    i32::try_from(n).map_err(|_| PyValueError::new_err("name batch too large for int32 offsets"))
+}
+
+fn column(py: Python<'_>, data: ColumnData) -> PyResult<Py<Column>> {
+    Py::new(py, Column::new(data))
+}
+
+/// Flat, columnar view over a batch of analysed names. See the module
+/// docs for the layout; `*_offsets` arrays have one more entry than
+/// the rows they index.
+#[pyclass(frozen, module = "rigour._core")]
+pub struct NameColumns {
+    /// Names per entity: entity `e` owns names
+    /// `entity_name_offsets[e]..entity_name_offsets[e + 1]`.
+    #[pyo3(get)]
+    entity_name_offsets: Py<Column>,
+    /// `NameTypeTag` code per name.
+    #[pyo3(get)]
+    name_tag: Py<Column>,
+    #[pyo3(get)]
+    name_form_offsets: Py<Column>,
+    #[pyo3(get)]
+    name_form_data: Py<Column>,
+    /// Name → part CSR offsets into the part columns.
+    #[pyo3(get)]
+    name_part_offsets: Py<Column>,
+    /// Name → span CSR offsets into the span columns.
+    #[pyo3(get)]
+    name_span_offsets: Py<Column>,
+    /// `NamePartTag` code per part.
+    #[pyo3(get)]
+    part_tag: Py<Column>,
+    #[pyo3(get)]
+    part_form_offsets: Py<Column>,
+    #[pyo3(get)]
+    part_form_data: Py<Column>,
+    #[pyo3(get)]
+    part_comparable_offsets: Py<Column>,
+    #[pyo3(get)]
+    part_comparable_data: Py<Column>,
+    /// Metaphone keys; parts without one get an empty string and a
+    /// cleared bit in `part_metaphone_validity`.
+    #[pyo3(get)]
+    part_metaphone_offsets: Py<Column>,
+    #[pyo3(get)]
+    part_metaphone_data: Py<Column>,
+    /// Arrow validity bitmap (LSB-first) for the metaphone column.
+    #[pyo3(get)]
+    part_metaphone_validity: Py<Column>,
+    /// Span → part CSR offsets into `span_parts`.
+    #[pyo3(get)]
+    span_part_offsets: Py<Column>,
+    /// Global part row of each span member.
+    #[pyo3(get)]
+    span_parts: Py<Column>,
+    /// Symbol row per span.
+    #[pyo3(get)]
+    span_symbol: Py<Column>,
+    /// `SymbolCategory` code per distinct symbol.
+    #[pyo3(get)]
+    symbol_category: Py<Column>,
+    #[pyo3(get)]
+    symbol_id_offsets: Py<Column>,
+    #[pyo3(get)]
+    symbol_id_data: Py<Column>,
+    #[pyo3(get)]
+    num_entities: usize,
+    #[pyo3(get)]
+    num_names: usize,
+    #[pyo3(get)]
+    num_parts: usize,
+    #[pyo3(get)]
+    num_spans: usize,
+    #[pyo3(get)]
+    num_symbols: usize,
+}
+
+#[pymethods]
+impl NameColumns {
+    /// `NameTypeTag` members indexed by their `name_tag` code.
+    #[classattr]
+    fn type_tags() -> Vec<NameTypeTag> {
+        TYPE_TAG_CODES.to_vec()
+    }
+
+    /// `NamePartTag` members indexed by their `part_tag` code.
+    #[classattr]
+    fn part_tags() -> Vec<NamePartTag> {
+        PART_TAG_CODES.to_vec()
+    }
+
+    /// `SymbolCategory` members indexed by their `symbol_category` code.
+    #[classattr]
+    fn symbol_categories() -> Vec<SymbolCategory> {
+        CATEGORY_CODES.to_vec()
+    }
+
+    fn __len__(&self) -> usize {
+        self.num_names
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<NameColumns(names={}, parts={}, spans={}, symbols={})>",
+            self.num_names, self.num_parts, self.num_spans, self.num_symbols
+        )
+    }
+}
+
+/// The arrays behind a [`NameColumns`], built in plain Rust so the
+/// layout pass can run with the GIL released.
+struct ColumnsData {
+    entity_name_offsets: Vec<i32>,
+    name_tag: Vec<u8>,
+    name_form: StrColumn,
+    name_part_offsets: Vec<i32>,
+    name_span_offsets: Vec<i32>,
+    part_tag: Vec<u8>,
+    part_form: StrColumn,
+    part_comparable: StrColumn,
+    part_metaphone: StrColumn,
+    metaphone_validity: Vec<u8>,
+    span_part_offsets: Vec<i32>,
+    span_parts: Vec<i32>,
+    span_symbol: Vec<i32>,
+    symbol_category: Vec<u8>,
+    symbol_id: StrColumn,
+    num_entities: usize,
+    num_names: usize,
+}
+
+/// Lay out `entities`, a list of name groups.
+fn build(entities: &[Vec<NameData>]) -> PyResult<ColumnsData> {
+    let mut data = ColumnsData {
+        entity_name_offsets: vec![0],
+        name_tag: Vec::new(),
+        name_form: StrColumn::new(),
+        name_part_offsets: vec![0],
+        name_span_offsets: vec![0],
+        part_tag: Vec::new(),
+        part_form: StrColumn::new(),
+        part_comparable: StrColumn::new(),
+        part_metaphone: StrColumn::new(),
+        metaphone_validity: Vec::new(),
+        span_part_offsets: vec![0],
+        span_parts: Vec::new(),
+        span_symbol: Vec::new(),
+        symbol_category: Vec::new(),
+        symbol_id: StrColumn::new(),
+        num_entities: entities.len(),
+        num_names: 0,
+    };
+    let mut symbol_rows: HashMap<&Symbol, i32> = HashMap::new();
+
+    for names in entities {
+        for name in names {
+            data.num_names += 1;
+            data.name_tag.push(name.tag as u8);
+            data.name_form.push(&name.form)?;
+
+            // Parts are stored at row `part_base + part.index`.
+            let part_base = data.part_tag.len();
+            for part in &name.parts {
+                let row = data.part_tag.len();
+                data.part_tag.push(part.tag as u8);
+                data.part_form.push(&part.form)?;
+                data.part_comparable.push(&part.comparable)?;
+                if row % 8 == 0 {
+                    data.metaphone_validity.push(0);
+                }
+                match &part.metaphone {
+                    Some(m) => {
+                        data.part_metaphone.push(m)?;
+                        data.metaphone_validity[row / 8] |= 1 << (row % 8);
+                    }
+                    None => data.part_metaphone.push("")?,
+                }
+            }
+            data.name_part_offsets.push(offset(data.part_tag.len())?);
+
+            for span in &name.spans {
+                for &index in &span.parts {
+                    data.span_parts.push(offset(part_base + index as usize)?);
+                }
+                data.span_part_offsets.push(offset(data.span_parts.len())?);
+
+                let next = symbol_rows.len();
+                let row = match symbol_rows.get(&span.symbol) {
+                    Some(row) => *row,
+                    None => {
+                        let row = offset(next)?;
+                        data.symbol_category.push(span.symbol.category as u8);
+                        data.symbol_id.push(&span.symbol.id)?;
+                        symbol_rows.insert(&span.symbol, row);
+                        row
+                    }
+                };
+                data.span_symbol.push(row);
+            }
+            data.name_span_offsets.push(offset(data.span_symbol.len())?);
+        }
+        data.entity_name_offsets.push(offset(data.num_names)?);
+    }
+    Ok(data)
+}
+
+impl NameColumns {
+    /// Wrap the arrays in [`Column`]s.
+    fn from_data(py: Python<'_>, data: ColumnsData) -> PyResult<Self> {
+        Ok(Self {
+            num_entities: data.num_entities,
+            num_names: data.num_names,
+            num_parts: data.part_tag.len(),
+            num_spans: data.span_symbol.len(),
+            num_symbols: data.symbol_category.len(),
+            entity_name_offsets: column(py, ColumnData::I32(data.entity_name_offsets))?,
+            name_tag: column(py, ColumnData::U8(data.name_tag))?,
+            name_form_offsets: column(py, ColumnData::I32(data.name_form.offsets))?,
+            name_form_data: column(py, ColumnData::U8(data.name_form.data))?,
+            name_part_offsets: column(py, ColumnData::I32(data.name_part_offsets))?,
+            name_span_offsets: column(py, ColumnData::I32(data.name_span_offsets))?,
+            part_tag: column(py, ColumnData::U8(data.part_tag))?,
+            part_form_offsets: column(py, ColumnData::I32(data.part_form.offsets))?,
+            part_form_data: column(py, ColumnData::U8(data.part_form.data))?,
+            part_comparable_offsets: column(py, ColumnData::I32(data.part_comparable.offsets))?,
+            part_comparable_data: column(py, ColumnData::U8(data.part_comparable.data))?,
+            part_metaphone_offsets: column(py, ColumnData::I32(data.part_metaphone.offsets))?,
+            part_metaphone_data: column(py, ColumnData::U8(data.part_metaphone.data))?,
+            part_metaphone_validity: column(py, ColumnData::U8(data.metaphone_validity))?,
+            span_part_offsets: column(py, ColumnData::I32(data.span_part_offsets))?,
+            span_parts: column(py, ColumnData::I32(data.span_parts))?,
+            span_symbol: column(py, ColumnData::I32(data.span_symbol))?,
+            symbol_category: column(py, ColumnData::U8(data.symbol_category))?,
+            symbol_id_offsets: column(py, ColumnData::I32(data.symbol_id.offsets))?,
+            symbol_id_data: column(py, ColumnData::U8(data.symbol_id.data))?,
+        })
+    }
+}
+
+/// Lay out `entities` — one list of names per entity — as
+/// [`NameColumns`].
+#[pyfunction]
+#[pyo3(name = "names_to_columns")]
+pub fn py_names_to_columns(
+    py: Python<'_>,
+    entities: Vec<Vec<PyRef<'_, Name>>>,
+) -> PyResult<NameColumns> {
+    let entities: Vec<Vec<NameData>> = entities
+        .iter()
+        .map(|names| {
+            names
+                .iter()
+                .map(|name| NameData::from_name(py, name))
+                .collect::<PyResult<_>>()
+        })
+        .collect::<PyResult<_>>()?;
+    let data = py.detach(|| build(&entities))?;
+    NameColumns::from_data(py, data)
+}
+
+/// Analyse many entities' names straight into [`NameColumns`]: the
+/// pipeline of `analyze_names_batch` without building `Name`
+/// objects. Everything up to wrapping the finished arrays runs with
+/// the GIL released, on up to `threads` workers.
+///
+/// `cached`, when given, holds one `dump_names` blob or `None` per
+/// entity: entities with a blob are decoded rather than analysed, and
+/// the second return value carries the encoded results of the others
+/// (`None` for the decoded ones) for the caller to store. Without
+/// `cached` that list is empty.
+#[pyfunction]
+#[pyo3(name = "analyze_names_columns")]
+#[pyo3(signature = (type_tags, names, part_tags = None, *, infer_initials = false, symbols = true, phonetics = true, numerics = true, consolidate = true, rewrite = true, threads = None, cached = None))]
+#[allow(clippy::too_many_arguments)]
+pub fn py_analyze_names_columns(
+    py: Python<'_>,
+    type_tags: Vec<NameTypeTag>,
+    names: Vec<Vec<String>>,
+    part_tags: Option<Vec<Option<Bound<'_, PyDict>>>>,
+    infer_initials: bool,
+    symbols: bool,
+    phonetics: bool,
+    numerics: bool,
+    consolidate: bool,
+    rewrite: bool,
+    threads: Option<usize>,
+    cached: Option<Vec<Option<Bound<'_, PyBytes>>>>,
+) -> PyResult<(NameColumns, Vec<Option<Py<PyBytes>>>)> {
+    let (entities, tags) = analyze::batch_inputs(type_tags, names, part_tags)?;
+    let blobs: Option<Vec<Option<&[u8]>>> = cached
+        .as_ref()
+        .map(|c| c.iter().map(|b| b.as_ref().map(|b| b.as_bytes())).collect());
+    if let Some(blobs) = &blobs {
+        if blobs.len() != entities.len() {
+            return Err(PyValueError::new_err(format!(
+                "cached and names differ in length: {} != {}",
+                blobs.len(),
+                entities.len()
+            )));
+        }
+    }
+    let opts = AnalyzeOptions {
+        infer_initials,
+        symbols,
+        phonetics,
+        numerics,
+        consolidate,
+        rewrite,
+    };
+    let threads = threads.unwrap_or_else(parallel::default_threads).max(1);
+
+    let (data, fresh) = py.detach(|| -> PyResult<_> {
+        analyze::warm_taggers(opts);
+        let jobs: Vec<usize> = (0..entities.len()).collect();
+        let results = parallel::map_ordered(&jobs, threads, |&idx| {
+            let blob = blobs.as_ref().map(|b| b[idx]);
+            match blob {
+                Some(Some(blob)) => codec::decode_data(blob).map(|names| (names, None)),
+                _ => {
+                    let (type_tag, names) = &entities[idx];
+                    let names = analyze::analyze_entity(*type_tag, names, &tags[idx], opts);
+                    // Encode for the caller's cache only when it has one.
+                    let encoded = blob.map(|_| codec::encode_data(&names));
+                    Ok((names, encoded))
+                }
+            }
+        });
+        let mut analysed = Vec::with_capacity(results.len());
+        let mut fresh = Vec::new();
+        for result in results {
+            let (names, encoded) = result.map_err(PyValueError::new_err)?;
+            if blobs.is_some() {
+                fresh.push(encoded);
+            }
+            analysed.push(names);
+        }
+        Ok((build(&analysed)?, fresh))
+    })?;
+
+    let columns = NameColumns::from_data(py, data)?;
+    let fresh = fresh
+        .into_iter()
+        .map(|blob| blob.map(|b| PyBytes::new(py, &b).unbind()))
+        .collect();
+    Ok((columns, fresh))
+}
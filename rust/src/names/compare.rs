@@ -436,19 +436,44 @@ struct AlignmentData {
     overlaps: HashMap<(usize, usize), u32>,
 }
 
+/// One side of a residue comparison in the form the DP consumes:
+/// the SEP-joined char vector of the parts' `comparable` strings and
+/// each part's char length. Built once per side per call — or once
+/// per query by a prepared name, which then reuses it against every
+/// candidate.
+#[derive(Clone, Debug)]
+pub(crate) struct Residue {
+    chars: Vec<char>,
+    lengths: Vec<usize>,
+}
+
+impl Residue {
+    pub(crate) fn new(comparable: &[String]) -> Self {
+        // Capped at MAX_NAME_LENGTH so the O(n·m) alignment matrix
+        // can't blow up on paragraph-length "names" (issue #230).
+        // Parts past the cut get an empty cost stream and fall out as
+        // solo clusters, so the "every part appears exactly once"
+        // contract still holds.
+        let mut chars: Vec<char> = comparable.join(&SEP.to_string()).chars().collect();
+        chars.truncate(MAX_NAME_LENGTH);
+        let lengths = comparable.iter().map(|c| c.chars().count()).collect();
+        Self { chars, lengths }
+    }
+
+    pub(crate) fn len(&self) -> usize {
+        self.lengths.len()
+    }
+}
+
 /// Run the DP over the SEP-joined strings and accumulate per-part
 /// cost streams + per-pair overlap counts as we walk the alignment.
 ///
 /// The walk advances a cursor on each side every time it consumes a
 /// SEP — which is how cost / overlap end up attributed to the right
 /// part instead of bleeding across token boundaries.
-fn run_align(
-    cfg: &CompareConfig,
-    qry_comparable: &[String],
-    res_comparable: &[String],
-) -> AlignmentData {
-    let n_q = qry_comparable.len();
-    let n_r = res_comparable.len();
+fn run_align(cfg: &CompareConfig, qry: &Residue, res: &Residue) -> AlignmentData {
+    let n_q = qry.len();
+    let n_r = res.len();
     let mut qry_costs: Vec<Vec<f64>> = vec![Vec::new(); n_q];
     let mut res_costs: Vec<Vec<f64>> = vec![Vec::new(); n_r];
     let mut overlaps: HashMap<(usize, usize), u32> = HashMap::new();
@@ -461,19 +486,7 @@ fn run_align(
         };
     }
 
-    // Build the SEP-joined char vectors for both sides, capped at
-    // MAX_NAME_LENGTH each so the O(n·m) alignment matrix can't blow
-    // up on paragraph-length "names" (issue #230). Parts past the cut
-    // get an empty cost stream and fall out as solo clusters, so the
-    // "every part appears exactly once" contract still holds.
-    let q_text: String = qry_comparable.join(&SEP.to_string());
-    let r_text: String = res_comparable.join(&SEP.to_string());
-    let mut q_chars: Vec<char> = q_text.chars().collect();
-    let mut r_chars: Vec<char> = r_text.chars().collect();
-    q_chars.truncate(MAX_NAME_LENGTH);
-    r_chars.truncate(MAX_NAME_LENGTH);
-
-    let steps = align_chars(cfg, &q_chars, &r_chars);
+    let steps = align_chars(cfg, &qry.chars, &res.chars);
 
     // Walk the alignment, advancing part-cursors on each SEP.
     let mut qry_idx: usize = 0;
@@ -521,9 +534,9 @@ fn run_align(
 /// unaccounted-for. Both sides non-empty means "these parts are
 /// talking about the same thing" (subject to the matcher's notion
 /// of *thing*).
-struct Cluster {
-    qps: Vec<usize>,
-    rps: Vec<usize>,
+pub(crate) struct Cluster {
+    pub(crate) qps: Vec<usize>,
+    pub(crate) rps: Vec<usize>,
 }
 
 /// Pair query/result parts into clusters by overlap-fraction
@@ -702,6 +715,40 @@ fn run_score(cfg: &CompareConfig, cluster: &Cluster, align: &AlignmentData) -> f
 
 // --- Public entry point --------------------------------------------
 
+/// The process-wide default [`CompareConfig`], for Rust callers
+/// that take an optional config.
+pub(crate) fn default_config() -> &'static CompareConfig {
+    &DEFAULT_CONFIG
+}
+
+/// Align, cluster and score two residues given as per-part
+/// `comparable` strings. Pure Rust — the core of
+/// [`py_compare_parts`], shared with the set matcher. Cluster
+/// indices point into the input slices.
+pub(crate) fn score_residue(
+    cfg: &CompareConfig,
+    q_comparable: &[String],
+    r_comparable: &[String],
+) -> Vec<(Cluster, f64)> {
+    score_residues(
+        cfg,
+        &Residue::new(q_comparable),
+        &Residue::new(r_comparable),
+    )
+}
+
+/// [`score_residue`] over sides already built into [`Residue`]s.
+pub(crate) fn score_residues(cfg: &CompareConfig, q: &Residue, r: &Residue) -> Vec<(Cluster, f64)> {
+    let align = run_align(cfg, q, r);
+    run_cluster(cfg, &align, &q.lengths, &r.lengths, q.len(), r.len())
+        .into_iter()
+        .map(|cluster| {
+            let score = run_score(cfg, &cluster, &align);
+            (cluster, score)
+        })
+        .collect()
+}
+
 /// Score the alignment of two `NamePart` lists.
 ///
 /// Callers should hand over the *residue* — parts that earlier stages
@@ -728,35 +775,35 @@ pub fn py_compare_parts(
 ) -> PyResult<Vec<Py<Alignment>>> {
     let cfg: &CompareConfig = config.unwrap_or(&DEFAULT_CONFIG);
 
-    let n_q = qry.len();
-    let n_r = res.len();
+    // Pull comparable strings off the NameParts up front; the
+    // alignment + clustering stages each iterate over them and we'd
+    // otherwise pay the PyO3 borrow cost per cell.
+    let q_comparable: Vec<String> = qry
+        .iter()
+        .map(|p| p.bind(py).borrow().comparable_str().to_string())
+        .collect();
+    let r_comparable: Vec<String> = res
+        .iter()
+        .map(|p| p.bind(py).borrow().comparable_str().to_string())
+        .collect();
+
+    // DP alignment, clustering and scoring only read the Rust-owned
+    // copies above, so they run with the GIL released; it's taken
+    // back to build the result objects.
+    let scored = py.detach(|| score_residue(cfg, &q_comparable, &r_comparable));
+    residue_alignments(py, scored, &qry, &res)
+}
 
-    // Pull comparable strings + char-lengths off the NameParts up front;
-    // the alignment + clustering stages each iterate over them and
-    // we'd otherwise pay the PyO3 borrow cost per cell.
-    let mut q_comparable: Vec<String> = Vec::with_capacity(n_q);
-    let mut q_lengths: Vec<usize> = Vec::with_capacity(n_q);
-    for p in &qry {
-        let part = p.bind(py).borrow();
-        let c = part.comparable_str().to_string();
-        q_lengths.push(c.chars().count());
-        q_comparable.push(c);
-    }
-    let mut r_comparable: Vec<String> = Vec::with_capacity(n_r);
-    let mut r_lengths: Vec<usize> = Vec::with_capacity(n_r);
-    for p in &res {
-        let part = p.bind(py).borrow();
-        let c = part.comparable_str().to_string();
-        r_lengths.push(c.chars().count());
-        r_comparable.push(c);
-    }
-
-    let align = run_align(cfg, &q_comparable, &r_comparable);
-    let clusters = run_cluster(cfg, &align, &q_lengths, &r_lengths, n_q, n_r);
-
-    let mut out: Vec<Py<Alignment>> = Vec::with_capacity(clusters.len());
-    for cluster in &clusters {
-        let score = run_score(cfg, cluster, &align);
+/// Materialise scored clusters as [`Alignment`]s over the parts they
+/// index into.
+pub(crate) fn residue_alignments(
+    py: Python<'_>,
+    scored: Vec<(Cluster, f64)>,
+    qry: &[Py<NamePart>],
+    res: &[Py<NamePart>],
+) -> PyResult<Vec<Py<Alignment>>> {
+    let mut out: Vec<Py<Alignment>> = Vec::with_capacity(scored.len());
+    for (cluster, score) in scored {
         let qps_parts: Vec<Py<NamePart>> =
             cluster.qps.iter().map(|&i| qry[i].clone_ref(py)).collect();
         let rps_parts: Vec<Py<NamePart>> =
@@ -880,7 +927,8 @@ mod tests {
         // rest stay empty and surface as solos downstream.
         let cfg = CompareConfig::default();
         let parts: Vec<String> = (0..MAX_NAME_LENGTH * 2).map(|_| "x".to_string()).collect();
-        let align = run_align(&cfg, &parts, &parts);
+        let residue = Residue::new(&parts);
+        let align = run_align(&cfg, &residue, &residue);
         assert_eq!(align.qry_costs.len(), parts.len());
         let scored = align.qry_costs.iter().filter(|c| !c.is_empty()).count();
         assert!(scored > 0 && scored < parts.len(), "scored {scored}");
@@ -0,0 +1,428 @@
+// Flat, position-independent Aho-Corasick automaton.
+//
+// The symbol taggers need an automaton that can be used straight out
+// of a read-only memory mapping, so that every process mapping the
+// same tagger image shares its pages instead of holding a private
+// copy. Neither `aho-corasick` nor `daachorse` can match over
+// borrowed bytes — both deserialise into owned arrays — so the tagger
+// runs on this one: a byte-level trie with failure and dictionary
+// links, encoded as little-endian `u32` arrays and read in place.
+//
+// Layout (all offsets relative to the section start):
+//
+//   n_states u32, n_edges u32, n_needles u32, pad u32
+//   root      256 × u32          goto table of the root state
+//   states    n_states × 5 × u32 (edge_start, edge_len, fail,
+//                                 needle, dict)
+//   targets   n_edges × u32      edge target states
+//   lengths   n_needles × u32    needle byte lengths
+//   labels    n_edges × u8       edge bytes, sorted per state;
+//                                padded to 4 bytes
+//
+// States are numbered in BFS order, so the shallow states every scan
+// walks through sit together at the front of the array. `needle` is
+// the index of the needle ending at a state, `dict` the nearest state
+// on its failure chain that ends a needle; both use `NONE` for none.
+//
+// Matching reports every occurrence of every needle (overlapping
+// semantics) as `(start, end, needle)` byte ranges, in order of end
+// position and longest needle first. Word boundaries are the
+// caller's business — see `matcher::boundary_ok`.
+
+const NONE: u32 = u32::MAX;
+const HEADER_WORDS: usize = 4;
+const STATE_WORDS: usize = 5;
+const EDGE_START: usize = 0;
+const EDGE_LEN: usize = 1;
+const FAIL: usize = 2;
+const NEEDLE: usize = 3;
+const DICT: usize = 4;
+
+struct Node {
+    edges: Vec<(u8, u32)>,
+    fail: u32,
+    needle: u32,
+    dict: u32,
+}
+
+impl Node {
+    fn new() -> Self {
+        Self {
+            edges: Vec::new(),
+            fail: 0,
+            needle: NONE,
+            dict: NONE,
+        }
+    }
+
+    fn goto(&self, b: u8) -> Option<u32> {
+        self.edges
+            .binary_search_by_key(&b, |e| e.0)
+            .ok()
+            .map(|k| self.edges[k].1)
+    }
+}
+
+fn put(out: &mut Vec<u8>, v: u32) {
+    out.extend_from_slice(&v.to_le_bytes());
+}
+
+/// Append the automaton for `needles` to `out`. Needle `i` is
+/// reported as `i`; needles must be non-empty and distinct.
+pub(crate) fn encode(needles: &[&str], out: &mut Vec<u8>) {
+    let mut nodes = vec![Node::new()];
+    for (i, needle) in needles.iter().enumerate() {
+        let mut cur = 0usize;
+        for &b in needle.as_bytes() {
+            cur = match nodes[cur].edges.binary_search_by_key(&b, |e| e.0) {
+                Ok(k) => nodes[cur].edges[k].1 as usize,
+                Err(k) => {
+                    let id = nodes.len();
+                    nodes[cur].edges.insert(k, (b, id as u32));
+                    nodes.push(Node::new());
+                    id
+                }
+            };
+        }
+        nodes[cur].needle = i as u32;
+    }
+
+    // Breadth-first: fill failure and dictionary links (a state's
+    // failure target is always shallower, so already final) and
+    // record the visiting order used for numbering.
+    let mut order: Vec<u32> = Vec::with_capacity(nodes.len());
+    order.push(0);
+    let mut head = 0;
+    while head < order.len() {
+        let u = order[head] as usize;
+        head += 1;
+        for k in 0..nodes[u].edges.len() {
+            let (b, v) = nodes[u].edges[k];
+            let fail = if u == 0 {
+                0
+            } else {
+                let mut f = nodes[u].fail as usize;
+                loop {
+                    if let Some(t) = nodes[f].goto(b) {
+                        break t;
+                    }
+                    if f == 0 {
+                        break 0;
+                    }
+                    f = nodes[f].fail as usize;
+                }
+            };
+            let target = &nodes[fail as usize];
+            let dict = if target.needle != NONE {
+                fail
+            } else {
+                target.dict
+            };
+            nodes[v as usize].fail = fail;
+            nodes[v as usize].dict = dict;
+            order.push(v);
+        }
+    }
+
+    let mut new_id = vec![0u32; nodes.len()];
+    for (i, &old) in order.iter().enumerate() {
+        new_id[old as usize] = i as u32;
+    }
+    let remap = |s: u32| if s == NONE { NONE } else { new_id[s as usize] };
+    let n_edges: usize = nodes.iter().map(|n| n.edges.len()).sum();
+
+    put(out, order.len() as u32);
+    put(out, n_edges as u32);
+    put(out, needles.len() as u32);
+    put(out, 0);
+    let mut root = [0u32; 256];
+    for &(b, v) in &nodes[0].edges {
+        root[b as usize] = new_id[v as usize];
+    }
+    for t in root {
+        put(out, t);
+    }
+    let mut edge_start = 0u32;
+    for &old in &order {
+        let n = &nodes[old as usize];
+        put(out, edge_start);
+        put(out, n.edges.len() as u32);
+        put(out, remap(n.fail));
+        put(out, n.needle);
+        put(out, remap(n.dict));
+        edge_start += n.edges.len() as u32;
+    }
+    for &old in &order {
+        for &(_, v) in &nodes[old as usize].edges {
+            put(out, new_id[v as usize]);
+        }
+    }
+    for needle in needles {
+        put(out, needle.len() as u32);
+    }
+    for &old in &order {
+        out.extend(nodes[old as usize].edges.iter().map(|e| e.0));
+    }
+    out.resize(out.len() + (4 - n_edges % 4) % 4, 0);
+}
+
+fn read_u32(data: &[u8], pos: usize) -> u32 {
+    u32::from_le_bytes(data[pos..pos + 4].try_into().unwrap())
+}
+
+/// Section offsets of an encoded automaton within its buffer.
+#[derive(Clone, Copy, Debug)]
+pub(crate) struct Layout {
+    root: usize,
+    states: usize,
+    targets: usize,
+    lengths: usize,
+    labels: usize,
+    n_needles: usize,
+    end: usize,
+}
+
+impl Layout {
+    /// Locate the automaton starting at `offset` in `data`, or `None`
+    /// if its sections don't fit or its indices don't check out.
+    pub(crate) fn parse(data: &[u8], offset: usize) -> Option<Self> {
+        let header = data.get(offset..offset.checked_add(HEADER_WORDS * 4)?)?;
+        let word = |i: usize| read_u32(header, i * 4) as usize;
+        let (n_states, n_edges, n_needles) = (word(0), word(1), word(2));
+        if n_states == 0 {
+            return None;
+        }
+        let root = offset + HEADER_WORDS * 4;
+        let states = root + 256 * 4;
+        let targets = states.checked_add(n_states.checked_mul(STATE_WORDS * 4)?)?;
+        let lengths = targets.checked_add(n_edges.checked_mul(4)?)?;
+        let labels = lengths.checked_add(n_needles.checked_mul(4)?)?;
+        let end = labels.checked_add(n_edges.checked_add(3)? & !3)?;
+        if end > data.len() {
+            return None;
+        }
+        let layout = Self {
+            root,
+            states,
+            targets,
+            lengths,
+            labels,
+            n_needles,
+            end,
+        };
+        layout.check(data, n_states, n_edges).then_some(layout)
+    }
+
+    /// Check every index the match path follows, so that matching a
+    /// damaged or foreign buffer can neither slice out of bounds nor
+    /// loop: edge ranges lie within the edge arrays, edges lead to
+    /// later states and each state has exactly one parent, the root
+    /// table leads to depth-one states, failure and dictionary links
+    /// point to strictly shallower states, and a needle's length is
+    /// the depth of the state that ends it.
+    fn check(&self, data: &[u8], n_states: usize, n_edges: usize) -> bool {
+        let word = |pos: usize| read_u32(data, pos) as usize;
+        let field = |s: usize, f: usize| word(self.states + (s * STATE_WORDS + f) * 4);
+        let none = NONE as usize;
+        let mut depth = vec![NONE; n_states];
+        depth[0] = 0;
+        for s in 0..n_states {
+            if depth[s] == NONE {
+                return false;
+            }
+            let (start, len) = (field(s, EDGE_START), field(s, EDGE_LEN));
+            if start + len > n_edges {
+                return false;
+            }
+            for e in start..start + len {
+                let t = word(self.targets + e * 4);
+                if t <= s || t >= n_states || depth[t] != NONE {
+                    return false;
+                }
+                depth[t] = depth[s] + 1;
+            }
+            if s > 0 {
+                let fail = field(s, FAIL);
+                if fail >= n_states || depth[fail] >= depth[s] {
+                    return false;
+                }
+            }
+            let needle = field(s, NEEDLE);
+            if needle != none
+                && (needle >= self.n_needles
+                    || word(self.lengths + needle * 4) != depth[s] as usize)
+            {
+                return false;
+            }
+            let dict = field(s, DICT);
+            if dict != none
+                && (dict >= n_states || depth[dict] >= depth[s] || field(dict, NEEDLE) == none)
+            {
+                return false;
+            }
+        }
+        (0..256).all(|b| {
+            let t = word(self.root + b * 4);
+            t == 0 || (t < n_states && depth[t] == 1)
+        })
+    }
+
+    /// Offset one past the automaton's last byte.
+    pub(crate) fn end(&self) -> usize {
+        self.end
+    }
+
+    pub(crate) fn n_needles(&self) -> usize {
+        self.n_needles
+    }
+}
+
+/// An encoded automaton, borrowed from the buffer holding it.
+#[derive(Clone, Copy)]
+pub(crate) struct FlatAc<'a> {
+    data: &'a [u8],
+    layout: Layout,
+}
+
+impl<'a> FlatAc<'a> {
+    /// `layout` must come from [`Layout::parse`] over `data`.
+    pub(crate) fn new(data: &'a [u8], layout: Layout) -> Self {
+        Self { data, layout }
+    }
+
+    fn state(&self, s: u32, field: usize) -> u32 {
+        read_u32(
+            self.data,
+            self.layout.states + (s as usize * STATE_WORDS + field) * 4,
+        )
+    }
+
+    fn next(&self, mut s: u32, b: u8) -> u32 {
+        loop {
+            if s == 0 {
+                return read_u32(self.data, self.layout.root + b as usize * 4);
+            }
+            let start = self.state(s, EDGE_START) as usize;
+            let len = self.state(s, EDGE_LEN) as usize;
+            let labels = &self.data[self.layout.labels + start..self.layout.labels + start + len];
+            if let Ok(k) = labels.binary_search(&b) {
+                return read_u32(self.data, self.layout.targets + (start + k) * 4);
+            }
+            s = self.state(s, FAIL);
+        }
+    }
+
+    /// Call `emit(start, end, needle)` for every needle occurrence in
+    /// `haystack`.
+    pub(crate) fn find_overlapping(
+        &self,
+        haystack: &[u8],
+        mut emit: impl FnMut(usize, usize, usize),
+    ) {
+        let mut s = 0u32;
+        for (i, &b) in haystack.iter().enumerate() {
+            s = self.next(s, b);
+            let mut out = if self.state(s, NEEDLE) != NONE {
+                s
+            } else {
+                self.state(s, DICT)
+            };
+            while out != NONE {
+                let needle = self.state(out, NEEDLE) as usize;
+                let len = read_u32(self.data, self.layout.lengths + needle * 4) as usize;
+                emit(i + 1 - len, i + 1, needle);
+                out = self.state(out, DICT);
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn matches(needles: &[&str], haystack: &str) -> Vec<(usize, usize, usize)> {
+        let mut data = Vec::new();
+        encode(needles, &mut data);
+        let layout = Layout::parse(&data, 0).expect("layout");
+        assert_eq!(layout.end(), data.len());
+        assert_eq!(layout.n_needles(), needles.len());
+        let mut out = Vec::new();
+        FlatAc::new(&data, layout)
+            .find_overlapping(haystack.as_bytes(), |s, e, n| out.push((s, e, n)));
+        out
+    }
+
+    #[test]
+    fn overlapping_matches() {
+        let needles = ["he", "she", "his", "hers"];
+        assert_eq!(
+            matches(&needles, "ushers"),
+            vec![(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+        );
+        assert_eq!(matches(&needles, "this"), vec![(1, 4, 2)]);
+        assert!(matches(&needles, "xyz").is_empty());
+        assert!(matches(&needles, "").is_empty());
+    }
+
+    #[test]
+    fn repeated_and_nested_needles() {
+        let needles = ["a", "aa", "aaa"];
+        assert_eq!(
+            matches(&needles, "aaa"),
+            vec![
+                (0, 1, 0),
+                (0, 2, 1),
+                (1, 2, 0),
+                (0, 3, 2),
+                (1, 3, 1),
+                (2, 3, 0)
+            ]
+        );
+    }
+
+    #[test]
+    fn multibyte_needles() {
+        let needles = ["владимир", "путин", "мир"];
+        let hay = "владимир путин";
+        let found: Vec<&str> = matches(&needles, hay)
+            .into_iter()
+            .map(|(s, e, _)| &hay[s..e])
+            .collect();
+        assert_eq!(found, vec!["владимир", "мир", "путин"]);
+    }
+
+    #[test]
+    fn truncated_layout_is_rejected() {
+        let mut data = Vec::new();
+        encode(&["abc"], &mut data);
+        assert!(Layout::parse(&data[..data.len() - 4], 0).is_none());
+        assert!(Layout::parse(&data[..8], 0).is_none());
+    }
+
+    #[test]
+    fn bad_indices_are_rejected() {
+        let mut data = Vec::new();
+        encode(&["he", "she", "his", "hers"], &mut data);
+        assert!(Layout::parse(&data, 0).is_some());
+        let states = (HEADER_WORDS + 256) * 4;
+        let n_states = read_u32(&data, 0) as usize;
+        let targets = states + n_states * STATE_WORDS * 4;
+        let corrupt = |pos: usize, v: u32| {
+            let mut bad = data.clone();
+            bad[pos..pos + 4].copy_from_slice(&v.to_le_bytes());
+            Layout::parse(&bad, 0).is_none()
+        };
+        let field = |s: usize, f: usize| states + (s * STATE_WORDS + f) * 4;
+        // Root goto table, edge range, failure link (a self-loop would
+        // never terminate), needle, dictionary link, edge target and
+        // needle length.
+        assert!(corrupt(HEADER_WORDS * 4 + b'h' as usize * 4, 1000));
+        assert!(corrupt(field(1, EDGE_LEN), 1000));
+        assert!(corrupt(field(2, FAIL), 2));
+        assert!(corrupt(field(3, NEEDLE), 4));
+        assert!(corrupt(field(3, DICT), 0));
+        assert!(corrupt(targets, 0));
+        assert!(corrupt(targets + read_u32(&data, 4) as usize * 4, 7));
+    }
+}
@@ -2,7 +2,10 @@
 // `(?<!\w)X(?!\w)` word boundaries. Used to back:
 //
 //   - rigour.names.org_types.replace_org_types_compare (payload = target String)
-//   - names::tagger, invoked from analyze_names (payload = Symbol)
+//
+// The tagger (`names::tagger`) runs its own serialisable automaton
+// but reuses `boundary_ok` below, so both apply identical boundary
+// semantics.
 //
 // ## Design
 //
@@ -158,7 +161,7 @@ impl<T> Needles<T> {
 
 /// True iff the match at `[start, end)` is flanked by non-word chars
 /// or the string edge — Python's `(?<!\w)X(?!\w)` semantics.
-fn boundary_ok(bytes: &[u8], start: usize, end: usize) -> bool {
+pub(crate) fn boundary_ok(bytes: &[u8], start: usize, end: usize) -> bool {
     let before_ok = start == 0 || !is_word_char_before(bytes, start);
     let after_ok = end == bytes.len() || !is_word_char_after(bytes, end);
     before_ok && after_ok
@@ -6,8 +6,13 @@ pub mod alignment;
 #[cfg(feature = "python")]
 pub mod analyze;
 #[cfg(feature = "python")]
+pub mod codec;
+#[cfg(feature = "python")]
+pub mod columns;
+#[cfg(feature = "python")]
 pub mod compare;
 pub mod constants;
+pub mod flat_ac;
 pub mod matcher;
 #[cfg(feature = "python")]
 pub mod name;
@@ -21,8 +26,13 @@ pub mod part;
 pub mod person_names;
 pub mod pick;
 pub mod prefix;
+#[cfg(feature = "python")]
+pub mod prepared;
+#[cfg(feature = "python")]
+pub mod set_match;
 pub mod stopwords;
 pub mod symbol;
 pub mod symbols;
 pub mod tag;
 pub mod tagger;
+pub mod tagger_image;
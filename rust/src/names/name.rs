@@ -6,10 +6,13 @@
 use std::collections::HashSet;
 use std::hash::{DefaultHasher, Hash, Hasher};
 
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyString, PyTuple};
+use pyo3::types::{PyBytes, PyList, PyString, PyTuple};
 
-use crate::names::part::{NamePart, Span};
+use crate::names::codec;
+use crate::names::part::{NamePart, PartData, Span, SpanData};
+use crate::names::prepared::PreparedName;
 use crate::names::symbol::{Symbol, SymbolCategory};
 use crate::names::tag::{NamePartTag, NameTypeTag};
 use crate::text::normalize::casefold;
@@ -89,38 +92,7 @@ impl Name {
             let part = NamePart::new(py, &token, i as u32, NamePartTag::UNSET, phonetics);
             parts_vec.push(Py::new(py, part)?);
         }
-        let parts_list = PyTuple::new(py, &parts_vec)?.unbind();
-
-        let mut comparable_segs: Vec<String> = Vec::with_capacity(parts_vec.len());
-        let mut norm_segs: Vec<String> = Vec::with_capacity(parts_vec.len());
-        for p in &parts_vec {
-            let part = p.bind(py).borrow();
-            comparable_segs.push(part.comparable_str().to_string());
-            norm_segs.push(part.form_str().to_string());
-        }
-        let comparable_str = comparable_segs.join(" ");
-        let norm_form_str = norm_segs.join(" ");
-
-        let original_py = PyString::new(py, original).unbind();
-        let form_py = PyString::new(py, &form_str).unbind();
-        let comparable_py = PyString::new(py, &comparable_str).unbind();
-        let norm_form_py = PyString::new(py, &norm_form_str).unbind();
-        let spans_list = PyList::empty(py).unbind();
-
-        let hash = hash_form(&form_str);
-
-        Ok(Self {
-            original: original_py,
-            form: form_py,
-            tag,
-            parts: parts_list,
-            spans: spans_list,
-            comparable: comparable_py,
-            norm_form: norm_form_py,
-            form_str,
-            norm_form_str,
-            hash,
-        })
+        Self::from_parts(py, original, form_str, tag, parts_vec)
     }
 
     /// Tag the parts that spell out `text` with the given tag.
@@ -152,24 +124,22 @@ impl Name {
             return Ok(());
         }
 
-        let parts_bound = self.parts.bind(py);
-        let mut matches: u32 = 0;
-        let mut matching: Vec<Py<NamePart>> = Vec::with_capacity(tokens.len());
-
-        for item in parts_bound.iter() {
-            let part_py = item.cast::<NamePart>()?.clone().unbind();
-            let next_idx = matching.len();
-            let part_form = part_py.bind(py).borrow().form_str().to_string();
-            if part_form == tokens[next_idx] {
-                matching.push(part_py);
-            }
-            if matching.len() == tokens.len() {
-                apply_tag_to_matching(py, &matching, tag);
-                matches += 1;
-                if matches >= max_matches {
-                    return Ok(());
-                }
-                matching.clear();
+        let parts: Vec<Bound<'_, NamePart>> = self
+            .parts
+            .bind(py)
+            .iter()
+            .map(|item| Ok(item.cast::<NamePart>()?.clone()))
+            .collect::<PyResult<_>>()?;
+        let forms: Vec<String> = parts
+            .iter()
+            .map(|p| p.borrow().form_str().to_string())
+            .collect();
+        // At least one occurrence is tagged, even for `max_matches=0`.
+        let limit = max_matches.max(1) as usize;
+        for group in phrase_matches(&forms, &tokens).into_iter().take(limit) {
+            for idx in group {
+                let current = parts[idx].borrow().tag;
+                parts[idx].borrow_mut().tag = merge_tag(current, tag);
             }
         }
         Ok(())
@@ -198,24 +168,22 @@ impl Name {
         if span_already_applied(py, &self.spans, &symbol, phrase)? {
             return Ok(());
         }
-        let parts_bound = self.parts.bind(py);
+        let parts: Vec<Py<NamePart>> = self
+            .parts
+            .bind(py)
+            .iter()
+            .map(|item| Ok(item.cast::<NamePart>()?.clone().unbind()))
+            .collect::<PyResult<_>>()?;
+        let forms: Vec<String> = parts
+            .iter()
+            .map(|p| p.bind(py).borrow().form_str().to_string())
+            .collect();
         let spans_bound = self.spans.bind(py);
-        let mut matching: Vec<Py<NamePart>> = Vec::with_capacity(tokens.len());
-        for item in parts_bound.iter() {
-            let part_py = item.cast::<NamePart>()?.clone().unbind();
-            let next_idx = matching.len();
-            let part_form = part_py.bind(py).borrow().form_str().to_string();
-            if part_form == tokens[next_idx] {
-                matching.push(part_py);
-            }
-            if matching.len() == tokens.len() {
-                let span_parts: Vec<Py<NamePart>> =
-                    matching.iter().map(|p| p.clone_ref(py)).collect();
-                let span = Span::new(py, span_parts, symbol.clone_ref(py))?;
-                let span_py = Py::new(py, span)?;
-                spans_bound.append(span_py)?;
-                matching.clear();
-            }
+        for group in phrase_matches(&forms, &tokens) {
+            let span_parts: Vec<Py<NamePart>> =
+                group.iter().map(|&idx| parts[idx].clone_ref(py)).collect();
+            let span = Span::new(py, span_parts, symbol.clone_ref(py))?;
+            spans_bound.append(Py::new(py, span)?)?;
         }
         Ok(())
     }
@@ -403,20 +371,321 @@ impl Name {
         }
         Ok(out.unbind())
     }
+
+    /// Snapshot this name's pairing and residue inputs into a
+    /// [`PreparedName`], for scoring it against many candidates.
+    /// Call after tagging: later spans are not picked up.
+    fn prepare(slf: &Bound<'_, Self>) -> PyResult<PreparedName> {
+        PreparedName::build(slf.py(), slf)
+    }
+
+    /// Serialise this name — parts with all their derived fields,
+    /// and the tagger spans — into a compact binary blob. Same
+    /// format as `dump_names` with a single entry.
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let out = codec::encode(py, std::iter::once(self))?;
+        Ok(PyBytes::new(py, &out))
+    }
+
+    /// Rebuild a name from `to_bytes` output without re-running
+    /// transliteration, phonetics or the tagger. Raises `ValueError`
+    /// on malformed input or if the blob doesn't hold exactly one
+    /// name.
+    #[classmethod]
+    fn from_bytes(
+        _cls: &Bound<'_, pyo3::types::PyType>,
+        py: Python<'_>,
+        data: &[u8],
+    ) -> PyResult<Py<Name>> {
+        let mut names = codec::decode(py, data)?;
+        if names.len() != 1 {
+            return Err(PyValueError::new_err(format!(
+                "expected one name, found {}",
+                names.len()
+            )));
+        }
+        Ok(names.remove(0))
+    }
+
+    /// Pickle via the binary codec: `Name.from_bytes(self.to_bytes())`.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let py = slf.py();
+        let ctor = slf.get_type().getattr("from_bytes")?;
+        Ok((ctor, (slf.borrow().to_bytes(py)?,)))
+    }
 }
 
-fn apply_tag_to_matching(py: Python<'_>, matching: &[Py<NamePart>], new_tag: NamePartTag) {
-    for part in matching {
-        let bind = part.bind(py);
-        let current = bind.borrow().tag;
-        if current == NamePartTag::UNSET {
-            bind.borrow_mut().tag = new_tag;
-            continue;
+impl Name {
+    /// Rust-only accessor for the normalised form.
+    pub fn form_str(&self) -> &str {
+        &self.form_str
+    }
+
+    /// Assemble a `Name` around already-constructed parts. Shared by
+    /// the `#[new]` constructor and [`NameData::into_py`].
+    /// `parts` must be the tokens of `form_str`, in order, with
+    /// `index` equal to their position.
+    pub fn from_parts(
+        py: Python<'_>,
+        original: &str,
+        form_str: String,
+        tag: NameTypeTag,
+        parts_vec: Vec<Py<NamePart>>,
+    ) -> PyResult<Self> {
+        let mut comparable_segs: Vec<String> = Vec::with_capacity(parts_vec.len());
+        let mut norm_segs: Vec<String> = Vec::with_capacity(parts_vec.len());
+        for p in &parts_vec {
+            let part = p.bind(py).borrow();
+            comparable_segs.push(part.comparable_str().to_string());
+            norm_segs.push(part.form_str().to_string());
+        }
+        let comparable_str = comparable_segs.join(" ");
+        let norm_form_str = norm_segs.join(" ");
+        let parts_list = PyTuple::new(py, &parts_vec)?.unbind();
+
+        let original_py = PyString::new(py, original).unbind();
+        let form_py = PyString::new(py, &form_str).unbind();
+        let comparable_py = PyString::new(py, &comparable_str).unbind();
+        let norm_form_py = PyString::new(py, &norm_form_str).unbind();
+        let spans_list = PyList::empty(py).unbind();
+
+        let hash = hash_form(&form_str);
+
+        Ok(Self {
+            original: original_py,
+            form: form_py,
+            tag,
+            parts: parts_list,
+            spans: spans_list,
+            comparable: comparable_py,
+            norm_form: norm_form_py,
+            form_str,
+            norm_form_str,
+            hash,
+        })
+    }
+}
+
+/// A [`Name`] in plain Rust: the analysis pipeline builds these off
+/// the GIL, the codec decodes into them and the columnar export reads
+/// them, so none of those needs the pyclass graph. `parts[i].index`
+/// is `i`; spans refer to parts by that position.
+#[derive(Clone, Debug)]
+pub struct NameData {
+    pub original: String,
+    pub form: String,
+    pub tag: NameTypeTag,
+    pub parts: Vec<PartData>,
+    pub spans: Vec<SpanData>,
+}
+
+impl NameData {
+    /// Space-joined part forms — `Name.norm_form`.
+    pub fn norm_form(&self) -> String {
+        let forms: Vec<&str> = self.parts.iter().map(|p| p.form.as_str()).collect();
+        forms.join(" ")
+    }
+
+    /// Build the `Name` / `NamePart` / `Span` objects. Spans share the
+    /// name's `NamePart` objects: `span.parts[0] is name.parts[i]`.
+    pub fn into_py(self, py: Python<'_>) -> PyResult<Py<Name>> {
+        let parts: Vec<Py<NamePart>> = self
+            .parts
+            .into_iter()
+            .map(|data| Py::new(py, NamePart::from_data(py, data)))
+            .collect::<PyResult<_>>()?;
+        let name_parts = parts.iter().map(|p| p.clone_ref(py)).collect();
+        let name = Name::from_parts(py, &self.original, self.form, self.tag, name_parts)?;
+        let spans = name.spans.bind(py);
+        for span in self.spans {
+            let span_parts = span
+                .parts
+                .iter()
+                .map(|&i| parts[i as usize].clone_ref(py))
+                .collect();
+            let symbol = Py::new(py, span.symbol)?;
+            spans.append(Py::new(py, Span::new(py, span_parts, symbol)?)?)?;
+        }
+        Py::new(py, name)
+    }
+
+    /// Copy an existing `Name` out of its objects.
+    pub fn from_name(py: Python<'_>, name: &Name) -> PyResult<Self> {
+        let mut parts = Vec::new();
+        for item in name.parts.bind(py).iter() {
+            let part = item.cast::<NamePart>()?.borrow();
+            let ascii = match &part.ascii {
+                Some(a) => Some(a.bind(py).to_str()?.to_string()),
+                None => None,
+            };
+            let metaphone = match &part.metaphone {
+                Some(m) => Some(m.bind(py).to_str()?.to_string()),
+                None => None,
+            };
+            parts.push(PartData {
+                form: part.form_str().to_string(),
+                index: part.index,
+                tag: part.tag,
+                latinize: part.latinize,
+                numeric: part.numeric,
+                ascii,
+                integer: part.integer,
+                comparable: part.comparable_str().to_string(),
+                metaphone,
+            });
+        }
+        let mut spans = Vec::new();
+        for item in name.spans.bind(py).iter() {
+            let span = item.cast::<Span>()?.get();
+            let mut indices = Vec::new();
+            for p in span.parts.bind(py).iter() {
+                let index = p.cast::<NamePart>()?.borrow().index;
+                if index as usize >= parts.len() {
+                    return Err(PyValueError::new_err(
+                        "span references a part outside its name",
+                    ));
+                }
+                indices.push(index);
+            }
+            spans.push(SpanData {
+                parts: indices,
+                symbol: span.symbol.bind(py).get().clone(),
+            });
+        }
+        Ok(Self {
+            original: name.original.bind(py).to_str()?.to_string(),
+            form: name.form_str.clone(),
+            tag: name.tag,
+            parts,
+            spans,
+        })
+    }
+
+    /// [`Name::tag_text`].
+    pub fn tag_text(&mut self, text: &str, tag: NamePartTag, max_matches: u32) {
+        let tokens = name_tokenize(&casefold(text));
+        let forms: Vec<&str> = self.parts.iter().map(|p| p.form.as_str()).collect();
+        let limit = max_matches.max(1) as usize;
+        for group in phrase_matches(&forms, &tokens).into_iter().take(limit) {
+            for idx in group {
+                let part = &mut self.parts[idx];
+                part.tag = merge_tag(part.tag, tag);
+            }
+        }
+    }
+
+    /// [`Name::apply_phrase`].
+    pub fn apply_phrase(&mut self, phrase: &str, symbol: &Symbol) {
+        let applied = self.spans.iter().any(|span| {
+            let forms: Vec<&str> = span
+                .parts
+                .iter()
+                .map(|&i| self.parts[i as usize].form.as_str())
+                .collect();
+            span.symbol == *symbol && forms.join(" ") == phrase
+        });
+        if applied {
+            return;
+        }
+        let tokens: Vec<&str> = phrase.split(' ').collect();
+        let forms: Vec<&str> = self.parts.iter().map(|p| p.form.as_str()).collect();
+        for group in phrase_matches(&forms, &tokens) {
+            self.spans.push(SpanData {
+                parts: group.into_iter().map(|idx| idx as u32).collect(),
+                symbol: symbol.clone(),
+            });
+        }
+    }
+
+    /// [`Name::apply_part`], with the part given by position.
+    pub fn apply_part(&mut self, part: u32, symbol: Symbol) {
+        let applied = self
+            .spans
+            .iter()
+            .any(|span| span.symbol == symbol && span.parts == [part]);
+        if !applied {
+            self.spans.push(SpanData {
+                parts: vec![part],
+                symbol,
+            });
+        }
+    }
+
+    /// [`Name::contains`].
+    pub fn contains(&self, other: &NameData) -> bool {
+        if self.form == other.form || self.tag == NameTypeTag::UNK {
+            return false;
+        }
+        if self.parts.len() < other.parts.len() {
+            return false;
+        }
+        if self.tag == NameTypeTag::PER {
+            let self_forms: Vec<String> = self.parts.iter().map(|p| p.comparable.clone()).collect();
+            let other_forms: Vec<String> =
+                other.parts.iter().map(|p| p.comparable.clone()).collect();
+            let mut common = list_intersection(&self_forms, &other_forms);
+            for o_span in &other.spans {
+                if o_span.symbol.category != SymbolCategory::INITIAL {
+                    continue;
+                }
+                let Some(&first) = o_span.parts.first() else {
+                    continue;
+                };
+                if other.parts[first as usize].form.chars().count() > 1 {
+                    continue;
+                }
+                if self.spans.iter().any(|s| s.symbol == o_span.symbol) {
+                    let comparable: Vec<&str> = o_span
+                        .parts
+                        .iter()
+                        .map(|&i| other.parts[i as usize].comparable.as_str())
+                        .collect();
+                    common.push(comparable.join(" "));
+                }
+            }
+            if common.len() == other_forms.len() {
+                return true;
+            }
+        }
+        self.norm_form().contains(&other.norm_form())
+    }
+}
+
+/// The tag a part ends up with when `new_tag` is applied over
+/// `current`: first writer wins, and a conflicting later tag demotes
+/// the part to `AMBIGUOUS`.
+fn merge_tag(current: NamePartTag, new_tag: NamePartTag) -> NamePartTag {
+    if current == NamePartTag::UNSET {
+        new_tag
+    } else if !current.can_match(new_tag) {
+        NamePartTag::AMBIGUOUS
+    } else {
+        current
+    }
+}
+
+/// The occurrences of `tokens` among the part `forms`, as
+/// `tag_text` and `apply_phrase` find them: walking the parts in
+/// order, each part equal to the next wanted token joins the current
+/// occurrence (other parts may sit in between), and a completed
+/// occurrence starts the next. Returns part positions per occurrence.
+fn phrase_matches<S: AsRef<str>, T: AsRef<str>>(forms: &[S], tokens: &[T]) -> Vec<Vec<usize>> {
+    let mut found = Vec::new();
+    if tokens.is_empty() {
+        return found;
+    }
+    let mut matching: Vec<usize> = Vec::with_capacity(tokens.len());
+    for (idx, form) in forms.iter().enumerate() {
+        if form.as_ref() == tokens[matching.len()].as_ref() {
+            matching.push(idx);
         }
-        if !current.can_match(new_tag) {
-            bind.borrow_mut().tag = NamePartTag::AMBIGUOUS;
+        if matching.len() == tokens.len() {
+            found.push(std::mem::take(&mut matching));
         }
     }
+    found
 }
 
 fn comparable_list(py: Python<'_>, parts: &Py<PyTuple>) -> PyResult<Vec<String>> {
@@ -431,7 +700,7 @@ fn comparable_list(py: Python<'_>, parts: &Py<PyTuple>) -> PyResult<Vec<String>>
 
 /// Multi-set intersection: each element in `a` consumes at most one
 /// matching element in `b`; the matched elements form the output.
-fn list_intersection(a: &[String], b: &[String]) -> Vec<String> {
+pub(crate) fn list_intersection(a: &[String], b: &[String]) -> Vec<String> {
     let mut avail: Vec<Option<&String>> = b.iter().map(Some).collect();
     let mut out = Vec::new();
     for x in a {
@@ -40,7 +40,7 @@
 use pyo3::prelude::*;
 
 use crate::names::constants::MAX_NAME_LENGTH;
-use crate::names::part::{NamePart, tag_sort_parts};
+use crate::names::part::NamePart;
 use crate::names::tag::NamePartTag;
 use crate::text::distance::damerau_levenshtein_cutoff;
 
@@ -50,11 +50,11 @@ const SCORE_FLOOR: f64 = 0.3;
 
 /// Cheap per-part snapshot, built once at entry so the scoring loop
 /// doesn't re-borrow `Py<NamePart>` per iteration.
-struct PartView {
-    form_len: usize,
-    comparable: String,
-    comparable_len: usize,
-    tag: NamePartTag,
+pub(crate) struct PartView {
+    pub(crate) form_len: usize,
+    pub(crate) comparable: String,
+    pub(crate) comparable_len: usize,
+    pub(crate) tag: NamePartTag,
 }
 
 fn extract_views(py: Python<'_>, parts: &[Py<NamePart>]) -> Vec<PartView> {
@@ -276,6 +276,28 @@ fn align_views(
     (left_out, right_out, matched)
 }
 
+/// Stable `tag_sort_parts` order over views, as indices.
+fn tag_sort_order(views: &[PartView]) -> Vec<usize> {
+    let mut order: Vec<usize> = (0..views.len()).collect();
+    order.sort_by_key(|&i| views[i].tag.order_index());
+    order
+}
+
+/// View-level form of [`py_align_person_name_order`], returning
+/// index orders into `left` / `right` — the same empty-left and
+/// nothing-aligned fallbacks included. Pure Rust, so the set
+/// matcher can call it with the GIL released.
+pub(crate) fn align_order(left: &[PartView], right: &[PartView]) -> (Vec<usize>, Vec<usize>) {
+    if left.is_empty() {
+        return (Vec::new(), tag_sort_order(right));
+    }
+    let (left_order, right_order, matched) = align_views(left, right);
+    if !matched {
+        return (tag_sort_order(left), tag_sort_order(right));
+    }
+    (left_order, right_order)
+}
+
 /// Greedy-align two lists of name parts so comparable tokens share
 /// the same output index.
 ///
@@ -295,17 +317,9 @@ pub fn py_align_person_name_order(
     left: Vec<Py<NamePart>>,
     right: Vec<Py<NamePart>>,
 ) -> (Vec<Py<NamePart>>, Vec<Py<NamePart>>) {
-    if left.is_empty() {
-        return (left, tag_sort_parts(py, right));
-    }
-
     let left_views = extract_views(py, &left);
     let right_views = extract_views(py, &right);
-    let (left_order, right_order, matched) = align_views(&left_views, &right_views);
-
-    if !matched {
-        return (tag_sort_parts(py, left), tag_sort_parts(py, right));
-    }
+    let (left_order, right_order) = align_order(&left_views, &right_views);
 
     let left_result: Vec<Py<NamePart>> =
         left_order.iter().map(|&i| left[i].clone_ref(py)).collect();
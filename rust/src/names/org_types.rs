@@ -35,8 +35,9 @@
 
 use icu::casemap::CaseMapper;
 use serde::Deserialize;
+use std::cell::RefCell;
 use std::collections::{HashMap, HashSet};
-use std::sync::{Arc, LazyLock, RwLock};
+use std::sync::{LazyLock, RwLock};
 
 use crate::names::matcher::Needles;
 use crate::text::normalize::{Cleanup, Normalize, SquashAction, normalize, squash_action};
@@ -53,7 +54,8 @@ pub(crate) struct OrgTypeSpec {
     pub(crate) aliases: Vec<String>,
 }
 
-const ORG_TYPES_ZST: &[u8] = include_bytes!(concat!(env!("OUT_DIR"), "/org_types.json.zst"));
+pub(crate) const ORG_TYPES_ZST: &[u8] =
+    include_bytes!(concat!(env!("OUT_DIR"), "/org_types.json.zst"));
 
 pub(crate) static ORG_TYPE_SPECS: LazyLock<Vec<OrgTypeSpec>> = LazyLock::new(|| {
     let bytes = zstd::decode_all(ORG_TYPES_ZST).expect("zstd decode org_types.json.zst");
@@ -243,26 +245,60 @@ fn build_display(flags: Normalize, cleanup: Cleanup) -> Replacer {
     }
 }
 
-type ReplacerCache = RwLock<HashMap<(ReplacerKind, Normalize, Cleanup), Arc<Replacer>>>;
+// Same layout as the tagger cache: replacers are never evicted, so
+// they're leaked to `&'static` and fronted by a per-thread map, keeping
+// the shared lock off the hot path once each thread has warmed up.
+type ReplacerKey = (ReplacerKind, Normalize, Cleanup);
+type ReplacerCache = RwLock<HashMap<ReplacerKey, &'static Replacer>>;
 
 static REPLACER_CACHE: LazyLock<ReplacerCache> = LazyLock::new(|| RwLock::new(HashMap::new()));
 
-fn get_replacer(kind: ReplacerKind, flags: Normalize, cleanup: Cleanup) -> Arc<Replacer> {
+thread_local! {
+    static LOCAL_REPLACERS: RefCell<HashMap<ReplacerKey, &'static Replacer>> =
+        RefCell::new(HashMap::new());
+}
+
+fn get_replacer(kind: ReplacerKind, flags: Normalize, cleanup: Cleanup) -> &'static Replacer {
     let key = (kind, flags, cleanup);
-    if let Some(existing) = REPLACER_CACHE.read().unwrap().get(&key) {
-        return existing.clone();
+    if let Some(local) = LOCAL_REPLACERS.with_borrow(|m| m.get(&key).copied()) {
+        return local;
+    }
+    let replacer = shared_replacer(key);
+    LOCAL_REPLACERS.with_borrow_mut(|m| m.insert(key, replacer));
+    replacer
+}
+
+fn shared_replacer(key: ReplacerKey) -> &'static Replacer {
+    if let Some(existing) = REPLACER_CACHE.read().unwrap().get(&key).copied() {
+        return existing;
     }
-    let built = Arc::new(match kind {
+    let (kind, flags, cleanup) = key;
+    let built = match kind {
         ReplacerKind::Compare => build_compare(flags, cleanup),
         ReplacerKind::Display => build_display(flags, cleanup),
         ReplacerKind::Generic => build_generic(flags, cleanup),
-    });
+    };
     let mut writer = REPLACER_CACHE.write().unwrap();
-    Arc::clone(writer.entry(key).or_insert(built))
+    *writer
+        .entry(key)
+        .or_insert_with(|| Box::leak(Box::new(built)))
 }
 
 // ----- Public functions -----
 
+/// Build the replacers the Python wrappers' default flags and
+/// `analyze_names` use, so their first call doesn't pay for it.
+pub fn preload() {
+    let compare = Normalize::CASEFOLD;
+    get_replacer(ReplacerKind::Compare, compare, Cleanup::Noop);
+    get_replacer(ReplacerKind::Generic, compare, Cleanup::Noop);
+    get_replacer(
+        ReplacerKind::Display,
+        compare | Normalize::SQUASH_SPACES,
+        Cleanup::Noop,
+    );
+}
+
 /// Replace recognised org types with their compare / generic form.
 /// `generic=false` uses the Compare replacer (target = `compare`
 /// form, or display if absent, or "" for explicit removal).
@@ -614,8 +650,8 @@ mod tests {
         let compare = get_replacer(ReplacerKind::Compare, COMPARE_FLAGS, Cleanup::Noop);
         let display = get_replacer(ReplacerKind::Display, COMPARE_FLAGS, Cleanup::Noop);
         let generic = get_replacer(ReplacerKind::Generic, COMPARE_FLAGS, Cleanup::Noop);
-        assert!(!Arc::ptr_eq(&compare, &display));
-        assert!(!Arc::ptr_eq(&compare, &generic));
-        assert!(!Arc::ptr_eq(&display, &generic));
+        assert!(!std::ptr::eq(compare, display));
+        assert!(!std::ptr::eq(compare, generic));
+        assert!(!std::ptr::eq(display, generic));
     }
 }
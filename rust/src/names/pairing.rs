@@ -60,7 +60,7 @@ const COMPONENT_NODE_BUDGET: usize = 4096;
 const PRODUCT_ITER_BUDGET: usize = 4096;
 
 /// Bundled output of [`collect_spans`].
-type SpansAndSymbols = (Vec<SpanInfo>, HashMap<Symbol, Py<Symbol>>);
+pub(crate) type SpansAndSymbols = (Vec<SpanInfo>, HashMap<Symbol, Py<Symbol>>);
 
 /// Per-part fields the pairing algorithm reads: tag (for
 /// NAME/NICK compatibility checks) and character length (for
@@ -74,28 +74,28 @@ struct PartInfo {
 
 /// One tagger-attached span flattened for pairing-side use.
 #[derive(Clone, Debug)]
-struct SpanInfo {
+pub(crate) struct SpanInfo {
     parts: Vec<PartInfo>,
-    mask: u64,
+    pub(crate) mask: u64,
     min_idx: u32,
-    symbol: Symbol,
+    pub(crate) symbol: Symbol,
 }
 
 /// A candidate edge — a tentative binding of one query span to
 /// one result span. Coverage lives in the bitmasks;
 /// [`mask_to_part_vec`] expands them to index lists at output.
 #[derive(Clone, Debug)]
-struct Edge {
-    qmask: u64,
-    rmask: u64,
-    symbol: Symbol,
+pub(crate) struct Edge {
+    pub(crate) qmask: u64,
+    pub(crate) rmask: u64,
+    pub(crate) symbol: Symbol,
 }
 
 /// Flatten a [`Name`]'s tagger spans into pairing-ready
 /// [`SpanInfo`] records, and index the Python `Symbol` objects
 /// by their Rust-side equivalents for zero-alloc reuse at output.
 /// Output is sorted by span start position.
-fn collect_spans(py: Python<'_>, name: &Name) -> PyResult<SpansAndSymbols> {
+pub(crate) fn collect_spans(py: Python<'_>, name: &Name) -> PyResult<SpansAndSymbols> {
     let spans_list = name.spans.bind(py);
     let mut out: Vec<SpanInfo> = Vec::with_capacity(spans_list.len());
     let mut sym_py: HashMap<Symbol, Py<Symbol>> = HashMap::new();
@@ -574,14 +574,14 @@ fn enumerate_coverings(edges: &[Edge]) -> Vec<Vec<usize>> {
 /// Used when input guards trip (> 64 parts, missing spans) so
 /// callers get a well-formed but non-matched result they can
 /// fall through to full Levenshtein on.
-fn empty_output(py: Python<'_>) -> PyResult<Py<PyList>> {
+pub(crate) fn empty_output(py: Python<'_>) -> PyResult<Py<PyList>> {
     let empty_tuple = PyTuple::empty(py);
     let list = PyList::new(py, [empty_tuple])?;
     Ok(list.unbind())
 }
 
 /// Expand a part-index bitmask to an ascending index vector.
-fn mask_to_part_vec(mut mask: u64) -> Vec<u32> {
+pub(crate) fn mask_to_part_vec(mut mask: u64) -> Vec<u32> {
     let mut out: Vec<u32> = Vec::with_capacity(mask.count_ones() as usize);
     while mask != 0 {
         out.push(mask.trailing_zeros());
@@ -640,6 +640,38 @@ fn build_pairing(
     Ok(PyTuple::new(py, &edge_objs)?.unbind())
 }
 
+/// The pure-Rust core of [`py_pair_symbols`]: candidate edges,
+/// subsumption pruning, dedupe, the [`MAX_EDGES`] cap and covering
+/// enumeration. Returns the final sorted edge list alongside the
+/// coverings that index into it.
+pub(crate) fn pair_spans(
+    q_spans: &[SpanInfo],
+    r_spans: &[SpanInfo],
+) -> (Vec<Edge>, Vec<Vec<usize>>) {
+    let mut edges = build_candidate_edges(q_spans, r_spans);
+    prune_subsumed(&mut edges);
+    dedupe_equivalent_edges(&mut edges);
+    if edges.len() > MAX_EDGES {
+        // Keep the widest-coverage edges; deterministic tie-break
+        // on the full sort key. Only reachable on adversarial
+        // input — real names produce single-digit edge counts.
+        edges.sort_by_cached_key(|e| {
+            (
+                std::cmp::Reverse(e.qmask.count_ones() + e.rmask.count_ones()),
+                e.qmask,
+                e.rmask,
+                e.symbol.category,
+                e.symbol.id.clone(),
+            )
+        });
+        edges.truncate(MAX_EDGES);
+    }
+    edges.sort_by_cached_key(edge_sort_key);
+
+    let coverings = enumerate_coverings(&edges);
+    (edges, coverings)
+}
+
 /// Align the symbol spans of two [`Name`]s into coverage-maximal
 /// pairings.
 ///
@@ -680,37 +712,38 @@ pub fn py_pair_symbols(
 
     let (q_spans, q_symbols) = collect_spans(py, &query)?;
     let (r_spans, _r_symbols) = collect_spans(py, &result)?;
+    pair_collected(
+        py,
+        &q_spans,
+        &q_symbols,
+        query_parts,
+        &r_spans,
+        result_parts,
+    )
+}
+
+/// Output stage of [`py_pair_symbols`], over spans that were already
+/// collected — shared with prepared names, which collect the query
+/// side once and pair it against many results.
+pub(crate) fn pair_collected(
+    py: Python<'_>,
+    q_spans: &[SpanInfo],
+    q_symbols: &HashMap<Symbol, Py<Symbol>>,
+    query_parts: &Bound<'_, PyTuple>,
+    r_spans: &[SpanInfo],
+    result_parts: &Bound<'_, PyTuple>,
+) -> PyResult<Py<PyList>> {
     if q_spans.is_empty() || r_spans.is_empty() {
         return empty_output(py);
     }
 
-    let mut edges = build_candidate_edges(&q_spans, &r_spans);
-    prune_subsumed(&mut edges);
-    dedupe_equivalent_edges(&mut edges);
-    if edges.len() > MAX_EDGES {
-        // Keep the widest-coverage edges; deterministic tie-break
-        // on the full sort key. Only reachable on adversarial
-        // input — real names produce single-digit edge counts.
-        edges.sort_by_cached_key(|e| {
-            (
-                std::cmp::Reverse(e.qmask.count_ones() + e.rmask.count_ones()),
-                e.qmask,
-                e.rmask,
-                e.symbol.category,
-                e.symbol.id.clone(),
-            )
-        });
-        edges.truncate(MAX_EDGES);
-    }
-    edges.sort_by_cached_key(edge_sort_key);
-
-    let coverings = enumerate_coverings(&edges);
+    // Edge building and covering enumeration work on the owned
+    // `SpanInfo` copies only; release the GIL for them.
+    let (edges, coverings) = py.detach(|| pair_spans(q_spans, r_spans));
 
-    let qp_ref = &query_parts;
-    let rp_ref = &result_parts;
     let pairings: Vec<Py<PyTuple>> = coverings
         .iter()
-        .map(|indices| build_pairing(py, &edges, indices, &q_symbols, qp_ref, rp_ref))
+        .map(|indices| build_pairing(py, &edges, indices, q_symbols, query_parts, result_parts))
         .collect::<PyResult<Vec<_>>>()?;
 
     Ok(PyList::new(py, &pairings)?.unbind())
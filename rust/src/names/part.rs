@@ -7,8 +7,9 @@
 use std::hash::{DefaultHasher, Hash, Hasher};
 
 use pyo3::prelude::*;
-use pyo3::types::PyString;
+use pyo3::types::{PyString, PyTuple};
 
+use crate::names::symbol::Symbol;
 use crate::names::tag::NamePartTag;
 use crate::text::numbers::string_number;
 use crate::text::phonetics::metaphone;
@@ -95,6 +96,77 @@ fn compute_metaphone(
     Some(metaphone(text))
 }
 
+/// The eagerly-derived fields of a [`NamePart`], computed in plain
+/// Rust. Split from the pyclass so the analysis pipeline can derive
+/// parts off the GIL (on batch worker threads) and box the strings
+/// into `PyString`s in one pass at the end, via
+/// [`NamePart::from_data`].
+#[derive(Clone, Debug)]
+pub struct PartData {
+    pub form: String,
+    pub index: u32,
+    pub tag: NamePartTag,
+    pub latinize: bool,
+    pub numeric: bool,
+    pub ascii: Option<String>,
+    pub integer: Option<i64>,
+    pub comparable: String,
+    pub metaphone: Option<String>,
+}
+
+impl PartData {
+    /// Derive every cached field of a part from its token `form`.
+    /// See [`NamePart::new`] for the field semantics.
+    pub fn compute(form: &str, index: u32, tag: NamePartTag, phonetics: bool) -> Self {
+        let numeric = !form.is_empty() && form.chars().all(|c| c.is_numeric());
+        let latinize = should_ascii(form);
+        // Plain ASCII digit strings parse directly — exact up to 19
+        // digits, where the string_number fallback (f64-based, used
+        // for non-ASCII numerals) loses integer precision past 2^53
+        // and would silently corrupt registry-number values.
+        let integer = if numeric {
+            form.parse::<i64>()
+                .ok()
+                .or_else(|| match string_number(form) {
+                    Some(v)
+                        if v.is_finite()
+                            && v.fract() == 0.0
+                            && v >= i64::MIN as f64
+                            && v <= i64::MAX as f64 =>
+                    {
+                        Some(v as i64)
+                    }
+                    _ => None,
+                })
+        } else {
+            None
+        };
+        let ascii = compute_ascii(form, numeric, latinize, integer);
+        let comparable = compute_comparable(form, numeric, latinize, integer, ascii.as_deref());
+        let metaphone = compute_metaphone(phonetics, latinize, numeric, ascii.as_deref());
+        Self {
+            form: form.to_string(),
+            index,
+            tag,
+            latinize,
+            numeric,
+            ascii,
+            integer,
+            comparable,
+            metaphone,
+        }
+    }
+}
+
+/// A [`Span`] in plain Rust: the positions of the covered parts
+/// within the parent name, plus the symbol. Part of
+/// [`crate::names::name::NameData`].
+#[derive(Clone, Debug)]
+pub struct SpanData {
+    pub parts: Vec<u32>,
+    pub symbol: Symbol,
+}
+
 /// A single tagged component of a [`crate::names::name::Name`].
 ///
 /// Equality and hashing are over `(index, form)` — the immutable
@@ -158,57 +230,7 @@ impl NamePart {
     #[new]
     #[pyo3(signature = (form, index, tag = NamePartTag::UNSET, phonetics = true))]
     pub fn new(py: Python<'_>, form: &str, index: u32, tag: NamePartTag, phonetics: bool) -> Self {
-        let form_str = form.to_string();
-        let numeric = !form_str.is_empty() && form_str.chars().all(|c| c.is_numeric());
-        let latinize = should_ascii(form);
-        // Plain ASCII digit strings parse directly — exact up to 19
-        // digits, where the string_number fallback (f64-based, used
-        // for non-ASCII numerals) loses integer precision past 2^53
-        // and would silently corrupt registry-number values.
-        let integer = if numeric {
-            form_str
-                .parse::<i64>()
-                .ok()
-                .or_else(|| match string_number(form) {
-                    Some(v)
-                        if v.is_finite()
-                            && v.fract() == 0.0
-                            && v >= i64::MIN as f64
-                            && v <= i64::MAX as f64 =>
-                    {
-                        Some(v as i64)
-                    }
-                    _ => None,
-                })
-        } else {
-            None
-        };
-        let ascii_s = compute_ascii(&form_str, numeric, latinize, integer);
-        let comparable_str =
-            compute_comparable(&form_str, numeric, latinize, integer, ascii_s.as_deref());
-        let metaphone_s = compute_metaphone(phonetics, latinize, numeric, ascii_s.as_deref());
-
-        let hash = hash_namepart(index, &form_str);
-
-        let form_py = PyString::new(py, &form_str).unbind();
-        let ascii_py = ascii_s.as_ref().map(|s| PyString::new(py, s).unbind());
-        let comparable_py = PyString::new(py, &comparable_str).unbind();
-        let metaphone_py = metaphone_s.as_ref().map(|s| PyString::new(py, s).unbind());
-
-        Self {
-            form: form_py,
-            index,
-            tag,
-            latinize,
-            numeric,
-            ascii: ascii_py,
-            integer,
-            comparable: comparable_py,
-            metaphone: metaphone_py,
-            form_str,
-            comparable_str,
-            hash,
-        }
+        Self::from_data(py, PartData::compute(form, index, tag, phonetics))
     }
 
     fn __eq__(&self, other: &Bound<'_, PyAny>) -> bool {
@@ -226,6 +248,62 @@ impl NamePart {
         self.form_str.chars().count()
     }
 
+    /// Pickle support. Restores through `_restore`, which takes the
+    /// derived fields as stored instead of recomputing them.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, Bound<'py, PyTuple>)> {
+        let py = slf.py();
+        let p = slf.borrow();
+        let state = (
+            p.form.clone_ref(py),
+            p.index,
+            p.tag,
+            p.latinize,
+            p.numeric,
+            p.ascii.as_ref().map(|a| a.clone_ref(py)),
+            p.integer,
+            p.comparable.clone_ref(py),
+            p.metaphone.as_ref().map(|m| m.clone_ref(py)),
+        )
+            .into_pyobject(py)?;
+        Ok((slf.get_type().getattr("_restore")?, state))
+    }
+
+    /// Unpickling constructor: rebuild a part from its stored fields.
+    /// Not a public API — the arguments are not validated against
+    /// `form`.
+    #[classmethod]
+    #[allow(clippy::too_many_arguments)]
+    fn _restore(
+        _cls: &Bound<'_, pyo3::types::PyType>,
+        py: Python<'_>,
+        form: String,
+        index: u32,
+        tag: NamePartTag,
+        latinize: bool,
+        numeric: bool,
+        ascii: Option<String>,
+        integer: Option<i64>,
+        comparable: String,
+        metaphone: Option<String>,
+    ) -> Self {
+        Self::from_data(
+            py,
+            PartData {
+                form,
+                index,
+                tag,
+                latinize,
+                numeric,
+                ascii,
+                integer,
+                comparable,
+                metaphone,
+            },
+        )
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "<NamePart('{}', {}, '{}')>",
@@ -281,6 +359,29 @@ pub fn tag_sort_parts(py: Python<'_>, parts: Vec<Py<NamePart>>) -> Vec<Py<NamePa
 }
 
 impl NamePart {
+    /// Box precomputed [`PartData`] into a `NamePart`. The only
+    /// place the part's strings cross into Python objects.
+    pub fn from_data(py: Python<'_>, data: PartData) -> Self {
+        let hash = hash_namepart(data.index, &data.form);
+        Self {
+            form: PyString::new(py, &data.form).unbind(),
+            index: data.index,
+            tag: data.tag,
+            latinize: data.latinize,
+            numeric: data.numeric,
+            ascii: data.ascii.as_ref().map(|s| PyString::new(py, s).unbind()),
+            integer: data.integer,
+            comparable: PyString::new(py, &data.comparable).unbind(),
+            metaphone: data
+                .metaphone
+                .as_ref()
+                .map(|s| PyString::new(py, s).unbind()),
+            form_str: data.form,
+            comparable_str: data.comparable,
+            hash,
+        }
+    }
+
     /// Rust-only accessor for the token text. Cheaper than
     /// `self.form.bind(py).extract::<String>()` when you already hold
     /// a `&NamePart`.
@@ -312,7 +413,11 @@ fn hash_namepart(index: u32, form: &str) -> isize {
 
 /// A contiguous group of [`NamePart`]s annotated with a
 /// [`crate::names::symbol::Symbol`] — the tagger's output unit.
-#[pyclass(module = "rigour._core")]
+///
+/// Immutable after construction, so declared `frozen`: reads skip
+/// the borrow flag, which matters once many threads walk the same
+/// name's spans on free-threaded builds.
+#[pyclass(frozen, module = "rigour._core")]
 pub struct Span {
     /// The [`NamePart`]s covered by this span. Same `Py<NamePart>`
     /// references that live in the parent [`crate::names::name::Name`]'s
@@ -384,6 +489,21 @@ impl Span {
         self.hash
     }
 
+    /// Pickle support: rebuilt from its parts and symbol.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> (
+        Bound<'py, pyo3::types::PyType>,
+        (Py<PyTuple>, Py<crate::names::symbol::Symbol>),
+    ) {
+        let py = slf.py();
+        let span = slf.get();
+        (
+            slf.get_type(),
+            (span.parts.clone_ref(py), span.symbol.clone_ref(py)),
+        )
+    }
+
     fn __eq__(&self, other: &Bound<'_, PyAny>) -> bool {
         match other.extract::<PyRef<'_, Span>>() {
             Ok(s) => s.hash == self.hash,
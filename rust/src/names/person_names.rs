@@ -23,7 +23,8 @@
 /// The compressed corpus — produced by `build.rs` from
 /// `rust/data/names/person_names.txt` (build fails if the source
 /// file is missing).
-const COMPRESSED: &[u8] = include_bytes!(concat!(env!("OUT_DIR"), "/person_names.txt.zst"));
+pub(crate) const COMPRESSED: &[u8] =
+    include_bytes!(concat!(env!("OUT_DIR"), "/person_names.txt.zst"));
 
 /// Decompress the corpus into a fresh `String`. Caller owns the
 /// allocation and is expected to drop it once per-line parsing is
@@ -33,6 +33,13 @@ static ORG_PREFIX_RE: LazyLock<Regex> =
 static OBJ_PREFIX_RE: LazyLock<Regex> =
     LazyLock::new(|| build_prefix_regex(&obj_name_prefixes_list()));
 
+/// Compile all three prefix regexes now rather than on first use.
+pub fn preload() {
+    LazyLock::force(&PERSON_PREFIX_RE);
+    LazyLock::force(&ORG_PREFIX_RE);
+    LazyLock::force(&OBJ_PREFIX_RE);
+}
+
 /// Strip honorific prefixes ("Mr.", "Mrs.", "Dr.", "Lady", …) from
 /// the head of a person name. Called before analysing or matching to
 /// stop honorifics from contaminating part alignment.
@@ -0,0 +1,225 @@
+//! The [`PreparedName`] pyclass — one query name, pre-digested for
+//! scoring against many candidates.
+//!
+//! A screening request compares one query `Name` against tens of
+//! candidates with several names each. Through the free functions,
+//! every `pair_symbols` call re-walks the query's spans into
+//! [`SpanInfo`] bitmasks and every `compare_parts` call re-joins and
+//! re-decodes the query's `comparable` strings into the DP's char
+//! vector. A `PreparedName` does the span work once at construction
+//! and keeps the Rust-side form: span infos and their `Symbol`
+//! objects, and the [`NameView`] the set matcher and the score bound
+//! read. Each method then only derives the candidate side.
+//!
+//! The query residue a matcher hands to `compare_parts` differs per
+//! pairing (the parts left after symbol pairing, reordered by
+//! `align_person_name_order` or `tag_sort`), but the same residue
+//! recurs across candidates. Residue char arrays are therefore cached
+//! by the `comparable` sequence actually passed in, not built once
+//! for the full name.
+//!
+//! Outputs are identical to the free functions with the prepared
+//! name as the query. The prepared form snapshots the name: spans
+//! the tagger adds to it afterwards are not seen — prepare after
+//! analysis is complete.
+
+use std::collections::HashMap;
+use std::sync::{Arc, RwLock};
+
+use pyo3::prelude::*;
+use pyo3::types::PyList;
+
+use crate::names::alignment::Alignment;
+use crate::names::compare::{
+    CompareConfig, Residue, default_config, residue_alignments, score_residues,
+};
+use crate::names::constants::MAX_PARTS;
+use crate::names::name::Name;
+use crate::names::pairing::{collect_spans, empty_output, pair_collected};
+use crate::names::part::NamePart;
+use crate::names::set_match::{MatchConfig, NameSetMatch, NameView, pair_upper_bound, run_match};
+use crate::names::symbol::Symbol;
+
+/// A query [`Name`] with its pairing and residue inputs precomputed.
+///
+/// Build with `PreparedName(name)` or `name.prepare()`.
+#[pyclass(frozen, module = "rigour._core")]
+pub struct PreparedName {
+    /// The name this was prepared from.
+    #[pyo3(get)]
+    name: Py<Name>,
+    view: NameView,
+    symbols: HashMap<Symbol, Py<Symbol>>,
+    residues: RwLock<HashMap<Vec<String>, Arc<Residue>>>,
+}
+
+/// Distinct query residues kept per prepared name. A name has few
+/// parts, so its pairings leave few distinct residues; the cap only
+/// guards against callers passing arbitrary part lists.
+const MAX_RESIDUES: usize = 64;
+
+impl PreparedName {
+    pub fn build(py: Python<'_>, name: &Bound<'_, Name>) -> PyResult<Self> {
+        let (view, symbols) = NameView::collect(py, &name.borrow())?;
+        Ok(Self {
+            name: name.clone().unbind(),
+            view,
+            symbols,
+            residues: RwLock::new(HashMap::new()),
+        })
+    }
+
+    /// The residue for the query parts `qry`, from the cache if this
+    /// sequence was seen before.
+    fn residue(&self, py: Python<'_>, qry: &[Py<NamePart>]) -> Arc<Residue> {
+        let key = part_comparables(py, qry);
+        if let Some(residue) = self.residues.read().unwrap().get(&key) {
+            return residue.clone();
+        }
+        let residue = Arc::new(Residue::new(&key));
+        let mut cache = self.residues.write().unwrap();
+        if cache.len() < MAX_RESIDUES {
+            cache.insert(key, residue.clone());
+        }
+        residue
+    }
+
+    fn pair_one(&self, py: Python<'_>, other: &Name) -> PyResult<Py<PyList>> {
+        let name = self.name.bind(py).borrow();
+        let q_parts = name.parts.bind(py);
+        let r_parts = other.parts.bind(py);
+        if q_parts.len() > MAX_PARTS || r_parts.len() > MAX_PARTS {
+            return empty_output(py);
+        }
+        let (r_spans, _) = collect_spans(py, other)?;
+        pair_collected(
+            py,
+            &self.view.spans,
+            &self.symbols,
+            q_parts,
+            &r_spans,
+            r_parts,
+        )
+    }
+}
+
+fn part_comparables(py: Python<'_>, parts: &[Py<NamePart>]) -> Vec<String> {
+    parts
+        .iter()
+        .map(|p| p.bind(py).borrow().comparable_str().to_string())
+        .collect()
+}
+
+#[pymethods]
+impl PreparedName {
+    #[new]
+    fn new(py: Python<'_>, name: Bound<'_, Name>) -> PyResult<Self> {
+        Self::build(py, &name)
+    }
+
+    /// `pair_symbols(self.name, other)`.
+    fn pair_symbols(&self, py: Python<'_>, other: PyRef<'_, Name>) -> PyResult<Py<PyList>> {
+        self.pair_one(py, &other)
+    }
+
+    /// `pair_symbols(self.name, other)` for each of `others`.
+    fn pair_symbols_many(
+        &self,
+        py: Python<'_>,
+        others: Vec<PyRef<'_, Name>>,
+    ) -> PyResult<Vec<Py<PyList>>> {
+        others.iter().map(|o| self.pair_one(py, o)).collect()
+    }
+
+    /// `compare_parts(qry, res, config)`, with `qry` a residue of the
+    /// prepared name's parts; its char array is reused across calls.
+    #[pyo3(signature = (qry, res, config = None))]
+    fn compare_parts(
+        &self,
+        py: Python<'_>,
+        qry: Vec<Py<NamePart>>,
+        res: Vec<Py<NamePart>>,
+        config: Option<&CompareConfig>,
+    ) -> PyResult<Vec<Py<Alignment>>> {
+        let cfg = config.unwrap_or(default_config());
+        let q = self.residue(py, &qry);
+        let r = Residue::new(&part_comparables(py, &res));
+        let scored = py.detach(|| score_residues(cfg, &q, &r));
+        residue_alignments(py, scored, &qry, &res)
+    }
+
+    /// [`PreparedName::compare_parts`] of `qry` against each part
+    /// list in `candidates`, scored in one GIL-released pass.
+    #[pyo3(signature = (qry, candidates, config = None))]
+    fn compare_parts_many(
+        &self,
+        py: Python<'_>,
+        qry: Vec<Py<NamePart>>,
+        candidates: Vec<Vec<Py<NamePart>>>,
+        config: Option<&CompareConfig>,
+    ) -> PyResult<Vec<Vec<Py<Alignment>>>> {
+        let cfg = config.unwrap_or(default_config());
+        let q = self.residue(py, &qry);
+        let residues: Vec<Residue> = candidates
+            .iter()
+            .map(|res| Residue::new(&part_comparables(py, res)))
+            .collect();
+        let scored: Vec<_> = py.detach(|| {
+            residues
+                .iter()
+                .map(|r| score_residues(cfg, &q, r))
+                .collect()
+        });
+        scored
+            .into_iter()
+            .zip(&candidates)
+            .map(|(s, res)| residue_alignments(py, s, &qry, res))
+            .collect()
+    }
+
+    /// `score_upper_bound(self.name, other, config)`.
+    #[pyo3(signature = (other, config = None))]
+    fn score_upper_bound(
+        &self,
+        py: Python<'_>,
+        other: PyRef<'_, Name>,
+        config: Option<MatchConfig>,
+    ) -> PyResult<f64> {
+        let r = NameView::new(py, &other)?;
+        Ok(pair_upper_bound(
+            &config.unwrap_or_default(),
+            &self.view,
+            &r,
+        ))
+    }
+
+    /// `match_name_sets([self.name], results, config)`.
+    #[pyo3(signature = (results, config = None))]
+    fn match_names<'py>(
+        &self,
+        py: Python<'py>,
+        results: Vec<Bound<'py, Name>>,
+        config: Option<MatchConfig>,
+    ) -> PyResult<NameSetMatch> {
+        let views = results
+            .iter()
+            .map(|n| NameView::new(py, &n.borrow()))
+            .collect::<PyResult<Vec<_>>>()?;
+        let query = [self.name.bind(py).clone()];
+        run_match(
+            py,
+            &config.unwrap_or_default(),
+            std::slice::from_ref(&self.view),
+            &query,
+            &views,
+            &results,
+        )
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> String {
+        format!(
+            "<PreparedName({:?})>",
+            self.name.bind(py).borrow().form_str()
+        )
+    }
+}
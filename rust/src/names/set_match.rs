@@ -0,0 +1,745 @@
+//! N×M name-set matching in one FFI call.
+//!
+//! A screening matcher compares every query-side name of an entity
+//! against every result-side name and keeps the best pair. Done from
+//! Python, each pair crosses into Rust twice (`pair_symbols`,
+//! `compare_parts`) and the 80-alias Putin entity turns one
+//! candidate into thousands of crossings. [`py_match_name_sets`]
+//! runs the whole cross product here instead:
+//!
+//! 1. **Literal short-circuit.** Pairs with equal `Name.comparable`
+//!    score `1.0` outright; the longest shared form wins.
+//! 2. **Pre-filter.** A pair survives if its `comparable` forms
+//!    share a script (a side with no script — digits, punctuation —
+//!    counts as compatible) or its names share a non-`INITIAL`
+//!    symbol. Everything else has no text or tagger bridge and is
+//!    skipped unscored.
+//! 3. **Upper bound.** Each survivor gets a cheap score ceiling
+//!    ([`upper_bound`]); pairs are scored in descending bound
+//!    order and the loop stops as soon as the best score found
+//!    reaches the next pair's bound. The first survivor is always
+//!    scored, so any surviving pair yields a best pair, if only at 0.
+//! 4. **Scoring.** Per pair, every symbol pairing from
+//!    [`crate::names::pairing`] is scored: symbol edges take a
+//!    per-category score and weight from [`MatchConfig`], the
+//!    uncovered parts are ordered (person alignment for PER,
+//!    tag order otherwise) and run through the residue scorer of
+//!    [`crate::names::compare`]. The pairing score is the weighted
+//!    mean over all alignments; solo residue parts carry the
+//!    `extra_*_weight`. The best pairing is the pair's score.
+//!
+//! Stages 1–4 run on plain-Rust snapshots with the GIL released;
+//! only the winning pair's alignments are built as Python objects.
+
+use std::collections::{HashMap, HashSet};
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyTuple;
+
+use crate::names::alignment::Alignment;
+use crate::names::codec::CATEGORY_CODES;
+use crate::names::compare::{CompareConfig, default_config, score_residue};
+use crate::names::constants::MAX_PARTS;
+use crate::names::name::Name;
+use crate::names::ordering::{PartView, align_order};
+use crate::names::pairing::{SpanInfo, collect_spans, mask_to_part_vec, pair_spans};
+use crate::names::part::NamePart;
+use crate::names::symbol::{Symbol, SymbolCategory};
+use crate::names::tag::NameTypeTag;
+use crate::text::scripts::text_scripts;
+
+const N_CATEGORIES: usize = CATEGORY_CODES.len();
+
+/// Per-category defaults for symbol-edge scores: nomenklatura's
+/// logic_v2 `SYM_SCORES` table (`names/magic.py`). Categories that
+/// table leaves out (`PHONETIC`) score 1.0, as its `.get(cat, 1.0)`
+/// lookup does.
+fn default_symbol_score(cat: SymbolCategory) -> f64 {
+    match cat {
+        SymbolCategory::ORG_CLASS => 0.8,
+        SymbolCategory::NICK => 0.6,
+        SymbolCategory::PHONETIC => 1.0,
+        _ => 0.9,
+    }
+}
+
+/// Per-category defaults for symbol-edge weights: logic_v2's
+/// `SYM_WEIGHTS` table, with 1.0 for the categories it leaves out
+/// (`NAME`, `PHONETIC`).
+fn default_symbol_weight(cat: SymbolCategory) -> f64 {
+    match cat {
+        SymbolCategory::ORG_CLASS | SymbolCategory::DOMAIN => 0.7,
+        SymbolCategory::INITIAL => 0.5,
+        SymbolCategory::NICK | SymbolCategory::LOCATION => 0.8,
+        SymbolCategory::SYMBOL => 0.3,
+        SymbolCategory::NUMERIC => 1.3,
+        _ => 1.0,
+    }
+}
+
+/// Default weights for unmatched query / result residue parts: the
+/// `nm_extra_query_name` / `nm_extra_result_name` defaults of the
+/// logic_v2 matcher.
+const EXTRA_QUERY_WEIGHT: f64 = 0.8;
+const EXTRA_RESULT_WEIGHT: f64 = 0.2;
+
+/// Scoring knobs for [`py_match_name_sets`].
+///
+/// Frozen, like [`CompareConfig`]: matchers build one per request
+/// and pass it down. `compare` configures the residue scorer;
+/// `symbol_scores` / `symbol_weights` override the per-category
+/// defaults for symbol edges; `extra_query_weight` /
+/// `extra_result_weight` weigh residue parts left without a
+/// counterpart on the other side.
+#[pyclass(frozen, from_py_object, module = "rigour._core")]
+#[derive(Clone, Debug)]
+pub struct MatchConfig {
+    #[pyo3(get)]
+    pub compare: CompareConfig,
+    symbol_scores: [f64; N_CATEGORIES],
+    symbol_weights: [f64; N_CATEGORIES],
+    #[pyo3(get)]
+    pub extra_query_weight: f64,
+    #[pyo3(get)]
+    pub extra_result_weight: f64,
+}
+
+impl Default for MatchConfig {
+    fn default() -> Self {
+        Self {
+            compare: default_config().clone(),
+            symbol_scores: CATEGORY_CODES.map(default_symbol_score),
+            symbol_weights: CATEGORY_CODES.map(default_symbol_weight),
+            extra_query_weight: EXTRA_QUERY_WEIGHT,
+            extra_result_weight: EXTRA_RESULT_WEIGHT,
+        }
+    }
+}
+
+impl MatchConfig {
+    pub(crate) fn symbol_score(&self, cat: SymbolCategory) -> f64 {
+        self.symbol_scores[cat as usize]
+    }
+
+    pub(crate) fn symbol_weight(&self, cat: SymbolCategory) -> f64 {
+        self.symbol_weights[cat as usize]
+    }
+
+    /// Largest weight any non-solo alignment can carry.
+    fn max_weight(&self) -> f64 {
+        self.symbol_weights.iter().copied().fold(1.0, f64::max)
+    }
+}
+
+fn check_weight(name: &str, value: f64) -> PyResult<f64> {
+    if value.is_finite() && value >= 0.0 {
+        Ok(value)
+    } else {
+        Err(PyValueError::new_err(format!(
+            "{name} must be a finite, non-negative number"
+        )))
+    }
+}
+
+#[pymethods]
+impl MatchConfig {
+    #[new]
+    #[pyo3(signature = (
+        compare = None,
+        symbol_scores = None,
+        symbol_weights = None,
+        extra_query_weight = EXTRA_QUERY_WEIGHT,
+        extra_result_weight = EXTRA_RESULT_WEIGHT,
+    ))]
+    fn new(
+        compare: Option<CompareConfig>,
+        symbol_scores: Option<HashMap<SymbolCategory, f64>>,
+        symbol_weights: Option<HashMap<SymbolCategory, f64>>,
+        extra_query_weight: f64,
+        extra_result_weight: f64,
+    ) -> PyResult<Self> {
+        let mut cfg = MatchConfig {
+            compare: compare.unwrap_or_else(|| default_config().clone()),
+            extra_query_weight: check_weight("extra_query_weight", extra_query_weight)?,
+            extra_result_weight: check_weight("extra_result_weight", extra_result_weight)?,
+            ..MatchConfig::default()
+        };
+        for (cat, score) in symbol_scores.unwrap_or_default() {
+            if !(0.0..=1.0).contains(&score) {
+                return Err(PyValueError::new_err("symbol scores must be in [0, 1]"));
+            }
+            cfg.symbol_scores[cat as usize] = score;
+        }
+        for (cat, weight) in symbol_weights.unwrap_or_default() {
+            cfg.symbol_weights[cat as usize] = check_weight("symbol weight", weight)?;
+        }
+        Ok(cfg)
+    }
+
+    /// Effective score per symbol category, defaults included.
+    #[getter]
+    fn symbol_scores(&self) -> HashMap<SymbolCategory, f64> {
+        CATEGORY_CODES
+            .iter()
+            .map(|&c| (c, self.symbol_score(c)))
+            .collect()
+    }
+
+    /// Effective weight per symbol category, defaults included.
+    #[getter]
+    fn symbol_weights(&self) -> HashMap<SymbolCategory, f64> {
+        CATEGORY_CODES
+            .iter()
+            .map(|&c| (c, self.symbol_weight(c)))
+            .collect()
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<MatchConfig(extra_query_weight={}, extra_result_weight={})>",
+            self.extra_query_weight, self.extra_result_weight
+        )
+    }
+}
+
+/// Plain-Rust snapshot of one [`Name`], taken under the GIL once
+/// per call so the pair loop never touches Python objects.
+pub(crate) struct NameView {
+    tag: NameTypeTag,
+    comparable: String,
+    pub(crate) parts: Vec<PartView>,
+    /// Characters of each part's `comparable`.
+    part_chars: Vec<HashSet<char>>,
+    /// Union of `part_chars`.
+    chars: HashSet<char>,
+    /// Pairing-ready spans; empty past `MAX_PARTS`, where
+    /// `pair_symbols` falls back to the empty pairing too.
+    pub(crate) spans: Vec<SpanInfo>,
+    /// For each part, the symbols of the spans covering it.
+    part_symbols: Vec<Vec<Symbol>>,
+    /// All span symbols.
+    symbols: HashSet<Symbol>,
+    scripts: Vec<&'static str>,
+}
+
+impl NameView {
+    pub(crate) fn new(py: Python<'_>, name: &Name) -> PyResult<Self> {
+        Ok(Self::collect(py, name)?.0)
+    }
+
+    /// [`NameView::new`], also handing back the name's Python
+    /// `Symbol` objects keyed by value, as [`collect_spans`] does.
+    pub(crate) fn collect(
+        py: Python<'_>,
+        name: &Name,
+    ) -> PyResult<(Self, HashMap<Symbol, Py<Symbol>>)> {
+        let parts_tuple = name.parts.bind(py);
+        let mut parts: Vec<PartView> = Vec::with_capacity(parts_tuple.len());
+        let mut part_chars: Vec<HashSet<char>> = Vec::with_capacity(parts_tuple.len());
+        let mut chars: HashSet<char> = HashSet::new();
+        for item in parts_tuple.iter() {
+            let part = item.cast::<NamePart>()?.borrow();
+            let comparable = part.comparable_str().to_string();
+            let pc: HashSet<char> = comparable.chars().filter(|c| *c != ' ').collect();
+            chars.extend(pc.iter().copied());
+            part_chars.push(pc);
+            parts.push(PartView {
+                form_len: part.form_str().chars().count(),
+                comparable_len: comparable.chars().count(),
+                comparable,
+                tag: part.tag,
+            });
+        }
+        let (spans, symbol_objs) = if parts.len() > MAX_PARTS {
+            (Vec::new(), HashMap::new())
+        } else {
+            collect_spans(py, name)?
+        };
+        let mut part_symbols: Vec<Vec<Symbol>> = vec![Vec::new(); parts.len()];
+        let mut symbols: HashSet<Symbol> = HashSet::new();
+        for span in &spans {
+            for idx in mask_to_part_vec(span.mask) {
+                if let Some(syms) = part_symbols.get_mut(idx as usize) {
+                    syms.push(span.symbol.clone());
+                }
+            }
+            symbols.insert(span.symbol.clone());
+        }
+        let comparable = name.comparable.bind(py).to_str()?.to_string();
+        let scripts = text_scripts(&comparable);
+        let view = Self {
+            tag: name.tag,
+            comparable,
+            parts,
+            part_chars,
+            chars,
+            spans,
+            part_symbols,
+            symbols,
+            scripts,
+        };
+        Ok((view, symbol_objs))
+    }
+
+    /// Whether part `i` can end up in a non-zero alignment against
+    /// `other`: it shares a character with `other`'s parts, or is
+    /// covered by a span whose symbol `other` also carries.
+    fn part_is_live(&self, i: usize, other: &NameView) -> bool {
+        !self.part_chars[i].is_disjoint(&other.chars)
+            || self.part_symbols[i]
+                .iter()
+                .any(|s| other.symbols.contains(s))
+    }
+}
+
+/// Stage 2: keep pairs with a shared script (or a script-less side)
+/// or a shared non-`INITIAL` symbol.
+fn passes_filter(q: &NameView, r: &NameView) -> bool {
+    if q.scripts.is_empty() || r.scripts.is_empty() {
+        return true;
+    }
+    if q.scripts.iter().any(|s| r.scripts.contains(s)) {
+        return true;
+    }
+    q.symbols
+        .iter()
+        .any(|s| s.category != SymbolCategory::INITIAL && r.symbols.contains(s))
+}
+
+/// Ceiling on the score [`score_pair`] can return for `(q, r)`.
+///
+/// A part that shares no character with the other name and sits in
+/// no span whose symbol the other name carries can't join a residue
+/// cluster or a symbol edge: it always ends up a solo alignment with
+/// score 0 and its side's `extra_*_weight`. Every other alignment
+/// scores at most 1 with weight at most [`MatchConfig::max_weight`],
+/// and there are no more of them than there are live parts. The
+/// weighted mean is therefore at most `L·w / (L·w + D)`, with `L` the
+/// live-part count, `w` the max weight and `D` the dead parts' total
+/// weight. Equal `comparable` forms bound (and score) at 1.
+pub(crate) fn upper_bound(cfg: &MatchConfig, q: &NameView, r: &NameView) -> f64 {
+    if q.comparable == r.comparable {
+        return 1.0;
+    }
+    let mut live = 0usize;
+    let mut dead_weight = 0.0;
+    for i in 0..q.parts.len() {
+        if q.part_is_live(i, r) {
+            live += 1;
+        } else {
+            dead_weight += cfg.extra_query_weight;
+        }
+    }
+    for j in 0..r.parts.len() {
+        if r.part_is_live(j, q) {
+            live += 1;
+        } else {
+            dead_weight += cfg.extra_result_weight;
+        }
+    }
+    if live == 0 {
+        return 0.0;
+    }
+    if dead_weight == 0.0 {
+        return 1.0;
+    }
+    let top = live as f64 * cfg.max_weight();
+    top / (top + dead_weight)
+}
+
+/// One alignment of the winning pairing, as part indices into the
+/// query / result names.
+pub(crate) struct AlignSpec {
+    qps: Vec<usize>,
+    rps: Vec<usize>,
+    symbol: Option<Symbol>,
+    score: f64,
+    weight: f64,
+}
+
+fn weighted_mean(specs: &[AlignSpec]) -> f64 {
+    let total: f64 = specs.iter().map(|a| a.weight).sum();
+    if total <= 0.0 {
+        return 0.0;
+    }
+    specs.iter().map(|a| a.score * a.weight).sum::<f64>() / total
+}
+
+/// Residue ordering: person alignment for PER, tag order otherwise.
+fn order_residue(
+    tag: NameTypeTag,
+    q: &NameView,
+    q_rem: &[usize],
+    r: &NameView,
+    r_rem: &[usize],
+) -> (Vec<usize>, Vec<usize>) {
+    let view = |v: &NameView, i: usize| PartView {
+        form_len: v.parts[i].form_len,
+        comparable: v.parts[i].comparable.clone(),
+        comparable_len: v.parts[i].comparable_len,
+        tag: v.parts[i].tag,
+    };
+    if tag == NameTypeTag::PER {
+        let qv: Vec<PartView> = q_rem.iter().map(|&i| view(q, i)).collect();
+        let rv: Vec<PartView> = r_rem.iter().map(|&i| view(r, i)).collect();
+        let (qo, ro) = align_order(&qv, &rv);
+        return (
+            qo.into_iter().map(|k| q_rem[k]).collect(),
+            ro.into_iter().map(|k| r_rem[k]).collect(),
+        );
+    }
+    let sort = |v: &NameView, rem: &[usize]| {
+        let mut out = rem.to_vec();
+        out.sort_by_key(|&i| v.parts[i].tag.order_index());
+        out
+    };
+    (sort(q, q_rem), sort(r, r_rem))
+}
+
+/// Stage 4: best pairing score for `(q, r)` and its alignments.
+pub(crate) fn score_pair(cfg: &MatchConfig, q: &NameView, r: &NameView) -> (f64, Vec<AlignSpec>) {
+    let (edges, coverings) = if q.spans.is_empty() || r.spans.is_empty() {
+        (Vec::new(), vec![Vec::new()])
+    } else {
+        pair_spans(&q.spans, &r.spans)
+    };
+    let mut best: Option<(f64, Vec<AlignSpec>)> = None;
+    for covering in &coverings {
+        let mut specs: Vec<AlignSpec> = Vec::new();
+        let (mut qmask, mut rmask) = (0u64, 0u64);
+        for &ei in covering {
+            let edge = &edges[ei];
+            qmask |= edge.qmask;
+            rmask |= edge.rmask;
+            specs.push(AlignSpec {
+                qps: mask_to_part_vec(edge.qmask)
+                    .into_iter()
+                    .map(|i| i as usize)
+                    .collect(),
+                rps: mask_to_part_vec(edge.rmask)
+                    .into_iter()
+                    .map(|i| i as usize)
+                    .collect(),
+                symbol: Some(edge.symbol.clone()),
+                score: cfg.symbol_score(edge.symbol.category),
+                weight: cfg.symbol_weight(edge.symbol.category),
+            });
+        }
+        let uncovered = |n: usize, mask: u64| -> Vec<usize> {
+            (0..n)
+                .filter(|&i| i >= 64 || mask & (1u64 << i) == 0)
+                .collect()
+        };
+        let (q_rem, r_rem) = order_residue(
+            q.tag,
+            q,
+            &uncovered(q.parts.len(), qmask),
+            r,
+            &uncovered(r.parts.len(), rmask),
+        );
+        let q_cmp: Vec<String> = q_rem
+            .iter()
+            .map(|&i| q.parts[i].comparable.clone())
+            .collect();
+        let r_cmp: Vec<String> = r_rem
+            .iter()
+            .map(|&i| r.parts[i].comparable.clone())
+            .collect();
+        for (cluster, score) in score_residue(&cfg.compare, &q_cmp, &r_cmp) {
+            let weight = match (cluster.qps.is_empty(), cluster.rps.is_empty()) {
+                (false, true) => cfg.extra_query_weight,
+                (true, false) => cfg.extra_result_weight,
+                _ => 1.0,
+            };
+            specs.push(AlignSpec {
+                qps: cluster.qps.iter().map(|&k| q_rem[k]).collect(),
+                rps: cluster.rps.iter().map(|&k| r_rem[k]).collect(),
+                symbol: None,
+                score,
+                weight,
+            });
+        }
+        let score = weighted_mean(&specs);
+        if best.as_ref().is_none_or(|(b, _)| score > *b) {
+            best = Some((score, specs));
+        }
+    }
+    best.unwrap_or((0.0, Vec::new()))
+}
+
+/// Residue-only alignments for a literal (equal-`comparable`) hit.
+fn literal_specs(cfg: &MatchConfig, q: &NameView, r: &NameView) -> Vec<AlignSpec> {
+    let q_cmp: Vec<String> = q.parts.iter().map(|p| p.comparable.clone()).collect();
+    let r_cmp: Vec<String> = r.parts.iter().map(|p| p.comparable.clone()).collect();
+    score_residue(&cfg.compare, &q_cmp, &r_cmp)
+        .into_iter()
+        .map(|(cluster, score)| AlignSpec {
+            qps: cluster.qps,
+            rps: cluster.rps,
+            symbol: None,
+            score,
+            weight: 1.0,
+        })
+        .collect()
+}
+
+/// Counters describing how much work a set match did.
+#[derive(Clone, Copy, Debug, Default)]
+pub(crate) struct MatchStats {
+    pairs: usize,
+    filtered: usize,
+    skipped: usize,
+    scored: usize,
+}
+
+/// Pure-Rust core of [`py_match_name_sets`]: the index pair of the
+/// best match (if any), its score, whether it was a literal hit, its
+/// alignments and the work counters.
+#[allow(clippy::type_complexity)]
+pub(crate) fn match_views(
+    cfg: &MatchConfig,
+    queries: &[NameView],
+    results: &[NameView],
+) -> (
+    Option<(usize, usize, f64, bool, Vec<AlignSpec>)>,
+    MatchStats,
+) {
+    let mut stats = MatchStats {
+        pairs: queries.len() * results.len(),
+        ..MatchStats::default()
+    };
+
+    // Stage 1: literal short-circuit, longest shared form first.
+    let mut literal: Option<(usize, usize)> = None;
+    for (qi, q) in queries.iter().enumerate() {
+        for (ri, r) in results.iter().enumerate() {
+            if q.comparable == r.comparable
+                && literal.is_none_or(|(lq, _)| q.comparable.len() > queries[lq].comparable.len())
+            {
+                literal = Some((qi, ri));
+            }
+        }
+    }
+    if let Some((qi, ri)) = literal {
+        stats.scored = 1;
+        stats.skipped = stats.pairs - 1;
+        let specs = literal_specs(cfg, &queries[qi], &results[ri]);
+        return (Some((qi, ri, 1.0, true, specs)), stats);
+    }
+
+    // Stages 2 and 3: filter, then order survivors by bound.
+    let mut candidates: Vec<(f64, usize, usize)> = Vec::with_capacity(stats.pairs);
+    for (qi, q) in queries.iter().enumerate() {
+        for (ri, r) in results.iter().enumerate() {
+            if !passes_filter(q, r) {
+                stats.filtered += 1;
+                continue;
+            }
+            candidates.push((upper_bound(cfg, q, r), qi, ri));
+        }
+    }
+    // Stable sort: equal bounds keep input order, so ties resolve
+    // the same way on every run.
+    candidates.sort_by(|a, b| b.0.total_cmp(&a.0));
+
+    // Stage 4: score until nothing left can beat the best. The first
+    // survivor is always scored, so a set whose bounds are all 0
+    // still reports its (zero-score) best pair.
+    let mut best: Option<(usize, usize, f64, bool, Vec<AlignSpec>)> = None;
+    for (pos, &(bound, qi, ri)) in candidates.iter().enumerate() {
+        if best.as_ref().is_some_and(|b| bound <= b.2) {
+            stats.skipped += candidates.len() - pos;
+            break;
+        }
+        stats.scored += 1;
+        let (score, specs) = score_pair(cfg, &queries[qi], &results[ri]);
+        if best.as_ref().is_none_or(|b| score > b.2) {
+            best = Some((qi, ri, score, false, specs));
+        }
+    }
+    (best, stats)
+}
+
+/// Outcome of [`py_match_name_sets`].
+///
+/// `query` / `result` are the best-scoring pair (both `None` when no
+/// pair survived the pre-filter), `alignments` the winning pairing's
+/// alignments — symbol edges first, then residue clusters — and
+/// `score` its weighted mean. `literal` marks a `comparable`-equality
+/// short-circuit. The counters report how many of the `pairs`
+/// candidate pairs were `filtered` out, `skipped` by the bound check
+/// or fully `scored`.
+#[pyclass(frozen, module = "rigour._core")]
+pub struct NameSetMatch {
+    #[pyo3(get)]
+    score: f64,
+    #[pyo3(get)]
+    query: Option<Py<Name>>,
+    #[pyo3(get)]
+    result: Option<Py<Name>>,
+    #[pyo3(get)]
+    alignments: Py<PyTuple>,
+    #[pyo3(get)]
+    literal: bool,
+    #[pyo3(get)]
+    pairs: usize,
+    #[pyo3(get)]
+    filtered: usize,
+    #[pyo3(get)]
+    skipped: usize,
+    #[pyo3(get)]
+    scored: usize,
+}
+
+#[pymethods]
+impl NameSetMatch {
+    fn __repr__(&self, py: Python<'_>) -> String {
+        let form = |n: &Option<Py<Name>>| match n {
+            Some(n) => n.bind(py).borrow().form_str().to_string(),
+            None => "-".to_string(),
+        };
+        format!(
+            "<NameSetMatch({:?} ~ {:?}, score={:.3}, scored={}/{})>",
+            form(&self.query),
+            form(&self.result),
+            self.score,
+            self.scored,
+            self.pairs
+        )
+    }
+}
+
+/// Build the Python alignments for the winning pair.
+fn build_alignments(
+    py: Python<'_>,
+    query: &Name,
+    result: &Name,
+    specs: Vec<AlignSpec>,
+) -> PyResult<Py<PyTuple>> {
+    let q_parts = query.parts.bind(py);
+    let r_parts = result.parts.bind(py);
+    // Reuse the tagger's Symbol objects so `is` holds against
+    // `name.spans`, as in `pair_symbols`.
+    let (_, q_symbols) = collect_spans(py, query)?;
+    let part = |parts: &Bound<'_, PyTuple>, i: usize| -> PyResult<Py<NamePart>> {
+        Ok(parts.get_item(i)?.cast::<NamePart>()?.clone().unbind())
+    };
+    let mut out: Vec<Py<Alignment>> = Vec::with_capacity(specs.len());
+    for spec in specs {
+        let qps = spec
+            .qps
+            .iter()
+            .map(|&i| part(&q_parts, i))
+            .collect::<PyResult<Vec<_>>>()?;
+        let rps = spec
+            .rps
+            .iter()
+            .map(|&i| part(&r_parts, i))
+            .collect::<PyResult<Vec<_>>>()?;
+        let symbol = match spec.symbol {
+            Some(sym) => Some(match q_symbols.get(&sym) {
+                Some(obj) => obj.clone_ref(py),
+                None => Py::new(py, sym)?,
+            }),
+            None => None,
+        };
+        let alignment = Alignment::build(py, qps, rps, symbol, spec.score, spec.weight)?;
+        out.push(Py::new(py, alignment)?);
+    }
+    Ok(PyTuple::new(py, &out)?.unbind())
+}
+
+/// Cheap ceiling on the score `match_name_sets([query], [result])`
+/// can return.
+///
+/// Provably `>=` the full-path score under the same `config`: `1.0`
+/// for a literal `comparable` match, `0.0` for a pair the script /
+/// symbol pre-filter drops, otherwise the live-part bound described
+/// on [`upper_bound`]. Reads part characters, span symbols and
+/// scripts only — no covering enumeration, no edit-distance DP — so
+/// a matcher can call it per pair and skip the ones that can't beat
+/// its threshold.
+#[pyfunction]
+#[pyo3(name = "score_upper_bound", signature = (query, result, config = None))]
+pub fn py_score_upper_bound(
+    py: Python<'_>,
+    query: PyRef<'_, Name>,
+    result: PyRef<'_, Name>,
+    config: Option<MatchConfig>,
+) -> PyResult<f64> {
+    let q = NameView::new(py, &query)?;
+    let r = NameView::new(py, &result)?;
+    Ok(pair_upper_bound(&config.unwrap_or_default(), &q, &r))
+}
+
+/// [`upper_bound`] with the literal and pre-filter outcomes folded
+/// in, as [`py_score_upper_bound`] reports it.
+pub(crate) fn pair_upper_bound(cfg: &MatchConfig, q: &NameView, r: &NameView) -> f64 {
+    if q.comparable != r.comparable && !passes_filter(q, r) {
+        return 0.0;
+    }
+    upper_bound(cfg, q, r)
+}
+
+/// Find the best-matching pair between two sets of names.
+///
+/// Runs the literal short-circuit, the script / symbol pre-filter,
+/// the bound-ordered early exit and the pairing + residue scoring
+/// described in the module docs, all in one call. `config` defaults
+/// to [`MatchConfig::default`].
+#[pyfunction]
+#[pyo3(name = "match_name_sets", signature = (query_names, result_names, config = None))]
+pub fn py_match_name_sets<'py>(
+    py: Python<'py>,
+    query_names: Vec<Bound<'py, Name>>,
+    result_names: Vec<Bound<'py, Name>>,
+    config: Option<MatchConfig>,
+) -> PyResult<NameSetMatch> {
+    let cfg = config.unwrap_or_default();
+    let queries = query_names
+        .iter()
+        .map(|n| NameView::new(py, &n.borrow()))
+        .collect::<PyResult<Vec<_>>>()?;
+    let results = result_names
+        .iter()
+        .map(|n| NameView::new(py, &n.borrow()))
+        .collect::<PyResult<Vec<_>>>()?;
+    run_match(py, &cfg, &queries, &query_names, &results, &result_names)
+}
+
+/// Match already-built views and wrap the outcome. `query_names` /
+/// `result_names` are the Python names the views were built from,
+/// index for index.
+pub(crate) fn run_match<'py>(
+    py: Python<'py>,
+    cfg: &MatchConfig,
+    queries: &[NameView],
+    query_names: &[Bound<'py, Name>],
+    results: &[NameView],
+    result_names: &[Bound<'py, Name>],
+) -> PyResult<NameSetMatch> {
+    let (best, stats) = py.detach(|| match_views(cfg, queries, results));
+
+    let empty = PyTuple::empty(py).unbind();
+    let (score, query, result, alignments, literal) = match best {
+        Some((qi, ri, score, literal, specs)) => {
+            let (query, result) = (&query_names[qi], &result_names[ri]);
+            let alignments = build_alignments(py, &query.borrow(), &result.borrow(), specs)?;
+            let (query, result) = (query.clone().unbind(), result.clone().unbind());
+            (score, Some(query), Some(result), alignments, literal)
+        }
+        None => (0.0, None, None, empty, false),
+    };
+    Ok(NameSetMatch {
+        score,
+        query,
+        result,
+        alignments,
+        literal,
+        pairs: stats.pairs,
+        filtered: stats.filtered,
+        skipped: stats.skipped,
+        scored: stats.scored,
+    })
+}
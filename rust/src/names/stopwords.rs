@@ -21,7 +21,7 @@ struct NameStopwords {
     generic_person_names: Vec<String>,
 }
 
-const JSON: &str = include_str!("../../data/names/stopwords.json");
+pub(crate) const JSON: &str = include_str!("../../data/names/stopwords.json");
 
 static DATA: LazyLock<NameStopwords> =
     LazyLock::new(|| serde_json::from_str(JSON).expect("rust/data/names/stopwords.json parses"));
@@ -8,6 +8,8 @@ use pyo3::prelude::*;
 use std::collections::HashMap;
 use std::sync::{Arc, LazyLock, RwLock};
 
+use crate::sharded::Sharded;
+
 /// The kind of semantic annotation a [`Symbol`] carries. Drives how
 /// strongly a symbol match counts during scoring — an `ORG_CLASS`
 /// match is a strong corporate-form signal, an `INITIAL` match is
@@ -47,6 +49,21 @@ pub enum SymbolCategory {
 }
 
 impl SymbolCategory {
+    /// Every category, in declaration order — index `i` is the
+    /// category whose discriminant is `i`. Binary formats (the name
+    /// codec, tagger images) store categories by this index.
+    pub const ALL: [SymbolCategory; 9] = [
+        SymbolCategory::ORG_CLASS,
+        SymbolCategory::SYMBOL,
+        SymbolCategory::DOMAIN,
+        SymbolCategory::INITIAL,
+        SymbolCategory::NAME,
+        SymbolCategory::NICK,
+        SymbolCategory::NUMERIC,
+        SymbolCategory::LOCATION,
+        SymbolCategory::PHONETIC,
+    ];
+
     /// Short stable key used for downstream serialisation — yente's
     /// flat symbol index field uses `f"{category.value}:{id}"`, for
     /// example, and logs / exports expect the same strings.
@@ -72,10 +89,23 @@ impl SymbolCategory {
     fn py_value(&self) -> &'static str {
         self.value()
     }
+
+    /// Pickle support: members restore as `getattr(cls, name)`, so
+    /// unpickling yields the canonical enum member.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, pyo3::types::PyType>, String))> {
+        let getattr = slf.py().import("builtins")?.getattr("getattr")?;
+        Ok((getattr, (slf.get_type(), format!("{:?}", slf.get()))))
+    }
 }
 
-type Interner = RwLock<HashMap<Box<str>, Arc<str>>>;
-static INTERNER: LazyLock<Interner> = LazyLock::new(|| RwLock::new(HashMap::new()));
+// Striped by id hash (see `crate::sharded`): `analyze_names` mints
+// INITIAL / NUMERIC symbols off the GIL, so worker threads hit the
+// interner concurrently and a single RwLock would serialise them.
+type Interner = Sharded<RwLock<HashMap<Box<str>, Arc<str>>>>;
+static INTERNER: LazyLock<Interner> =
+    LazyLock::new(|| Sharded::new(|| RwLock::new(HashMap::new())));
 
 /// Dedup id strings across the process so that logically-equal
 /// symbols share one heap allocation.
@@ -88,15 +118,16 @@ static INTERNER: LazyLock<Interner> = LazyLock::new(|| RwLock::new(HashMap::new(
 /// shrinks — entries live for the process lifetime, which is fine
 /// given the bounded set.
 pub fn intern(s: &str) -> Arc<str> {
+    let shard = INTERNER.shard(s);
     // Fast path: read lock — the common case after the tagger has
     // populated the interner on first use.
-    if let Some(a) = INTERNER.read().unwrap().get(s) {
+    if let Some(a) = shard.read().unwrap().get(s) {
         return a.clone();
     }
     // Slow path: another thread may have inserted between
     // read-release and write-acquire, so check again before creating
     // a fresh `Arc`.
-    let mut w = INTERNER.write().unwrap();
+    let mut w = shard.write().unwrap();
     if let Some(a) = w.get(s) {
         return a.clone();
     }
@@ -207,6 +238,15 @@ impl Symbol {
     fn __repr__(&self) -> String {
         format!("<Symbol({:?}, {})>", self.category, self.id)
     }
+
+    /// Pickle support: rebuilt through the constructor, which
+    /// re-interns the id on the receiving side.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> (Bound<'py, pyo3::types::PyType>, (SymbolCategory, String)) {
+        let sym = slf.get();
+        (slf.get_type(), (sym.category, sym.id.to_string()))
+    }
 }
 
 #[cfg(test)]
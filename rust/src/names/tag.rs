@@ -58,6 +58,15 @@ impl NameTypeTag {
     fn py_value(&self) -> &'static str {
         self.value()
     }
+
+    /// Pickle support: members restore as `getattr(cls, name)`, so
+    /// unpickling yields the canonical enum member.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, pyo3::types::PyType>, String))> {
+        let getattr = slf.py().import("builtins")?.getattr("getattr")?;
+        Ok((getattr, (slf.get_type(), format!("{:?}", slf.get()))))
+    }
 }
 
 /// The structural role of a part within a name. A newly-constructed
@@ -261,6 +270,15 @@ impl NamePartTag {
         self.value()
     }
 
+    /// Pickle support: members restore as `getattr(cls, name)`, so
+    /// unpickling yields the canonical enum member.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, pyo3::types::PyType>, String))> {
+        let getattr = slf.py().import("builtins")?.getattr("getattr")?;
+        Ok((getattr, (slf.get_type(), format!("{:?}", slf.get()))))
+    }
+
     #[pyo3(name = "can_match")]
     fn py_can_match(&self, other: NamePartTag) -> bool {
         self.can_match(other)
@@ -12,25 +12,35 @@
 //                                 (person only, via names::person_names)
 //
 // Each source contributes to a `HashMap<String, Vec<Symbol>>` that
-// seeds `Needles<Vec<Symbol>>`. Aliases are normalised with the
+// seeds the tagger's automaton. Aliases are normalised with the
 // caller's `Normalize` flags before insertion — callers must
 // normalise runtime input with the same flags. Overlapping match
 // iteration emits every recognised phrase as an independent
 // `(matched_phrase, Symbol)` pair.
 //
+// The automaton is `flat_ac`'s flat layout inside a tagger image
+// (`tagger_image`), matched in place with the same Python-style
+// boundary post-filter `Needles<T>` uses. The image can be saved and
+// memory-mapped by later processes, which then share its pages.
+//
 // Flag-keyed cache: one compiled Tagger per `(TaggerKind, Normalize)`
-// combination, same shape as the org_types Replacer cache.
+// combination, same shape as the org_types Replacer cache. On a miss
+// the cache maps a tagger image from `RIGOUR_TAGGER_CACHE` before
+// building, and after building saves one there and maps it.
 
+use std::cell::RefCell;
 use std::collections::{HashMap, HashSet};
-use std::sync::{Arc, LazyLock, RwLock};
+use std::path::{Path, PathBuf};
+use std::sync::{LazyLock, RwLock};
 
 use serde::Deserialize;
 
-use crate::names::matcher::Needles;
+use crate::names::matcher::boundary_ok;
 use crate::names::org_types;
 use crate::names::person_names;
 use crate::names::symbol::{Symbol, SymbolCategory};
 use crate::names::symbols as name_symbols;
+use crate::names::tagger_image::{self, Image};
 use crate::territories;
 use crate::text::normalize::{Cleanup, Normalize, normalize};
 use crate::text::ordinals;
@@ -42,10 +52,29 @@ pub enum TaggerKind {
 }
 
 pub struct Tagger {
-    needles: Needles<Vec<Symbol>>,
+    image: Image,
 }
 
 impl Tagger {
+    /// Build from a normalised phrase → symbols mapping. Needles are
+    /// sorted so the same data always yields byte-identical images.
+    fn build(mapping: HashMap<String, Vec<Symbol>>, kind: TaggerKind, flags: Normalize) -> Self {
+        let mut entries: Vec<(String, Vec<Symbol>)> =
+            mapping.into_iter().filter(|(k, _)| !k.is_empty()).collect();
+        entries.sort_unstable_by(|a, b| a.0.cmp(&b.0));
+        let data = tagger_image::encode(&entries, kind, flags);
+        Self::from_image(Image::from_bytes(data, kind, flags).expect("fresh tagger image is valid"))
+    }
+
+    pub(crate) fn from_image(image: Image) -> Self {
+        Self { image }
+    }
+
+    /// The tagger's image, for saving.
+    pub fn image(&self) -> &Image {
+        &self.image
+    }
+
     /// Match pre-normalised `text` against the tagger's alias set.
     /// One `(phrase, symbol)` pair per match × symbol in the
     /// payload — matches today's Python `Tagger.__call__` output
@@ -63,14 +92,23 @@ impl Tagger {
         // pair is what downstream wants. See issue #197.
         let mut seen: HashSet<(String, Symbol)> = HashSet::new();
         let mut out: Vec<(String, Symbol)> = Vec::new();
-        for m in self.needles.find_overlapping(text) {
-            for sym in m.payload {
-                let key = (m.matched.to_string(), sym.clone());
-                if seen.insert(key.clone()) {
-                    out.push(key);
+        let bytes = text.as_bytes();
+        self.image
+            .automaton()
+            .find_overlapping(bytes, |start, end, needle| {
+                if !boundary_ok(bytes, start, end) {
+                    return;
                 }
-            }
-        }
+                // Needles and haystack are both valid UTF-8, so match
+                // edges always fall on char boundaries.
+                let matched = &text[start..end];
+                for sym in self.image.payload(needle) {
+                    let key = (matched.to_string(), sym);
+                    if seen.insert(key.clone()) {
+                        out.push(key);
+                    }
+                }
+            });
         out
     }
 }
@@ -119,10 +157,8 @@ impl Builder {
         }
     }
 
-    fn finish(self) -> Tagger {
-        Tagger {
-            needles: Needles::build(self.mapping),
-        }
+    fn finish(self, kind: TaggerKind) -> Tagger {
+        Tagger::build(self.mapping, kind, self.flags)
     }
 }
 
@@ -227,7 +263,7 @@ fn build_org_tagger(flags: Normalize) -> Tagger {
         }
     }
 
-    b.finish()
+    b.finish(TaggerKind::Org)
 }
 
 fn build_person_tagger(flags: Normalize) -> Tagger {
@@ -298,24 +334,82 @@ fn build_person_tagger(flags: Normalize) -> Tagger {
         }
     }
 
-    b.finish()
+    b.finish(TaggerKind::Person)
 }
 
-type TaggerCache = RwLock<HashMap<(TaggerKind, Normalize), Arc<Tagger>>>;
+// Built taggers are never evicted, so they're leaked to `&'static`:
+// callers share the automaton without bumping a refcount, which would
+// otherwise be one cache line every scoring thread writes to.
+type TaggerCache = RwLock<HashMap<(TaggerKind, Normalize), &'static Tagger>>;
 
 static TAGGER_CACHE: LazyLock<TaggerCache> = LazyLock::new(|| RwLock::new(HashMap::new()));
 
-pub fn get_tagger(kind: TaggerKind, flags: Normalize) -> Arc<Tagger> {
+thread_local! {
+    // Per-thread front for `TAGGER_CACHE`. After a thread's first
+    // lookup of a key it never touches the shared lock again.
+    static LOCAL_TAGGERS: RefCell<HashMap<(TaggerKind, Normalize), &'static Tagger>> =
+        RefCell::new(HashMap::new());
+}
+
+pub fn get_tagger(kind: TaggerKind, flags: Normalize) -> &'static Tagger {
     let key = (kind, flags);
-    if let Some(existing) = TAGGER_CACHE.read().unwrap().get(&key) {
-        return existing.clone();
+    if let Some(local) = LOCAL_TAGGERS.with_borrow(|m| m.get(&key).copied()) {
+        return local;
+    }
+    let tagger = shared_tagger(key);
+    LOCAL_TAGGERS.with_borrow_mut(|m| m.insert(key, tagger));
+    tagger
+}
+
+fn shared_tagger(key: (TaggerKind, Normalize)) -> &'static Tagger {
+    if let Some(existing) = TAGGER_CACHE.read().unwrap().get(&key).copied() {
+        return existing;
     }
-    let built = Arc::new(match kind {
+    let (kind, flags) = key;
+    let built = match tagger_image::cache_dir() {
+        Some(dir) => load_or_build(&dir, kind, flags),
+        None => build_tagger(kind, flags),
+    };
+    let mut writer = TAGGER_CACHE.write().unwrap();
+    // A racing thread may have built the same key; keep its copy and
+    // drop ours rather than leaking both.
+    *writer
+        .entry(key)
+        .or_insert_with(|| Box::leak(Box::new(built)))
+}
+
+/// Build the `(kind, flags)` tagger from the embedded data.
+pub fn build_tagger(kind: TaggerKind, flags: Normalize) -> Tagger {
+    match kind {
         TaggerKind::Org => build_org_tagger(flags),
         TaggerKind::Person => build_person_tagger(flags),
-    });
-    let mut writer = TAGGER_CACHE.write().unwrap();
-    Arc::clone(writer.entry(key).or_insert(built))
+    }
+}
+
+/// Map the tagger image from `dir`, or build the tagger, leave an
+/// image there for the next process and map that. The cache is
+/// best-effort: an unwritable directory costs the rebuild (and this
+/// process keeps a private copy), never an error.
+fn load_or_build(dir: &Path, kind: TaggerKind, flags: Normalize) -> Tagger {
+    if let Some(image) = tagger_image::load(dir, kind, flags) {
+        return Tagger::from_image(image);
+    }
+    let tagger = build_tagger(kind, flags);
+    if tagger_image::save(dir, tagger.image(), kind, flags).is_ok() {
+        if let Some(image) = tagger_image::load(dir, kind, flags) {
+            return Tagger::from_image(image);
+        }
+    }
+    tagger
+}
+
+/// Write images of both taggers for `flags` into `dir`, building (or
+/// reusing) them as needed. Returns the image paths.
+pub fn save_images(dir: &Path, flags: Normalize) -> std::io::Result<Vec<PathBuf>> {
+    [TaggerKind::Org, TaggerKind::Person]
+        .into_iter()
+        .map(|kind| tagger_image::save(dir, get_tagger(kind, flags).image(), kind, flags))
+        .collect()
 }
 
 #[cfg(test)]
@@ -415,17 +509,17 @@ mod tests {
     }
 
     #[test]
-    fn cache_returns_same_arc() {
+    fn cache_returns_same_tagger() {
         let a = get_tagger(TaggerKind::Org, FLAGS);
         let b = get_tagger(TaggerKind::Org, FLAGS);
-        assert!(Arc::ptr_eq(&a, &b));
+        assert!(std::ptr::eq(a, b));
     }
 
     #[test]
     fn cache_distinguishes_kind() {
         let org = get_tagger(TaggerKind::Org, FLAGS);
         let person = get_tagger(TaggerKind::Person, FLAGS);
-        assert!(!Arc::ptr_eq(&org, &person));
+        assert!(!std::ptr::eq(org, person));
     }
 
     #[test]
@@ -0,0 +1,400 @@
+// Serialised tagger images.
+//
+// Building a tagger is the dominant cold-start cost of the name
+// pipeline: the person tagger decompresses the ~8 MB person-names
+// corpus, normalises every alias and assembles an automaton over
+// several hundred thousand needles. None of that depends on anything
+// but the embedded data and the normalisation flags, so the result
+// can be written to disk once and loaded by every later process.
+//
+// An image holds the tagger in its final, directly usable form: the
+// flat Aho-Corasick automaton (`flat_ac`) plus the symbol payload
+// tables. A loaded image is memory-mapped read-only and matched in
+// place — no decompression, no normalisation, no automaton
+// construction, and no private copy: every process mapping the same
+// file shares one set of physical pages, so extra worker processes
+// add next to nothing to the host's memory. A freshly built tagger
+// uses the same bytes from an owned buffer.
+//
+// Images are a first-run artifact. When `RIGOUR_TAGGER_CACHE` names a
+// directory, `tagger::get_tagger` maps a matching image from there
+// before building, and after building writes one and maps that. So
+// the first process on a host pays the build and every later one
+// (or every forked sibling) shares its result. `save_images`
+// pre-generates them, e.g. as a container build step.
+//
+// ## Format (little-endian)
+//
+//   magic "RGTI", format u8, kind u8, pad u16, flags u32,
+//   fingerprint u64, n_symbols u32, n_refs u32, symbol_bytes u32,
+//   pad u32
+//   automaton                 see `flat_ac`; n_needles from there
+//   (n_needles + 1) × u32     payload offsets into the ref table
+//   n_refs × u32              symbol indices
+//   (n_symbols + 1) × u32     symbol offsets into the symbol bytes
+//   symbol_bytes bytes        per symbol: category u8, id UTF-8
+//
+// The fingerprint covers the crate version, this format, and every
+// embedded data blob a tagger reads. A mismatching image — another
+// rigour build, other data — is ignored and rebuilt, and so is one
+// whose indices don't check out on load (a truncated or damaged
+// file): every automaton and table index is validated once when the
+// image is parsed, so matching never trusts the file. Images are only
+// ever replaced by rename, never rewritten in place, so a mapping
+// stays valid for as long as the process holds it.
+
+use std::collections::HashMap;
+use std::fs;
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+
+use memmap2::Mmap;
+
+use crate::names::flat_ac::{FlatAc, Layout};
+use crate::names::symbol::{Symbol, SymbolCategory};
+use crate::names::tagger::TaggerKind;
+use crate::text::normalize::Normalize;
+
+const MAGIC: &[u8; 4] = b"RGTI";
+const FORMAT: u8 = 2;
+const HEADER_LEN: usize = 36;
+
+/// Environment variable naming the image directory.
+pub const CACHE_ENV: &str = "RIGOUR_TAGGER_CACHE";
+
+/// Fingerprint of everything a tagger is built from. FNV-1a, stable
+/// across Rust releases.
+pub fn fingerprint() -> u64 {
+    const OFFSET: u64 = 0xcbf2_9ce4_8422_2325;
+    const PRIME: u64 = 0x0000_0100_0000_01b3;
+    let parts: [&[u8]; 7] = [
+        env!("CARGO_PKG_VERSION").as_bytes(),
+        &[FORMAT],
+        crate::names::org_types::ORG_TYPES_ZST,
+        crate::names::symbols::SYMBOLS_ZST,
+        crate::names::person_names::COMPRESSED,
+        crate::territories::COMPRESSED,
+        crate::text::ordinals::JSON.as_bytes(),
+    ];
+    let mut h = OFFSET;
+    for part in parts {
+        for b in (part.len() as u64).to_le_bytes().iter().chain(part) {
+            h ^= *b as u64;
+            h = h.wrapping_mul(PRIME);
+        }
+    }
+    h
+}
+
+fn kind_code(kind: TaggerKind) -> u8 {
+    match kind {
+        TaggerKind::Org => 0,
+        TaggerKind::Person => 1,
+    }
+}
+
+fn kind_name(kind: TaggerKind) -> &'static str {
+    match kind {
+        TaggerKind::Org => "org",
+        TaggerKind::Person => "person",
+    }
+}
+
+/// Image file name for a tagger. Carries the fingerprint, so images
+/// from different builds can share a directory.
+pub fn file_name(kind: TaggerKind, flags: Normalize) -> String {
+    format!(
+        "tagger-{}-{:04x}-{:016x}.bin",
+        kind_name(kind),
+        flags.bits(),
+        fingerprint()
+    )
+}
+
+/// The image directory from [`CACHE_ENV`], if set and non-empty.
+pub fn cache_dir() -> Option<PathBuf> {
+    std::env::var_os(CACHE_ENV)
+        .filter(|v| !v.is_empty())
+        .map(PathBuf::from)
+}
+
+/// Encode a tagger image from needles and their symbol payloads.
+/// `entries` must be sorted by needle, with no empty or repeated
+/// needles.
+pub(crate) fn encode(
+    entries: &[(String, Vec<Symbol>)],
+    kind: TaggerKind,
+    flags: Normalize,
+) -> Vec<u8> {
+    let mut symbol_ids: HashMap<&Symbol, u32> = HashMap::new();
+    let mut symbols: Vec<&Symbol> = Vec::new();
+    let mut offsets: Vec<u32> = Vec::with_capacity(entries.len() + 1);
+    let mut refs: Vec<u32> = Vec::new();
+    offsets.push(0);
+    for (_, payload) in entries {
+        for sym in payload {
+            let id = *symbol_ids.entry(sym).or_insert_with(|| {
+                symbols.push(sym);
+                (symbols.len() - 1) as u32
+            });
+            refs.push(id);
+        }
+        offsets.push(refs.len() as u32);
+    }
+    let mut symbol_offsets: Vec<u32> = Vec::with_capacity(symbols.len() + 1);
+    let mut symbol_bytes: Vec<u8> = Vec::new();
+    symbol_offsets.push(0);
+    for sym in &symbols {
+        symbol_bytes.push(sym.category as u8);
+        symbol_bytes.extend_from_slice(sym.id.as_bytes());
+        symbol_offsets.push(symbol_bytes.len() as u32);
+    }
+
+    let mut out: Vec<u8> = Vec::new();
+    out.extend_from_slice(MAGIC);
+    out.push(FORMAT);
+    out.push(kind_code(kind));
+    out.extend_from_slice(&[0, 0]);
+    out.extend_from_slice(&(flags.bits() as u32).to_le_bytes());
+    out.extend_from_slice(&fingerprint().to_le_bytes());
+    out.extend_from_slice(&(symbols.len() as u32).to_le_bytes());
+    out.extend_from_slice(&(refs.len() as u32).to_le_bytes());
+    out.extend_from_slice(&(symbol_bytes.len() as u32).to_le_bytes());
+    out.extend_from_slice(&[0, 0, 0, 0]);
+    debug_assert_eq!(out.len(), HEADER_LEN);
+    let needles: Vec<&str> = entries.iter().map(|(k, _)| k.as_str()).collect();
+    crate::names::flat_ac::encode(&needles, &mut out);
+    for v in offsets.iter().chain(&refs).chain(&symbol_offsets) {
+        out.extend_from_slice(&v.to_le_bytes());
+    }
+    out.extend_from_slice(&symbol_bytes);
+    out
+}
+
+/// Where an image's bytes live.
+enum Storage {
+    Owned(Vec<u8>),
+    Mapped(Mmap),
+}
+
+impl Storage {
+    fn bytes(&self) -> &[u8] {
+        match self {
+            Storage::Owned(v) => v,
+            Storage::Mapped(m) => m,
+        }
+    }
+}
+
+fn read_u32(data: &[u8], pos: usize) -> usize {
+    u32::from_le_bytes(data[pos..pos + 4].try_into().unwrap()) as usize
+}
+
+/// A validated tagger image, owned or mapped.
+pub struct Image {
+    storage: Storage,
+    automaton: Layout,
+    payloads: usize,
+    refs: usize,
+    symbols: usize,
+    symbol_bytes: usize,
+}
+
+impl Image {
+    /// Validate `storage` as the `(kind, flags)` image of this build.
+    fn parse(storage: Storage, kind: TaggerKind, flags: Normalize) -> Option<Self> {
+        let data = storage.bytes();
+        let header = data.get(..HEADER_LEN)?;
+        if &header[..4] != MAGIC || header[4] != FORMAT || header[5] != kind_code(kind) {
+            return None;
+        }
+        if read_u32(header, 8) != flags.bits() as usize
+            || header[12..20] != fingerprint().to_le_bytes()
+        {
+            return None;
+        }
+        let (n_symbols, n_refs, n_symbol_bytes) = (
+            read_u32(header, 20),
+            read_u32(header, 24),
+            read_u32(header, 28),
+        );
+        let automaton = Layout::parse(data, HEADER_LEN)?;
+        let payloads = automaton.end();
+        let refs = payloads.checked_add((automaton.n_needles() + 1) * 4)?;
+        let symbols = refs.checked_add(n_refs.checked_mul(4)?)?;
+        let symbol_bytes = symbols.checked_add((n_symbols + 1) * 4)?;
+        if symbol_bytes.checked_add(n_symbol_bytes)? != data.len() {
+            return None;
+        }
+        // `Layout::parse` has checked the automaton; checking every
+        // table index once here as well lets the match path slice
+        // without fallible lookups.
+        let word = |base: usize, i: usize| read_u32(data, base + i * 4);
+        let offsets_ok = |base: usize, n: usize, limit: usize| {
+            word(base, 0) == 0
+                && (0..n).all(|i| word(base, i) <= word(base, i + 1))
+                && word(base, n) == limit
+        };
+        if !offsets_ok(payloads, automaton.n_needles(), n_refs)
+            || !offsets_ok(symbols, n_symbols, n_symbol_bytes)
+            || (0..n_refs).any(|i| word(refs, i) >= n_symbols)
+        {
+            return None;
+        }
+        for i in 0..n_symbols {
+            let sym = &data[symbol_bytes + word(symbols, i)..symbol_bytes + word(symbols, i + 1)];
+            let (&category, id) = sym.split_first()?;
+            if category as usize >= SymbolCategory::ALL.len() || std::str::from_utf8(id).is_err() {
+                return None;
+            }
+        }
+        Some(Self {
+            storage,
+            automaton,
+            payloads,
+            refs,
+            symbols,
+            symbol_bytes,
+        })
+    }
+
+    /// Wrap a freshly encoded image.
+    pub(crate) fn from_bytes(data: Vec<u8>, kind: TaggerKind, flags: Normalize) -> Option<Self> {
+        Self::parse(Storage::Owned(data), kind, flags)
+    }
+
+    /// The image's bytes, as written to disk.
+    pub fn bytes(&self) -> &[u8] {
+        self.storage.bytes()
+    }
+
+    /// Whether the image is shared from a file mapping.
+    pub fn is_mapped(&self) -> bool {
+        matches!(self.storage, Storage::Mapped(_))
+    }
+
+    pub(crate) fn automaton(&self) -> FlatAc<'_> {
+        FlatAc::new(self.bytes(), self.automaton)
+    }
+
+    /// The symbols attached to needle `needle`.
+    pub(crate) fn payload(&self, needle: usize) -> impl Iterator<Item = Symbol> + '_ {
+        let data = self.bytes();
+        let start = read_u32(data, self.payloads + needle * 4);
+        let end = read_u32(data, self.payloads + (needle + 1) * 4);
+        (start..end).map(move |r| {
+            let sym = read_u32(data, self.refs + r * 4);
+            let from = self.symbol_bytes + read_u32(data, self.symbols + sym * 4);
+            let to = self.symbol_bytes + read_u32(data, self.symbols + (sym + 1) * 4);
+            let category = SymbolCategory::ALL[data[from] as usize];
+            let id = std::str::from_utf8(&data[from + 1..to]).expect("validated on load");
+            Symbol::from_str(category, id)
+        })
+    }
+}
+
+/// Write `data` to `path` via a temporary file and a rename, so a
+/// concurrent reader sees either no file or the complete one.
+pub fn write_atomic(path: &Path, data: &[u8]) -> io::Result<()> {
+    let dir = path.parent().unwrap_or(Path::new("."));
+    fs::create_dir_all(dir)?;
+    let tmp = dir.join(format!(
+        ".{}.{}.tmp",
+        path.file_name()
+            .and_then(|n| n.to_str())
+            .unwrap_or("tagger"),
+        std::process::id()
+    ));
+    let result = (|| {
+        let mut fh = fs::File::create(&tmp)?;
+        fh.write_all(data)?;
+        fh.sync_all()?;
+        fs::rename(&tmp, path)
+    })();
+    if result.is_err() {
+        let _ = fs::remove_file(&tmp);
+    }
+    result
+}
+
+/// Map the `(kind, flags)` tagger image from `dir`, if a valid one is
+/// there.
+pub fn load(dir: &Path, kind: TaggerKind, flags: Normalize) -> Option<Image> {
+    let file = fs::File::open(dir.join(file_name(kind, flags))).ok()?;
+    // SAFETY: images are written to a temporary file and renamed into
+    // place (`write_atomic`), never modified in place, so the mapped
+    // file's contents cannot change while we hold the mapping.
+    let mmap = unsafe { Mmap::map(&file) }.ok()?;
+    Image::parse(Storage::Mapped(mmap), kind, flags)
+}
+
+/// Write `image` into `dir` under its `(kind, flags)` file name,
+/// returning the path.
+pub fn save(dir: &Path, image: &Image, kind: TaggerKind, flags: Normalize) -> io::Result<PathBuf> {
+    let path = dir.join(file_name(kind, flags));
+    write_atomic(&path, image.bytes())?;
+    Ok(path)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::names::tagger::{build_tagger, get_tagger};
+
+    const FLAGS: Normalize = Normalize::CASEFOLD.union(Normalize::SQUASH_SPACES);
+    const TEXTS: [&str; 3] = ["siemens aktiengesellschaft", "acme number one limited", "x"];
+
+    fn image_bytes() -> Vec<u8> {
+        get_tagger(TaggerKind::Org, FLAGS).image().bytes().to_vec()
+    }
+
+    #[test]
+    fn image_is_deterministic() {
+        let rebuilt = build_tagger(TaggerKind::Org, FLAGS);
+        assert_eq!(rebuilt.image().bytes(), image_bytes().as_slice());
+    }
+
+    #[test]
+    fn image_roundtrip_through_mapping() {
+        let dir = std::env::temp_dir().join(format!("rigour-tagger-{}", std::process::id()));
+        let tagger = get_tagger(TaggerKind::Org, FLAGS);
+        save(&dir, tagger.image(), TaggerKind::Org, FLAGS).expect("image saves");
+        let mapped = load(&dir, TaggerKind::Org, FLAGS).expect("image maps");
+        assert!(mapped.is_mapped());
+        let loaded = crate::names::tagger::Tagger::from_image(mapped);
+        for text in TEXTS {
+            assert_eq!(loaded.tag(text), tagger.tag(text));
+        }
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[test]
+    fn image_rejects_mismatch() {
+        let image = image_bytes();
+        let parse = |data: &[u8], kind, flags| Image::from_bytes(data.to_vec(), kind, flags);
+        assert!(parse(&image, TaggerKind::Org, FLAGS).is_some());
+        assert!(parse(&image, TaggerKind::Person, FLAGS).is_none());
+        assert!(parse(&image, TaggerKind::Org, Normalize::CASEFOLD).is_none());
+        assert!(parse(&image[..image.len() - 1], TaggerKind::Org, FLAGS).is_none());
+        assert!(parse(&image[..HEADER_LEN], TaggerKind::Org, FLAGS).is_none());
+        assert!(parse(b"", TaggerKind::Org, FLAGS).is_none());
+
+        // A damaged automaton index fails the load like a mismatch
+        // does, instead of panicking later in `find_overlapping`.
+        let mut bad = image.clone();
+        let root = HEADER_LEN + 16;
+        bad[root..root + 4].copy_from_slice(&u32::MAX.to_le_bytes());
+        assert!(parse(&bad, TaggerKind::Org, FLAGS).is_none());
+    }
+
+    #[test]
+    fn damaged_image_is_rebuilt() {
+        let dir = std::env::temp_dir().join(format!("rigour-tagger-bad-{}", std::process::id()));
+        let mut bad = image_bytes();
+        let root = HEADER_LEN + 16;
+        bad[root..root + 4].copy_from_slice(&u32::MAX.to_le_bytes());
+        write_atomic(&dir.join(file_name(TaggerKind::Org, FLAGS)), &bad).expect("writes");
+        assert!(load(&dir, TaggerKind::Org, FLAGS).is_none());
+        let _ = fs::remove_dir_all(&dir);
+    }
+}
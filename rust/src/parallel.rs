@@ -0,0 +1,116 @@
+// Scoped worker pool for the batch entry points. Pure Rust, no
+// Python: callers release the GIL before handing work here and
+// re-acquire it to materialise results.
+//
+// Built on `std::thread::scope` rather than a pool crate: batches
+// are coarse (thousands of entities per call), so per-call thread
+// spawn cost is noise next to the work, and scoped threads let the
+// workers borrow the caller's input slice without `Arc`-wrapping
+// it. Work is handed out in fixed-size chunks off an atomic cursor,
+// so one slow entity (a 40-alias person with a long tagger pass)
+// doesn't stall a statically-assigned partition.
+
+use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+/// Items claimed per cursor bump. Small enough to balance uneven
+/// per-item cost, large enough that the atomic isn't contended.
+const CHUNK: usize = 16;
+
+/// Worker count to use when the caller doesn't pass one: the
+/// machine's available parallelism, falling back to a single thread
+/// when the platform can't report it.
+pub fn default_threads() -> usize {
+    std::thread::available_parallelism()
+        .map(NonZeroUsize::get)
+        .unwrap_or(1)
+}
+
+/// Map `f` over `items` on up to `threads` scoped worker threads,
+/// returning results in input order.
+///
+/// Runs inline on the calling thread when `threads <= 1` or the
+/// input fits in a single chunk — spawning would cost more than it
+/// saves. A panic in a worker is re-raised on the calling thread
+/// with its original payload.
+pub fn map_ordered<T, R, F>(items: &[T], threads: usize, f: F) -> Vec<R>
+where
+    T: Sync,
+    R: Send,
+    F: Fn(&T) -> R + Sync,
+{
+    let workers = threads.min(items.len().div_ceil(CHUNK));
+    if workers <= 1 {
+        return items.iter().map(f).collect();
+    }
+    let cursor = AtomicUsize::new(0);
+    let batches: Vec<Vec<(usize, R)>> = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                let cursor = &cursor;
+                let f = &f;
+                scope.spawn(move || {
+                    let mut local: Vec<(usize, R)> = Vec::new();
+                    loop {
+                        let start = cursor.fetch_add(CHUNK, Ordering::Relaxed);
+                        if start >= items.len() {
+                            break;
+                        }
+                        let end = (start + CHUNK).min(items.len());
+                        for (offset, item) in items[start..end].iter().enumerate() {
+                            local.push((start + offset, f(item)));
+                        }
+                    }
+                    local
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().unwrap_or_else(|e| std::panic::resume_unwind(e)))
+            .collect()
+    });
+    let mut slots: Vec<Option<R>> = (0..items.len()).map(|_| None).collect();
+    for (idx, result) in batches.into_iter().flatten() {
+        slots[idx] = Some(result);
+    }
+    slots
+        .into_iter()
+        .map(|r| r.expect("every item is claimed by exactly one worker"))
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn preserves_input_order() {
+        let items: Vec<u64> = (0..1000).collect();
+        let out = map_ordered(&items, 8, |x| x * 2);
+        let expected: Vec<u64> = (0..1000).map(|x| x * 2).collect();
+        assert_eq!(out, expected);
+    }
+
+    #[test]
+    fn single_thread_runs_inline() {
+        let items = vec!["a", "bb", "ccc"];
+        let out = map_ordered(&items, 1, |s| s.len());
+        assert_eq!(out, vec![1, 2, 3]);
+    }
+
+    #[test]
+    fn empty_input() {
+        let items: Vec<u32> = Vec::new();
+        let out: Vec<u32> = map_ordered(&items, 4, |x| *x);
+        assert!(out.is_empty());
+    }
+
+    #[test]
+    fn more_threads_than_chunks() {
+        let items: Vec<u32> = (0..(CHUNK as u32 + 1)).collect();
+        let out = map_ordered(&items, 64, |x| x + 1);
+        assert_eq!(out.len(), items.len());
+        assert_eq!(out[CHUNK], CHUNK as u32 + 1);
+    }
+}
@@ -0,0 +1,110 @@
+// Eager construction of the lazily built Rust-side data.
+//
+// Every structure here is otherwise built on first use: the taggers
+// (by far the slowest), the org-type replacers, the name-prefix
+// regexes, the stopword set `analyze_names` promotes STOP tags from,
+// the name-symbol dictionaries, the address keyword replacers and
+// the territory name scanner. `rigour.preload()` calls in here
+// at process start — before a pre-fork server forks — so the first
+// real request doesn't pay for them and forked children inherit the
+// built pages.
+//
+// The builds are independent, so each requested component runs on
+// its own scoped thread. They all go through the same process-wide
+// caches as on-demand use, so a preload racing a real call builds
+// each structure once.
+
+use std::time::Instant;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+use crate::names::analyze::{preload_stopwords, preload_tagger};
+use crate::names::tagger::TaggerKind;
+use crate::names::{org_types, prefix, symbols};
+use crate::territories::mentions;
+use crate::text::address;
+
+fn org_tagger() {
+    preload_tagger(TaggerKind::Org);
+}
+
+fn person_tagger() {
+    preload_tagger(TaggerKind::Person);
+}
+
+fn name_symbols() {
+    symbols::data();
+}
+
+/// Component name → builder, in the order `preload` reports them.
+pub const COMPONENTS: [(&str, fn()); 8] = [
+    ("org_tagger", org_tagger),
+    ("person_tagger", person_tagger),
+    ("org_types", org_types::preload),
+    ("name_prefixes", prefix::preload),
+    ("name_stopwords", preload_stopwords),
+    ("name_symbols", name_symbols),
+    ("address_keywords", address::preload),
+    ("territory_mentions", mentions::preload),
+];
+
+fn builder(name: &str) -> Option<fn()> {
+    COMPONENTS.iter().find(|(n, _)| *n == name).map(|(_, f)| *f)
+}
+
+/// Build the named components concurrently, one thread each.
+/// Returns `(name, seconds)` per component in input order; an
+/// already-built component reports the (near-zero) time its lookup
+/// took.
+pub fn preload(names: &[&'static str]) -> Vec<(&'static str, f64)> {
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = names
+            .iter()
+            .filter_map(|&name| builder(name).map(|build| (name, build)))
+            .map(|(name, build)| {
+                scope.spawn(move || {
+                    let start = Instant::now();
+                    build();
+                    (name, start.elapsed().as_secs_f64())
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().unwrap_or_else(|e| std::panic::resume_unwind(e)))
+            .collect()
+    })
+}
+
+/// PyO3 wrapper: build `components` (default: all) with the GIL
+/// released. Unknown names raise `ValueError` before anything is
+/// built.
+#[pyfunction]
+#[pyo3(name = "preload_data")]
+#[pyo3(signature = (components = None))]
+pub fn py_preload_data(
+    py: Python<'_>,
+    components: Option<Vec<String>>,
+) -> PyResult<Vec<(String, f64)>> {
+    let names: Vec<&'static str> = match components {
+        None => COMPONENTS.iter().map(|(n, _)| *n).collect(),
+        Some(requested) => requested
+            .iter()
+            .map(|r| {
+                COMPONENTS
+                    .iter()
+                    .map(|(n, _)| *n)
+                    .find(|n| *n == r.as_str())
+                    .ok_or_else(|| {
+                        PyValueError::new_err(format!("unknown preload component: {:?}", r))
+                    })
+            })
+            .collect::<PyResult<_>>()?,
+    };
+    let timings = py.detach(|| preload(&names));
+    Ok(timings
+        .into_iter()
+        .map(|(n, t)| (n.to_string(), t))
+        .collect())
+}
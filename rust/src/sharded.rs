@@ -0,0 +1,64 @@
+// Lock striping for process-global caches. With the GIL released
+// (and on free-threaded CPython, where there is no GIL at all) every
+// worker thread probes the same caches; a single Mutex / RwLock puts
+// all of them on one cache line. `Sharded<T>` splits the state into a
+// fixed number of independently locked shards picked by key hash, so
+// threads working on different keys rarely touch the same lock.
+
+use std::hash::{BuildHasher, Hash, RandomState};
+
+/// Shard count. A power of two, comfortably above the core counts we
+/// deploy on, so two threads collide on a shard with low probability.
+pub const SHARDS: usize = 32;
+
+/// `SHARDS` copies of `T`, each standing in for one slice of the key
+/// space. `T` is typically a `Mutex<…>` or `RwLock<…>`.
+pub struct Sharded<T> {
+    shards: Box<[T]>,
+    hasher: RandomState,
+}
+
+impl<T> Sharded<T> {
+    /// Build with `init` called once per shard.
+    pub fn new(init: impl Fn() -> T) -> Self {
+        Self {
+            shards: (0..SHARDS).map(|_| init()).collect(),
+            hasher: RandomState::new(),
+        }
+    }
+
+    /// The shard responsible for `key`.
+    pub fn shard<K: Hash + ?Sized>(&self, key: &K) -> &T {
+        let h = self.hasher.hash_one(key) as usize;
+        &self.shards[h % SHARDS]
+    }
+
+    /// All shards, for whole-cache operations (clearing, stats).
+    pub fn iter(&self) -> impl Iterator<Item = &T> {
+        self.shards.iter()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::Mutex;
+
+    #[test]
+    fn same_key_same_shard() {
+        let s: Sharded<Mutex<Vec<u32>>> = Sharded::new(|| Mutex::new(Vec::new()));
+        let a = s.shard("hello") as *const _;
+        let b = s.shard("hello") as *const _;
+        assert_eq!(a, b);
+    }
+
+    #[test]
+    fn keys_spread_over_shards() {
+        let s: Sharded<Mutex<u32>> = Sharded::new(|| Mutex::new(0));
+        for i in 0..10_000 {
+            *s.shard(&i).lock().unwrap() += 1;
+        }
+        let used = s.iter().filter(|m| *m.lock().unwrap() > 0).count();
+        assert_eq!(used, SHARDS);
+    }
+}
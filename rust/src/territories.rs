@@ -11,17 +11,25 @@
 // time by `build.rs` (~214 KiB).
 //
 // No static `LazyLock<String>` cache — each `decompressed()` call
-// returns a fresh owned `String`. Both consumers are one-shot:
-// Python's `rigour.territories.*` reads via `@cache`-decorated index
-// builders (so exactly one FFI hop per process), and the Rust tagger
-// walks the lines once per `(TaggerKind, flags, cleanup)` cache miss.
-// A persistent Rust-side copy would just duplicate what's already in
-// Python's cached PyString / the tagger's AC automaton.
+// returns a fresh owned `String`. The consumers are one-shot: the
+// parsed index (`index.rs`, behind the `Territory` pyclass in
+// `territory.rs`) is built from it once per process, the Rust tagger
+// walks the lines once per `(TaggerKind, flags, cleanup)` cache miss,
+// and Python's name lookups read it via `@cache`-decorated builders.
+// A persistent copy of the text would only duplicate those.
+
+pub mod fuzzy;
+pub mod hierarchy;
+pub mod index;
+pub mod mentions;
+#[cfg(feature = "python")]
+pub mod territory;
 
 /// The compressed blob — produced by `build.rs` from
 /// `rust/data/territories/data.jsonl` (build fails if the source
 /// file is missing).
-const COMPRESSED: &[u8] = include_bytes!(concat!(env!("OUT_DIR"), "/territories.jsonl.zst"));
+pub(crate) const COMPRESSED: &[u8] =
+    include_bytes!(concat!(env!("OUT_DIR"), "/territories.jsonl.zst"));
 
 /// Decompress the JSONL into a fresh `String`. Caller owns the
 /// allocation — do not stash the result in a static. PyO3 boundary:
@@ -0,0 +1,245 @@
+// Approximate-match index over the normalised territory names.
+//
+// `lookup_territory(text, fuzzy=True)` falls back to the closest
+// known name within a Levenshtein radius of 30% of the query's
+// length. Scanning every name per miss is the hot spot on address
+// data with high-cardinality country strings, so the names go into a
+// BK-tree: Levenshtein is a metric, so a node at distance `d` from
+// the query can only have matches in child subtrees whose edge
+// distance lies in `[d - k, d + k]`. Everything else is pruned, and
+// the search is still exact.
+//
+// Semantics match the former linear scan: names of four characters
+// or fewer are never candidates, the radius is
+// `floor(len(query) * 0.3)` in characters, and the best match is the
+// smallest distance, ties going to the name that came first in the
+// input list.
+
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+
+use crate::parallel;
+use crate::text::distance::levenshtein;
+
+/// Names this short are never fuzzy-matched.
+const MIN_CHARS: usize = 5;
+
+struct Node {
+    text: String,
+    /// Position in the list the index was built from.
+    position: usize,
+    /// `(edge distance, node)`.
+    children: Vec<(usize, usize)>,
+}
+
+/// A BK-tree over a list of names; search results are positions in
+/// that list.
+#[cfg_attr(feature = "python", pyclass(frozen, module = "rigour._core"))]
+pub struct FuzzyNameIndex {
+    nodes: Vec<Node>,
+}
+
+impl FuzzyNameIndex {
+    pub fn new<S: AsRef<str>>(names: &[S]) -> Self {
+        let mut index = FuzzyNameIndex { nodes: Vec::new() };
+        for (position, name) in names.iter().enumerate() {
+            let name = name.as_ref();
+            if name.chars().count() >= MIN_CHARS {
+                index.insert(name, position);
+            }
+        }
+        index
+    }
+
+    fn insert(&mut self, text: &str, position: usize) {
+        if self.nodes.is_empty() {
+            self.nodes.push(Node {
+                text: text.to_string(),
+                position,
+                children: Vec::new(),
+            });
+            return;
+        }
+        let mut cur = 0;
+        loop {
+            let d = levenshtein(&self.nodes[cur].text, text);
+            if d == 0 {
+                // Duplicate: the earlier position wins ties anyway.
+                return;
+            }
+            match self.nodes[cur].children.iter().find(|(e, _)| *e == d) {
+                Some(&(_, next)) => cur = next,
+                None => {
+                    let id = self.nodes.len();
+                    self.nodes.push(Node {
+                        text: text.to_string(),
+                        position,
+                        children: Vec::new(),
+                    });
+                    self.nodes[cur].children.push((d, id));
+                    return;
+                }
+            }
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.nodes.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.nodes.is_empty()
+    }
+
+    /// Best match for `query` as `(position, distance)`, or `None`
+    /// if no name is within the radius.
+    pub fn search(&self, query: &str) -> Option<(usize, usize)> {
+        // Same float arithmetic as the Python `int(len(name) * 0.3)`.
+        let radius = (query.chars().count() as f64 * 0.3) as usize;
+        if self.nodes.is_empty() {
+            return None;
+        }
+        let mut best: Option<(usize, usize)> = None; // (distance, position)
+        let mut stack = vec![0usize];
+        while let Some(id) = stack.pop() {
+            let node = &self.nodes[id];
+            let d = levenshtein(query, &node.text);
+            if d <= radius && best.is_none_or(|b| (d, node.position) < b) {
+                best = Some((d, node.position));
+            }
+            let lo = d.saturating_sub(radius);
+            let hi = d + radius;
+            stack.extend(
+                node.children
+                    .iter()
+                    .filter(|(e, _)| *e >= lo && *e <= hi)
+                    .map(|(_, child)| *child),
+            );
+        }
+        best.map(|(distance, position)| (position, distance))
+    }
+
+    /// [`search`](Self::search) over many queries on up to `threads`
+    /// workers, in input order.
+    pub fn search_batch<S: AsRef<str> + Sync>(
+        &self,
+        queries: &[S],
+        threads: usize,
+    ) -> Vec<Option<(usize, usize)>> {
+        parallel::map_ordered(queries, threads, |q| self.search(q.as_ref()))
+    }
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl FuzzyNameIndex {
+    /// Index `names`; results refer to positions in this list.
+    #[new]
+    fn py_new(py: Python<'_>, names: Vec<String>) -> Self {
+        py.detach(|| FuzzyNameIndex::new(&names))
+    }
+
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    /// Best match as `(position, distance)`, or `None`.
+    #[pyo3(name = "search")]
+    fn py_search(&self, py: Python<'_>, name: &str) -> Option<(usize, usize)> {
+        py.detach(|| self.search(name))
+    }
+
+    /// `search` for each name, with the GIL released.
+    #[pyo3(name = "search_batch", signature = (names, threads = None))]
+    fn py_search_batch(
+        &self,
+        py: Python<'_>,
+        names: Vec<String>,
+        threads: Option<usize>,
+    ) -> Vec<Option<(usize, usize)>> {
+        let threads = threads.unwrap_or_else(parallel::default_threads);
+        py.detach(|| self.search_batch(&names, threads))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::text::distance::levenshtein_cutoff;
+
+    /// The linear scan this index replaces.
+    fn linear(names: &[&str], query: &str) -> Option<(usize, usize)> {
+        let cutoff = (query.chars().count() as f64 * 0.3) as usize;
+        let mut best: Option<(usize, usize)> = None;
+        let mut best_distance = cutoff + 1;
+        for (i, cand) in names.iter().enumerate() {
+            if cand.chars().count() <= 4 {
+                continue;
+            }
+            let d = levenshtein_cutoff(query, cand, cutoff);
+            if d < best_distance {
+                best_distance = d;
+                best = Some((i, d));
+            }
+        }
+        best
+    }
+
+    const NAMES: &[&str] = &[
+        "germany",
+        "france",
+        "russia",
+        "russian federation",
+        "united kingdom",
+        "united states",
+        "united states of america",
+        "iran",
+        "irán",
+        "bosnia and herzegovina",
+        "czech republic",
+        "czechia",
+        "guinea",
+        "guinea bissau",
+        "equatorial guinea",
+        "ghana",
+        "guyana",
+        "gambia",
+        "zambia",
+        "namibia",
+    ];
+
+    #[test]
+    fn matches_linear_scan() {
+        let index = FuzzyNameIndex::new(NAMES);
+        let queries = [
+            "germani",
+            "frnace",
+            "rusia",
+            "united kingdon",
+            "united state",
+            "bosnia herzegovina",
+            "chech republic",
+            "gvinea",
+            "ganna",
+            "zambya",
+            "gambiaa",
+            "iran",
+            "xyzzy",
+            "",
+            "unitedstatesofamerica",
+        ];
+        for q in queries {
+            assert_eq!(index.search(q), linear(NAMES, q), "query {q:?}");
+        }
+        let batch = index.search_batch(&queries, 4);
+        let single: Vec<_> = queries.iter().map(|q| index.search(q)).collect();
+        assert_eq!(batch, single);
+    }
+
+    #[test]
+    fn short_names_are_skipped() {
+        let index = FuzzyNameIndex::new(&["iran", "irán", "oman"]);
+        assert!(index.is_empty());
+        assert_eq!(index.search("irann"), None);
+    }
+}
@@ -0,0 +1,225 @@
+// Territory hierarchy as bitsets over the dense record ids.
+//
+// Built with the index (`index.rs`), once per process. Three rows per
+// territory, each a fixed-width bitset over all records (~600 bits):
+//
+//   - `ancestors`: the transitive parent chain, excluding itself;
+//   - `descendants`: every territory whose chain contains it;
+//   - `related_down`: direct children plus territories claiming it —
+//     exactly the relations `territories_intersect` follows.
+//
+// `territories_intersect(L, R)` has always matched a territory in one
+// list if it is also in the other, or if its direct parent or one of
+// its claims is. With `down(S)` the union of `related_down` over `S`,
+// that is `(L & R) | (L & down(R)) | (R & down(L))`: a handful of word
+// ORs and ANDs instead of set construction and attribute walks.
+
+use crate::territories::index::{Index, Record};
+
+/// A fixed-width set of record ids.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct Bitset {
+    words: Vec<u64>,
+}
+
+impl Bitset {
+    pub fn new(bits: usize) -> Self {
+        Bitset {
+            words: vec![0; bits.div_ceil(64)],
+        }
+    }
+
+    pub fn insert(&mut self, id: usize) {
+        self.words[id / 64] |= 1 << (id % 64);
+    }
+
+    pub fn contains(&self, id: usize) -> bool {
+        self.words[id / 64] & (1 << (id % 64)) != 0
+    }
+
+    pub fn union_with(&mut self, other: &Bitset) {
+        for (a, b) in self.words.iter_mut().zip(&other.words) {
+            *a |= b;
+        }
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.words.iter().all(|w| *w == 0)
+    }
+
+    /// Set ids in ascending order.
+    pub fn iter(&self) -> impl Iterator<Item = usize> + '_ {
+        self.words.iter().enumerate().flat_map(|(i, &word)| {
+            let mut word = word;
+            std::iter::from_fn(move || {
+                if word == 0 {
+                    return None;
+                }
+                let bit = word.trailing_zeros() as usize;
+                word &= word - 1;
+                Some(i * 64 + bit)
+            })
+        })
+    }
+}
+
+pub struct Hierarchy {
+    bits: usize,
+    ancestors: Vec<Bitset>,
+    descendants: Vec<Bitset>,
+    related_down: Vec<Bitset>,
+}
+
+impl Hierarchy {
+    pub fn build(records: &[Record]) -> Self {
+        let bits = records.len();
+        let mut ancestors = vec![Bitset::new(bits); bits];
+        let mut descendants = vec![Bitset::new(bits); bits];
+        let mut related_down = vec![Bitset::new(bits); bits];
+        for (id, record) in records.iter().enumerate() {
+            let mut cur = record.parent;
+            // Bounded like the field inheritance: a parent cycle in
+            // the data must not hang the load.
+            for _ in 0..bits {
+                let Some(parent) = cur else { break };
+                if parent == id || ancestors[id].contains(parent) {
+                    break;
+                }
+                ancestors[id].insert(parent);
+                descendants[parent].insert(id);
+                cur = records[parent].parent;
+            }
+            if let Some(parent) = record.parent {
+                related_down[parent].insert(id);
+            }
+            for &claim in &record.claims {
+                related_down[claim].insert(id);
+            }
+        }
+        Hierarchy {
+            bits,
+            ancestors,
+            descendants,
+            related_down,
+        }
+    }
+
+    /// The ids of `codes`, resolved through the index's codes and
+    /// aliases; unknown codes are skipped.
+    pub fn set_of(&self, index: &Index, codes: &[impl AsRef<str>]) -> Bitset {
+        let mut set = Bitset::new(self.bits);
+        for code in codes {
+            if let Some(&id) = index.by_code.get(code.as_ref()) {
+                set.insert(id);
+            }
+        }
+        set
+    }
+
+    /// Territories related downwards to any member of `set`: their
+    /// direct children and the territories claiming them.
+    fn down(&self, set: &Bitset) -> Bitset {
+        let mut out = Bitset::new(self.bits);
+        for id in set.iter() {
+            out.union_with(&self.related_down[id]);
+        }
+        out
+    }
+
+    fn intersect_with_down(&self, left: &Bitset, left_down: &Bitset, right: &Bitset) -> Bitset {
+        let right_down = self.down(right);
+        let words = left
+            .words
+            .iter()
+            .zip(&left_down.words)
+            .zip(right.words.iter().zip(&right_down.words))
+            .map(|((l, ld), (r, rd))| (l & r) | (l & rd) | (r & ld))
+            .collect();
+        Bitset { words }
+    }
+
+    /// Territories common to both sets, through parent and claim
+    /// relations; see the module docs.
+    pub fn intersect(&self, left: &Bitset, right: &Bitset) -> Bitset {
+        self.intersect_with_down(left, &self.down(left), right)
+    }
+
+    /// [`intersect`](Self::intersect) of one query set against many
+    /// candidate sets, expanding the query once.
+    pub fn intersect_many(&self, query: &Bitset, candidates: &[Bitset]) -> Vec<Bitset> {
+        let query_down = self.down(query);
+        candidates
+            .iter()
+            .map(|cand| self.intersect_with_down(query, &query_down, cand))
+            .collect()
+    }
+
+    /// Whether `id` is `ancestor` or lies beneath it in the parent
+    /// chain.
+    pub fn is_within(&self, id: usize, ancestor: usize) -> bool {
+        id == ancestor || self.ancestors[id].contains(ancestor)
+    }
+
+    /// Every territory beneath `id`, at any depth.
+    pub fn descendants(&self, id: usize) -> &Bitset {
+        &self.descendants[id]
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::territories::index::index;
+
+    fn codes(set: &super::Bitset) -> Vec<&'static str> {
+        let index = index();
+        let mut out: Vec<_> = set.iter().map(|i| index.records[i].code.as_str()).collect();
+        out.sort();
+        out
+    }
+
+    fn intersect(left: &[&str], right: &[&str]) -> Vec<&'static str> {
+        let index = index();
+        let h = &index.hierarchy;
+        codes(&h.intersect(&h.set_of(index, left), &h.set_of(index, right)))
+    }
+
+    #[test]
+    fn intersects_through_relations() {
+        assert_eq!(intersect(&["us", "ca"], &["mx", "ca", "us"]), ["ca", "us"]);
+        assert!(intersect(&["us", "ca"], &["mx", "fr"]).is_empty());
+        assert_eq!(intersect(&["us"], &["us-ca", "us-tx"]), ["us-ca", "us-tx"]);
+        assert_eq!(intersect(&["ru"], &["ua-cri"]), ["ua-cri"]);
+        assert_eq!(intersect(&["ua-cri"], &["ua"]), ["ua-cri"]);
+        assert_eq!(intersect(&["cn-hk"], &["hk"]), ["hk"]);
+    }
+
+    #[test]
+    fn batch_matches_pairwise() {
+        let index = index();
+        let h = &index.hierarchy;
+        let query = h.set_of(index, &["ru", "us"]);
+        let cands: Vec<_> = [&["ua-cri"][..], &["us-tx", "fr"], &[], &["xx"]]
+            .iter()
+            .map(|c| h.set_of(index, c))
+            .collect();
+        let batch = h.intersect_many(&query, &cands);
+        for (cand, got) in cands.iter().zip(&batch) {
+            assert_eq!(&h.intersect(&query, cand), got);
+        }
+    }
+
+    #[test]
+    fn ancestry() {
+        let index = index();
+        let h = &index.hierarchy;
+        let id = |c: &str| index.by_code[c];
+        assert!(h.is_within(id("gb-nir"), id("gb")));
+        assert!(h.is_within(id("gb"), id("gb")));
+        assert!(!h.is_within(id("gb"), id("gb-nir")));
+        assert!(!h.is_within(id("fr"), id("gb")));
+        let below = codes(h.descendants(id("gb")));
+        assert!(below.contains(&"gb-nir") && below.contains(&"gb-sct"));
+        assert!(!below.contains(&"gb"));
+        assert!(h.descendants(id("gb-nir")).is_empty());
+    }
+}
@@ -0,0 +1,265 @@
+// Parsed territory database, shared by every Rust-side consumer.
+//
+// Built once per process from the embedded JSONL (see the parent
+// module). Cross-references (`parent`, `successors`, `claims`,
+// `see`) are resolved to record indices, and the fields a territory
+// inherits from its ancestors — region, subregion, FtM country and
+// languages — are resolved at load, so no reader ever walks the
+// parent chain.
+//
+// The record indices double as dense territory ids: `hierarchy.rs`
+// keys its bitsets on them.
+//
+// `by_code` reproduces the Python index's key semantics exactly:
+// every primary code first, then, in record order, each record's
+// `other_codes` and `alpha3`. An alias that collides with another
+// territory's primary code wins, as it always has.
+
+use std::collections::HashMap;
+use std::sync::LazyLock;
+
+use serde::Deserialize;
+
+use crate::territories::hierarchy::Hierarchy;
+
+/// One line of `data.jsonl`, as emitted by
+/// `genscripts/generate_territories.py`.
+#[derive(Debug, Deserialize)]
+struct RawRecord {
+    code: String,
+    name: String,
+    full_name: Option<String>,
+    alpha3: Option<String>,
+    #[serde(default)]
+    is_country: bool,
+    #[serde(default)]
+    is_ftm: bool,
+    is_jurisdiction: Option<bool>,
+    #[serde(default)]
+    is_historical: bool,
+    region: Option<String>,
+    subregion: Option<String>,
+    in_sentence: Option<String>,
+    qid: String,
+    #[serde(default)]
+    other_qids: Vec<String>,
+    #[serde(default)]
+    other_codes: Vec<String>,
+    parent: Option<String>,
+    #[serde(default)]
+    successors: Vec<String>,
+    #[serde(default)]
+    claims: Vec<String>,
+    #[serde(default)]
+    see: Vec<String>,
+    #[serde(default)]
+    langs: Vec<String>,
+    #[serde(default)]
+    names_strong: Vec<String>,
+    #[serde(default)]
+    names_weak: Vec<String>,
+}
+
+/// A territory with its references and inherited fields resolved.
+#[derive(Debug)]
+pub struct Record {
+    pub code: String,
+    pub name: String,
+    pub full_name: String,
+    pub alpha3: Option<String>,
+    pub is_country: bool,
+    pub is_ftm: bool,
+    pub is_jurisdiction: bool,
+    pub is_historical: bool,
+    pub qid: String,
+    pub other_qids: Vec<String>,
+    pub other_codes: Vec<String>,
+    /// Index of the governing territory.
+    pub parent: Option<usize>,
+    pub successors: Vec<usize>,
+    pub claims: Vec<usize>,
+    pub see: Vec<usize>,
+    /// The record's own values, as stored in the data file.
+    pub own_region: Option<String>,
+    pub own_subregion: Option<String>,
+    pub own_in_sentence: Option<String>,
+    /// Resolved up the parent chain.
+    pub region: Option<String>,
+    pub subregion: Option<String>,
+    pub ftm_country: Option<String>,
+    pub langs: Vec<String>,
+    pub names_strong: Vec<String>,
+    pub names_weak: Vec<String>,
+}
+
+impl Record {
+    /// The name to use in a sentence ("the United Kingdom").
+    pub fn in_sentence(&self) -> &str {
+        match self.own_in_sentence.as_deref() {
+            Some(s) if !s.is_empty() => s,
+            _ => &self.name,
+        }
+    }
+}
+
+pub struct Index {
+    /// Records in data-file order.
+    pub records: Vec<Record>,
+    /// Code / alias → record index.
+    pub by_code: HashMap<String, usize>,
+    /// Ancestry and claim bitsets over the record indices.
+    pub hierarchy: Hierarchy,
+}
+
+impl Index {
+    pub fn get(&self, code: &str) -> Option<&Record> {
+        self.by_code.get(code).map(|&i| &self.records[i])
+    }
+
+    /// `(key, record)` in the order the Python-side index dict
+    /// assigns them. Later assignments of a key overwrite earlier
+    /// ones but keep the key's first position, as `dict` does.
+    pub fn assignments(&self) -> impl Iterator<Item = (&str, usize)> + '_ {
+        let primary = self
+            .records
+            .iter()
+            .enumerate()
+            .map(|(i, r)| (r.code.as_str(), i));
+        let aliases = self.records.iter().enumerate().flat_map(|(i, r)| {
+            r.other_codes
+                .iter()
+                .chain(r.alpha3.iter())
+                .map(move |c| (c.as_str(), i))
+        });
+        primary.chain(aliases)
+    }
+}
+
+/// First value found walking from `id` up the parent chain.
+fn inherit<T>(
+    raw: &[RawRecord],
+    parents: &[Option<usize>],
+    id: usize,
+    get: impl Fn(&RawRecord) -> Option<T>,
+) -> Option<T> {
+    let mut cur = Some(id);
+    // Bounded: a parent cycle in the data must not hang the load.
+    for _ in 0..raw.len() {
+        let i = cur?;
+        if let Some(value) = get(&raw[i]) {
+            return Some(value);
+        }
+        cur = parents[i];
+    }
+    None
+}
+
+fn build(corpus: &str) -> Index {
+    let raw: Vec<RawRecord> = corpus
+        .lines()
+        .filter(|l| !l.is_empty())
+        .map(|l| serde_json::from_str(l).expect("territories.jsonl record parses"))
+        .collect();
+    let primary: HashMap<&str, usize> = raw
+        .iter()
+        .enumerate()
+        .map(|(i, r)| (r.code.as_str(), i))
+        .collect();
+    let resolve = |codes: &[String]| -> Vec<usize> {
+        codes
+            .iter()
+            .filter_map(|c| primary.get(c.as_str()).copied())
+            .collect()
+    };
+    let parents: Vec<Option<usize>> = raw
+        .iter()
+        .map(|r| r.parent.as_deref().and_then(|p| primary.get(p).copied()))
+        .collect();
+
+    let mut records = Vec::with_capacity(raw.len());
+    for (i, r) in raw.iter().enumerate() {
+        let langs = inherit(&raw, &parents, i, |x| {
+            (!x.langs.is_empty()).then(|| x.langs.clone())
+        })
+        .unwrap_or_default();
+        records.push(Record {
+            code: r.code.clone(),
+            name: r.name.clone(),
+            full_name: r.full_name.clone().unwrap_or_else(|| r.name.clone()),
+            alpha3: r.alpha3.clone(),
+            is_country: r.is_country,
+            is_ftm: r.is_ftm,
+            is_jurisdiction: r.is_jurisdiction.unwrap_or(r.is_country),
+            is_historical: r.is_historical,
+            qid: r.qid.clone(),
+            other_qids: r.other_qids.clone(),
+            other_codes: r.other_codes.clone(),
+            parent: parents[i],
+            successors: resolve(&r.successors),
+            claims: resolve(&r.claims),
+            see: resolve(&r.see),
+            own_region: r.region.clone(),
+            own_subregion: r.subregion.clone(),
+            own_in_sentence: r.in_sentence.clone(),
+            region: inherit(&raw, &parents, i, |x| x.region.clone()),
+            subregion: inherit(&raw, &parents, i, |x| x.subregion.clone()),
+            ftm_country: inherit(&raw, &parents, i, |x| x.is_ftm.then(|| x.code.clone())),
+            langs,
+            names_strong: r.names_strong.clone(),
+            names_weak: r.names_weak.clone(),
+        });
+    }
+
+    let hierarchy = Hierarchy::build(&records);
+    let mut index = Index {
+        records,
+        by_code: HashMap::new(),
+        hierarchy,
+    };
+    let by_code: HashMap<String, usize> = index
+        .assignments()
+        .map(|(code, i)| (code.to_string(), i))
+        .collect();
+    index.by_code = by_code;
+    index
+}
+
+static INDEX: LazyLock<Index> = LazyLock::new(|| build(&super::decompressed()));
+
+/// The process-wide territory index, built on first use.
+pub fn index() -> &'static Index {
+    &INDEX
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn resolves_references() {
+        let index = index();
+        let gb = index.get("gb").expect("gb");
+        assert_eq!(gb.name, "United Kingdom");
+        assert!(gb.parent.is_none());
+        assert_eq!(gb.in_sentence(), "the United Kingdom");
+
+        let nir = index.get("gb-nir").expect("gb-nir");
+        assert_eq!(index.records[nir.parent.unwrap()].code, "gb");
+        assert_eq!(nir.region.as_deref(), Some("Europe"));
+        assert_eq!(nir.in_sentence(), "Northern Ireland");
+
+        let moscow = index.get("ru-mos").expect("ru-mos");
+        assert!(moscow.own_region.is_none());
+        assert_eq!(moscow.subregion.as_deref(), Some("Eastern Europe"));
+        assert_eq!(moscow.ftm_country.as_deref(), Some("ru"));
+        assert!(!moscow.langs.is_empty());
+    }
+
+    #[test]
+    fn aliases_resolve() {
+        let index = index();
+        assert_eq!(index.get("gg-srk").unwrap().code, "cq");
+        assert_eq!(index.get("deu").unwrap().code, "de");
+        assert!(index.get("gb-nirvana").is_none());
+    }
+}
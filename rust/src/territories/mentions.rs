@@ -0,0 +1,251 @@
+// Territory names mentioned in free text — the scanner behind
+// `rigour.territories.find_territories`.
+//
+// One `Needles` automaton (Aho-Corasick + Python-style word
+// boundaries, leftmost-longest) over every territory name, drawn from
+// the same records as the lookup tables in `rigour.territories.lookup`:
+//
+//   - strong names: each record's `names_strong`, plus the `name` and
+//     `full_name` of the territory its code resolves to; later records
+//     overwrite earlier ones;
+//   - weak names (`names_weak`), unless the same key is a strong name.
+//
+// Each needle carries the record index and whether it is strong, so
+// callers can drop the weak hits, which include plenty of common
+// words ("down", "cook"). A weak hit that contains a strong name of
+// the same territory ("the united states of america") counts as
+// strong.
+//
+// The haystack is split into words before normalising, so that
+// match offsets can be mapped back to the input. A word is a run of
+// letters and numbers; `.`, `-` and apostrophes inside a run are part
+// of the word ("U.S.A.", "Guinea-Bissau", "Côte d'Ivoire"), and, as
+// in `normalize_territory_name`, are dropped. Every other character
+// separates words. Each word is normalised on its own and the
+// results are joined by single spaces; a match counts only if it
+// starts and ends on word boundaries in that joined text. The names
+// go through the same split, so that a name normalises as its
+// mention in a text does ("Birmanie/Myanmar" → "birmanie myanmar").
+//
+// Offsets are in characters, as Python indexes strings. The
+// automaton is built on first use and kept for the life of the
+// process.
+
+use std::collections::HashMap;
+use std::sync::LazyLock;
+
+use crate::names::matcher::Needles;
+use crate::territories::index::index;
+use crate::text::normalize::normalize_territory_name;
+
+/// Kept inside a word, but never start or end one.
+const JOINERS: &[char] = &['.', '-', '\'', '’', 'ʻ'];
+
+#[derive(Clone, Copy, Debug)]
+struct Needle {
+    territory: usize,
+    strong: bool,
+}
+
+/// A territory name found in a text.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct Mention {
+    /// Character offset of the first character of the name.
+    pub start: usize,
+    /// Character offset just past the name.
+    pub end: usize,
+    /// Index of the territory in the territory index.
+    pub territory: usize,
+    /// Whether the name is a strong name of the territory.
+    pub strong: bool,
+}
+
+fn build_needles() -> Needles<Needle> {
+    let index = index();
+    let mut strong: HashMap<String, usize> = HashMap::new();
+    let mut weak: HashMap<String, usize> = HashMap::new();
+    for record in &index.records {
+        // Resolved through the code index, as the Python-side lookup
+        // tables are: an alias can shadow a primary code.
+        let Some(&id) = index.by_code.get(&record.code) else {
+            continue;
+        };
+        let territory = &index.records[id];
+        let names = record
+            .names_strong
+            .iter()
+            .chain([&territory.name, &territory.full_name]);
+        for name in names {
+            strong.insert(split_words(name).0, id);
+        }
+        for name in &record.names_weak {
+            weak.insert(split_words(name).0, id);
+        }
+    }
+    weak.retain(|name, _| !strong.contains_key(name));
+    let strong = strong.into_iter().map(|(name, territory)| {
+        let needle = Needle {
+            territory,
+            strong: true,
+        };
+        (name, needle)
+    });
+    let weak = weak.into_iter().map(|(name, territory)| {
+        let needle = Needle {
+            territory,
+            strong: false,
+        };
+        (name, needle)
+    });
+    Needles::build(strong.chain(weak))
+}
+
+static NEEDLES: LazyLock<Needles<Needle>> = LazyLock::new(build_needles);
+
+/// Build the territory name automaton, so the first call doesn't pay
+/// for it.
+pub fn preload() {
+    LazyLock::force(&NEEDLES);
+}
+
+/// A normalised word in the haystack: byte range in the joined text,
+/// character range in the input.
+struct Word {
+    norm_start: usize,
+    norm_end: usize,
+    start: usize,
+    end: usize,
+}
+
+fn push_word(haystack: &mut String, words: &mut Vec<Word>, text: &str, start: usize, end: usize) {
+    let norm = normalize_territory_name(text);
+    if norm.is_empty() {
+        return;
+    }
+    if !haystack.is_empty() {
+        haystack.push(' ');
+    }
+    let norm_start = haystack.len();
+    haystack.push_str(&norm);
+    words.push(Word {
+        norm_start,
+        norm_end: haystack.len(),
+        start,
+        end,
+    });
+}
+
+fn split_words(text: &str) -> (String, Vec<Word>) {
+    let mut haystack = String::with_capacity(text.len());
+    let mut words = Vec::new();
+    // (byte start, char start, byte end, char end) of the open word;
+    // the end only moves past letters and numbers, so trailing
+    // joiners are left out.
+    let mut open: Option<(usize, usize, usize, usize)> = None;
+    for (pos, (byte, ch)) in text.char_indices().enumerate() {
+        if ch.is_alphanumeric() {
+            let end = (byte + ch.len_utf8(), pos + 1);
+            open = match open {
+                Some((b, c, _, _)) => Some((b, c, end.0, end.1)),
+                None => Some((byte, pos, end.0, end.1)),
+            };
+        } else if open.is_some() && JOINERS.contains(&ch) {
+            continue;
+        } else if let Some((b, c, be, ce)) = open.take() {
+            push_word(&mut haystack, &mut words, &text[b..be], c, ce);
+        }
+    }
+    if let Some((b, c, be, ce)) = open {
+        push_word(&mut haystack, &mut words, &text[b..be], c, ce);
+    }
+    (haystack, words)
+}
+
+/// Every territory name mentioned in `text`, left to right and
+/// non-overlapping; at each position the longest name wins.
+pub fn find_territories(text: &str) -> Vec<Mention> {
+    let (haystack, words) = split_words(text);
+    let mut mentions = Vec::new();
+    for m in NEEDLES.find_iter(&haystack) {
+        let first = words.binary_search_by_key(&m.start, |w| w.norm_start);
+        let last = words.binary_search_by_key(&m.end, |w| w.norm_end);
+        // A name can end inside a word whose normal form has a space
+        // in it ("irán" → "ira n"); those don't count.
+        let (Ok(first), Ok(last)) = (first, last) else {
+            continue;
+        };
+        let territory = m.payload.territory;
+        // The longest name can be a weak one wrapped around a strong
+        // one ("the united states of america"); it is as good a
+        // mention as the strong name it contains.
+        let strong = m.payload.strong
+            || NEEDLES
+                .find_overlapping(m.matched)
+                .iter()
+                .any(|n| n.payload.strong && n.payload.territory == territory);
+        mentions.push(Mention {
+            start: words[first].start,
+            end: words[last].end,
+            territory,
+            strong,
+        });
+    }
+    mentions
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn codes(text: &str) -> Vec<(String, &'static str, bool)> {
+        let chars: Vec<char> = text.chars().collect();
+        find_territories(text)
+            .into_iter()
+            .map(|m| {
+                let span: String = chars[m.start..m.end].iter().collect();
+                let code = index().records[m.territory].code.as_str();
+                (span, code, m.strong)
+            })
+            .collect()
+    }
+
+    #[test]
+    fn finds_names() {
+        assert_eq!(
+            codes("Bahnhofstr. 10, 86150 Augsburg, Germany"),
+            vec![("Germany".to_string(), "de", true)]
+        );
+        let found = codes("Trade between the United States of America and Iran.");
+        assert_eq!(
+            found[0],
+            ("the United States of America".to_string(), "us", true)
+        );
+        assert_eq!(found[1], ("Iran".to_string(), "ir", true));
+    }
+
+    #[test]
+    fn joined_words() {
+        let found = codes("Shipped to the U.S.A. from Guinea-Bissau");
+        assert_eq!(found[0], ("U.S.A".to_string(), "us", true));
+        assert_eq!(found[1], ("Guinea-Bissau".to_string(), "gw", true));
+    }
+
+    #[test]
+    fn names_split_like_text() {
+        // The weak name "BIRMANIE/MYANMAR" wraps the strong "Myanmar".
+        assert_eq!(
+            codes("Shipped from Birmanie/Myanmar"),
+            vec![("Birmanie/Myanmar".to_string(), "mm", true)]
+        );
+    }
+
+    #[test]
+    fn word_boundaries() {
+        assert!(codes("Germanyfoo 12").is_empty());
+        assert!(codes("").is_empty());
+        assert!(codes("...").is_empty());
+        // Offsets count characters, not bytes.
+        let found = codes("Straße 5, 10117 Berlin, Deutschland");
+        assert_eq!(found.last().unwrap().0, "Deutschland");
+    }
+}
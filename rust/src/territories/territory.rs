@@ -0,0 +1,424 @@
+//! The [`Territory`] pyclass — one entry of the territory index, as
+//! seen from Python.
+//!
+//! One object per territory is built the first time the index is
+//! asked for and lives for the rest of the process. Every field is
+//! converted to its Python form at that point: strings are interned
+//! `PyString`s, `codes` / `qids` are cached `frozenset`s and the
+//! `to_dict()` form is prepared up front, so attribute access is a
+//! reference-count bump rather than a parent-chain walk or a fresh
+//! allocation. References to other territories (`parent`, `claims`,
+//! …) are record indices into the shared object table.
+
+use pyo3::basic::CompareOp;
+use pyo3::exceptions::PyAttributeError;
+use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PyFrozenSet, PyList, PySet, PyString, PyTuple};
+
+use crate::parallel;
+use crate::territories::hierarchy::Bitset;
+use crate::territories::index::{Record, index};
+use crate::territories::mentions::{Mention, find_territories};
+
+/// A territory - country, sub-national, historic, or supranational.
+#[pyclass(frozen, module = "rigour._core")]
+pub struct Territory {
+    id: usize,
+    #[pyo3(get)]
+    code: Py<PyString>,
+    #[pyo3(get)]
+    name: Py<PyString>,
+    #[pyo3(get)]
+    full_name: Py<PyString>,
+    #[pyo3(get)]
+    alpha3: Option<Py<PyString>>,
+    #[pyo3(get)]
+    is_country: bool,
+    #[pyo3(get)]
+    is_ftm: bool,
+    #[pyo3(get)]
+    is_jurisdiction: bool,
+    #[pyo3(get)]
+    is_historical: bool,
+    #[pyo3(get)]
+    qid: Py<PyString>,
+    /// All QIDs linked to the territory.
+    #[pyo3(get)]
+    qids: Py<PyFrozenSet>,
+    /// All codes linked to the territory: its own, `alpha3` and
+    /// `other_codes`.
+    #[pyo3(get)]
+    codes: Py<PyFrozenSet>,
+    /// Global region name, inherited from the parent if unset.
+    #[pyo3(get)]
+    region: Option<Py<PyString>>,
+    /// Subregion name, inherited from the parent if unset.
+    #[pyo3(get)]
+    subregion: Option<Py<PyString>>,
+    /// Name to use in a sentence.
+    #[pyo3(get)]
+    in_sentence: Py<PyString>,
+    /// FtM country code: the territory's own code if it is an FtM
+    /// country, otherwise its parent's.
+    #[pyo3(get)]
+    ftm_country: Option<Py<PyString>>,
+    #[pyo3(get, name = "_region")]
+    own_region: Option<Py<PyString>>,
+    #[pyo3(get, name = "_subregion")]
+    own_subregion: Option<Py<PyString>>,
+    #[pyo3(get, name = "_in_sentence")]
+    own_in_sentence: Option<Py<PyString>>,
+    other_qids: Py<PyTuple>,
+    other_codes: Py<PyTuple>,
+    langs: Py<PyTuple>,
+    /// `to_dict()` template; list values are stored as tuples and
+    /// copied out on each call.
+    dict: Py<PyDict>,
+}
+
+static OBJECTS: PyOnceLock<Vec<Py<Territory>>> = PyOnceLock::new();
+
+fn pystr(py: Python<'_>, s: &str) -> Py<PyString> {
+    PyString::intern(py, s).unbind()
+}
+
+fn opt_pystr(py: Python<'_>, s: &Option<String>) -> Option<Py<PyString>> {
+    s.as_deref().map(|s| pystr(py, s))
+}
+
+fn str_tuple(py: Python<'_>, items: &[String]) -> PyResult<Py<PyTuple>> {
+    Ok(PyTuple::new(py, items.iter().map(|s| pystr(py, s)))?.unbind())
+}
+
+fn build_one(py: Python<'_>, id: usize, r: &Record) -> PyResult<Territory> {
+    let records = &index().records;
+    let code = pystr(py, &r.code);
+    let qids = PyFrozenSet::new(
+        py,
+        r.other_qids
+            .iter()
+            .chain(std::iter::once(&r.qid))
+            .map(|s| pystr(py, s)),
+    )?;
+    let codes = PyFrozenSet::new(
+        py,
+        r.other_codes
+            .iter()
+            .chain(std::iter::once(&r.code))
+            .chain(r.alpha3.iter())
+            .map(|s| pystr(py, s)),
+    )?;
+    let ref_codes =
+        |ids: &[usize]| -> Vec<String> { ids.iter().map(|&i| records[i].code.clone()).collect() };
+
+    // Same keys, in the same order, as the former Python `to_dict`.
+    let dict = PyDict::new(py);
+    dict.set_item("code", &code)?;
+    dict.set_item("name", &r.name)?;
+    dict.set_item("full_name", &r.full_name)?;
+    dict.set_item("alpha3", &r.alpha3)?;
+    dict.set_item("is_country", r.is_country)?;
+    dict.set_item("is_ftm", r.is_ftm)?;
+    dict.set_item("ftm_country", &r.ftm_country)?;
+    dict.set_item("is_jurisdiction", r.is_jurisdiction)?;
+    dict.set_item("is_historical", r.is_historical)?;
+    dict.set_item("qid", &r.qid)?;
+    dict.set_item("qids", PyTuple::new(py, qids.iter())?)?;
+    dict.set_item("codes", PyTuple::new(py, codes.iter())?)?;
+    if let Some(parent) = r.parent {
+        dict.set_item("parent", &records[parent].code)?;
+    }
+    if let Some(region) = &r.own_region {
+        dict.set_item("region", region)?;
+    }
+    if let Some(subregion) = &r.own_subregion {
+        dict.set_item("subregion", subregion)?;
+    }
+    if let Some(in_sentence) = &r.own_in_sentence {
+        dict.set_item("in_sentence", in_sentence)?;
+    }
+    for (key, ids) in [
+        ("successors", &r.successors),
+        ("claims", &r.claims),
+        ("see", &r.see),
+    ] {
+        if !ids.is_empty() {
+            dict.set_item(key, str_tuple(py, &ref_codes(ids))?)?;
+        }
+    }
+    if !r.langs.is_empty() {
+        dict.set_item("langs", str_tuple(py, &r.langs)?)?;
+    }
+
+    Ok(Territory {
+        id,
+        code,
+        name: pystr(py, &r.name),
+        full_name: pystr(py, &r.full_name),
+        alpha3: opt_pystr(py, &r.alpha3),
+        is_country: r.is_country,
+        is_ftm: r.is_ftm,
+        is_jurisdiction: r.is_jurisdiction,
+        is_historical: r.is_historical,
+        qid: pystr(py, &r.qid),
+        qids: qids.unbind(),
+        codes: codes.unbind(),
+        region: opt_pystr(py, &r.region),
+        subregion: opt_pystr(py, &r.subregion),
+        in_sentence: pystr(py, r.in_sentence()),
+        ftm_country: opt_pystr(py, &r.ftm_country),
+        own_region: opt_pystr(py, &r.own_region),
+        own_subregion: opt_pystr(py, &r.own_subregion),
+        own_in_sentence: opt_pystr(py, &r.own_in_sentence),
+        other_qids: str_tuple(py, &r.other_qids)?,
+        other_codes: str_tuple(py, &r.other_codes)?,
+        langs: str_tuple(py, &r.langs)?,
+        dict: dict.unbind(),
+    })
+}
+
+/// The `Territory` objects, one per record in index order, built on
+/// first use.
+pub fn objects(py: Python<'_>) -> PyResult<&'static [Py<Territory>]> {
+    let objects = OBJECTS.get_or_try_init(py, || {
+        // Parsing the JSONL needs no Python state.
+        let records = &py.detach(index).records;
+        records
+            .iter()
+            .enumerate()
+            .map(|(id, r)| Py::new(py, build_one(py, id, r)?))
+            .collect::<PyResult<Vec<_>>>()
+    })?;
+    Ok(objects)
+}
+
+fn territory_list(py: Python<'_>, ids: &[usize]) -> PyResult<Vec<Py<Territory>>> {
+    let objects = objects(py)?;
+    Ok(ids.iter().map(|&i| objects[i].clone_ref(py)).collect())
+}
+
+impl Territory {
+    fn record(&self) -> &'static Record {
+        &index().records[self.id]
+    }
+}
+
+#[pymethods]
+impl Territory {
+    /// The governing territory.
+    #[getter]
+    fn parent(&self, py: Python<'_>) -> PyResult<Option<Py<Territory>>> {
+        match self.record().parent {
+            Some(parent) => Ok(Some(objects(py)?[parent].clone_ref(py))),
+            None => Ok(None),
+        }
+    }
+
+    /// Successor territories.
+    #[getter]
+    fn successors(&self, py: Python<'_>) -> PyResult<Vec<Py<Territory>>> {
+        territory_list(py, &self.record().successors)
+    }
+
+    /// Territories with a contested claim on this one.
+    #[getter]
+    fn claims(&self, py: Python<'_>) -> PyResult<Vec<Py<Territory>>> {
+        territory_list(py, &self.record().claims)
+    }
+
+    /// Related territories.
+    #[getter]
+    fn see(&self, py: Python<'_>) -> PyResult<Vec<Py<Territory>>> {
+        territory_list(py, &self.record().see)
+    }
+
+    #[getter]
+    fn other_qids<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        PyList::new(py, self.other_qids.bind(py).iter())
+    }
+
+    #[getter]
+    fn other_codes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        PyList::new(py, self.other_codes.bind(py).iter())
+    }
+
+    /// Languages of the territory, inherited from the parent if
+    /// unset.
+    #[getter]
+    fn langs<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        PyList::new(py, self.langs.bind(py).iter())
+    }
+
+    /// A dictionary (JSON-ready) representation of the territory.
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let out = self.dict.bind(py).copy()?;
+        for (key, value) in self.dict.bind(py).iter() {
+            if let Ok(items) = value.cast::<PyTuple>() {
+                out.set_item(key, PyList::new(py, items.iter())?)?;
+            }
+        }
+        Ok(out)
+    }
+
+    /// Ordered and compared by `code`, against anything that has
+    /// one; compares unequal (and sorts after) anything else.
+    fn __richcmp__(&self, other: &Bound<'_, PyAny>, op: CompareOp) -> PyResult<bool> {
+        let py = other.py();
+        let other_code = match other.getattr(pyo3::intern!(py, "code")) {
+            Ok(code) => Some(code),
+            Err(err) if err.is_instance_of::<PyAttributeError>(py) => None,
+            Err(err) => return Err(err),
+        };
+        let code = self.code.bind(py);
+        let (eq, le) = match &other_code {
+            Some(other) => (code.as_any().eq(other)?, code.as_any().le(other)?),
+            None => (false, true),
+        };
+        Ok(match op {
+            CompareOp::Eq => eq,
+            CompareOp::Ne => !eq,
+            CompareOp::Le => le,
+            CompareOp::Lt => le && !eq,
+            CompareOp::Gt => !le,
+            CompareOp::Ge => !le || eq,
+        })
+    }
+
+    fn __hash__(&self, py: Python<'_>) -> PyResult<isize> {
+        self.code.bind(py).hash()
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> PyResult<String> {
+        Ok(format!("<Territory({})>", self.code.bind(py).repr()?))
+    }
+
+    /// Pickle support: restored by code from the receiving process's
+    /// own index.
+    fn __reduce__<'py>(&self, py: Python<'py>) -> PyResult<(Bound<'py, PyAny>, (Py<PyString>,))> {
+        let lookup = py.import("rigour._core")?.getattr("territory_by_code")?;
+        Ok((lookup, (self.code.clone_ref(py),)))
+    }
+}
+
+/// The index dict: every code and alias → its `Territory`. A fresh
+/// dict per call; `rigour.territories.territory.get_index` caches it.
+#[pyfunction]
+#[pyo3(name = "territory_index")]
+pub fn py_territory_index(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let objects = objects(py)?;
+    let dict = PyDict::new(py);
+    for (code, id) in index().assignments() {
+        dict.set_item(pystr(py, code), &objects[id])?;
+    }
+    Ok(dict)
+}
+
+/// The territory with exactly this code or alias (no cleaning).
+#[pyfunction]
+#[pyo3(name = "territory_by_code")]
+pub fn py_territory_by_code(py: Python<'_>, code: &str) -> PyResult<Option<Py<Territory>>> {
+    let objects = objects(py)?;
+    Ok(index()
+        .by_code
+        .get(code)
+        .map(|&id| objects[id].clone_ref(py)))
+}
+
+fn code_set<'py>(py: Python<'py>, set: &Bitset) -> PyResult<Bound<'py, PySet>> {
+    let records = &index().records;
+    PySet::new(py, set.iter().map(|i| records[i].code.as_str()))
+}
+
+/// Codes common to both lists through parent and claim relations;
+/// see `rigour.territories.match.territories_intersect`.
+#[pyfunction]
+#[pyo3(name = "territories_intersect")]
+pub fn py_territories_intersect<'py>(
+    py: Python<'py>,
+    left: Vec<String>,
+    right: Vec<String>,
+) -> PyResult<Bound<'py, PySet>> {
+    let common = py.detach(|| {
+        let index = index();
+        let h = &index.hierarchy;
+        h.intersect(&h.set_of(index, &left), &h.set_of(index, &right))
+    });
+    code_set(py, &common)
+}
+
+/// `territories_intersect(query, c)` for each `c` in `candidates`.
+#[pyfunction]
+#[pyo3(name = "territories_intersect_batch")]
+pub fn py_territories_intersect_batch<'py>(
+    py: Python<'py>,
+    query: Vec<String>,
+    candidates: Vec<Vec<String>>,
+) -> PyResult<Vec<Bound<'py, PySet>>> {
+    let common = py.detach(|| {
+        let index = index();
+        let h = &index.hierarchy;
+        let cands: Vec<Bitset> = candidates.iter().map(|c| h.set_of(index, c)).collect();
+        h.intersect_many(&h.set_of(index, &query), &cands)
+    });
+    common.iter().map(|set| code_set(py, set)).collect()
+}
+
+/// Whether `code` is `ancestor` or lies beneath it; `False` if
+/// either is unknown.
+#[pyfunction]
+#[pyo3(name = "territory_is_within")]
+pub fn py_territory_is_within(code: &str, ancestor: &str) -> bool {
+    let index = index();
+    match (index.by_code.get(code), index.by_code.get(ancestor)) {
+        (Some(&id), Some(&anc)) => index.hierarchy.is_within(id, anc),
+        _ => false,
+    }
+}
+
+/// Every territory beneath `code`, at any depth, in index order.
+#[pyfunction]
+#[pyo3(name = "territory_descendants")]
+pub fn py_territory_descendants(py: Python<'_>, code: &str) -> PyResult<Vec<Py<Territory>>> {
+    let index = index();
+    match index.by_code.get(code) {
+        Some(&id) => {
+            let ids: Vec<usize> = index.hierarchy.descendants(id).iter().collect();
+            territory_list(py, &ids)
+        }
+        None => Ok(Vec::new()),
+    }
+}
+
+/// `(start, end, territory, strong)` per mention.
+type MentionTuple = (usize, usize, Py<Territory>, bool);
+
+fn mention_tuples(py: Python<'_>, mentions: &[Mention]) -> PyResult<Vec<MentionTuple>> {
+    let objects = objects(py)?;
+    Ok(mentions
+        .iter()
+        .map(|m| (m.start, m.end, objects[m.territory].clone_ref(py), m.strong))
+        .collect())
+}
+
+/// Territory names mentioned in `text`; see
+/// `rigour.territories.find_territories`.
+#[pyfunction]
+#[pyo3(name = "find_territories")]
+pub fn py_find_territories(py: Python<'_>, text: &str) -> PyResult<Vec<MentionTuple>> {
+    let mentions = py.detach(|| find_territories(text));
+    mention_tuples(py, &mentions)
+}
+
+/// `find_territories` for each text, with the GIL released.
+#[pyfunction]
+#[pyo3(name = "find_territories_batch", signature = (texts, threads = None))]
+pub fn py_find_territories_batch(
+    py: Python<'_>,
+    texts: Vec<String>,
+    threads: Option<usize>,
+) -> PyResult<Vec<Vec<MentionTuple>>> {
+    let threads = threads.unwrap_or_else(parallel::default_threads);
+    let mentions = py.detach(|| parallel::map_ordered(&texts, threads, |t| find_territories(t)));
+    mentions.iter().map(|ms| mention_tuples(py, ms)).collect()
+}
@@ -0,0 +1,420 @@
+// `normalize_address` — the comparison key behind
+// `rigour.addresses.normalize_address`: casefold, split into tokens on
+// Unicode General Category, optionally latinize each token, rejoin
+// with single spaces.
+//
+// Category mapping (`TOKEN_SEP_CATEGORIES` in the former Python
+// implementation — close to `tokenize_name`'s, but Mc separates tokens
+// here, and there are no skip / keep character lists):
+//
+//   Whitespace (token separator): Cc, Mc, Zs, Zl, Zp, Pc, Pd, Ps, Pe,
+//                                 Pi, Pf, Po, Sm, So
+//   Delete:                       Cf, Co, Cn, Lm, Mn, Me, No, Sc, Sk
+//   Keep:                         everything else (L*, Nd, Nl)
+//
+// `&` and `№` are always kept, whatever their category.
+//
+// ASCII input — the bulk of real addresses — never touches the ICU
+// tables: the category of every ASCII character is fixed, so it is a
+// single byte loop.
+//
+// ## Keyword replacer
+//
+// `shorten_address_keywords` / `remove_address_keywords` run on a
+// `Needles<Keyword>` automaton (Aho-Corasick + Python-style
+// `(?<!\w)X(?!\w)` boundaries, leftmost-longest) built from, in this
+// order, later entries overwriting earlier ones:
+//
+//   1. `rust/data/addresses/forms.json` (generated from
+//      resources/addresses/forms.yml by genscripts/generate_addresses.py):
+//      each form → its target, and the target → itself;
+//   2. the ordinals: each form → the number;
+//   3. every strong name, name and full name of each territory → the
+//      last segment of its code ("ir", "ae", "ca" for "us-ca").
+//
+// Each replacement carries the table it came from (`KeywordKind`);
+// `address_compare.rs` weighs tokens by it.
+//
+// All keys and targets go through `normalize_address(_, latinize, 1)`
+// so they line up with a pre-normalised haystack. Territory names are
+// never latinized: that leads to too much ambiguity ("Shanxi" and
+// "Shaanxi" in China). One automaton per `latinize` flag, built on
+// first use and kept for the life of the process.
+//
+// The regex this replaces matched with `re.I`, so a haystack that
+// isn't lowercase yet still finds its keywords. As there, each
+// character is simple-casefolded on its own, one character in and one
+// out ("STRAßE" stays "straße", which no key is); ASCII input is left
+// to the automaton's own case folding. Matches are mapped back to the
+// original text, which is otherwise kept as it was. `shorten` then
+// looks the match up lowercased, as the regex callback did, and keeps
+// a match whose lowercase form isn't the key it matched as it is.
+
+use std::collections::HashMap;
+use std::sync::LazyLock;
+
+use icu::casemap::CaseMapper;
+use icu::properties::{CodePointMapData, props::GeneralCategory};
+use serde::Deserialize;
+
+use crate::names::matcher::Needles;
+use crate::territories::index::index;
+use crate::text::normalize::{CharAction, casefold};
+use crate::text::ordinals::ordinals;
+use crate::text::translit::maybe_ascii;
+
+/// Kept regardless of category (Po and So respectively).
+const ALLOWED_CHARS: &[char] = &['&', '№'];
+
+fn category_action(cat: GeneralCategory) -> CharAction {
+    use GeneralCategory::*;
+    match cat {
+        Control | SpacingMark => CharAction::Whitespace, // Cc/Mc
+        SpaceSeparator | LineSeparator | ParagraphSeparator => CharAction::Whitespace, // Zs/Zl/Zp
+        ConnectorPunctuation | DashPunctuation | OpenPunctuation | ClosePunctuation
+        | InitialPunctuation | FinalPunctuation | OtherPunctuation => CharAction::Whitespace, // Pc/Pd/Ps/Pe/Pi/Pf/Po
+        MathSymbol | OtherSymbol => CharAction::Whitespace, // Sm/So
+        Format | PrivateUse | Unassigned => CharAction::Delete, // Cf/Co/Cn
+        ModifierLetter | NonspacingMark | EnclosingMark => CharAction::Delete, // Lm/Mn/Me
+        OtherNumber => CharAction::Delete,                  // No
+        CurrencySymbol | ModifierSymbol => CharAction::Delete, // Sc/Sk
+        _ => CharAction::Keep,
+    }
+}
+
+/// The same mapping for ASCII: `$` (Sc), `^` and `` ` `` (Sk) are
+/// deleted, every other non-alphanumeric separates tokens.
+fn ascii_action(b: u8) -> CharAction {
+    match b {
+        b'a'..=b'z' | b'A'..=b'Z' | b'0'..=b'9' | b'&' => CharAction::Keep,
+        b'$' | b'^' | b'`' => CharAction::Delete,
+        _ => CharAction::Whitespace,
+    }
+}
+
+fn normalize_ascii(address: &str) -> String {
+    let mut out = String::with_capacity(address.len());
+    let mut pending_space = false;
+    for b in address.bytes() {
+        match ascii_action(b) {
+            CharAction::Keep => {
+                if pending_space && !out.is_empty() {
+                    out.push(' ');
+                }
+                pending_space = false;
+                out.push(b.to_ascii_lowercase() as char);
+            }
+            CharAction::Delete => {}
+            CharAction::Whitespace => pending_space = true,
+        }
+    }
+    out
+}
+
+fn normalize_unicode(address: &str, latinize: bool) -> String {
+    let gc = CodePointMapData::<GeneralCategory>::new();
+    let folded = casefold(address);
+    let mut tokens: Vec<String> = Vec::new();
+    let mut token = String::new();
+    for ch in folded.chars() {
+        let action = if ch.is_ascii_alphanumeric() || ALLOWED_CHARS.contains(&ch) {
+            CharAction::Keep
+        } else {
+            category_action(gc.get(ch))
+        };
+        match action {
+            CharAction::Keep => token.push(ch),
+            CharAction::Delete => {}
+            CharAction::Whitespace => {
+                if !token.is_empty() {
+                    tokens.push(std::mem::take(&mut token));
+                }
+            }
+        }
+    }
+    if !token.is_empty() {
+        tokens.push(token);
+    }
+    if latinize {
+        tokens = tokens
+            .into_iter()
+            .map(|t| maybe_ascii(&t, false))
+            .filter(|t| !t.is_empty())
+            .collect();
+    }
+    tokens.join(" ")
+}
+
+/// Comparison key for an address: a flat, lowercase, single-spaced
+/// token sequence, or `None` if shorter than `min_length` characters.
+/// With `latinize`, tokens in a script `maybe_ascii` admits are
+/// transliterated to ASCII; others are kept as they are.
+pub fn normalize_address(address: &str, latinize: bool, min_length: usize) -> Option<String> {
+    let out = if address.is_ascii() {
+        normalize_ascii(address)
+    } else {
+        normalize_unicode(address, latinize)
+    };
+    if out.chars().count() < min_length {
+        return None;
+    }
+    Some(out)
+}
+
+#[derive(Debug, Deserialize)]
+struct FormSpec {
+    target: String,
+    forms: Vec<String>,
+}
+
+const FORMS_JSON: &str = include_str!("../../data/addresses/forms.json");
+
+/// Which table a keyword replacement came from.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum KeywordKind {
+    Form,
+    Ordinal,
+    Territory,
+}
+
+/// The replacement for a matched keyword.
+pub struct Keyword {
+    pub text: String,
+    pub kind: KeywordKind,
+}
+
+fn build_replacer(latinize: bool) -> Needles<Keyword> {
+    let specs: Vec<FormSpec> =
+        serde_json::from_str(FORMS_JSON).expect("rust/data/addresses/forms.json parses");
+    let ordinals = ordinals()
+        .iter()
+        .map(|o| (o.number.to_string(), &o.forms, KeywordKind::Ordinal));
+    let forms = specs
+        .iter()
+        .map(|s| (s.target.clone(), &s.forms, KeywordKind::Form))
+        .chain(ordinals);
+
+    let mut mapping: HashMap<String, Keyword> = HashMap::new();
+    let keyword = |text: &str, kind| Keyword {
+        text: text.to_string(),
+        kind,
+    };
+    for (target, values, kind) in forms {
+        let Some(target_norm) = normalize_address(&target, latinize, 1) else {
+            continue;
+        };
+        mapping.insert(target_norm.clone(), keyword(&target_norm, kind));
+        for value in values {
+            let Some(value_norm) = normalize_address(value, latinize, 1) else {
+                continue;
+            };
+            if value_norm != target_norm {
+                mapping.insert(value_norm, keyword(&target_norm, kind));
+            }
+        }
+    }
+
+    // Weak names are left out, they cause too many false positives.
+    let index = index();
+    for record in &index.records {
+        // Resolved through the code index, as the Python-side lookup
+        // tables are: an alias can shadow a primary code.
+        let Some(territory) = index.get(&record.code) else {
+            continue;
+        };
+        let target = territory.code.rsplit('-').next().unwrap_or_default();
+        let names = record
+            .names_strong
+            .iter()
+            .chain([&territory.name, &territory.full_name]);
+        for name in names {
+            if let Some(name_norm) = normalize_address(name, false, 1) {
+                mapping.insert(name_norm, keyword(target, KeywordKind::Territory));
+            }
+        }
+    }
+    Needles::build(mapping)
+}
+
+static REPLACER: LazyLock<Needles<Keyword>> = LazyLock::new(|| build_replacer(false));
+static REPLACER_LATIN: LazyLock<Needles<Keyword>> = LazyLock::new(|| build_replacer(true));
+
+/// The keyword automaton for the given `latinize` flag.
+pub(crate) fn replacer(latinize: bool) -> &'static Needles<Keyword> {
+    if latinize { &REPLACER_LATIN } else { &REPLACER }
+}
+
+/// Build both keyword replacers, so the first call doesn't pay for it.
+pub fn preload() {
+    LazyLock::force(&REPLACER);
+    LazyLock::force(&REPLACER_LATIN);
+}
+
+/// `address` with every character simple-casefolded, and the byte
+/// offset in `address` of each folded byte's source character (plus
+/// one trailing entry for the end). `None` if folding changes nothing.
+fn fold_with_offsets(address: &str) -> Option<(String, Vec<usize>)> {
+    let mapper = CaseMapper::new();
+    if address.is_ascii() || address.chars().all(|ch| mapper.simple_fold(ch) == ch) {
+        return None;
+    }
+    let mut folded = String::with_capacity(address.len());
+    let mut origin: Vec<usize> = Vec::with_capacity(address.len() + 1);
+    for (i, ch) in address.char_indices() {
+        folded.push(mapper.simple_fold(ch));
+        origin.resize(folded.len(), i);
+    }
+    origin.push(address.len());
+    Some((folded, origin))
+}
+
+/// Rebuild `address` with each keyword match replaced by what `push`
+/// appends for it, given the keyword, the matched original text and
+/// the key it matched. Matching is case-insensitive; see the header.
+fn replace_keywords(
+    address: &str,
+    latinize: bool,
+    mut push: impl FnMut(&mut String, &Keyword, &str, &str),
+) -> String {
+    let needles = replacer(latinize);
+    let folded = fold_with_offsets(address);
+    let (haystack, origin) = match &folded {
+        Some((text, origin)) => (text.as_str(), Some(origin)),
+        None => (address, None),
+    };
+    let mut out = String::with_capacity(address.len());
+    let mut cursor = 0;
+    for m in needles.find_iter(haystack) {
+        let (start, end) = match origin {
+            Some(origin) => (origin[m.start], origin[m.end]),
+            None => (m.start, m.end),
+        };
+        out.push_str(&address[cursor..start]);
+        push(&mut out, m.payload, &address[start..end], m.matched);
+        cursor = end;
+    }
+    out.push_str(&address[cursor..]);
+    out
+}
+
+/// Replace recognised address keywords in a pre-normalised address
+/// with their short form ("street" → "st", "united arab emirates" →
+/// "ae"). Everything outside a match is kept verbatim.
+pub fn shorten_address_keywords(address: &str, latinize: bool) -> String {
+    replace_keywords(address, latinize, |out, keyword, original, key| {
+        if original.to_lowercase() == key {
+            out.push_str(&keyword.text);
+        } else {
+            out.push_str(original);
+        }
+    })
+}
+
+/// Replace every recognised address keyword in a pre-normalised
+/// address with `replacement`. Whitespace is not collapsed.
+pub fn remove_address_keywords(address: &str, latinize: bool, replacement: &str) -> String {
+    replace_keywords(address, latinize, |out, _, _, _| out.push_str(replacement))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn n(address: &str) -> Option<String> {
+        normalize_address(address, false, 4)
+    }
+
+    #[test]
+    fn ascii_addresses() {
+        assert_eq!(
+            n("Bahnhofstr. 10, 86150 Augsburg, Germany").as_deref(),
+            Some("bahnhofstr 10 86150 augsburg germany")
+        );
+        assert_eq!(
+            n("160 Broad` St, Birmingham B15 1DT").as_deref(),
+            Some("160 broad st birmingham b15 1dt")
+        );
+        assert_eq!(n("  A & B $5 ^x  ").as_deref(), Some("a & b 5 x"));
+        assert_eq!(n("hey"), None);
+        assert_eq!(n(""), None);
+        assert_eq!(n("h e"), None);
+        assert_eq!(normalize_address("h e", false, 1).as_deref(), Some("h e"));
+    }
+
+    #[test]
+    fn unicode_addresses() {
+        assert_eq!(
+            n("Д.127, АМУРСКАЯ, АМУРСКАЯ, 675000").as_deref(),
+            Some("д 127 амурская амурская 675000")
+        );
+        assert_eq!(
+            normalize_address("Д.127, АМУРСКАЯ, АМУРСКАЯ, 675000", true, 4).as_deref(),
+            Some("d 127 amurskaa amurskaa 675000")
+        );
+        assert_eq!(n("Straße № 5").as_deref(), Some("strasse № 5"));
+        // Combining marks are deleted, not split on.
+        assert_eq!(n("Cafe\u{301} 1€").as_deref(), Some("cafe 1"));
+    }
+
+    #[test]
+    fn ascii_path_matches_category_table() {
+        let gc = CodePointMapData::<GeneralCategory>::new();
+        for b in 0u8..=127 {
+            let ch = b as char;
+            let expected = if ch.is_ascii_alphanumeric() || ALLOWED_CHARS.contains(&ch) {
+                CharAction::Keep
+            } else {
+                category_action(gc.get(ch))
+            };
+            assert_eq!(
+                std::mem::discriminant(&ascii_action(b)),
+                std::mem::discriminant(&expected),
+                "{ch:?}"
+            );
+        }
+    }
+
+    fn shorten(address: &str) -> String {
+        shorten_address_keywords(&n(address).unwrap(), false)
+    }
+
+    #[test]
+    fn shortens_keywords() {
+        assert_eq!(
+            shorten("160 Broad Street, Birmingham B15 1DT"),
+            "160 broad st birmingham b15 1dt"
+        );
+        assert_eq!(
+            shorten("New York Street, New York, NY 10001"),
+            "ny st ny 10001"
+        );
+        // Multi-token territory names win over their components.
+        assert_eq!(shorten("Islamic Republic of Iran"), "ir");
+        assert_eq!(shorten("United Arab Emirates"), "ae");
+        // No match inside a word.
+        assert_eq!(shorten("Kiran Lake"), "kiran lake");
+        assert_eq!(shorten("Biranian Street"), "biranian st");
+    }
+
+    #[test]
+    fn removes_keywords() {
+        let address = n("Marlborough House, Pall Mall, London SW1Y 5HX").unwrap();
+        assert_eq!(
+            remove_address_keywords(&address, false, " "),
+            "marlborough   pall mall london sw1y 5hx"
+        );
+        assert_eq!(remove_address_keywords("", false, " "), "");
+    }
+
+    #[test]
+    fn keywords_match_any_case() {
+        assert_eq!(
+            shorten_address_keywords("160 BROAD STREET", false),
+            "160 BROAD st"
+        );
+        assert_eq!(
+            shorten_address_keywords("УЛИЦА Ленина, Дом 5", false),
+            "ul Ленина, d 5"
+        );
+    }
+}
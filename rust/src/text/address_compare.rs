@@ -0,0 +1,261 @@
+// Address comparison and blocking keys — the engine behind
+// `rigour.addresses.compare_addresses` and `address_keys`.
+//
+// Both read the same token stream: the address goes through
+// `normalize_address`, then the keyword automaton of `address.rs`.
+// Text outside a keyword match splits on spaces into plain words; a
+// match becomes its short form ("street" → "st", "germany" → "de"),
+// tagged with the table it came from. Ordinals ("first" → "1") are
+// plain words: they read like house numbers and carry as much weight.
+//
+// ## Comparison
+//
+// A weighted Dice coefficient over the two token sets:
+//
+//   score = Σ_{t ∈ L ∩ R} (w_L(t) + w_R(t)) / (Σ_{t ∈ L} w_L(t) + Σ_{t ∈ R} w_R(t))
+//
+// Plain words weigh 1, shortened keywords `KEYWORD_WEIGHT`, territory
+// codes `TERRITORY_WEIGHT`: sharing "st" or "de" says little, and
+// leaving out the country barely costs anything. A token occurring
+// in several roles in one address takes its highest weight.
+//
+// ## Blocking keys
+//
+// Stable, sorted, de-duplicated strings; two addresses that might be
+// the same place share at least one of them, so candidate pairs come
+// from a sort-merge on keys rather than an all-pairs scan:
+//
+//   p:<token>         postal-code-like: a word with a digit and at
+//                     least four characters ("86150") that doesn't
+//                     read as a house number, or two adjacent
+//                     letter+digit words joined ("sw1y5hx")
+//   n:<number>:<word> a house number with a neighbouring street word
+//   r:<word>          the `RARE_KEYS` longest plain words — length
+//                     stands in for rarity, as no corpus statistics
+//                     are available here
+//
+// Callers should drop oversized blocks (a common city name as `r:`)
+// before pairing.
+
+use crate::text::address::{KeywordKind, normalize_address, replacer};
+
+/// Weight of a shortened address keyword ("st", "apt", "no").
+const KEYWORD_WEIGHT: f64 = 0.2;
+/// Weight of a territory code standing in for a territory name.
+const TERRITORY_WEIGHT: f64 = 0.3;
+/// Number of `r:` keys emitted per address.
+const RARE_KEYS: usize = 2;
+/// Most digits in a house number; longer runs read as postal codes.
+const MAX_HOUSE_DIGITS: usize = 4;
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum TokenKind {
+    Word,
+    Keyword,
+    Territory,
+}
+
+impl TokenKind {
+    fn weight(self) -> f64 {
+        match self {
+            TokenKind::Word => 1.0,
+            TokenKind::Keyword => KEYWORD_WEIGHT,
+            TokenKind::Territory => TERRITORY_WEIGHT,
+        }
+    }
+}
+
+fn push_words(out: &mut Vec<(String, TokenKind)>, text: &str, kind: TokenKind) {
+    for word in text.split_whitespace() {
+        out.push((word.to_string(), kind));
+    }
+}
+
+fn tokens(address: &str, latinize: bool) -> Vec<(String, TokenKind)> {
+    let Some(norm) = normalize_address(address, latinize, 1) else {
+        return Vec::new();
+    };
+    let mut out = Vec::new();
+    let mut cursor = 0;
+    for m in replacer(latinize).find_iter(&norm) {
+        push_words(&mut out, &norm[cursor..m.start], TokenKind::Word);
+        let kind = match m.payload.kind {
+            KeywordKind::Form => TokenKind::Keyword,
+            KeywordKind::Territory => TokenKind::Territory,
+            KeywordKind::Ordinal => TokenKind::Word,
+        };
+        push_words(&mut out, &m.payload.text, kind);
+        cursor = m.end;
+    }
+    push_words(&mut out, &norm[cursor..], TokenKind::Word);
+    out
+}
+
+/// Distinct tokens with their weight, sorted by text.
+fn weighted_set(tokens: Vec<(String, TokenKind)>) -> Vec<(String, f64)> {
+    let mut set: Vec<(String, f64)> = tokens
+        .into_iter()
+        .map(|(text, kind)| (text, kind.weight()))
+        .collect();
+    // Highest weight first within a text, so dedup keeps it.
+    set.sort_by(|a, b| a.0.cmp(&b.0).then(b.1.total_cmp(&a.1)));
+    set.dedup_by(|a, b| a.0 == b.0);
+    set
+}
+
+/// Similarity of two addresses in `[0, 1]`: a weighted Dice
+/// coefficient over their token sets, with address keywords and
+/// territory codes weighing less than other words. Addresses that
+/// normalise to nothing score 0.
+pub fn compare_addresses(left: &str, right: &str, latinize: bool) -> f64 {
+    let left = weighted_set(tokens(left, latinize));
+    let right = weighted_set(tokens(right, latinize));
+    let total: f64 = left.iter().chain(right.iter()).map(|(_, w)| w).sum();
+    if total == 0.0 {
+        return 0.0;
+    }
+    let mut shared = 0.0;
+    let (mut i, mut j) = (0, 0);
+    while i < left.len() && j < right.len() {
+        match left[i].0.cmp(&right[j].0) {
+            std::cmp::Ordering::Less => i += 1,
+            std::cmp::Ordering::Greater => j += 1,
+            std::cmp::Ordering::Equal => {
+                shared += left[i].1 + right[j].1;
+                i += 1;
+                j += 1;
+            }
+        }
+    }
+    shared / total
+}
+
+fn has_digit(token: &str) -> bool {
+    token.chars().any(char::is_numeric)
+}
+
+fn has_letter(token: &str) -> bool {
+    token.chars().any(char::is_alphabetic)
+}
+
+fn is_house_number(token: &str) -> bool {
+    // Digits, optionally followed by a single letter ("10a").
+    let digits = token.strip_suffix(char::is_alphabetic).unwrap_or(token);
+    let count = digits.chars().count();
+    count > 0 && count <= MAX_HOUSE_DIGITS && digits.chars().all(char::is_numeric)
+}
+
+fn is_street_word(token: &str) -> bool {
+    token.chars().count() >= 3 && token.chars().all(char::is_alphabetic)
+}
+
+/// The plain word at `i`, if any.
+fn word(tokens: &[(String, TokenKind)], i: usize) -> Option<&str> {
+    match tokens.get(i) {
+        Some((text, TokenKind::Word)) => Some(text.as_str()),
+        _ => None,
+    }
+}
+
+/// Blocking keys for an address: postal-code-like tokens (`p:`),
+/// house number + street word pairs (`n:`) and the longest plain
+/// words (`r:`). Sorted and de-duplicated.
+pub fn address_keys(address: &str, latinize: bool) -> Vec<String> {
+    let tokens = tokens(address, latinize);
+    let mut keys: Vec<String> = Vec::new();
+    let mut rare: Vec<&str> = Vec::new();
+    for i in 0..tokens.len() {
+        let Some(text) = word(&tokens, i) else {
+            continue;
+        };
+        if has_digit(text) && text.chars().count() >= 4 && !is_house_number(text) {
+            keys.push(format!("p:{text}"));
+        }
+        if has_digit(text) && has_letter(text) {
+            if let Some(next) = word(&tokens, i + 1).filter(|n| has_digit(n) && has_letter(n)) {
+                keys.push(format!("p:{text}{next}"));
+            }
+        }
+        if is_house_number(text) {
+            let before = i.checked_sub(1).and_then(|j| word(&tokens, j));
+            let after = word(&tokens, i + 1);
+            for street in [before, after].into_iter().flatten() {
+                if is_street_word(street) {
+                    keys.push(format!("n:{text}:{street}"));
+                }
+            }
+        }
+        if text.chars().count() >= 4 && text.chars().all(char::is_alphabetic) {
+            rare.push(text);
+        }
+    }
+    rare.sort_by(|a, b| b.chars().count().cmp(&a.chars().count()).then(a.cmp(b)));
+    rare.dedup();
+    keys.extend(rare.into_iter().take(RARE_KEYS).map(|t| format!("r:{t}")));
+    keys.sort();
+    keys.dedup();
+    keys
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn keyword_tokens() {
+        let toks = tokens("160 Broad Street, Birmingham, United Kingdom", false);
+        let kinds: Vec<(&str, TokenKind)> = toks.iter().map(|(t, k)| (t.as_str(), *k)).collect();
+        assert_eq!(
+            kinds,
+            vec![
+                ("160", TokenKind::Word),
+                ("broad", TokenKind::Word),
+                ("st", TokenKind::Keyword),
+                ("birmingham", TokenKind::Word),
+                ("gb", TokenKind::Territory),
+            ]
+        );
+    }
+
+    #[test]
+    fn compare_scores() {
+        let a = "160 Broad Street, Birmingham B15 1DT";
+        assert_eq!(compare_addresses(a, a, false), 1.0);
+        // Spelling out the keyword changes nothing.
+        assert_eq!(
+            compare_addresses(a, "160 Broad St., Birmingham B15 1DT", false),
+            1.0
+        );
+        // A missing country costs little, a different number a lot.
+        let country = compare_addresses(a, "160 Broad St, Birmingham B15 1DT, UK", false);
+        let number = compare_addresses(a, "162 Broad St, Birmingham B15 1DT", false);
+        assert!(country > 0.95, "{country}");
+        assert!(number < country, "{number} < {country}");
+        assert_eq!(compare_addresses("", a, false), 0.0);
+        assert_eq!(compare_addresses("", "", false), 0.0);
+    }
+
+    #[test]
+    fn blocking_keys() {
+        let keys = address_keys("Bahnhofstr. 10, 86150 Augsburg, Germany", false);
+        assert_eq!(
+            keys,
+            ["n:10:bahnhofstr", "p:86150", "r:augsburg", "r:bahnhofstr"]
+        );
+        let keys = address_keys("Pall Mall, London SW1Y 5HX", false);
+        assert!(keys.contains(&"p:sw1y5hx".to_string()), "{keys:?}");
+        assert!(keys.contains(&"p:sw1y".to_string()), "{keys:?}");
+        // Up to MAX_HOUSE_DIGITS digits is a house number, not a postcode.
+        let keys = address_keys("Hauptstrasse 1234a, Wien", false);
+        assert_eq!(
+            keys,
+            [
+                "n:1234a:hauptstrasse",
+                "n:1234a:wien",
+                "r:hauptstrasse",
+                "r:wien"
+            ]
+        );
+        assert!(address_keys("", false).is_empty());
+    }
+}
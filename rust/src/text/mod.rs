@@ -1,6 +1,8 @@
 // Mirrors the `rigour.text.*` Python submodule layout — phonetic and
 // character-level routines that feed into `rigour.text` end up here.
 
+pub mod address;
+pub mod address_compare;
 pub mod distance;
 pub mod normalize;
 pub mod numbers;
@@ -14,6 +14,8 @@
 //
 // Transliteration is NOT part of this pipeline — rigour's public
 // surface is `text::translit::maybe_ascii` (narrow, opportunistic).
+// The one exception is `normalize_territory_name`, a fixed pipeline
+// of its own that latinizes like the Python function it replaces.
 //
 // Empty output → None, matching the Optional[str] contract of the legacy
 // Python normalizers.
@@ -21,9 +23,13 @@
 use bitflags::bitflags;
 use icu::casemap::CaseMapper;
 use icu::normalizer::{ComposingNormalizerBorrowed, DecomposingNormalizerBorrowed};
-use icu::properties::{CodePointMapData, props::GeneralCategory};
+use icu::properties::{
+    CodePointMapData,
+    props::{GeneralCategory, GeneralCategoryGroup},
+};
 
 use crate::text::tokenize::tokenize_name;
+use crate::text::translit::{latinize, should_ascii};
 
 bitflags! {
     // Hash lets `Normalize` be used as part of a HashMap key — see
@@ -235,6 +241,68 @@ pub fn normalize(text: &str, flags: Normalize, cleanup: Cleanup) -> Option<Strin
     if s.is_empty() { None } else { Some(s) }
 }
 
+/// Punctuation dropped outright (not turned into a space) by
+/// [`normalize_territory_name`], so "d'Ivoire" and "U.S." close up.
+const TERRITORY_SKIP_CHARS: &str = ".()[],;:_-/ʻ'’";
+
+/// Highest codepoint `normality.latinize_text` treats as already
+/// Latin (`MAX_LATIN`); text entirely below it skips transliteration.
+const MAX_LATIN: char = '\u{2E4}';
+
+/// Lookup key for territory names; the Rust side of
+/// `rigour.territories.util.normalize_territory_name`.
+///
+/// NFKD, casefold, drop [`TERRITORY_SKIP_CHARS`], turn every other
+/// character that isn't a letter or number (Python `str.isalnum`) into
+/// a space — including the combining marks NFKD split off — then
+/// latinize if every script allows it, NFKC and squash spaces. ASCII
+/// input (most of it) takes a single pass with none of the ICU steps.
+pub fn normalize_territory_name(name: &str) -> String {
+    if name.is_ascii() {
+        let mut out = String::with_capacity(name.len());
+        let mut last_was_space = true;
+        for b in name.bytes() {
+            let ch = b as char;
+            if TERRITORY_SKIP_CHARS.contains(ch) {
+                continue;
+            }
+            if ch.is_ascii_alphanumeric() {
+                out.push(ch.to_ascii_lowercase());
+                last_was_space = false;
+            } else if !last_was_space {
+                out.push(' ');
+                last_was_space = true;
+            }
+        }
+        if out.ends_with(' ') {
+            out.pop();
+        }
+        return out;
+    }
+
+    let decomposed = DecomposingNormalizerBorrowed::new_nfkd().normalize(name);
+    let folded = casefold(&decomposed);
+    let gc = CodePointMapData::<GeneralCategory>::new();
+    let mut filtered = String::with_capacity(folded.len());
+    for ch in folded.chars() {
+        if TERRITORY_SKIP_CHARS.contains(ch) {
+            continue;
+        }
+        let cat = gc.get(ch);
+        if GeneralCategoryGroup::Letter.contains(cat) || GeneralCategoryGroup::Number.contains(cat)
+        {
+            filtered.push(ch);
+        } else {
+            filtered.push(' ');
+        }
+    }
+    if filtered.chars().any(|c| c > MAX_LATIN) && should_ascii(&filtered) {
+        filtered = latinize(&filtered);
+    }
+    let composed = ComposingNormalizerBorrowed::new_nfkc().normalize(&filtered);
+    squash_spaces(&composed)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -592,4 +660,37 @@ mod tests {
             None
         );
     }
+
+    // --- normalize_territory_name ---
+    //
+    // Expected values are the output of the former Python
+    // implementation, quirks included: NFKD-split combining marks
+    // become spaces ("co te"), skip characters close up ("divoire").
+
+    #[test]
+    fn territory_name_ascii() {
+        let n = normalize_territory_name;
+        assert_eq!(n("United States of America"), "united states of america");
+        assert_eq!(n("  U.S.A. "), "usa");
+        assert_eq!(n("Bosnia & Herzegovina"), "bosnia herzegovina");
+        assert_eq!(
+            n("Kyrgyzstan (Kyrgyz Republic)"),
+            "kyrgyzstan kyrgyz republic"
+        );
+        assert_eq!(n(""), "");
+    }
+
+    #[test]
+    fn territory_name_unicode() {
+        let n = normalize_territory_name;
+        assert_eq!(n("Côte d'Ivoire"), "co te divoire");
+        assert_eq!(n("São Tomé and Príncipe"), "sa o tome and pri ncipe");
+        assert_eq!(n("Palestinä"), "palestina");
+        assert_eq!(n("Straße"), "strasse");
+        assert_eq!(n("ʻOahu"), "oahu");
+        assert_eq!(n("Tʼbilisi"), "tʼbilisi");
+        assert_eq!(n("Российская Федерация"), "rossii skaâ federaciâ");
+        assert_eq!(n("Ελλάδα"), "ella da");
+        assert_eq!(n("中华人民共和国"), "中华人民共和国");
+    }
 }
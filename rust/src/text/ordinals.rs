@@ -18,7 +18,7 @@ pub struct OrdinalSpec {
     pub forms: Vec<String>,
 }
 
-const JSON: &str = include_str!("../../data/text/ordinals.json");
+pub(crate) const JSON: &str = include_str!("../../data/text/ordinals.json");
 
 static DATA: LazyLock<Vec<OrdinalSpec>> =
     LazyLock::new(|| serde_json::from_str(JSON).expect("rust/data/text/ordinals.json parses"));
@@ -15,7 +15,7 @@ struct TextStopwords {
     nullplaces: Vec<String>,
 }
 
-const JSON: &str = include_str!("../../data/text/stopwords.json");
+pub(crate) const JSON: &str = include_str!("../../data/text/stopwords.json");
 
 static DATA: LazyLock<TextStopwords> =
     LazyLock::new(|| serde_json::from_str(JSON).expect("rust/data/text/stopwords.json parses"));
@@ -20,6 +20,7 @@ use std::num::NonZeroUsize;
 use std::sync::{LazyLock, Mutex};
 
 use crate::constants::MEMO_LARGE;
+use crate::sharded::{SHARDS, Sharded};
 use crate::text::scripts::text_scripts;
 
 // Script long names admitted by `should_ascii`. Single source of
@@ -212,6 +213,22 @@ fn nfkd_strip_marks(input: &str) -> String {
         .collect()
 }
 
+/// Script-to-Latin transliteration only: the per-script pass of
+/// [`maybe_ascii`] without its ASCII folding, so Latin diacritics
+/// survive ("ё" → "ë"). Scripts outside `LATINIZE_SCRIPTS` pass
+/// through unchanged; callers gate on [`should_ascii`]. Stands in for
+/// `normality.latinize_text` (ICU `Any-Latin`), which dispatches to
+/// the same CLDR per-script transforms.
+pub fn latinize(text: &str) -> String {
+    let mut result = text.to_string();
+    for script in text_scripts(text) {
+        if let Some(locale_id) = locale_for_script(script) {
+            result = transliterate_with(locale_id, result);
+        }
+    }
+    result
+}
+
 /// True iff every distinguishing script in `text` is in
 /// `LATINIZE_SCRIPTS` (Latin, Cyrillic, Greek, Armenian, Georgian,
 /// Hangul). Pure-punct / pure-digit / empty inputs return true
@@ -230,10 +247,16 @@ pub fn should_ascii(text: &str) -> bool {
 // Arabic / etc. inputs skip the script scan too; the `drop` flag is
 // applied at return time, letting both drop modes share one entry
 // (past the admission check the pipeline output doesn't depend on
-// `drop`). Guarded by a Mutex: `py_maybe_ascii` holds the GIL, so
-// stock CPython never contends on it.
-static MAYBE_ASCII_CACHE: LazyLock<Mutex<LruCache<String, Option<String>>>> =
-    LazyLock::new(|| Mutex::new(LruCache::new(NonZeroUsize::new(MEMO_LARGE).unwrap())));
+// `drop`). `py_maybe_ascii` runs with the GIL released, so worker
+// threads share the cache: it's striped over `SHARDS` independently
+// locked LRUs (each `MEMO_LARGE / SHARDS` entries) keyed by input
+// hash, and a lock is only held for the probe or the insert, never
+// across ICU work.
+type AsciiCache = Sharded<Mutex<LruCache<String, Option<String>>>>;
+static MAYBE_ASCII_CACHE: LazyLock<AsciiCache> = LazyLock::new(|| {
+    let per_shard = NonZeroUsize::new(MEMO_LARGE / SHARDS).unwrap();
+    Sharded::new(|| Mutex::new(LruCache::new(per_shard)))
+});
 
 /// If every distinguishing script in `text` is in
 /// `LATINIZE_SCRIPTS`, transliterate to ASCII via a layered pipeline:
@@ -264,7 +287,8 @@ pub fn maybe_ascii(text: &str, drop: bool) -> String {
     if text.is_ascii() {
         return text.to_string();
     }
-    if let Some(cached) = MAYBE_ASCII_CACHE.lock().unwrap().get(text).cloned() {
+    let shard = MAYBE_ASCII_CACHE.shard(text);
+    if let Some(cached) = shard.lock().unwrap().get(text).cloned() {
         return match cached {
             Some(result) => result,
             None if drop => String::new(),
@@ -273,10 +297,7 @@ pub fn maybe_ascii(text: &str, drop: bool) -> String {
     }
     let scripts = text_scripts(text);
     if scripts.iter().any(|s| !LATINIZE_SCRIPTS.contains(s)) {
-        MAYBE_ASCII_CACHE
-            .lock()
-            .unwrap()
-            .put(text.to_string(), None);
+        shard.lock().unwrap().put(text.to_string(), None);
         return if drop {
             String::new()
         } else {
@@ -299,7 +320,7 @@ pub fn maybe_ascii(text: &str, drop: bool) -> String {
     result = nfkd_strip_marks(&result);
     result = transliterate_with(LATIN_ASCII_LOCALE, result);
     result = ascii_fallback(&result);
-    MAYBE_ASCII_CACHE
+    shard
         .lock()
         .unwrap()
         .put(text.to_string(), Some(result.clone()));
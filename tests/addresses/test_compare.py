@@ -0,0 +1,63 @@
+from rigour.addresses import (
+    address_keys,
+    address_keys_batch,
+    compare_addresses,
+    compare_addresses_batch,
+)
+
+
+def test_compare_addresses():
+    addr = "160 Broad Street, Birmingham B15 1DT"
+    assert compare_addresses(addr, addr) == 1.0
+    assert compare_addresses(addr, "160 Broad St., Birmingham B15 1DT") == 1.0
+
+    # Territory names become codes, which weigh little:
+    with_country = compare_addresses(addr, "160 Broad St, Birmingham B15 1DT, UK")
+    assert with_country > 0.95
+    other_number = compare_addresses(addr, "162 Broad St, Birmingham B15 1DT")
+    assert other_number < with_country
+    other_place = compare_addresses(addr, "Bahnhofstr. 10, 86150 Augsburg")
+    assert other_place == 0.0
+
+    assert compare_addresses("", addr) == 0.0
+    assert compare_addresses("", "") == 0.0
+
+    cyrillic = "Д.127, АМУРСКАЯ, АМУРСКАЯ, 675000"
+    latin = "D. 127, Amurskaa, 675000"
+    assert compare_addresses(cyrillic, latin) < 1.0
+    assert compare_addresses(cyrillic, latin, latinize=True) == 1.0
+
+
+def test_compare_addresses_batch():
+    pairs = [
+        ("160 Broad Street, Birmingham", "160 Broad St, Birmingham"),
+        ("160 Broad Street, Birmingham", "Bahnhofstr. 10, 86150 Augsburg"),
+        ("", ""),
+    ]
+    expected = [compare_addresses(a, b) for a, b in pairs]
+    assert compare_addresses_batch(pairs) == expected
+    assert compare_addresses_batch([]) == []
+
+
+def test_address_keys():
+    keys = address_keys("Bahnhofstr. 10, 86150 Augsburg, Germany")
+    assert keys == ["n:10:bahnhofstr", "p:86150", "r:augsburg", "r:bahnhofstr"]
+
+    keys = address_keys("Pall Mall, London SW1Y 5HX")
+    assert "p:sw1y5hx" in keys
+    assert keys == sorted(set(keys))
+
+    # Four digits read as a house number, not a postal code:
+    keys = address_keys("Hauptstrasse 1234a, Wien")
+    assert keys == ["n:1234a:hauptstrasse", "n:1234a:wien", "r:hauptstrasse", "r:wien"]
+
+    # Keyword spelling doesn't change the keys:
+    left = address_keys("160 Broad Street, Birmingham")
+    assert left == address_keys("160 Broad St., Birmingham, United Kingdom")
+    assert "n:160:broad" in left
+
+    assert address_keys("") == []
+    assert address_keys_batch(["", "Pall Mall, London SW1Y 5HX"]) == [
+        [],
+        address_keys("Pall Mall, London SW1Y 5HX"),
+    ]
@@ -1,3 +1,11 @@
+import re
+import pytest
+from typing import Dict, List, Optional
+
+from jinja2 import Environment
+
+from rigour.addresses import format_address_lines
+from rigour.addresses.format import _format, _load_formats
 from rigour.addresses.format import format_address, format_address_line
 
 
@@ -66,3 +74,72 @@ def test_format_address_line():
     addr = {"road": "Main Street", "house_number": "16", "city": "Guerntown"}
     expect = "16 Main Street, Guerntown, Guernsey, Channel Islands"
     assert format_address_line(addr, country="GG") == expect
+
+
+def _jinja_format(address: Dict[str, Optional[str]], country: Optional[str]) -> str:
+    # The Jinja2 renderer the compiled formatter replaces.
+    address = dict(address)
+    country = country.upper() if country is not None else "default"
+    formats = _load_formats()
+    fmt = formats.get(country)
+    if fmt is None and "-" in country:
+        country, _ = country.split("-", 1)
+        fmt = formats.get(country)
+    if fmt is None:
+        fmt = formats["default"]
+    if fmt.get("use_country") is not None:
+        for key, value in fmt.get("add_component", {}).items():
+            if key not in address:
+                address[key] = value
+        return _jinja_format(address, fmt["use_country"])
+    cleaned: Dict[str, str] = {}
+    for part, pvalue in address.items():
+        if pvalue is not None and len(str(pvalue).strip()):
+            cleaned[part] = str(pvalue).strip()
+    return Environment().from_string(fmt["address_template"]).render(**cleaned)
+
+
+def test_format_all_countries():
+    formats = _load_formats()
+    countries: List[Optional[str]] = [None, "XX", "AE-DU", "us-ny", "de"]
+    countries.extend(k for k, v in formats.items() if isinstance(v, dict))
+    fields = set()
+    for value in formats.values():
+        if isinstance(value, dict) and "address_template" in value:
+            for expr in re.findall(r"{{([^}]*)}}", value["address_template"]):
+                fields.update(re.split(r"\s+or\s+", expr.strip()))
+    full = {f: f"{f.title()} {i}" for i, f in enumerate(sorted(fields))}
+    addresses: List[Dict[str, Optional[str]]] = [
+        full,
+        {"road": "Bahnhofstr.", "house_number": "10", "city": "Augsburg"},
+        {"house": "Marlborough House", "quarter": "St James's", "road": "Pall Mall"},
+        {"quarter": "Mitte", "postcode": " 10115 ", "town": "", "state": None},
+        {"country": None, "state": "  ", "village": "Kleindorf"},
+        {"country": "Elsewhere", "house_number": 7},  # type: ignore
+        {},
+    ]
+    for country in countries:
+        lines: List[str] = []
+        for address in addresses:
+            assert _format(address, country) == _jinja_format(address, country)
+            lines.append(format_address_line(address, country=country))
+        batch = format_address_lines(addresses, [country] * len(addresses))
+        assert batch == lines
+
+
+def test_format_address_lines():
+    addresses: List[Dict[str, Optional[str]]] = [
+        {"road": "Sesame Street", "house_number": "16", "state": "Dubai"},
+        {"road": "Main Street", "house_number": "16", "city": "Guerntown"},
+        {"road": "Sesame Street", "country": "Fantastan"},
+    ]
+    lines = format_address_lines(addresses, ["AE-DU", "GG", None])
+    assert lines == [
+        "16 Sesame Street, Dubai",
+        "16 Main Street, Guerntown, Guernsey, Channel Islands",
+        "Sesame Street, Fantastan",
+    ]
+    assert format_address_lines(addresses[2:]) == ["Sesame Street, Fantastan"]
+    assert format_address_lines([]) == []
+    with pytest.raises(ValueError):
+        format_address_lines(addresses, ["DE"])
@@ -1,8 +1,14 @@
+import json
+from pathlib import Path
+
 from normality import squash_spaces
 from rigour.addresses import (
     normalize_address,
+    normalize_addresses,
     remove_address_keywords,
+    remove_address_keywords_batch,
     shorten_address_keywords,
+    shorten_address_keywords_batch,
 )
 
 
@@ -47,6 +53,22 @@ def test_normalize_address():
     )
 
 
+def test_normalize_addresses():
+    addresses = [
+        "Bahnhofstr. 10, 86150 Augsburg, Germany",
+        "hey",
+        "Д.127, АМУРСКАЯ, АМУРСКАЯ, 675000",
+        "",
+        "Straße № 5",
+    ]
+    for latinize in (False, True):
+        expected = [normalize_address(a, latinize=latinize) for a in addresses]
+        assert normalize_addresses(addresses, latinize=latinize) == expected
+    assert normalize_addresses(addresses)[1] is None
+    assert normalize_addresses(["h e"], min_length=1) == ["h e"]
+    assert normalize_addresses([]) == []
+
+
 def test_shorten_address_keywords():
     cases = [
         ("New York Street, New York, NY 10001", "ny st ny 10001"),
@@ -151,6 +173,30 @@ def test_replacer_unicode_word_boundary():
     assert "ir" not in shortened.split()
 
 
+def test_replacer_ignores_case():
+    # The replacer matched with re.I: keywords in text that isn't
+    # lowercase yet are still found, and the rest is kept as it was.
+    assert shorten_address_keywords("160 BROAD STREET") == "160 BROAD st"
+    assert shorten_address_keywords("УЛИЦА Ленина, Дом 5") == "ul Ленина, d 5"
+
+
+def test_replacer_regex_sample():
+    # Rows of [address, shorten, remove, shorten latinized, remove
+    # latinized], as the regex replacer produced them on the address
+    # normalised with the matching `latinize` flag. The addresses mix
+    # forms, ordinals, territory names and street words, in any case.
+    path = Path(__file__).parent / "keyword_sample.json"
+    with open(path, encoding="utf-8") as fh:
+        sample = json.load(fh)
+    for latinize, col in ((False, 1), (True, 3)):
+        rows = [r for r in sample if r[col] is not None]
+        normalized = [normalize_address(r[0], latinize, 1) or "" for r in rows]
+        shortened = shorten_address_keywords_batch(normalized, latinize=latinize)
+        assert shortened == [r[col] for r in rows]
+        removed = remove_address_keywords_batch(normalized, latinize=latinize)
+        assert removed == [r[col + 1] for r in rows]
+
+
 def test_remove_address_keywords_substitutes_with_whitespace():
     # remove_address_keywords drops matched forms, replacing each
     # with a single whitespace by default.
@@ -174,3 +220,22 @@ def test_remove_address_keywords_does_not_collapse_whitespace():
     # Three consecutive matched forms → multiple whitespace runs.
     # Non-collapsed whitespace will produce >1 consecutive space.
     assert "  " in removed
+
+
+def test_address_keywords_batch():
+    addresses = [
+        "160 Broad Street, Birmingham B15 1DT",
+        "Islamic Republic of Iran",
+        "Marlborough House, Pall Mall, London SW1Y 5HX",
+        "Д.127, АМУРСКАЯ, АМУРСКАЯ, 675000",
+        "",
+    ]
+    for latinize in (False, True):
+        normalized = [normalize_address(a, latinize=latinize) or "" for a in addresses]
+        shortened = shorten_address_keywords_batch(normalized, latinize=latinize)
+        expected = [shorten_address_keywords(n, latinize=latinize) for n in normalized]
+        assert shortened == expected
+        removed = remove_address_keywords_batch(normalized, latinize, "_")
+        expected = [remove_address_keywords(n, latinize, "_") for n in normalized]
+        assert removed == expected
+    assert shorten_address_keywords_batch([]) == []
@@ -0,0 +1,128 @@
+import random
+from typing import List, Optional, Tuple
+
+import pytest
+
+from rigour.ids import FormatType, get_identifier_format
+from rigour.ids import get_identifier_format_names
+from rigour.ids import normalize_identifiers, validate_identifiers
+
+SAMPLES = {
+    "wikidata": ["Q42", "Q42\n", "https://www.wikidata.org/wiki/q42", "Q٤٢", "q"],
+    "ogrn": ["1027739552642", "ОГРН 1027739552642.", "304500116000157"],
+    "imo": ["IMO 9321483", "IMO: 5363641", "912681", "12343 IMO 9321483"],
+    "isin": ["US0378331005", "au0000XVGZA3", "XS2021832634"],
+    "iban": [
+        "GB82 WEST 1234 5698 7654 32",
+        "DE89370400440532013000",
+        "FR1420041010050500013M02606",
+        "BE71096123456769",
+        "NO9386011117947",
+        "ES9121000418450200051332",
+    ],
+    "figi": ["BBG000BLNQ16", "bbg00 0b9xry4"],
+    "bic": ["DEUTDEFF", "DEUTDEFF500", "deut-de ff"],
+    "inn": ["7707083893", "500100732259"],
+    "npi": ["1245319599", "NPI: 1245319599", "123456789012347", "0000000000"],
+    "lei": ["5493 0084UKLVMY22DS16", "213800D1EI4B9WTWWD28"],
+    "uei": ["J7M9HPTGJ1S9", " j7m9hptgj1s9 ", "uei: J7M9HPTGJ1S9"],
+    "ssn": ["536-90-4399", "536904399", "078-05-1120"],
+    "cpf": ["390.533.447-05", "39053344705"],
+    "cnpj": ["16.727.230/0001-97", "12.ABC.345/01DE-35"],
+    "uscc": ["91110000600037341L", "9111 0000-6000 3734 1L"],
+    "generic": ["abc", "  ", " x\n"],
+    "strict": ["Ab-12", "ä", "x"],
+}
+
+# Separators, look-alike and non-ASCII digits, case variants.
+NOISE = list(" -./:#_\n\t–０١٣๓ſKkIOQ059AZaz'") + ["IMO"]
+
+
+def perturb(rng: random.Random, value: str) -> str:
+    chars = list(value)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.random()
+        if op < 0.3 and chars:
+            chars[rng.randrange(len(chars))] = rng.choice(NOISE)
+        elif op < 0.6:
+            chars.insert(rng.randint(0, len(chars)), rng.choice(NOISE))
+        elif chars:
+            del chars[rng.randrange(len(chars))]
+    return "".join(chars)
+
+
+def reference(fmt: FormatType, value: str) -> Tuple[Optional[str], bool]:
+    # A few inputs make the Python formats raise (`int()` in OGRN on a
+    # trailing letter); the batch functions report them as invalid.
+    try:
+        norm = fmt.normalize(value)
+    except ValueError:
+        norm = None
+    try:
+        valid = fmt.is_valid(value)
+    except ValueError:
+        valid = False
+    return norm, valid
+
+
+@pytest.mark.parametrize("name", get_identifier_format_names())
+def test_batch_matches_formats(name: str):
+    fmt = get_identifier_format(name)
+    assert fmt is not None
+    rng = random.Random(name)
+    samples = SAMPLES[name]
+    values: List[str] = list(samples)
+    for _ in range(300):
+        values.append(perturb(rng, rng.choice(samples)))
+    values.append("")
+
+    expected = [reference(fmt, value) for value in values]
+    assert normalize_identifiers(name, values) == [norm for norm, _ in expected]
+    assert validate_identifiers(name, values) == [ok for _, ok in expected]
+
+
+def test_batch_identifiers():
+    values = ["US0378331005", "US0378331004", " us0378331005 "]
+    assert normalize_identifiers("isin", values) == [
+        "US0378331005",
+        None,
+        "US0378331005",
+    ]
+    assert validate_identifiers("isin", values) == [True, False, True]
+    assert normalize_identifiers("qid", ["Q42"]) == ["Q42"]
+    assert normalize_identifiers("bic", iter(["DEUTDEFF500"])) == ["DEUTDEFF"]
+    assert validate_identifiers("imo", []) == []
+
+    # National account checks, as python-stdnum runs them: the second
+    # IBAN has a valid checksum but names an unknown Belgian bank.
+    ibans = ["BE71096123456769", "BE68539007547034"]
+    assert validate_identifiers("iban", ibans) == [True, False]
+    assert normalize_identifiers("iban", ibans) == ["BE71096123456769", None]
+
+    with pytest.raises(ValueError):
+        normalize_identifiers("nope", ["x"])
+    with pytest.raises(ValueError):
+        validate_identifiers("nope", ["x"])
+
+
+def test_batch_stdnum_version(monkeypatch: pytest.MonkeyPatch):
+    # Under another python-stdnum release, the stdnum formats run in
+    # Python rather than on tables generated from a different one.
+    import stdnum
+    import rigour.ids.batch as batch
+
+    def rust(*args: object) -> None:
+        raise AssertionError("Rust core used")
+
+    monkeypatch.setattr(batch, "_normalize_identifiers", rust)
+    monkeypatch.setattr(batch, "_validate_identifiers", rust)
+    monkeypatch.setattr(stdnum, "__version__", "0.0")
+    batch._stdnum_matches.cache_clear()
+    try:
+        values = [" us0378331005 ", "US0378331004"]
+        assert normalize_identifiers("isin", values) == ["US0378331005", None]
+        assert validate_identifiers("iban", ["BE71096123456769"]) == [True]
+        with pytest.raises(AssertionError):
+            validate_identifiers("wikidata", ["Q42"])
+    finally:
+        batch._stdnum_matches.cache_clear()
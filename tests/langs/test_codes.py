@@ -1,4 +1,4 @@
-from rigour.data.langs.iso639 import ISO3_ALL
+from rigour._core import is_iso_639_3
 from rigour.langs import iso_639_alpha3, iso_639_alpha2
 from rigour.langs import list_to_alpha3, is_lang_better
 from rigour.langs import PREFERRED_LANG, PREFERRED_LANGS
@@ -59,11 +59,18 @@ def test_list():
     assert not len(list_to_alpha3([""]))
 
 
+def test_list_batch():
+    codes = ["en", "ENG ", "pt-BR", "zh_Hans", "chi_sim", "mul", "", "banana"]
+    assert list_to_alpha3(codes, synonyms=False) == {"eng", "por", "zho"}
+    assert list_to_alpha3(iter(["de"])) == {"deu"}
+    assert list_to_alpha3([]) == set()
+
+
 def test_list_only_valid_codes():
     # Synonym expansion must not leak non-ISO-639-3 codes (639-2/B or
     # Tesseract-style, e.g. "ger", "chi") into the output set.
     for inputs in (["de"], ["zho"], ["sqi"], ["srp"], ["mya"]):
-        assert list_to_alpha3(inputs) <= ISO3_ALL, inputs
+        assert all(is_iso_639_3(c) for c in list_to_alpha3(inputs)), inputs
 
 
 def test_old_norse_not_norwegian():
@@ -5,12 +5,15 @@ test, direct assertions on the returned `Name` objects' `.parts`,
 `.spans`, `.symbols`, `.tag`, `.form`.
 """
 
+import pytest
+
 from rigour.names import (
     Name,
     NamePartTag,
     NameTypeTag,
     Symbol,
     analyze_names,
+    analyze_names_batch,
 )
 
 
@@ -756,3 +759,51 @@ def test_repeated_token_no_duplicate_spans():
     assert len(keys) == len(set(keys)), (
         f"duplicate spans: {len(keys)} total, {len(set(keys))} distinct"
     )
+
+
+# --- batch ---
+
+
+def _summary(names: set[Name]) -> set[tuple]:
+    """Hashable digest of a result set, deeper than `Name.__eq__`."""
+    return {
+        (
+            n.form,
+            n.tag,
+            tuple((p.form, p.tag, p.metaphone) for p in n.parts),
+            frozenset(n.symbols),
+        )
+        for n in names
+    }
+
+
+def test_batch_matches_single():
+    entities = [
+        (NameTypeTag.PER, ["Mr. John Smith", "J. Smith"], {NamePartTag.GIVEN: ["John"]}),
+        (NameTypeTag.ORG, ["Siemens Aktiengesellschaft", "The Siemens AG"], None),
+        (NameTypeTag.ENT, ["Eli Lilly LLP", "Vladimir Putin"], None),
+        (NameTypeTag.OBJ, ["M/V Oceanic 7"], None),
+        (NameTypeTag.UNK, ["", "Something"], None),
+    ] * 10
+    type_tags = [e[0] for e in entities]
+    names = [e[1] for e in entities]
+    part_tags = [e[2] for e in entities]
+    for threads in (1, 4):
+        batch = analyze_names_batch(
+            type_tags, names, part_tags, infer_initials=True, threads=threads
+        )
+        assert len(batch) == len(entities)
+        for (type_tag, raw, tags), result in zip(entities, batch):
+            single = analyze_names(type_tag, raw, tags, infer_initials=True)
+            assert _summary(result) == _summary(single)
+
+
+def test_batch_empty():
+    assert analyze_names_batch([], []) == []
+
+
+def test_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        analyze_names_batch([NameTypeTag.PER], [["a"], ["b"]])
+    with pytest.raises(ValueError):
+        analyze_names_batch([NameTypeTag.PER], [["a"]], [None, None])
@@ -0,0 +1,159 @@
+import struct
+
+import pytest
+
+from rigour.names import (
+    NameCache,
+    NamePartTag,
+    NameTypeTag,
+    analyze_names,
+    analyze_names_batch,
+)
+from rigour.names.cache import cache_key, name_data_version
+
+
+def _forms(names) -> set:
+    return {(n.form, tuple(p.tag for p in n.parts), frozenset(n.symbols)) for n in names}
+
+
+def test_cache_roundtrip(tmp_path):
+    path = tmp_path / "names.cache"
+    with NameCache(path) as cache:
+        first = analyze_names(NameTypeTag.PER, ["Vladimir Putin"], cache=cache)
+        again = analyze_names(NameTypeTag.PER, ["Vladimir Putin"], cache=cache)
+        assert _forms(first) == _forms(again)
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.pending == 1
+    assert path.exists()
+
+    cache = NameCache(path, readonly=True)
+    assert len(cache) == 1
+    hit = analyze_names(NameTypeTag.PER, ["Vladimir Putin"], cache=cache)
+    assert _forms(hit) == _forms(first)
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 0
+    assert stats.hit_rate == 1.0
+    assert stats.nbytes == path.stat().st_size
+    cache.close()
+
+
+def test_cache_key_covers_inputs():
+    flags = {"symbols": True}
+    base = cache_key(NameTypeTag.PER, ["John Smith"], None, flags)
+    assert base == cache_key(NameTypeTag.PER, ["John Smith"], {}, flags)
+    assert base != cache_key(NameTypeTag.ORG, ["John Smith"], None, flags)
+    assert base != cache_key(NameTypeTag.PER, ["John Smyth"], None, flags)
+    assert base != cache_key(NameTypeTag.PER, ["John Smith"], None, {"symbols": False})
+    tags = {NamePartTag.GIVEN: ["John"]}
+    assert base != cache_key(NameTypeTag.PER, ["John Smith"], tags, flags)
+
+
+def test_cache_key_tag_order(tmp_path):
+    # The first tag given for a part wins, so the order of `part_tags`
+    # changes the analysis and must change the key.
+    flags = {"symbols": True}
+    given_first = {NamePartTag.GIVEN: ["John"], NamePartTag.MIDDLE: ["John"]}
+    middle_first = {NamePartTag.MIDDLE: ["John"], NamePartTag.GIVEN: ["John"]}
+    one = cache_key(NameTypeTag.PER, ["John Smith"], given_first, flags)
+    two = cache_key(NameTypeTag.PER, ["John Smith"], middle_first, flags)
+    assert one != two
+
+    cache = NameCache(tmp_path / "names.cache")
+    for part_tags in (given_first, middle_first):
+        cached = analyze_names(
+            NameTypeTag.PER, ["John Smith"], part_tags=part_tags, cache=cache
+        )
+        fresh = analyze_names(NameTypeTag.PER, ["John Smith"], part_tags=part_tags)
+        assert _forms(cached) == _forms(fresh)
+    assert cache.stats.misses == 2
+    cache.close()
+
+
+def test_cache_flags_distinct(tmp_path):
+    cache = NameCache(tmp_path / "names.cache")
+    with_sym = analyze_names(NameTypeTag.ORG, ["Siemens AG"], cache=cache)
+    no_sym = analyze_names(NameTypeTag.ORG, ["Siemens AG"], symbols=False, cache=cache)
+    assert any(n.symbols for n in with_sym)
+    assert not any(n.symbols for n in no_sym)
+    assert cache.stats.misses == 2
+
+
+def test_cache_batch(tmp_path):
+    path = tmp_path / "names.cache"
+    tags = [NameTypeTag.PER, NameTypeTag.ORG]
+    names = [["Vladimir Putin"], ["Siemens AG"]]
+    with NameCache(path) as cache:
+        analyze_names_batch(tags[:1], names[:1], cache=cache)
+
+    cache = NameCache(path)
+    results = analyze_names_batch(tags, names, cache=cache)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    expected = [analyze_names(t, n) for t, n in zip(tags, names)]
+    assert [_forms(r) for r in results] == [_forms(e) for e in expected]
+    cache.save()
+    assert len(NameCache(path)) == 2
+
+
+def test_cache_merge_on_save(tmp_path):
+    path = tmp_path / "names.cache"
+    one = NameCache(path)
+    two = NameCache(path)
+    analyze_names(NameTypeTag.PER, ["John Smith"], cache=one)
+    analyze_names(NameTypeTag.PER, ["Jane Doe"], cache=two)
+    one.save()
+    two.save()
+    assert len(NameCache(path)) == 2
+
+
+def test_cache_failed_save(tmp_path, monkeypatch):
+    path = tmp_path / "names.cache"
+    with NameCache(path) as cache:
+        analyze_names(NameTypeTag.PER, ["John Smith"], cache=cache)
+    cache = NameCache(path)
+    analyze_names(NameTypeTag.PER, ["Jane Doe"], cache=cache)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("rigour.names.cache.os.replace", fail)
+    with pytest.raises(OSError):
+        cache.save()
+    monkeypatch.undo()
+    # The old file is still mapped and the pending result is kept.
+    analyze_names(NameTypeTag.PER, ["John Smith"], cache=cache)
+    assert cache.stats.hits == 1
+    assert cache.stats.pending == 1
+    cache.save()
+    assert len(NameCache(path)) == 2
+    assert list(tmp_path.iterdir()) == [path]
+    cache.close()
+
+
+def test_cache_stale_version(tmp_path):
+    path = tmp_path / "names.cache"
+    with NameCache(path) as cache:
+        analyze_names(NameTypeTag.PER, ["John Smith"], cache=cache)
+    data = bytearray(path.read_bytes())
+    stamp = (name_data_version() + 1) % 2**64
+    struct.pack_into("<Q", data, 8, stamp)
+    path.write_bytes(bytes(data))
+    assert len(NameCache(path)) == 0
+
+
+def test_cache_garbage_file(tmp_path):
+    path = tmp_path / "names.cache"
+    path.write_bytes(b"definitely not a cache")
+    cache = NameCache(path)
+    assert len(cache) == 0
+    analyze_names(NameTypeTag.PER, ["John Smith"], cache=cache)
+    cache.save()
+    assert len(NameCache(path)) == 1
+
+
+def test_batch_length_mismatch_with_cache(tmp_path):
+    cache = NameCache(tmp_path / "names.cache")
+    with pytest.raises(ValueError):
+        analyze_names_batch([NameTypeTag.PER], [["a"], ["b"]], cache=cache)
@@ -0,0 +1,122 @@
+import pickle
+
+import pytest
+
+from rigour.names import (
+    Alignment,
+    Name,
+    NamePart,
+    NamePartTag,
+    NameTypeTag,
+    Span,
+    Symbol,
+    SymbolCategory,
+    analyze_names,
+    dump_names,
+    load_names,
+)
+
+
+def _full(name: Name) -> tuple:
+    parts = tuple(
+        (
+            p.form,
+            p.index,
+            p.tag,
+            p.latinize,
+            p.numeric,
+            p.ascii,
+            p.integer,
+            p.comparable,
+            p.metaphone,
+        )
+        for p in name.parts
+    )
+    spans = tuple(
+        (tuple(p.index for p in s.parts), s.symbol) for s in name.spans
+    )
+    return (name.original, name.form, name.tag, parts, spans)
+
+
+def _sample() -> list[Name]:
+    names: list[Name] = []
+    names.extend(analyze_names(NameTypeTag.PER, ["Vladimir Vladimirovich Putin"]))
+    names.extend(analyze_names(NameTypeTag.PER, ["Владимир Путин", "J. R. R. Tolkien"]))
+    names.extend(analyze_names(NameTypeTag.ORG, ["Siemens Aktiengesellschaft"]))
+    names.extend(analyze_names(NameTypeTag.ENT, ["7th Fleet Holdings 2024 LLC"]))
+    names.append(Name("株式会社トヨタ", tag=NameTypeTag.ORG))
+    return names
+
+
+def test_name_bytes_roundtrip():
+    for name in _sample():
+        data = name.to_bytes()
+        assert isinstance(data, bytes)
+        restored = Name.from_bytes(data)
+        assert restored == name
+        assert _full(restored) == _full(name)
+        assert restored.symbols == name.symbols
+        assert restored.comparable == name.comparable
+        assert restored.norm_form == name.norm_form
+
+
+def test_spans_share_parts():
+    name = next(iter(analyze_names(NameTypeTag.ORG, ["Siemens AG"])))
+    assert len(name.spans) > 0
+    restored = Name.from_bytes(name.to_bytes())
+    for span in restored.spans:
+        for part in span.parts:
+            assert part is restored.parts[part.index]
+
+
+def test_dump_load_names():
+    names = _sample()
+    data = dump_names(names)
+    restored = load_names(data)
+    assert [_full(n) for n in restored] == [_full(n) for n in names]
+    assert load_names(dump_names([])) == []
+
+
+def test_bad_data():
+    with pytest.raises(ValueError):
+        load_names(b"")
+    with pytest.raises(ValueError):
+        load_names(b"not a name blob")
+    data = dump_names(_sample())
+    with pytest.raises(ValueError):
+        load_names(data[: len(data) // 2])
+    with pytest.raises(ValueError):
+        Name.from_bytes(data)
+
+
+def test_pickle_name():
+    for name in _sample():
+        restored = pickle.loads(pickle.dumps(name))
+        assert _full(restored) == _full(name)
+
+
+def test_pickle_name_objects():
+    assert pickle.loads(pickle.dumps(NameTypeTag.ORG)) is NameTypeTag.ORG
+    assert pickle.loads(pickle.dumps(NamePartTag.GIVEN)) is NamePartTag.GIVEN
+    cat = SymbolCategory.ORG_CLASS
+    assert pickle.loads(pickle.dumps(cat)) is cat
+
+    sym = Symbol(SymbolCategory.NAME, "Q7747")
+    assert pickle.loads(pickle.dumps(sym)) == sym
+
+    part = NamePart("Путин", 1, NamePartTag.FAMILY)
+    other = pickle.loads(pickle.dumps(part))
+    assert other == part
+    assert other.tag == NamePartTag.FAMILY
+    assert other.ascii == part.ascii
+    assert other.metaphone == part.metaphone
+
+    span = Span([part], sym)
+    other_span = pickle.loads(pickle.dumps(span))
+    assert other_span == span
+
+    align = Alignment([part], [part], sym, 0.5, 2.0)
+    other_align = pickle.loads(pickle.dumps(align))
+    assert other_align == align
+    assert other_align.score == 0.5
+    assert other_align.weight == 2.0
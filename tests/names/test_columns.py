@@ -0,0 +1,175 @@
+from rigour.names import (
+    NameCache,
+    NamePartTag,
+    NameTypeTag,
+    analyze_names,
+    analyze_names_batch,
+    analyze_names_columns,
+    name_columns,
+)
+
+
+def _strings(offsets, data) -> list[str]:
+    offs = memoryview(offsets).tolist()
+    raw = bytes(memoryview(data))
+    return [raw[a:b].decode("utf-8") for a, b in zip(offs, offs[1:])]
+
+
+def test_columns_match_objects():
+    names = list(analyze_names(NameTypeTag.ORG, ["Siemens AG", "Газпром ПАО"]))
+    names += list(analyze_names(NameTypeTag.PER, ["Vladimir Vladimirovich Putin"]))
+    cols = name_columns(names)
+    assert len(cols) == len(names)
+    assert cols.num_entities == 1
+    assert memoryview(cols.entity_name_offsets).tolist() == [0, len(names)]
+
+    name_tags = [cols.type_tags[c] for c in memoryview(cols.name_tag).tolist()]
+    assert name_tags == [n.tag for n in names]
+    assert _strings(cols.name_form_offsets, cols.name_form_data) == [
+        n.form for n in names
+    ]
+
+    parts = [p for n in names for p in n.parts]
+    assert cols.num_parts == len(parts)
+    part_tags = [cols.part_tags[c] for c in memoryview(cols.part_tag).tolist()]
+    assert part_tags == [p.tag for p in parts]
+    assert _strings(cols.part_form_offsets, cols.part_form_data) == [
+        p.form for p in parts
+    ]
+    assert _strings(cols.part_comparable_offsets, cols.part_comparable_data) == [
+        p.comparable for p in parts
+    ]
+    metaphones = _strings(cols.part_metaphone_offsets, cols.part_metaphone_data)
+    validity = bytes(memoryview(cols.part_metaphone_validity))
+    for row, part in enumerate(parts):
+        valid = bool(validity[row // 8] & (1 << (row % 8)))
+        assert valid == (part.metaphone is not None)
+        assert metaphones[row] == (part.metaphone or "")
+
+    ids = _strings(cols.symbol_id_offsets, cols.symbol_id_data)
+    cats = [cols.symbol_categories[c] for c in memoryview(cols.symbol_category).tolist()]
+    assert cols.num_symbols == len(set(zip(cats, ids)))
+    name_offs = memoryview(cols.name_part_offsets).tolist()
+    span_offs = memoryview(cols.name_span_offsets).tolist()
+    span_part_offs = memoryview(cols.span_part_offsets).tolist()
+    span_parts = memoryview(cols.span_parts).tolist()
+    span_symbol = memoryview(cols.span_symbol).tolist()
+    for idx, name in enumerate(names):
+        assert name_offs[idx + 1] - name_offs[idx] == len(name.parts)
+        got = []
+        for s in range(span_offs[idx], span_offs[idx + 1]):
+            rows = span_parts[span_part_offs[s] : span_part_offs[s + 1]]
+            forms = tuple(parts[r].form for r in rows)
+            sym = span_symbol[s]
+            got.append((forms, cats[sym], ids[sym]))
+        expected = [
+            (tuple(p.form for p in sp.parts), sp.symbol.category, sp.symbol.id)
+            for sp in name.spans
+        ]
+        assert got == expected
+
+
+def test_column_buffers():
+    cols = name_columns(analyze_names(NameTypeTag.PER, ["John Smith"]))
+    view = memoryview(cols.part_form_offsets)
+    assert view.format == "i"
+    assert view.itemsize == 4
+    assert view.readonly
+    assert len(view) == len(cols.part_form_offsets) == cols.num_parts + 1
+    assert memoryview(cols.part_tag).format == "B"
+
+
+def test_analyze_names_columns():
+    cols = analyze_names_columns(
+        [NameTypeTag.PER, NameTypeTag.ORG, NameTypeTag.PER],
+        [["Vladimir Putin", "Putin"], [], ["John Smith"]],
+        consolidate=False,
+    )
+    assert cols.num_entities == 3
+    assert memoryview(cols.entity_name_offsets).tolist() == [0, 2, 2, 3]
+
+
+def _entities(cols) -> list[set]:
+    # One set of (form, tag, parts, spans) per entity, comparable across
+    # name orders.
+    name_forms = _strings(cols.name_form_offsets, cols.name_form_data)
+    part_forms = _strings(cols.part_form_offsets, cols.part_form_data)
+    comparables = _strings(cols.part_comparable_offsets, cols.part_comparable_data)
+    metaphones = _strings(cols.part_metaphone_offsets, cols.part_metaphone_data)
+    ids = _strings(cols.symbol_id_offsets, cols.symbol_id_data)
+    name_tag = memoryview(cols.name_tag).tolist()
+    part_tag = memoryview(cols.part_tag).tolist()
+    category = memoryview(cols.symbol_category).tolist()
+    entity_offs = memoryview(cols.entity_name_offsets).tolist()
+    name_offs = memoryview(cols.name_part_offsets).tolist()
+    span_offs = memoryview(cols.name_span_offsets).tolist()
+    span_part_offs = memoryview(cols.span_part_offsets).tolist()
+    span_parts = memoryview(cols.span_parts).tolist()
+    span_symbol = memoryview(cols.span_symbol).tolist()
+    out = []
+    for e in range(cols.num_entities):
+        names = set()
+        for n in range(entity_offs[e], entity_offs[e + 1]):
+            rows = range(name_offs[n], name_offs[n + 1])
+            parts = tuple(
+                (part_forms[r], part_tag[r], comparables[r], metaphones[r])
+                for r in rows
+            )
+            spans = frozenset(
+                (
+                    tuple(span_parts[span_part_offs[s] : span_part_offs[s + 1]]),
+                    category[span_symbol[s]],
+                    ids[span_symbol[s]],
+                )
+                for s in range(span_offs[n], span_offs[n + 1])
+            )
+            names.add((name_forms[n], name_tag[n], parts, spans))
+        out.append(names)
+    return out
+
+
+def test_analyze_names_columns_matches_batch():
+    type_tags = [NameTypeTag.PER, NameTypeTag.ENT, NameTypeTag.ORG, NameTypeTag.PER]
+    names = [
+        ["Vladimir Vladimirovich Putin", "Putin, Vladimir", "V. Putin"],
+        ["Eli Lilly LLP", "John Smith"],
+        ["Siemens AG", "Siemens Aktiengesellschaft", "Газпром ПАО", "Apple 2000"],
+        ["John J Smith", "John Smith", "J Smith 3rd"],
+    ]
+    part_tags = [
+        {NamePartTag.GIVEN: ["Vladimir"], NamePartTag.FAMILY: ["Putin"]},
+        None,
+        None,
+        {NamePartTag.MIDDLE: ["J"], NamePartTag.GIVEN: ["John", "J"]},
+    ]
+    for kwargs in ({}, {"consolidate": False, "infer_initials": True}):
+        batch = analyze_names_batch(type_tags, names, part_tags, **kwargs)
+        expected = [_entities(name_columns(result))[0] for result in batch]
+        cols = analyze_names_columns(type_tags, names, part_tags, **kwargs)
+        assert _entities(cols) == expected
+
+
+def test_analyze_names_columns_cache(tmp_path):
+    type_tags = [NameTypeTag.PER, NameTypeTag.ORG]
+    names = [["Vladimir Putin"], ["Siemens AG"]]
+    cache = NameCache(tmp_path / "names.cache")
+    first = analyze_names_columns(type_tags[:1], names[:1], cache=cache)
+    assert cache.stats.misses == 1
+    assert cache.stats.pending == 1
+
+    cols = analyze_names_columns(type_tags, names, cache=cache)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert _entities(cols)[:1] == _entities(first)
+    assert _entities(cols) == _entities(analyze_names_columns(type_tags, names))
+    # Entries written from the columns path decode as names, too.
+    hit = analyze_names(NameTypeTag.ORG, ["Siemens AG"], cache=cache)
+    assert _entities(name_columns(hit)) == _entities(cols)[1:]
+    cache.close()
+
+
+def test_empty_columns():
+    cols = name_columns([])
+    assert len(cols) == 0
+    assert memoryview(cols.name_part_offsets).tolist() == [0]
+    assert len(memoryview(cols.part_form_data)) == 0
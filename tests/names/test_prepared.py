@@ -0,0 +1,137 @@
+from typing import List
+
+from rigour.names import (
+    CompareConfig,
+    Name,
+    NameTypeTag,
+    PreparedName,
+    analyze_names,
+    compare_parts,
+    match_name_sets,
+    pair_symbols,
+    score_upper_bound,
+)
+
+
+def names(tag: NameTypeTag, *texts: str) -> List[Name]:
+    out: List[Name] = []
+    for text in texts:
+        out.extend(analyze_names(tag, [text]))
+    return out
+
+
+def _shape(pairings) -> list:
+    return [
+        sorted(
+            (
+                tuple(p.index for p in a.qps),
+                tuple(p.index for p in a.rps),
+                str(a.symbol),
+                a.score,
+            )
+            for a in pairing
+        )
+        for pairing in pairings
+    ]
+
+
+def _aligns(aligns) -> list:
+    return [
+        (tuple(p.form for p in a.qps), tuple(p.form for p in a.rps), a.score)
+        for a in aligns
+    ]
+
+
+QUERY = "Isa Bin Tarif Al Bin Ali"
+CANDIDATES = [
+    "Shaikh Isa Bin Tarif Al Bin Ali",
+    "Isa bin Tarif",
+    "Ali Isa",
+    "John Smith",
+    "عيسى بن طريف",
+]
+
+
+def test_prepare() -> None:
+    (query,) = names(NameTypeTag.PER, QUERY)
+    prepared = query.prepare()
+    assert isinstance(prepared, PreparedName)
+    assert prepared.name is query
+    assert PreparedName(query).name is query
+
+
+def test_pair_symbols_matches_free_function() -> None:
+    (query,) = names(NameTypeTag.PER, QUERY)
+    candidates = names(NameTypeTag.PER, *CANDIDATES)
+    prepared = query.prepare()
+    for cand in candidates:
+        assert _shape(prepared.pair_symbols(cand)) == _shape(pair_symbols(query, cand))
+    many = prepared.pair_symbols_many(candidates)
+    assert len(many) == len(candidates)
+    for cand, pairings in zip(candidates, many):
+        assert _shape(pairings) == _shape(pair_symbols(query, cand))
+
+
+def test_pair_symbols_reuses_symbols() -> None:
+    (query,) = names(NameTypeTag.PER, QUERY)
+    (cand,) = names(NameTypeTag.PER, CANDIDATES[0])
+    span_symbols = {id(s.symbol) for s in query.spans}
+    for pairing in query.prepare().pair_symbols(cand):
+        for align in pairing:
+            assert id(align.symbol) in span_symbols
+
+
+def test_compare_parts_matches_free_function() -> None:
+    (query,) = names(NameTypeTag.ORG, "Siemens Aktiengesellschaft")
+    candidates = names(NameTypeTag.ORG, "Siemens AG", "Simens Aktiengesellschaft")
+    prepared = query.prepare()
+    qry = list(query.parts)
+    config = CompareConfig(budget_tolerance=0.5)
+    for cand in candidates:
+        expected = compare_parts(qry, list(cand.parts))
+        assert _aligns(prepared.compare_parts(qry, list(cand.parts))) == _aligns(
+            expected
+        )
+        strict = compare_parts(qry, list(cand.parts), config)
+        assert _aligns(
+            prepared.compare_parts(qry, list(cand.parts), config)
+        ) == _aligns(strict)
+    many = prepared.compare_parts_many(qry, [list(c.parts) for c in candidates])
+    for cand, aligns in zip(candidates, many):
+        expected = compare_parts(qry, list(cand.parts))
+        assert _aligns(aligns) == _aligns(expected)
+    assert prepared.compare_parts_many(qry, []) == []
+    assert _aligns(prepared.compare_parts(qry, [])) == _aligns(compare_parts(qry, []))
+
+
+def test_compare_parts_residues() -> None:
+    # Matchers pass a different residue per pairing: a subset of the
+    # query's parts, reordered. Each one scores as the free function
+    # does, also when it comes back from the cache.
+    (query,) = names(NameTypeTag.PER, QUERY)
+    candidates = names(NameTypeTag.PER, *CANDIDATES)
+    prepared = query.prepare()
+    parts = list(query.parts)
+    residues = [parts, parts[::-1], parts[1:3], parts[3:] + parts[:1], []]
+    for _ in range(2):
+        for qry in residues:
+            for cand in candidates:
+                res = list(cand.parts)
+                expected = compare_parts(qry, res)
+                assert _aligns(prepared.compare_parts(qry, res)) == _aligns(expected)
+            many = prepared.compare_parts_many(qry, [list(c.parts) for c in candidates])
+            for cand, aligns in zip(candidates, many):
+                assert _aligns(aligns) == _aligns(compare_parts(qry, list(cand.parts)))
+
+
+def test_bound_and_match() -> None:
+    (query,) = names(NameTypeTag.PER, QUERY)
+    candidates = names(NameTypeTag.PER, *CANDIDATES)
+    prepared = query.prepare()
+    for cand in candidates:
+        assert prepared.score_upper_bound(cand) == score_upper_bound(query, cand)
+    match = prepared.match_names(candidates)
+    expected = match_name_sets([query], candidates)
+    assert match.score == expected.score
+    assert match.result is expected.result
+    assert match.query is query
@@ -0,0 +1,213 @@
+import csv
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from rigour.names import (
+    MatchConfig,
+    Name,
+    NameTypeTag,
+    SymbolCategory,
+    analyze_names,
+    match_name_sets,
+    score_upper_bound,
+)
+
+CONTRIB = Path(__file__).parent.parent.parent / "contrib"
+PUTIN = CONTRIB / "putin_names.txt"
+
+
+def names(tag: NameTypeTag, *texts: str) -> List[Name]:
+    out: List[Name] = []
+    for text in texts:
+        out.extend(analyze_names(tag, [text]))
+    return out
+
+
+def test_empty_sides() -> None:
+    query = names(NameTypeTag.PER, "Vladimir Putin")
+    for qs, rs in (([], []), (query, []), ([], query)):
+        match = match_name_sets(qs, rs)
+        assert match.query is None
+        assert match.result is None
+        assert match.score == 0.0
+        assert match.alignments == ()
+        assert match.pairs == 0
+
+
+def test_literal_short_circuit() -> None:
+    query = names(NameTypeTag.PER, "Vladimir Putin", "Putin")
+    result = names(NameTypeTag.PER, "Владимир Путин", "Путин", "Wladimir Putin")
+    match = match_name_sets(query, result)
+    assert match.literal is True
+    assert match.score == 1.0
+    assert match.query is not None and match.result is not None
+    assert match.query.comparable == "vladimir putin"
+    assert match.result.comparable == "vladimir putin"
+    assert match.scored == 1
+    assert match.skipped == match.pairs - 1
+    assert len(match.alignments) == 2
+
+
+def test_cross_script_filtered() -> None:
+    query = names(NameTypeTag.PER, "สมชาย ใจดี")
+    result = names(NameTypeTag.PER, "عبد الرحمن")
+    match = match_name_sets(query, result)
+    assert match.pairs == 1
+    assert match.filtered == 1
+    assert match.scored == 0
+    assert match.query is None
+
+
+def test_zero_bound_pair_reported() -> None:
+    # Same script, but no shared character: the pair survives the
+    # filter with an upper bound of 0 and is still the best pair.
+    query = names(NameTypeTag.PER, "Bob Lee")
+    result = names(NameTypeTag.PER, "Tim Xu")
+    assert score_upper_bound(query[0], result[0]) == 0.0
+    match = match_name_sets(query, result)
+    assert match.query is not None and match.result is not None
+    assert match.score == 0.0
+    assert match.filtered == 0
+    assert match.scored == 1
+    assert len(match.alignments) > 0
+
+
+def test_scriptless_names_kept() -> None:
+    query = names(NameTypeTag.ORG, "007")
+    result = names(NameTypeTag.ORG, "شركة 007")
+    match = match_name_sets(query, result)
+    assert match.filtered == 0
+    assert match.scored == 1
+    assert match.score > 0.0
+
+
+def test_every_part_accounted_for() -> None:
+    query = names(NameTypeTag.PER, "John Frederick Smith")
+    result = names(NameTypeTag.PER, "Jon Smith")
+    match = match_name_sets(query, result)
+    assert match.literal is False
+    assert 0.0 < match.score < 1.0
+    qps = sorted(p.index for a in match.alignments for p in a.qps)
+    rps = sorted(p.index for a in match.alignments for p in a.rps)
+    assert qps == [0, 1, 2]
+    assert rps == [0, 1]
+
+
+def test_best_pair_equals_brute_force() -> None:
+    with open(PUTIN, encoding="utf-8") as fh:
+        texts = [line.strip() for line in fh if line.strip()]
+    query = names(NameTypeTag.PER, "Vladimir Vladimirovitch Putin", "Путин В. В.")
+    result = names(NameTypeTag.PER, *texts[:30])
+    match = match_name_sets(query, result)
+    best = max(match_name_sets([q], [r]).score for q in query for r in result)
+    assert match.score == pytest.approx(best)
+    assert match.filtered + match.skipped + match.scored == match.pairs
+
+
+def test_match_config() -> None:
+    config = MatchConfig()
+    assert config.extra_query_weight == 0.8
+    assert config.symbol_weights[SymbolCategory.INITIAL] == 0.5
+    assert config.symbol_scores[SymbolCategory.NICK] == 0.6
+    custom = MatchConfig(symbol_scores={SymbolCategory.NICK: 1.0})
+    assert custom.symbol_scores[SymbolCategory.NICK] == 1.0
+    with pytest.raises(ValueError):
+        MatchConfig(extra_result_weight=-1.0)
+    with pytest.raises(ValueError):
+        MatchConfig(symbol_scores={SymbolCategory.NAME: 2.0})
+
+    query = names(NameTypeTag.PER, "John Frederick Smith")
+    result = names(NameTypeTag.PER, "John Smith")
+    lenient = MatchConfig(extra_query_weight=0.0)
+    assert match_name_sets(query, result, lenient).score > match_name_sets(
+        query, result
+    ).score
+
+
+def test_match_config_defaults() -> None:
+    # Pinned to nomenklatura logic_v2 (names/magic.py SYM_SCORES /
+    # SYM_WEIGHTS, nm_extra_*_name); change both together.
+    config = MatchConfig()
+    assert config.symbol_scores == {
+        SymbolCategory.ORG_CLASS: 0.8,
+        SymbolCategory.SYMBOL: 0.9,
+        SymbolCategory.DOMAIN: 0.9,
+        SymbolCategory.INITIAL: 0.9,
+        SymbolCategory.NAME: 0.9,
+        SymbolCategory.NICK: 0.6,
+        SymbolCategory.NUMERIC: 0.9,
+        SymbolCategory.LOCATION: 0.9,
+        SymbolCategory.PHONETIC: 1.0,
+    }
+    assert config.symbol_weights == {
+        SymbolCategory.ORG_CLASS: 0.7,
+        SymbolCategory.SYMBOL: 0.3,
+        SymbolCategory.DOMAIN: 0.7,
+        SymbolCategory.INITIAL: 0.5,
+        SymbolCategory.NAME: 1.0,
+        SymbolCategory.NICK: 0.8,
+        SymbolCategory.NUMERIC: 1.3,
+        SymbolCategory.LOCATION: 0.8,
+        SymbolCategory.PHONETIC: 1.0,
+    }
+    assert config.extra_query_weight == 0.8
+    assert config.extra_result_weight == 0.2
+
+
+def test_score_upper_bound_edges() -> None:
+    (putin,) = names(NameTypeTag.PER, "Vladimir Putin")
+    (cyrillic,) = names(NameTypeTag.PER, "Владимир Путин")
+    assert score_upper_bound(putin, cyrillic) == 1.0
+    (thai,) = names(NameTypeTag.PER, "สมชาย ใจดี")
+    (arabic,) = names(NameTypeTag.PER, "عبد الرحمن")
+    assert score_upper_bound(thai, arabic) == 0.0
+    (other,) = names(NameTypeTag.PER, "Vladimir Xxxxx")
+    bound = score_upper_bound(putin, other)
+    assert 0.0 < bound < 1.0
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    tokens = text.split()
+    op = rng.randrange(4)
+    if op == 0 and len(tokens) > 1:
+        tokens.pop(rng.randrange(len(tokens)))
+    elif op == 1:
+        rng.shuffle(tokens)
+    elif op == 2:
+        idx = rng.randrange(len(tokens))
+        chars = list(tokens[idx])
+        chars[rng.randrange(len(chars))] = rng.choice("aeiouxyz0")
+        tokens[idx] = "".join(chars)
+    else:
+        tokens.append(rng.choice(["jr", "ltd", "al", "von", "ivanovich"]))
+    return " ".join(tokens)
+
+
+def test_score_upper_bound_holds() -> None:
+    # Property check over a generated corpus: sample names, their
+    # random mutations (drops, shuffles, typos, extra tokens) and
+    # random unrelated pairs. The bound must never undershoot the
+    # full pairing + residue score.
+    rng = random.Random(4711)
+    with open(CONTRIB / "sample_names.csv", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader)
+        texts = [row[0] for row in reader if row and row[0].strip()]
+    pairs = []
+    for _ in range(1500):
+        text = rng.choice(texts)
+        other = _mutate(rng, text) if rng.random() < 0.7 else rng.choice(texts)
+        tag = rng.choice([NameTypeTag.PER, NameTypeTag.ORG, NameTypeTag.ENT])
+        pairs.append((tag, text, other))
+    checked = 0
+    for tag, text, other in pairs:
+        for query in names(tag, text):
+            for result in names(tag, other):
+                bound = score_upper_bound(query, result)
+                score = match_name_sets([query], [result]).score
+                assert bound >= score - 1e-9, (query, result, bound, score)
+                checked += 1
+    assert checked >= 1000
@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+
+from rigour.names import NameTypeTag, analyze_names, save_tagger_images
+
+CHILD = """
+import json
+from rigour.names import NameTypeTag, analyze_names
+out = []
+for tag, text in [("PER", "Vladimir Putin"), ("ORG", "Siemens AG")]:
+    for name in analyze_names(NameTypeTag[tag], [text]):
+        out.append(sorted(str(s) for s in name.symbols))
+print(json.dumps(sorted(out)))
+"""
+
+
+def _symbols() -> list:
+    out = []
+    for tag, text in [("PER", "Vladimir Putin"), ("ORG", "Siemens AG")]:
+        for name in analyze_names(NameTypeTag[tag], [text]):
+            out.append(sorted(str(s) for s in name.symbols))
+    return sorted(out)
+
+
+def _run_child(cache_dir) -> list:
+    env = dict(os.environ, RIGOUR_TAGGER_CACHE=str(cache_dir))
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def test_save_tagger_images(tmp_path):
+    paths = save_tagger_images(tmp_path / "images")
+    assert len(paths) == 2
+    for path in paths:
+        assert os.path.getsize(path) > 0
+    # Saving again overwrites in place.
+    assert sorted(save_tagger_images(tmp_path / "images")) == sorted(paths)
+
+
+def test_loaded_images_tag_identically(tmp_path):
+    save_tagger_images(tmp_path)
+    before = set(os.listdir(tmp_path))
+    assert _run_child(tmp_path) == _symbols()
+    assert set(os.listdir(tmp_path)) == before
+
+
+def test_cache_dir_is_filled_on_first_use(tmp_path):
+    assert _run_child(tmp_path) == _symbols()
+    names = os.listdir(tmp_path)
+    assert any(n.startswith("tagger-person-") for n in names)
+    assert any(n.startswith("tagger-org-") for n in names)
@@ -0,0 +1,112 @@
+"""Multi-threaded stress test for the Rust name pipeline.
+
+Hammers the GIL-releasing entry points from many threads at once and
+checks every result against a single-threaded baseline. On stock
+CPython this exercises the shared Rust caches with the GIL dropped;
+on free-threaded builds (3.13t / 3.14t) it also covers concurrent
+access to the pyclasses themselves.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List
+
+from rigour.names import (
+    Name,
+    NameTypeTag,
+    analyze_names,
+    compare_parts,
+    pair_symbols,
+)
+from rigour.text.normalize import Normalize, normalize
+from rigour.text.translit import maybe_ascii
+
+THREADS = 8
+ROUNDS = 5
+
+PUTIN = Path(__file__).parent.parent.parent / "contrib" / "putin_names.txt"
+
+
+def _putin_names() -> List[str]:
+    with open(PUTIN, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _digest(names: set[Name]) -> set[tuple]:
+    return {
+        (n.form, n.tag, tuple(p.tag for p in n.parts), frozenset(n.symbols))
+        for n in names
+    }
+
+
+def _hammer(fn: Callable[[int], Any]) -> List[Any]:
+    """Run `fn(round)` for every round on every thread, released together."""
+    barrier = threading.Barrier(THREADS)
+
+    def worker(_: int) -> List[Any]:
+        barrier.wait()
+        return [fn(r) for r in range(ROUNDS)]
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return list(pool.map(worker, range(THREADS)))
+
+
+def test_threaded_text_primitives():
+    texts = _putin_names()
+    flags = Normalize.CASEFOLD | Normalize.NAME
+    # Suffix per round so the maybe_ascii LRU sees both hits (shared
+    # across threads) and misses (each round's first arrival).
+    expected = [
+        [(maybe_ascii(f"{t} {r}"), normalize(t, flags)) for t in texts]
+        for r in range(ROUNDS)
+    ]
+
+    def run(r: int) -> list:
+        return [(maybe_ascii(f"{t} {r}"), normalize(t, flags)) for t in texts]
+
+    for per_thread in _hammer(run):
+        assert per_thread == expected
+
+
+def test_threaded_analyze_names():
+    texts = _putin_names()
+    expected = [_digest(analyze_names(NameTypeTag.PER, [t])) for t in texts]
+    expected_ent = _digest(analyze_names(NameTypeTag.ENT, texts))
+
+    def run(r: int) -> tuple:
+        per = [_digest(analyze_names(NameTypeTag.PER, [t])) for t in texts]
+        ent = _digest(analyze_names(NameTypeTag.ENT, texts))
+        return per, ent
+
+    for per_thread in _hammer(run):
+        for per, ent in per_thread:
+            assert per == expected
+            assert ent == expected_ent
+
+
+def test_threaded_scoring_shared_names():
+    # All threads score the *same* Name objects, which is what a
+    # candidate-scoring pool does with the query side.
+    names = [
+        n for t in _putin_names()[:12] for n in analyze_names(NameTypeTag.PER, [t])
+    ]
+    pairs = [(q, r) for q in names for r in names]
+
+    def score(q: Name, r: Name) -> tuple:
+        pairings = pair_symbols(q, r)
+        aligns = compare_parts(list(q.parts), list(r.parts))
+        return (
+            len(pairings),
+            max(len(p) for p in pairings),
+            tuple(round(a.score, 9) for a in aligns),
+        )
+
+    expected = [score(q, r) for q, r in pairs]
+
+    def run(r: int) -> list:
+        return [score(q, r) for q, r in pairs]
+
+    for per_thread in _hammer(run):
+        for got in per_thread:
+            assert got == expected
@@ -1,5 +1,6 @@
 from rigour.territories import lookup_by_identifier
 from rigour.territories import lookup_territory
+from rigour.territories import lookup_territories
 
 
 def test_lookup_by_identifier():
@@ -105,3 +106,17 @@ def test_britain():
     assert terr and terr.code == "gb"
     terr = lookup_territory(misspelled, fuzzy=False)
     assert terr is None
+
+
+def test_lookup_territories():
+    texts = ["Germany", "Rossiyskaya Federacia", "Narnia", "TGermany", "Germany"]
+    terrs = lookup_territories(texts, fuzzy=True)
+    assert len(terrs) == len(texts)
+    assert [t.code if t else None for t in terrs] == ["de", "ru", None, "de", "de"]
+    for text, terr in zip(texts, terrs):
+        assert terr == lookup_territory(text, fuzzy=True)
+
+    terrs = lookup_territories(["Germany", "TGermany"])
+    assert terrs[0] and terrs[0].code == "de"
+    assert terrs[1] is None
+    assert lookup_territories([]) == []
@@ -1,4 +1,9 @@
-from rigour.territories.match import territories_intersect
+from rigour.territories.match import (
+    descendants,
+    is_within,
+    territories_intersect,
+    territories_intersect_batch,
+)
 
 
 def test_territories_intersect_basic():
@@ -43,3 +48,32 @@ def test_territories_intersect_children():
 
     common = territories_intersect(["md"], ["md-pmr"])
     assert common == {"md-pmr"}
+
+
+def test_territories_intersect_batch():
+    query = ["ru", "us"]
+    candidates = [["ua-cri"], ["us-tx", "fr"], [], ["xx"], ("us",)]
+    results = territories_intersect_batch(query, candidates)
+    assert results == [{"ua-cri"}, {"us-tx"}, set(), set(), {"us"}]
+    for cand, result in zip(candidates, results):
+        assert result == territories_intersect(query, cand)
+    assert territories_intersect_batch(query, []) == []
+
+
+def test_is_within():
+    assert is_within("gb-nir", "gb")
+    assert is_within("gb", "gb")
+    assert not is_within("gb", "gb-nir")
+    assert not is_within("fr", "gb")
+    assert not is_within("ua-cri", "ru")
+    assert not is_within("xx", "gb")
+    assert not is_within("gb", "xx")
+
+
+def test_descendants():
+    codes = {t.code for t in descendants("gb")}
+    assert {"gb-nir", "gb-sct", "gb-wls"} <= codes
+    assert "gb" not in codes
+    assert all(is_within(code, "gb") for code in codes)
+    assert descendants("gb-nir") == []
+    assert descendants("xx") == []
@@ -0,0 +1,53 @@
+from rigour.territories import find_territories, find_territories_batch
+
+
+def found(text: str):
+    return [
+        (text[m.start : m.end], m.territory.code, m.strong)
+        for m in find_territories(text)
+    ]
+
+
+def test_find_territories():
+    """Test the find_territories function."""
+    assert found("Bahnhofstr. 10, 86150 Augsburg, Germany") == [
+        ("Germany", "de", True)
+    ]
+    assert found("Straße 5, 10117 Berlin, Deutschland") == [
+        ("Berlin", "de-be", True),
+        ("Deutschland", "de", True),
+    ]
+    assert found("Shipped to the U.S.A. from Guinea-Bissau") == [
+        ("U.S.A", "us", True),
+        ("Guinea-Bissau", "gw", True),
+    ]
+    assert found("Côte d'Ivoire, Abidjan") == [("Côte d'Ivoire", "ci", True)]
+    assert found("Д.127, АМУРСКАЯ, 675000, Россия") == [("Россия", "ru", True)]
+
+    # The longest name wins, and keeps the strong name it contains:
+    assert found("Between the United States of America and Iran.") == [
+        ("the United States of America", "us", True),
+        ("Iran", "ir", True),
+    ]
+
+    # Weak names are reported, but flagged:
+    weak = found("1 Down Street, Cook County")
+    assert ("Down", "gb-nir", False) in weak
+    assert all(not strong for _, _, strong in weak)
+
+    # Names are split into words as the text is, "/" included:
+    assert found("Shipped from Birmanie/Myanmar") == [
+        ("Birmanie/Myanmar", "mm", True)
+    ]
+
+    assert found("Germanyfoo 12") == []
+    assert found("") == []
+
+
+def test_find_territories_batch():
+    """Test the find_territories_batch function."""
+    texts = ["Augsburg, Germany", "", "Paris, France"]
+    results = find_territories_batch(texts)
+    assert results == [find_territories(text) for text in texts]
+    assert results[2][0].territory.code == "fr"
+    assert find_territories_batch([]) == []
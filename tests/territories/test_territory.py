@@ -1,6 +1,8 @@
 from rigour.territories import get_territory, get_territory_by_qid
 from rigour.territories import get_ftm_countries, get_territories
 from rigour.territories.util import clean_codes
+from rigour.territories.util import normalize_territory_name
+from rigour.territories.util import normalize_territory_names
 
 
 def test_world_real():
@@ -122,3 +124,40 @@ def test_clean_code():
     assert clean_codes(["GB", "US", "FR"]) == ["gb", "us", "fr"]
     assert clean_codes(["GB_NIR"]) == ["gb-nir"]
     assert clean_codes([""]) == []
+
+
+def test_normalize_territory_name():
+    assert normalize_territory_name("  U.S.A. ") == "usa"
+    assert normalize_territory_name("Bosnia & Herzegovina") == "bosnia herzegovina"
+    assert normalize_territory_name("Côte d'Ivoire") == "co te divoire"
+    assert normalize_territory_name("Palestinä") == "palestina"
+    assert normalize_territory_name("საქართველო") == "sakartvelo"
+    assert normalize_territory_name("中华人民共和国") == "中华人民共和国"
+    names = ["Germany", "Российская Федерация", "", "Straße"]
+    expected = [normalize_territory_name(n) for n in names]
+    assert normalize_territory_names(names) == expected
+    assert normalize_territory_names([]) == []
+
+
+def test_cached_fields():
+    gb = get_territory("gb")
+    nir = get_territory("gb-nir")
+    assert gb is not None and nir is not None
+    assert nir.parent is gb
+    assert isinstance(gb.codes, frozenset)
+    assert gb.codes is gb.codes
+    assert {"gb", "gbr"} <= gb.codes
+    assert gb.qids == frozenset(["Q145"]) | frozenset(gb.other_qids)
+
+    data = gb.to_dict()
+    data["codes"].append("xx")
+    data["name"] = "changed"
+    assert "xx" not in gb.to_dict()["codes"]
+    assert gb.to_dict()["name"] == "United Kingdom"
+
+
+def test_pickle():
+    import pickle
+
+    fr = get_territory("fr")
+    assert pickle.loads(pickle.dumps(fr)) is fr
@@ -0,0 +1,59 @@
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = [
+    "rigour",
+    "rigour.names",
+    "rigour.text",
+    "rigour.territories",
+    "rigour.addresses",
+    "rigour.ids",
+    "rigour.mime",
+    "rigour.urls",
+]
+
+
+def _loaded_after(module: str) -> set:
+    code = f"import json, sys; import {module}; print(json.dumps(list(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return set(json.loads(proc.stdout))
+
+
+def test_names_import_is_lazy():
+    loaded = _loaded_after("rigour.names")
+    assert "rigour.names.analyze" not in loaded
+    assert "rigour.langs" not in loaded
+
+
+def test_ids_import_is_lazy():
+    loaded = _loaded_after("rigour.ids")
+    assert "stdnum" not in loaded
+
+
+@pytest.mark.parametrize("name", PACKAGES)
+def test_public_names_resolve(name):
+    module = importlib.import_module(name)
+    listed = dir(module)
+    for attr in module.__all__:
+        assert attr in listed
+        assert getattr(module, attr) is not None
+
+
+def test_unknown_attribute():
+    import rigour.names
+
+    with pytest.raises(AttributeError):
+        rigour.names.does_not_exist  # noqa: B018
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from rigour.names import *", namespace)
+    assert "analyze_names" in namespace
+    assert "Name" in namespace
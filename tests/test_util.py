@@ -1,4 +1,8 @@
-from rigour.util import list_intersection
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rigour.util import build_once, list_intersection
 
 
 def test_list_intersection():
@@ -11,3 +15,32 @@ def test_list_intersection():
     assert list_intersection(["a", "b", "c"], ["d", "e"]) == []
     assert list_intersection(["a", "b", "c"], ["c", "d"]) == ["c"]
     assert list_intersection(["a", "b"], ["a", "b"]) == ["a", "b"]
+
+
+def test_build_once():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @build_once
+    def table(flag: bool = False) -> dict:
+        """A table."""
+        calls.append(flag)
+        time.sleep(0.01)
+        return {"flag": flag}
+
+    def worker(_: int) -> dict:
+        barrier.wait()
+        return table(flag=True)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(8)))
+    assert calls == [True]
+    assert all(r is results[0] for r in results)
+    assert table() == {"flag": False}
+    assert table.cache_info().currsize == 2
+    assert table.__doc__ == "A table."
+
+    table.cache_clear()
+    assert table.cache_info().currsize == 0
+    assert table(flag=True) is not results[0]
+    assert table.cache_info().builds == 3
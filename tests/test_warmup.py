@@ -0,0 +1,61 @@
+import gc
+import threading
+import time
+
+import pytest
+
+import rigour
+import rigour.warmup
+from rigour.names.prefix import _person_prefix_regex
+from rigour.territories.lookup import _get_territory_names
+
+
+def test_preload_builds_components():
+    _person_prefix_regex.cache_clear()
+    _get_territory_names.cache_clear()
+    timings = rigour.preload(freeze=False)
+    assert _person_prefix_regex.cache_info().currsize == 1
+    assert _get_territory_names.cache_info().currsize == 1
+    for key in ("person_tagger", "org_types", "territory_index", "stopwords"):
+        assert timings[key] >= 0.0
+    assert timings["total"] >= max(v for k, v in timings.items() if k != "total")
+
+
+def test_preload_subsets():
+    timings = rigour.preload(
+        names=False, territories=True, addresses=False, text=False, freeze=False
+    )
+    assert "territory_index" in timings
+    assert "person_tagger" not in timings
+    assert "address_keywords" not in timings
+
+
+def test_preload_freeze():
+    before = gc.get_freeze_count()
+    try:
+        rigour.preload(names=False, addresses=False, text=False)
+        assert gc.get_freeze_count() > before
+    finally:
+        gc.unfreeze()
+
+
+def test_preload_joins_worker_on_error(monkeypatch):
+    built = []
+
+    def slow_rust(components):
+        time.sleep(0.2)
+        built.append(components)
+        return []
+
+    def broken():
+        raise RuntimeError("builder failed")
+
+    monkeypatch.setattr(rigour.warmup, "preload_data", slow_rust)
+    monkeypatch.setattr(
+        rigour.warmup, "_territories_builders", lambda: [("broken", broken)]
+    )
+    with pytest.raises(RuntimeError):
+        rigour.preload(names=False, addresses=False, text=False, freeze=False)
+    # The Rust builds finished before the builder's error surfaced.
+    assert built == [rigour.warmup.TERRITORIES_RUST]
+    assert all(t.name != "rigour-preload" for t in threading.enumerate())